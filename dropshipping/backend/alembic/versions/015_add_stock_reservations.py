@@ -0,0 +1,83 @@
+"""Add stock_reservations table.
+
+Revision ID: 015_stock_reservations
+Revises: 014_service_integrations
+Create Date: 2026-10-18
+
+Creates the ``stock_reservations`` table used by the atomic reservation
+engine to track checkout holds on warehouse inventory, plus a partial
+index on ``expires_at`` for active holds so the expiry sweep only scans
+reservations that can actually expire.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "015_stock_reservations"
+down_revision = "014_service_integrations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create stock_reservations with its lookup and expiry indexes."""
+    op.create_table(
+        "stock_reservations",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("inventory_level_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("variant_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("order_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["inventory_level_id"], ["inventory_levels.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["order_id"], ["orders.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_stock_reservations_store_id", "stock_reservations", ["store_id"]
+    )
+    op.create_index(
+        "ix_stock_reservations_inventory_level_id",
+        "stock_reservations",
+        ["inventory_level_id"],
+    )
+    op.create_index(
+        "ix_stock_reservations_order_id", "stock_reservations", ["order_id"]
+    )
+    op.create_index(
+        "ix_stock_reservations_active_expiry",
+        "stock_reservations",
+        ["expires_at"],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop stock_reservations and its indexes."""
+    op.drop_index("ix_stock_reservations_active_expiry", table_name="stock_reservations")
+    op.drop_index("ix_stock_reservations_order_id", table_name="stock_reservations")
+    op.drop_index(
+        "ix_stock_reservations_inventory_level_id", table_name="stock_reservations"
+    )
+    op.drop_index("ix_stock_reservations_store_id", table_name="stock_reservations")
+    op.drop_table("stock_reservations")
@@ -0,0 +1,99 @@
+"""Add daily analytics rollup tables.
+
+Revision ID: 016_analytics_rollups
+Revises: 015_stock_reservations
+Create Date: 2026-10-18
+
+Creates the ``daily_store_metrics`` and ``daily_product_metrics`` fact
+tables materialized by the nightly analytics task, and the
+``analytics_rollup_watermarks`` table recording which days they cover.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "016_analytics_rollups"
+down_revision = "015_stock_reservations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the rollup fact tables and the watermark table."""
+    op.create_table(
+        "daily_store_metrics",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Numeric(12, 2), nullable=False),
+        sa.Column("cost", sa.Numeric(12, 2), nullable=False),
+        sa.Column("units_sold", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_daily_store_metrics_store_day",
+        "daily_store_metrics",
+        ["store_id", "day"],
+        unique=True,
+    )
+
+    op.create_table(
+        "daily_product_metrics",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("product_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("product_title", sa.String(length=500), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("revenue", sa.Numeric(12, 2), nullable=False),
+        sa.Column("cost", sa.Numeric(12, 2), nullable=False),
+        sa.Column("units_sold", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_daily_product_metrics_store_day",
+        "daily_product_metrics",
+        ["store_id", "day"],
+    )
+
+    op.create_table(
+        "analytics_rollup_watermarks",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("rolled_from", sa.Date(), nullable=False),
+        sa.Column("rolled_through", sa.Date(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the rollup tables."""
+    op.drop_table("analytics_rollup_watermarks")
+    op.drop_index(
+        "ix_daily_product_metrics_store_day", table_name="daily_product_metrics"
+    )
+    op.drop_table("daily_product_metrics")
+    op.drop_index("ix_daily_store_metrics_store_day", table_name="daily_store_metrics")
+    op.drop_table("daily_store_metrics")
@@ -0,0 +1,59 @@
+"""Add export_jobs table.
+
+Revision ID: 017_export_jobs
+Revises: 016_analytics_rollups
+Create Date: 2026-10-18
+
+Creates the ``export_jobs`` table tracking background CSV/NDJSON exports
+written to files by the ``generate_export`` Celery task.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "017_export_jobs"
+down_revision = "016_analytics_rollups"
+branch_labels = None
+depends_on = None
+
+export_job_status = sa.Enum(
+    "pending", "running", "completed", "failed", name="exportjobstatus"
+)
+
+
+def upgrade() -> None:
+    """Create export_jobs."""
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("dataset", sa.String(length=20), nullable=False),
+        sa.Column("format", sa.String(length=10), nullable=False),
+        sa.Column("compressed", sa.Boolean(), nullable=False),
+        sa.Column("status", export_job_status, nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=True),
+        sa.Column("file_path", sa.Text(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_export_jobs_store_id", "export_jobs", ["store_id"])
+
+
+def downgrade() -> None:
+    """Drop export_jobs and its status enum."""
+    op.drop_index("ix_export_jobs_store_id", table_name="export_jobs")
+    op.drop_table("export_jobs")
+    export_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,62 @@
+"""Add bulk_jobs table.
+
+Revision ID: 018_bulk_jobs
+Revises: 017_export_jobs
+Create Date: 2026-10-18
+
+Creates the ``bulk_jobs`` table tracking large bulk product operations
+applied in chunks by the ``run_bulk_job`` Celery task.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "018_bulk_jobs"
+down_revision = "017_export_jobs"
+branch_labels = None
+depends_on = None
+
+bulk_job_status = sa.Enum(
+    "pending", "running", "completed", "failed", name="bulkjobstatus"
+)
+
+
+def upgrade() -> None:
+    """Create bulk_jobs."""
+    op.create_table(
+        "bulk_jobs",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("operation", sa.String(length=20), nullable=False),
+        sa.Column("params", JSONB(), nullable=False),
+        sa.Column("product_ids", JSONB(), nullable=False),
+        sa.Column("status", bulk_job_status, nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("succeeded", sa.Integer(), nullable=False),
+        sa.Column("failed", sa.Integer(), nullable=False),
+        sa.Column("errors", JSONB(), nullable=False),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_bulk_jobs_store_id", "bulk_jobs", ["store_id"])
+
+
+def downgrade() -> None:
+    """Drop bulk_jobs and its status enum."""
+    op.drop_index("ix_bulk_jobs_store_id", table_name="bulk_jobs")
+    op.drop_table("bulk_jobs")
+    bulk_job_status.drop(op.get_bind(), checkfirst=True)
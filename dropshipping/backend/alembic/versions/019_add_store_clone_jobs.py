@@ -0,0 +1,61 @@
+"""Add store_clone_jobs table.
+
+Revision ID: 019_store_clone_jobs
+Revises: 018_bulk_jobs
+Create Date: 2026-10-18
+
+Creates the ``store_clone_jobs`` table tracking large store clones run
+by the ``clone_store_contents`` Celery task.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "019_store_clone_jobs"
+down_revision = "018_bulk_jobs"
+branch_labels = None
+depends_on = None
+
+clone_job_status = sa.Enum(
+    "pending", "running", "completed", "failed", name="clonejobstatus"
+)
+
+
+def upgrade() -> None:
+    """Create store_clone_jobs."""
+    op.create_table(
+        "store_clone_jobs",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("source_store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("status", clone_job_status, nullable=False),
+        sa.Column("total_steps", sa.Integer(), nullable=False),
+        sa.Column("completed_steps", sa.Integer(), nullable=False),
+        sa.Column("current_step", sa.String(length=50), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["source_store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_store_clone_jobs_source_store_id", "store_clone_jobs", ["source_store_id"]
+    )
+
+
+def downgrade() -> None:
+    """Drop store_clone_jobs and its status enum."""
+    op.drop_index("ix_store_clone_jobs_source_store_id", table_name="store_clone_jobs")
+    op.drop_table("store_clone_jobs")
+    clone_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,47 @@
+"""Add retry scheduling to webhook_deliveries.
+
+Revision ID: 020_webhook_delivery_retries
+Revises: 019_store_clone_jobs
+Create Date: 2026-10-18
+
+Adds ``attempt`` and ``next_retry_at`` to ``webhook_deliveries`` plus a
+partial index over the scheduled retries scanned by the
+``retry_webhook_deliveries`` Beat task.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "020_webhook_delivery_retries"
+down_revision = "019_store_clone_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the retry columns and the due-retry index."""
+    op.add_column(
+        "webhook_deliveries",
+        sa.Column("attempt", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "webhook_deliveries",
+        sa.Column("next_retry_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_webhook_deliveries_next_retry_at",
+        "webhook_deliveries",
+        ["next_retry_at"],
+        postgresql_where=sa.text("next_retry_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the due-retry index and the retry columns."""
+    op.drop_index(
+        "ix_webhook_deliveries_next_retry_at", table_name="webhook_deliveries"
+    )
+    op.drop_column("webhook_deliveries", "next_retry_at")
+    op.drop_column("webhook_deliveries", "attempt")
@@ -0,0 +1,38 @@
+"""Add payment and post-payment pipeline timestamps to orders.
+
+Revision ID: 021_order_pipeline_timings
+Revises: 020_webhook_delivery_retries
+Create Date: 2026-10-18
+
+Adds ``paid_at`` and the ``pipeline_timings`` JSONB map (seconds from
+payment to each completed post-payment stage) to ``orders``.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "021_order_pipeline_timings"
+down_revision = "020_webhook_delivery_retries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the payment timestamp and stage timings columns."""
+    op.add_column(
+        "orders",
+        sa.Column("paid_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "orders",
+        sa.Column("pipeline_timings", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the stage timings and payment timestamp columns."""
+    op.drop_column("orders", "pipeline_timings")
+    op.drop_column("orders", "paid_at")
@@ -0,0 +1,32 @@
+"""Index orders by store, customer email and creation time.
+
+Revision ID: 022_order_customer_index
+Revises: 021_order_pipeline_timings
+Create Date: 2026-10-18
+
+Serves the per-customer lookups of the fraud scorer (order history and
+velocity window) and its batch rescoring self-join.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "022_order_customer_index"
+down_revision = "021_order_pipeline_timings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the composite customer index."""
+    op.create_index(
+        "ix_orders_store_email_created",
+        "orders",
+        ["store_id", "customer_email", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite customer index."""
+    op.drop_index("ix_orders_store_email_created", table_name="orders")
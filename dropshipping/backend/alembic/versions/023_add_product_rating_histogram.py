@@ -0,0 +1,65 @@
+"""Add incremental rating aggregates to products.
+
+Revision ID: 023_product_rating_histogram
+Revises: 022_order_customer_index
+Create Date: 2026-10-19
+
+Adds ``rating_sum`` and the per-star ``rating_N_count`` histogram, which
+``review_service`` maintains on every review moderation change, and
+backfills them (with ``avg_rating`` and ``review_count``) from the
+approved reviews.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "023_product_rating_histogram"
+down_revision = "022_order_customer_index"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ["rating_sum"] + [f"rating_{star}_count" for star in range(1, 6)]
+
+
+def upgrade() -> None:
+    """Add the aggregate columns and backfill them."""
+    for name in _COLUMNS:
+        op.add_column(
+            "products",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute(
+        """
+        UPDATE products p SET
+            review_count = s.review_count,
+            rating_sum = s.rating_sum,
+            avg_rating = ROUND(s.rating_sum::numeric / s.review_count, 2),
+            rating_1_count = s.c1,
+            rating_2_count = s.c2,
+            rating_3_count = s.c3,
+            rating_4_count = s.c4,
+            rating_5_count = s.c5
+        FROM (
+            SELECT product_id,
+                   COUNT(*) AS review_count,
+                   SUM(rating) AS rating_sum,
+                   COUNT(*) FILTER (WHERE rating = 1) AS c1,
+                   COUNT(*) FILTER (WHERE rating = 2) AS c2,
+                   COUNT(*) FILTER (WHERE rating = 3) AS c3,
+                   COUNT(*) FILTER (WHERE rating = 4) AS c4,
+                   COUNT(*) FILTER (WHERE rating = 5) AS c5
+            FROM reviews
+            WHERE status = 'approved'
+            GROUP BY product_id
+        ) s
+        WHERE p.id = s.product_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the aggregate columns."""
+    for name in reversed(_COLUMNS):
+        op.drop_column("products", name)
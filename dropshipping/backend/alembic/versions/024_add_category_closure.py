@@ -0,0 +1,61 @@
+"""Add the category closure table.
+
+Revision ID: 024_category_closure
+Revises: 023_product_rating_histogram
+Create Date: 2026-10-19
+
+Adds ``category_closure`` (one row per ancestor/descendant pair of the
+category tree, each category paired with itself at depth 0), which
+``category_service`` maintains on category create, move, and delete,
+and backfills it from ``categories.parent_id``. The depth guard and
+grouping keep the backfill finite if existing data contains a cycle.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "024_category_closure"
+down_revision = "023_product_rating_histogram"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the closure table and backfill it."""
+    op.create_table(
+        "category_closure",
+        sa.Column("ancestor_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("descendant_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["descendant_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index(
+        "ix_category_closure_descendant", "category_closure", ["descendant_id"]
+    )
+    op.execute(
+        """
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM categories
+            UNION ALL
+            SELECT t.ancestor_id, c.id, t.depth + 1
+            FROM tree t
+            JOIN categories c ON c.parent_id = t.descendant_id
+            WHERE t.depth < 64
+        )
+        INSERT INTO category_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, MIN(depth)
+        FROM tree
+        GROUP BY ancestor_id, descendant_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the closure table."""
+    op.drop_index("ix_category_closure_descendant", table_name="category_closure")
+    op.drop_table("category_closure")
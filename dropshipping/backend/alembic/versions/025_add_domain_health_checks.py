@@ -0,0 +1,55 @@
+"""Add cached DNS health-check state to custom domains.
+
+Revision ID: 025_domain_health_checks
+Revises: 024_category_closure
+Create Date: 2026-10-19
+
+Adds ``dns_propagated``, ``dns_checked_at``, ``dns_check_failures``, and
+``dns_next_check_at`` to ``custom_domains``. ``dns_management_service``
+stores the last propagation result there, and the ``sweep-domain-health``
+Beat task picks due domains by ``dns_next_check_at`` (indexed). Existing
+domains start unchecked, so the first sweep checks all of them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "025_domain_health_checks"
+down_revision = "024_category_closure"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the health-check columns and the due-check index."""
+    op.add_column(
+        "custom_domains", sa.Column("dns_propagated", sa.Boolean(), nullable=True)
+    )
+    op.add_column(
+        "custom_domains",
+        sa.Column("dns_checked_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "custom_domains",
+        sa.Column(
+            "dns_check_failures", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.add_column(
+        "custom_domains",
+        sa.Column("dns_next_check_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_custom_domains_dns_next_check_at", "custom_domains", ["dns_next_check_at"]
+    )
+
+
+def downgrade() -> None:
+    """Drop the health-check columns."""
+    op.drop_index("ix_custom_domains_dns_next_check_at", table_name="custom_domains")
+    op.drop_column("custom_domains", "dns_next_check_at")
+    op.drop_column("custom_domains", "dns_check_failures")
+    op.drop_column("custom_domains", "dns_checked_at")
+    op.drop_column("custom_domains", "dns_propagated")
@@ -0,0 +1,62 @@
+"""Add materialized membership for automatic segments.
+
+Revision ID: 026_segment_members
+Revises: 025_domain_health_checks
+Create Date: 2026-10-19
+
+Adds ``segment_members`` (one row per store customer matching an
+automatic segment's rules), which ``segment_rules_service`` maintains,
+and resets ``segments.customer_count`` of manual segments to their
+``segment_customers`` count, since the counter is now maintained on every
+membership change. Automatic segments had no materialized members before;
+they are filled the next time their rules are saved.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "026_segment_members"
+down_revision = "025_domain_health_checks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the membership table and backfill manual segment counters."""
+    op.create_table(
+        "segment_members",
+        sa.Column("segment_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("customer_id", UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "added_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["segment_id"], ["segments.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["customer_id"], ["customer_accounts.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("segment_id", "customer_id"),
+    )
+    op.create_index(
+        "ix_segment_members_customer_id", "segment_members", ["customer_id"]
+    )
+    op.execute(
+        """
+        UPDATE segments SET customer_count = (
+            SELECT count(*) FROM segment_customers
+            WHERE segment_customers.segment_id = segments.id
+        )
+        WHERE segment_type = 'manual'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the membership table."""
+    op.drop_index("ix_segment_members_customer_id", table_name="segment_members")
+    op.drop_table("segment_members")
@@ -0,0 +1,35 @@
+"""Add a partial index for polling shipped orders.
+
+Revision ID: 027_orders_shipped_index
+Revises: 026_segment_members
+Create Date: 2026-10-19
+
+``tracking_service.poll_shipments_sync`` pages through shipped orders by
+id; the partial index keeps those pages cheap however many delivered
+orders pile up.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "027_orders_shipped_index"
+down_revision = "026_segment_members"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the shipped-orders keyset index."""
+    op.create_index(
+        "ix_orders_shipped_id",
+        "orders",
+        ["id"],
+        postgresql_where=sa.text("status = 'shipped'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the shipped-orders keyset index."""
+    op.drop_index("ix_orders_shipped_id", table_name="orders")
@@ -0,0 +1,33 @@
+"""Track the supplier data last applied to product-supplier links.
+
+Revision ID: 028_product_supplier_sync
+Revises: 027_orders_shipped_index
+Create Date: 2026-10-19
+
+Adds ``sync_hash`` to ``product_suppliers``. The supplier catalog sync
+stores the hash of the supplier payload it applied there and skips links
+whose supplier data has not changed. Existing links start without a
+hash, so the first sync applies all of them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "028_product_supplier_sync"
+down_revision = "027_orders_shipped_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the sync hash column."""
+    op.add_column(
+        "product_suppliers", sa.Column("sync_hash", sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Drop the sync hash column."""
+    op.drop_column("product_suppliers", "sync_hash")
@@ -0,0 +1,107 @@
+"""Add the co-purchase matrix and precomputed product recommendations.
+
+Revision ID: 029_product_recommendations
+Revises: 028_product_supplier_sync
+Create Date: 2026-10-19
+
+Adds ``product_co_purchases`` (paid orders per product pair, diagonal
+included), ``product_recommendations`` (blended manual and learned
+recommendations read by the storefront) and ``recommendation_watermarks``
+(how far orders have been counted), all maintained by
+``recommendation_service``. Active upsells are copied into
+``product_recommendations`` here; the learned rows are built from the
+whole order history by the first ``refresh-product-recommendations`` run.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "029_product_recommendations"
+down_revision = "028_product_supplier_sync"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the recommendation tables and mirror the active upsells."""
+    op.create_table(
+        "product_co_purchases",
+        sa.Column("product_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("other_product_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("orders", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["other_product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("product_id", "other_product_id"),
+    )
+    op.create_index(
+        "ix_product_co_purchases_store_id", "product_co_purchases", ["store_id"]
+    )
+    op.create_table(
+        "product_recommendations",
+        sa.Column("id", UUID(as_uuid=True), nullable=False),
+        sa.Column("store_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("product_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("target_product_id", UUID(as_uuid=True), nullable=False),
+        sa.Column("upsell_id", UUID(as_uuid=True), nullable=True),
+        sa.Column("score", sa.Float(), nullable=True),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["target_product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["upsell_id"], ["upsells.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("upsell_id"),
+    )
+    op.create_index(
+        "ix_product_recommendations_store_id", "product_recommendations", ["store_id"]
+    )
+    op.create_index(
+        "ix_product_recommendations_product_rank",
+        "product_recommendations",
+        ["product_id", "rank"],
+    )
+    op.create_table(
+        "recommendation_watermarks",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("processed_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        """
+        INSERT INTO product_recommendations
+            (id, store_id, product_id, target_product_id, upsell_id, score, rank)
+        SELECT gen_random_uuid(), store_id, source_product_id, target_product_id, id, NULL,
+               row_number() OVER (
+                   PARTITION BY source_product_id ORDER BY position, created_at
+               ) - 1
+        FROM upsells
+        WHERE is_active
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the recommendation tables."""
+    op.drop_table("recommendation_watermarks")
+    op.drop_index(
+        "ix_product_recommendations_product_rank", table_name="product_recommendations"
+    )
+    op.drop_index(
+        "ix_product_recommendations_store_id", table_name="product_recommendations"
+    )
+    op.drop_table("product_recommendations")
+    op.drop_index(
+        "ix_product_co_purchases_store_id", table_name="product_co_purchases"
+    )
+    op.drop_table("product_co_purchases")
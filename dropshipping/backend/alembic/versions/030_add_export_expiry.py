@@ -0,0 +1,37 @@
+"""Add the expired export job status.
+
+Revision ID: 030_export_expiry
+Revises: 029_product_recommendations
+Create Date: 2026-10-19
+
+Adds ``expired`` to the ``exportjobstatus`` enum. ``expire_exports``
+deletes export files older than ``export_retention_hours`` and moves
+their jobs to ``expired``.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "030_export_expiry"
+down_revision = "029_product_recommendations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the expired value to exportjobstatus."""
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE exportjobstatus ADD VALUE IF NOT EXISTS 'expired'")
+
+
+def downgrade() -> None:
+    """Report expired jobs as failed.
+
+    PostgreSQL cannot drop an enum value, so ``expired`` stays in the
+    type; the rows using it are moved back to ``failed``.
+    """
+    op.execute(
+        "UPDATE export_jobs SET status = 'failed', "
+        "error_message = 'Export file expired' WHERE status = 'expired'"
+    )
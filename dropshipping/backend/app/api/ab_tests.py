@@ -15,8 +15,10 @@ conversions, and analyze results to optimize their storefront.
     - POST create returns 201 with the test configuration.
     - Test statuses: ``draft``, ``running``, ``paused``, ``completed``.
     - Variant assignment uses consistent hashing by visitor ID.
-    - Events endpoint records conversions and page views.
-    - GET with results includes statistical significance.
+    - Events endpoint records conversions and page views; variant
+      counters include them after the next counter flush.
+    - GET ``/stats`` returns significance against the control, including
+      events not yet flushed.
     - DELETE returns 204 with no content.
 
 **For End Users:**
@@ -41,6 +43,7 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.ab_test import (
     ABTestResponse,
+    ABTestStatsResponse,
     CreateABTestRequest,
     PaginatedABTestResponse,
     RecordEventRequest,
@@ -72,11 +75,13 @@ class VariantAssignmentResponse(BaseModel):
 
     Attributes:
         test_id: The A/B test UUID.
+        variant_id: The assigned variant UUID (for recording events).
         variant_name: The assigned variant name.
         variant_config: The variant's configuration.
     """
 
     test_id: uuid.UUID
+    variant_id: uuid.UUID
     variant_name: str
     variant_config: Optional[dict] = None
 
@@ -345,19 +350,18 @@ async def record_event_endpoint(
         HTTPException 400: If the test is not running or variant is invalid.
     """
     from app.services import ab_test_service
+    from app.services.store_access_service import verify_store_ownership
 
     try:
-        # Verify store ownership
-        await ab_test_service.get_test(
-            db, store_id=store_id, user_id=current_user.id, test_id=test_id
-        )
+        await verify_store_ownership(db, store_id, current_user.id)
 
-        # Service takes variant_id, event_type, optional revenue
         await ab_test_service.record_event(
             db,
+            test_id=test_id,
             variant_id=request.variant_id,
             event_type=request.event_type,
             revenue=request.revenue,
+            store_id=store_id,
         )
     except ValueError as e:
         detail = str(e)
@@ -399,18 +403,16 @@ async def get_variant_assignment_endpoint(
         HTTPException 400: If the test is not running.
     """
     from app.services import ab_test_service
+    from app.services.store_access_service import verify_store_ownership
 
     try:
-        # Verify store ownership
-        await ab_test_service.get_test(
-            db, store_id=store_id, user_id=current_user.id, test_id=test_id
-        )
+        await verify_store_ownership(db, store_id, current_user.id)
 
-        # Service returns an ABTestVariant ORM instance
         variant = await ab_test_service.get_assigned_variant(
             db,
             test_id=test_id,
             visitor_id=visitor_id,
+            store_id=store_id,
         )
     except ValueError as e:
         detail = str(e)
@@ -422,6 +424,53 @@ async def get_variant_assignment_endpoint(
         raise HTTPException(status_code=code, detail=detail)
     return VariantAssignmentResponse(
         test_id=test_id,
+        variant_id=variant.id,
         variant_name=variant.name,
-        variant_config=variant.config,
     )
+
+
+@router.get("/{test_id}/stats", response_model=ABTestStatsResponse)
+async def get_ab_test_stats_endpoint(
+    store_id: uuid.UUID,
+    test_id: uuid.UUID,
+    confidence_level: float = Query(
+        0.95, gt=0, lt=1, description="Confidence required for significance"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ABTestStatsResponse:
+    """Get a test's statistical results.
+
+    Compares every variant with the control (two-proportion z-test on
+    conversion rate) using the aggregated variant counters, including
+    events recorded since the last counter flush.
+
+    Args:
+        store_id: The UUID of the store.
+        test_id: The UUID of the A/B test.
+        confidence_level: Confidence required to call a result
+            significant (default 0.95).
+        current_user: The authenticated store owner.
+        db: Async database session injected by FastAPI.
+
+    Returns:
+        ABTestStatsResponse with per-variant results and the winner.
+
+    Raises:
+        HTTPException 404: If the store or test is not found.
+    """
+    from app.services import ab_test_service
+
+    try:
+        stats = await ab_test_service.get_test_stats(
+            db,
+            store_id=store_id,
+            user_id=current_user.id,
+            test_id=test_id,
+            confidence_level=confidence_level,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+        )
+    return ABTestStatsResponse(**stats)
@@ -9,10 +9,17 @@ request, reducing round trips for large catalog management tasks.
     (full path: ``/api/v1/stores/{store_id}/bulk/...``).
     The ``get_current_user`` dependency is used for authentication.
     Service functions in ``bulk_service`` handle batch processing.
+    Requests naming more than ``settings.bulk_job_threshold`` products
+    are queued as a ``BulkJob`` (202 with the job) and applied by
+    ``bulk_tasks.run_bulk_job``; poll ``GET /bulk/jobs/{job_id}``.
+    Smaller requests run inline and send one batched ``product.updated``
+    webhook after the transaction commits.
 
 **For QA Engineers:**
     - All endpoints return 401 without a valid token.
-    - Maximum 100 products per bulk operation.
+    - Up to ``bulk_job_threshold`` products are processed inline; larger
+      requests return 202 with a bulk job whose ``processed`` counter
+      shows progress.
     - Partial failures return 200 with a results array showing per-item status.
     - Price adjustment supports both percentage and fixed amount changes.
     - Bulk delete performs soft-delete (status set to archived).
@@ -27,19 +34,23 @@ request, reducing round trips for large catalog management tasks.
 import uuid
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
+from app.config import settings
 from app.database import get_db
 from app.models.user import User
 from app.schemas.bulk import (
+    BulkJobResponse,
     BulkOperationResponse,
     BulkPriceUpdateRequest,
     BulkProductDeleteRequest,
     BulkProductUpdateRequest,
 )
+from app.services import bulk_service
+from app.services.bulk_service import BulkOperation
 
 router = APIRouter(prefix="/stores/{store_id}/bulk", tags=["bulk-operations"])
 
@@ -79,41 +90,101 @@ class BulkItemOperationResponse(BaseModel):
     results: list[BulkItemResult]
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _item_response(
+    product_ids: list[uuid.UUID], summary: dict, success_message: str
+) -> BulkItemOperationResponse:
+    """Build per-item results from a bulk service summary."""
+    error_map = {e["product_id"]: e["error"] for e in summary.get("errors", [])}
+    results = []
+    for pid in product_ids:
+        pid_str = str(pid)
+        if pid_str in error_map:
+            results.append(BulkItemResult(
+                product_id=pid, success=False, message=error_map[pid_str]
+            ))
+        else:
+            results.append(BulkItemResult(
+                product_id=pid, success=True, message=success_message
+            ))
+
+    return BulkItemOperationResponse(
+        total=summary["total"],
+        succeeded=summary["succeeded"],
+        failed=summary["failed"],
+        results=results,
+    )
+
+
+async def _queue_job(
+    db: AsyncSession,
+    response: Response,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    operation: BulkOperation,
+    product_ids: list[uuid.UUID],
+    params: dict,
+) -> BulkJobResponse:
+    """Record a background bulk job, commit it, and dispatch the worker."""
+    job = await bulk_service.create_bulk_job(
+        db, store_id, user_id, operation, product_ids, params
+    )
+    # Commit before dispatching so the worker can see the job row
+    await db.commit()
+
+    from app.tasks.bulk_tasks import run_bulk_job
+    run_bulk_job.delay(str(job.id))
+
+    response.status_code = status.HTTP_202_ACCEPTED
+    return BulkJobResponse.model_validate(job)
+
+
 # ---------------------------------------------------------------------------
 # Route handlers
 # ---------------------------------------------------------------------------
 
 
-@router.post("/products/update", response_model=BulkItemOperationResponse)
+@router.post(
+    "/products/update",
+    response_model=BulkItemOperationResponse | BulkJobResponse,
+)
 async def bulk_update_products_endpoint(
     store_id: uuid.UUID,
     request: BulkProductUpdateRequest,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> BulkItemOperationResponse:
+) -> BulkItemOperationResponse | BulkJobResponse:
     """Bulk update multiple products in a single request.
 
-    Applies individual update payloads to each specified product.
+    Applies the same update payload to each specified product.
     Partial failures are allowed: products that fail to update are
     reported in the results array while successful updates proceed.
 
     Args:
         store_id: The UUID of the store.
-        request: Bulk update payload with per-product changes.
+        request: Bulk update payload with product IDs and changes.
+        response: The outgoing response (status set to 202 for jobs).
         current_user: The authenticated store owner.
         db: Async database session injected by FastAPI.
 
     Returns:
-        BulkOperationResponse with per-product success/failure results.
+        Per-product success/failure results, or the queued bulk job when
+        the request exceeds ``bulk_job_threshold`` products.
 
     Raises:
         HTTPException 404: If the store is not found or belongs to another user.
     """
-    from app.services import bulk_service
-
     try:
-        # BulkProductUpdateRequest has product_ids and updates (dict)
-        # which match the service function parameters directly
+        if len(request.product_ids) > settings.bulk_job_threshold:
+            return await _queue_job(
+                db, response, store_id, current_user.id, BulkOperation.update,
+                request.product_ids, {"updates": request.updates},
+            )
         summary = await bulk_service.bulk_update_products(
             db,
             store_id=store_id,
@@ -126,36 +197,24 @@ async def bulk_update_products_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
         )
 
-    # Build per-item results from the summary
-    error_ids = {e["product_id"] for e in summary.get("errors", [])}
-    error_map = {e["product_id"]: e["error"] for e in summary.get("errors", [])}
-    results = []
-    for pid in request.product_ids:
-        pid_str = str(pid)
-        if pid_str in error_ids:
-            results.append(BulkItemResult(
-                product_id=pid, success=False, message=error_map[pid_str]
-            ))
-        else:
-            results.append(BulkItemResult(
-                product_id=pid, success=True, message="Updated successfully"
-            ))
-
-    return BulkItemOperationResponse(
-        total=summary["total"],
-        succeeded=summary["succeeded"],
-        failed=summary["failed"],
-        results=results,
+    await db.commit()
+    bulk_service.notify_bulk_change(
+        store_id, BulkOperation.update, request.product_ids, summary["errors"]
     )
+    return _item_response(request.product_ids, summary, "Updated successfully")
 
 
-@router.post("/products/delete", response_model=BulkItemOperationResponse)
+@router.post(
+    "/products/delete",
+    response_model=BulkItemOperationResponse | BulkJobResponse,
+)
 async def bulk_delete_products_endpoint(
     store_id: uuid.UUID,
     request: BulkProductDeleteRequest,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> BulkItemOperationResponse:
+) -> BulkItemOperationResponse | BulkJobResponse:
     """Bulk soft-delete multiple products.
 
     Sets the status of each specified product to ``archived``.
@@ -164,19 +223,23 @@ async def bulk_delete_products_endpoint(
     Args:
         store_id: The UUID of the store.
         request: Bulk delete payload with product IDs.
+        response: The outgoing response (status set to 202 for jobs).
         current_user: The authenticated store owner.
         db: Async database session injected by FastAPI.
 
     Returns:
-        BulkOperationResponse with per-product success/failure results.
+        Per-product success/failure results, or the queued bulk job when
+        the request exceeds ``bulk_job_threshold`` products.
 
     Raises:
         HTTPException 404: If the store is not found or belongs to another user.
     """
-    from app.services import bulk_service
-
     try:
-        # Service returns a summary dict: {total, succeeded, failed, errors}
+        if len(request.product_ids) > settings.bulk_job_threshold:
+            return await _queue_job(
+                db, response, store_id, current_user.id, BulkOperation.delete,
+                request.product_ids, {},
+            )
         summary = await bulk_service.bulk_delete_products(
             db,
             store_id=store_id,
@@ -188,63 +251,55 @@ async def bulk_delete_products_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
         )
 
-    # Build per-item results from the summary
-    error_ids = {e["product_id"] for e in summary.get("errors", [])}
-    error_map = {e["product_id"]: e["error"] for e in summary.get("errors", [])}
-    results = []
-    for pid in request.product_ids:
-        pid_str = str(pid)
-        if pid_str in error_ids:
-            results.append(BulkItemResult(
-                product_id=pid, success=False, message=error_map[pid_str]
-            ))
-        else:
-            results.append(BulkItemResult(
-                product_id=pid, success=True, message="Deleted successfully"
-            ))
-
-    return BulkItemOperationResponse(
-        total=summary["total"],
-        succeeded=summary["succeeded"],
-        failed=summary["failed"],
-        results=results,
+    await db.commit()
+    bulk_service.notify_bulk_change(
+        store_id, BulkOperation.delete, request.product_ids, summary["errors"]
     )
+    return _item_response(request.product_ids, summary, "Deleted successfully")
 
 
-@router.post("/products/price", response_model=BulkItemOperationResponse)
+@router.post(
+    "/products/price",
+    response_model=BulkItemOperationResponse | BulkJobResponse,
+)
 async def bulk_price_adjustment_endpoint(
     store_id: uuid.UUID,
     request: BulkPriceUpdateRequest,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> BulkItemOperationResponse:
+) -> BulkItemOperationResponse | BulkJobResponse:
     """Bulk adjust prices for multiple products.
 
     Applies a percentage or fixed amount adjustment to each product's
     price. Supports both increases (positive value) and decreases
-    (negative value). An optional minimum price floor prevents prices
-    from going below zero or a specified threshold.
+    (negative value). Prices never drop below $0.01.
 
     Args:
         store_id: The UUID of the store.
         request: Price adjustment payload with product IDs and adjustment.
+        response: The outgoing response (status set to 202 for jobs).
         current_user: The authenticated store owner.
         db: Async database session injected by FastAPI.
 
     Returns:
-        BulkOperationResponse with per-product success/failure results.
+        Per-product success/failure results, or the queued bulk job when
+        the request exceeds ``bulk_job_threshold`` products.
 
     Raises:
         HTTPException 404: If the store is not found or belongs to another user.
         HTTPException 400: If the adjustment parameters are invalid.
     """
-    from app.services import bulk_service
-
     try:
-        # Service function is bulk_update_prices with adjustment_value (not value)
-        # Service does not accept min_price parameter
-        # BulkPriceUpdateRequest has product_ids, adjustment_type, adjustment_value
-        # which match the service function parameters directly
+        if len(request.product_ids) > settings.bulk_job_threshold:
+            return await _queue_job(
+                db, response, store_id, current_user.id, BulkOperation.price,
+                request.product_ids,
+                {
+                    "adjustment_type": request.adjustment_type,
+                    "adjustment_value": request.adjustment_value,
+                },
+            )
         summary = await bulk_service.bulk_update_prices(
             db,
             store_id=store_id,
@@ -262,24 +317,38 @@ async def bulk_price_adjustment_endpoint(
         )
         raise HTTPException(status_code=code, detail=detail)
 
-    # Build per-item results from the summary
-    error_ids = {e["product_id"] for e in summary.get("errors", [])}
-    error_map = {e["product_id"]: e["error"] for e in summary.get("errors", [])}
-    results = []
-    for pid in request.product_ids:
-        pid_str = str(pid)
-        if pid_str in error_ids:
-            results.append(BulkItemResult(
-                product_id=pid, success=False, message=error_map[pid_str]
-            ))
-        else:
-            results.append(BulkItemResult(
-                product_id=pid, success=True, message="Price adjusted successfully"
-            ))
-
-    return BulkItemOperationResponse(
-        total=summary["total"],
-        succeeded=summary["succeeded"],
-        failed=summary["failed"],
-        results=results,
+    await db.commit()
+    bulk_service.notify_bulk_change(
+        store_id, BulkOperation.price, request.product_ids, summary["errors"]
     )
+    return _item_response(
+        request.product_ids, summary, "Price adjusted successfully"
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=BulkJobResponse)
+async def get_bulk_job_endpoint(
+    store_id: uuid.UUID,
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> BulkJobResponse:
+    """Get the progress of a background bulk job.
+
+    Args:
+        store_id: The UUID of the store.
+        job_id: The bulk job UUID.
+        current_user: The authenticated store owner.
+        db: Async database session injected by FastAPI.
+
+    Returns:
+        The bulk job with its progress counters and per-item errors.
+
+    Raises:
+        HTTPException 404: If the store or job is not found.
+    """
+    try:
+        job = await bulk_service.get_bulk_job(db, store_id, current_user.id, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return BulkJobResponse.model_validate(job)
@@ -23,7 +23,9 @@ their products without authentication.
     - DELETE returns 204 with no content.
     - Assigning a product to a category is idempotent.
     - Public GET endpoints require no authentication.
-    - Public category products only returns active products.
+    - Public category products only returns active products, including
+      those of active subcategories unless ``include_subcategories=false``.
+    - Public category ``product_count`` includes active subcategories.
 
 **For End Users:**
     - Organize your products into categories and subcategories.
@@ -95,7 +97,8 @@ class PublicCategoryResponse(BaseModel):
         description: Optional description.
         image_url: Optional category image.
         parent_id: Parent category ID (null for top-level).
-        product_count: Number of active products in this category.
+        product_count: Number of active products in this category and its
+            active subcategories.
     """
 
     id: uuid.UUID
@@ -531,7 +534,9 @@ async def list_public_categories_endpoint(
     """List all active categories for a store (public).
 
     Returns all active categories for a store, visible to customers on
-    the storefront. No authentication required.
+    the storefront, from the cached category tree. ``product_count``
+    includes the products of active subcategories. No authentication
+    required.
 
     Args:
         slug: The store's URL slug.
@@ -543,62 +548,33 @@ async def list_public_categories_endpoint(
     Raises:
         HTTPException 404: If the store is not found or is not active.
     """
-    from app.models.category import Category, ProductCategory
-    from app.models.product import Product, ProductStatus
-    from app.models.store import Store, StoreStatus
-    from sqlalchemy import func
+    from app.services.storefront_routing_service import resolve_slug
 
     # Resolve store
-    store_result = await db.execute(
-        select(Store).where(
-            Store.slug == slug,
-            Store.status == StoreStatus.active,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
         )
 
-    # Fetch active categories with product counts
-    result = await db.execute(
-        select(Category)
-        .where(
-            Category.store_id == store.id,
-            Category.is_active.is_(True),
-        )
-        .order_by(Category.position, Category.name)
+    from app.services import category_service
+
+    nodes = category_service.flatten_category_tree(
+        await category_service.get_category_tree(db, store.id)
     )
-    categories = list(result.scalars().all())
-
-    # Count active products per category
-    responses = []
-    for cat in categories:
-        count_result = await db.execute(
-            select(func.count(Product.id))
-            .join(ProductCategory, ProductCategory.product_id == Product.id)
-            .where(
-                ProductCategory.category_id == cat.id,
-                Product.store_id == store.id,
-                Product.status == ProductStatus.active,
-            )
-        )
-        product_count = count_result.scalar_one()
-
-        responses.append(
-            PublicCategoryResponse(
-                id=cat.id,
-                name=cat.name,
-                slug=cat.slug,
-                description=cat.description,
-                image_url=cat.image_url,
-                parent_id=cat.parent_id,
-                product_count=product_count,
-            )
+    nodes.sort(key=lambda node: (node["position"], node["name"]))
+    return [
+        PublicCategoryResponse(
+            id=node["id"],
+            name=node["name"],
+            slug=node["slug"],
+            description=node["description"],
+            image_url=node["image_url"],
+            parent_id=node["parent_id"],
+            product_count=node["product_count"],
         )
-
-    return responses
+        for node in nodes
+    ]
 
 
 @router.get(
@@ -610,18 +586,23 @@ async def list_public_category_products_endpoint(
     category_slug: str,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    include_subcategories: bool = Query(
+        True, description="Include products of active subcategories"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedPublicCategoryProductResponse:
     """List active products in a category (public).
 
-    Returns paginated active products within a specific category.
-    No authentication required.
+    Returns paginated active products within a specific category and,
+    by default, its active subcategories. No authentication required.
 
     Args:
         slug: The store's URL slug.
         category_slug: The category's URL slug.
         page: Page number (1-based, default 1).
         per_page: Items per page (1-100, default 20).
+        include_subcategories: Also list products of the category's
+            active subcategories (default true).
         db: Async database session injected by FastAPI.
 
     Returns:
@@ -630,20 +611,12 @@ async def list_public_category_products_endpoint(
     Raises:
         HTTPException 404: If the store or category is not found.
     """
-    from app.models.category import Category, ProductCategory
-    from app.models.product import Product, ProductStatus
-    from app.models.store import Store, StoreStatus
-    from sqlalchemy import func
+    from app.models.category import Category
+    from app.services.storefront_routing_service import resolve_slug
 
     # Resolve store
-    store_result = await db.execute(
-        select(Store).where(
-            Store.slug == slug,
-            Store.status == StoreStatus.active,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
         )
@@ -662,33 +635,16 @@ async def list_public_category_products_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
         )
 
-    # Count total products
-    count_result = await db.execute(
-        select(func.count(Product.id))
-        .join(ProductCategory, ProductCategory.product_id == Product.id)
-        .where(
-            ProductCategory.category_id == category.id,
-            Product.store_id == store.id,
-            Product.status == ProductStatus.active,
-        )
-    )
-    total = count_result.scalar_one()
-
-    # Fetch paginated products
-    offset = (page - 1) * per_page
-    products_result = await db.execute(
-        select(Product)
-        .join(ProductCategory, ProductCategory.product_id == Product.id)
-        .where(
-            ProductCategory.category_id == category.id,
-            Product.store_id == store.id,
-            Product.status == ProductStatus.active,
-        )
-        .order_by(Product.created_at.desc())
-        .offset(offset)
-        .limit(per_page)
+    from app.services import category_service
+
+    products, total = await category_service.get_products_by_category(
+        db,
+        store_id=store.id,
+        category_id=category.id,
+        page=page,
+        per_page=per_page,
+        include_subcategories=include_subcategories,
     )
-    products = list(products_result.scalars().all())
 
     pages_count = math.ceil(total / per_page) if total > 0 else 1
 
@@ -130,8 +130,7 @@ async def list_currencies_endpoint(
     """
     from app.services import currency_service
 
-    # Service function is synchronous (no db needed)
-    currencies = currency_service.get_supported_currencies()
+    currencies = await currency_service.get_supported_currencies()
     return CurrencyListResponse(
         currencies=[CurrencyRateResponse(
             code=c["code"],
@@ -148,7 +147,7 @@ class ExchangeRatesResponse(BaseModel):
     Used by the dashboard currency converter tool.
 
     Attributes:
-        base: The base currency code (always "USD" for now).
+        base: The base currency code of the live rates.
         rates: Mapping of currency code to exchange rate relative to base.
         updated_at: ISO timestamp when rates were last refreshed.
     """
@@ -164,8 +163,9 @@ async def get_exchange_rates_endpoint(
 ) -> ExchangeRatesResponse:
     """Get exchange rates for all supported currencies.
 
-    Returns rates relative to USD as the base currency. Used by the
-    dashboard currency converter tool.
+    Returns the live rates relative to their base currency (USD unless
+    the rate source uses another). Used by the dashboard currency
+    converter tool.
 
     Args:
         current_user: The authenticated user.
@@ -173,14 +173,13 @@ async def get_exchange_rates_endpoint(
     Returns:
         ExchangeRatesResponse with base currency, rates dict, and timestamp.
     """
-    from datetime import datetime, timezone
-
     from app.services import currency_service
 
+    rates = await currency_service.get_exchange_rates()
     return ExchangeRatesResponse(
-        base="USD",
-        rates=dict(currency_service.EXCHANGE_RATES),
-        updated_at=datetime.now(timezone.utc).isoformat(),
+        base=rates["base"],
+        rates=rates["rates"],
+        updated_at=rates["updated_at"].isoformat(),
     )
 
 
@@ -210,8 +209,7 @@ async def convert_currency_endpoint(
     from app.services import currency_service
 
     try:
-        # Service function is synchronous and doesn't need db
-        result = currency_service.convert_price(
+        result = await currency_service.convert_price(
             amount=request.amount,
             from_currency=request.from_currency,
             to_currency=request.to_currency,
@@ -328,7 +326,7 @@ async def update_store_currency_endpoint(
     new_currency = update_data.get("base_currency")
     if new_currency:
         # Validate currency is supported
-        supported = currency_service.get_supported_currencies()
+        supported = await currency_service.get_supported_currencies()
         supported_codes = {c["code"] for c in supported}
         if new_currency.upper() not in supported_codes:
             raise HTTPException(
@@ -25,7 +25,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.customer import CustomerAccount, CustomerAddress
-from app.models.store import Store, StoreStatus
+from app.services import segment_rules_service
+from app.services.storefront_routing_service import StoreRoute, resolve_slug
 from app.api.deps import get_current_customer
 from app.schemas.customer import CustomerAddressRequest, CustomerAddressResponse
 
@@ -35,17 +36,23 @@ router = APIRouter(
 )
 
 
-async def _get_active_store(db: AsyncSession, slug: str) -> Store:
+async def _get_active_store(db: AsyncSession, slug: str) -> StoreRoute:
     """Resolve an active store by slug."""
-    result = await db.execute(
-        select(Store).where(Store.slug == slug, Store.status == StoreStatus.active)
-    )
-    store = result.scalar_one_or_none()
-    if not store:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(status_code=404, detail="Store not found")
     return store
 
 
+async def _refresh_segments(
+    db: AsyncSession, store_id: uuid.UUID, customer_id: uuid.UUID
+) -> None:
+    """Re-evaluate the customer's address-based automatic segments."""
+    await segment_rules_service.refresh_customer_segments(
+        db, store_id, frozenset({segment_rules_service.ADDRESS}), customer_id=customer_id
+    )
+
+
 @router.get("", response_model=list[CustomerAddressResponse])
 async def list_addresses(
     slug: str,
@@ -124,6 +131,8 @@ async def create_address(
         is_default=body.is_default,
     )
     db.add(address)
+    await db.flush()
+    await _refresh_segments(db, store.id, customer.id)
     await db.commit()
     await db.refresh(address)
 
@@ -188,6 +197,8 @@ async def update_address(
     address.phone = body.phone
     address.is_default = body.is_default
 
+    await db.flush()
+    await _refresh_segments(db, store.id, customer.id)
     await db.commit()
     await db.refresh(address)
 
@@ -226,6 +237,8 @@ async def delete_address(
         raise HTTPException(status_code=404, detail="Address not found")
 
     await db.delete(address)
+    await db.flush()
+    await _refresh_segments(db, store.id, customer.id)
     await db.commit()
 
 
@@ -275,6 +288,8 @@ async def set_default(
     )
 
     address.is_default = True
+    await db.flush()
+    await _refresh_segments(db, store.id, customer.id)
     await db.commit()
     await db.refresh(address)
 
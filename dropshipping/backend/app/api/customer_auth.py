@@ -28,7 +28,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.customer import CustomerAccount
-from app.models.store import Store, StoreStatus
 from app.api.deps import get_current_customer
 from app.schemas.customer import (
     CustomerChangePasswordRequest,
@@ -53,11 +52,13 @@ from app.services.customer_service import (
     register_customer,
     verify_password,
 )
+from app.services import segment_rules_service
+from app.services.storefront_routing_service import StoreRoute, resolve_slug
 
 router = APIRouter(prefix="/public/stores/{slug}/customers", tags=["customer-auth"])
 
 
-async def _get_active_store(db: AsyncSession, slug: str) -> Store:
+async def _get_active_store(db: AsyncSession, slug: str) -> StoreRoute:
     """Resolve an active store by slug.
 
     Args:
@@ -65,16 +66,13 @@ async def _get_active_store(db: AsyncSession, slug: str) -> Store:
         slug: The store's URL slug.
 
     Returns:
-        The Store ORM instance.
+        The store's ``StoreRoute``.
 
     Raises:
         HTTPException: 404 if the store is not found or not active.
     """
-    result = await db.execute(
-        select(Store).where(Store.slug == slug, Store.status == StoreStatus.active)
-    )
-    store = result.scalar_one_or_none()
-    if not store:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(status_code=404, detail="Store not found")
     return store
 
@@ -260,6 +258,14 @@ async def update_profile(
         customer.last_name = body.last_name
     if body.email is not None:
         customer.email = body.email
+        await db.flush()
+        # Orders are matched to customers by email.
+        await segment_rules_service.refresh_customer_segments(
+            db,
+            customer.store_id,
+            frozenset({segment_rules_service.PROFILE, segment_rules_service.ORDERS}),
+            customer_id=customer.id,
+        )
     await db.commit()
     await db.refresh(customer)
     return CustomerProfileResponse.model_validate(customer)
@@ -26,7 +26,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.customer import CustomerAccount
 from app.models.order import Order
-from app.models.store import Store, StoreStatus
+from app.services.storefront_routing_service import StoreRoute, resolve_slug
 from app.api.deps import get_current_customer
 from app.schemas.customer import CustomerOrderResponse
 
@@ -36,13 +36,10 @@ router = APIRouter(
 )
 
 
-async def _get_active_store(db: AsyncSession, slug: str) -> Store:
+async def _get_active_store(db: AsyncSession, slug: str) -> StoreRoute:
     """Resolve an active store by slug."""
-    result = await db.execute(
-        select(Store).where(Store.slug == slug, Store.status == StoreStatus.active)
-    )
-    store = result.scalar_one_or_none()
-    if not store:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(status_code=404, detail="Store not found")
     return store
 
@@ -2,20 +2,28 @@
 
 Provides reusable dependencies such as ``get_current_user`` that can be
 injected into any route handler that requires an authenticated user,
-and plan enforcement dependencies (``check_store_limit``,
-``check_product_limit``) that gate resource creation.
+plan enforcement dependencies (``check_store_limit``,
+``check_product_limit``) that gate resource creation, and store access
+dependencies (``get_store_role``, ``require_store_owner``) for routes
+under ``/stores/{store_id}``.
 
 **For Developers:**
     Use ``current_user: User = Depends(get_current_user)`` in route
     signatures to enforce authentication and receive the caller's User object.
     Use ``Depends(check_store_limit)`` / ``Depends(check_product_limit)``
     on create endpoints to enforce plan limits (returns 403 if exceeded).
+    Use ``role: str = Depends(get_store_role)`` or
+    ``Depends(require_store_owner)`` to check store access; answers are
+    cached by ``store_access_service``, so the service-level ownership
+    checks later in the same request cost nothing.
 
 **For QA Engineers:**
     - Any request missing a valid ``Authorization: Bearer <token>`` header
       will receive a 401 response with ``"Could not validate credentials"``.
     - Plan limit violations return 403 with a message indicating the limit
       and suggesting an upgrade.
+    - Store access failures return 404 ``"Store not found"`` so that
+      other users' store IDs are not disclosed.
 """
 
 import uuid
@@ -34,6 +42,7 @@ from app.models.store import Store, StoreStatus
 from app.models.user import User
 from app.services.auth_service import decode_token, get_user_by_id
 from app.services.customer_service import get_customer_by_id
+from app.services.store_access_service import OWNER, resolve_store_role
 
 # OAuth2 scheme extracts the Bearer token from the Authorization header.
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -169,6 +178,60 @@ async def check_product_limit(
     return current_user
 
 
+async def get_store_role(
+    store_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> str:
+    """Resolve the current user's role in the store from the URL path.
+
+    Args:
+        store_id: The store UUID (from the URL path).
+        current_user: The authenticated user.
+        db: Async database session.
+
+    Returns:
+        ``"owner"`` or the user's team role (``"admin"``, ``"editor"``,
+        ``"viewer"``).
+
+    Raises:
+        HTTPException: 404 if the store does not exist, is deleted, or
+            the user has no access to it.
+    """
+    role = await resolve_store_role(db, store_id, current_user.id)
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
+        )
+    return role
+
+
+async def require_store_owner(
+    current_user: User = Depends(get_current_user),
+    role: str = Depends(get_store_role),
+) -> User:
+    """Verify the current user owns the store from the URL path.
+
+    Inject this instead of ``get_current_user`` on owner-only store
+    endpoints. Returns the authenticated user on success.
+
+    Args:
+        current_user: The authenticated user.
+        role: The user's role in the store (resolved via ``get_store_role``).
+
+    Returns:
+        The authenticated User if they own the store.
+
+    Raises:
+        HTTPException: 404 if the user does not own the store.
+    """
+    if role != OWNER:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
+        )
+    return current_user
+
+
 # Optional OAuth2 scheme for customer tokens (same header, different audience).
 customer_oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/public/stores/{slug}/customers/login",
@@ -1,18 +1,32 @@
-"""CSV export API endpoints.
+"""Data export API endpoints.
 
 Provides download endpoints for exporting store data (orders, products,
-customers) as CSV files. All endpoints require authentication and verify
-store ownership.
+customers) as CSV or NDJSON, optionally gzip-compressed, plus background
+export jobs for very large stores. All endpoints require authentication
+and verify store ownership.
 
 **For Developers:**
-    Each endpoint returns a ``StreamingResponse`` with
-    ``text/csv`` content type and a ``Content-Disposition`` header that
-    triggers a file download in the browser.
+    The direct download endpoints return a ``StreamingResponse`` over the
+    async generator from ``export_service.open_export``; rows are read
+    from a server-side cursor in batches and the first bytes are sent
+    before the query finishes. The request's database session stays open
+    until the response has been fully streamed.
+
+    ``POST /{dataset}/jobs`` records an ``ExportJob``, commits it, and
+    dispatches ``export_tasks.generate_export``. Clients poll
+    ``GET /jobs/{job_id}`` and download the file from
+    ``GET /jobs/{job_id}/download`` once ``status`` is ``completed``.
 
 **For QA Engineers:**
-    - ``GET /stores/{store_id}/exports/orders`` → orders CSV download
-    - ``GET /stores/{store_id}/exports/products`` → products CSV download
-    - ``GET /stores/{store_id}/exports/customers`` → customers CSV download
+    - ``GET /stores/{store_id}/exports/orders`` → orders download
+    - ``GET /stores/{store_id}/exports/products`` → products download
+    - ``GET /stores/{store_id}/exports/customers`` → customers download
+    - ``?format=ndjson`` switches to newline-delimited JSON;
+      ``?gzip=true`` returns a ``.gz`` file (``application/gzip``).
+    - ``POST /stores/{store_id}/exports/{dataset}/jobs`` → 202 with job.
+    - ``GET /stores/{store_id}/exports/jobs/{job_id}`` → job status.
+    - ``GET /stores/{store_id}/exports/jobs/{job_id}/download`` → file;
+      409 if the job has not completed.
     - All endpoints require valid JWT authentication.
     - Returns 404 if the store doesn't exist or belong to the user.
 
@@ -22,19 +36,26 @@ store ownership.
 @module api/exports
 """
 
+import os
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
 from app.api.deps import get_current_user
+from app.database import get_db
+from app.models.export_job import ExportJob, ExportJobStatus
 from app.models.user import User
+from app.schemas.export import ExportJobResponse
 from app.services.export_service import (
-    export_orders_csv,
-    export_products_csv,
-    export_customers_csv,
+    ExportDataset,
+    ExportFormat,
+    create_export_job,
+    export_filename,
+    export_media_type,
+    get_export_job,
+    open_export,
 )
 
 router = APIRouter(
@@ -43,100 +64,239 @@ router = APIRouter(
 )
 
 
+def _job_response(job: ExportJob) -> ExportJobResponse:
+    """Build the API response for an export job, with its download link."""
+    response = ExportJobResponse.model_validate(job)
+    if job.status == ExportJobStatus.completed:
+        response.download_url = (
+            f"/api/v1/stores/{job.store_id}/exports/jobs/{job.id}/download"
+        )
+    return response
+
+
+async def _stream_dataset(
+    dataset: ExportDataset,
+    store_id: uuid.UUID,
+    fmt: ExportFormat,
+    gzip: bool,
+    current_user: User,
+    db: AsyncSession,
+) -> StreamingResponse:
+    """Open a streaming export and wrap it in a download response.
+
+    The export reads a server-side cursor from the request's ``get_db``
+    session while the body streams; FastAPI keeps dependency sessions
+    open until the response is sent from 0.118 on (hence the pin).
+    """
+    try:
+        chunks = await open_export(db, store_id, current_user.id, dataset, fmt, gzip)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    filename = export_filename(dataset, store_id, fmt, gzip)
+    return StreamingResponse(
+        chunks,
+        media_type=export_media_type(fmt, gzip),
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 @router.get("/orders")
 async def export_orders(
     store_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> Response:
-    """Export all orders for a store as a CSV file download.
+) -> StreamingResponse:
+    """Stream all orders for a store as a file download.
 
     Args:
         store_id: The store UUID from the URL path.
+        format: Serialization format (``csv`` or ``ndjson``).
+        gzip: Whether to gzip-compress the download.
         current_user: The authenticated user (injected by dependency).
         db: Database session (injected by dependency).
 
     Returns:
-        A CSV file response with orders data.
+        A streaming file response with orders data.
 
     Raises:
         HTTPException: 404 if store not found or access denied.
     """
-    try:
-        csv_content = await export_orders_csv(db, store_id, current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=orders-{store_id}.csv",
-        },
+    return await _stream_dataset(
+        ExportDataset.orders, store_id, format, gzip, current_user, db
     )
 
 
 @router.get("/products")
 async def export_products(
     store_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> Response:
-    """Export all products for a store as a CSV file download.
+) -> StreamingResponse:
+    """Stream all products for a store as a file download.
 
     Args:
         store_id: The store UUID from the URL path.
+        format: Serialization format (``csv`` or ``ndjson``).
+        gzip: Whether to gzip-compress the download.
         current_user: The authenticated user (injected by dependency).
         db: Database session (injected by dependency).
 
     Returns:
-        A CSV file response with products data.
+        A streaming file response with products data.
 
     Raises:
         HTTPException: 404 if store not found or access denied.
     """
-    try:
-        csv_content = await export_products_csv(db, store_id, current_user.id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=products-{store_id}.csv",
-        },
+    return await _stream_dataset(
+        ExportDataset.products, store_id, format, gzip, current_user, db
     )
 
 
 @router.get("/customers")
 async def export_customers(
     store_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream all customer accounts for a store as a file download.
+
+    Args:
+        store_id: The store UUID from the URL path.
+        format: Serialization format (``csv`` or ``ndjson``).
+        gzip: Whether to gzip-compress the download.
+        current_user: The authenticated user (injected by dependency).
+        db: Database session (injected by dependency).
+
+    Returns:
+        A streaming file response with customers data.
+
+    Raises:
+        HTTPException: 404 if store not found or access denied.
+    """
+    return await _stream_dataset(
+        ExportDataset.customers, store_id, format, gzip, current_user, db
+    )
+
+
+@router.post(
+    "/{dataset}/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_export_job_endpoint(
+    store_id: uuid.UUID,
+    dataset: ExportDataset,
+    format: ExportFormat = Query(ExportFormat.csv, description="csv or ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> Response:
-    """Export all customer accounts for a store as a CSV file download.
+) -> ExportJobResponse:
+    """Queue a background export that writes the dataset to a file.
 
     Args:
         store_id: The store UUID from the URL path.
+        dataset: Which dataset to export.
+        format: Serialization format (``csv`` or ``ndjson``).
+        gzip: Whether to gzip-compress the file.
         current_user: The authenticated user (injected by dependency).
         db: Database session (injected by dependency).
 
     Returns:
-        A CSV file response with customers data.
+        The pending export job.
 
     Raises:
         HTTPException: 404 if store not found or access denied.
     """
     try:
-        csv_content = await export_customers_csv(db, store_id, current_user.id)
+        job = await create_export_job(
+            db, store_id, current_user.id, dataset, format, gzip
+        )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={
-            "Content-Disposition": f"attachment; filename=customers-{store_id}.csv",
-        },
+    # Commit before dispatching so the worker can see the job row
+    await db.commit()
+
+    from app.tasks.export_tasks import generate_export
+    generate_export.delay(str(job.id))
+
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job_endpoint(
+    store_id: uuid.UUID,
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ExportJobResponse:
+    """Get the status of a background export job.
+
+    Args:
+        store_id: The store UUID from the URL path.
+        job_id: The export job UUID.
+        current_user: The authenticated user (injected by dependency).
+        db: Database session (injected by dependency).
+
+    Returns:
+        The export job, with ``download_url`` once completed.
+
+    Raises:
+        HTTPException: 404 if the store or job is not found.
+    """
+    try:
+        job = await get_export_job(db, store_id, current_user.id, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_export_job(
+    store_id: uuid.UUID,
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> FileResponse:
+    """Download the file produced by a completed export job.
+
+    Args:
+        store_id: The store UUID from the URL path.
+        job_id: The export job UUID.
+        current_user: The authenticated user (injected by dependency).
+        db: Database session (injected by dependency).
+
+    Returns:
+        The export file.
+
+    Raises:
+        HTTPException: 404 if the store, job, or file is not found;
+            409 if the job has not completed.
+    """
+    try:
+        job = await get_export_job(db, store_id, current_user.id, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    if job.status != ExportJobStatus.completed:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job is {job.status.value}",
+        )
+    if not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(status_code=404, detail="Export file no longer exists.")
+
+    dataset = ExportDataset(job.dataset)
+    fmt = ExportFormat(job.format)
+    return FileResponse(
+        job.file_path,
+        media_type=export_media_type(fmt, job.compressed),
+        filename=export_filename(dataset, store_id, fmt, job.compressed),
     )
@@ -32,7 +32,6 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -301,18 +300,12 @@ async def public_validate_gift_card_endpoint(
     Raises:
         HTTPException 404: If the store is not found.
     """
-    from app.models.store import Store, StoreStatus
+    from app.services.storefront_routing_service import resolve_slug
     from app.services import gift_card_service
 
     # Resolve store from slug
-    store_result = await db.execute(
-        select(Store).where(
-            Store.slug == slug,
-            Store.status == StoreStatus.active,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
         )
@@ -15,6 +15,8 @@ ecommerce and hybrid stores. All endpoints are scoped under
     - Warehouse and inventory CRUD follows standard REST patterns.
     - Deleting the default warehouse returns 400.
     - Adjusting below zero quantity returns 400.
+    - ``/inventory/{id}/hot-counter`` toggles the Redis flash-sale gate
+      for a single inventory level (404 for other stores' levels).
 
 **For Project Managers:**
     These endpoints power the inventory management dashboard for
@@ -30,6 +32,7 @@ ecommerce and hybrid stores. All endpoints are scoped under
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -37,6 +40,7 @@ from app.database import get_db
 from app.models.user import User
 from app.schemas.inventory import (
     AdjustInventoryRequest,
+    HotCounterResponse,
     CreateWarehouseRequest,
     InventoryAdjustmentResponse,
     InventoryLevelResponse,
@@ -59,6 +63,7 @@ from app.services.inventory_service import (
     set_inventory_level,
     update_warehouse,
 )
+from app.services.reservation_service import mark_level_hot, unmark_level_hot
 from app.services.store_service import get_store
 
 router = APIRouter(tags=["inventory"])
@@ -437,3 +442,68 @@ async def low_stock_endpoint(
     await _verify_store_access(db, current_user.id, store_id)
     items = await get_low_stock_items(db, store_id)
     return [InventoryLevelResponse.model_validate(item) for item in items]
+
+
+@router.post(
+    "/stores/{store_id}/inventory/{inventory_level_id}/hot-counter",
+    response_model=HotCounterResponse,
+)
+async def enable_hot_counter_endpoint(
+    store_id: uuid.UUID,
+    inventory_level_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> HotCounterResponse:
+    """Gate reservations for a flash-sale SKU through a Redis counter.
+
+    Args:
+        store_id: The store's UUID.
+        inventory_level_id: The inventory level to front.
+        current_user: Authenticated user.
+        db: Database session.
+
+    Returns:
+        The hot counter state with the seeded available units.
+    """
+    await _verify_store_access(db, current_user.id, store_id)
+    try:
+        available = await mark_level_hot(db, store_id, inventory_level_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Hot stock counters are unavailable",
+        )
+    return HotCounterResponse(
+        inventory_level_id=inventory_level_id, is_hot=True, available=available
+    )
+
+
+@router.delete(
+    "/stores/{store_id}/inventory/{inventory_level_id}/hot-counter",
+    response_model=HotCounterResponse,
+)
+async def disable_hot_counter_endpoint(
+    store_id: uuid.UUID,
+    inventory_level_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> HotCounterResponse:
+    """Stop gating an inventory level through a Redis counter.
+
+    Args:
+        store_id: The store's UUID.
+        inventory_level_id: The inventory level to release.
+        current_user: Authenticated user.
+        db: Database session.
+
+    Returns:
+        The hot counter state (``is_hot`` false).
+    """
+    await _verify_store_access(db, current_user.id, store_id)
+    try:
+        await unmark_level_hot(db, store_id, inventory_level_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return HotCounterResponse(inventory_level_id=inventory_level_id, is_hot=False)
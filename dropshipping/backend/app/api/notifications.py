@@ -16,11 +16,16 @@ team invitations, and other events.
     - Mark-read accepts a list of notification IDs.
     - Mark-all-read marks every unread notification for the user.
     - DELETE returns 204 with no content.
+    - GET ``/stream`` is a Server-Sent Events stream of new notifications
+      and unread count changes (see ``notification_push_service``). It
+      authenticates with the same Bearer header, so the dashboard reads
+      it with ``fetch`` rather than ``EventSource``.
 
 **For End Users:**
     - View notifications about orders, team invites, and system events.
     - Mark notifications as read individually or all at once.
     - See your unread notification count for badge display.
+    - New notifications appear without reloading the page.
     - Delete notifications you no longer need.
 """
 
@@ -28,10 +33,11 @@ import math
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, oauth2_scheme
 from app.database import get_db
 from app.models.user import User
 from app.schemas.notification import (
@@ -139,6 +145,51 @@ async def get_unread_count_endpoint(
     return UnreadCountResponse(count=count)
 
 
+async def _stream_subscriber(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> tuple[uuid.UUID, int]:
+    """Authenticate a stream and read its opening unread count.
+
+    Function-scoped, so the database session is released before the
+    (long-lived) stream starts instead of being held until it closes.
+
+    Returns:
+        Tuple of the user's UUID and their unread count.
+    """
+    from app.services import notification_service
+
+    user = await get_current_user(token, db)
+    return user.id, await notification_service.get_unread_count(db, user_id=user.id)
+
+
+@router.get("/stream")
+async def stream_notifications_endpoint(
+    subscriber: tuple[uuid.UUID, int] = Depends(_stream_subscriber),
+) -> StreamingResponse:
+    """Push new notifications and unread count changes as Server-Sent Events.
+
+    Opens with an ``unread_count`` event, then sends ``notification`` and
+    ``unread_count`` events as they happen, with a keep-alive comment when
+    idle. Replaces polling ``/unread-count`` and the list.
+
+    Args:
+        subscriber: The authenticated user's UUID and unread count.
+
+    Returns:
+        A ``text/event-stream`` response that stays open until the client
+        disconnects.
+    """
+    from app.services.notification_push_service import stream_events
+
+    user_id, unread_count = subscriber
+    return StreamingResponse(
+        stream_events(user_id, unread_count),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/mark-read", response_model=MarkReadResponse)
 async def mark_notifications_read_endpoint(
     request: MarkReadRequest,
@@ -30,7 +30,7 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import check_product_limit, get_current_user
+from app.api.deps import check_product_limit, get_current_user, require_store_owner
 from app.database import get_db
 from app.models.product import ProductStatus
 from app.models.user import User
@@ -307,8 +307,7 @@ async def delete_product_endpoint(
 async def upload_product_image(
     store_id: uuid.UUID,
     file: UploadFile,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_store_owner),
 ) -> dict:
     """Upload a product image to local filesystem.
 
@@ -318,8 +317,7 @@ async def upload_product_image(
     Args:
         store_id: The UUID of the store.
         file: The uploaded image file.
-        current_user: The authenticated user, injected by dependency.
-        db: Async database session injected by FastAPI.
+        current_user: The authenticated store owner, injected by dependency.
 
     Returns:
         A dict with the ``url`` key containing the image path.
@@ -328,15 +326,6 @@ async def upload_product_image(
         HTTPException: 404 if the store is not found or belongs to another user.
         HTTPException: 400 if the file type is not an allowed image format.
     """
-    from app.services.product_service import _verify_store_ownership
-
-    try:
-        await _verify_store_ownership(db, store_id, current_user.id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
-        )
-
     allowed_types = {"image/jpeg", "image/png", "image/webp", "image/gif"}
     if file.content_type not in allowed_types:
         raise HTTPException(
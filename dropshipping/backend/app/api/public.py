@@ -6,7 +6,9 @@ by the Next.js storefront app via server-side rendering.
 
 **For Developers:**
     The router is prefixed with ``/public`` (full path:
-    ``/api/v1/public/...``). Stores are looked up by slug, not UUID.
+    ``/api/v1/public/...``). Stores are looked up by slug, not UUID, or
+    by custom domain (``/public/host``), through the in-memory table of
+    ``storefront_routing_service``.
     Products are scoped to a store slug and only active products are returned.
 
 **For QA Engineers:**
@@ -14,6 +16,8 @@ by the Next.js storefront app via server-side rendering.
     - Only products with ``status == active`` are returned.
     - Paused and deleted stores return 404.
     - No ``user_id`` or ``cost`` is exposed in product responses.
+    - Product endpoints accept ``?currency=EUR`` to show every price in
+      another supported currency (unsupported codes return 400).
 
 **For End Users:**
     These endpoints power the public storefront. When you visit a store
@@ -22,17 +26,16 @@ by the Next.js storefront app via server-side rendering.
 
 import json
 import math
-import uuid
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.order import Order
 from app.models.product import Product, ProductStatus
-from app.models.store import Store, StoreStatus
+from app.models.store import Store
 from app.schemas.order import (
     CalculateTaxRequest,
     CalculateTaxResponse,
@@ -48,38 +51,78 @@ from app.schemas.public import (
     PublicStoreResponse,
 )
 from app.schemas.theme import PublicThemeResponse
-from app.services import order_service, theme_service
+from app.services import currency_service, order_service, theme_service
 from app.services.discount_service import apply_discount, validate_discount
 from app.services.gift_card_service import charge_gift_card, validate_gift_card
+from app.services.storefront_routing_service import StoreRoute, resolve_host, resolve_slug
 from app.services.stripe_service import create_checkout_session
 from app.services.tax_service import calculate_tax
 
 router = APIRouter(prefix="/public", tags=["public"])
 
 
-async def _get_active_store(db: AsyncSession, slug: str) -> Store:
-    """Retrieve an active store by slug or raise 404.
+async def _get_active_store(db: AsyncSession, slug: str) -> StoreRoute:
+    """Resolve an active store by slug or raise 404.
 
     Args:
         db: Async database session.
         slug: The store's URL slug.
 
     Returns:
-        The Store ORM instance.
+        The store's ``StoreRoute`` (from the in-memory routing table).
 
     Raises:
         HTTPException: 404 if the store does not exist or is not active.
     """
-    result = await db.execute(
-        select(Store).where(Store.slug == slug, Store.status == StoreStatus.active)
-    )
-    store = result.scalar_one_or_none()
-    if store is None:
+    route = await resolve_slug(db, slug)
+    if route is None or not route.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Store not found",
         )
-    return store
+    return route
+
+
+async def _priced_products(
+    products: list[Product], store: StoreRoute, currency: str | None
+) -> list[PublicProductResponse]:
+    """Build product responses with prices in the requested currency.
+
+    Every price on the page (product, compare-at, and variant prices) is
+    converted in a single ``convert_prices`` call.
+
+    Args:
+        products: Products to serialize.
+        store: The products' store.
+        currency: Requested ISO 4217 code, or None for the store's own.
+
+    Returns:
+        The product responses, in input order.
+
+    Raises:
+        HTTPException: 400 if the currency is not supported.
+    """
+    store_currency = store.default_currency or "USD"
+    target = (currency or store_currency).upper()
+    items = [PublicProductResponse.model_validate(p) for p in products]
+    for item in items:
+        item.currency = target
+    if target == store_currency:
+        return items
+
+    fields = [(item, "price") for item in items]
+    fields += [(item, "compare_at_price") for item in items]
+    fields += [(variant, "price") for item in items for variant in item.variants]
+    fields = [(obj, name) for obj, name in fields if getattr(obj, name) is not None]
+    try:
+        converted = await currency_service.convert_prices(
+            [getattr(obj, name) for obj, name in fields], store_currency, target
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    for (obj, name), amount in zip(fields, converted):
+        setattr(obj, name, amount)
+    return items
 
 
 @router.get("/stores/{slug}", response_model=PublicStoreResponse)
@@ -102,8 +145,42 @@ async def get_public_store(
     Raises:
         HTTPException: 404 if the store does not exist or is not active.
     """
-    store = await _get_active_store(db, slug)
-    return PublicStoreResponse.model_validate(store)
+    route = await _get_active_store(db, slug)
+    return PublicStoreResponse.model_validate(await db.get(Store, route.id))
+
+
+@router.get("/host", response_model=PublicStoreResponse)
+async def get_public_store_for_host(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> PublicStoreResponse:
+    """Retrieve the store whose verified custom domain the request came to.
+
+    The storefront calls this for requests on a custom domain to learn
+    which store slug to render. ``StorefrontHostMiddleware`` resolves the
+    host from memory; hosts it does not know are looked up once and then
+    answered from the negative cache.
+
+    Args:
+        request: The incoming request (``Host`` or ``X-Forwarded-Host``).
+        db: Async database session injected by FastAPI.
+
+    Returns:
+        PublicStoreResponse for the domain's store.
+
+    Raises:
+        HTTPException: 404 if the host is not a verified custom domain of
+            an active store.
+    """
+    route = request.state.storefront_store or await resolve_host(
+        db, request.state.storefront_host
+    )
+    if route is None or not route.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Store not found",
+        )
+    return PublicStoreResponse.model_validate(await db.get(Store, route.id))
 
 
 @router.get(
@@ -114,6 +191,9 @@ async def list_public_products(
     slug: str,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    currency: str | None = Query(
+        None, min_length=3, max_length=3, description="Display currency (ISO 4217)"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedPublicProductResponse:
     """List active products for a store (public, paginated).
@@ -125,6 +205,8 @@ async def list_public_products(
         slug: The store's URL slug.
         page: Page number (1-based, default 1).
         per_page: Items per page (1–100, default 20).
+        currency: Optional currency to show prices in (default: the
+            store's currency).
         db: Async database session injected by FastAPI.
 
     Returns:
@@ -132,6 +214,7 @@ async def list_public_products(
 
     Raises:
         HTTPException: 404 if the store does not exist or is not active.
+        HTTPException: 400 if the currency is not supported.
     """
     store = await _get_active_store(db, slug)
 
@@ -158,7 +241,7 @@ async def list_public_products(
     pages = math.ceil(total / per_page) if total > 0 else 1
 
     return PaginatedPublicProductResponse(
-        items=[PublicProductResponse.model_validate(p) for p in products],
+        items=await _priced_products(products, store, currency),
         total=total,
         page=page,
         per_page=per_page,
@@ -173,6 +256,9 @@ async def list_public_products(
 async def get_public_product(
     slug: str,
     product_slug: str,
+    currency: str | None = Query(
+        None, min_length=3, max_length=3, description="Display currency (ISO 4217)"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> PublicProductResponse:
     """Retrieve a single active product by its slug (public).
@@ -180,6 +266,8 @@ async def get_public_product(
     Args:
         slug: The store's URL slug.
         product_slug: The product's URL slug.
+        currency: Optional currency to show prices in (default: the
+            store's currency).
         db: Async database session injected by FastAPI.
 
     Returns:
@@ -187,6 +275,7 @@ async def get_public_product(
 
     Raises:
         HTTPException: 404 if the store or product does not exist or is not active.
+        HTTPException: 400 if the currency is not supported.
     """
     store = await _get_active_store(db, slug)
 
@@ -205,7 +294,8 @@ async def get_public_product(
             detail="Product not found",
         )
 
-    return PublicProductResponse.model_validate(product)
+    (item,) = await _priced_products([product], store, currency)
+    return item
 
 
 @router.post(
@@ -317,8 +407,10 @@ async def create_checkout(
         3. Calculate tax based on shipping address and discounted subtotal.
         4. If ``gift_card_code`` provided, validate and calculate deduction.
         5. Compute final total: subtotal - discount + tax - gift_card.
-        6. Create Stripe Checkout session for the final total.
-        7. Create pending order with all financial data and shipping address.
+        6. Create pending order with all financial data and shipping address,
+           reserving warehouse stock for tracked variants.
+        7. Create Stripe Checkout session for the final total, so no
+           session is left behind when stock could not be reserved.
 
     Args:
         slug: The store's URL slug.
@@ -333,7 +425,8 @@ async def create_checkout(
     Raises:
         HTTPException: 404 if the store doesn't exist or is not active.
         HTTPException: 400 if cart items are invalid, discount code is
-            invalid, or gift card has insufficient balance.
+            invalid, gift card has insufficient balance, or warehouse
+            stock could not be reserved.
     """
     store = await _get_active_store(db, slug)
 
@@ -412,33 +505,41 @@ async def create_checkout(
     # 5. Compute final total
     total = max(discounted_subtotal + tax_amount - gift_card_amount, Decimal("0.00"))
 
-    # 6. Create Stripe session (for the amount Stripe will charge)
-    checkout_id = uuid.uuid4()
+    # 6. Create pending order with full financial breakdown. This reserves
+    # the stock, so an out-of-stock checkout fails before Stripe is called.
+    shipping_address_json = json.dumps(body.shipping_address.model_dump())
+
+    try:
+        order = await order_service.create_order_from_checkout(
+            db=db,
+            store_id=store.id,
+            customer_email=body.customer_email,
+            items_data=order_items,
+            total=total,
+            subtotal=subtotal,
+            shipping_address=shipping_address_json,
+            discount_code=discount_code,
+            discount_amount=discount_amount,
+            tax_amount=tax_amount,
+            gift_card_amount=gift_card_amount,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    # 7. Create Stripe session (for the amount Stripe will charge). If it
+    # fails, the request rolls back and the reservation with it.
     stripe_data = create_checkout_session(
-        order_id=checkout_id,
+        order_id=order.id,
         items=order_items,
         customer_email=body.customer_email,
         store_name=store.name,
         total_override=total if (discount_amount > 0 or gift_card_amount > 0 or tax_amount > 0) else None,
     )
-
-    # 7. Create pending order with full financial breakdown
-    shipping_address_json = json.dumps(body.shipping_address.model_dump())
-
-    order = await order_service.create_order_from_checkout(
-        db=db,
-        store_id=store.id,
-        customer_email=body.customer_email,
-        items_data=order_items,
-        total=total,
-        stripe_session_id=stripe_data["session_id"],
-        subtotal=subtotal,
-        shipping_address=shipping_address_json,
-        discount_code=discount_code,
-        discount_amount=discount_amount,
-        tax_amount=tax_amount,
-        gift_card_amount=gift_card_amount,
-    )
+    order.stripe_session_id = stripe_data["session_id"]
+    await db.flush()
 
     return CheckoutResponse(
         checkout_url=stripe_data["checkout_url"],
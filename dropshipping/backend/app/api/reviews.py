@@ -87,6 +87,7 @@ class PaginatedPublicReviewResponse(BaseModel):
         per_page: Number of items per page.
         pages: Total number of pages.
         average_rating: Average star rating for this product.
+        rating_distribution: Approved reviews per star level ("1"-"5").
     """
 
     items: list[PublicReviewResponse]
@@ -95,6 +96,7 @@ class PaginatedPublicReviewResponse(BaseModel):
     per_page: int
     pages: int
     average_rating: Optional[Decimal] = None
+    rating_distribution: dict[str, int] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -334,7 +336,8 @@ async def list_public_product_reviews_endpoint(
     """List approved reviews for a product (public).
 
     Returns only approved reviews visible to customers on the storefront.
-    Includes the average rating for the product.
+    Includes the product's average rating and star histogram, read from
+    its aggregates.
 
     Args:
         slug: The store's URL slug.
@@ -351,18 +354,12 @@ async def list_public_product_reviews_endpoint(
     """
     from app.services import review_service
 
-    from app.models.store import Store, StoreStatus
+    from app.services.storefront_routing_service import resolve_slug
     from app.models.product import Product, ProductStatus
 
     try:
         # Resolve store and product from slugs
-        store_result = await db.execute(
-            select(Store).where(
-                Store.slug == slug,
-                Store.status != StoreStatus.deleted,
-            )
-        )
-        store = store_result.scalar_one_or_none()
+        store = await resolve_slug(db, slug)
         if store is None:
             raise ValueError("Store not found")
 
@@ -385,12 +382,8 @@ async def list_public_product_reviews_endpoint(
             per_page=per_page,
         )
 
-        # Get average rating
-        stats = await review_service.get_review_stats(
-            db,
-            store_id=store.id,
-            product_id=product.id,
-        )
+        # Rating stats come from the product's aggregates
+        stats = review_service.rating_stats(product)
         avg_rating = stats.get("average_rating")
     except ValueError as e:
         raise HTTPException(
@@ -406,6 +399,9 @@ async def list_public_product_reviews_endpoint(
         per_page=per_page,
         pages=pages,
         average_rating=avg_rating,
+        rating_distribution={
+            str(k): v for k, v in stats["rating_distribution"].items()
+        },
     )
 
 
@@ -440,18 +436,12 @@ async def submit_public_review_endpoint(
         HTTPException 400: If the customer has already reviewed this product.
     """
     from app.services import review_service
-    from app.models.store import Store, StoreStatus
+    from app.services.storefront_routing_service import resolve_slug
     from app.models.product import Product, ProductStatus
 
     try:
         # Resolve store and product from slugs
-        store_result = await db.execute(
-            select(Store).where(
-                Store.slug == slug,
-                Store.status != StoreStatus.deleted,
-            )
-        )
-        store = store_result.scalar_one_or_none()
+        store = await resolve_slug(db, slug)
         if store is None:
             raise ValueError("Store not found")
 
@@ -33,8 +33,6 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sqlalchemy import select
-
 from app.database import get_db
 from app.schemas.search import SearchResponse
 
@@ -131,18 +129,12 @@ async def search_products_endpoint(
             detail=f"Invalid sort_by. Must be one of: {', '.join(sorted(valid_sort_options))}",
         )
 
-    from app.models.store import Store, StoreStatus
+    from app.services.storefront_routing_service import resolve_slug
     from app.services import search_service
 
     # Resolve store from slug
-    store_result = await db.execute(
-        select(Store).where(
-            Store.slug == slug,
-            Store.status == StoreStatus.active,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
         )
@@ -201,18 +193,12 @@ async def search_suggestions_endpoint(
     Raises:
         HTTPException 404: If the store is not found or is not active.
     """
-    from app.models.store import Store, StoreStatus
+    from app.services.storefront_routing_service import resolve_slug
     from app.services import search_service
 
     # Resolve store from slug
-    store_result = await db.execute(
-        select(Store).where(
-            Store.slug == slug,
-            Store.status == StoreStatus.active,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
+    store = await resolve_slug(db, slug)
+    if store is None or not store.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Store not found"
         )
@@ -117,7 +117,8 @@ async def create_segment_endpoint(
 
     Raises:
         HTTPException 404: If the store is not found or belongs to another user.
-        HTTPException 400: If the segment name already exists in this store.
+        HTTPException 400: If the segment name already exists in this store,
+            or the segment type or rules are invalid.
     """
     from app.services import segment_service
 
@@ -132,7 +133,7 @@ async def create_segment_endpoint(
         detail = str(e)
         code = (
             status.HTTP_400_BAD_REQUEST
-            if "already exists" in detail
+            if "already exists" in detail or detail.startswith("Invalid")
             else status.HTTP_404_NOT_FOUND
         )
         raise HTTPException(status_code=code, detail=detail)
@@ -246,6 +247,7 @@ async def update_segment_endpoint(
 
     Raises:
         HTTPException 404: If the store or segment is not found.
+        HTTPException 400: If the segment type or rules are invalid.
     """
     from app.services import segment_service
 
@@ -258,9 +260,13 @@ async def update_segment_endpoint(
             **request.model_dump(exclude_unset=True),
         )
     except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+        detail = str(e)
+        code = (
+            status.HTTP_400_BAD_REQUEST
+            if detail.startswith("Invalid")
+            else status.HTTP_404_NOT_FOUND
         )
+        raise HTTPException(status_code=code, detail=detail)
     return SegmentResponse.model_validate(segment)
 
 
@@ -327,6 +333,7 @@ async def add_customers_to_segment_endpoint(
 
     Raises:
         HTTPException 404: If the store, segment, or any customer is not found.
+        HTTPException 400: If the segment is automatic.
     """
     from app.services import segment_service
 
@@ -339,9 +346,13 @@ async def add_customers_to_segment_endpoint(
             customer_ids=request.customer_ids,
         )
     except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
+        detail = str(e)
+        code = (
+            status.HTTP_400_BAD_REQUEST
+            if detail.startswith("Invalid")
+            else status.HTTP_404_NOT_FOUND
         )
+        raise HTTPException(status_code=code, detail=detail)
     return {
         "segment_id": str(segment_id),
         "added": added,
@@ -18,11 +18,14 @@ access their own stores.
     - GET/PATCH/DELETE on a non-existent or another user's store returns 404.
     - DELETE performs a soft-delete (status set to ``deleted``).
     - Creating a store returns 201 with the full store data including slug.
+    - Cloning a store with more than ``clone_job_threshold`` products
+      returns 202 with a paused store and a ``job``; poll
+      ``GET /stores/{store_id}/clone/jobs/{job_id}`` for progress.
 """
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import check_store_limit, get_current_user
@@ -32,10 +35,16 @@ from app.schemas.store import (
     CloneStoreRequest,
     CloneStoreResponse,
     CreateStoreRequest,
+    StoreCloneJobResponse,
     StoreResponse,
     UpdateStoreRequest,
 )
-from app.services.clone_service import clone_store
+from app.services.clone_service import (
+    clone_store,
+    get_clone_job,
+    needs_clone_job,
+    start_clone_job,
+)
 from app.services.store_service import (
     create_store,
     delete_store,
@@ -193,6 +202,7 @@ async def delete_store_endpoint(
 async def clone_store_endpoint(
     store_id: uuid.UUID,
     request: CloneStoreRequest,
+    response: Response,
     current_user: User = Depends(check_store_limit),
     db: AsyncSession = Depends(get_db),
 ) -> CloneStoreResponse:
@@ -202,23 +212,49 @@ async def clone_store_endpoint(
     themes, discounts, categories, tax rules, and suppliers. Orders,
     reviews, customers, and analytics are NOT cloned.
 
+    Stores with more than ``settings.clone_job_threshold`` products are
+    copied by a background job: the response is 202 with the new (paused)
+    store and the job to poll.
+
     Plan enforcement: the ``check_store_limit`` dependency verifies
     the user has not exceeded their plan's store limit.
 
     Args:
         store_id: The UUID of the store to clone.
         request: Optional name override for the cloned store.
+        response: The outgoing response (status set to 202 for jobs).
         current_user: The authenticated user (verified within plan limits).
         db: Async database session injected by FastAPI.
 
     Returns:
-        CloneStoreResponse with the new store and the source store ID.
+        CloneStoreResponse with the new store and the source store ID,
+        plus the clone job when the copy runs in the background.
 
     Raises:
         HTTPException: 404 if the source store is not found or belongs to
             another user.
     """
     try:
+        if await needs_clone_job(db, current_user.id, store_id):
+            job, new_store = await start_clone_job(
+                db,
+                user_id=current_user.id,
+                source_store_id=store_id,
+                new_name=request.new_name,
+            )
+            # Commit before dispatching so the worker can see the job row
+            await db.commit()
+
+            from app.tasks.clone_tasks import clone_store_contents
+            clone_store_contents.delay(str(job.id))
+
+            response.status_code = status.HTTP_202_ACCEPTED
+            return CloneStoreResponse(
+                store=StoreResponse.model_validate(new_store),
+                source_store_id=store_id,
+                job=StoreCloneJobResponse.model_validate(job),
+            )
+
         new_store = await clone_store(
             db,
             user_id=current_user.id,
@@ -234,3 +270,34 @@ async def clone_store_endpoint(
         store=StoreResponse.model_validate(new_store),
         source_store_id=store_id,
     )
+
+
+@router.get(
+    "/{store_id}/clone/jobs/{job_id}",
+    response_model=StoreCloneJobResponse,
+)
+async def get_clone_job_endpoint(
+    store_id: uuid.UUID,
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StoreCloneJobResponse:
+    """Get the progress of a background store clone.
+
+    Args:
+        store_id: The UUID of the source store.
+        job_id: The clone job UUID.
+        current_user: The authenticated user, injected by dependency.
+        db: Async database session injected by FastAPI.
+
+    Returns:
+        The clone job with its step progress.
+
+    Raises:
+        HTTPException: 404 if the store or job is not found.
+    """
+    try:
+        job = await get_clone_job(db, current_user.id, store_id, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return StoreCloneJobResponse.model_validate(job)
@@ -14,7 +14,10 @@ checkout to increase average order value.
     - Admin endpoints return 401 without a valid token.
     - POST create returns 201 with the upsell rule data.
     - DELETE returns 204 with no content.
-    - Public endpoint returns only active upsell recommendations.
+    - Public endpoint returns the product's active upsells first, then
+      products frequently bought together with it (``source`` is
+      ``manual`` or ``learned``), read from the precomputed
+      ``product_recommendations`` table in one query.
     - Upsell types: ``upsell``, ``cross_sell``, ``bundle``.
 
 **For End Users:**
@@ -67,6 +70,8 @@ class PublicUpsellResponse(BaseModel):
         title: Display title for the recommendation.
         description: Description text.
         discount_percentage: Optional discount percentage.
+        source: ``manual`` for a configured upsell, ``learned`` for a
+            co-purchase recommendation.
     """
 
     target_product_id: uuid.UUID
@@ -78,6 +83,7 @@ class PublicUpsellResponse(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     discount_percentage: Optional[Decimal] = None
+    source: str = "manual"
 
     model_config = {"from_attributes": True}
 
@@ -283,9 +289,10 @@ async def get_public_product_upsells_endpoint(
 ) -> list[PublicUpsellResponse]:
     """Get upsell recommendations for a product (public).
 
-    Returns active upsell and cross-sell recommendations for a product
-    on the storefront. Only active rules with active target products
-    are included.
+    Returns the product's active upsells (in position order) followed by
+    learned co-purchase recommendations, up to
+    ``settings.recommendation_top_k``. Only active target products are
+    included.
 
     Args:
         slug: The store's URL slug.
@@ -298,19 +305,13 @@ async def get_public_product_upsells_endpoint(
     Raises:
         HTTPException 404: If the store or product is not found.
     """
-    from app.services import upsell_service
-    from app.models.store import Store, StoreStatus
+    from app.services import recommendation_service
+    from app.services.storefront_routing_service import resolve_slug
     from app.models.product import Product, ProductStatus
 
     try:
         # Resolve store and product from slugs
-        store_result = await db.execute(
-            select(Store).where(
-                Store.slug == slug,
-                Store.status != StoreStatus.deleted,
-            )
-        )
-        store = store_result.scalar_one_or_none()
+        store = await resolve_slug(db, slug)
         if store is None:
             raise ValueError("Store not found")
 
@@ -325,11 +326,11 @@ async def get_public_product_upsells_endpoint(
         if product is None:
             raise ValueError("Product not found")
 
-        upsells = await upsell_service.get_product_upsells(
+        recommendations = await recommendation_service.get_product_recommendations(
             db, store_id=store.id, product_id=product.id
         )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=str(e)
         )
-    return [PublicUpsellResponse.model_validate(u) for u in upsells]
+    return [PublicUpsellResponse(**r) for r in recommendations]
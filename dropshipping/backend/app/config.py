@@ -24,6 +24,126 @@ class Settings(BaseSettings):
         jwt_algorithm: Algorithm used for JWT encoding/decoding.
         jwt_access_token_expire_minutes: Lifetime of access tokens in minutes.
         jwt_refresh_token_expire_days: Lifetime of refresh tokens in days.
+        stock_reservation_ttl_minutes: How long an unpaid checkout holds stock.
+        inventory_hot_counters_enabled: Gate hot SKUs through Redis counters.
+        export_dir: Directory where background export jobs write their files.
+        export_retention_hours: How long a finished export file is kept
+            before ``expire_exports`` deletes it.
+        bulk_job_threshold: Bulk operations on more products than this run
+            as a background job instead of inside the request.
+        clone_job_threshold: Stores with more products than this are
+            cloned by a background job.
+        bridge_stream_key: Redis Stream that buffers ServiceBridge events.
+        bridge_stream_maxlen: Approximate cap on the stream's length.
+        bridge_read_batch_size: Stream entries read per drain batch.
+        bridge_max_events_per_post: Events per batch POST to one service.
+        bridge_max_batches_per_drain: Read batches processed per drain run.
+        bridge_timeout_seconds: Per-request timeout for batch POSTs.
+        dns_propagation_concurrency: DNS propagation lookups in flight at
+            once, both for one domain's records and across a sweep batch.
+        domain_health_batch_size: Due domains claimed per health sweep.
+        domain_health_interval_seconds: How often a healthy domain
+            (verified and propagated) is re-checked.
+        domain_health_retry_base_seconds: Delay before re-checking a
+            domain after its first failed check; doubles with every
+            further consecutive failure.
+        domain_health_retry_max_seconds: Upper bound on that delay.
+        domain_health_claim_seconds: How long a sweep's claim on due
+            domains lasts; a sweep that dies mid-batch has its domains
+            picked up again after this.
+        http_pool_max_connections: Connection pool size of the pooled
+            async HTTP client each Celery worker thread uses for outbound
+            deliveries.
+        webhook_timeout_seconds: Per-request timeout for webhook deliveries.
+        webhook_max_per_host: Concurrent webhook deliveries allowed to one
+            destination host.
+        webhook_max_attempts: Delivery attempts per event before a failed
+            webhook delivery is given up.
+        webhook_retry_base_seconds: Delay before the first retry; doubles
+            with every further attempt.
+        webhook_retry_max_seconds: Upper bound on the retry delay.
+        webhook_circuit_breaker_threshold: Consecutive failures after which
+            a webhook is disabled.
+        webhook_retry_batch_size: Due retries claimed per sweep.
+        webhook_retry_claim_seconds: How long a sweep's claim on due
+            retries lasts; a sweep that dies mid-batch has its retries
+            picked up again after this.
+        low_stock_threshold: Variants at or below this many units trigger
+            a low-stock alert after a sale.
+        low_stock_digest_window_seconds: How long low-stock alerts for a
+            store are collected before one digest is sent.
+        tracking_batch_size: Shipped orders polled per tracking batch;
+            each batch is one keyset page and one bulk status update.
+        tracking_min_transit_days: Shipments younger than this are not
+            polled yet.
+        tracking_lookup_concurrency: Bulk carrier lookups in flight at
+            once within a batch.
+        notification_stream_heartbeat_seconds: Idle time after which an
+            open notification stream sends a keep-alive comment.
+        notification_stream_queue_size: Pushed messages one stream may
+            have waiting before the oldest are dropped.
+        aliexpress_api_key: AliExpress Open Platform key for the supplier
+            catalog sync; empty uses the demo catalog.
+        cjdropship_api_key: CJDropshipping API key for the supplier catalog
+            sync; empty uses the demo catalog.
+        supplier_sync_batch_size: Product-supplier links per catalog sync
+            batch; each batch is one keyset page and one bulk update per
+            table.
+        supplier_sync_concurrency: Supplier product lookups in flight at
+            once per supplier platform.
+        recommendation_top_k: Recommendations stored and served per
+            product (manual upsells plus learned co-purchases).
+        recommendation_min_co_purchases: Shared paid orders a product pair
+            needs before it is recommended.
+        gift_card_cache_ttl_seconds: Longest time a gift card's cached
+            validation snapshot (status and expiry) is served.
+        email_backend: ``log`` writes emails to the log (development);
+            ``smtp`` queues them for batched SMTP delivery.
+        email_from_address: Sender address of transactional emails.
+        email_template_cache_dir: Directory for compiled Jinja2 template
+            bytecode, shared by all worker processes on a host.
+        email_outbox_key: Redis list holding emails waiting to be sent.
+        email_batch_window_seconds: How long queued emails are collected
+            before a flush sends them.
+        email_batch_size: Emails taken from the outbox per flush batch.
+        email_max_batches_per_flush: Outbox batches sent per flush run.
+        email_max_attempts: Send attempts before an email is dropped.
+        smtp_host: SMTP relay host.
+        smtp_port: SMTP relay port.
+        smtp_username: SMTP login (empty for unauthenticated relays).
+        smtp_password: SMTP password.
+        smtp_start_tls: Upgrade SMTP connections with STARTTLS.
+        smtp_timeout_seconds: Per-command SMTP timeout.
+        smtp_pool_size: Persistent SMTP connections per worker thread; a
+            flush batch is split across them.
+        checkout_rules_cache_ttl_seconds: Longest time a process answers
+            tax and discount checks from its compiled rules without
+            recompiling.
+        checkout_rules_cache_max_stores: Stores whose compiled checkout
+            rules each process keeps.
+        category_tree_cache_ttl_seconds: Longest time a store's cached
+            category tree (with product counts) is served.
+        ab_test_cache_ttl_seconds: Longest time a process assigns
+            visitors and accepts events from its cached test definition.
+        ab_test_cache_max_tests: A/B test definitions each process keeps.
+        store_access_local_ttl_seconds: Longest time a process answers
+            store access checks from memory; bounds how long other
+            processes honour a revoked role.
+        store_access_cache_ttl_seconds: Lifetime of a store's cached
+            roles in Redis.
+        store_access_cache_max_entries: ``(store, user)`` access answers
+            each process keeps.
+        storefront_routes_refresh_seconds: Interval at which each process
+            reloads its storefront routing table (slugs and custom
+            domains) as a backstop for missed pub/sub messages.
+        storefront_negative_cache_ttl_seconds: How long an unknown slug or
+            host is answered from memory before it is looked up again.
+        storefront_negative_cache_max_entries: Unknown slugs and hosts
+            each process remembers.
+        exchange_rate_source: Where exchange rates are fetched from
+            (``static``, ``file``, or ``http``).
+        exchange_rate_file: JSON rate file read by the ``file`` source.
+        exchange_rate_url: Rate endpoint fetched by the ``http`` source.
     """
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
@@ -76,6 +196,12 @@ class Settings(BaseSettings):
 
     # Platform Bridge (inter-service event delivery)
     platform_webhook_secret: str = "dev-platform-bridge-secret"
+    bridge_stream_key: str = "bridge:events"
+    bridge_stream_maxlen: int = 100_000
+    bridge_read_batch_size: int = 500
+    bridge_max_events_per_post: int = 100
+    bridge_max_batches_per_drain: int = 20
+    bridge_timeout_seconds: float = 10.0
 
     # DNS Management (Feature 6)
     dns_provider_mode: str = "mock"  # mock, cloudflare, route53, google
@@ -88,6 +214,14 @@ class Settings(BaseSettings):
     platform_ip_address: str = "192.0.2.1"  # Platform's public IP for A records
     platform_cname_target: str = "proxy.platform.app"  # Platform's CNAME target
 
+    # Domain health sweeps (see dns_management_service)
+    dns_propagation_concurrency: int = 20
+    domain_health_batch_size: int = 200
+    domain_health_interval_seconds: int = 3600
+    domain_health_retry_base_seconds: int = 60
+    domain_health_retry_max_seconds: int = 21600
+    domain_health_claim_seconds: int = 600
+
     # Domain Purchasing (Feature 7)
     domain_provider_mode: str = "mock"  # mock, resellerclub, squarespace
     resellerclub_api_key: str = ""
@@ -95,5 +229,101 @@ class Settings(BaseSettings):
     squarespace_api_key: str = ""
     platform_nameservers: str = "ns1.platform.app,ns2.platform.app"
 
+    # Stock reservations (checkout holds on warehouse inventory)
+    stock_reservation_ttl_minutes: int = 30
+    inventory_hot_counters_enabled: bool = True
+
+    # Data exports (background export job files)
+    export_dir: str = "/tmp/dropshipping-exports"
+    export_retention_hours: int = 24
+
+    # Bulk product operations (larger batches run as a Celery job)
+    bulk_job_threshold: int = 1000
+
+    # Store cloning (larger catalogs are copied by a Celery job)
+    clone_job_threshold: int = 5000
+
+    # Outbound HTTP from Celery workers (see app.http_client)
+    http_pool_max_connections: int = 100
+
+    # Store webhook delivery (backoff retries, circuit breaker)
+    webhook_timeout_seconds: float = 10.0
+    webhook_max_per_host: int = 4
+    webhook_max_attempts: int = 6
+    webhook_retry_base_seconds: int = 30
+    webhook_retry_max_seconds: int = 3600
+    webhook_circuit_breaker_threshold: int = 10
+    webhook_retry_batch_size: int = 200
+    webhook_retry_claim_seconds: int = 900
+
+    # Post-payment low-stock alerts (one digest per store per window)
+    low_stock_threshold: int = 5
+    low_stock_digest_window_seconds: int = 300
+
+    # Carrier tracking polls (see tracking_service)
+    tracking_batch_size: int = 500
+    tracking_min_transit_days: int = 7
+    tracking_lookup_concurrency: int = 8
+
+    # Dashboard notification push (see notification_push_service)
+    notification_stream_heartbeat_seconds: int = 15
+    notification_stream_queue_size: int = 100
+
+    # Supplier catalog sync (see supplier_sync_service)
+    aliexpress_api_key: str = ""
+    cjdropship_api_key: str = ""
+    supplier_sync_batch_size: int = 200
+    supplier_sync_concurrency: int = 4
+
+    # Storefront recommendations (see recommendation_service)
+    recommendation_top_k: int = 8
+    recommendation_min_co_purchases: int = 2
+
+    # Cached gift card validation (see gift_card_service)
+    gift_card_cache_ttl_seconds: int = 300
+
+    # Transactional email (compiled template cache, batched SMTP outbox)
+    email_backend: str = "log"  # log, smtp
+    email_from_address: str = "no-reply@platform.app"
+    email_template_cache_dir: str = "/tmp/dropshipping-email-templates"
+    email_outbox_key: str = "email:outbox"
+    email_batch_window_seconds: int = 2
+    email_batch_size: int = 200
+    email_max_batches_per_flush: int = 20
+    email_max_attempts: int = 3
+    smtp_host: str = "localhost"
+    smtp_port: int = 587
+    smtp_username: str = ""
+    smtp_password: str = ""
+    smtp_start_tls: bool = True
+    smtp_timeout_seconds: float = 10.0
+    smtp_pool_size: int = 4
+
+    # Compiled per-store tax and discount rules (see checkout_rules_service)
+    checkout_rules_cache_ttl_seconds: int = 60
+    checkout_rules_cache_max_stores: int = 1000
+
+    # Cached storefront category trees (see category_service)
+    category_tree_cache_ttl_seconds: int = 300
+
+    # Cached A/B test definitions (see ab_test_service)
+    ab_test_cache_ttl_seconds: int = 60
+    ab_test_cache_max_tests: int = 5000
+
+    # Cached store access checks (see store_access_service)
+    store_access_local_ttl_seconds: int = 5
+    store_access_cache_ttl_seconds: int = 300
+    store_access_cache_max_entries: int = 10000
+
+    # Storefront routing table (see storefront_routing_service)
+    storefront_routes_refresh_seconds: int = 300
+    storefront_negative_cache_ttl_seconds: int = 60
+    storefront_negative_cache_max_entries: int = 10000
+
+    # Exchange rates (refreshed by Beat into a Redis snapshot)
+    exchange_rate_source: str = "static"  # static, file, http
+    exchange_rate_file: str = ""
+    exchange_rate_url: str = ""
+
 
 settings = Settings()
@@ -3,15 +3,23 @@
 Provides the async SQLAlchemy engine and session factory used throughout the
 application. All ORM models should inherit from ``Base`` so that Alembic can
 detect schema changes via ``Base.metadata``.
+
+``on_commit`` defers work (cache invalidation) until a session's
+transaction has committed, so readers cannot re-cache the old rows in
+between.
 """
 
-from collections.abc import AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator, Callable
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 engine = create_async_engine(settings.database_url, echo=settings.debug)
 
 # expire_on_commit=False allows accessing attributes after commit without
@@ -43,3 +51,39 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+# Session.info key holding the callbacks of the open transaction
+_ON_COMMIT = "on_commit"
+
+
+def on_commit(db: AsyncSession | Session, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Callbacks are dropped if the transaction rolls back. They run
+    synchronously inside ``commit()`` (so use the sync Redis client),
+    before it returns, and a failing callback is logged, not raised.
+
+    Args:
+        db: Async or sync session the change was made in.
+        callback: Function without arguments.
+    """
+    session = db.sync_session if isinstance(db, AsyncSession) else db
+    session.info.setdefault(_ON_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session: Session) -> None:
+    """Run the callbacks registered for the committed transaction."""
+    for callback in session.info.pop(_ON_COMMIT, []):
+        try:
+            callback()
+        except Exception:
+            logger.exception("on_commit callback failed")
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_on_commit(session: Session, transaction: SessionTransaction) -> None:
+    """Forget the callbacks of a rolled-back transaction."""
+    if transaction.parent is None:
+        session.info.pop(_ON_COMMIT, None)
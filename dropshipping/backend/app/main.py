@@ -2,7 +2,10 @@
 
 Creates the FastAPI app instance, configures CORS middleware,
 and registers all API routers for the dropshipping platform.
-All versioned endpoints are mounted under the /api/v1 prefix.
+All versioned endpoints are mounted under the /api/v1 prefix. The app's
+lifespan runs the storefront route listener, which keeps this process's
+slug and custom-domain routing table current, and the notification
+listener, which feeds this process's open dashboard notification streams.
 
 **Router Registration Order:**
     1. Infrastructure: health, auth, webhooks (Stripe)
@@ -15,6 +18,9 @@ All versioned endpoints are mounted under the /api/v1 prefix.
     8. Service integrations: external SaaS microservices (A1-A8)
 """
 
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -82,6 +88,9 @@ from app.api.customer_addresses import router as customer_addresses_router
 
 from app.config import settings
 from app.constants.plans import init_price_ids
+from app.middleware import StorefrontHostMiddleware
+from app.services.notification_push_service import listen_for_notifications
+from app.services.storefront_routing_service import listen_for_route_changes
 
 # ── Sentry error tracking ─────────────────────────────────────────
 init_sentry(
@@ -90,7 +99,25 @@ init_sentry(
     environment=settings.environment,
 )
 
-app = FastAPI(title=settings.app_name)
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the route and notification listeners for the process's life."""
+    listeners = [
+        asyncio.create_task(listen_for_route_changes()),
+        asyncio.create_task(listen_for_notifications()),
+    ]
+    try:
+        yield
+    finally:
+        for listener in listeners:
+            listener.cancel()
+        for listener in listeners:
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 # Security headers middleware (must be added before CORS)
 app.add_middleware(SecurityHeadersMiddleware)
@@ -106,6 +133,9 @@ app.add_middleware(
 # Request logging middleware (adds X-Request-ID and structured access logs)
 app.add_middleware(RequestLoggingMiddleware, service_name=settings.service_name)
 
+# Resolve custom-domain storefronts from the in-memory routing table
+app.add_middleware(StorefrontHostMiddleware)
+
 # Rate limiting (100 requests/minute default)
 setup_rate_limiting(app)
 
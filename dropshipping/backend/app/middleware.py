@@ -0,0 +1,43 @@
+"""Application-specific ASGI middleware.
+
+**For Developers:**
+    ``StorefrontHostMiddleware`` resolves the request's host against the
+    in-memory storefront routing table and stores the result on
+    ``request.state``:
+
+    - ``storefront_host``: the normalized ``X-Forwarded-Host`` (first
+      value) or ``Host``.
+    - ``storefront_store``: the ``StoreRoute`` of the store whose
+      verified custom domain the host is, or None if the table does not
+      know the host.
+
+    It never queries the database, so it is cheap enough to run on every
+    request; handlers that must be sure fall back to
+    ``storefront_routing_service.resolve_host``, which looks unknown hosts
+    up once and then answers from its negative cache.
+
+**For QA Engineers:**
+    Send ``Host: shop.example.com`` (or ``X-Forwarded-Host``) to
+    ``/api/v1/public/host`` to see which store a custom domain routes to.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.storefront_routing_service import lookup_host, normalize_host
+
+
+class StorefrontHostMiddleware:
+    """Attach the custom-domain store of each request to ``request.state``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            raw = headers.get(b"x-forwarded-host") or headers.get(b"host") or b""
+            host = normalize_host(raw.decode("latin-1").split(",")[0])
+            state = scope.setdefault("state", {})
+            state["storefront_host"] = host
+            state["storefront_store"] = lookup_host(host) if host else None
+        await self.app(scope, receive, send)
@@ -15,13 +15,17 @@ Core models:
 Feature models:
     - Discount, DiscountProduct, DiscountCategory, DiscountUsage (F8):
       Coupon codes and promotional discounts.
-    - Category, ProductCategory (F9): Hierarchical product categories.
+    - Category, CategoryClosure, ProductCategory (F9): Hierarchical product
+      categories and their ancestor/descendant pairs.
     - Supplier, ProductSupplier (F10): Dropshipping supplier management.
     - Review, ReviewStatus (F12): Customer product reviews with moderation.
     - Refund, RefundStatus, RefundReason (F14): Order refund processing.
     - TaxRate (F16): Location-based tax rate configuration.
     - Upsell, UpsellType (F18): Product upsell/cross-sell recommendations.
-    - Segment, SegmentCustomer, SegmentType (F19): Customer segmentation.
+    - ProductCoPurchase, ProductRecommendation, RecommendationWatermark
+      (F18): Co-purchase matrix and precomputed storefront recommendations.
+    - Segment, SegmentCustomer, SegmentMember, SegmentType (F19): Customer
+      segmentation.
     - GiftCard, GiftCardTransaction, GiftCardStatus (F20): Store gift cards.
     - CustomDomain, DomainStatus (F22): Custom domain management.
     - StoreWebhook, WebhookDelivery, WebhookEvent (F23): Store webhooks.
@@ -32,6 +36,13 @@ Feature models:
     - CustomerAccount, CustomerWishlist (F7.5): Storefront customer accounts
       and wishlists.
 
+Analytics models:
+    - DailyStoreMetrics, DailyProductMetrics, AnalyticsRollupWatermark:
+      Materialized daily rollups backing the analytics dashboard.
+
+Export models:
+    - ExportJob, ExportJobStatus: Background CSV/NDJSON export jobs.
+
 Service integration models:
     - ServiceIntegration, ServiceName, ServiceTier: External SaaS microservice
       connections (Phase 2 Automation A1-A8).
@@ -56,7 +67,7 @@ from app.models.discount import (  # noqa: F401
 )
 
 # F9 - Categories
-from app.models.category import Category, ProductCategory  # noqa: F401
+from app.models.category import Category, CategoryClosure, ProductCategory  # noqa: F401
 
 # F10 - Supplier Management
 from app.models.supplier import (  # noqa: F401
@@ -75,10 +86,16 @@ from app.models.refund import Refund, RefundStatus, RefundReason  # noqa: F401
 from app.models.tax import TaxRate  # noqa: F401
 
 # F18 - Upsells
-from app.models.upsell import Upsell, UpsellType  # noqa: F401
+from app.models.upsell import (  # noqa: F401
+    ProductCoPurchase,
+    ProductRecommendation,
+    RecommendationWatermark,
+    Upsell,
+    UpsellType,
+)
 
 # F19 - Segments
-from app.models.segment import Segment, SegmentCustomer, SegmentType  # noqa: F401
+from app.models.segment import Segment, SegmentCustomer, SegmentMember, SegmentType  # noqa: F401
 
 # F20 - Gift Cards
 from app.models.gift_card import (  # noqa: F401
@@ -134,7 +151,25 @@ from app.models.inventory import (  # noqa: F401
     InventoryLevel,
     InventoryAdjustment,
     AdjustmentReason,
+    ReservationStatus,
+    StockReservation,
+)
+
+# Analytics rollups (materialized daily facts for the dashboard)
+from app.models.analytics import (  # noqa: F401
+    AnalyticsRollupWatermark,
+    DailyProductMetrics,
+    DailyStoreMetrics,
 )
 
+# Background data exports
+from app.models.export_job import ExportJob, ExportJobStatus  # noqa: F401
+
+# Background bulk product operations
+from app.models.bulk_job import BulkJob, BulkJobStatus  # noqa: F401
+
+# Background store clones
+from app.models.store_clone_job import CloneJobStatus, StoreCloneJob  # noqa: F401
+
 # ServiceBridge delivery tracking (Phase 3 - Platform event integration)
 from app.models.bridge_delivery import BridgeDelivery  # noqa: F401
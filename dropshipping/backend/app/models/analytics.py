@@ -0,0 +1,163 @@
+"""Materialized analytics rollup models.
+
+Defines the daily fact tables that back the analytics dashboard and the
+watermark recording which days they cover.
+
+**For Developers:**
+    ``DailyStoreMetrics`` holds one row per store per UTC day and
+    ``DailyProductMetrics`` one row per store, product and day. Both are
+    written exclusively by ``app.services.analytics_rollup_service`` with
+    set-based ``INSERT ... SELECT ... GROUP BY`` statements: the nightly
+    task materializes closed days for every store at once, and order
+    status changes rebuild only the affected store-day. Never write rows
+    one at a time from application code.
+
+    ``AnalyticsRollupWatermark`` is a single-row table (``name="daily"``)
+    recording the contiguous day range ``[rolled_from, rolled_through]``
+    that has been materialized. Readers trust the fact tables only inside
+    that range and fall back to raw orders outside it.
+
+**For QA Engineers:**
+    - Only paid, shipped and delivered orders are counted.
+    - ``cost`` is the product cost at the time the day was rolled up.
+    - Days without revenue orders have no rows.
+
+**For Project Managers:**
+    Rollups make the dashboard cost proportional to the number of days
+    shown rather than the number of orders a store has ever received.
+
+**For End Users:**
+    Your analytics dashboard loads quickly no matter how many orders your
+    store has processed.
+"""
+
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class DailyStoreMetrics(Base):
+    """Per-store revenue facts for one UTC day.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: Foreign key to the store.
+        day: The UTC calendar day the metrics cover.
+        order_count: Number of revenue orders created that day.
+        revenue: Sum of order totals.
+        cost: Sum of product cost times quantity for the day's items.
+        units_sold: Sum of item quantities.
+        updated_at: When the row was (re)materialized.
+    """
+
+    __tablename__ = "daily_store_metrics"
+    __table_args__ = (
+        Index("ix_daily_store_metrics_store_day", "store_id", "day", unique=True),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0.00")
+    )
+    cost: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0.00")
+    )
+    units_sold: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class DailyProductMetrics(Base):
+    """Per-product sales facts for one UTC day.
+
+    Grouped by ``(store_id, product_id, product_title, day)`` to match the
+    raw top-products query, so a product renamed mid-day yields two rows.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: Foreign key to the store.
+        product_id: The product sold (None if the product was deleted).
+        product_title: Product title snapshotted on the order items.
+        day: The UTC calendar day the metrics cover.
+        revenue: Sum of unit price times quantity.
+        cost: Sum of product cost times quantity.
+        units_sold: Sum of item quantities.
+        updated_at: When the row was (re)materialized.
+    """
+
+    __tablename__ = "daily_product_metrics"
+    __table_args__ = (
+        Index("ix_daily_product_metrics_store_day", "store_id", "day"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    product_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    product_title: Mapped[str] = mapped_column(String(500), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0.00")
+    )
+    cost: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=Decimal("0.00")
+    )
+    units_sold: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+class AnalyticsRollupWatermark(Base):
+    """The contiguous day range covered by the daily fact tables.
+
+    Attributes:
+        name: Rollup family name (``"daily"``).
+        rolled_from: First materialized UTC day.
+        rolled_through: Last materialized UTC day.
+        updated_at: When the range last advanced.
+    """
+
+    __tablename__ = "analytics_rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    rolled_from: Mapped[date] = mapped_column(Date, nullable=False)
+    rolled_through: Mapped[date] = mapped_column(Date, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,109 @@
+"""Background bulk operation job model.
+
+Tracks bulk product operations that are too large to run inside a single
+API request and are processed by a Celery worker instead.
+
+**For Developers:**
+    Import via ``app.models`` for Alembic discovery. Jobs are created by
+    ``bulk_service.create_bulk_job`` and processed by
+    ``bulk_tasks.run_bulk_job``, which applies the operation chunk by
+    chunk and commits ``processed``/``succeeded``/``failed`` after every
+    chunk so clients can poll progress.
+
+**For QA Engineers:**
+    - ``status`` moves ``pending`` → ``running`` → ``completed`` or
+      ``failed``.
+    - ``processed`` grows from 0 to ``total`` while the job runs.
+    - ``errors`` holds the per-product failures (``product_id``, ``error``).
+
+**For Project Managers:**
+    Bulk jobs let merchants update or archive thousands of products at
+    once without the request timing out.
+
+**For End Users:**
+    Very large bulk edits run in the background; the progress bar shows
+    how many products have been processed so far.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class BulkJobStatus(str, enum.Enum):
+    """Lifecycle states of a background bulk job.
+
+    Attributes:
+        pending: Queued, not yet picked up by a worker.
+        running: A worker is applying the operation.
+        completed: Every product has been processed.
+        failed: The job aborted; see ``error_message``.
+    """
+
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class BulkJob(Base):
+    """A background bulk operation over a list of store products.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: The store whose products are changed.
+        user_id: The user who requested the operation.
+        operation: ``update``, ``delete``, or ``price``.
+        params: Operation parameters (``updates`` or the price adjustment).
+        product_ids: The requested product UUIDs (as strings).
+        status: Current job status.
+        total: Number of products in the job.
+        processed: Number of products processed so far.
+        succeeded: Number of products changed successfully.
+        failed: Number of products that could not be changed.
+        errors: Per-product failures (``product_id`` and ``error``).
+        error_message: Failure description, if the job aborted.
+        created_at: When the job was requested.
+        completed_at: When the job finished (successfully or not).
+    """
+
+    __tablename__ = "bulk_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    operation: Mapped[str] = mapped_column(String(20), nullable=False)
+    params: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
+    product_ids: Mapped[list] = mapped_column(JSONB, nullable=False)
+    status: Mapped[BulkJobStatus] = mapped_column(
+        Enum(BulkJobStatus), default=BulkJobStatus.pending, nullable=False
+    )
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    succeeded: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    errors: Mapped[list] = mapped_column(JSONB, default=list, nullable=False)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -1,7 +1,7 @@
-"""Category and ProductCategory database models.
+"""Category, CategoryClosure, and ProductCategory database models.
 
-Defines the ``categories`` and ``product_categories`` tables for organizing
-products into hierarchical groupings. Categories support self-referential
+Defines the ``categories``, ``category_closure``, and ``product_categories``
+tables for organizing products into hierarchical groupings. Categories support self-referential
 parent-child nesting (e.g. Electronics > Phones > Smartphones) and are
 scoped to a single store.
 
@@ -11,7 +11,10 @@ scoped to a single store.
     enables arbitrary depth category trees. The ``position`` column supports
     manual ordering within the same parent. The ``product_categories``
     junction table enables a many-to-many relationship between products
-    and categories.
+    and categories. ``category_closure`` holds one row per (ancestor,
+    descendant) pair, including each category paired with itself, so a
+    whole subtree is one indexed lookup; ``category_service`` keeps it in
+    step with ``parent_id``.
 
 **For QA Engineers:**
     - Category slugs are unique per store (composite unique constraint on
@@ -23,6 +26,8 @@ scoped to a single store.
     - ``position`` is used for manual sort ordering within the same level.
     - The ``product_categories`` junction table enforces uniqueness on
       (``product_id``, ``category_id``) to prevent duplicate assignments.
+    - ``category_closure.depth`` is 0 for the self row, 1 for the parent,
+      and so on.
 
 **For End Users:**
     Categories help you organize your products so customers can browse by
@@ -39,6 +44,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -127,6 +133,33 @@ class Category(Base):
     )
 
 
+class CategoryClosure(Base):
+    """Ancestor/descendant pairs of the category tree (closure table).
+
+    Attributes:
+        ancestor_id: The ancestor category (or the category itself).
+        descendant_id: A category in the ancestor's subtree.
+        depth: Number of levels between them (0 for the self row).
+    """
+
+    __tablename__ = "category_closure"
+    __table_args__ = (
+        Index("ix_category_closure_descendant", "descendant_id"),
+    )
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
 class ProductCategory(Base):
     """Junction table linking products to categories (many-to-many).
 
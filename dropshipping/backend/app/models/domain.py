@@ -41,6 +41,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Integer,
     String,
     func,
 )
@@ -81,6 +82,13 @@ class CustomDomain(Base):
         verified_at: Timestamp when DNS verification succeeded (null until
             verified).
         ssl_provisioned: Whether an SSL certificate has been issued.
+        dns_propagated: Result of the last propagation check of the
+            managed records (null until checked).
+        dns_checked_at: When propagation was last checked.
+        dns_check_failures: Consecutive failed health checks (pending
+            verification or unpropagated records); drives the backoff.
+        dns_next_check_at: When the health sweep next checks this domain
+            (null means due now).
         created_at: Timestamp when the domain was added (DB server time).
         updated_at: Timestamp of the last update (DB server time, auto-updated).
         store: Relationship to the Store.
@@ -124,6 +132,18 @@ class CustomDomain(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    # Health-check state (see dns_management_service.claim_due_domains_sync)
+    dns_propagated: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    dns_checked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    dns_check_failures: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    dns_next_check_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+
     # Domain Purchasing fields
     purchase_provider: Mapped[str | None] = mapped_column(String(50), nullable=True)
     purchase_date: Mapped[datetime | None] = mapped_column(
@@ -0,0 +1,118 @@
+"""Background data export job model.
+
+Tracks exports that are generated by a Celery worker into a file instead
+of being streamed directly to the browser.
+
+**For Developers:**
+    Import via ``app.models`` for Alembic discovery. Jobs are created by
+    ``export_service.create_export_job`` and processed by
+    ``export_tasks.generate_export``, which writes the file under
+    ``settings.export_dir`` and records its path and row count.
+    ``export_tasks.expire_exports`` deletes files older than
+    ``settings.export_retention_hours`` and marks their jobs ``expired``.
+
+**For QA Engineers:**
+    - ``status`` moves ``pending`` → ``running`` → ``completed`` or
+      ``failed``, and ``completed`` → ``expired`` once the file is
+      deleted.
+    - ``file_path`` is only set once the file is complete, and cleared
+      when it expires.
+    - ``error_message`` is set when the job fails.
+
+**For Project Managers:**
+    Export jobs let very large stores export their data without keeping
+    a browser download open for the whole export.
+
+**For End Users:**
+    Request an export, keep working, and download the file when it's
+    ready. Files are kept for a limited time, after which the export
+    has to be requested again.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ExportJobStatus(str, enum.Enum):
+    """Lifecycle states of a background export job.
+
+    Attributes:
+        pending: Queued, not yet picked up by a worker.
+        running: A worker is writing the file.
+        completed: The file is ready for download.
+        failed: The export failed; see ``error_message``.
+        expired: The file was deleted after the retention period.
+    """
+
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+    expired = "expired"
+
+
+class ExportJob(Base):
+    """A background export of one store dataset to a file.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: The store being exported.
+        user_id: The user who requested the export.
+        dataset: ``orders``, ``products``, or ``customers``.
+        format: ``csv`` or ``ndjson``.
+        compressed: Whether the file is gzip-compressed.
+        status: Current job status.
+        row_count: Number of exported rows (set on completion).
+        file_path: Absolute path of the finished file.
+        error_message: Failure description, if the job failed.
+        created_at: When the job was requested.
+        completed_at: When the job finished (successfully or not).
+    """
+
+    __tablename__ = "export_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    dataset: Mapped[str] = mapped_column(String(20), nullable=False)
+    format: Mapped[str] = mapped_column(String(10), nullable=False)
+    compressed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    status: Mapped[ExportJobStatus] = mapped_column(
+        Enum(ExportJobStatus), default=ExportJobStatus.pending, nullable=False
+    )
+    row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    file_path: Mapped[str | None] = mapped_column(Text, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -11,7 +11,8 @@ customers redeem them and can be tracked through a full transaction log.
     ``initial_balance`` minus the sum of ``charge`` transactions plus the
     sum of ``refund`` and ``adjustment`` transactions. Use
     ``GiftCardTransaction`` for all balance modifications to maintain an
-    audit trail.
+    audit trail; transactions form an append-only ledger and are never
+    updated or deleted individually.
 
 **For QA Engineers:**
     - ``GiftCardStatus`` restricts the lifecycle to ``active``, ``used``,
@@ -1,13 +1,16 @@
 """Inventory management models for ecommerce stores.
 
-Defines ``warehouses``, ``inventory_levels``, and ``inventory_adjustments``
-tables for tracking stock across multiple warehouse locations.
+Defines ``warehouses``, ``inventory_levels``, ``inventory_adjustments``,
+and ``stock_reservations`` tables for tracking stock across multiple
+warehouse locations.
 
 **For Developers:**
     Warehouses are store-scoped — each ecommerce/hybrid store can have
     multiple warehouses. InventoryLevel tracks quantity per variant per
     warehouse (unique constraint enforced). InventoryAdjustment provides
-    an immutable audit trail of every stock change.
+    an immutable audit trail of every stock change. StockReservation
+    records each checkout hold so it can be fulfilled, released, or
+    expired exactly once.
 
 **For QA Engineers:**
     - One default warehouse is auto-created for ecommerce stores.
@@ -16,6 +19,7 @@ tables for tracking stock across multiple warehouse locations.
     - Adjustments record the reason and reference (order_id, manual, etc).
     - ``reserved_quantity`` is incremented on order creation, decremented
       on fulfillment or cancellation.
+    - Active reservations past ``expires_at`` are released automatically.
 
 **For Project Managers:**
     Inventory management is the core differentiator between dropshipping
@@ -36,12 +40,14 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -264,3 +270,89 @@ class InventoryAdjustment(Base):
     inventory_level = relationship(
         "InventoryLevel", back_populates="adjustments"
     )
+
+
+class ReservationStatus(str, enum.Enum):
+    """Lifecycle states for a stock reservation.
+
+    Attributes:
+        active: Units are held against ``reserved_quantity``.
+        fulfilled: Units shipped; quantity and reservation both decremented.
+        released: Hold released explicitly (order cancelled or adjusted).
+        expired: Hold released automatically after its TTL elapsed.
+    """
+
+    active = "active"
+    fulfilled = "fulfilled"
+    released = "released"
+    expired = "expired"
+
+
+class StockReservation(Base):
+    """A hold on units of one inventory level for one order.
+
+    Reservations are created in batches by the reservation engine at
+    checkout. Each one transitions out of ``active`` exactly once, which
+    makes release, fulfillment, and expiry idempotent under concurrency.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: Store that owns the reserved inventory.
+        inventory_level_id: Foreign key to the reserved inventory level.
+        variant_id: Denormalized variant UUID (for order-level lookups).
+        order_id: Optional order the hold belongs to.
+        quantity: Number of units held.
+        status: Current lifecycle state.
+        expires_at: When an ``active`` hold is released automatically
+            (null holds never expire, e.g. after payment).
+        created_at: Reservation timestamp.
+        updated_at: Last status change timestamp.
+    """
+
+    __tablename__ = "stock_reservations"
+    __table_args__ = (
+        Index(
+            "ix_stock_reservations_active_expiry",
+            "expires_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    inventory_level_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("inventory_levels.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    variant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    order_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("orders.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[ReservationStatus] = mapped_column(
+        String(20), default=ReservationStatus.active, nullable=False
+    )
+    expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(),
+        onupdate=func.now(), nullable=False
+    )
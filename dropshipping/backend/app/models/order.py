@@ -28,6 +28,9 @@ linked to products and optional variants.
     - ``subtotal`` is the sum of line items before discounts and tax.
     - ``gift_card_amount`` stores any gift card balance applied.
     - ``currency`` is a 3-letter ISO currency code (e.g. "USD", "EUR").
+    - ``paid_at`` is set when payment is confirmed; ``pipeline_timings``
+      records how many seconds after ``paid_at`` each post-payment stage
+      finished (e.g. ``{"fraud_checked": 1.2, "fulfilled": 3.4}``).
 
 **For End Users:**
     Orders are created when customers complete checkout. Store owners can
@@ -45,13 +48,15 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -92,6 +97,10 @@ class Order(Base):
         currency: ISO 4217 currency code (default "USD").
         stripe_session_id: Stripe Checkout session ID for payment tracking.
         shipping_address: Optional shipping address as free-text.
+        paid_at: When payment was confirmed (null until paid).
+        pipeline_timings: Seconds from ``paid_at`` to each completed
+            post-payment stage, keyed by stage name (null until the
+            post-payment pipeline starts).
         created_at: Timestamp when the order was created (DB server time).
         updated_at: Timestamp of the last update (DB server time, auto-updated).
         store: Relationship to the Store this order belongs to.
@@ -99,6 +108,16 @@ class Order(Base):
     """
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # Per-customer history lookups (fraud features, velocity).
+        Index("ix_orders_store_email_created", "store_id", "customer_email", "created_at"),
+        # Keyset pages of shipped orders for the carrier tracking poll.
+        Index(
+            "ix_orders_shipped_id",
+            "id",
+            postgresql_where=text("status = 'shipped'"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -135,6 +154,10 @@ class Order(Base):
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     tracking_number: Mapped[str | None] = mapped_column(String(255), nullable=True)
     carrier: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    paid_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    pipeline_timings: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     shipped_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
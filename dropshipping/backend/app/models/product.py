@@ -9,7 +9,9 @@ variants (e.g. sizes, colors).
     changes automatically. The ``store_id`` foreign key enforces store scoping.
     Products use soft-delete via the ``status`` field (set to ``archived``).
     The ``avg_rating`` and ``review_count`` are denormalized from the
-    ``reviews`` table for fast product listing queries. The ``tags`` JSON
+    ``reviews`` table for fast product listing queries, together with
+    ``rating_sum`` and the per-star ``rating_N_count`` histogram that
+    ``review_service`` updates incrementally. The ``tags`` JSON
     column stores free-form tag strings for search and filtering.
 
 **For QA Engineers:**
@@ -23,6 +25,8 @@ variants (e.g. sizes, colors).
     - ``avg_rating`` is a denormalized average of approved review ratings
       (null if no reviews).
     - ``review_count`` is a denormalized count of approved reviews.
+    - ``rating_sum`` and ``rating_1_count`` .. ``rating_5_count`` always
+      add up to ``review_count`` approved reviews.
     - ``tags`` is a JSON array of tag strings for search filtering.
 
 **For End Users:**
@@ -84,6 +88,9 @@ class Product(Base):
         status: Current product status (draft, active, or archived).
         avg_rating: Denormalized average star rating from approved reviews.
         review_count: Denormalized count of approved reviews.
+        rating_sum: Sum of the star ratings of approved reviews.
+        rating_1_count: Approved 1-star reviews (likewise up to
+            ``rating_5_count``).
         tags: JSON array of tag strings for search and filtering.
         seo_title: Optional custom SEO title for search engines.
         seo_description: Optional custom SEO meta description.
@@ -125,6 +132,12 @@ class Product(Base):
     )
     avg_rating: Mapped[Decimal | None] = mapped_column(Numeric(3, 2), nullable=True)
     review_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rating_sum: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_1_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_2_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_3_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_4_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    rating_5_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     tags: Mapped[list | None] = mapped_column(JSON, nullable=True, default=list)
     seo_title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     seo_description: Mapped[str | None] = mapped_column(Text, nullable=True)
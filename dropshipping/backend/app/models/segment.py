@@ -8,8 +8,9 @@ customers) or automatic (rule-based dynamic membership).
     Import these models via ``app.models`` so that Alembic picks up schema
     changes automatically. Manual segments use the ``segment_customers``
     junction table for explicit membership. Automatic segments store filter
-    rules as a JSON column and dynamically evaluate membership at query
-    time (the ``customer_count`` is a denormalized cache).
+    rules as a JSON column; ``segment_rules_service`` compiles them to SQL
+    and materializes the matching store customers in ``segment_members``.
+    ``customer_count`` is a counter maintained by every membership change.
 
 **For QA Engineers:**
     - ``SegmentType`` restricts the type to ``manual`` or ``automatic``.
@@ -17,8 +18,8 @@ customers) or automatic (rule-based dynamic membership).
       ``segment_customers``.
     - For automatic segments, the ``rules`` JSON column stores filter
       criteria (e.g. ``{"total_spent_gte": 100, "country": "US"}``).
-    - ``customer_count`` is a cached count that should be refreshed
-      periodically or on membership changes.
+    - ``customer_count`` is kept up to date as members are added and
+      removed, for both segment types.
     - The unique constraint on (``segment_id``, ``customer_id``) prevents
       adding the same customer to a segment twice.
 
@@ -73,7 +74,8 @@ class Segment(Base):
         segment_type: Whether membership is manual or automatic.
         rules: JSON object containing filter rules for automatic segments
             (null for manual segments).
-        customer_count: Cached count of customers in this segment.
+        customer_count: Number of customers in this segment (a counter
+            updated with every membership change).
         created_at: Timestamp when the segment was created (DB server time).
         updated_at: Timestamp of the last update (DB server time, auto-updated).
         store: Relationship to the Store.
@@ -155,3 +157,36 @@ class SegmentCustomer(Base):
     added_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+
+class SegmentMember(Base):
+    """Materialized membership of an automatic segment.
+
+    One row per store customer (``customer_accounts``) matching the
+    segment's rules. Rows are written set-based by
+    ``segment_rules_service`` when the rules change and per customer when
+    a customer or order event touches an attribute the rules use.
+
+    Attributes:
+        segment_id: Foreign key to the segment (part of the primary key).
+        customer_id: Foreign key to the customer account (part of the
+            primary key).
+        added_at: Timestamp when the customer started matching.
+    """
+
+    __tablename__ = "segment_members"
+
+    segment_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("segments.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    customer_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("customer_accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+    added_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,106 @@
+"""Background store clone job model.
+
+Tracks clones of large stores whose catalog is copied by a Celery worker
+instead of inside the API request.
+
+**For Developers:**
+    Import via ``app.models`` for Alembic discovery. Jobs are created by
+    ``clone_service.start_clone_job`` together with the (paused) target
+    store, and processed by ``clone_tasks.clone_store_contents``, which
+    runs the ``INSERT ... SELECT`` clone steps in one transaction and
+    records each finished step on the job through a separate session.
+
+**For QA Engineers:**
+    - ``status`` moves ``pending`` → ``running`` → ``completed`` or
+      ``failed``.
+    - ``completed_steps`` counts up to ``total_steps``; ``current_step``
+      names the last finished step (``products``, ``discounts``, ...).
+    - The target store stays ``paused`` until the job completes.
+
+**For Project Managers:**
+    Store clone jobs let merchants duplicate catalogs with tens of
+    thousands of products without the request timing out.
+
+**For End Users:**
+    Cloning a very large store runs in the background; the new store
+    goes live once everything has been copied.
+"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class CloneJobStatus(str, enum.Enum):
+    """Lifecycle states of a background store clone job.
+
+    Attributes:
+        pending: Queued, not yet picked up by a worker.
+        running: A worker is copying the store.
+        completed: The clone is complete and the store is active.
+        failed: The clone was rolled back; see ``error_message``.
+    """
+
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class StoreCloneJob(Base):
+    """A background copy of one store's catalog into a new store.
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        source_store_id: The store being cloned.
+        store_id: The new (target) store.
+        user_id: The user who requested the clone.
+        status: Current job status.
+        total_steps: Number of clone steps.
+        completed_steps: Number of steps finished so far.
+        current_step: Name of the last finished step.
+        error_message: Failure description, if the job failed.
+        created_at: When the job was requested.
+        completed_at: When the job finished (successfully or not).
+    """
+
+    __tablename__ = "store_clone_jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    source_store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    status: Mapped[CloneJobStatus] = mapped_column(
+        Enum(CloneJobStatus), default=CloneJobStatus.pending, nullable=False
+    )
+    total_steps: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_steps: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    current_step: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -145,6 +145,8 @@ class ProductSupplier(Base):
         supplier_sku: Optional supplier-side SKU or item identifier.
         supplier_cost: The cost charged by this supplier for the product.
         is_primary: Whether this is the default supplier for the product.
+        sync_hash: Hash of the supplier data last applied by the catalog
+            sync (``supplier_sync_service``); None until the first sync.
         created_at: Timestamp when the link was created.
         supplier: Relationship back to the Supplier.
         product: Relationship back to the Product.
@@ -176,6 +178,7 @@ class ProductSupplier(Base):
     supplier_sku: Mapped[str | None] = mapped_column(String(100), nullable=True)
     supplier_cost: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     is_primary: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    sync_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
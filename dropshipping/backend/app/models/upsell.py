@@ -22,6 +22,11 @@ product within the same store.
       on the storefront.
     - The unique constraint prevents creating duplicate upsell records
       for the same source-target-type combination.
+    - ``product_co_purchases`` is the sparse item-item co-occurrence
+      matrix of paid orders (the diagonal holds each product's order
+      count); ``product_recommendations`` holds the precomputed, blended
+      recommendations the storefront reads. Both are maintained by
+      ``recommendation_service``.
 
 **For End Users:**
     Upsells help you increase average order value by recommending
@@ -40,7 +45,9 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -155,3 +162,113 @@ class Upsell(Base):
         backref="upsells_as_target",
         lazy="selectin",
     )
+
+
+class ProductCoPurchase(Base):
+    """One cell of a store's item-item co-purchase matrix.
+
+    The number of paid orders that contained both products. Both
+    directions of a pair are stored, and the diagonal row
+    (``product_id == other_product_id``) counts the orders that contained
+    the product at all.
+
+    Attributes:
+        product_id: Row product of the cell.
+        other_product_id: Column product of the cell.
+        store_id: The products' store.
+        orders: Paid orders containing both products.
+    """
+
+    __tablename__ = "product_co_purchases"
+
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    other_product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    orders: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class ProductRecommendation(Base):
+    """A precomputed storefront recommendation for a product.
+
+    Manual rows mirror the product's active upsells (``upsell_id`` set,
+    ranked by position); learned rows are its top co-purchased products
+    (``upsell_id`` null, ranked by ``score``).
+
+    Attributes:
+        id: Unique identifier (UUID v4).
+        store_id: The products' store.
+        product_id: The product being viewed.
+        target_product_id: The recommended product.
+        upsell_id: The manual upsell this row mirrors, or None if learned.
+        score: Co-purchase score (cosine similarity) of learned rows.
+        rank: Order among the product's manual or learned rows (0 first).
+    """
+
+    __tablename__ = "product_recommendations"
+    __table_args__ = (
+        Index("ix_product_recommendations_product_rank", "product_id", "rank"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("stores.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    target_product_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    upsell_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("upsells.id", ondelete="CASCADE"),
+        nullable=True,
+        unique=True,
+    )
+    score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    rank: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class RecommendationWatermark(Base):
+    """How far paid orders have been folded into the co-purchase matrix.
+
+    Attributes:
+        name: Watermark name (``"co_purchases"``).
+        processed_through: Orders paid at or before this time are counted.
+        updated_at: When the watermark last advanced.
+    """
+
+    __tablename__ = "recommendation_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    processed_through: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -11,7 +11,9 @@ events occur.
     event type strings that this webhook subscribes to. The ``secret``
     column contains an HMAC secret used to sign webhook payloads so the
     receiver can verify authenticity. ``WebhookDelivery`` records every
-    delivery attempt for debugging and retry logic.
+    delivery attempt for debugging and retry logic; a failed attempt that
+    will be retried carries ``next_retry_at`` until the retry sweep
+    (``webhook_tasks.retry_webhook_deliveries``) picks it up.
 
     Note: This model is for store-owner webhooks (Feature 23), not to be
     confused with ``backend/app/api/webhooks.py`` which handles incoming
@@ -20,8 +22,11 @@ events occur.
 **For QA Engineers:**
     - ``events`` is a JSON array of event strings matching
       ``WebhookEvent`` values (e.g. ``["order.created", "order.paid"]``).
-    - ``failure_count`` increments on each failed delivery; webhooks
-      should be auto-disabled after a threshold (e.g. 10 failures).
+    - ``failure_count`` increments on each failed delivery; webhooks are
+      auto-disabled after ``settings.webhook_circuit_breaker_threshold``
+      consecutive failures.
+    - ``attempt`` starts at 1 and grows with every retry of the same
+      event; ``next_retry_at`` is only set on the latest failed attempt.
     - ``last_triggered_at`` updates on each delivery attempt.
     - ``WebhookDelivery`` captures the full request/response cycle:
       payload sent, HTTP status received, response body, and success flag.
@@ -43,10 +48,12 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -152,11 +159,21 @@ class WebhookDelivery(Base):
         response_status: The HTTP status code received (null if network error).
         response_body: The response body received (truncated if very large).
         success: Whether the delivery was successful (2xx status).
+        attempt: Attempt number for this event (1 for the first delivery).
+        next_retry_at: When this failed attempt is due to be retried
+            (null once retried, or if no retry is scheduled).
         created_at: Timestamp when the delivery was attempted.
         webhook: Relationship back to the parent StoreWebhook.
     """
 
     __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        Index(
+            "ix_webhook_deliveries_next_retry_at",
+            "next_retry_at",
+            postgresql_where=text("next_retry_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -172,6 +189,10 @@ class WebhookDelivery(Base):
     response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
     response_body: Mapped[str | None] = mapped_column(Text, nullable=True)
     success: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    attempt: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    next_retry_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
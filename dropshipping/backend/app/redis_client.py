@@ -0,0 +1,77 @@
+"""Shared Redis clients for caching, counters, and pub/sub.
+
+Provides lazily-created singleton Redis clients for the API process
+(async) and for Celery workers (sync). Both point at ``settings.redis_url``
+and decode responses to ``str``.
+
+**For Developers:**
+    Use ``get_redis()`` inside async request handlers and services, and
+    ``get_sync_redis()`` inside Celery tasks::
+
+        from app.redis_client import get_redis
+
+        redis = get_redis()
+        await redis.incr("some:counter")
+
+    Redis is an accelerator, never the source of truth. Callers must
+    treat any ``redis.RedisError`` as a cache miss and fall back to
+    PostgreSQL so the platform keeps working when Redis is unavailable.
+
+**For QA Engineers:**
+    Tests run against the Redis configured by ``REDIS_URL``. Call
+    ``reset_redis_clients()`` to drop cached clients (e.g. after changing
+    the URL or the event loop).
+
+**For Project Managers:**
+    A single place to configure Redis keeps connection pooling consistent
+    across every feature that caches or counts in Redis.
+"""
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+
+_async_client: aioredis.Redis | None = None
+_sync_client: redis.Redis | None = None
+
+
+def get_redis() -> aioredis.Redis:
+    """Get or create the process-wide async Redis client.
+
+    Returns:
+        An ``redis.asyncio.Redis`` client with ``decode_responses=True``.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=2,
+        )
+    return _async_client
+
+
+def get_sync_redis() -> redis.Redis:
+    """Get or create the process-wide sync Redis client (Celery workers).
+
+    Returns:
+        A ``redis.Redis`` client with ``decode_responses=True``.
+    """
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=1,
+            socket_timeout=2,
+        )
+    return _sync_client
+
+
+def reset_redis_clients() -> None:
+    """Drop the cached clients so the next call creates fresh ones."""
+    global _async_client, _sync_client
+    _async_client = None
+    _sync_client = None
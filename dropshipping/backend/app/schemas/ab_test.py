@@ -8,6 +8,8 @@ the ``/api/v1/stores/{store_id}/ab-tests/*`` routes.
     ``ABTestResponse`` uses ``from_attributes`` and includes nested
     ``ABTestVariantResponse`` items with computed ``conversion_rate``.
     ``RecordEventRequest`` captures impressions and conversions.
+    ``ABTestStatsResponse`` carries significance computed from the
+    aggregated counters.
 
 **For QA Engineers:**
     - ``ABTestVariantInput.weight`` controls traffic allocation (0-100).
@@ -196,3 +198,58 @@ class RecordEventRequest(BaseModel):
     revenue: Decimal | None = Field(
         None, ge=0, description="Revenue for conversion events"
     )
+
+
+class ABTestVariantStats(BaseModel):
+    """Results of one variant, compared with the control.
+
+    Attributes:
+        variant_id: The variant's unique identifier.
+        name: Display name of the variant.
+        is_control: Whether this is the control variant.
+        impressions: Impressions including those not yet flushed.
+        conversions: Conversions including those not yet flushed.
+        revenue: Attributed revenue including what is not yet flushed.
+        conversion_rate: ``conversions / impressions`` (0.0 if none).
+        lift: Relative conversion rate change against the control (null
+            for the control or when the control has no conversions).
+        z_score: Two-proportion z-score against the control (null for
+            the control or without impressions on either side).
+        p_value: Two-sided p-value of ``z_score``.
+        significant: Whether ``p_value`` is below ``1 - confidence_level``.
+    """
+
+    variant_id: uuid.UUID
+    name: str
+    is_control: bool
+    impressions: int
+    conversions: int
+    revenue: Decimal
+    conversion_rate: float
+    lift: float | None = None
+    z_score: float | None = None
+    p_value: float | None = None
+    significant: bool = False
+
+
+class ABTestStatsResponse(BaseModel):
+    """Statistical results of an A/B test.
+
+    Attributes:
+        test_id: The test's unique identifier.
+        status: Current test status.
+        confidence_level: Confidence used for ``significant``.
+        total_impressions: Impressions across all variants.
+        total_conversions: Conversions across all variants.
+        variants: Per-variant results.
+        winner_variant_id: Best-converting variant that beats the control
+            significantly (null if none does yet).
+    """
+
+    test_id: uuid.UUID
+    status: str
+    confidence_level: float
+    total_impressions: int
+    total_conversions: int
+    variants: list[ABTestVariantStats]
+    winner_variant_id: uuid.UUID | None = None
@@ -7,7 +7,8 @@ the ``/api/v1/stores/{store_id}/bulk/*`` routes.
     ``BulkProductUpdateRequest`` and ``BulkProductDeleteRequest`` are input
     schemas for batch operations. ``BulkOperationResponse`` reports success
     and failure counts. ``BulkPriceUpdateRequest`` handles batch price
-    adjustments.
+    adjustments. ``BulkJobResponse`` reports the progress of operations
+    that were too large to run inline and were queued as a background job.
 
 **For QA Engineers:**
     - ``BulkProductUpdateRequest.product_ids`` must have at least 1 item.
@@ -17,6 +18,8 @@ the ``/api/v1/stores/{store_id}/bulk/*`` routes.
       ``"fixed"``.
     - ``BulkOperationResponse.errors`` contains per-item failure details.
     - ``succeeded + failed`` should always equal ``total``.
+    - ``BulkJobResponse.processed`` counts up to ``total`` while the job
+      runs; ``succeeded + failed`` always equals ``processed``.
 
 **For Project Managers:**
     Bulk operations save time for stores with large catalogues. Merchants
@@ -29,10 +32,13 @@ the ``/api/v1/stores/{store_id}/bulk/*`` routes.
 """
 
 import uuid
+from datetime import datetime
 from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
+from app.models.bulk_job import BulkJobStatus
+
 
 class BulkProductUpdateRequest(BaseModel):
     """Schema for updating multiple products at once.
@@ -104,3 +110,37 @@ class BulkPriceUpdateRequest(BaseModel):
     adjustment_value: Decimal = Field(
         ..., description="Adjustment amount (positive to increase, negative to decrease)"
     )
+
+
+class BulkJobResponse(BaseModel):
+    """Schema for returning background bulk job progress.
+
+    Attributes:
+        id: Bulk job unique identifier.
+        store_id: The store whose products are changed.
+        operation: ``update``, ``delete``, or ``price``.
+        status: Current job status.
+        total: Number of products in the job.
+        processed: Number of products processed so far.
+        succeeded: Number of products changed successfully.
+        failed: Number of products that could not be changed.
+        errors: Per-product failures (``product_id`` and ``error``).
+        error_message: Failure description, if the job aborted.
+        created_at: When the job was requested.
+        completed_at: When the job finished.
+    """
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    store_id: uuid.UUID
+    operation: str
+    status: BulkJobStatus
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    errors: list[dict]
+    error_message: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
@@ -157,7 +157,10 @@ class DnsStatusResponse(BaseModel):
         dns_configured: Whether auto DNS configuration has been applied.
         ssl_provisioned: Whether SSL certificate has been provisioned.
         records_count: Total number of DNS records for this domain.
-        propagation_status: Current propagation status ("propagated" or "pending").
+        propagation_status: Propagation status of the last check
+            ("propagated" or "pending").
+        checked_at: When propagation was last checked (the background
+            health sweep re-checks domains periodically).
     """
 
     domain: str
@@ -165,3 +168,4 @@ class DnsStatusResponse(BaseModel):
     ssl_provisioned: bool
     records_count: int
     propagation_status: str
+    checked_at: datetime | None = None
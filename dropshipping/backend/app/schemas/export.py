@@ -0,0 +1,55 @@
+"""Pydantic schemas for background export job endpoints.
+
+These schemas shape responses for the
+``/api/v1/stores/{store_id}/exports/jobs/*`` routes.
+
+**For Developers:**
+    ``ExportJobResponse`` uses ``from_attributes`` for ORM serialization.
+    The API fills ``download_url`` once the job has completed.
+
+**For QA Engineers:**
+    - ``download_url`` is null until ``status`` is ``completed``.
+    - ``row_count`` is null until the job finishes.
+
+**For End Users:**
+    Check on a large export and download it when it's ready.
+"""
+
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.models.export_job import ExportJobStatus
+
+
+class ExportJobResponse(BaseModel):
+    """Schema for returning background export job status.
+
+    Attributes:
+        id: Export job unique identifier.
+        store_id: The exported store.
+        dataset: ``orders``, ``products``, or ``customers``.
+        format: ``csv`` or ``ndjson``.
+        compressed: Whether the file is gzip-compressed.
+        status: Current job status.
+        row_count: Number of exported rows (once finished).
+        error_message: Failure description, if the job failed.
+        download_url: API path to download the file (once completed).
+        created_at: When the job was requested.
+        completed_at: When the job finished.
+    """
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    store_id: uuid.UUID
+    dataset: str
+    format: str
+    compressed: bool
+    status: ExportJobStatus
+    row_count: int | None = None
+    error_message: str | None = None
+    download_url: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
@@ -233,3 +233,22 @@ class InventorySummaryResponse(BaseModel):
     total_in_stock: int
     total_reserved: int
     low_stock_count: int
+
+
+# ---------------------------------------------------------------------------
+# Hot-SKU counters
+# ---------------------------------------------------------------------------
+
+
+class HotCounterResponse(BaseModel):
+    """State of the Redis hot counter fronting an inventory level.
+
+    Attributes:
+        inventory_level_id: The inventory level UUID.
+        is_hot: Whether reservations are gated through Redis.
+        available: Seeded available units (None when not hot).
+    """
+
+    inventory_level_id: uuid.UUID
+    is_hot: bool
+    available: int | None = None
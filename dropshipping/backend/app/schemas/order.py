@@ -208,6 +208,9 @@ class OrderResponse(BaseModel):
         currency: Three-letter currency code.
         stripe_session_id: Stripe Checkout session ID (may be null).
         shipping_address: Structured shipping address (may be null).
+        paid_at: When payment was confirmed (may be null).
+        pipeline_timings: Seconds from payment to each completed
+            post-payment stage (may be null).
         created_at: When the order was created.
         updated_at: When the order was last modified.
         items: List of order line items.
@@ -231,6 +234,8 @@ class OrderResponse(BaseModel):
     notes: str | None = None
     tracking_number: str | None = None
     carrier: str | None = None
+    paid_at: datetime | None = None
+    pipeline_timings: dict[str, float] | None = None
     shipped_at: datetime | None = None
     delivered_at: datetime | None = None
     created_at: datetime
@@ -273,6 +278,8 @@ class OrderResponse(BaseModel):
             notes=order.notes,
             tracking_number=order.tracking_number,
             carrier=order.carrier,
+            paid_at=order.paid_at,
+            pipeline_timings=order.pipeline_timings,
             shipped_at=order.shipped_at,
             delivered_at=order.delivered_at,
             created_at=order.created_at,
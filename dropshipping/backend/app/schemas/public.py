@@ -84,6 +84,8 @@ class PublicProductResponse(BaseModel):
         seo_description: SEO meta description (may be null).
         created_at: When the product was created.
         variants: List of product variants.
+        currency: Currency of all prices in the response (the store's
+            default currency unless another one was requested).
     """
 
     model_config = {"from_attributes": True}
@@ -99,6 +101,7 @@ class PublicProductResponse(BaseModel):
     seo_description: str | None
     created_at: datetime
     variants: list[PublicVariantResponse] = []
+    currency: str | None = None
 
 
 class PaginatedPublicProductResponse(BaseModel):
@@ -6,18 +6,21 @@ the ``/api/v1/stores/{store_id}/segments/*`` routes.
 **For Developers:**
     ``CreateSegmentRequest`` and ``UpdateSegmentRequest`` are input schemas.
     ``SegmentResponse`` uses ``from_attributes``. Segments can be
-    ``"manual"`` (hand-picked customers) or ``"dynamic"`` (rule-based
-    filters evaluated at query time).
+    ``"manual"`` (hand-picked customers) or ``"automatic"`` (rule-based,
+    membership materialized by ``segment_rules_service``); ``"dynamic"``
+    is accepted as an alias of ``"automatic"``.
 
 **For QA Engineers:**
     - ``CreateSegmentRequest.name`` is required, 1-255 characters.
-    - ``segment_type`` must be ``"manual"`` or ``"dynamic"``.
-    - ``rules`` is a freeform dict for dynamic segments (e.g.
-      ``{"min_orders": 3, "country": "US"}``).
+    - ``segment_type`` must be ``"manual"``, ``"automatic"``, or
+      ``"dynamic"``; responses report ``"automatic"``.
+    - ``rules`` is a dict for automatic segments (e.g.
+      ``{"min_orders": 3, "country": "US"}``); unknown rules are
+      rejected with 400.
     - ``AddCustomersToSegmentRequest`` only applies to manual segments.
 
 **For Project Managers:**
-    Customer segments enable targeted marketing. Dynamic segments
+    Customer segments enable targeted marketing. Automatic segments
     auto-update based on rules (e.g. "customers with 3+ orders").
     Manual segments are curated lists. Segments integrate with
     email marketing and discount targeting.
@@ -39,9 +42,9 @@ class CreateSegmentRequest(BaseModel):
     Attributes:
         name: Display name of the segment (1-255 characters).
         description: Optional description of the segment's purpose.
-        segment_type: Either ``"manual"`` (hand-picked) or ``"dynamic"``
-            (rule-based auto-updating).
-        rules: Optional rule definitions for dynamic segments. Structure
+        segment_type: Either ``"manual"`` (hand-picked) or ``"automatic"``
+            (rule-based auto-updating; ``"dynamic"`` is an alias).
+        rules: Optional rule definitions for automatic segments. Structure
             depends on segment_type. Example:
             ``{"min_orders": 3, "country": "US"}``.
     """
@@ -53,10 +56,10 @@ class CreateSegmentRequest(BaseModel):
         None, max_length=1000, description="Segment description"
     )
     segment_type: str = Field(
-        ..., description='Segment type: "manual" or "dynamic"'
+        ..., description='Segment type: "manual" or "automatic"'
     )
     rules: dict | None = Field(
-        None, description="Dynamic segment rules"
+        None, description="Automatic segment rules"
     )
 
 
@@ -86,8 +89,8 @@ class SegmentResponse(BaseModel):
         store_id: The parent store's UUID.
         name: Display name of the segment.
         description: Segment description (may be null).
-        segment_type: ``"manual"`` or ``"dynamic"``.
-        rules: Dynamic segment rules (may be null for manual segments).
+        segment_type: ``"manual"`` or ``"automatic"``.
+        rules: Automatic segment rules (may be null for manual segments).
         customer_count: Number of customers currently in this segment.
         created_at: When the segment was created.
         updated_at: When the segment was last modified.
@@ -6,6 +6,8 @@ the ``/api/v1/stores/*`` routes.
 **For Developers:**
     ``CreateStoreRequest`` and ``UpdateStoreRequest`` are input schemas.
     ``StoreResponse`` uses ``from_attributes`` to serialize ORM instances.
+    ``CloneStoreResponse.job`` is set when a large store is cloned in the
+    background; ``StoreCloneJobResponse`` reports that job's progress.
 
 **For QA Engineers:**
     - ``CreateStoreRequest.name`` is required, 1–255 characters.
@@ -23,6 +25,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.models.store import StoreStatus, StoreType
+from app.models.store_clone_job import CloneJobStatus
 
 
 class CreateStoreRequest(BaseModel):
@@ -97,15 +100,49 @@ class StoreResponse(BaseModel):
     updated_at: datetime
 
 
+class StoreCloneJobResponse(BaseModel):
+    """Schema for returning background store clone progress.
+
+    Attributes:
+        id: Clone job unique identifier.
+        source_store_id: The store being cloned.
+        store_id: The new store receiving the copy.
+        status: Current job status.
+        total_steps: Number of clone steps.
+        completed_steps: Number of steps finished so far.
+        current_step: Name of the last finished step.
+        error_message: Failure description, if the job failed.
+        created_at: When the job was requested.
+        completed_at: When the job finished.
+    """
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    source_store_id: uuid.UUID
+    store_id: uuid.UUID
+    status: CloneJobStatus
+    total_steps: int
+    completed_steps: int
+    current_step: str | None = None
+    error_message: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
+
+
 class CloneStoreResponse(BaseModel):
     """Schema for the clone operation result.
 
     Attributes:
         store: The newly created cloned store.
         source_store_id: The ID of the store that was cloned.
+        job: The background clone job, when the store is too large to
+            clone inside the request (the store stays ``paused`` until
+            the job completes).
     """
 
     model_config = {"from_attributes": True}
 
     store: StoreResponse
     source_store_id: uuid.UUID
+    job: StoreCloneJobResponse | None = None
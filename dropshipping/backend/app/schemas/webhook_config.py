@@ -130,6 +130,8 @@ class WebhookDeliveryResponse(BaseModel):
         response_status: HTTP status code returned by the target
             (may be null if the request failed to connect).
         success: Whether the delivery was successful (2xx response).
+        attempt: Attempt number for this event (1 for the first delivery).
+        next_retry_at: When the failed attempt will be retried, if at all.
         created_at: When the delivery was attempted.
     """
 
@@ -141,4 +143,6 @@ class WebhookDeliveryResponse(BaseModel):
     payload: dict
     response_status: int | None
     success: bool
+    attempt: int = 1
+    next_retry_at: datetime | None = None
     created_at: datetime
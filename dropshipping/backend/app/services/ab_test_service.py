@@ -8,15 +8,44 @@ assignment, and conversion/revenue tracking.
     Variant assignment uses a deterministic hash of the visitor ID and
     test ID so the same visitor always sees the same variant. Weights
     control traffic allocation. Status transitions follow the lifecycle:
-    ``draft`` -> ``running`` -> ``paused`` | ``completed``. The
-    ``record_event`` function increments counters atomically.
+    ``draft`` -> ``running`` -> ``paused`` | ``completed``.
+
+    The storefront path (``get_assigned_variant`` and ``record_event``)
+    does not touch the database:
+
+    - Test definitions (status and weighted variants) are cached per
+      process as ``CompiledTest``. ``update_test`` and ``delete_test``
+      call ``invalidate_test_definition``, which, once the change
+      commits, drops the local entry and bumps the test's version key in
+      Redis; other processes compare it on each lookup (one ``GET``). As
+      with the checkout rules cache, entries also expire after
+      ``settings.ab_test_cache_ttl_seconds``, so a status change made
+      while Redis is down is seen within that time.
+    - The dashboard event and assignment endpoints check the caller with
+      the cached ``verify_store_ownership`` and pass ``store_id``, which
+      is compared with the cached definition's store instead of loading
+      the test.
+    - Visitors are bucketed with CRC-32 seeded per test plus a 32-bit
+      finalizer, which is much cheaper than SHA-256 and spreads evenly
+      enough for traffic splits.
+    - Impressions, conversions, and revenue (in cents) are added to the
+      ``PENDING_COUNTERS_KEY`` Redis hash. The
+      ``flush_ab_test_counters`` task drains it every 30 seconds and
+      adds the totals to the variant rows with one batched ``UPDATE``.
+      Draining renames the hash to ``FLUSHING_COUNTERS_KEY``, which is
+      deleted only after the update commits, so a failed flush is retried
+      (at-least-once). Without Redis, events are added to the variant
+      row directly.
+    - ``get_test_stats`` computes significance from the variant counters
+      plus the not yet flushed ones.
 
 **For QA Engineers:**
     - ``create_test`` requires at least two variants.
     - ``get_assigned_variant`` produces deterministic assignments using
       a hash-based algorithm.
     - ``record_event`` supports ``impression`` and ``conversion`` event
-      types and optional revenue tracking.
+      types and optional revenue tracking. Variant counters in API
+      responses lag by up to one flush; ``get_test_stats`` does not.
     - Status transitions are validated: cannot go from ``completed`` back
       to ``running``.
     - ``delete_test`` is only allowed for ``draft`` tests.
@@ -33,26 +62,63 @@ assignment, and conversion/revenue tracking.
     and let data guide your decisions.
 """
 
-import hashlib
+import bisect
+import logging
+import math
+import time
 import uuid
-from decimal import Decimal
-
-from sqlalchemy import func, select
+import zlib
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import on_commit
+from app.redis_client import get_redis, get_sync_redis
+from app.services.store_access_service import verify_store_ownership
 
-from app.models.store import Store, StoreStatus
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
 # A/B test models -- import conditionally.
 # ---------------------------------------------------------------------------
 try:
-    from app.models.ab_test import ABTest, ABTestVariant
+    from app.models.ab_test import ABTest, ABTestStatus, ABTestVariant
 except ImportError:
     ABTest = None  # type: ignore[assignment,misc]
+    ABTestStatus = None  # type: ignore[assignment,misc]
     ABTestVariant = None  # type: ignore[assignment,misc]
 
 
+PENDING_COUNTERS_KEY = "ab-test:counters:pending"
+"""Redis hash of event counts not yet added to the variant rows."""
+
+FLUSHING_COUNTERS_KEY = "ab-test:counters:flushing"
+"""Redis hash of event counts being added by the running flush."""
+
+COUNTER_FIELDS = ("impressions", "conversions", "revenue_cents")
+"""Per-variant fields of the counter hashes (``<variant_id>:<field>``)."""
+
+# KEYS: pending hash, flushing hash.
+# Resumes a flush that did not finish; otherwise moves the pending hash.
+_DRAIN_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+
 # Valid status transitions
 _VALID_TRANSITIONS = {
     "draft": {"running"},
@@ -62,32 +128,6 @@ _VALID_TRANSITIONS = {
 }
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_test(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -121,7 +161,7 @@ async def create_test(
         ValueError: If the store doesn't exist, belongs to another user,
             or fewer than two variants are provided.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if not variants or len(variants) < 2:
         raise ValueError("At least two variants are required for an A/B test")
@@ -179,7 +219,7 @@ async def list_tests(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(ABTest).where(ABTest.store_id == store_id)
     count_query = select(func.count(ABTest.id)).where(ABTest.store_id == store_id)
@@ -217,7 +257,7 @@ async def get_test(
         ValueError: If the store or test doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(ABTest).where(
@@ -276,6 +316,7 @@ async def update_test(
 
     await db.flush()
     await db.refresh(test)
+    invalidate_test_definition(db, test.id)
     return test
 
 
@@ -307,28 +348,294 @@ async def delete_test(
 
     await db.delete(test)
     await db.flush()
+    invalidate_test_definition(db, test_id)
+
+
+# ---------------------------------------------------------------------------
+# Cached test definitions and assignment
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CompiledVariant:
+    """A test variant, detached from the session."""
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    weight: int
+    is_control: bool
+
+
+@dataclass
+class CompiledTest:
+    """A test's status and variants, ready for assignment.
+
+    Attributes:
+        id: The test's UUID.
+        store_id: The owning store's UUID.
+        status: The test's status when compiled.
+        variants: Variants in creation order.
+        seed: Per-test CRC-32 seed for visitor hashing.
+        cumulative_weights: Running weight totals of ``variants``.
+        version: Redis version the test was compiled at (None without
+            Redis).
+        compiled_at: ``time.monotonic()`` at compile time.
+    """
+
+    id: uuid.UUID
+    store_id: uuid.UUID
+    status: "ABTestStatus"
+    variants: tuple[CompiledVariant, ...]
+    seed: int
+    cumulative_weights: tuple[int, ...]
+    version: str | None = None
+    compiled_at: float = 0.0
+
+    def variant(self, variant_id: uuid.UUID) -> CompiledVariant | None:
+        """Return the test's variant with the given ID, if any."""
+        for variant in self.variants:
+            if variant.id == variant_id:
+                return variant
+        return None
+
+    def assign(self, visitor_id: str) -> CompiledVariant:
+        """Pick the visitor's variant according to the weights."""
+        hash_value = _visitor_hash(self.seed, visitor_id)
+        total_weight = self.cumulative_weights[-1]
+        if total_weight <= 0:
+            # Fallback to equal distribution
+            return self.variants[hash_value % len(self.variants)]
+        bucket = hash_value % total_weight
+        return self.variants[bisect.bisect_right(self.cumulative_weights, bucket)]
+
+
+# Per-process cache: test_id -> CompiledTest, least recently used first.
+_cache: "OrderedDict[uuid.UUID, CompiledTest]" = OrderedDict()
+
+
+def _visitor_hash(seed: int, visitor_id: str) -> int:
+    """32-bit hash of a visitor ID under a test's seed.
+
+    CRC-32 is fast but linear, so its output goes through the MurmurHash3
+    ``fmix32`` finalizer to spread nearby visitor IDs across buckets.
+    """
+    h = zlib.crc32(visitor_id.encode("utf-8"), seed)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def _version_key(test_id: uuid.UUID) -> str:
+    """Redis key holding a test definition's version."""
+    return f"ab-test:version:{test_id}"
+
+
+async def _compile(db: AsyncSession, test_id: uuid.UUID) -> CompiledTest:
+    """Load a test and its variants.
+
+    Raises:
+        ValueError: If the test doesn't exist or has no variants.
+    """
+    row = (
+        await db.execute(select(ABTest.store_id, ABTest.status).where(ABTest.id == test_id))
+    ).one_or_none()
+    if row is None:
+        raise ValueError("A/B test not found")
+    variants = tuple(
+        CompiledVariant(
+            id=v.id,
+            name=v.name,
+            description=v.description,
+            weight=v.weight,
+            is_control=v.is_control,
+        )
+        for v in (
+            await db.execute(
+                select(
+                    ABTestVariant.id,
+                    ABTestVariant.name,
+                    ABTestVariant.description,
+                    ABTestVariant.weight,
+                    ABTestVariant.is_control,
+                )
+                .where(ABTestVariant.test_id == test_id)
+                .order_by(ABTestVariant.created_at, ABTestVariant.id)
+            )
+        ).all()
+    )
+    if not variants:
+        raise ValueError("No variants found for this test")
+
+    cumulative: list[int] = []
+    total = 0
+    for variant in variants:
+        total += max(variant.weight, 0)
+        cumulative.append(total)
+    return CompiledTest(
+        id=test_id,
+        store_id=row.store_id,
+        status=ABTestStatus(row.status),
+        variants=variants,
+        seed=zlib.crc32(str(test_id).encode("ascii")),
+        cumulative_weights=tuple(cumulative),
+    )
+
+
+async def get_test_definition(db: AsyncSession, test_id: uuid.UUID) -> CompiledTest:
+    """Get a test's cached definition, compiling it if needed.
+
+    Args:
+        db: Async database session (used only to compile).
+        test_id: The UUID of the A/B test.
+
+    Returns:
+        The test's ``CompiledTest``.
+
+    Raises:
+        ValueError: If the test doesn't exist or has no variants.
+    """
+    cached = _cache.get(test_id)
+    fresh = (
+        cached is not None
+        and time.monotonic() - cached.compiled_at < settings.ab_test_cache_ttl_seconds
+    )
+    try:
+        version = await get_redis().get(_version_key(test_id)) or "0"
+    except RedisError as exc:
+        logger.warning("A/B test version unavailable, using TTL only: %s", exc)
+        version = None
+        if fresh:
+            _cache.move_to_end(test_id)
+            return cached
+    else:
+        if fresh and cached.version == version:
+            _cache.move_to_end(test_id)
+            return cached
+
+    compiled = await _compile(db, test_id)
+    compiled.version = version
+    compiled.compiled_at = time.monotonic()
+    _cache[test_id] = compiled
+    _cache.move_to_end(test_id)
+    while len(_cache) > settings.ab_test_cache_max_tests:
+        _cache.popitem(last=False)
+    return compiled
+
+
+def _forget_test(test_id: uuid.UUID) -> None:
+    """Drop a test definition from this process and bump its version."""
+    _cache.pop(test_id, None)
+    try:
+        get_sync_redis().incr(_version_key(test_id))
+    except RedisError as exc:
+        logger.warning("A/B test invalidation not broadcast: test=%s error=%s", test_id, exc)
+
+
+def invalidate_test_definition(db: AsyncSession, test_id: uuid.UUID) -> None:
+    """Make every process reload a test's definition once the change commits.
+
+    Args:
+        db: The session making the change.
+        test_id: The test whose status or variants changed.
+    """
+    on_commit(db, lambda: _forget_test(test_id))
+
+
+def clear_test_cache() -> None:
+    """Drop this process's cached test definitions."""
+    _cache.clear()
+
+
+async def _store_test_definition(
+    db: AsyncSession, test_id: uuid.UUID, store_id: uuid.UUID | None
+) -> CompiledTest:
+    """Get a test's cached definition, optionally requiring its store.
+
+    Raises:
+        ValueError: If the test doesn't exist, has no variants, or
+            belongs to another store than ``store_id``.
+    """
+    test = await get_test_definition(db, test_id)
+    if store_id is not None and test.store_id != store_id:
+        raise ValueError("A/B test not found")
+    return test
+
+
+async def get_assigned_variant(
+    db: AsyncSession,
+    test_id: uuid.UUID,
+    visitor_id: str,
+    store_id: uuid.UUID | None = None,
+) -> CompiledVariant:
+    """Assign a visitor to a test variant deterministically.
+
+    Uses a hash of the visitor ID and test ID to produce a consistent
+    assignment. The same visitor always sees the same variant. Variants
+    are selected according to their weight distribution.
+
+    Args:
+        db: Async database session (used only on a cache miss).
+        test_id: The UUID of the A/B test.
+        visitor_id: A unique identifier for the visitor (e.g. session ID,
+            cookie, or fingerprint).
+        store_id: If given, the store the test must belong to.
+
+    Returns:
+        The assigned ``CompiledVariant``.
+
+    Raises:
+        ValueError: If the test doesn't exist (in ``store_id``) or has no
+            variants.
+    """
+    test = await _store_test_definition(db, test_id, store_id)
+    return test.assign(visitor_id)
+
+
+# ---------------------------------------------------------------------------
+# Event counters
+# ---------------------------------------------------------------------------
+
+
+def _field(variant_id: uuid.UUID, name: str) -> str:
+    """Counter hash field of one variant counter."""
+    return f"{variant_id}:{name}"
+
+
+def _cents(amount: Decimal) -> int:
+    """Whole cents of a revenue amount."""
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
 
 
 async def record_event(
     db: AsyncSession,
+    test_id: uuid.UUID,
     variant_id: uuid.UUID,
     event_type: str,
     revenue: Decimal | None = None,
+    store_id: uuid.UUID | None = None,
 ) -> None:
     """Record an event (impression or conversion) for a test variant.
 
-    Increments the appropriate counter on the variant record. For
+    Adds to the variant's pending counters in Redis; the
+    ``flush_ab_test_counters`` task moves them to the variant row. For
     conversion events, optionally adds revenue.
 
     Args:
-        db: Async database session.
+        db: Async database session (used on a cache miss, or to write
+            the counters directly when Redis is unavailable).
+        test_id: The UUID of the test the variant belongs to.
         variant_id: The UUID of the variant to record against.
         event_type: Either ``"impression"`` or ``"conversion"``.
         revenue: Optional revenue amount for conversion events.
+        store_id: If given, the store the test must belong to.
 
     Raises:
-        ValueError: If the variant doesn't exist or the event type is
-            invalid.
+        ValueError: If the test (in ``store_id``) or variant doesn't
+            exist, the test is not running, or the event type is invalid.
     """
     if event_type not in ("impression", "conversion"):
         raise ValueError(
@@ -336,84 +643,252 @@ async def record_event(
             f"Must be 'impression' or 'conversion'."
         )
 
-    result = await db.execute(
-        select(ABTestVariant).where(ABTestVariant.id == variant_id)
-    )
-    variant = result.scalar_one_or_none()
-    if variant is None:
+    test = await _store_test_definition(db, test_id, store_id)
+    if test.variant(variant_id) is None:
         raise ValueError("Variant not found")
+    if test.status != ABTestStatus.running:
+        raise ValueError("Test is not running — cannot record events")
 
-    # Verify the parent test is currently running
-    test_result = await db.execute(
-        select(ABTest).where(ABTest.id == variant.test_id)
+    increments = {"impressions": 1} if event_type == "impression" else {"conversions": 1}
+    if event_type == "conversion" and revenue:
+        increments["revenue_cents"] = _cents(revenue)
+
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for name, amount in increments.items():
+            pipe.hincrby(PENDING_COUNTERS_KEY, _field(variant_id, name), amount)
+        await pipe.execute()
+        return
+    except RedisError as exc:
+        logger.warning("A/B event counters unavailable, writing directly: %s", exc)
+
+    await db.execute(
+        update(ABTestVariant)
+        .where(ABTestVariant.id == variant_id)
+        .values(
+            impressions=ABTestVariant.impressions + increments.get("impressions", 0),
+            conversions=ABTestVariant.conversions + increments.get("conversions", 0),
+            revenue=ABTestVariant.revenue + Decimal(increments.get("revenue_cents", 0)) / 100,
+        )
+        .execution_options(synchronize_session="fetch")
     )
-    test = test_result.scalar_one_or_none()
-    if test is None or test.status != "running":
-        raise ValueError("Test is not running — cannot record events")
+    await db.flush()
 
-    if event_type == "impression":
-        variant.impressions += 1
-    elif event_type == "conversion":
-        variant.conversions += 1
-        if revenue is not None:
-            variant.revenue += revenue
 
-    await db.flush()
+def _parse_counters(raw: list[str] | dict[str, str]) -> dict[uuid.UUID, dict[str, int]]:
+    """Group counter hash fields by variant, skipping unreadable ones."""
+    items = raw.items() if isinstance(raw, dict) else zip(raw[::2], raw[1::2])
+    counters: dict[uuid.UUID, dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(COUNTER_FIELDS, 0)
+    )
+    for key, value in items:
+        variant_id, _, name = key.rpartition(":")
+        try:
+            counters[uuid.UUID(variant_id)][name] += int(value)
+        except (KeyError, ValueError):
+            logger.error("Dropping unreadable A/B counter field %s=%s", key, value)
+    return dict(counters)
 
 
-async def get_assigned_variant(
-    db: AsyncSession,
-    test_id: uuid.UUID,
-    visitor_id: str,
-) -> "ABTestVariant":
-    """Assign a visitor to a test variant deterministically.
+def drain_event_counters_sync(redis: Redis | None = None) -> dict[uuid.UUID, dict[str, int]]:
+    """Take the pending event counters for a flush.
 
-    Uses a hash of the visitor ID and test ID to produce a consistent
-    assignment. The same visitor always sees the same variant. Variants
-    are selected according to their weight distribution.
+    Returns the counters of an unfinished earlier flush first, if any.
+    Call ``ack_event_counters_sync`` once they are committed.
 
     Args:
-        db: Async database session.
-        test_id: The UUID of the A/B test.
-        visitor_id: A unique identifier for the visitor (e.g. session ID,
-            cookie, or fingerprint).
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
 
     Returns:
-        The assigned ABTestVariant ORM instance.
+        Dict of variant ID to ``COUNTER_FIELDS`` totals.
 
     Raises:
-        ValueError: If the test doesn't exist or has no variants.
+        redis.RedisError: If Redis is unavailable.
     """
-    result = await db.execute(
-        select(ABTestVariant)
-        .where(ABTestVariant.test_id == test_id)
-        .order_by(ABTestVariant.created_at)
+    redis = redis or get_sync_redis()
+    return _parse_counters(redis.eval(_DRAIN_LUA, 2, PENDING_COUNTERS_KEY, FLUSHING_COUNTERS_KEY))
+
+
+def apply_event_counters_sync(
+    session: Session, counters: dict[uuid.UUID, dict[str, int]]
+) -> int:
+    """Add drained counters to the variant rows with one batched UPDATE.
+
+    Variants deleted in the meantime are skipped.
+
+    Args:
+        session: Sync database session (not committed here).
+        counters: Output of ``drain_event_counters_sync``.
+
+    Returns:
+        Number of variants updated.
+    """
+    if not counters:
+        return 0
+    table = ABTestVariant.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("variant_id"))
+        .values(
+            impressions=table.c.impressions + bindparam("add_impressions"),
+            conversions=table.c.conversions + bindparam("add_conversions"),
+            revenue=table.c.revenue + bindparam("add_revenue"),
+        )
+    )
+    session.execute(
+        stmt,
+        [
+            {
+                "variant_id": variant_id,
+                "add_impressions": counts["impressions"],
+                "add_conversions": counts["conversions"],
+                "add_revenue": Decimal(counts["revenue_cents"]) / 100,
+            }
+            for variant_id, counts in counters.items()
+        ],
     )
-    variants = list(result.scalars().all())
+    return len(counters)
 
-    if not variants:
-        raise ValueError("No variants found for this test")
 
-    # Deterministic hash-based assignment
-    hash_input = f"{test_id}:{visitor_id}"
-    hash_value = int(
-        hashlib.sha256(hash_input.encode("utf-8")).hexdigest(), 16
+def ack_event_counters_sync(redis: Redis | None = None) -> None:
+    """Discard the drained counters after they were committed.
+
+    Args:
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    (redis or get_sync_redis()).delete(FLUSHING_COUNTERS_KEY)
+
+
+# ---------------------------------------------------------------------------
+# Results
+# ---------------------------------------------------------------------------
+
+
+def _two_proportion_test(
+    control_n: int, control_x: int, n: int, x: int
+) -> tuple[float | None, float | None]:
+    """Pooled two-proportion z-test of a variant against the control.
+
+    Returns:
+        ``(z_score, two-sided p_value)``, or ``(None, None)`` when either
+        side has no impressions.
+    """
+    if control_n == 0 or n == 0:
+        return None, None
+    pooled = (control_x + x) / (control_n + n)
+    se = math.sqrt(pooled * (1 - pooled) * (1 / control_n + 1 / n))
+    if se == 0:
+        return 0.0, 1.0
+    z = (x / n - control_x / control_n) / se
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+async def _pending_counters(variant_ids: list[uuid.UUID]) -> dict[uuid.UUID, dict[str, int]]:
+    """Not yet flushed counters of some variants (empty without Redis)."""
+    fields = [_field(v, name) for v in variant_ids for name in COUNTER_FIELDS]
+    if not fields:
+        return {}
+    try:
+        values = await get_redis().hmget(PENDING_COUNTERS_KEY, fields)
+    except RedisError as exc:
+        logger.warning("A/B pending counters unavailable: %s", exc)
+        return {}
+    return _parse_counters(
+        {field: value for field, value in zip(fields, values) if value is not None}
     )
 
-    # Calculate total weight and find the assigned variant
-    total_weight = sum(v.weight for v in variants)
-    if total_weight <= 0:
-        # Fallback to equal distribution
-        index = hash_value % len(variants)
-        return variants[index]
 
-    bucket = hash_value % total_weight
-    cumulative = 0
+async def get_test_stats(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    test_id: uuid.UUID,
+    confidence_level: float = 0.95,
+) -> dict:
+    """Compute a test's results from its aggregated counters.
 
-    for variant in variants:
-        cumulative += variant.weight
-        if bucket < cumulative:
-            return variant
+    Each variant is compared with the control using a pooled
+    two-proportion z-test on conversion rate. The winner is the
+    best-converting variant that beats the control significantly.
 
-    # Fallback (should not reach here)
-    return variants[-1]
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        user_id: The requesting user's UUID (for ownership check).
+        test_id: The UUID of the A/B test.
+        confidence_level: Confidence required to call a difference
+            significant (e.g. ``0.95``).
+
+    Returns:
+        Dict with ``test_id``, ``status``, ``confidence_level``,
+        ``total_impressions``, ``total_conversions``, ``variants`` (one
+        dict per variant), and ``winner_variant_id`` (or None).
+
+    Raises:
+        ValueError: If the store or test doesn't exist, or the store
+            belongs to another user.
+    """
+    test = await get_test(db, store_id, user_id, test_id)
+    rows = (
+        await db.execute(
+            select(
+                ABTestVariant.id,
+                ABTestVariant.name,
+                ABTestVariant.is_control,
+                ABTestVariant.impressions,
+                ABTestVariant.conversions,
+                ABTestVariant.revenue,
+            )
+            .where(ABTestVariant.test_id == test_id)
+            .order_by(ABTestVariant.created_at, ABTestVariant.id)
+        )
+    ).all()
+    pending = await _pending_counters([row.id for row in rows])
+
+    variants = []
+    for row in rows:
+        extra = pending.get(row.id, dict.fromkeys(COUNTER_FIELDS, 0))
+        impressions = row.impressions + extra["impressions"]
+        conversions = row.conversions + extra["conversions"]
+        variants.append({
+            "variant_id": row.id,
+            "name": row.name,
+            "is_control": row.is_control,
+            "impressions": impressions,
+            "conversions": conversions,
+            "revenue": row.revenue + Decimal(extra["revenue_cents"]) / 100,
+            "conversion_rate": conversions / impressions if impressions else 0.0,
+        })
+
+    control = next((v for v in variants if v["is_control"]), variants[0] if variants else None)
+    winner = None
+    for variant in variants:
+        variant.update(lift=None, z_score=None, p_value=None, significant=False)
+        if variant is control:
+            continue
+        z, p_value = _two_proportion_test(
+            control["impressions"], control["conversions"],
+            variant["impressions"], variant["conversions"],
+        )
+        if control["conversion_rate"]:
+            variant["lift"] = variant["conversion_rate"] / control["conversion_rate"] - 1
+        variant["z_score"] = z
+        variant["p_value"] = p_value
+        variant["significant"] = p_value is not None and p_value < 1 - confidence_level
+        if variant["significant"] and z > 0 and (
+            winner is None or variant["conversion_rate"] > winner["conversion_rate"]
+        ):
+            winner = variant
+
+    return {
+        "test_id": test.id,
+        "status": ABTestStatus(test.status).value,
+        "confidence_level": confidence_level,
+        "total_impressions": sum(v["impressions"] for v in variants),
+        "total_conversions": sum(v["conversions"] for v in variants),
+        "variants": variants,
+        "winner_variant_id": winner["variant_id"] if winner else None,
+    }
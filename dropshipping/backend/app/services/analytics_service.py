@@ -6,15 +6,23 @@ order data and product costs stored in the database.
 
 **For Developers:**
     Period parsing converts shorthand strings like ``"30d"``, ``"7d"``,
-    ``"90d"`` into date ranges. Revenue comes from paid/shipped/delivered
-    orders. Cost comes from the product ``cost`` field (supplier cost)
-    at the time of query (not snapshotted at order time -- a known
-    simplification for MVP). Granularity options for time series are
-    ``day``, ``week``, and ``month``.
+    ``"90d"`` into date ranges that start at midnight UTC. Revenue comes
+    from paid/shipped/delivered orders. Granularity options for time
+    series are ``day``, ``week``, and ``month``.
+
+    Closed days are read from the materialized rollups maintained by
+    ``analytics_rollup_service``; only days outside the rollup watermark
+    (normally just today) are aggregated from raw ``Order``/``OrderItem``
+    rows. Both halves are combined in SQL with ``UNION ALL`` so ranking
+    and bucketing stay in the database. Cost comes from the product
+    ``cost`` field at rollup time for closed days and at query time for
+    today (not snapshotted at order time -- a known simplification).
 
 **For QA Engineers:**
     - ``get_profit_summary`` excludes pending and cancelled orders.
     - ``get_revenue_time_series`` groups by PostgreSQL ``date_trunc``.
+    - Periods cover whole UTC days: ``"7d"`` starts at midnight seven
+      days ago and includes today so far.
     - ``get_top_products`` ranks by revenue and includes profit margin.
     - ``get_dashboard_analytics`` combines all three in a single call.
     - All functions verify store ownership before returning data.
@@ -31,41 +39,22 @@ order data and product costs stored in the database.
 """
 
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import func, select, extract, case
+from sqlalchemy import DateTime, cast, func, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.order import Order, OrderItem, OrderStatus
+from app.models.analytics import DailyProductMetrics, DailyStoreMetrics
+from app.models.order import Order, OrderItem
 from app.models.product import Product
-from app.models.store import Store, StoreStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services.analytics_rollup_service import (
+    REVENUE_STATUSES,
+    day_start,
+    get_rollup_window,
+    order_day,
+)
+from app.services.store_access_service import verify_store_ownership
 
 
 def _parse_period(period: str) -> datetime:
@@ -92,8 +81,44 @@ def _parse_period(period: str) -> datetime:
     return now - timedelta(days=30)
 
 
-# Statuses that count as completed revenue
-_REVENUE_STATUSES = [OrderStatus.paid, OrderStatus.shipped, OrderStatus.delivered]
+async def _period_window(
+    db: AsyncSession, period: str
+) -> tuple[tuple[date, date] | None, list]:
+    """Split a period into rolled-up days and a raw-order remainder.
+
+    The period starts at midnight UTC of the day ``_parse_period`` lands
+    on. Days inside the rollup watermark are served from the fact tables;
+    every other part of the period is read from raw orders.
+
+    Args:
+        db: Async database session.
+        period: Time period shorthand (e.g. ``"30d"``).
+
+    Returns:
+        A tuple of the inclusive ``(first_day, last_day)`` range to read
+        from rollups (None if no rollup covers the period) and the
+        ``Order`` criteria selecting the raw remainder.
+    """
+    start_day = _parse_period(period).date()
+    raw_criteria = [
+        Order.status.in_(REVENUE_STATUSES),
+        Order.created_at >= day_start(start_day),
+    ]
+
+    window = await get_rollup_window(db)
+    if window is None:
+        return None, raw_criteria
+    first_day, last_day = max(window[0], start_day), window[1]
+    if first_day > last_day:
+        return None, raw_criteria
+
+    raw_criteria.append(
+        or_(
+            Order.created_at < day_start(first_day),
+            Order.created_at >= day_start(last_day + timedelta(days=1)),
+        )
+    )
+    return (first_day, last_day), raw_criteria
 
 
 async def get_profit_summary(
@@ -106,7 +131,8 @@ async def get_profit_summary(
 
     Revenue is the sum of order totals for paid/shipped/delivered orders.
     Cost is estimated from the product ``cost`` field multiplied by
-    quantities sold. Profit is revenue minus cost.
+    quantities sold. Profit is revenue minus cost. Closed days come from
+    ``daily_store_metrics``; the remainder from raw orders.
 
     Args:
         db: Async database session.
@@ -121,25 +147,41 @@ async def get_profit_summary(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
-    period_start = _parse_period(period)
+    await verify_store_ownership(db, store_id, user_id)
+    rolled_days, raw_criteria = await _period_window(db, period)
+
+    total_revenue = Decimal("0.00")
+    total_cost = Decimal("0.00")
+    order_count = 0
+
+    if rolled_days is not None:
+        rolled_result = await db.execute(
+            select(
+                func.coalesce(func.sum(DailyStoreMetrics.revenue), Decimal("0.00")),
+                func.coalesce(func.sum(DailyStoreMetrics.order_count), 0),
+                func.coalesce(func.sum(DailyStoreMetrics.cost), Decimal("0.00")),
+            ).where(
+                DailyStoreMetrics.store_id == store_id,
+                DailyStoreMetrics.day.between(*rolled_days),
+            )
+        )
+        rolled_row = rolled_result.one()
+        total_revenue += rolled_row[0]
+        order_count += rolled_row[1]
+        total_cost += rolled_row[2]
 
-    # Total revenue
+    # Revenue for days not covered by the rollups
     revenue_result = await db.execute(
         select(
             func.coalesce(func.sum(Order.total), Decimal("0.00")),
             func.count(Order.id),
-        ).where(
-            Order.store_id == store_id,
-            Order.status.in_(_REVENUE_STATUSES),
-            Order.created_at >= period_start,
-        )
+        ).where(Order.store_id == store_id, *raw_criteria)
     )
     revenue_row = revenue_result.one()
-    total_revenue = revenue_row[0]
-    order_count = revenue_row[1]
+    total_revenue += revenue_row[0]
+    order_count += revenue_row[1]
 
-    # Total cost (from product cost * quantity)
+    # Cost for days not covered by the rollups (product cost * quantity)
     cost_result = await db.execute(
         select(
             func.coalesce(
@@ -151,13 +193,9 @@ async def get_profit_summary(
         )
         .join(Order, OrderItem.order_id == Order.id)
         .join(Product, OrderItem.product_id == Product.id)
-        .where(
-            Order.store_id == store_id,
-            Order.status.in_(_REVENUE_STATUSES),
-            Order.created_at >= period_start,
-        )
+        .where(Order.store_id == store_id, *raw_criteria)
     )
-    total_cost = cost_result.scalar_one()
+    total_cost += cost_result.scalar_one()
 
     profit = total_revenue - total_cost
     margin = (
@@ -183,8 +221,9 @@ async def get_revenue_time_series(
 ) -> list[dict]:
     """Get revenue grouped by time intervals.
 
-    Uses PostgreSQL ``date_trunc`` to aggregate order totals by day,
-    week, or month.
+    Daily revenue from ``daily_store_metrics`` and from raw orders is
+    combined with ``UNION ALL`` and bucketed with PostgreSQL
+    ``date_trunc`` by day, week, or month.
 
     Args:
         db: Async database session.
@@ -201,24 +240,43 @@ async def get_revenue_time_series(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
-    period_start = _parse_period(period)
+    await verify_store_ownership(db, store_id, user_id)
+    rolled_days, raw_criteria = await _period_window(db, period)
 
     if granularity not in ("day", "week", "month"):
         granularity = "day"
 
-    date_trunc = func.date_trunc(granularity, Order.created_at)
+    raw_day = order_day()
+    daily = (
+        select(
+            raw_day.label("day"),
+            func.sum(Order.total).label("revenue"),
+            func.count(Order.id).label("order_count"),
+        )
+        .where(Order.store_id == store_id, *raw_criteria)
+        .group_by(raw_day)
+    )
+    if rolled_days is not None:
+        daily = union_all(
+            select(
+                DailyStoreMetrics.day,
+                DailyStoreMetrics.revenue,
+                DailyStoreMetrics.order_count,
+            ).where(
+                DailyStoreMetrics.store_id == store_id,
+                DailyStoreMetrics.day.between(*rolled_days),
+            ),
+            daily,
+        )
+    daily = daily.subquery("daily")
+
+    date_trunc = func.date_trunc(granularity, cast(daily.c.day, DateTime(timezone=True)))
 
     result = await db.execute(
         select(
             date_trunc.label("period_date"),
-            func.coalesce(func.sum(Order.total), Decimal("0.00")).label("revenue"),
-            func.count(Order.id).label("order_count"),
-        )
-        .where(
-            Order.store_id == store_id,
-            Order.status.in_(_REVENUE_STATUSES),
-            Order.created_at >= period_start,
+            func.coalesce(func.sum(daily.c.revenue), Decimal("0.00")).label("revenue"),
+            func.sum(daily.c.order_count).label("order_count"),
         )
         .group_by(date_trunc)
         .order_by(date_trunc)
@@ -245,7 +303,9 @@ async def get_top_products(
     """Get top-performing products by revenue.
 
     Ranks products by total revenue (unit_price * quantity) from orders
-    within the period. Includes cost and profit calculations.
+    within the period. Includes cost and profit calculations. Closed
+    days come from ``daily_product_metrics`` and are merged with raw
+    order items in SQL before ranking.
 
     Args:
         db: Async database session.
@@ -261,28 +321,49 @@ async def get_top_products(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
-    period_start = _parse_period(period)
+    await verify_store_ownership(db, store_id, user_id)
+    rolled_days, raw_criteria = await _period_window(db, period)
 
-    result = await db.execute(
+    sales = (
         select(
-            OrderItem.product_id,
-            OrderItem.product_title,
-            func.sum(OrderItem.unit_price * OrderItem.quantity).label("revenue"),
-            func.sum(
+            OrderItem.product_id.label("product_id"),
+            OrderItem.product_title.label("product_title"),
+            (OrderItem.unit_price * OrderItem.quantity).label("revenue"),
+            (
                 func.coalesce(Product.cost, Decimal("0.00")) * OrderItem.quantity
             ).label("cost"),
-            func.sum(OrderItem.quantity).label("units_sold"),
+            OrderItem.quantity.label("units_sold"),
         )
         .join(Order, OrderItem.order_id == Order.id)
         .outerjoin(Product, OrderItem.product_id == Product.id)
-        .where(
-            Order.store_id == store_id,
-            Order.status.in_(_REVENUE_STATUSES),
-            Order.created_at >= period_start,
+        .where(Order.store_id == store_id, *raw_criteria)
+    )
+    if rolled_days is not None:
+        sales = union_all(
+            select(
+                DailyProductMetrics.product_id,
+                DailyProductMetrics.product_title,
+                DailyProductMetrics.revenue,
+                DailyProductMetrics.cost,
+                DailyProductMetrics.units_sold,
+            ).where(
+                DailyProductMetrics.store_id == store_id,
+                DailyProductMetrics.day.between(*rolled_days),
+            ),
+            sales,
+        )
+    sales = sales.subquery("sales")
+
+    result = await db.execute(
+        select(
+            sales.c.product_id,
+            sales.c.product_title,
+            func.sum(sales.c.revenue).label("revenue"),
+            func.sum(sales.c.cost).label("cost"),
+            func.sum(sales.c.units_sold).label("units_sold"),
         )
-        .group_by(OrderItem.product_id, OrderItem.product_title)
-        .order_by(func.sum(OrderItem.unit_price * OrderItem.quantity).desc())
+        .group_by(sales.c.product_id, sales.c.product_title)
+        .order_by(func.sum(sales.c.revenue).desc())
         .limit(limit)
     )
 
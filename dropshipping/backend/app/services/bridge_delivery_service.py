@@ -0,0 +1,463 @@
+"""Batched ServiceBridge event bus on Redis Streams.
+
+Platform events are appended to a Redis Stream when they happen and
+delivered to the connected services in batches, instead of one Celery
+task and one HTTP request per event and service.
+
+**For Developers:**
+    - ``publish_platform_event`` appends the event envelope to
+      ``settings.bridge_stream_key`` (one ``XADD``) and, at most once per
+      ``DRAIN_KICK_SECONDS``, schedules the ``drain_platform_events``
+      task. A 1,000-product import therefore queues a handful of tasks.
+    - ``read_platform_events`` reads from the stream through the
+      ``bridge-dispatchers`` consumer group. Entries a previous drain read
+      but never acknowledged (worker crash) are returned first.
+    - ``plan_service_batches`` resolves every event in a read batch to the
+      active ``ServiceIntegration`` rows of its user with one query and
+      groups the (event, integration) pairs per destination service,
+      preserving stream order.
+    - ``deliver_service_batches`` POSTs each service's events to its
+      ``/api/v1/webhooks/platform-events/batch`` endpoint in chunks of
+      ``settings.bridge_max_events_per_post``. Chunks for one service are
+      sent in order; different services are sent in parallel.
+    - ``record_bridge_deliveries`` writes one ``BridgeDelivery`` row per
+      (event, service) with a single batched ``INSERT``.
+    - The drain task holds ``drain_lock`` so only one drain runs at a
+      time (per-service ordering) and acknowledges stream entries only
+      after their delivery rows are committed (at-least-once delivery).
+
+**For QA Engineers:**
+    - Batch requests carry ``X-Platform-Signature: sha256=<hmac>`` over
+      the whole body and ``X-Platform-Event-Count``.
+    - Every event/service pair still produces one ``BridgeDelivery`` row,
+      so the Service Activity dashboard is unchanged.
+    - If Redis is unavailable, ``fire_platform_event`` falls back to the
+      per-event ``dispatch_platform_event`` Celery task.
+
+**For Project Managers:**
+    Bulk actions (imports, bulk edits) no longer flood the task queue and
+    the connected services with thousands of individual requests.
+
+**For End Users:**
+    Your connected AI tools keep receiving store events within seconds,
+    even during large imports.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+from redis import Redis
+from redis.exceptions import LockError, ResponseError
+from redis.lock import Lock
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.http_client import get_async_http_client, run_async
+from app.models.bridge_delivery import BridgeDelivery
+from app.models.service_integration import ServiceIntegration, ServiceName
+from app.models.store import Store
+from app.redis_client import get_sync_redis
+from app.services.bridge_service import sign_bridge_payload
+
+logger = logging.getLogger(__name__)
+
+STREAM_GROUP = "bridge-dispatchers"
+"""Consumer group that drains the ServiceBridge event stream."""
+
+STREAM_CONSUMER = "drainer"
+"""Consumer name; a single drain runs at a time (see ``drain_lock``)."""
+
+DRAIN_LOCK_KEY = "bridge:events:drain-lock"
+DRAIN_LOCK_SECONDS = 300
+DRAIN_KICK_KEY = "bridge:events:drain-kick"
+DRAIN_KICK_SECONDS = 2
+
+
+# ---------------------------------------------------------------------------
+# Event-to-service mapping
+# ---------------------------------------------------------------------------
+
+EVENT_SERVICE_MAP: dict[str, list[ServiceName]] = {
+    "product.created": [
+        ServiceName.contentforge,
+        ServiceName.rankpilot,
+        ServiceName.trendscout,
+        ServiceName.postpilot,
+        ServiceName.adscale,
+        ServiceName.shopchat,
+    ],
+    "product.updated": [
+        ServiceName.contentforge,
+        ServiceName.rankpilot,
+        ServiceName.shopchat,
+    ],
+    "order.created": [
+        ServiceName.flowsend,
+        ServiceName.spydrop,
+    ],
+    "order.shipped": [
+        ServiceName.flowsend,
+    ],
+    "customer.created": [
+        ServiceName.flowsend,
+    ],
+}
+"""Maps platform event names to the list of services that should be notified.
+
+Each service in the list receives the event, provided the user has an
+active integration for that service.
+"""
+
+
+def service_batch_url(service_name: ServiceName) -> str:
+    """Return a service's batch ingestion URL from the SERVICE_CATALOG.
+
+    Args:
+        service_name: The service to look up.
+
+    Returns:
+        The batch endpoint URL, or ``""`` if the service has no base URL.
+    """
+    from app.services.service_integration_service import SERVICE_CATALOG
+
+    base_url = SERVICE_CATALOG.get(service_name, {}).get("base_url", "")
+    return f"{base_url}/api/v1/webhooks/platform-events/batch" if base_url else ""
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+
+def build_platform_envelope(
+    user_id: uuid.UUID,
+    store_id: uuid.UUID | None,
+    event: str,
+    resource_id: uuid.UUID,
+    resource_type: str,
+    payload: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the event envelope delivered to services.
+
+    Args:
+        user_id: The platform user who triggered the event.
+        store_id: The store scope (may be None).
+        event: Event type string (e.g. ``"product.created"``).
+        resource_id: UUID of the triggering resource.
+        resource_type: ``"product"``, ``"order"``, or ``"customer"``.
+        payload: The event data dict.
+
+    Returns:
+        The envelope dict (all UUIDs as strings).
+    """
+    return {
+        "event": event,
+        "store_id": str(store_id) if store_id else None,
+        "user_id": str(user_id),
+        "resource_id": str(resource_id),
+        "resource_type": resource_type,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "data": payload,
+    }
+
+
+def publish_platform_event(envelope: dict[str, Any], redis: Redis | None = None) -> str:
+    """Append an event envelope to the bridge stream and schedule a drain.
+
+    Args:
+        envelope: Envelope from ``build_platform_envelope``.
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        The stream entry ID.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    redis = redis or get_sync_redis()
+    entry_id = redis.xadd(
+        settings.bridge_stream_key,
+        {"envelope": json.dumps(envelope, default=str)},
+        maxlen=settings.bridge_stream_maxlen,
+        approximate=True,
+    )
+    # One drain task per kick window, however many events are published.
+    if redis.set(DRAIN_KICK_KEY, "1", nx=True, ex=DRAIN_KICK_SECONDS):
+        from app.tasks.bridge_tasks import drain_platform_events
+
+        drain_platform_events.apply_async(countdown=1)
+    return entry_id
+
+
+# ---------------------------------------------------------------------------
+# Consuming
+# ---------------------------------------------------------------------------
+
+
+def drain_lock(redis: Redis) -> Lock:
+    """Return the lock that serializes drains (and thus per-service order)."""
+    return redis.lock(DRAIN_LOCK_KEY, timeout=DRAIN_LOCK_SECONDS)
+
+
+def release_drain_lock(lock: Lock) -> None:
+    """Release a drain lock, ignoring a lock that already expired."""
+    try:
+        lock.release()
+    except LockError:
+        logger.warning("Bridge drain lock expired before release")
+
+
+def ensure_consumer_group(redis: Redis) -> None:
+    """Create the stream and its consumer group if they do not exist."""
+    try:
+        redis.xgroup_create(
+            settings.bridge_stream_key, STREAM_GROUP, id="0", mkstream=True
+        )
+    except ResponseError as exc:
+        if "BUSYGROUP" not in str(exc):
+            raise
+
+
+def read_platform_events(
+    redis: Redis, count: int | None = None
+) -> list[tuple[str, dict[str, Any] | None]]:
+    """Read the next batch of stream entries for the drain consumer.
+
+    Entries that were read before but not acknowledged are returned
+    first, so a crashed drain's batch is delivered again before newer
+    events.
+
+    Args:
+        redis: Sync Redis client.
+        count: Maximum entries to read (defaults to
+            ``settings.bridge_read_batch_size``).
+
+    Returns:
+        List of ``(entry_id, envelope)``; the envelope is None for entries
+        that were trimmed or could not be decoded.
+    """
+    count = count or settings.bridge_read_batch_size
+    for start in ("0", ">"):
+        response = redis.xreadgroup(
+            STREAM_GROUP,
+            STREAM_CONSUMER,
+            {settings.bridge_stream_key: start},
+            count=count,
+        )
+        entries = response[0][1] if response else []
+        if entries:
+            return [(entry_id, _decode(entry_id, fields)) for entry_id, fields in entries]
+    return []
+
+
+def _decode(entry_id: str, fields: dict | None) -> dict[str, Any] | None:
+    """Decode a stream entry's envelope, or None if it is unusable."""
+    try:
+        return json.loads(fields["envelope"])
+    except (TypeError, KeyError, ValueError):
+        logger.warning("Skipping unreadable bridge stream entry %s", entry_id)
+        return None
+
+
+def ack_platform_events(redis: Redis, entry_ids: list[str]) -> None:
+    """Acknowledge and delete processed stream entries."""
+    if entry_ids:
+        redis.xack(settings.bridge_stream_key, STREAM_GROUP, *entry_ids)
+        redis.xdel(settings.bridge_stream_key, *entry_ids)
+
+
+# ---------------------------------------------------------------------------
+# Delivery
+# ---------------------------------------------------------------------------
+
+
+def plan_service_batches(
+    session: Session, envelopes: list[dict[str, Any]]
+) -> dict[ServiceName, list[tuple[dict[str, Any], uuid.UUID]]]:
+    """Group events by destination service for the users' active integrations.
+
+    Args:
+        session: Sync database session.
+        envelopes: Event envelopes in stream order.
+
+    Returns:
+        Dict mapping each service to its ``(envelope, integration_id)``
+        pairs, in stream order.
+    """
+    targeted = [e for e in envelopes if EVENT_SERVICE_MAP.get(e["event"])]
+    if not targeted:
+        return {}
+
+    user_ids = {uuid.UUID(e["user_id"]) for e in targeted}
+    services = {s for e in targeted for s in EVENT_SERVICE_MAP[e["event"]]}
+    integrations = session.execute(
+        select(ServiceIntegration.id, ServiceIntegration.user_id, ServiceIntegration.service_name)
+        .where(
+            ServiceIntegration.user_id.in_(user_ids),
+            ServiceIntegration.is_active.is_(True),
+            ServiceIntegration.service_name.in_(services),
+        )
+    ).all()
+    by_user_service = {(row.user_id, row.service_name): row.id for row in integrations}
+
+    # Stores deleted since the event was published are recorded as None.
+    store_ids = {uuid.UUID(e["store_id"]) for e in targeted if e.get("store_id")}
+    live_stores = set(
+        session.execute(select(Store.id).where(Store.id.in_(store_ids))).scalars()
+    ) if store_ids else set()
+
+    plan: dict[ServiceName, list[tuple[dict[str, Any], uuid.UUID]]] = defaultdict(list)
+    for envelope in targeted:
+        if envelope.get("store_id") and uuid.UUID(envelope["store_id"]) not in live_stores:
+            envelope = {**envelope, "store_id": None}
+        user_id = uuid.UUID(envelope["user_id"])
+        for service in EVENT_SERVICE_MAP[envelope["event"]]:
+            integration_id = by_user_service.get((user_id, service))
+            if integration_id is not None:
+                plan[service].append((envelope, integration_id))
+    return dict(plan)
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    """Split ``items`` into consecutive lists of at most ``size``."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def _post_service(
+    client: httpx.AsyncClient,
+    service: ServiceName,
+    url: str,
+    items: list[tuple[dict[str, Any], uuid.UUID]],
+) -> list[dict[str, Any]]:
+    """POST one service's events chunk by chunk, in order; return delivery rows."""
+    rows: list[dict[str, Any]] = []
+    for chunk in _chunks(items, settings.bridge_max_events_per_post):
+        body = json.dumps({"events": [envelope for envelope, _ in chunk]}, default=str)
+        signature = sign_bridge_payload(body, settings.platform_webhook_secret)
+        headers = {
+            "Content-Type": "application/json",
+            "X-Platform-Signature": f"sha256={signature}",
+            "X-Platform-Event-Count": str(len(chunk)),
+        }
+        response_status = None
+        response_body = None
+        success = False
+        error_message = None
+        start_time = time.monotonic()
+        try:
+            resp = await client.post(
+                url, content=body, headers=headers, timeout=settings.bridge_timeout_seconds
+            )
+            response_status = resp.status_code
+            response_body = resp.text[:1000]
+            success = 200 <= resp.status_code < 300
+            if not success:
+                error_message = f"HTTP {resp.status_code}"
+        except httpx.TimeoutException:
+            error_message = f"Timeout after {settings.bridge_timeout_seconds:g}s"
+            logger.warning("Bridge timeout: service=%s events=%d", service.value, len(chunk))
+        except Exception as exc:
+            error_message = str(exc)[:500]
+            response_body = str(exc)[:1000]
+            logger.warning(
+                "Bridge delivery failed: service=%s events=%d error=%s",
+                service.value, len(chunk), str(exc)[:200],
+            )
+        latency_ms = int((time.monotonic() - start_time) * 1000)
+
+        for envelope, integration_id in chunk:
+            rows.append({
+                "id": uuid.uuid4(),
+                "user_id": uuid.UUID(envelope["user_id"]),
+                "store_id": uuid.UUID(envelope["store_id"]) if envelope.get("store_id") else None,
+                "integration_id": integration_id,
+                "service_name": service,
+                "event": envelope["event"],
+                "resource_id": envelope["resource_id"],
+                "resource_type": envelope["resource_type"],
+                "payload": envelope,
+                "response_status": response_status,
+                "response_body": response_body,
+                "success": success,
+                "error_message": error_message,
+                "latency_ms": latency_ms,
+            })
+    return rows
+
+
+async def _deliver(
+    plan: dict[ServiceName, list[tuple[dict[str, Any], uuid.UUID]]],
+) -> list[dict[str, Any]]:
+    """Send every service's batches in parallel."""
+    client = get_async_http_client()
+    sends = []
+    for service, items in plan.items():
+        url = service_batch_url(service)
+        if not url:
+            logger.warning("No base_url for service %s, skipping", service.value)
+            continue
+        sends.append(_post_service(client, service, url, items))
+    results = await asyncio.gather(*sends)
+    return [row for rows in results for row in rows]
+
+
+def deliver_service_batches(
+    plan: dict[ServiceName, list[tuple[dict[str, Any], uuid.UUID]]],
+) -> list[dict[str, Any]]:
+    """Deliver a plan from ``plan_service_batches`` (sync entry point).
+
+    Args:
+        plan: Per-service ``(envelope, integration_id)`` pairs.
+
+    Returns:
+        One ``BridgeDelivery`` row dict per delivered (event, service).
+    """
+    if not plan:
+        return []
+    return run_async(_deliver(plan))
+
+
+def record_bridge_deliveries(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert delivery rows with one batched statement (not committed)."""
+    if rows:
+        session.execute(insert(BridgeDelivery), rows)
+
+
+def drain_batch_sync(session: Session, redis: Redis) -> dict[str, Any] | None:
+    """Read, deliver, and record one batch of stream entries.
+
+    The caller commits the session and then acknowledges ``entry_ids``
+    with ``ack_platform_events``.
+
+    Args:
+        session: Sync database session (not committed).
+        redis: Sync Redis client.
+
+    Returns:
+        Dict with ``entry_ids``, ``events``, ``deliveries``,
+        ``success_count``, and ``failure_count``, or None if the stream
+        has no entries for the consumer.
+    """
+    entries = read_platform_events(redis)
+    if not entries:
+        return None
+
+    envelopes = [envelope for _, envelope in entries if envelope]
+    rows = deliver_service_batches(plan_service_batches(session, envelopes))
+    record_bridge_deliveries(session, rows)
+    success_count = sum(1 for row in rows if row["success"])
+    return {
+        "entry_ids": [entry_id for entry_id, _ in entries],
+        "events": len(envelopes),
+        "deliveries": len(rows),
+        "success_count": success_count,
+        "failure_count": len(rows) - success_count,
+    }
@@ -1,11 +1,14 @@
 """ServiceBridge helper functions.
 
 Provides HMAC signing for platform event payloads and convenience wrappers
-for firing events via Celery and querying delivery history for the dashboard.
+for firing events onto the ServiceBridge event bus and querying delivery
+history for the dashboard.
 
 **For Developers:**
     ``fire_platform_event`` is the main entry point called from API endpoints.
-    It constructs the Celery task arguments and calls ``.delay()``.
+    It appends the event to the Redis Stream drained in batches by
+    ``bridge_delivery_service``; if Redis is unavailable it falls back to
+    the per-event ``dispatch_platform_event`` Celery task.
     Query functions (``get_recent_activity``, ``get_resource_deliveries``,
     ``get_service_activity``) are used by ``app.api.bridge`` endpoints to
     feed the dashboard UI.
@@ -13,11 +16,12 @@ for firing events via Celery and querying delivery history for the dashboard.
 **For QA Engineers:**
     - ``sign_bridge_payload`` uses HMAC-SHA256 identical to
       ``webhook_service.sign_payload``.
-    - ``fire_platform_event`` is fire-and-forget (async via Celery).
+    - ``fire_platform_event`` is fire-and-forget (delivered in the
+      background by the bridge drain task).
     - Query functions return ``(items, total)`` tuples for pagination.
 
 **For Project Managers:**
-    This module connects the API layer to the Celery bridge task and
+    This module connects the API layer to the bridge event bus and
     provides the data layer for all Service Activity dashboard widgets.
 
 **For End Users:**
@@ -33,6 +37,7 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from redis.exceptions import RedisError
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -70,10 +75,11 @@ def fire_platform_event(
     resource_type: str,
     payload: dict[str, Any],
 ) -> None:
-    """Fire a platform event asynchronously via Celery.
+    """Fire a platform event for asynchronous delivery to services.
 
-    Lazy-imports the Celery task to avoid circular imports and calls
-    ``.delay()`` with all arguments serialized as strings (UUIDs).
+    Publishes the event envelope to the bridge Redis Stream. When Redis
+    is unavailable, lazy-imports the Celery task and calls ``.delay()``
+    with all arguments serialized as strings (UUIDs) instead.
 
     Args:
         user_id: The platform user who triggered the event.
@@ -84,16 +90,29 @@ def fire_platform_event(
             ``"customer"``).
         payload: The event data dict to deliver to services.
     """
-    from app.tasks.bridge_tasks import dispatch_platform_event
-
-    dispatch_platform_event.delay(
-        user_id=str(user_id),
-        store_id=str(store_id) if store_id else None,
-        event=event,
-        resource_id=str(resource_id),
-        resource_type=resource_type,
-        payload=payload,
+    from app.services.bridge_delivery_service import (
+        build_platform_envelope,
+        publish_platform_event,
     )
+
+    try:
+        publish_platform_event(
+            build_platform_envelope(
+                user_id, store_id, event, resource_id, resource_type, payload
+            )
+        )
+    except RedisError as exc:
+        logger.warning("Bridge stream unavailable, dispatching via Celery: %s", exc)
+        from app.tasks.bridge_tasks import dispatch_platform_event
+
+        dispatch_platform_event.delay(
+            user_id=str(user_id),
+            store_id=str(store_id) if store_id else None,
+            event=event,
+            resource_id=str(resource_id),
+            resource_type=resource_type,
+            payload=payload,
+        )
     logger.info(
         "Fired platform event %s for %s %s (user=%s)",
         event, resource_type, resource_id, user_id,
@@ -1,24 +1,36 @@
 """Bulk operations business logic.
 
 Handles batch operations on products including bulk updates, deletes,
-and price adjustments. Operations are executed transactionally with
-per-item error tracking.
+and price adjustments. Operations are executed as set-based statements
+with per-item error tracking.
 
 **For Developers:**
     All bulk functions return a summary dict with ``total``, ``succeeded``,
-    ``failed``, and ``errors`` (list of per-item error details). Each item
-    is processed independently so a failure on one product does not block
-    others. The caller is responsible for committing the transaction.
+    ``failed``, and ``errors`` (list of per-item error details). Products
+    are changed ``BULK_CHUNK_SIZE`` at a time with a single
+    ``UPDATE products ... WHERE id = ANY(:ids) AND store_id = :store_id
+    RETURNING id`` per chunk; ids missing from the returned set are
+    reported as errors (one extra ``SELECT`` per chunk tells "not found"
+    apart from "already archived"). The caller is responsible for
+    committing the transaction.
+
+    Batches larger than ``settings.bulk_job_threshold`` are recorded as a
+    ``BulkJob`` by ``create_bulk_job`` and applied by
+    ``bulk_tasks.run_bulk_job`` through ``apply_bulk_chunk_sync``.
+    ``notify_bulk_change`` sends one ``product.updated`` webhook for the
+    whole batch instead of one per product.
 
 **For QA Engineers:**
     - ``bulk_update_products`` applies the same field updates to all
-      specified products.
+      specified products. Unknown fields and ``id``/``store_id``/timestamps
+      are ignored.
     - ``bulk_delete_products`` performs soft-delete (sets status to
       ``archived``).
     - ``bulk_update_prices`` supports ``"percentage"`` and ``"fixed"``
       adjustment types, and prevents negative prices.
     - All functions verify store ownership before processing.
     - Products not belonging to the store are reported as errors.
+    - Duplicate product ids in a request are processed once.
 
 **For Project Managers:**
     This service powers Feature 26 (Bulk Operations) from the backlog.
@@ -31,40 +43,220 @@ per-item error tracking.
     that are no longer sold.
 """
 
+import enum
 import uuid
+from collections.abc import Iterator
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import ARRAY, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.models.bulk_job import BulkJob, BulkJobStatus
 from app.models.product import Product, ProductStatus
-from app.models.store import Store, StoreStatus
+from app.services.store_access_service import verify_store_ownership
 
+BULK_CHUNK_SIZE = 500
+"""Products changed per UPDATE statement."""
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
+_PROTECTED_COLUMNS = frozenset({"id", "store_id", "created_at", "updated_at"})
 
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
 
-    Returns:
-        The Store ORM instance.
+class BulkOperation(str, enum.Enum):
+    """Kinds of bulk product operation.
+
+    Attributes:
+        update: Apply the same field updates to every product.
+        delete: Soft-delete (archive) every product.
+        price: Adjust every product's price.
+    """
+
+    update = "update"
+    delete = "delete"
+    price = "price"
+
+
+def _validate_adjustment_type(adjustment_type: str) -> None:
+    """Reject price adjustment types other than percentage and fixed.
 
     Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
+        ValueError: If the adjustment_type is not ``"percentage"`` or
+            ``"fixed"``.
     """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+    if adjustment_type not in ("percentage", "fixed"):
+        raise ValueError(
+            f"Invalid adjustment type: '{adjustment_type}'. "
+            f"Must be 'percentage' or 'fixed'."
+        )
+
+
+def _unique_ids(product_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+    """Drop duplicate ids while keeping the request order."""
+    return list(dict.fromkeys(product_ids))
+
+
+def bulk_chunks(product_ids: list[uuid.UUID]) -> Iterator[list[uuid.UUID]]:
+    """Split product ids into ``BULK_CHUNK_SIZE`` slices."""
+    for i in range(0, len(product_ids), BULK_CHUNK_SIZE):
+        yield product_ids[i : i + BULK_CHUNK_SIZE]
+
+
+def _id_matches(ids: list[uuid.UUID]):
+    """``products.id = ANY(:ids)`` with the ids bound as one uuid[] array."""
+    return Product.id == any_(
+        bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True)))
+    )
+
+
+def _update_values(updates: dict) -> dict:
+    """Keep the non-null updates that name a writable product column."""
+    columns = Product.__table__.columns
+    return {
+        key: value
+        for key, value in updates.items()
+        if value is not None and key in columns and key not in _PROTECTED_COLUMNS
+    }
+
+
+def _adjusted_price(adjustment_type: str, adjustment_value: Decimal):
+    """SQL expression for a product's adjusted price.
+
+    The result is clamped to a minimum of 0.01 and rounded to cents.
+    """
+    if adjustment_type == "percentage":
+        multiplier = Decimal("1") + (adjustment_value / Decimal("100"))
+        new_price = Product.price * multiplier
+    else:
+        new_price = Product.price + adjustment_value
+    return func.round(func.greatest(new_price, Decimal("0.01")), 2)
+
+
+def _apply_stmt(
+    operation: BulkOperation, store_id: uuid.UUID, ids: list[uuid.UUID], params: dict
+):
+    """Build the set-based statement applying one chunk of an operation.
+
+    Returns:
+        An ``UPDATE ... RETURNING id`` statement, or None when an update
+        has no applicable fields.
+    """
+    criteria = [_id_matches(ids), Product.store_id == store_id]
+    if operation == BulkOperation.update:
+        values = _update_values(params["updates"])
+        if not values:
+            return None
+    elif operation == BulkOperation.delete:
+        criteria.append(Product.status != ProductStatus.archived)
+        values = {"status": ProductStatus.archived}
+    else:
+        values = {
+            "price": _adjusted_price(
+                params["adjustment_type"], Decimal(str(params["adjustment_value"]))
+            )
+        }
+    return (
+        update(Product)
+        .where(*criteria)
+        .values(**values)
+        .returning(Product.id)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def _existing_stmt(store_id: uuid.UUID, ids: list[uuid.UUID]):
+    """Select which of the ids are products of the store."""
+    return select(Product.id).where(_id_matches(ids), Product.store_id == store_id)
+
+
+def _chunk_errors(
+    ids: list[uuid.UUID], applied: set[uuid.UUID], existing: set[uuid.UUID]
+) -> list[dict]:
+    """Per-id errors for the ids a chunk statement did not return.
+
+    Only archiving skips existing products, so an id that exists but was
+    not applied is an already archived product.
+    """
+    return [
+        {
+            "product_id": str(pid),
+            "error": (
+                "Product is already archived"
+                if pid in existing
+                else "Product not found in this store"
+            ),
+        }
+        for pid in ids
+        if pid not in applied
+    ]
+
+
+async def _apply_chunk(
+    db: AsyncSession,
+    operation: BulkOperation,
+    store_id: uuid.UUID,
+    ids: list[uuid.UUID],
+    params: dict,
+) -> list[dict]:
+    """Apply one chunk of an operation and return its per-id errors."""
+    stmt = _apply_stmt(operation, store_id, ids, params)
+    applied = set() if stmt is None else set((await db.execute(stmt)).scalars())
+    existing: set[uuid.UUID] = set()
+    if len(applied) < len(ids):
+        existing = set((await db.execute(_existing_stmt(store_id, ids))).scalars())
+    if stmt is None:
+        applied = existing
+    return _chunk_errors(ids, applied, existing)
+
+
+def apply_bulk_chunk_sync(
+    session: Session,
+    operation: BulkOperation,
+    store_id: uuid.UUID,
+    ids: list[uuid.UUID],
+    params: dict,
+) -> list[dict]:
+    """Synchronous ``_apply_chunk`` for the bulk job worker.
+
+    Args:
+        session: Sync SQLAlchemy session.
+        operation: The bulk operation.
+        store_id: The store's UUID.
+        ids: One chunk of product UUIDs.
+        params: The job's operation parameters.
+
+    Returns:
+        Per-id error dicts for the products that were not changed.
+    """
+    stmt = _apply_stmt(operation, store_id, ids, params)
+    applied = set() if stmt is None else set(session.execute(stmt).scalars())
+    existing: set[uuid.UUID] = set()
+    if len(applied) < len(ids):
+        existing = set(session.execute(_existing_stmt(store_id, ids)).scalars())
+    if stmt is None:
+        applied = existing
+    return _chunk_errors(ids, applied, existing)
+
+
+async def _run_bulk(
+    db: AsyncSession,
+    operation: BulkOperation,
+    store_id: uuid.UUID,
+    product_ids: list[uuid.UUID],
+    params: dict,
+) -> dict:
+    """Apply an operation chunk by chunk and build the summary dict."""
+    ids = _unique_ids(product_ids)
+    errors: list[dict] = []
+    for chunk in bulk_chunks(ids):
+        errors.extend(await _apply_chunk(db, operation, store_id, chunk, params))
+
+    return {
+        "total": len(ids),
+        "succeeded": len(ids) - len(errors),
+        "failed": len(errors),
+        "errors": errors,
+    }
 
 
 async def bulk_update_products(
@@ -76,8 +268,8 @@ async def bulk_update_products(
 ) -> dict:
     """Apply the same field updates to multiple products.
 
-    Processes each product independently. Products that don't exist or
-    don't belong to the store are reported as errors.
+    Products that don't exist or don't belong to the store are reported
+    as errors.
 
     Args:
         db: Async database session.
@@ -91,44 +283,10 @@ async def bulk_update_products(
         ``failed`` (int), and ``errors`` (list of dicts with ``product_id``
         and ``error`` for each failure).
     """
-    await _verify_store_ownership(db, store_id, user_id)
-
-    succeeded = 0
-    failed = 0
-    errors = []
-
-    for product_id in product_ids:
-        try:
-            result = await db.execute(
-                select(Product).where(
-                    Product.id == product_id,
-                    Product.store_id == store_id,
-                )
-            )
-            product = result.scalar_one_or_none()
-            if product is None:
-                raise ValueError("Product not found in this store")
-
-            for key, value in updates.items():
-                if value is not None and hasattr(product, key):
-                    setattr(product, key, value)
-
-            succeeded += 1
-        except Exception as e:
-            failed += 1
-            errors.append({
-                "product_id": str(product_id),
-                "error": str(e),
-            })
-
-    await db.flush()
-
-    return {
-        "total": len(product_ids),
-        "succeeded": succeeded,
-        "failed": failed,
-        "errors": errors,
-    }
+    await verify_store_ownership(db, store_id, user_id)
+    return await _run_bulk(
+        db, BulkOperation.update, store_id, product_ids, {"updates": updates}
+    )
 
 
 async def bulk_delete_products(
@@ -139,8 +297,8 @@ async def bulk_delete_products(
 ) -> dict:
     """Soft-delete multiple products by setting status to ``archived``.
 
-    Processes each product independently. Products that don't exist or
-    don't belong to the store are reported as errors.
+    Products that don't exist, don't belong to the store, or are already
+    archived are reported as errors.
 
     Args:
         db: Async database session.
@@ -153,44 +311,8 @@ async def bulk_delete_products(
         ``failed`` (int), and ``errors`` (list of dicts with ``product_id``
         and ``error`` for each failure).
     """
-    await _verify_store_ownership(db, store_id, user_id)
-
-    succeeded = 0
-    failed = 0
-    errors = []
-
-    for product_id in product_ids:
-        try:
-            result = await db.execute(
-                select(Product).where(
-                    Product.id == product_id,
-                    Product.store_id == store_id,
-                )
-            )
-            product = result.scalar_one_or_none()
-            if product is None:
-                raise ValueError("Product not found in this store")
-
-            if product.status == ProductStatus.archived:
-                raise ValueError("Product is already archived")
-
-            product.status = ProductStatus.archived
-            succeeded += 1
-        except Exception as e:
-            failed += 1
-            errors.append({
-                "product_id": str(product_id),
-                "error": str(e),
-            })
-
-    await db.flush()
-
-    return {
-        "total": len(product_ids),
-        "succeeded": succeeded,
-        "failed": failed,
-        "errors": errors,
-    }
+    await verify_store_ownership(db, store_id, user_id)
+    return await _run_bulk(db, BulkOperation.delete, store_id, product_ids, {})
 
 
 async def bulk_update_prices(
@@ -230,56 +352,119 @@ async def bulk_update_prices(
         ValueError: If the adjustment_type is not ``"percentage"`` or
             ``"fixed"``.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
+    _validate_adjustment_type(adjustment_type)
+    return await _run_bulk(
+        db,
+        BulkOperation.price,
+        store_id,
+        product_ids,
+        {"adjustment_type": adjustment_type, "adjustment_value": str(adjustment_value)},
+    )
+
+
+async def create_bulk_job(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    operation: BulkOperation,
+    product_ids: list[uuid.UUID],
+    params: dict,
+) -> BulkJob:
+    """Record a pending background bulk job.
 
-    if adjustment_type not in ("percentage", "fixed"):
-        raise ValueError(
-            f"Invalid adjustment type: '{adjustment_type}'. "
-            f"Must be 'percentage' or 'fixed'."
-        )
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        user_id: The requesting user's UUID (for ownership check).
+        operation: The bulk operation to run.
+        product_ids: Product UUIDs to change.
+        params: ``{"updates": ...}`` for updates, or ``adjustment_type``
+            and ``adjustment_value`` for price adjustments.
 
-    succeeded = 0
-    failed = 0
-    errors = []
-
-    for product_id in product_ids:
-        try:
-            result = await db.execute(
-                select(Product).where(
-                    Product.id == product_id,
-                    Product.store_id == store_id,
-                )
-            )
-            product = result.scalar_one_or_none()
-            if product is None:
-                raise ValueError("Product not found in this store")
-
-            if adjustment_type == "percentage":
-                # Calculate percentage adjustment
-                multiplier = Decimal("1") + (adjustment_value / Decimal("100"))
-                new_price = product.price * multiplier
-            else:
-                # Fixed adjustment
-                new_price = product.price + adjustment_value
-
-            # Ensure price doesn't go below minimum
-            new_price = max(new_price, Decimal("0.01"))
-            new_price = new_price.quantize(Decimal("0.01"))
-
-            product.price = new_price
-            succeeded += 1
-        except Exception as e:
-            failed += 1
-            errors.append({
-                "product_id": str(product_id),
-                "error": str(e),
-            })
+    Returns:
+        The new BulkJob (flushed, not committed).
 
+    Raises:
+        ValueError: If the store is not found or the price adjustment
+            type is invalid.
+    """
+    await verify_store_ownership(db, store_id, user_id)
+    if operation == BulkOperation.price:
+        _validate_adjustment_type(params["adjustment_type"])
+        params = {**params, "adjustment_value": str(params["adjustment_value"])}
+
+    ids = _unique_ids(product_ids)
+    job = BulkJob(
+        store_id=store_id,
+        user_id=user_id,
+        operation=operation.value,
+        params=params,
+        product_ids=[str(pid) for pid in ids],
+        status=BulkJobStatus.pending,
+        total=len(ids),
+        processed=0,
+        succeeded=0,
+        failed=0,
+        errors=[],
+    )
+    db.add(job)
     await db.flush()
+    return job
 
-    return {
-        "total": len(product_ids),
-        "succeeded": succeeded,
-        "failed": failed,
-        "errors": errors,
-    }
+
+async def get_bulk_job(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    job_id: uuid.UUID,
+) -> BulkJob:
+    """Fetch a bulk job of a store owned by the user.
+
+    Raises:
+        ValueError: If the store or job is not found.
+    """
+    await verify_store_ownership(db, store_id, user_id)
+    job = await db.scalar(
+        select(BulkJob).where(BulkJob.id == job_id, BulkJob.store_id == store_id)
+    )
+    if job is None:
+        raise ValueError("Bulk job not found")
+    return job
+
+
+def notify_bulk_change(
+    store_id: uuid.UUID,
+    operation: BulkOperation,
+    product_ids: list[uuid.UUID],
+    errors: list[dict],
+) -> None:
+    """Send one ``product.updated`` webhook for a whole bulk operation.
+
+    Call after the transaction has committed. Nothing is sent when no
+    product changed. Also drops the store's cached category tree, whose
+    product counts depend on product status.
+
+    Args:
+        store_id: The store's UUID.
+        operation: The bulk operation that ran.
+        product_ids: The requested product UUIDs.
+        errors: The per-id errors from the operation summary.
+    """
+    failed_ids = {e["product_id"] for e in errors}
+    changed = [str(pid) for pid in _unique_ids(product_ids) if str(pid) not in failed_ids]
+    if not changed:
+        return
+
+    from app.services.category_service import invalidate_category_tree_sync
+    from app.tasks.webhook_tasks import dispatch_webhook_event
+
+    if operation != BulkOperation.price:
+        invalidate_category_tree_sync(store_id)
+
+    dispatch_webhook_event.delay(str(store_id), "product.updated", {
+        "bulk": True,
+        "operation": operation.value,
+        "product_ids": changed,
+        "count": len(changed),
+    })
@@ -5,11 +5,29 @@ including tree building, product assignment, and slug generation.
 
 **For Developers:**
     Categories support self-referential parent-child nesting via
-    ``parent_id``. The ``get_category_tree`` function builds a full
-    hierarchical tree in memory from a flat list. Category slugs are
-    auto-generated from the name and scoped unique within a store.
-    Product-to-category assignment uses the ``product_categories``
-    junction table.
+    ``parent_id``. Category slugs are auto-generated from the name and
+    scoped unique within a store. Product-to-category assignment uses the
+    ``product_categories`` junction table.
+
+    The ``category_closure`` table mirrors ``parent_id`` as one row per
+    ancestor/descendant pair. ``create_category`` links the new category
+    under its parent's ancestors; moving a category (``parent_id`` in
+    ``update_category``) and ``delete_category`` detach the subtree from
+    its old ancestors with one ``DELETE`` and re-attach it with one
+    ``INSERT ... SELECT``. A subtree is therefore one indexed lookup:
+    ``get_products_by_category(include_subcategories=True)`` lists it with
+    a single semi-join, and the product counts of every node come from one
+    grouped query.
+
+    ``get_category_tree`` serves the store's active categories, nested,
+    with recursive ``product_count`` per node, from a Redis cache
+    (``category-tree:<store_id>``). Category CRUD, product assignment,
+    and product status changes (``product_service``, bulk operations)
+    call ``invalidate_category_tree``, which drops the cached tree once the
+    writing transaction commits (``database.on_commit``), so a concurrent
+    reader cannot re-cache the old rows. The cache also expires after
+    ``settings.category_tree_cache_ttl_seconds``. Without Redis the tree
+    is built on every call.
 
 **For QA Engineers:**
     - ``create_category`` generates a slug unique within the store.
@@ -18,7 +36,13 @@ including tree building, product assignment, and slug generation.
     - ``delete_category`` is a hard delete; child categories are orphaned
       (their ``parent_id`` becomes NULL via ON DELETE SET NULL).
     - ``assign_products_to_category`` is idempotent (skips duplicates).
-    - ``get_products_by_category`` only returns active products.
+    - ``get_products_by_category`` only returns active products; with
+      ``include_subcategories`` it also returns products of active
+      subcategories, each product once.
+    - Moving a category under itself or one of its subcategories is
+      rejected.
+    - Tree ``product_count`` counts distinct active products in the node
+      and its active subcategories.
 
 **For Project Managers:**
     This service powers Feature 9 (Categories & Navigation) from the
@@ -31,41 +55,25 @@ including tree building, product assignment, and slug generation.
     and assign products to multiple categories.
 """
 
+import json
+import logging
 import uuid
 
-from sqlalchemy import func, select
+from redis.exceptions import RedisError
+from sqlalchemy import delete, distinct, func, insert, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.models.category import Category, ProductCategory
+from app.config import settings
+from app.database import on_commit
+from app.models.category import Category, CategoryClosure, ProductCategory
 from app.models.product import Product, ProductStatus
-from app.models.store import Store, StoreStatus
+from app.redis_client import get_redis, get_sync_redis
+from app.services.checkout_rules_service import invalidate_store_rules
 from app.utils.slug import slugify
+from app.services.store_access_service import verify_store_ownership
 
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+logger = logging.getLogger(__name__)
 
 
 async def _generate_category_slug(
@@ -104,6 +112,171 @@ async def _generate_category_slug(
         counter += 1
 
 
+# ---------------------------------------------------------------------------
+# Closure table maintenance
+# ---------------------------------------------------------------------------
+
+
+async def _attach_subtree(
+    db: AsyncSession, category_id: uuid.UUID, parent_id: uuid.UUID
+) -> None:
+    """Link a category's subtree below the parent and all its ancestors."""
+    above = aliased(CategoryClosure)
+    below = aliased(CategoryClosure)
+    await db.execute(
+        insert(CategoryClosure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(above.ancestor_id, below.descendant_id, above.depth + below.depth + 1)
+            .join(below, true())
+            .where(above.descendant_id == parent_id, below.ancestor_id == category_id),
+        )
+    )
+
+
+async def _detach_subtree(db: AsyncSession, category_id: uuid.UUID) -> None:
+    """Unlink a category's subtree from the category's ancestors."""
+    subtree = select(CategoryClosure.descendant_id).where(
+        CategoryClosure.ancestor_id == category_id
+    )
+    await db.execute(
+        delete(CategoryClosure)
+        .where(
+            CategoryClosure.descendant_id.in_(subtree),
+            CategoryClosure.ancestor_id.not_in(subtree),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _is_in_subtree(
+    db: AsyncSession, category_id: uuid.UUID, candidate_id: uuid.UUID
+) -> bool:
+    """Whether ``candidate_id`` is the category or one of its descendants."""
+    result = await db.execute(
+        select(CategoryClosure.depth).where(
+            CategoryClosure.ancestor_id == category_id,
+            CategoryClosure.descendant_id == candidate_id,
+        )
+    )
+    return result.scalar_one_or_none() is not None
+
+
+# ---------------------------------------------------------------------------
+# Tree cache
+# ---------------------------------------------------------------------------
+
+
+def _tree_key(store_id: uuid.UUID) -> str:
+    """Redis key holding a store's serialized category tree."""
+    return f"category-tree:{store_id}"
+
+
+async def _build_tree(db: AsyncSession, store_id: uuid.UUID) -> list[dict]:
+    """Load the active categories and their subtree product counts.
+
+    Returns:
+        Root nodes with string IDs, ready for JSON.
+    """
+    categories = (
+        await db.execute(
+            select(
+                Category.id,
+                Category.name,
+                Category.slug,
+                Category.description,
+                Category.image_url,
+                Category.parent_id,
+                Category.position,
+            )
+            .where(Category.store_id == store_id, Category.is_active.is_(True))
+            .order_by(Category.position, Category.name)
+        )
+    ).all()
+
+    descendant = aliased(Category)
+    counts = dict(
+        (
+            await db.execute(
+                select(
+                    CategoryClosure.ancestor_id,
+                    func.count(distinct(ProductCategory.product_id)),
+                )
+                .join(descendant, descendant.id == CategoryClosure.descendant_id)
+                .join(ProductCategory, ProductCategory.category_id == CategoryClosure.descendant_id)
+                .join(Product, Product.id == ProductCategory.product_id)
+                .where(
+                    descendant.store_id == store_id,
+                    descendant.is_active.is_(True),
+                    Product.store_id == store_id,
+                    Product.status == ProductStatus.active,
+                )
+                .group_by(CategoryClosure.ancestor_id)
+            )
+        ).all()
+    )
+
+    lookup: dict[uuid.UUID, dict] = {}
+    for cat in categories:
+        lookup[cat.id] = {
+            "id": str(cat.id),
+            "name": cat.name,
+            "slug": cat.slug,
+            "description": cat.description,
+            "image_url": cat.image_url,
+            "parent_id": str(cat.parent_id) if cat.parent_id else None,
+            "position": cat.position,
+            "product_count": counts.get(cat.id, 0),
+            "children": [],
+        }
+
+    roots: list[dict] = []
+    for cat in categories:
+        node = lookup[cat.id]
+        if cat.parent_id is not None and cat.parent_id in lookup:
+            lookup[cat.parent_id]["children"].append(node)
+        else:
+            roots.append(node)
+    return roots
+
+
+def _load_tree(raw: str) -> list[dict]:
+    """Deserialize a cached tree, restoring UUID fields."""
+
+    def restore(node: dict) -> dict:
+        node["id"] = uuid.UUID(node["id"])
+        if node["parent_id"] is not None:
+            node["parent_id"] = uuid.UUID(node["parent_id"])
+        for child in node["children"]:
+            restore(child)
+        return node
+
+    return [restore(node) for node in json.loads(raw)]
+
+
+def invalidate_category_tree(db: AsyncSession, store_id: uuid.UUID) -> None:
+    """Drop a store's cached category tree once ``db`` commits.
+
+    Args:
+        db: The session making the change.
+        store_id: The store whose categories, assignments, or product
+            statuses changed.
+    """
+    on_commit(db, lambda: invalidate_category_tree_sync(store_id))
+
+
+def invalidate_category_tree_sync(store_id: uuid.UUID) -> None:
+    """Drop a store's cached category tree now (after the change committed)."""
+    try:
+        get_sync_redis().delete(_tree_key(store_id))
+    except RedisError as exc:
+        logger.warning("Category tree invalidation failed: store=%s error=%s", store_id, exc)
+
+
+# ---------------------------------------------------------------------------
+# CRUD
+# ---------------------------------------------------------------------------
+
+
 async def create_category(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -137,7 +310,7 @@ async def create_category(
         ValueError: If the store doesn't exist, belongs to another user,
             or the parent category doesn't exist.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if parent_id is not None:
         parent_result = await db.execute(
@@ -162,7 +335,15 @@ async def create_category(
     )
     db.add(category)
     await db.flush()
+    await db.execute(
+        insert(CategoryClosure).values(
+            ancestor_id=category.id, descendant_id=category.id, depth=0
+        )
+    )
+    if parent_id is not None:
+        await _attach_subtree(db, category.id, parent_id)
     await db.refresh(category)
+    invalidate_category_tree(db, store_id)
     return category
 
 
@@ -260,7 +441,8 @@ async def update_category(
     """Update a category's fields (partial update).
 
     Regenerates the slug if the name changes. Only provided (non-None)
-    keyword arguments are applied.
+    keyword arguments are applied. A new ``parent_id`` moves the category
+    with its whole subtree.
 
     Args:
         db: Async database session.
@@ -274,12 +456,23 @@ async def update_category(
         The updated Category ORM instance.
 
     Raises:
-        ValueError: If the store or category doesn't exist, or the store
-            belongs to another user.
+        ValueError: If the store, category, or new parent doesn't exist,
+            the store belongs to another user, or the new parent is the
+            category itself or one of its subcategories.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
     category = await get_category(db, store_id, category_id)
 
+    new_parent_id = kwargs.get("parent_id")
+    moved = new_parent_id is not None and new_parent_id != category.parent_id
+    if moved:
+        await get_category(db, store_id, new_parent_id)
+        if await _is_in_subtree(db, category.id, new_parent_id):
+            raise ValueError(
+                "Circular category hierarchy: a category cannot be moved "
+                "under itself or one of its subcategories"
+            )
+
     for key, value in kwargs.items():
         if value is not None:
             setattr(category, key, value)
@@ -291,7 +484,11 @@ async def update_category(
         )
 
     await db.flush()
+    if moved:
+        await _detach_subtree(db, category.id)
+        await _attach_subtree(db, category.id, new_parent_id)
     await db.refresh(category)
+    invalidate_category_tree(db, store_id)
     return category
 
 
@@ -304,8 +501,8 @@ async def delete_category(
     """Permanently delete a category.
 
     Child categories will have their ``parent_id`` set to NULL (orphaned)
-    via the ON DELETE SET NULL foreign key constraint. Product-category
-    links are cascade-deleted.
+    via the ON DELETE SET NULL foreign key constraint, and their subtrees
+    become separate trees. Product-category links are cascade-deleted.
 
     Args:
         db: Async database session.
@@ -317,60 +514,64 @@ async def delete_category(
         ValueError: If the store or category doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
     category = await get_category(db, store_id, category_id)
+    await _detach_subtree(db, category.id)
     await db.delete(category)
     await db.flush()
+    invalidate_store_rules(db, store_id)
+    invalidate_category_tree(db, store_id)
 
 
 async def get_category_tree(
     db: AsyncSession,
     store_id: uuid.UUID,
 ) -> list[dict]:
-    """Build a hierarchical category tree for a store.
+    """Get a store's hierarchical category tree.
 
-    Fetches all active categories for the store and assembles them into
-    a nested tree structure in memory. Each node is a dict containing
-    the category's fields and a ``children`` list of child nodes.
+    Serves the tree from the Redis cache, building it with two queries on
+    a miss. Each node is a dict containing the category's fields, its
+    recursive ``product_count``, and a ``children`` list of child nodes.
 
     Args:
-        db: Async database session.
+        db: Async database session (used only to build the tree).
         store_id: The store's UUID.
 
     Returns:
         A list of root-level category dicts, each with nested ``children``.
     """
-    result = await db.execute(
-        select(Category).where(
-            Category.store_id == store_id,
-            Category.is_active.is_(True),
-        ).order_by(Category.position, Category.name)
-    )
-    categories = list(result.scalars().all())
+    key = _tree_key(store_id)
+    try:
+        raw = await get_redis().get(key)
+    except RedisError as exc:
+        logger.warning("Category tree cache unavailable: %s", exc)
+        return _load_tree(json.dumps(await _build_tree(db, store_id)))
 
-    # Build lookup and tree
-    lookup: dict[uuid.UUID, dict] = {}
-    for cat in categories:
-        lookup[cat.id] = {
-            "id": cat.id,
-            "name": cat.name,
-            "slug": cat.slug,
-            "description": cat.description,
-            "image_url": cat.image_url,
-            "parent_id": cat.parent_id,
-            "position": cat.position,
-            "children": [],
-        }
+    if raw is None:
+        raw = json.dumps(await _build_tree(db, store_id))
+        try:
+            await get_redis().set(key, raw, ex=settings.category_tree_cache_ttl_seconds)
+        except RedisError as exc:
+            logger.warning("Category tree not cached: store=%s error=%s", store_id, exc)
+    return _load_tree(raw)
 
-    roots: list[dict] = []
-    for cat_id, node in lookup.items():
-        parent_id = node["parent_id"]
-        if parent_id is not None and parent_id in lookup:
-            lookup[parent_id]["children"].append(node)
-        else:
-            roots.append(node)
 
-    return roots
+def flatten_category_tree(nodes: list[dict]) -> list[dict]:
+    """List every node of a tree, parents before their children.
+
+    Args:
+        nodes: Root nodes as returned by ``get_category_tree``.
+
+    Returns:
+        The nodes (children lists included) in depth-first order.
+    """
+    flat: list[dict] = []
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        flat.append(node)
+        stack.extend(reversed(node["children"]))
+    return flat
 
 
 async def assign_products_to_category(
@@ -396,7 +597,7 @@ async def assign_products_to_category(
         ValueError: If the store or category doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
     await get_category(db, store_id, category_id)
 
     for pid in product_ids:
@@ -411,6 +612,8 @@ async def assign_products_to_category(
             db.add(ProductCategory(product_id=pid, category_id=category_id))
 
     await db.flush()
+    invalidate_store_rules(db, store_id)
+    invalidate_category_tree(db, store_id)
 
 
 async def remove_product_from_category(
@@ -433,7 +636,7 @@ async def remove_product_from_category(
         ValueError: If the store or category doesn't exist, the store
             belongs to another user, or the product is not in the category.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
     await get_category(db, store_id, category_id)
 
     result = await db.execute(
@@ -448,6 +651,8 @@ async def remove_product_from_category(
 
     await db.delete(link)
     await db.flush()
+    invalidate_store_rules(db, store_id)
+    invalidate_category_tree(db, store_id)
 
 
 async def get_products_by_category(
@@ -456,6 +661,7 @@ async def get_products_by_category(
     category_id: uuid.UUID,
     page: int = 1,
     per_page: int = 20,
+    include_subcategories: bool = False,
 ) -> tuple[list[Product], int]:
     """Get active products belonging to a specific category.
 
@@ -468,6 +674,8 @@ async def get_products_by_category(
         category_id: The UUID of the category.
         page: Page number (1-based).
         per_page: Number of items per page.
+        include_subcategories: Also return products of the category's
+            active subcategories at any depth (each product once).
 
     Returns:
         A tuple of (products list, total count).
@@ -477,32 +685,38 @@ async def get_products_by_category(
     """
     await get_category(db, store_id, category_id)
 
-    query = (
-        select(Product)
-        .join(ProductCategory, ProductCategory.product_id == Product.id)
-        .where(
-            ProductCategory.category_id == category_id,
-            Product.store_id == store_id,
-            Product.status == ProductStatus.active,
+    if include_subcategories:
+        descendant = aliased(Category)
+        member_ids = (
+            select(ProductCategory.product_id)
+            .join(CategoryClosure, CategoryClosure.descendant_id == ProductCategory.category_id)
+            .join(descendant, descendant.id == CategoryClosure.descendant_id)
+            .where(
+                CategoryClosure.ancestor_id == category_id,
+                or_(CategoryClosure.depth == 0, descendant.is_active.is_(True)),
+            )
         )
-    )
-    count_query = (
-        select(func.count(Product.id))
-        .join(ProductCategory, ProductCategory.product_id == Product.id)
-        .where(
-            ProductCategory.category_id == category_id,
-            Product.store_id == store_id,
-            Product.status == ProductStatus.active,
+    else:
+        member_ids = select(ProductCategory.product_id).where(
+            ProductCategory.category_id == category_id
         )
+    criteria = (
+        Product.id.in_(member_ids),
+        Product.store_id == store_id,
+        Product.status == ProductStatus.active,
     )
 
-    total_result = await db.execute(count_query)
+    total_result = await db.execute(select(func.count(Product.id)).where(*criteria))
     total = total_result.scalar_one()
 
     offset = (page - 1) * per_page
-    query = query.order_by(Product.created_at.desc()).offset(offset).limit(per_page)
-
-    result = await db.execute(query)
+    result = await db.execute(
+        select(Product)
+        .where(*criteria)
+        .order_by(Product.created_at.desc())
+        .offset(offset)
+        .limit(per_page)
+    )
     products = list(result.scalars().all())
 
     return products, total
@@ -0,0 +1,293 @@
+"""Per-store compiled tax and discount rules for checkout.
+
+Cart validation and checkout ask the same questions over and over: which
+tax rates apply to this address, and does this coupon code apply to this
+cart. The answers depend on rules store owners rarely change, so each
+API process compiles a store's rules once and answers from memory until
+they change.
+
+**For Developers:**
+    - ``get_store_rules`` returns the store's ``StoreRules``: active tax
+      rates indexed by ``(country, state, zip_code)`` and every discount
+      keyed by code, with its targeted product IDs precomputed (for
+      category discounts, the products in the targeted categories).
+      Compiling takes four queries per store.
+    - Every write that can change an answer calls
+      ``invalidate_store_rules``: tax rate and discount CRUD and category
+      membership changes (cloned stores are new IDs, so nothing is cached
+      for them yet). Once the writing transaction commits
+      (``database.on_commit``), it drops the local entry and bumps the
+      store's version key in Redis, which the other API processes compare
+      on each lookup (one ``GET``). Bumping only after the commit means a
+      lookup in between cannot compile the old rules under the new
+      version. Entries also expire after
+      ``settings.checkout_rules_cache_ttl_seconds``; if Redis is down,
+      they are used until then.
+    - ``times_used`` is not cached: it changes with every order. Codes
+      with a ``max_uses`` cap read it with a primary-key lookup.
+    - At most ``settings.checkout_rules_cache_max_stores`` stores are
+      kept per process; the least recently used are dropped.
+
+**For QA Engineers:**
+    - Tax and discount answers are identical to the uncached queries.
+    - Edits to tax rates, discounts, or category membership take effect
+      on the next request in every process.
+
+**For Project Managers:**
+    Checkout tax estimates and coupon checks no longer hit the database
+    for every keystroke in the storefront.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import on_commit
+from app.models.category import ProductCategory
+from app.models.discount import (
+    AppliesTo,
+    Discount,
+    DiscountCategory,
+    DiscountProduct,
+    DiscountStatus,
+    DiscountType,
+)
+from app.models.tax import TaxRate
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledTaxRate:
+    """An active tax rate, detached from the session."""
+
+    id: uuid.UUID
+    name: str
+    rate: Decimal
+    is_inclusive: bool
+    priority: int
+
+
+@dataclass(frozen=True)
+class CompiledDiscount:
+    """A discount with its targeting resolved to product IDs.
+
+    Attributes:
+        target_product_ids: Products the discount applies to. For
+            ``specific_products`` the linked products; for
+            ``specific_categories`` the products currently in the linked
+            categories; empty for ``all``.
+    """
+
+    id: uuid.UUID
+    code: str
+    discount_type: DiscountType
+    value: Decimal
+    status: DiscountStatus
+    applies_to: AppliesTo
+    minimum_order_amount: Decimal | None
+    max_uses: int | None
+    starts_at: datetime | None
+    expires_at: datetime | None
+    target_product_ids: frozenset[uuid.UUID] = frozenset()
+
+    def targets_any(self, product_ids: list[uuid.UUID]) -> bool:
+        """Whether any of the cart's products is targeted."""
+        return not self.target_product_ids.isdisjoint(product_ids)
+
+
+@dataclass
+class StoreRules:
+    """All checkout rules of one store.
+
+    Attributes:
+        tax_rates: Active tax rates keyed by ``(country, state, zip_code)``,
+            each list sorted by priority.
+        discounts: Discounts keyed by uppercase code.
+        version: Redis version the rules were compiled at (None without
+            Redis).
+        compiled_at: ``time.monotonic()`` at compile time.
+    """
+
+    tax_rates: dict[tuple[str, str | None, str | None], list[CompiledTaxRate]] = field(
+        default_factory=dict
+    )
+    discounts: dict[str, CompiledDiscount] = field(default_factory=dict)
+    version: str | None = None
+    compiled_at: float = 0.0
+
+    def match_tax_rates(
+        self, country: str, state: str | None, zip_code: str | None
+    ) -> list[CompiledTaxRate]:
+        """Active rates for an address, in application order.
+
+        A rate matches when its country is the address's country and its
+        state and zip code are either unset or equal to the address's.
+        """
+        country = country.upper()
+        state = state.upper() if state else None
+        states = [None, state] if state else [None]
+        zips = [None, zip_code] if zip_code else [None]
+        matched = [
+            rate
+            for s in states
+            for z in zips
+            for rate in self.tax_rates.get((country, s, z), ())
+        ]
+        return sorted(matched, key=lambda r: (r.priority, r.name, r.id))
+
+
+# Per-process cache: store_id -> StoreRules, least recently used first.
+_cache: "OrderedDict[uuid.UUID, StoreRules]" = OrderedDict()
+
+
+def _version_key(store_id: uuid.UUID) -> str:
+    """Redis key holding a store's checkout rules version."""
+    return f"checkout-rules:version:{store_id}"
+
+
+async def _current_version(store_id: uuid.UUID) -> str:
+    """Read the store's rules version; raises ``RedisError`` if unavailable."""
+    return await get_redis().get(_version_key(store_id)) or "0"
+
+
+async def _compile(db: AsyncSession, store_id: uuid.UUID) -> StoreRules:
+    """Load and compile a store's tax and discount rules."""
+    rules = StoreRules()
+    tax_rows = (
+        await db.execute(
+            select(TaxRate).where(TaxRate.store_id == store_id, TaxRate.is_active.is_(True))
+        )
+    ).scalars().all()
+    grouped: dict[tuple, list[CompiledTaxRate]] = defaultdict(list)
+    for row in tax_rows:
+        grouped[(row.country, row.state, row.zip_code)].append(
+            CompiledTaxRate(
+                id=row.id,
+                name=row.name,
+                rate=row.rate,
+                is_inclusive=row.is_inclusive,
+                priority=row.priority,
+            )
+        )
+    rules.tax_rates = {
+        key: sorted(rates, key=lambda r: (r.priority, r.name, r.id))
+        for key, rates in grouped.items()
+    }
+
+    discounts = (
+        await db.execute(select(Discount).where(Discount.store_id == store_id))
+    ).scalars().all()
+    targets: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
+    product_links = await db.execute(
+        select(DiscountProduct.discount_id, DiscountProduct.product_id)
+        .join(Discount, Discount.id == DiscountProduct.discount_id)
+        .where(
+            Discount.store_id == store_id,
+            Discount.applies_to == AppliesTo.specific_products,
+        )
+    )
+    category_links = await db.execute(
+        select(DiscountCategory.discount_id, ProductCategory.product_id)
+        .join(Discount, Discount.id == DiscountCategory.discount_id)
+        .join(ProductCategory, ProductCategory.category_id == DiscountCategory.category_id)
+        .where(
+            Discount.store_id == store_id,
+            Discount.applies_to == AppliesTo.specific_categories,
+        )
+    )
+    for discount_id, product_id in [*product_links.all(), *category_links.all()]:
+        targets[discount_id].add(product_id)
+
+    rules.discounts = {
+        d.code: CompiledDiscount(
+            id=d.id,
+            code=d.code,
+            discount_type=d.discount_type,
+            value=d.value,
+            status=d.status,
+            applies_to=d.applies_to,
+            minimum_order_amount=d.minimum_order_amount,
+            max_uses=d.max_uses,
+            starts_at=d.starts_at,
+            expires_at=d.expires_at,
+            target_product_ids=frozenset(targets.get(d.id, ())),
+        )
+        for d in discounts
+    }
+    return rules
+
+
+async def get_store_rules(db: AsyncSession, store_id: uuid.UUID) -> StoreRules:
+    """Get a store's compiled checkout rules, compiling them if needed.
+
+    Args:
+        db: Async database session (used only to compile).
+        store_id: The store's UUID.
+
+    Returns:
+        The store's ``StoreRules``.
+    """
+    cached = _cache.get(store_id)
+    fresh = (
+        cached is not None
+        and time.monotonic() - cached.compiled_at < settings.checkout_rules_cache_ttl_seconds
+    )
+    try:
+        version = await _current_version(store_id)
+    except RedisError as exc:
+        logger.warning("Checkout rules version unavailable, using TTL only: %s", exc)
+        version = None
+        if fresh:
+            _cache.move_to_end(store_id)
+            return cached
+    else:
+        if fresh and cached.version == version:
+            _cache.move_to_end(store_id)
+            return cached
+
+    rules = await _compile(db, store_id)
+    rules.version = version
+    rules.compiled_at = time.monotonic()
+    _cache[store_id] = rules
+    _cache.move_to_end(store_id)
+    while len(_cache) > settings.checkout_rules_cache_max_stores:
+        _cache.popitem(last=False)
+    return rules
+
+
+def _forget_rules(store_id: uuid.UUID) -> None:
+    """Drop a store's rules from this process and bump their version."""
+    _cache.pop(store_id, None)
+    try:
+        get_sync_redis().incr(_version_key(store_id))
+    except RedisError as exc:
+        logger.warning(
+            "Checkout rules invalidation not broadcast: store=%s error=%s", store_id, exc
+        )
+
+
+def invalidate_store_rules(db: AsyncSession, store_id: uuid.UUID) -> None:
+    """Make every process recompile a store's rules once ``db`` commits.
+
+    Args:
+        db: The session making the change.
+        store_id: The store whose tax rates, discounts, or category
+            membership changed.
+    """
+    on_commit(db, lambda: _forget_rules(store_id))
+
+
+def clear_rules_cache() -> None:
+    """Drop this process's compiled rules (all stores)."""
+    _cache.clear()
@@ -5,10 +5,21 @@ themes, discounts, categories, tax rules, and suppliers.
 
 **For Developers:**
     ``clone_store()`` is the main entry point. It creates a new store
-    record and copies all child entities using dedicated ``_clone_*``
-    helper functions. Each helper remaps UUIDs so cloned records have
-    fresh identifiers. Junction tables (product-category, product-supplier,
-    discount-product, discount-category) are re-linked using ID maps.
+    record and copies all child entities server-side with ``INSERT ...
+    SELECT`` statements, so no source rows are loaded into Python. Fresh
+    ids for categories, products, suppliers, and discounts are generated
+    up front into the ``clone_id_map`` temp table (``kind``, ``old_id``,
+    ``new_id``), and every copy joins through it to remap foreign keys,
+    including category parents, the category closure table, and the
+    junction tables (product-category, product-supplier, discount-product,
+    discount-category).
+
+    ``clone_steps()`` returns the ordered statement groups; the inline
+    path and the ``clone_tasks.clone_store_contents`` worker (via
+    ``clone_store_contents_sync``) run the same steps. Sources with more
+    than ``settings.clone_job_threshold`` products are cloned in the
+    background: ``start_clone_job`` creates the paused target store and a
+    ``StoreCloneJob`` that records progress per step.
 
 **For QA Engineers:**
     - Cloned stores get a slug like ``{original}-copy``, ``{original}-copy-2``.
@@ -17,6 +28,7 @@ themes, discounts, categories, tax rules, and suppliers.
     - Discount codes are suffixed with ``-copy`` to avoid cross-store confusion.
     - The ``is_active`` theme flag is preserved so the same theme is active.
     - Category hierarchies (parent-child) are preserved using ID remapping.
+    - Background clones keep the new store ``paused`` until they complete.
 
 **For End Users:**
     Clone an existing store to quickly create a copy with all your
@@ -25,59 +37,307 @@ themes, discounts, categories, tax rules, and suppliers.
 """
 
 import uuid
-from datetime import datetime, timezone
-
-from sqlalchemy import select
+from collections.abc import Callable
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    and_,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable, DropTable
 
-from app.models.category import Category, ProductCategory
+from app.config import settings
+from app.models.category import Category, CategoryClosure, ProductCategory
 from app.models.discount import (
     Discount,
     DiscountCategory,
     DiscountProduct,
     DiscountStatus,
 )
-from app.models.product import Product, ProductVariant
+from app.models.product import Product, ProductStatus, ProductVariant
 from app.models.store import Store, StoreStatus
+from app.models.store_clone_job import CloneJobStatus, StoreCloneJob
 from app.models.supplier import ProductSupplier, Supplier
 from app.models.tax import TaxRate
 from app.models.theme import StoreTheme
+from app.services.storefront_routing_service import publish_store_route
 from app.utils.slug import generate_unique_slug
 
+# Transaction-scoped old-id -> new-id map. Kept out of ``Base.metadata``
+# so ``create_all`` and Alembic never see it.
+_id_map = Table(
+    "clone_id_map",
+    MetaData(),
+    Column("kind", String(20), primary_key=True),
+    Column("old_id", UUID(as_uuid=True), primary_key=True),
+    Column("new_id", UUID(as_uuid=True), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
 
-async def clone_store(
-    db: AsyncSession,
-    user_id: uuid.UUID,
-    source_store_id: uuid.UUID,
-    new_name: str | None = None,
-) -> Store:
-    """Clone a store with all products, variants, themes, discounts, and more.
 
-    Creates a new store record owned by the same user, then copies all child
-    entities. Orders, reviews, analytics, customer data, webhooks, and teams
-    are NOT cloned.
+def _map_ids(kind: str, id_column, *criteria):
+    """Generate a fresh id into the id map for every matching source row."""
+    return insert(_id_map).from_select(
+        ["kind", "old_id", "new_id"],
+        select(literal(kind), id_column, func.gen_random_uuid()).where(*criteria),
+    )
+
+
+def _mapped(kind: str, name: str, old_id):
+    """Alias of the id map joined on ``old_id`` for one kind of row.
+
+    Returns:
+        A tuple of (alias, join condition).
+    """
+    alias = _id_map.alias(name)
+    return alias, and_(alias.c.kind == kind, alias.c.old_id == old_id)
+
+
+def _copy(model, columns: list[str], query):
+    """``INSERT INTO <model> (columns) <query>``."""
+    return insert(model.__table__).from_select(columns, query)
+
+
+def clone_steps(
+    source_store_id: uuid.UUID, target_store_id: uuid.UUID
+) -> list[tuple[str, list]]:
+    """Build the ordered statement groups that copy a store's contents.
+
+    Every inserted row gets its id from the id map or from
+    ``gen_random_uuid()`` in the select list; Python-side defaults would
+    be evaluated once per statement, not once per row.
 
     Args:
-        db: Async database session.
-        user_id: UUID of the user performing the clone (must own the source store).
-        source_store_id: UUID of the store to clone.
-        new_name: Optional name override. Defaults to ``{original_name} (Copy)``.
+        source_store_id: ID of the source store.
+        target_store_id: ID of the target (cloned) store.
 
     Returns:
-        The newly created Store ORM instance with all cloned child records.
+        A list of ``(step_name, statements)`` pairs to execute in order
+        within one transaction.
+    """
+    target = literal(target_store_id, UUID(as_uuid=True))
+
+    c = Category.__table__
+    cl = CategoryClosure.__table__
+    p = Product.__table__
+    v = ProductVariant.__table__
+    s = Supplier.__table__
+    pc = ProductCategory.__table__
+    ps = ProductSupplier.__table__
+    t = StoreTheme.__table__
+    d = Discount.__table__
+    dp = DiscountProduct.__table__
+    dc = DiscountCategory.__table__
+    tr = TaxRate.__table__
+
+    id_map_step = [
+        CreateTable(_id_map),
+        _map_ids("category", c.c.id, c.c.store_id == source_store_id),
+        _map_ids(
+            "product",
+            p.c.id,
+            p.c.store_id == source_store_id,
+            p.c.status != ProductStatus.archived,
+        ),
+        _map_ids("supplier", s.c.id, s.c.store_id == source_store_id),
+        _map_ids(
+            "discount",
+            d.c.id,
+            d.c.store_id == source_store_id,
+            d.c.status != DiscountStatus.expired,
+            or_(d.c.expires_at.is_(None), d.c.expires_at >= func.now()),
+        ),
+        text("ANALYZE clone_id_map"),
+    ]
+
+    cat, cat_on = _mapped("category", "cat", c.c.id)
+    parent, parent_on = _mapped("category", "parent", c.c.parent_id)
+    categories = _copy(
+        Category,
+        ["id", "store_id", "name", "slug", "description", "image_url",
+         "parent_id", "position", "is_active"],
+        select(
+            cat.c.new_id, target, c.c.name, c.c.slug, c.c.description,
+            c.c.image_url, parent.c.new_id, c.c.position, c.c.is_active,
+        ).select_from(c.join(cat, cat_on).outerjoin(parent, parent_on)),
+    )
+    anc, anc_on = _mapped("category", "anc", cl.c.ancestor_id)
+    desc, desc_on = _mapped("category", "desc", cl.c.descendant_id)
+    category_closure = _copy(
+        CategoryClosure,
+        ["ancestor_id", "descendant_id", "depth"],
+        select(anc.c.new_id, desc.c.new_id, cl.c.depth)
+        .select_from(cl.join(anc, anc_on).join(desc, desc_on)),
+    )
+
+    prod, prod_on = _mapped("product", "prod", p.c.id)
+    products = _copy(
+        Product,
+        ["id", "store_id", "title", "slug", "description", "price",
+         "compare_at_price", "cost", "images", "status", "tags", "seo_title",
+         "seo_description", "avg_rating", "review_count"],
+        select(
+            prod.c.new_id, target, p.c.title, p.c.slug, p.c.description,
+            p.c.price, p.c.compare_at_price, p.c.cost, p.c.images, p.c.status,
+            p.c.tags, p.c.seo_title, p.c.seo_description, literal(None), literal(0),
+        ).select_from(p.join(prod, prod_on)),
+    )
+
+    vprod, vprod_on = _mapped("product", "vprod", v.c.product_id)
+    variants = _copy(
+        ProductVariant,
+        ["id", "product_id", "name", "sku", "barcode", "price", "inventory_count",
+         "weight", "weight_unit", "track_inventory", "allow_backorder"],
+        select(
+            func.gen_random_uuid(), vprod.c.new_id, v.c.name, v.c.sku, v.c.barcode,
+            v.c.price, v.c.inventory_count, v.c.weight, v.c.weight_unit,
+            v.c.track_inventory, v.c.allow_backorder,
+        ).select_from(v.join(vprod, vprod_on)),
+    )
+
+    sup, sup_on = _mapped("supplier", "sup", s.c.id)
+    suppliers = _copy(
+        Supplier,
+        ["id", "store_id", "name", "website", "contact_email", "contact_phone",
+         "notes", "status", "reliability_score", "avg_shipping_days"],
+        select(
+            sup.c.new_id, target, s.c.name, s.c.website, s.c.contact_email,
+            s.c.contact_phone, s.c.notes, s.c.status, s.c.reliability_score,
+            s.c.avg_shipping_days,
+        ).select_from(s.join(sup, sup_on)),
+    )
+
+    pc_prod, pc_prod_on = _mapped("product", "pc_prod", pc.c.product_id)
+    pc_cat, pc_cat_on = _mapped("category", "pc_cat", pc.c.category_id)
+    ps_prod, ps_prod_on = _mapped("product", "ps_prod", ps.c.product_id)
+    ps_sup, ps_sup_on = _mapped("supplier", "ps_sup", ps.c.supplier_id)
+    product_links = [
+        _copy(
+            ProductCategory,
+            ["id", "product_id", "category_id"],
+            select(func.gen_random_uuid(), pc_prod.c.new_id, pc_cat.c.new_id)
+            .select_from(pc.join(pc_prod, pc_prod_on).join(pc_cat, pc_cat_on)),
+        ),
+        _copy(
+            ProductSupplier,
+            ["id", "product_id", "supplier_id", "supplier_url", "supplier_sku",
+             "supplier_cost", "is_primary"],
+            select(
+                func.gen_random_uuid(), ps_prod.c.new_id, ps_sup.c.new_id,
+                ps.c.supplier_url, ps.c.supplier_sku, ps.c.supplier_cost,
+                ps.c.is_primary,
+            ).select_from(ps.join(ps_prod, ps_prod_on).join(ps_sup, ps_sup_on)),
+        ),
+    ]
+
+    themes = _copy(
+        StoreTheme,
+        ["id", "store_id", "name", "is_active", "is_preset", "colors",
+         "typography", "styles", "blocks", "logo_url", "favicon_url", "custom_css"],
+        select(
+            func.gen_random_uuid(), target, t.c.name, t.c.is_active, t.c.is_preset,
+            t.c.colors, t.c.typography, t.c.styles, t.c.blocks, t.c.logo_url,
+            t.c.favicon_url, t.c.custom_css,
+        ).where(t.c.store_id == source_store_id),
+    )
+
+    disc, disc_on = _mapped("discount", "disc", d.c.id)
+    dp_disc, dp_disc_on = _mapped("discount", "dp_disc", dp.c.discount_id)
+    dp_prod, dp_prod_on = _mapped("product", "dp_prod", dp.c.product_id)
+    dc_disc, dc_disc_on = _mapped("discount", "dc_disc", dc.c.discount_id)
+    dc_cat, dc_cat_on = _mapped("category", "dc_cat", dc.c.category_id)
+    discounts = [
+        _copy(
+            Discount,
+            ["id", "store_id", "code", "description", "discount_type", "value",
+             "minimum_order_amount", "max_uses", "times_used", "starts_at",
+             "expires_at", "status", "applies_to"],
+            select(
+                disc.c.new_id, target, d.c.code + "-copy", d.c.description,
+                d.c.discount_type, d.c.value, d.c.minimum_order_amount,
+                d.c.max_uses, literal(0), d.c.starts_at, d.c.expires_at,
+                d.c.status, d.c.applies_to,
+            ).select_from(d.join(disc, disc_on)),
+        ),
+        _copy(
+            DiscountProduct,
+            ["id", "discount_id", "product_id"],
+            select(func.gen_random_uuid(), dp_disc.c.new_id, dp_prod.c.new_id)
+            .select_from(dp.join(dp_disc, dp_disc_on).join(dp_prod, dp_prod_on)),
+        ),
+        _copy(
+            DiscountCategory,
+            ["id", "discount_id", "category_id"],
+            select(func.gen_random_uuid(), dc_disc.c.new_id, dc_cat.c.new_id)
+            .select_from(dc.join(dc_disc, dc_disc_on).join(dc_cat, dc_cat_on)),
+        ),
+    ]
+
+    tax_rates = _copy(
+        TaxRate,
+        ["id", "store_id", "name", "rate", "country", "state", "zip_code",
+         "is_active", "priority", "is_inclusive"],
+        select(
+            func.gen_random_uuid(), target, tr.c.name, tr.c.rate, tr.c.country,
+            tr.c.state, tr.c.zip_code, literal(True), tr.c.priority,
+            tr.c.is_inclusive,
+        ).where(tr.c.store_id == source_store_id, tr.c.is_active.is_(True)),
+    )
+
+    return [
+        ("id_map", id_map_step),
+        ("categories", [categories, category_closure]),
+        ("products", [products]),
+        ("variants", [variants]),
+        ("suppliers", [suppliers]),
+        ("product_links", product_links),
+        ("themes", [themes]),
+        ("discounts", discounts),
+        ("tax_rates", [tax_rates, DropTable(_id_map)]),
+    ]
+
+
+CLONE_STEP_COUNT = len(clone_steps(uuid.UUID(int=0), uuid.UUID(int=0)))
+"""Number of progress steps reported by background clone jobs."""
+
+
+async def _get_source_store(
+    db: AsyncSession, user_id: uuid.UUID, source_store_id: uuid.UUID
+) -> Store:
+    """Fetch the source store and verify the user owns it.
 
     Raises:
         ValueError: If the source store is not found or doesn't belong to the user.
     """
-    # Fetch and verify ownership of the source store.
     result = await db.execute(select(Store).where(Store.id == source_store_id))
     source = result.scalar_one_or_none()
     if source is None or source.status == StoreStatus.deleted:
         raise ValueError("Store not found")
     if source.user_id != user_id:
         raise ValueError("Store not found")
+    return source
 
-    # Create the cloned store.
+
+async def _create_target_store(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    source: Store,
+    new_name: str | None,
+    status: StoreStatus,
+) -> Store:
+    """Create the store record that receives the cloned contents."""
     clone_name = new_name or f"{source.name} (Copy)"
     slug = await generate_unique_slug(db, Store, clone_name)
 
@@ -92,433 +352,153 @@ async def clone_store(
         logo_url=source.logo_url,
         favicon_url=source.favicon_url,
         custom_css=source.custom_css,
-        status=StoreStatus.active,
+        status=status,
     )
     db.add(new_store)
     await db.flush()
-
-    # Clone child entities. Order matters because some depend on ID maps.
-    category_id_map = await _clone_categories(db, source.id, new_store.id)
-    product_id_map, variant_id_map = await _clone_products(db, source.id, new_store.id)
-    supplier_id_map = await _clone_suppliers(db, source.id, new_store.id)
-    await _clone_product_categories(db, product_id_map, category_id_map)
-    await _clone_product_suppliers(db, product_id_map, supplier_id_map)
-    await _clone_themes(db, source.id, new_store.id)
-    await _clone_discounts(db, source.id, new_store.id, product_id_map, category_id_map)
-    await _clone_tax_rules(db, source.id, new_store.id)
-
-    await db.refresh(new_store)
+    publish_store_route(db, new_store)
     return new_store
 
 
-async def _clone_categories(
+async def clone_store(
     db: AsyncSession,
+    user_id: uuid.UUID,
     source_store_id: uuid.UUID,
-    target_store_id: uuid.UUID,
-) -> dict[uuid.UUID, uuid.UUID]:
-    """Clone all categories, preserving parent-child hierarchy.
-
-    Args:
-        db: Async database session.
-        source_store_id: ID of the source store.
-        target_store_id: ID of the target (cloned) store.
-
-    Returns:
-        A mapping from old category IDs to new category IDs.
-    """
-    result = await db.execute(
-        select(Category)
-        .where(Category.store_id == source_store_id)
-        .order_by(Category.position)
-    )
-    categories = list(result.scalars().all())
-
-    id_map: dict[uuid.UUID, uuid.UUID] = {}
-
-    # First pass: clone all categories without parent links.
-    for cat in categories:
-        new_id = uuid.uuid4()
-        id_map[cat.id] = new_id
-        new_cat = Category(
-            id=new_id,
-            store_id=target_store_id,
-            name=cat.name,
-            slug=cat.slug,
-            description=cat.description,
-            image_url=cat.image_url,
-            parent_id=None,
-            position=cat.position,
-            is_active=cat.is_active,
-        )
-        db.add(new_cat)
-
-    await db.flush()
-
-    # Second pass: set parent_id using the ID map.
-    for cat in categories:
-        if cat.parent_id and cat.parent_id in id_map:
-            result2 = await db.execute(
-                select(Category).where(Category.id == id_map[cat.id])
-            )
-            new_cat = result2.scalar_one()
-            new_cat.parent_id = id_map[cat.parent_id]
-
-    await db.flush()
-    return id_map
-
+    new_name: str | None = None,
+) -> Store:
+    """Clone a store with all products, variants, themes, discounts, and more.
 
-async def _clone_products(
-    db: AsyncSession,
-    source_store_id: uuid.UUID,
-    target_store_id: uuid.UUID,
-) -> tuple[dict[uuid.UUID, uuid.UUID], dict[uuid.UUID, uuid.UUID]]:
-    """Clone all non-archived products and their variants.
+    Creates a new store record owned by the same user, then copies all child
+    entities. Orders, reviews, analytics, customer data, webhooks, and teams
+    are NOT cloned.
 
     Args:
         db: Async database session.
-        source_store_id: ID of the source store.
-        target_store_id: ID of the target (cloned) store.
+        user_id: UUID of the user performing the clone (must own the source store).
+        source_store_id: UUID of the store to clone.
+        new_name: Optional name override. Defaults to ``{original_name} (Copy)``.
 
     Returns:
-        A tuple of (product_id_map, variant_id_map) mapping old IDs to new IDs.
+        The newly created Store ORM instance with all cloned child records.
+
+    Raises:
+        ValueError: If the source store is not found or doesn't belong to the user.
     """
-    result = await db.execute(
-        select(Product).where(
-            Product.store_id == source_store_id,
-            Product.status != "archived",
-        )
+    source = await _get_source_store(db, user_id, source_store_id)
+    new_store = await _create_target_store(
+        db, user_id, source, new_name, StoreStatus.active
     )
-    products = list(result.scalars().all())
-
-    product_id_map: dict[uuid.UUID, uuid.UUID] = {}
-    variant_id_map: dict[uuid.UUID, uuid.UUID] = {}
-
-    for product in products:
-        new_product_id = uuid.uuid4()
-        product_id_map[product.id] = new_product_id
-
-        new_product = Product(
-            id=new_product_id,
-            store_id=target_store_id,
-            title=product.title,
-            slug=product.slug,
-            description=product.description,
-            price=product.price,
-            compare_at_price=product.compare_at_price,
-            cost=product.cost,
-            images=product.images,
-            status=product.status,
-            tags=product.tags,
-            seo_title=product.seo_title,
-            seo_description=product.seo_description,
-            avg_rating=None,
-            review_count=0,
-        )
-        db.add(new_product)
-
-        # Clone variants for this product.
-        for variant in product.variants:
-            new_variant_id = uuid.uuid4()
-            variant_id_map[variant.id] = new_variant_id
-
-            new_variant = ProductVariant(
-                id=new_variant_id,
-                product_id=new_product_id,
-                name=variant.name,
-                sku=variant.sku,
-                price=variant.price,
-                inventory_count=variant.inventory_count,
-            )
-            db.add(new_variant)
 
-    await db.flush()
-    return product_id_map, variant_id_map
+    for _, statements in clone_steps(source.id, new_store.id):
+        for stmt in statements:
+            await db.execute(stmt)
 
+    await db.refresh(new_store)
+    return new_store
 
-async def _clone_product_categories(
-    db: AsyncSession,
-    product_id_map: dict[uuid.UUID, uuid.UUID],
-    category_id_map: dict[uuid.UUID, uuid.UUID],
-) -> int:
-    """Clone product-category junction records using remapped IDs.
 
-    Args:
-        db: Async database session.
-        product_id_map: Mapping from old to new product IDs.
-        category_id_map: Mapping from old to new category IDs.
+async def needs_clone_job(
+    db: AsyncSession, user_id: uuid.UUID, source_store_id: uuid.UUID
+) -> bool:
+    """Whether a store is large enough to be cloned in the background.
 
-    Returns:
-        Number of junction records created.
+    Raises:
+        ValueError: If the source store is not found or doesn't belong to the user.
     """
-    if not product_id_map or not category_id_map:
-        return 0
-
-    old_product_ids = list(product_id_map.keys())
-    result = await db.execute(
-        select(ProductCategory).where(ProductCategory.product_id.in_(old_product_ids))
+    source = await _get_source_store(db, user_id, source_store_id)
+    product_count = await db.scalar(
+        select(func.count(Product.id)).where(
+            Product.store_id == source.id,
+            Product.status != ProductStatus.archived,
+        )
     )
-    junctions = list(result.scalars().all())
-
-    count = 0
-    for junc in junctions:
-        new_product_id = product_id_map.get(junc.product_id)
-        new_category_id = category_id_map.get(junc.category_id)
-        if new_product_id and new_category_id:
-            db.add(ProductCategory(
-                product_id=new_product_id,
-                category_id=new_category_id,
-            ))
-            count += 1
-
-    await db.flush()
-    return count
+    return product_count > settings.clone_job_threshold
 
 
-async def _clone_suppliers(
+async def start_clone_job(
     db: AsyncSession,
+    user_id: uuid.UUID,
     source_store_id: uuid.UUID,
-    target_store_id: uuid.UUID,
-) -> dict[uuid.UUID, uuid.UUID]:
-    """Clone all active suppliers.
+    new_name: str | None = None,
+) -> tuple[StoreCloneJob, Store]:
+    """Create a paused target store and a pending background clone job.
 
     Args:
         db: Async database session.
-        source_store_id: ID of the source store.
-        target_store_id: ID of the target (cloned) store.
+        user_id: UUID of the user performing the clone (must own the source store).
+        source_store_id: UUID of the store to clone.
+        new_name: Optional name override. Defaults to ``{original_name} (Copy)``.
 
     Returns:
-        A mapping from old supplier IDs to new supplier IDs.
-    """
-    result = await db.execute(
-        select(Supplier).where(Supplier.store_id == source_store_id)
-    )
-    suppliers = list(result.scalars().all())
-
-    id_map: dict[uuid.UUID, uuid.UUID] = {}
-
-    for sup in suppliers:
-        new_id = uuid.uuid4()
-        id_map[sup.id] = new_id
-        db.add(Supplier(
-            id=new_id,
-            store_id=target_store_id,
-            name=sup.name,
-            website=sup.website,
-            contact_email=sup.contact_email,
-            contact_phone=sup.contact_phone,
-            notes=sup.notes,
-            status=sup.status,
-            reliability_score=sup.reliability_score,
-            avg_shipping_days=sup.avg_shipping_days,
-        ))
+        A tuple of (job, target store), flushed but not committed.
 
-    await db.flush()
-    return id_map
-
-
-async def _clone_product_suppliers(
-    db: AsyncSession,
-    product_id_map: dict[uuid.UUID, uuid.UUID],
-    supplier_id_map: dict[uuid.UUID, uuid.UUID],
-) -> int:
-    """Clone product-supplier junction records using remapped IDs.
-
-    Args:
-        db: Async database session.
-        product_id_map: Mapping from old to new product IDs.
-        supplier_id_map: Mapping from old to new supplier IDs.
-
-    Returns:
-        Number of junction records created.
+    Raises:
+        ValueError: If the source store is not found or doesn't belong to the user.
     """
-    if not product_id_map or not supplier_id_map:
-        return 0
-
-    old_product_ids = list(product_id_map.keys())
-    result = await db.execute(
-        select(ProductSupplier).where(ProductSupplier.product_id.in_(old_product_ids))
+    source = await _get_source_store(db, user_id, source_store_id)
+    new_store = await _create_target_store(
+        db, user_id, source, new_name, StoreStatus.paused
     )
-    junctions = list(result.scalars().all())
-
-    count = 0
-    for junc in junctions:
-        new_product_id = product_id_map.get(junc.product_id)
-        new_supplier_id = supplier_id_map.get(junc.supplier_id)
-        if new_product_id and new_supplier_id:
-            db.add(ProductSupplier(
-                product_id=new_product_id,
-                supplier_id=new_supplier_id,
-                cost=junc.cost,
-                sku=junc.sku,
-                source_url=junc.source_url,
-                is_primary=junc.is_primary,
-            ))
-            count += 1
-
-    await db.flush()
-    return count
-
-
-async def _clone_themes(
-    db: AsyncSession,
-    source_store_id: uuid.UUID,
-    target_store_id: uuid.UUID,
-) -> int:
-    """Clone all theme configs, preserving active/inactive state.
-
-    Args:
-        db: Async database session.
-        source_store_id: ID of the source store.
-        target_store_id: ID of the target (cloned) store.
 
-    Returns:
-        Number of themes cloned.
-    """
-    result = await db.execute(
-        select(StoreTheme).where(StoreTheme.store_id == source_store_id)
+    job = StoreCloneJob(
+        source_store_id=source.id,
+        store_id=new_store.id,
+        user_id=user_id,
+        status=CloneJobStatus.pending,
+        total_steps=CLONE_STEP_COUNT,
+        completed_steps=0,
     )
-    themes = list(result.scalars().all())
-
-    for theme in themes:
-        db.add(StoreTheme(
-            store_id=target_store_id,
-            name=theme.name,
-            is_active=theme.is_active,
-            is_preset=theme.is_preset,
-            colors=theme.colors,
-            typography=theme.typography,
-            styles=theme.styles,
-            blocks=theme.blocks,
-            logo_url=theme.logo_url,
-            favicon_url=theme.favicon_url,
-            custom_css=theme.custom_css,
-        ))
-
+    db.add(job)
     await db.flush()
-    return len(themes)
+    await db.refresh(job)
+    await db.refresh(new_store)
+    return job, new_store
 
 
-async def _clone_discounts(
+async def get_clone_job(
     db: AsyncSession,
+    user_id: uuid.UUID,
     source_store_id: uuid.UUID,
-    target_store_id: uuid.UUID,
-    product_id_map: dict[uuid.UUID, uuid.UUID],
-    category_id_map: dict[uuid.UUID, uuid.UUID],
-) -> int:
-    """Clone all non-expired discounts. Reset usage counters and suffix codes.
+    job_id: uuid.UUID,
+) -> StoreCloneJob:
+    """Fetch a clone job of a store owned by the user.
 
-    Args:
-        db: Async database session.
-        source_store_id: ID of the source store.
-        target_store_id: ID of the target (cloned) store.
-        product_id_map: Mapping from old to new product IDs.
-        category_id_map: Mapping from old to new category IDs.
-
-    Returns:
-        Number of discounts cloned.
+    Raises:
+        ValueError: If the store or job is not found.
     """
-    now = datetime.now(timezone.utc)
-    result = await db.execute(
-        select(Discount).where(
-            Discount.store_id == source_store_id,
-            Discount.status != DiscountStatus.expired,
+    await _get_source_store(db, user_id, source_store_id)
+    job = await db.scalar(
+        select(StoreCloneJob).where(
+            StoreCloneJob.id == job_id,
+            StoreCloneJob.source_store_id == source_store_id,
         )
     )
-    discounts = list(result.scalars().all())
-
-    discount_id_map: dict[uuid.UUID, uuid.UUID] = {}
-
-    for disc in discounts:
-        # Skip already expired discounts based on date.
-        if disc.expires_at and disc.expires_at < now:
-            continue
-
-        new_id = uuid.uuid4()
-        discount_id_map[disc.id] = new_id
-
-        db.add(Discount(
-            id=new_id,
-            store_id=target_store_id,
-            code=f"{disc.code}-copy",
-            description=disc.description,
-            discount_type=disc.discount_type,
-            value=disc.value,
-            minimum_order_amount=disc.minimum_order_amount,
-            max_uses=disc.max_uses,
-            times_used=0,
-            starts_at=disc.starts_at,
-            expires_at=disc.expires_at,
-            status=disc.status,
-            applies_to=disc.applies_to,
-        ))
+    if job is None:
+        raise ValueError("Clone job not found")
+    return job
 
-    await db.flush()
-
-    # Clone discount-product and discount-category junctions.
-    for old_disc_id, new_disc_id in discount_id_map.items():
-        # Products.
-        prod_result = await db.execute(
-            select(DiscountProduct).where(DiscountProduct.discount_id == old_disc_id)
-        )
-        for dp in prod_result.scalars().all():
-            new_prod_id = product_id_map.get(dp.product_id)
-            if new_prod_id:
-                db.add(DiscountProduct(
-                    discount_id=new_disc_id,
-                    product_id=new_prod_id,
-                ))
-
-        # Categories.
-        cat_result = await db.execute(
-            select(DiscountCategory).where(DiscountCategory.discount_id == old_disc_id)
-        )
-        for dc in cat_result.scalars().all():
-            new_cat_id = category_id_map.get(dc.category_id)
-            if new_cat_id:
-                db.add(DiscountCategory(
-                    discount_id=new_disc_id,
-                    category_id=new_cat_id,
-                ))
-
-    await db.flush()
-    return len(discount_id_map)
 
-
-async def _clone_tax_rules(
-    db: AsyncSession,
+def clone_store_contents_sync(
+    session: Session,
     source_store_id: uuid.UUID,
     target_store_id: uuid.UUID,
-) -> int:
-    """Clone all active tax rates.
+    on_step: Callable[[str, int], None] | None = None,
+) -> None:
+    """Copy a store's contents into an existing store (worker path).
+
+    Runs every clone step on ``session`` without committing; the caller
+    commits once all steps succeeded.
 
     Args:
-        db: Async database session.
+        session: Sync SQLAlchemy session.
         source_store_id: ID of the source store.
         target_store_id: ID of the target (cloned) store.
-
-    Returns:
-        Number of tax rules cloned.
+        on_step: Optional callback receiving the finished step's name and
+            the number of steps finished so far.
     """
-    result = await db.execute(
-        select(TaxRate).where(
-            TaxRate.store_id == source_store_id,
-            TaxRate.is_active.is_(True),
-        )
-    )
-    tax_rates = list(result.scalars().all())
-
-    for tr in tax_rates:
-        db.add(TaxRate(
-            store_id=target_store_id,
-            name=tr.name,
-            rate=tr.rate,
-            country=tr.country,
-            state=tr.state,
-            zip_code=tr.zip_code,
-            is_active=True,
-            priority=tr.priority,
-            is_inclusive=tr.is_inclusive,
-        ))
-
-    await db.flush()
-    return len(tax_rates)
+    steps = clone_steps(source_store_id, target_store_id)
+    for done, (name, statements) in enumerate(steps, start=1):
+        for stmt in statements:
+            session.execute(stmt)
+        if on_step is not None:
+            on_step(name, done)
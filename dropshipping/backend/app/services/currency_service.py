@@ -1,27 +1,41 @@
 """Currency conversion service.
 
-Provides multi-currency support with static exchange rates for MVP.
-In production, rates would be fetched from a live API (e.g. Open
-Exchange Rates, Fixer.io) and cached.
+Provides multi-currency support backed by live exchange rates. A Beat
+task fetches rates from the configured source and publishes them to Redis
+as a versioned snapshot; every API process keeps the current snapshot in
+memory as a ``RateTable`` with all cross rates precomputed.
 
 **For Developers:**
-    Exchange rates are stored as a module-level dict relative to USD
-    as the base currency. ``convert_price`` handles bidirectional
-    conversion through USD as an intermediary. ``get_store_currency``
-    reads the store's configured currency (defaults to USD).
+    - ``refresh_exchange_rates_sync`` (the ``refresh_exchange_rates`` task)
+      fetches a ``RateQuote`` from ``exchange_rates.get_rate_source()``,
+      and, if the rates changed, writes the snapshot and bumps the version
+      key in one transaction.
+    - ``get_rate_table`` costs one Redis ``GET`` (the version) when the
+      process already holds the current snapshot. Without a snapshot it
+      serves the built-in ``EXCHANGE_RATES``; if Redis is unreachable it
+      keeps serving the last snapshot it loaded.
+    - ``convert_prices`` converts a whole list of amounts with one rate
+      lookup, e.g. every price on a storefront listing page.
+      ``convert_price`` is the single-amount form.
+    - Rounding follows ``CURRENCY_INFO``: ``decimals`` places, or the
+      ``rounding`` increment where a currency has one (CHF prices round
+      to 0.05). Ties round half up.
+    - ``get_store_currency`` reads the store's configured currency
+      (defaults to USD).
 
 **For QA Engineers:**
-    - ``get_supported_currencies`` returns all available currencies with
-      metadata (name, symbol, code).
-    - ``convert_price`` validates both source and target currencies.
-    - Conversion goes from_currency -> USD -> to_currency for accuracy.
+    - ``get_supported_currencies`` returns every currency in both
+      ``CURRENCY_INFO`` and the live snapshot, with metadata (name,
+      symbol, code) and its rate against the snapshot's base currency.
+    - Conversions validate both source and target currencies.
+    - Converting to the same currency returns the amounts unchanged.
     - ``get_store_currency`` returns "USD" if the store doesn't have a
       ``currency`` field.
 
 **For Project Managers:**
     This service powers Feature 21 (Multi-Currency) from the backlog.
     It enables storefronts to display prices in the customer's preferred
-    currency.
+    currency, using rates refreshed every hour.
 
 **For End Users:**
     View product prices in your preferred currency. The conversion rate
@@ -29,18 +43,34 @@ Exchange Rates, Fixer.io) and cached.
     currency.
 """
 
+import json
+import logging
 import uuid
-from decimal import Decimal, ROUND_HALF_UP
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
 
+from redis import Redis
+from redis.exceptions import RedisError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.store import Store
+from app.redis_client import get_redis, get_sync_redis
+from app.services.exchange_rates import AbstractRateSource, RateQuote, get_rate_source
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "currency:rates:snapshot"
+VERSION_KEY = "currency:rates:version"
+
+BUILTIN_VERSION = "builtin"
 
 
 # ---------------------------------------------------------------------------
-# Static exchange rates relative to USD (base currency).
-# In production, these would be fetched from an external API and cached.
+# Built-in exchange rates relative to USD. Served by the ``static`` rate
+# source and used whenever no live snapshot is available.
 # ---------------------------------------------------------------------------
 EXCHANGE_RATES: dict[str, float] = {
     "USD": 1.0,
@@ -72,7 +102,7 @@ CURRENCY_INFO: dict[str, dict] = {
     "CAD": {"name": "Canadian Dollar", "symbol": "CA$", "decimals": 2},
     "AUD": {"name": "Australian Dollar", "symbol": "A$", "decimals": 2},
     "JPY": {"name": "Japanese Yen", "symbol": "\u00a5", "decimals": 0},
-    "CHF": {"name": "Swiss Franc", "symbol": "CHF", "decimals": 2},
+    "CHF": {"name": "Swiss Franc", "symbol": "CHF", "decimals": 2, "rounding": "0.05"},
     "CNY": {"name": "Chinese Yuan", "symbol": "\u00a5", "decimals": 2},
     "INR": {"name": "Indian Rupee", "symbol": "\u20b9", "decimals": 2},
     "BRL": {"name": "Brazilian Real", "symbol": "R$", "decimals": 2},
@@ -89,36 +119,264 @@ CURRENCY_INFO: dict[str, dict] = {
 }
 
 
-def get_supported_currencies() -> list[dict]:
+def _increment(code: str) -> Decimal:
+    """Smallest price step of a currency."""
+    info = CURRENCY_INFO.get(code, {})
+    if "rounding" in info:
+        return Decimal(info["rounding"])
+    return Decimal(1).scaleb(-info.get("decimals", 2))
+
+
+def round_amount(amount: Decimal, currency: str) -> Decimal:
+    """Round an amount to a currency's price step (half up).
+
+    Args:
+        amount: The unrounded amount.
+        currency: ISO 4217 code of the amount.
+
+    Returns:
+        The amount rounded to the currency's increment, with the
+        currency's number of decimal places.
+    """
+    code = currency.upper()
+    step = _increment(code)
+    quantum = Decimal(1).scaleb(-CURRENCY_INFO.get(code, {}).get("decimals", 2))
+    if step != quantum:
+        amount = (amount / step).quantize(Decimal(1), rounding=ROUND_HALF_UP) * step
+    return amount.quantize(quantum, rounding=ROUND_HALF_UP)
+
+
+@dataclass(frozen=True)
+class RateTable:
+    """One exchange-rate snapshot with every cross rate precomputed.
+
+    Attributes:
+        version: Snapshot version (``"builtin"`` for the built-in table).
+        base: Currency the ``rates`` are relative to.
+        as_of: When the provider published the rates.
+        rates: Units of each supported currency per unit of ``base``, in
+            ``CURRENCY_INFO`` order.
+        cross: ``(from, to)`` to direct conversion rate, for every pair.
+    """
+
+    version: str
+    base: str
+    as_of: datetime
+    rates: dict[str, Decimal]
+    cross: dict[tuple[str, str], Decimal]
+
+    @classmethod
+    def build(cls, quote: RateQuote, version: str) -> "RateTable":
+        """Build a table from a quote, keeping only supported currencies.
+
+        Raises:
+            ValueError: If fewer than two supported currencies are quoted.
+        """
+        rates = {code: quote.rates[code] for code in CURRENCY_INFO if code in quote.rates}
+        if len(rates) < 2:
+            raise ValueError("Exchange rate quote covers no supported currency pair")
+        cross = {
+            (src, dst): dst_rate / src_rate
+            for src, src_rate in rates.items()
+            for dst, dst_rate in rates.items()
+        }
+        return cls(version=version, base=quote.base, as_of=quote.as_of, rates=rates, cross=cross)
+
+    def to_json(self) -> str:
+        """Serialize for the Redis snapshot."""
+        return json.dumps({
+            "version": self.version,
+            "base": self.base,
+            "timestamp": int(self.as_of.timestamp()),
+            "rates": {code: str(rate) for code, rate in self.rates.items()},
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "RateTable":
+        """Load a Redis snapshot."""
+        payload = json.loads(raw)
+        return cls.build(RateQuote.from_payload(payload), str(payload["version"]))
+
+    def rate(self, from_currency: str, to_currency: str) -> Decimal:
+        """Direct conversion rate between two currencies.
+
+        Raises:
+            ValueError: If either currency code is not supported.
+        """
+        from_code = from_currency.upper()
+        to_code = to_currency.upper()
+        for code in (from_code, to_code):
+            if code not in self.rates:
+                raise ValueError(f"Unsupported currency: {code}")
+        return self.cross[(from_code, to_code)]
+
+    def convert_many(
+        self, amounts: Iterable[Decimal], from_currency: str, to_currency: str
+    ) -> list[Decimal]:
+        """Convert amounts with one rate lookup, rounded for the target.
+
+        Raises:
+            ValueError: If either currency code is not supported.
+        """
+        rate = self.rate(from_currency, to_currency)
+        if from_currency.upper() == to_currency.upper():
+            return list(amounts)
+        return [round_amount(amount * rate, to_currency) for amount in amounts]
+
+
+_table: RateTable | None = None
+_builtin_table: RateTable | None = None
+
+
+def _builtin() -> RateTable:
+    """The table of the built-in ``EXCHANGE_RATES``."""
+    global _builtin_table
+    if _builtin_table is None:
+        quote = RateQuote.from_payload({"base": "USD", "rates": EXCHANGE_RATES})
+        _builtin_table = RateTable.build(quote, BUILTIN_VERSION)
+    return _builtin_table
+
+
+async def get_rate_table() -> RateTable:
+    """Get the current exchange-rate table.
+
+    Returns:
+        The live snapshot, or the built-in table if none was published.
+        If Redis is unreachable, the last snapshot this process loaded.
+    """
+    global _table
+    redis = get_redis()
+    try:
+        version = await redis.get(VERSION_KEY)
+        if version is None:
+            return _builtin()
+        if _table is not None and _table.version == version:
+            return _table
+        raw = await redis.get(SNAPSHOT_KEY)
+    except RedisError as exc:
+        logger.warning("Exchange rate snapshot unavailable: %s", exc)
+        return _table or _builtin()
+    if raw is None:
+        return _builtin()
+    _table = RateTable.from_json(raw)
+    return _table
+
+
+def reset_rate_table() -> None:
+    """Drop this process's loaded snapshot."""
+    global _table
+    _table = None
+
+
+def refresh_exchange_rates_sync(
+    source: AbstractRateSource | None = None,
+    redis: Redis | None = None,
+) -> dict:
+    """Fetch rates from the source and publish them if they changed.
+
+    Args:
+        source: Rate source (defaults to ``get_rate_source()``).
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        Dict with the live ``version``, whether it ``changed``, and the
+        number of ``currencies`` it covers.
+
+    Raises:
+        ValueError: If the source returned unusable rates.
+        OSError: If the source could not be reached.
+        redis.RedisError: If Redis is unavailable.
+    """
+    from app.http_client import run_async
+
+    source = source or get_rate_source()
+    redis = redis or get_sync_redis()
+    table = RateTable.build(run_async(source.fetch_rates()), "")
+    missing = sorted(set(CURRENCY_INFO) - set(table.rates))
+    if missing:
+        logger.warning("Exchange rate source has no rate for %s", ", ".join(missing))
+
+    raw = redis.get(SNAPSHOT_KEY)
+    current = RateTable.from_json(raw) if raw else None
+    if current is not None and (current.base, current.rates) == (table.base, table.rates):
+        return {"version": current.version, "changed": False, "currencies": len(table.rates)}
+
+    version = str(int(current.version) + 1 if current else 1)
+    published = RateTable(version, table.base, table.as_of, table.rates, table.cross)
+    pipe = redis.pipeline(transaction=True)
+    pipe.set(SNAPSHOT_KEY, published.to_json())
+    pipe.set(VERSION_KEY, version)
+    pipe.execute()
+    return {"version": version, "changed": True, "currencies": len(table.rates)}
+
+
+async def get_supported_currencies() -> list[dict]:
     """Get a list of all supported currencies with metadata.
 
     Returns:
         A list of dicts, each containing ``code``, ``name``, ``symbol``,
-        ``decimals``, and ``rate`` (exchange rate relative to USD).
+        ``decimals``, and ``rate`` (exchange rate relative to the
+        snapshot's base currency).
     """
+    table = await get_rate_table()
     currencies = []
-    for code, rate in EXCHANGE_RATES.items():
-        info = CURRENCY_INFO.get(code, {})
+    for code, rate in table.rates.items():
+        info = CURRENCY_INFO[code]
         currencies.append({
             "code": code,
             "name": info.get("name", code),
             "symbol": info.get("symbol", code),
             "decimals": info.get("decimals", 2),
-            "rate": rate,
+            "rate": float(rate),
         })
     return currencies
 
 
-def convert_price(
+async def get_exchange_rates() -> dict:
+    """Get the live rates of every supported currency.
+
+    Returns:
+        A dict with ``base``, ``rates`` (code to float rate against
+        ``base``), and ``updated_at`` (when the rates were published).
+    """
+    table = await get_rate_table()
+    return {
+        "base": table.base,
+        "rates": {code: float(rate) for code, rate in table.rates.items()},
+        "updated_at": table.as_of,
+    }
+
+
+async def convert_prices(
+    amounts: Iterable[Decimal],
+    from_currency: str,
+    to_currency: str,
+) -> list[Decimal]:
+    """Convert many prices between two currencies at once.
+
+    Args:
+        amounts: Monetary amounts in ``from_currency``.
+        from_currency: The source currency code (e.g. ``"USD"``).
+        to_currency: The target currency code (e.g. ``"EUR"``).
+
+    Returns:
+        The converted amounts in input order, rounded for the target
+        currency.
+
+    Raises:
+        ValueError: If either currency code is not supported.
+    """
+    table = await get_rate_table()
+    return table.convert_many(amounts, from_currency, to_currency)
+
+
+async def convert_price(
     amount: Decimal,
     from_currency: str,
     to_currency: str,
 ) -> dict:
     """Convert a price between two currencies.
 
-    Conversion is performed via USD as the intermediary base currency:
-    ``amount / from_rate * to_rate``.
-
     Args:
         amount: The monetary amount to convert.
         from_currency: The source currency code (e.g. ``"USD"``).
@@ -131,37 +389,11 @@ def convert_price(
     Raises:
         ValueError: If either currency code is not supported.
     """
-    from_code = from_currency.upper()
-    to_code = to_currency.upper()
-
-    if from_code not in EXCHANGE_RATES:
-        raise ValueError(f"Unsupported currency: {from_code}")
-    if to_code not in EXCHANGE_RATES:
-        raise ValueError(f"Unsupported currency: {to_code}")
-
-    if from_code == to_code:
-        return {
-            "converted_amount": amount,
-            "rate": 1.0,
-        }
-
-    from_rate = Decimal(str(EXCHANGE_RATES[from_code]))
-    to_rate = Decimal(str(EXCHANGE_RATES[to_code]))
-
-    # Convert: amount in from_currency -> USD -> to_currency
-    usd_amount = amount / from_rate
-    converted = usd_amount * to_rate
-
-    # Determine decimal places for target currency
-    decimals = CURRENCY_INFO.get(to_code, {}).get("decimals", 2)
-    quantize_str = "0." + "0" * decimals if decimals > 0 else "1"
-    converted = converted.quantize(Decimal(quantize_str), rounding=ROUND_HALF_UP)
-
-    direct_rate = float(to_rate / from_rate)
-
+    table = await get_rate_table()
+    (converted,) = table.convert_many([amount], from_currency, to_currency)
     return {
         "converted_amount": converted,
-        "rate": round(direct_rate, 6),
+        "rate": round(float(table.rate(from_currency, to_currency)), 6),
     }
 
 
@@ -30,6 +30,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models.customer import CustomerAccount
+from app.services import segment_rules_service
 
 
 def hash_password(password: str) -> str:
@@ -164,6 +165,9 @@ async def register_customer(
     )
     db.add(customer)
     await db.flush()
+    await segment_rules_service.refresh_customer_segments(
+        db, store_id, None, customer_id=customer.id
+    )
     return customer
 
 
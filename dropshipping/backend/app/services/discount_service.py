@@ -48,33 +48,12 @@ from app.models.discount import (
     DiscountType,
     DiscountUsage,
 )
-from app.models.store import Store, StoreStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services.checkout_rules_service import (
+    CompiledDiscount,
+    get_store_rules,
+    invalidate_store_rules,
+)
+from app.services.store_access_service import verify_store_ownership
 
 
 async def create_discount(
@@ -123,7 +102,7 @@ async def create_discount(
         ValueError: If the store doesn't exist, belongs to another user,
             or a discount with the same code already exists in this store.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Check for duplicate code within the store
     existing = await db.execute(
@@ -164,6 +143,7 @@ async def create_discount(
         await db.flush()
 
     await db.refresh(discount)
+    invalidate_store_rules(db, store_id)
     return discount
 
 
@@ -191,7 +171,7 @@ async def list_discounts(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Discount).where(Discount.store_id == store_id)
     count_query = select(func.count(Discount.id)).where(Discount.store_id == store_id)
@@ -233,7 +213,7 @@ async def get_discount(
         ValueError: If the store or discount doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Discount).where(
@@ -315,6 +295,7 @@ async def update_discount(
 
     await db.flush()
     await db.refresh(discount)
+    invalidate_store_rules(db, store_id)
     return discount
 
 
@@ -342,6 +323,7 @@ async def delete_discount(
     discount = await get_discount(db, store_id, user_id, discount_id)
     await db.delete(discount)
     await db.flush()
+    invalidate_store_rules(db, store_id)
 
 
 async def validate_discount(
@@ -379,13 +361,8 @@ async def validate_discount(
         A dict with keys: ``valid`` (bool), ``discount_type``,
         ``value``, ``discount_amount``, and ``message``.
     """
-    result = await db.execute(
-        select(Discount).where(
-            Discount.store_id == store_id,
-            Discount.code == code.upper(),
-        )
-    )
-    discount = result.scalar_one_or_none()
+    rules = await get_store_rules(db, store_id)
+    discount = rules.discounts.get(code.upper())
 
     if discount is None:
         return {
@@ -428,8 +405,8 @@ async def validate_discount(
             "message": "This discount code has expired",
         }
 
-    # Check max uses
-    if discount.max_uses is not None and discount.times_used >= discount.max_uses:
+    # Check max uses (times_used changes with every order, so it is read live)
+    if discount.max_uses is not None and await _times_used(db, discount.id) >= discount.max_uses:
         return {
             "valid": False,
             "discount_type": discount.discount_type,
@@ -453,13 +430,7 @@ async def validate_discount(
 
     # Check product/category targeting
     if discount.applies_to == AppliesTo.specific_products and product_ids:
-        linked_product_ids_result = await db.execute(
-            select(DiscountProduct.product_id).where(
-                DiscountProduct.discount_id == discount.id
-            )
-        )
-        linked_product_ids = {row[0] for row in linked_product_ids_result.fetchall()}
-        if not linked_product_ids.intersection(set(product_ids)):
+        if not discount.targets_any(product_ids):
             return {
                 "valid": False,
                 "discount_type": discount.discount_type,
@@ -469,22 +440,7 @@ async def validate_discount(
             }
 
     if discount.applies_to == AppliesTo.specific_categories and product_ids:
-        from app.models.category import ProductCategory
-
-        linked_cat_ids_result = await db.execute(
-            select(DiscountCategory.category_id).where(
-                DiscountCategory.discount_id == discount.id
-            )
-        )
-        linked_cat_ids = {row[0] for row in linked_cat_ids_result.fetchall()}
-
-        product_cat_result = await db.execute(
-            select(ProductCategory.product_id).where(
-                ProductCategory.category_id.in_(linked_cat_ids),
-                ProductCategory.product_id.in_(product_ids),
-            )
-        )
-        if not product_cat_result.fetchall():
+        if not discount.targets_any(product_ids):
             return {
                 "valid": False,
                 "discount_type": discount.discount_type,
@@ -505,11 +461,19 @@ async def validate_discount(
     }
 
 
-def _calculate_discount_amount(discount: Discount, subtotal: Decimal) -> Decimal:
+async def _times_used(db: AsyncSession, discount_id: uuid.UUID) -> int:
+    """Read a discount's current usage count."""
+    result = await db.execute(select(Discount.times_used).where(Discount.id == discount_id))
+    return result.scalar_one_or_none() or 0
+
+
+def _calculate_discount_amount(
+    discount: "Discount | CompiledDiscount", subtotal: Decimal
+) -> Decimal:
     """Calculate the actual monetary discount for a given subtotal.
 
     Args:
-        discount: The Discount ORM instance.
+        discount: The Discount ORM instance or its compiled form.
         subtotal: The cart subtotal to apply the discount against.
 
     Returns:
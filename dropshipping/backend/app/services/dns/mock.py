@@ -15,7 +15,9 @@ where no real DNS infrastructure is available.
     - ``create_record`` appends to the zone's record list.
     - ``delete_record`` removes the matching record and returns True,
       or returns False if not found.
-    - ``verify_propagation`` always returns True.
+    - ``verify_propagation`` returns True unless the provider was built
+      with ``propagated=False``; ``latency`` (seconds) makes every check
+      sleep first, to simulate slow resolvers in concurrency tests.
     - Zone IDs are deterministic: ``mock-zone-{domain_with_dashes}``.
 
 **For Project Managers:**
@@ -28,6 +30,7 @@ where no real DNS infrastructure is available.
     (Cloudflare, Route53, or Google Cloud DNS).
 """
 
+import asyncio
 import uuid
 from collections import defaultdict
 
@@ -43,11 +46,20 @@ class MockDnsProvider(AbstractDnsProvider):
 
     Attributes:
         _zones: Dictionary mapping zone IDs to lists of DnsRecord objects.
+        latency: Seconds each ``verify_propagation`` call waits.
+        propagated: What ``verify_propagation`` reports.
     """
 
-    def __init__(self):
-        """Initialize the mock DNS provider with an empty zone store."""
+    def __init__(self, latency: float = 0.0, propagated: bool = True):
+        """Initialize the mock DNS provider with an empty zone store.
+
+        Args:
+            latency: Simulated resolver latency per propagation check.
+            propagated: Result of every propagation check.
+        """
         self._zones: dict[str, list[DnsRecord]] = defaultdict(list)
+        self.latency = latency
+        self.propagated = propagated
 
     async def create_record(self, zone_id: str, record: DnsRecord) -> DnsRecord:
         """Create a DNS record in the mock zone store.
@@ -131,7 +143,7 @@ class MockDnsProvider(AbstractDnsProvider):
     async def verify_propagation(
         self, domain: str, record_type: DnsRecordType, expected_value: str
     ) -> bool:
-        """Verify DNS propagation (mock always returns True).
+        """Verify DNS propagation after the configured latency.
 
         Args:
             domain: The domain to check.
@@ -139,6 +151,9 @@ class MockDnsProvider(AbstractDnsProvider):
             expected_value: The expected record value.
 
         Returns:
-            True (mock assumes instant propagation).
+            ``self.propagated`` (True by default: the mock assumes
+            instant propagation).
         """
-        return True
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.propagated
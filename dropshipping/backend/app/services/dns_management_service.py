@@ -10,11 +10,36 @@ propagation verification.
     the CustomDomain model with DNS/SSL status. The DNS provider is
     obtained via ``get_dns_provider()`` factory.
 
+    Propagation lookups go through ``check_propagation``, which runs them
+    concurrently, at most ``settings.dns_propagation_concurrency`` at a
+    time. The result of the last check is cached on the CustomDomain
+    (``dns_propagated``, ``dns_checked_at``) and the next check is
+    scheduled in ``dns_next_check_at``: a healthy domain after
+    ``settings.domain_health_interval_seconds``, a failing one after an
+    exponential backoff (``domain_health_retry_base_seconds`` doubling
+    per consecutive failure, capped at ``domain_health_retry_max_seconds``).
+    Changing a managed record calls ``mark_dns_unchecked`` so the cached
+    result is not served for records it did not check.
+
+    The health sweep leases due domains by pushing ``dns_next_check_at``
+    forward and committing, runs the lookups with no transaction open,
+    and then writes back the results of the domains that did not change
+    in the meantime.
+
 **For QA Engineers:**
     - ``auto_configure_dns`` creates exactly 2 records (A + CNAME).
     - ``provision_ssl`` sets ssl_provisioned=True and populates
       ssl_certificate_id, ssl_provider, and ssl_expires_at.
-    - ``verify_dns_propagation`` checks all managed records.
+    - ``verify_dns_propagation`` checks all managed records concurrently
+      and stores the result on the domain.
+    - ``get_dns_status`` answers from the stored result; only a domain
+      that was never checked (or whose managed records changed since) is
+      checked live.
+    - ``claim_due_domains_sync`` and ``check_claimed_domains_sync``
+      (Beat, every minute) re-check due domains: pending ones are
+      verified once their TXT record resolves, verified and active ones
+      have their managed records re-checked, and expired SSL certificates
+      are flagged.
     - CRUD operations on dns_records use the DnsRecordEntry model.
     - Deleting a managed record is allowed but triggers a warning log.
 
@@ -29,15 +54,102 @@ propagation verification.
     also manually manage DNS records if you prefer more control.
 """
 
+import asyncio
+import logging
+import random
 import uuid
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, lazyload
 
+from app.config import settings
+from app.http_client import run_async
 from app.models.domain import CustomDomain, DnsRecordEntry, DnsRecordType, DomainStatus
 from app.services.dns.base import DnsRecord
 from app.services.dns.factory import get_dns_provider
+from app.services.storefront_routing_service import publish_domain_route
+
+logger = logging.getLogger(__name__)
+
+# A propagation check: (domain name, record type, expected value).
+PropagationCheck = tuple[str, DnsRecordType, str]
+
+
+async def check_propagation(checks: list[PropagationCheck]) -> list[bool]:
+    """Run propagation checks concurrently against the DNS provider.
+
+    At most ``settings.dns_propagation_concurrency`` lookups are in flight
+    at once. A lookup that raises counts as not propagated.
+
+    Args:
+        checks: ``(domain, record_type, expected_value)`` tuples.
+
+    Returns:
+        One result per check, in the order of ``checks``.
+    """
+    provider = get_dns_provider()
+    slots = asyncio.Semaphore(settings.dns_propagation_concurrency)
+
+    async def _check(domain: str, record_type: DnsRecordType, value: str) -> bool:
+        async with slots:
+            try:
+                return await provider.verify_propagation(domain, record_type, value)
+            except Exception as exc:
+                logger.warning(
+                    "Propagation check failed: domain=%s type=%s error=%s",
+                    domain, record_type.value, exc,
+                )
+                return False
+
+    return list(await asyncio.gather(*(_check(*check) for check in checks)))
+
+
+def _health_check_delay(failures: int) -> timedelta:
+    """Compute when a domain is due for its next health check.
+
+    Args:
+        failures: Consecutive failed checks (0 after a healthy one).
+
+    Returns:
+        ``domain_health_interval_seconds`` for a healthy domain, otherwise
+        ``domain_health_retry_base_seconds * 2 ** (failures - 1)`` capped
+        at ``domain_health_retry_max_seconds``; both with ±10% jitter so
+        domains added together are not re-checked in lockstep.
+    """
+    if failures == 0:
+        seconds = settings.domain_health_interval_seconds
+    else:
+        seconds = min(
+            settings.domain_health_retry_base_seconds * 2 ** min(failures - 1, 30),
+            settings.domain_health_retry_max_seconds,
+        )
+    return timedelta(seconds=seconds * random.uniform(0.9, 1.1))
+
+
+def _record_health_check(domain: CustomDomain, healthy: bool, now: datetime) -> None:
+    """Store a check's outcome and schedule the domain's next check."""
+    domain.dns_checked_at = now
+    domain.dns_check_failures = 0 if healthy else domain.dns_check_failures + 1
+    domain.dns_next_check_at = now + _health_check_delay(domain.dns_check_failures)
+
+
+def mark_dns_unchecked(domain: CustomDomain) -> None:
+    """Discard a domain's cached propagation result and make it due now.
+
+    Call after changing the domain's managed records or status, so the
+    next status request or health sweep checks the current records.
+
+    Args:
+        domain: The CustomDomain (flushed by the caller).
+    """
+    domain.dns_propagated = None
+    domain.dns_checked_at = None
+    domain.dns_check_failures = 0
+    domain.dns_next_check_at = None
 
 
 async def auto_configure_dns(
@@ -60,8 +172,6 @@ async def auto_configure_dns(
     Raises:
         ValueError: If the domain is not found.
     """
-    from app.config import settings
-
     result = await db.execute(
         select(CustomDomain).where(CustomDomain.id == domain_id)
     )
@@ -120,6 +230,7 @@ async def auto_configure_dns(
     domain.dns_provider = mode
     domain.dns_zone_id = zone_id
     domain.auto_dns_configured = True
+    mark_dns_unchecked(domain)
 
     await db.flush()
     await db.refresh(a_entry)
@@ -165,6 +276,7 @@ async def provision_ssl(
 
     await db.flush()
     await db.refresh(domain)
+    publish_domain_route(db, domain)
     return domain
 
 
@@ -174,8 +286,9 @@ async def verify_dns_propagation(
 ) -> dict:
     """Check if DNS records for a domain have propagated globally.
 
-    Verifies each managed DNS record via the DNS provider's
-    verify_propagation method.
+    Verifies all managed DNS records concurrently via the DNS provider's
+    verify_propagation method, stores the result on the domain (served by
+    ``get_dns_status``), and schedules the domain's next health check.
 
     Args:
         db: Async database session.
@@ -211,25 +324,25 @@ async def verify_dns_propagation(
             "details": [],
         }
 
-    provider = get_dns_provider()
-    details = []
-    verified_count = 0
-
-    for record in records:
-        is_propagated = await provider.verify_propagation(
-            domain.domain, record.record_type, record.value
-        )
-        details.append({
+    results = await check_propagation(
+        [(domain.domain, record.record_type, record.value) for record in records]
+    )
+    details = [
+        {
             "record_type": record.record_type.value,
             "name": record.name,
             "value": record.value,
             "propagated": is_propagated,
-        })
-        if is_propagated:
-            verified_count += 1
-
+        }
+        for record, is_propagated in zip(records, results)
+    ]
+    verified_count = sum(results)
     all_propagated = verified_count == len(records)
 
+    domain.dns_propagated = all_propagated
+    _record_health_check(domain, all_propagated, datetime.now(timezone.utc))
+    await db.flush()
+
     return {
         "propagated": all_propagated,
         "total_records": len(records),
@@ -238,6 +351,13 @@ async def verify_dns_propagation(
     }
 
 
+async def _mark_record_domain_unchecked(db: AsyncSession, entry: DnsRecordEntry) -> None:
+    """Invalidate the cached propagation result of a record's domain."""
+    domain = await db.get(CustomDomain, entry.domain_id)
+    if domain is not None:
+        mark_dns_unchecked(domain)
+
+
 async def create_dns_record(
     db: AsyncSession,
     domain_id: uuid.UUID,
@@ -395,6 +515,9 @@ async def update_dns_record(
             )
             await provider.update_record(zone_id, entry.provider_record_id, dns_record)
 
+    if entry.is_managed:
+        await _mark_record_domain_unchecked(db, entry)
+
     await db.flush()
     await db.refresh(entry)
     return entry
@@ -434,6 +557,9 @@ async def delete_dns_record(
             zone_id = domain.dns_zone_id or await provider.get_zone_id(domain.domain)
             await provider.delete_record(zone_id, entry.provider_record_id)
 
+    if entry.is_managed:
+        await _mark_record_domain_unchecked(db, entry)
+
     await db.delete(entry)
     await db.flush()
     return True
@@ -468,12 +594,214 @@ async def get_dns_status(
     )
     records = list(records_result.scalars().all())
 
-    propagation = await verify_dns_propagation(db, domain_id)
+    if domain.dns_checked_at is None:
+        propagated = (await verify_dns_propagation(db, domain_id))["propagated"]
+    else:
+        propagated = bool(domain.dns_propagated)
 
     return {
         "domain": domain.domain,
         "dns_configured": domain.auto_dns_configured,
         "ssl_provisioned": domain.ssl_provisioned,
         "records_count": len(records),
-        "propagation_status": "propagated" if propagation["propagated"] else "pending",
+        "propagation_status": "propagated" if propagated else "pending",
+        "checked_at": domain.dns_checked_at,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Background health sweep (Celery)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DomainHealthClaim:
+    """A due domain leased by a health sweep, with the checks to run.
+
+    Attributes:
+        status: The domain's status when it was claimed.
+        lease_until: The ``dns_next_check_at`` the claim wrote; any other
+            value at write-back means the domain changed meanwhile.
+        checks: Propagation checks for the domain: its verification TXT
+            record while pending, otherwise its managed records.
+    """
+
+    status: DomainStatus
+    lease_until: datetime
+    checks: list[PropagationCheck]
+
+
+def claim_due_domains_sync(
+    session: Session, limit: int | None = None
+) -> dict[uuid.UUID, DomainHealthClaim]:
+    """Lease the domains whose next health check is due.
+
+    Claimed domains get ``dns_next_check_at`` pushed forward by
+    ``settings.domain_health_claim_seconds``, so once the caller commits,
+    concurrent sweeps skip them without any lock being held while their
+    DNS lookups run. A sweep that dies mid-batch has its domains picked
+    up again when the lease runs out.
+
+    Args:
+        session: Sync database session (not committed).
+        limit: Maximum domains to claim (defaults to
+            ``settings.domain_health_batch_size``).
+
+    Returns:
+        The claims, keyed by CustomDomain UUID.
+    """
+    now = datetime.now(timezone.utc)
+    due = (
+        select(CustomDomain.id)
+        .where(
+            CustomDomain.status.in_(
+                (DomainStatus.pending, DomainStatus.verified, DomainStatus.active)
+            ),
+            or_(
+                CustomDomain.dns_next_check_at.is_(None),
+                CustomDomain.dns_next_check_at <= now,
+            ),
+        )
+        .order_by(CustomDomain.dns_next_check_at.asc().nulls_first())
+        .limit(limit or settings.domain_health_batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    rows = session.execute(
+        update(CustomDomain)
+        .where(CustomDomain.id.in_(due.scalar_subquery()))
+        .values(
+            dns_next_check_at=now + timedelta(seconds=settings.domain_health_claim_seconds)
+        )
+        .returning(
+            CustomDomain.id,
+            CustomDomain.domain,
+            CustomDomain.status,
+            CustomDomain.verification_token,
+            CustomDomain.dns_next_check_at,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    if not rows:
+        return {}
+
+    managed: dict[uuid.UUID, list[PropagationCheck]] = defaultdict(list)
+    for domain_id, name, record_type, value in session.execute(
+        select(
+            DnsRecordEntry.domain_id,
+            CustomDomain.domain,
+            DnsRecordEntry.record_type,
+            DnsRecordEntry.value,
+        )
+        .join(CustomDomain, CustomDomain.id == DnsRecordEntry.domain_id)
+        .where(
+            DnsRecordEntry.domain_id.in_([row[0] for row in rows]),
+            DnsRecordEntry.is_managed.is_(True),
+        )
+        .order_by(DnsRecordEntry.created_at)
+    ):
+        managed[domain_id].append((name, record_type, value))
+
+    return {
+        domain_id: DomainHealthClaim(
+            status=status,
+            lease_until=lease_until,
+            checks=(
+                [(name, DnsRecordType.TXT, token)]
+                if status == DomainStatus.pending
+                else managed[domain_id]
+            ),
+        )
+        for domain_id, name, status, token, lease_until in rows
     }
+
+
+def check_claimed_domains_sync(
+    session: Session, claimed: dict[uuid.UUID, DomainHealthClaim]
+) -> dict:
+    """Run the claimed domains' checks and record their results.
+
+    Call with the claim committed; all propagation checks run in one
+    concurrent batch before this session touches the database again.
+    The domains are then re-read and locked, and a domain whose status
+    or ``dns_next_check_at`` no longer matches its claim (its records or
+    status changed, or it was checked by a request meanwhile) is left
+    alone: it is already due again or has a fresher result. Otherwise:
+
+    - ``pending``: if the verification token resolves as a TXT record,
+      the domain becomes ``verified`` and its storefront route is
+      published.
+    - ``verified`` / ``active``: the managed records' propagation result
+      is stored. A domain without managed records has nothing to check
+      and is looked at again after the healthy interval.
+    - ``active`` with an expired certificate: ``ssl_provisioned`` is
+      cleared and the domain falls back to ``verified`` (it stays
+      routable, but needs a new certificate).
+
+    Args:
+        session: Sync database session (not committed).
+        claimed: Result of ``claim_due_domains_sync``.
+
+    Returns:
+        Dict with ``checked``, ``verified``, ``propagated``, ``failing``,
+        and ``ssl_expired`` counts.
+    """
+    counts = {"checked": 0, "verified": 0, "propagated": 0, "failing": 0, "ssl_expired": 0}
+    if not claimed:
+        return counts
+
+    checks: list[PropagationCheck] = []
+    spans: dict[uuid.UUID, tuple[int, int]] = {}
+    for domain_id, claim in claimed.items():
+        spans[domain_id] = (len(checks), len(checks) + len(claim.checks))
+        checks.extend(claim.checks)
+    results = run_async(check_propagation(checks)) if checks else []
+
+    now = datetime.now(timezone.utc)
+    domains = session.execute(
+        select(CustomDomain)
+        .where(CustomDomain.id.in_(list(claimed)))
+        .order_by(CustomDomain.id)
+        .options(lazyload(CustomDomain.store), lazyload(CustomDomain.dns_records))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).scalars().all()
+    for domain in domains:
+        claim = claimed[domain.id]
+        if domain.status != claim.status or domain.dns_next_check_at != claim.lease_until:
+            continue
+        counts["checked"] += 1
+        if (
+            domain.status == DomainStatus.active
+            and domain.ssl_expires_at is not None
+            and domain.ssl_expires_at <= now
+        ):
+            domain.ssl_provisioned = False
+            domain.status = DomainStatus.verified
+            counts["ssl_expired"] += 1
+
+        start, end = spans[domain.id]
+        if start == end:
+            # Verified without managed records: nothing to check yet.
+            domain.dns_check_failures = 0
+            domain.dns_next_check_at = now + _health_check_delay(0)
+            continue
+
+        healthy = all(results[start:end])
+        if domain.status == DomainStatus.pending:
+            if healthy:
+                domain.status = DomainStatus.verified
+                domain.verified_at = now
+                publish_domain_route(session, domain)
+                counts["verified"] += 1
+                # Its records are checked on the next sweep.
+                mark_dns_unchecked(domain)
+                continue
+        else:
+            domain.dns_propagated = healthy
+            if healthy:
+                counts["propagated"] += 1
+        if not healthy:
+            counts["failing"] += 1
+        _record_health_check(domain, healthy, now)
+
+    return counts
@@ -40,6 +40,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.domain import CustomDomain, DomainStatus
 from app.services.domain_registrar.base import DomainSearchResult
 from app.services.domain_registrar.factory import get_domain_provider
+from app.services.storefront_routing_service import publish_domain_route
 
 
 async def search_available_domains(
@@ -170,6 +171,7 @@ async def purchase_domain(
     db.add(custom_domain)
     await db.flush()
     await db.refresh(custom_domain)
+    publish_domain_route(db, custom_domain)
 
     # 3. Set nameservers to platform
     platform_ns_str = getattr(
@@ -34,7 +34,9 @@ import uuid
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.store import Store, StoreStatus
+from app.services.dns_management_service import mark_dns_unchecked
+from app.services.store_access_service import verify_store_ownership
+from app.services.storefront_routing_service import publish_domain_route
 
 
 # ---------------------------------------------------------------------------
@@ -53,32 +55,6 @@ _DOMAIN_REGEX = re.compile(
 )
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_domain(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -105,7 +81,7 @@ async def create_domain(
             the domain format is invalid, or the store already has a
             custom domain.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Validate domain format
     domain = domain.lower().strip()
@@ -165,7 +141,7 @@ async def get_domain(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(CustomDomain).where(CustomDomain.store_id == store_id)
@@ -197,7 +173,7 @@ async def verify_domain(
         ValueError: If the store doesn't exist, belongs to another user,
             or no custom domain is configured.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(CustomDomain).where(CustomDomain.store_id == store_id)
@@ -227,8 +203,10 @@ async def verify_domain(
 
     if verified:
         custom_domain.status = DomainStatus.verified
+        mark_dns_unchecked(custom_domain)
         await db.flush()
         await db.refresh(custom_domain)
+        publish_domain_route(db, custom_domain)
         return {
             "verified": True,
             "domain": custom_domain.domain,
@@ -261,7 +239,7 @@ async def delete_domain(
         ValueError: If the store doesn't exist, belongs to another user,
             or no custom domain is configured.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(CustomDomain).where(CustomDomain.store_id == store_id)
@@ -272,3 +250,4 @@ async def delete_domain(
 
     await db.delete(custom_domain)
     await db.flush()
+    publish_domain_route(db, custom_domain, deleted=True)
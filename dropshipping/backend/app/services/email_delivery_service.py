@@ -0,0 +1,325 @@
+"""Batched transactional email delivery over pooled SMTP connections.
+
+Rendered emails are queued in a Redis list (the outbox) and sent in
+batches over a small pool of persistent SMTP connections, instead of one
+SMTP session (connect, TLS handshake, login, quit) per email.
+
+**For Developers:**
+    - ``queue_email`` / ``queue_email_async`` append an ``OutgoingEmail``
+      to ``settings.email_outbox_key`` and, at most once per
+      ``settings.email_batch_window_seconds``, schedule the
+      ``flush_email_outbox`` task. Everything queued within the window is
+      sent by that one flush.
+    - ``flush_outbox_sync`` pops up to ``settings.email_batch_size``
+      emails at a time and hands them to ``send_emails``. Failed emails
+      are pushed back with their attempt count raised and picked up by
+      the next flush (Beat runs one every 30 seconds); after
+      ``settings.email_max_attempts`` they are dropped and logged.
+    - ``SmtpPool`` keeps up to ``settings.smtp_pool_size`` open
+      ``aiosmtplib`` connections per worker thread (on the event loop of
+      ``app.http_client.run_async``). A batch is split into one
+      contiguous chunk per connection; each connection sends its chunk
+      message after message, connections run in parallel. A connection
+      the server dropped is replaced once per message.
+    - Popped emails are not tracked while they are being sent: a worker
+      killed mid-batch loses that batch rather than sending it twice.
+
+**For QA Engineers:**
+    - With ``email_backend = "log"`` (the default) nothing is queued or
+      sent; ``EmailService`` logs the emails instead.
+    - A recipient the relay refuses fails only that email, not the batch.
+
+**For Project Managers:**
+    Order confirmations and other emails go out in bulk over warm
+    connections, so one worker sends many times more emails per second.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from dataclasses import asdict, dataclass, replace
+from email.message import EmailMessage
+
+import aiosmtplib
+from redis import Redis
+
+from app.config import settings
+from app.http_client import run_async
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+FLUSH_KICK_KEY = "email:outbox:flush-kick"
+
+# Pools are bound to the event loop of ``run_async``, which is per thread.
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """A rendered email waiting in the outbox.
+
+    Attributes:
+        to: Recipient address.
+        subject: Subject line.
+        html: Rendered HTML body.
+        template_name: Template the body was rendered from (for logs).
+        attempts: Failed send attempts so far.
+    """
+
+    to: str
+    subject: str
+    html: str
+    template_name: str = ""
+    attempts: int = 0
+
+    def to_json(self) -> str:
+        """Serialize for the Redis outbox."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "OutgoingEmail":
+        """Deserialize an outbox entry."""
+        return cls(**json.loads(raw))
+
+    def to_mime(self) -> EmailMessage:
+        """Build the MIME message sent over SMTP."""
+        message = EmailMessage()
+        message["From"] = settings.email_from_address
+        message["To"] = self.to
+        message["Subject"] = self.subject
+        message.set_content(self.html, subtype="html")
+        return message
+
+
+# ---------------------------------------------------------------------------
+# Outbox
+# ---------------------------------------------------------------------------
+
+
+def _schedule_flush() -> None:
+    """Schedule the flush task at the end of the current batch window."""
+    from app.tasks.email_tasks import flush_email_outbox
+
+    flush_email_outbox.apply_async(countdown=settings.email_batch_window_seconds)
+
+
+def queue_email(email: OutgoingEmail, redis: Redis | None = None) -> bool:
+    """Add an email to the outbox.
+
+    Args:
+        email: The rendered email.
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        True if this call scheduled the next flush.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    redis = redis or get_sync_redis()
+    redis.rpush(settings.email_outbox_key, email.to_json())
+    if redis.set(FLUSH_KICK_KEY, "1", nx=True, ex=settings.email_batch_window_seconds):
+        _schedule_flush()
+        return True
+    return False
+
+
+async def queue_email_async(email: OutgoingEmail) -> bool:
+    """Add an email to the outbox from async (API) code.
+
+    Args:
+        email: The rendered email.
+
+    Returns:
+        True if this call scheduled the next flush.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    redis = get_redis()
+    await redis.rpush(settings.email_outbox_key, email.to_json())
+    if await redis.set(FLUSH_KICK_KEY, "1", nx=True, ex=settings.email_batch_window_seconds):
+        _schedule_flush()
+        return True
+    return False
+
+
+def flush_outbox_sync(redis: Redis | None = None) -> dict:
+    """Send everything waiting in the outbox, batch by batch.
+
+    Args:
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        Dict with ``batches``, ``sent``, ``requeued`` and ``dropped``
+        counts.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    redis = redis or get_sync_redis()
+    totals = {"batches": 0, "sent": 0, "requeued": 0, "dropped": 0}
+    retry: list[OutgoingEmail] = []
+    for _ in range(settings.email_max_batches_per_flush):
+        raw = redis.lpop(settings.email_outbox_key, settings.email_batch_size)
+        if not raw:
+            break
+        emails = []
+        for entry in raw:
+            try:
+                emails.append(OutgoingEmail.from_json(entry))
+            except (TypeError, ValueError):
+                logger.error("Dropping unreadable outbox entry: %.200s", entry)
+                totals["dropped"] += 1
+
+        results = send_emails(emails)
+        totals["batches"] += 1
+        for email, sent in zip(emails, results):
+            if sent:
+                totals["sent"] += 1
+            elif email.attempts + 1 < settings.email_max_attempts:
+                retry.append(replace(email, attempts=email.attempts + 1))
+            else:
+                logger.error(
+                    "Giving up on email to=%s template=%s after %d attempts",
+                    email.to, email.template_name, email.attempts + 1,
+                )
+                totals["dropped"] += 1
+        if len(raw) < settings.email_batch_size:
+            break
+
+    # Pushed back after the loop so a failing relay is not retried at once.
+    if retry:
+        redis.rpush(settings.email_outbox_key, *(email.to_json() for email in retry))
+        totals["requeued"] = len(retry)
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# SMTP
+# ---------------------------------------------------------------------------
+
+
+class SmtpPool:
+    """Persistent SMTP connections shared by the batches of one thread.
+
+    Attributes:
+        size: Maximum number of connections used for one batch.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Create an empty pool; connections open on first use."""
+        self.size = max(size, 1)
+        self._idle: list[aiosmtplib.SMTP] = []
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """Take an idle open connection or open a new one."""
+        while self._idle:
+            smtp = self._idle.pop()
+            if smtp.is_connected:
+                return smtp
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            username=settings.smtp_username or None,
+            password=settings.smtp_password or None,
+            start_tls=settings.smtp_start_tls,
+            timeout=settings.smtp_timeout_seconds,
+        )
+        await smtp.connect()
+        return smtp
+
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        """Return a connection to the pool if it is still open."""
+        if smtp.is_connected:
+            self._idle.append(smtp)
+
+    async def _send_chunk(self, messages: list[EmailMessage]) -> list[bool]:
+        """Send messages one after another over a single connection."""
+        results = [False] * len(messages)
+        smtp = None
+        retried = False
+        index = 0
+        try:
+            while index < len(messages):
+                if smtp is None:
+                    smtp = await self._acquire()
+                try:
+                    await smtp.send_message(messages[index])
+                    results[index] = True
+                except OSError as exc:
+                    # Connection dropped or timed out: retry once on a new one.
+                    smtp.close()
+                    smtp = None
+                    if not retried:
+                        retried = True
+                        continue
+                    logger.warning("SMTP send failed to=%s: %s", messages[index]["To"], exc)
+                except aiosmtplib.SMTPException as exc:
+                    logger.warning("SMTP refused to=%s: %s", messages[index]["To"], exc)
+                retried = False
+                index += 1
+        except (OSError, aiosmtplib.SMTPException) as exc:
+            logger.warning(
+                "SMTP connection failed, %d emails not sent: %s", len(messages) - index, exc
+            )
+        finally:
+            if smtp is not None:
+                self._release(smtp)
+        return results
+
+    async def send_batch(self, messages: list[EmailMessage]) -> list[bool]:
+        """Send a batch split across up to ``size`` connections.
+
+        Args:
+            messages: MIME messages to send.
+
+        Returns:
+            Per-message success flags, in input order.
+        """
+        if not messages:
+            return []
+        chunk_size = -(-len(messages) // self.size)
+        chunks = [messages[i:i + chunk_size] for i in range(0, len(messages), chunk_size)]
+        results = await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks))
+        return [sent for chunk in results for sent in chunk]
+
+    async def close(self) -> None:
+        """Politely close every idle connection."""
+        idle, self._idle = self._idle, []
+        for smtp in idle:
+            try:
+                await smtp.quit()
+            except (OSError, aiosmtplib.SMTPException):
+                smtp.close()
+
+
+def get_smtp_pool() -> SmtpPool:
+    """Get or create this thread's SMTP connection pool."""
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = SmtpPool(settings.smtp_pool_size)
+        _local.pool = pool
+    return pool
+
+
+def reset_smtp_pool() -> None:
+    """Close and drop this thread's SMTP connection pool."""
+    pool = getattr(_local, "pool", None)
+    if pool is not None:
+        run_async(pool.close())
+    _local.pool = None
+
+
+def send_emails(emails: list[OutgoingEmail]) -> list[bool]:
+    """Send emails now over this thread's SMTP pool.
+
+    Args:
+        emails: Rendered emails.
+
+    Returns:
+        Per-email success flags, in input order.
+    """
+    return run_async(get_smtp_pool().send_batch([email.to_mime() for email in emails]))
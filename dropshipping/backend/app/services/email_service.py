@@ -8,10 +8,23 @@ and team invitations.
 **For Developers:**
     The ``EmailService`` class uses Jinja2 templates from
     ``app/templates/email/`` for HTML email rendering. In dev mode
-    (``dev_mode=True``), emails are logged to stdout instead of being
-    sent over SMTP. The singleton instance ``email_service`` should be
-    imported and used directly. Template files are loaded lazily and
-    fall back to plain-text if the template directory doesn't exist.
+    (``settings.email_backend == "log"``), emails are logged to stdout
+    instead of being sent over SMTP. The singleton instance
+    ``email_service`` should be imported and used directly. Template
+    files are loaded lazily and fall back to plain-text if the template
+    directory doesn't exist.
+
+    All instances share one process-wide Jinja2 environment
+    (``get_template_env``), so each template is parsed once per process
+    and its compiled code is kept in memory. Compiled bytecode is also
+    written to ``settings.email_template_cache_dir``, so freshly started
+    workers skip compilation too. Template files are only re-checked for
+    changes when ``settings.debug`` is on.
+
+    Outside dev mode, ``send_email`` (async, API) and ``send_email_sync``
+    (Celery workers) queue the rendered email in the outbox of
+    ``email_delivery_service``, which sends queued emails in batches over
+    pooled SMTP connections.
 
 **For QA Engineers:**
     - In dev mode, no emails are actually sent -- check the application
@@ -35,10 +48,62 @@ and team invitations.
 """
 
 import logging
+import os
+from pathlib import Path
 from typing import Any
 
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.services.email_delivery_service import (
+    OutgoingEmail,
+    queue_email,
+    queue_email_async,
+    send_emails,
+)
+
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+_template_env = None
+_template_env_loaded = False
+
+
+def get_template_env():
+    """Get or create the process-wide Jinja2 environment for email templates.
+
+    Returns:
+        A ``jinja2.Environment`` with a bytecode cache, or None if Jinja2
+        could not be initialised.
+    """
+    global _template_env, _template_env_loaded
+    if not _template_env_loaded:
+        _template_env_loaded = True
+        try:
+            from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+            os.makedirs(settings.email_template_cache_dir, exist_ok=True)
+            _template_env = Environment(
+                loader=FileSystemLoader(TEMPLATE_DIR),
+                autoescape=True,
+                bytecode_cache=FileSystemBytecodeCache(settings.email_template_cache_dir),
+                auto_reload=settings.debug,
+            )
+        except Exception:
+            logger.warning(
+                "Could not initialise Jinja2 email templates. "
+                "Emails will use plain-text fallback."
+            )
+    return _template_env
+
+
+def reset_template_env() -> None:
+    """Drop the cached environment so the next call creates a fresh one."""
+    global _template_env, _template_env_loaded
+    _template_env = None
+    _template_env_loaded = False
+
 
 class EmailService:
     """Centralised transactional email service.
@@ -55,23 +120,11 @@ class EmailService:
     def __init__(self) -> None:
         """Initialise the email service.
 
-        Attempts to load Jinja2 templates from ``app/templates/email/``.
-        Falls back gracefully if the directory doesn't exist.
+        Uses the shared Jinja2 environment for ``app/templates/email/``.
+        Falls back gracefully if it could not be created.
         """
-        self.dev_mode = True  # In dev, log instead of sending
-        self.template_env = None
-
-        try:
-            from jinja2 import Environment, FileSystemLoader
-            self.template_env = Environment(
-                loader=FileSystemLoader("app/templates/email"),
-                autoescape=True,
-            )
-        except Exception:
-            logger.warning(
-                "Could not initialise Jinja2 email templates. "
-                "Emails will use plain-text fallback."
-            )
+        self.dev_mode = settings.email_backend == "log"  # In dev, log instead of sending
+        self.template_env = get_template_env()
 
     def _render_template(
         self, template_name: str, context: dict[str, Any]
@@ -112,8 +165,8 @@ class EmailService:
         """Send a transactional email.
 
         In dev mode, logs the email content instead of sending via SMTP.
-        In production, this would use an SMTP client or email API service
-        (e.g. SendGrid, AWS SES, Mailgun).
+        Otherwise the rendered email is queued in the outbox and sent by
+        the next batched flush.
 
         Args:
             to: Recipient email address.
@@ -122,7 +175,7 @@ class EmailService:
             context: Template variables dict.
 
         Returns:
-            True if the email was sent (or logged) successfully, False
+            True if the email was queued (or logged) successfully, False
             if an error occurred.
         """
         try:
@@ -143,27 +196,50 @@ class EmailService:
                 )
                 return True
 
-            # Production: send via SMTP
-            # import smtplib
-            # from email.mime.text import MIMEText
-            # from email.mime.multipart import MIMEMultipart
-            #
-            # msg = MIMEMultipart("alternative")
-            # msg["Subject"] = subject
-            # msg["From"] = settings.email_from_address
-            # msg["To"] = to
-            # msg.attach(MIMEText(html_body, "html"))
-            #
-            # with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-            #     server.starttls()
-            #     server.login(settings.smtp_user, settings.smtp_password)
-            #     server.send_message(msg)
-
+            await queue_email_async(
+                OutgoingEmail(to=to, subject=subject, html=html_body, template_name=template_name)
+            )
             return True
         except Exception as e:
             logger.error("Failed to send email to %s: %s", to, str(e))
             return False
 
+    def send_email_sync(
+        self,
+        to: str,
+        subject: str,
+        template_name: str,
+        context: dict[str, Any],
+    ) -> bool:
+        """Send a transactional email from a Celery worker.
+
+        In dev mode the email is only rendered (the calling task logs
+        it). Otherwise it is queued for the next batched flush; if Redis
+        is unavailable it is sent straight away over the worker's SMTP
+        pool.
+
+        Args:
+            to: Recipient email address.
+            subject: Email subject line.
+            template_name: The Jinja2 template filename.
+            context: Template variables dict.
+
+        Returns:
+            True if the email was queued or sent (or logged), False if
+            the immediate send failed.
+        """
+        html_body = self._render_template(template_name, context)
+        if self.dev_mode:
+            return True
+
+        email = OutgoingEmail(to=to, subject=subject, html=html_body, template_name=template_name)
+        try:
+            queue_email(email)
+            return True
+        except RedisError as exc:
+            logger.warning("Email outbox unavailable, sending directly: %s", exc)
+            return send_emails([email])[0]
+
     async def send_order_confirmation(
         self,
         order: Any,
@@ -0,0 +1,17 @@
+"""Exchange-rate source abstraction package.
+
+Provides a unified interface for fetching currency exchange rates from a
+live API, a local JSON file, or the built-in static table used in
+development and testing.
+"""
+
+from app.services.exchange_rates.base import AbstractRateSource, RateQuote
+from app.services.exchange_rates.factory import get_rate_source
+from app.services.exchange_rates.static import StaticRateSource
+
+__all__ = [
+    "AbstractRateSource",
+    "RateQuote",
+    "StaticRateSource",
+    "get_rate_source",
+]
@@ -0,0 +1,101 @@
+"""Abstract exchange-rate source and the rate quote it returns.
+
+**For Developers:**
+    Subclass ``AbstractRateSource`` to add a new rate provider. Sources
+    only fetch; the refresh task in ``currency_service`` validates the
+    quote and publishes it to Redis. ``RateQuote.from_payload`` parses the
+    ``{"base": ..., "rates": {...}}`` JSON shape used by most rate APIs
+    (Open Exchange Rates, exchangerate.host) and by the file source.
+
+**For QA Engineers:**
+    - Rates are parsed as ``Decimal`` from their string form, so no float
+      rounding creeps in.
+    - Non-positive or unparseable rates are dropped; the base currency is
+      always present with rate 1.
+
+**For Project Managers:**
+    This abstraction lets the platform switch exchange-rate providers via
+    a single config value.
+
+**For End Users:**
+    Prices shown in other currencies use rates refreshed from the
+    platform's rate provider.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateQuote:
+    """Exchange rates relative to one base currency.
+
+    Attributes:
+        base: ISO 4217 code the rates are relative to.
+        rates: Units of each currency per one unit of ``base``.
+        as_of: When the provider published the rates.
+    """
+
+    base: str
+    rates: dict[str, Decimal]
+    as_of: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "RateQuote":
+        """Parse a ``{"base": "USD", "rates": {"EUR": 0.92, ...}}`` payload.
+
+        An optional ``timestamp`` (Unix seconds) sets ``as_of``.
+
+        Args:
+            payload: Decoded JSON from a rate provider or file.
+
+        Returns:
+            The parsed quote.
+
+        Raises:
+            ValueError: If the payload has no rates.
+        """
+        base = str(payload.get("base") or "USD").upper()
+        rates: dict[str, Decimal] = {}
+        for code, value in (payload.get("rates") or {}).items():
+            try:
+                rate = Decimal(str(value))
+            except InvalidOperation:
+                rate = Decimal("0")
+            if rate > 0 and rate.is_finite():
+                rates[str(code).upper()] = rate
+            else:
+                logger.warning("Ignoring invalid exchange rate %s=%r", code, value)
+        if not rates:
+            raise ValueError("Exchange rate payload has no rates")
+        rates[base] = Decimal("1")
+
+        quote = cls(base=base, rates=rates)
+        if payload.get("timestamp"):
+            quote.as_of = datetime.fromtimestamp(int(payload["timestamp"]), timezone.utc)
+        return quote
+
+
+class AbstractRateSource(ABC):
+    """Base exchange-rate source interface.
+
+    Methods:
+        fetch_rates: Fetch the provider's current rates.
+    """
+
+    @abstractmethod
+    async def fetch_rates(self) -> RateQuote:
+        """Fetch the current exchange rates.
+
+        Returns:
+            The provider's latest quote.
+
+        Raises:
+            ValueError: If the provider returned unusable data.
+            OSError: If the provider could not be reached.
+        """
@@ -0,0 +1,43 @@
+"""Exchange-rate source factory.
+
+**For Developers:**
+    Call ``get_rate_source()`` to obtain a source instance. The mode is
+    read from ``settings.exchange_rate_source``. Supported modes:
+    ``static``, ``file`` (``settings.exchange_rate_file``), ``http``
+    (``settings.exchange_rate_url``).
+
+**For QA Engineers:**
+    - Tests and development default to ``"static"``.
+    - Unknown modes fall back to the static source.
+
+**For Project Managers:**
+    Switching rate providers is a single config value.
+
+**For End Users:**
+    No setup is required; the platform picks the configured provider.
+"""
+
+from app.services.exchange_rates.base import AbstractRateSource
+from app.services.exchange_rates.static import StaticRateSource
+
+
+def get_rate_source() -> AbstractRateSource:
+    """Create and return the configured exchange-rate source.
+
+    Returns:
+        An instance of AbstractRateSource matching the configured mode.
+    """
+    from app.config import settings
+
+    mode = settings.exchange_rate_source
+
+    if mode == "file":
+        from app.services.exchange_rates.file import FileRateSource
+
+        return FileRateSource(settings.exchange_rate_file)
+    elif mode == "http":
+        from app.services.exchange_rates.http import HttpRateSource
+
+        return HttpRateSource(settings.exchange_rate_url)
+
+    return StaticRateSource()
@@ -0,0 +1,44 @@
+"""File-based exchange-rate source.
+
+**For Developers:**
+    Reads a JSON file in the ``{"base": "USD", "rates": {...}}`` shape on
+    every fetch. Useful for air-gapped deployments (a cron job drops the
+    file) and as a fixture in tests.
+
+**For QA Engineers:**
+    - Edit the file and run ``refresh_exchange_rates`` to publish new rates.
+    - A missing file raises ``OSError``; the previous snapshot stays live.
+
+**For Project Managers:**
+    Lets operators supply exchange rates without a rate provider account.
+
+**For End Users:**
+    No action required; rates are managed by the platform operator.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+from app.services.exchange_rates.base import AbstractRateSource, RateQuote
+
+
+class FileRateSource(AbstractRateSource):
+    """Rate source reading a local JSON file.
+
+    Attributes:
+        path: Path of the JSON rate file.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the file source.
+
+        Args:
+            path: Path of the JSON rate file.
+        """
+        self.path = Path(path)
+
+    async def fetch_rates(self) -> RateQuote:
+        """Read and parse the rate file."""
+        text = await asyncio.to_thread(self.path.read_text, encoding="utf-8")
+        return RateQuote.from_payload(json.loads(text))
@@ -0,0 +1,51 @@
+"""HTTP exchange-rate source.
+
+**For Developers:**
+    GETs ``url`` with the worker's pooled ``httpx`` client (see
+    ``app.http_client``) and parses the ``{"base": ..., "rates": {...}}``
+    response most rate APIs return. Put any API key in the URL's query
+    string (e.g. ``?app_id=...`` for Open Exchange Rates).
+
+**For QA Engineers:**
+    - Non-2xx responses raise ``OSError`` so the refresh keeps the previous
+      snapshot.
+
+**For Project Managers:**
+    Connects the platform to a commercial exchange-rate provider.
+
+**For End Users:**
+    Prices in other currencies follow the provider's published rates.
+"""
+
+import httpx
+
+from app.http_client import get_async_http_client
+from app.services.exchange_rates.base import AbstractRateSource, RateQuote
+
+
+class HttpRateSource(AbstractRateSource):
+    """Rate source fetching a JSON rate endpoint.
+
+    Attributes:
+        url: Endpoint returning the latest rates.
+    """
+
+    def __init__(self, url: str):
+        """Initialize the HTTP source.
+
+        Args:
+            url: Endpoint returning the latest rates.
+        """
+        self.url = url
+
+    async def fetch_rates(self) -> RateQuote:
+        """Fetch and parse the provider's latest rates.
+
+        Must run under ``app.http_client.run_async``.
+        """
+        try:
+            response = await get_async_http_client().get(self.url)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise OSError(f"Exchange rate request failed: {exc}") from exc
+        return RateQuote.from_payload(response.json())
@@ -0,0 +1,47 @@
+"""Static exchange-rate source for development and testing.
+
+**For Developers:**
+    Returns a fixed rate table, by default ``currency_service.EXCHANGE_RATES``
+    (the built-in USD-based table). Pass ``rates`` to use a fixture.
+
+**For QA Engineers:**
+    - Always succeeds and always returns the same rates.
+
+**For Project Managers:**
+    Lets development and CI run without a rate provider account.
+
+**For End Users:**
+    This source is used internally during development.
+"""
+
+from decimal import Decimal
+
+from app.services.exchange_rates.base import AbstractRateSource, RateQuote
+
+
+class StaticRateSource(AbstractRateSource):
+    """Rate source returning a fixed table.
+
+    Attributes:
+        base: The base currency of ``rates``.
+        rates: Currency code to rate mapping (None for the built-in table).
+    """
+
+    def __init__(self, rates: dict[str, float | Decimal] | None = None, base: str = "USD"):
+        """Initialize the static source.
+
+        Args:
+            rates: Rate table; defaults to the built-in USD table.
+            base: Currency the rates are relative to.
+        """
+        self.base = base
+        self.rates = rates
+
+    async def fetch_rates(self) -> RateQuote:
+        """Return the fixed table as a quote."""
+        rates = self.rates
+        if rates is None:
+            from app.services.currency_service import EXCHANGE_RATES
+
+            rates = EXCHANGE_RATES
+        return RateQuote.from_payload({"base": self.base, "rates": rates})
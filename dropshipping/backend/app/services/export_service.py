@@ -1,39 +1,284 @@
-"""CSV export service for orders, products, and customers.
+"""Streaming data export service for orders, products, and customers.
 
-Generates streaming CSV responses for data export from the dashboard.
-Each export function queries the database and yields CSV rows.
+Streams store data as CSV or NDJSON, optionally gzip-compressed, straight
+from a server-side cursor to the client, and writes the same output to
+files for background export jobs.
 
 **For Developers:**
-    Uses Python's ``csv`` module with ``io.StringIO`` for in-memory CSV
-    generation. Returns a generator of CSV string chunks for streaming
-    response support. Each function verifies store ownership before
-    querying.
+    ``open_export`` verifies store ownership up front, so the API can still
+    answer 404, and then returns an async generator of ``bytes`` chunks.
+    The generator reads rows with ``AsyncSession.stream_scalars`` and
+    ``yield_per``: PostgreSQL keeps a server-side cursor and the
+    application holds only one batch (``EXPORT_BATCH_SIZE`` rows) at a
+    time. Each batch is encoded into a single chunk so the first bytes
+    reach the client right away. ``lazyload("*")`` disables the models'
+    ``selectin`` relationships, which would otherwise eager-load stores,
+    items, and variants for every exported row.
+
+    ``write_export_sync`` is the sync counterpart used by the
+    ``export_tasks.generate_export`` Celery task. Both paths share the
+    dataset definitions in ``_DATASETS`` and the batch encoder, so streamed
+    and file exports are byte-identical.
+
+    Gzip output is produced incrementally with ``zlib.compressobj`` (gzip
+    container, ``wbits=31``); the stream never buffers the whole file.
 
 **For QA Engineers:**
     - Exported CSVs include headers as the first row.
-    - All monetary values are formatted to 2 decimal places.
+    - NDJSON exports have one JSON object per line and no header; keys
+      are snake_case and lists (tags, images) stay JSON arrays.
+    - All monetary values are formatted to 2 decimal places (strings in
+      NDJSON to preserve precision).
     - Datetime values are in ISO 8601 format.
-    - Empty/null fields appear as empty strings in CSV.
+    - Empty/null fields appear as empty strings in CSV and ``null`` in
+      NDJSON.
+    - Gzip downloads decompress to exactly the uncompressed export.
 
 **For Project Managers:**
     Implements Feature 5A (CSV Export) from the Phase 5 polish plan.
-    Supports exporting orders, products, and customers per store.
+    Exports start downloading immediately and use constant memory no
+    matter how large the store is; very large stores can request a
+    background export job and download the file when it is ready.
 
 @module services/export_service
 """
 
 import csv
+import enum
 import io
+import json
 import uuid
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterable
+from datetime import datetime
+from decimal import Decimal
+from typing import BinaryIO, NamedTuple
 
-from sqlalchemy import select, func
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, lazyload
 
-from app.models.order import Order, OrderItem
-from app.models.product import Product
 from app.models.customer import CustomerAccount
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.order import Order
+from app.models.product import Product
 from app.models.store import Store
-from app.models.user import User
+
+# Rows fetched from the server-side cursor per batch
+EXPORT_BATCH_SIZE = 1000
+
+_ZERO = Decimal("0")
+
+
+class ExportDataset(str, enum.Enum):
+    """Exportable store datasets."""
+
+    orders = "orders"
+    products = "products"
+    customers = "customers"
+
+
+class ExportFormat(str, enum.Enum):
+    """Export serialization formats."""
+
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class _Field(NamedTuple):
+    """One exported column: NDJSON key, CSV header, and value getter."""
+
+    key: str
+    header: str
+    get: Callable[[object], object]
+
+
+_ORDER_FIELDS = [
+    _Field("id", "Order ID", lambda o: o.id),
+    _Field("status", "Status", lambda o: o.status),
+    _Field("customer_email", "Customer Email", lambda o: o.customer_email),
+    _Field("subtotal", "Subtotal", lambda o: o.subtotal),
+    _Field("discount_code", "Discount Code", lambda o: o.discount_code),
+    _Field("discount_amount", "Discount Amount", lambda o: o.discount_amount or _ZERO),
+    _Field("tax_amount", "Tax Amount", lambda o: o.tax_amount or _ZERO),
+    _Field("gift_card_amount", "Gift Card Amount", lambda o: o.gift_card_amount or _ZERO),
+    _Field("total", "Total", lambda o: o.total),
+    _Field("currency", "Currency", lambda o: o.currency or "USD"),
+    _Field("shipping_address", "Shipping Address", lambda o: o.shipping_address),
+    _Field("tracking_number", "Tracking Number", lambda o: o.tracking_number),
+    _Field("carrier", "Carrier", lambda o: o.carrier),
+    _Field("notes", "Notes", lambda o: o.notes),
+    _Field("created_at", "Created At", lambda o: o.created_at),
+    _Field("updated_at", "Updated At", lambda o: o.updated_at),
+]
+
+_PRODUCT_FIELDS = [
+    _Field("id", "Product ID", lambda p: p.id),
+    _Field("title", "Title", lambda p: p.title),
+    _Field("slug", "Slug", lambda p: p.slug),
+    _Field("status", "Status", lambda p: p.status),
+    _Field("price", "Price", lambda p: p.price),
+    _Field("compare_at_price", "Compare At Price", lambda p: p.compare_at_price),
+    _Field("cost", "Cost", lambda p: p.cost),
+    _Field("description", "Description", lambda p: p.description),
+    _Field("tags", "Tags", lambda p: p.tags or []),
+    _Field("avg_rating", "Avg Rating", lambda p: p.avg_rating),
+    _Field("review_count", "Review Count", lambda p: p.review_count or 0),
+    _Field("seo_title", "SEO Title", lambda p: p.seo_title),
+    _Field("seo_description", "SEO Description", lambda p: p.seo_description),
+    _Field("images", "Images", lambda p: p.images or []),
+    _Field("created_at", "Created At", lambda p: p.created_at),
+    _Field("updated_at", "Updated At", lambda p: p.updated_at),
+]
+
+_CUSTOMER_FIELDS = [
+    _Field("id", "Customer ID", lambda c: c.id),
+    _Field("email", "Email", lambda c: c.email),
+    _Field("first_name", "First Name", lambda c: c.first_name),
+    _Field("last_name", "Last Name", lambda c: c.last_name),
+    _Field("is_active", "Active", lambda c: bool(c.is_active)),
+    _Field("created_at", "Created At", lambda c: c.created_at),
+    _Field("updated_at", "Updated At", lambda c: c.updated_at),
+]
+
+# dataset -> (model, fields)
+_DATASETS: dict[ExportDataset, tuple[type, list[_Field]]] = {
+    ExportDataset.orders: (Order, _ORDER_FIELDS),
+    ExportDataset.products: (Product, _PRODUCT_FIELDS),
+    ExportDataset.customers: (CustomerAccount, _CUSTOMER_FIELDS),
+}
+
+_MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def _csv_value(value: object) -> str:
+    """Format a field value for a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, Decimal):
+        return f"{value:.2f}"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value)
+    return str(value)
+
+
+def _json_value(value: object) -> object:
+    """Convert a field value into a JSON-serializable value."""
+    if isinstance(value, Decimal):
+        return f"{value:.2f}"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _encode_header(fields: list[_Field], fmt: ExportFormat) -> str:
+    """Encode the header line (CSV only; NDJSON has no header)."""
+    if fmt != ExportFormat.csv:
+        return ""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([field.header for field in fields])
+    return buffer.getvalue()
+
+
+def _encode_batch(rows: Iterable, fields: list[_Field], fmt: ExportFormat) -> str:
+    """Encode a batch of ORM rows into one text chunk."""
+    if fmt == ExportFormat.csv:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            [_csv_value(field.get(row)) for field in fields] for row in rows
+        )
+        return buffer.getvalue()
+    return "".join(
+        json.dumps(
+            {field.key: _json_value(field.get(row)) for field in fields},
+            separators=(",", ":"),
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+class _ChunkEncoder:
+    """Encodes text chunks to UTF-8, optionally through a gzip stream."""
+
+    def __init__(self, compress: bool):
+        self._gzip = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+
+    def encode(self, text: str) -> bytes:
+        """Encode one chunk (may return ``b""`` while gzip buffers)."""
+        data = text.encode("utf-8")
+        return self._gzip.compress(data) if self._gzip else data
+
+    def finish(self) -> bytes:
+        """Flush any buffered gzip output and the gzip trailer."""
+        return self._gzip.flush() if self._gzip else b""
+
+
+def _export_stmt(dataset: ExportDataset, store_id: uuid.UUID) -> Select:
+    """Build the streaming query for a dataset, newest rows first."""
+    model, _ = _DATASETS[dataset]
+    return (
+        select(model)
+        .where(model.store_id == store_id)
+        .order_by(model.created_at.desc(), model.id)
+        .options(lazyload("*"))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+
+def export_media_type(fmt: ExportFormat, compress: bool) -> str:
+    """Return the HTTP media type for an export.
+
+    Args:
+        fmt: Serialization format.
+        compress: Whether the export is gzip-compressed.
+
+    Returns:
+        The MIME type string.
+    """
+    return "application/gzip" if compress else _MEDIA_TYPES[fmt]
+
+
+def export_filename(
+    dataset: ExportDataset, store_id: uuid.UUID, fmt: ExportFormat, compress: bool
+) -> str:
+    """Return the download filename for an export.
+
+    Args:
+        dataset: The exported dataset.
+        store_id: The store UUID.
+        fmt: Serialization format.
+        compress: Whether the export is gzip-compressed.
+
+    Returns:
+        A filename such as ``orders-<store_id>.csv.gz``.
+    """
+    suffix = ".gz" if compress else ""
+    return f"{dataset.value}-{store_id}.{fmt.value}{suffix}"
+
+
+# ---------------------------------------------------------------------------
+# Streaming exports (request path)
+# ---------------------------------------------------------------------------
 
 
 async def _verify_store(
@@ -50,197 +295,177 @@ async def _verify_store(
         ValueError: If the store is not found or not owned by the user.
     """
     result = await db.execute(
-        select(Store).where(Store.id == store_id, Store.user_id == user_id)
+        select(Store.id).where(Store.id == store_id, Store.user_id == user_id)
     )
-    store = result.scalar_one_or_none()
-    if not store:
+    if result.scalar_one_or_none() is None:
         raise ValueError("Store not found or access denied.")
 
 
-async def export_orders_csv(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> str:
-    """Export all orders for a store as a CSV string.
+async def _stream(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    dataset: ExportDataset,
+    fmt: ExportFormat,
+    compress: bool,
+) -> AsyncIterator[bytes]:
+    """Yield encoded export chunks, one per server-side cursor batch."""
+    _, fields = _DATASETS[dataset]
+    encoder = _ChunkEncoder(compress)
+
+    chunk = encoder.encode(_encode_header(fields, fmt))
+    if chunk:
+        yield chunk
+
+    result = await db.stream_scalars(_export_stmt(dataset, store_id))
+    async for rows in result.partitions():
+        chunk = encoder.encode(_encode_batch(rows, fields, fmt))
+        if chunk:
+            yield chunk
+
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def open_export(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    dataset: ExportDataset,
+    fmt: ExportFormat = ExportFormat.csv,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Verify access and return a streaming export.
+
+    Ownership is checked before any bytes are produced, so callers can
+    turn a ``ValueError`` into a 404 before starting the response.
 
     Args:
-        db: Database session.
+        db: Database session. Must stay open while the stream is consumed.
         store_id: The store UUID.
         user_id: The authenticated user's UUID.
+        dataset: Which dataset to export.
+        fmt: CSV or NDJSON.
+        compress: Gzip the output.
 
     Returns:
-        A complete CSV string with headers and all order rows.
+        An async iterator of ``bytes`` chunks.
 
     Raises:
         ValueError: If the store is not found or not owned by the user.
     """
     await _verify_store(db, store_id, user_id)
+    return _stream(db, store_id, dataset, fmt, compress)
 
-    result = await db.execute(
-        select(Order)
-        .where(Order.store_id == store_id)
-        .order_by(Order.created_at.desc())
-    )
-    orders = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Order ID",
-        "Status",
-        "Customer Email",
-        "Subtotal",
-        "Discount Code",
-        "Discount Amount",
-        "Tax Amount",
-        "Gift Card Amount",
-        "Total",
-        "Currency",
-        "Shipping Address",
-        "Tracking Number",
-        "Carrier",
-        "Notes",
-        "Created At",
-        "Updated At",
-    ])
-
-    for order in orders:
-        writer.writerow([
-            str(order.id),
-            order.status.value if order.status else "",
-            order.customer_email or "",
-            f"{order.subtotal:.2f}" if order.subtotal is not None else "",
-            order.discount_code or "",
-            f"{order.discount_amount:.2f}" if order.discount_amount is not None else "0.00",
-            f"{order.tax_amount:.2f}" if order.tax_amount is not None else "0.00",
-            f"{order.gift_card_amount:.2f}" if order.gift_card_amount is not None else "0.00",
-            f"{order.total:.2f}",
-            order.currency or "USD",
-            order.shipping_address or "",
-            order.tracking_number or "",
-            order.carrier or "",
-            getattr(order, "notes", "") or "",
-            order.created_at.isoformat() if order.created_at else "",
-            order.updated_at.isoformat() if order.updated_at else "",
-        ])
-
-    return output.getvalue()
-
-
-async def export_products_csv(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> str:
-    """Export all products for a store as a CSV string.
+
+# ---------------------------------------------------------------------------
+# Background export jobs
+# ---------------------------------------------------------------------------
+
+
+async def create_export_job(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    dataset: ExportDataset,
+    fmt: ExportFormat = ExportFormat.csv,
+    compress: bool = False,
+) -> ExportJob:
+    """Record a pending background export job.
+
+    The caller dispatches ``export_tasks.generate_export`` after the job
+    has been committed.
 
     Args:
         db: Database session.
         store_id: The store UUID.
         user_id: The authenticated user's UUID.
+        dataset: Which dataset to export.
+        fmt: CSV or NDJSON.
+        compress: Gzip the output file.
 
     Returns:
-        A complete CSV string with headers and all product rows.
+        The newly created ExportJob.
 
     Raises:
         ValueError: If the store is not found or not owned by the user.
     """
     await _verify_store(db, store_id, user_id)
-
-    result = await db.execute(
-        select(Product)
-        .where(Product.store_id == store_id)
-        .order_by(Product.created_at.desc())
+    job = ExportJob(
+        store_id=store_id,
+        user_id=user_id,
+        dataset=dataset.value,
+        format=fmt.value,
+        compressed=compress,
+        status=ExportJobStatus.pending,
     )
-    products = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Product ID",
-        "Title",
-        "Slug",
-        "Status",
-        "Price",
-        "Compare At Price",
-        "Cost",
-        "Description",
-        "Tags",
-        "Avg Rating",
-        "Review Count",
-        "SEO Title",
-        "SEO Description",
-        "Images",
-        "Created At",
-        "Updated At",
-    ])
-
-    for product in products:
-        writer.writerow([
-            str(product.id),
-            product.title or "",
-            product.slug or "",
-            product.status.value if product.status else "",
-            f"{product.price:.2f}" if product.price is not None else "",
-            f"{product.compare_at_price:.2f}" if product.compare_at_price is not None else "",
-            f"{product.cost:.2f}" if product.cost is not None else "",
-            product.description or "",
-            "; ".join(product.tags) if product.tags else "",
-            f"{product.avg_rating:.2f}" if product.avg_rating is not None else "",
-            str(product.review_count) if product.review_count else "0",
-            product.seo_title or "",
-            product.seo_description or "",
-            "; ".join(product.images) if product.images else "",
-            product.created_at.isoformat() if product.created_at else "",
-            product.updated_at.isoformat() if product.updated_at else "",
-        ])
-
-    return output.getvalue()
-
-
-async def export_customers_csv(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> str:
-    """Export all customer accounts for a store as a CSV string.
+    db.add(job)
+    await db.flush()
+    await db.refresh(job)
+    return job
+
+
+async def get_export_job(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    user_id: uuid.UUID,
+    job_id: uuid.UUID,
+) -> ExportJob:
+    """Retrieve an export job belonging to the user's store.
 
     Args:
         db: Database session.
         store_id: The store UUID.
         user_id: The authenticated user's UUID.
+        job_id: The export job UUID.
 
     Returns:
-        A complete CSV string with headers and all customer rows.
+        The ExportJob.
 
     Raises:
-        ValueError: If the store is not found or not owned by the user.
+        ValueError: If the store or job is not found or not owned by the user.
     """
     await _verify_store(db, store_id, user_id)
-
     result = await db.execute(
-        select(CustomerAccount)
-        .where(CustomerAccount.store_id == store_id)
-        .order_by(CustomerAccount.created_at.desc())
+        select(ExportJob).where(
+            ExportJob.id == job_id, ExportJob.store_id == store_id
+        )
     )
-    customers = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Customer ID",
-        "Email",
-        "First Name",
-        "Last Name",
-        "Active",
-        "Created At",
-        "Updated At",
-    ])
-
-    for customer in customers:
-        writer.writerow([
-            str(customer.id),
-            customer.email or "",
-            customer.first_name or "",
-            customer.last_name or "",
-            "Yes" if customer.is_active else "No",
-            customer.created_at.isoformat() if customer.created_at else "",
-            customer.updated_at.isoformat() if customer.updated_at else "",
-        ])
-
-    return output.getvalue()
+    job = result.scalar_one_or_none()
+    if job is None:
+        raise ValueError("Export job not found.")
+    return job
+
+
+def write_export_sync(
+    session: Session,
+    store_id: uuid.UUID,
+    dataset: ExportDataset,
+    fmt: ExportFormat,
+    compress: bool,
+    out: BinaryIO,
+) -> int:
+    """Write a full export to a binary file object (Celery path).
+
+    Args:
+        session: Sync database session.
+        store_id: The store UUID.
+        dataset: Which dataset to export.
+        fmt: CSV or NDJSON.
+        compress: Gzip the output.
+        out: Binary file object to write to.
+
+    Returns:
+        The number of exported rows.
+    """
+    _, fields = _DATASETS[dataset]
+    encoder = _ChunkEncoder(compress)
+    out.write(encoder.encode(_encode_header(fields, fmt)))
+
+    row_count = 0
+    for rows in session.scalars(_export_stmt(dataset, store_id)).partitions():
+        out.write(encoder.encode(_encode_batch(rows, fields, fmt)))
+        row_count += len(rows)
+
+    out.write(encoder.finish())
+    return row_count
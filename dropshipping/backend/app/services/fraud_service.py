@@ -13,6 +13,18 @@ override the automated assessment.
     and mismatched shipping address. Risk levels: ``low`` (0-25),
     ``medium`` (26-50), ``high`` (51-75), ``critical`` (76-100).
 
+    ``score_order`` is the single implementation of the rules; it is
+    shared by ``check_order_fraud``, the ``run_fraud_check`` Celery task,
+    and ``rescore_pending_orders_sync``. Per-customer inputs come from
+    ``fraud_feature_service`` (Redis counters, no history scans).
+
+    ``rescore_pending_orders_sync`` re-evaluates every paid, not yet
+    shipped order after the rules change. It computes the features of a
+    whole batch of orders with one grouped query, then rewrites only the
+    checks whose outcome changed with one batched ``UPDATE`` and inserts
+    missing checks with one batched ``INSERT``. Checks a store owner has
+    reviewed are left alone.
+
 **For QA Engineers:**
     - ``check_order_fraud`` creates a FraudCheck record with the score,
       risk level, and detected signals.
@@ -21,7 +33,8 @@ override the automated assessment.
       the same email within 1 hour.
     - The ``new_customer_high_order`` signal triggers for first-time
       buyers with orders over $200.
-    - ``review_fraud_check`` allows manual flagging/unflagging.
+    - ``review_fraud_check`` allows manual flagging/unflagging and records
+      the reviewer, which protects the check from batch rescoring.
     - ``list_fraud_checks`` supports pagination and flagged-only filtering.
 
 **For Project Managers:**
@@ -36,14 +49,21 @@ override the automated assessment.
 """
 
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
 
 from app.models.order import Order, OrderStatus
-from app.models.store import Store, StoreStatus
+from app.services.fraud_feature_service import (
+    COUNTED_STATUSES,
+    VELOCITY_WINDOW,
+    CustomerFeatures,
+    get_customer_features,
+)
+from app.services.store_access_service import verify_store_ownership
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +84,6 @@ _HIGH_AMOUNT_SCORE = 20
 _NEW_CUSTOMER_HIGH_ORDER_THRESHOLD = Decimal("200.00")
 _NEW_CUSTOMER_HIGH_ORDER_SCORE = 25
 
-_VELOCITY_WINDOW_HOURS = 1
 _VELOCITY_COUNT_THRESHOLD = 3
 _VELOCITY_SCORE = 30
 
@@ -94,30 +113,46 @@ def _map_risk_level(score: int) -> str:
         return "critical"
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
+def score_order(
+    total: Decimal, customer_email: str, features: CustomerFeatures
+) -> tuple[int, str, list[str]]:
+    """Apply the fraud rules to one order.
 
     Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
+        total: The order total.
+        customer_email: The customer's email address.
+        features: The customer's features for this order.
 
     Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
+        Tuple of (score capped at 100, risk level, detected signals).
     """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+    signals = []
+    score = 0
+    is_first_order = features.previous_orders == 0
+
+    if total >= _HIGH_AMOUNT_THRESHOLD:
+        signals.append("high_amount")
+        score += _HIGH_AMOUNT_SCORE
+
+    if is_first_order and total >= _NEW_CUSTOMER_HIGH_ORDER_THRESHOLD:
+        signals.append("new_customer_high_order")
+        score += _NEW_CUSTOMER_HIGH_ORDER_SCORE
+
+    if features.recent_orders >= _VELOCITY_COUNT_THRESHOLD:
+        signals.append("velocity_spike")
+        score += _VELOCITY_SCORE
+
+    email_lower = customer_email.lower()
+    if any(pattern in email_lower for pattern in _SUSPICIOUS_EMAIL_PATTERNS):
+        signals.append("suspicious_email")
+        score += _SUSPICIOUS_EMAIL_SCORE
+
+    if is_first_order:
+        signals.append("first_order")
+        score += _FIRST_ORDER_SCORE
+
+    score = min(score, 100)
+    return score, _map_risk_level(score), signals
 
 
 async def check_order_fraud(
@@ -155,63 +190,18 @@ async def check_order_fraud(
         The newly created FraudCheck ORM instance with score, risk level,
         and detected signals.
     """
-    signals = []
-    score = 0
-
-    # Signal 1: High order amount
-    if total >= _HIGH_AMOUNT_THRESHOLD:
-        signals.append("high_amount")
-        score += _HIGH_AMOUNT_SCORE
-
-    # Signal 2: Check if this is a new customer with a high order
-    previous_orders_result = await db.execute(
-        select(func.count(Order.id)).where(
-            Order.store_id == store_id,
-            Order.customer_email == customer_email,
-            Order.id != order_id,
-            Order.status.in_([
-                OrderStatus.paid,
-                OrderStatus.shipped,
-                OrderStatus.delivered,
-            ]),
-        )
-    )
-    previous_order_count = previous_orders_result.scalar_one()
-
-    if previous_order_count == 0:
-        signals.append("first_order")
-        score += _FIRST_ORDER_SCORE
-
-        if total >= _NEW_CUSTOMER_HIGH_ORDER_THRESHOLD:
-            signals.append("new_customer_high_order")
-            score += _NEW_CUSTOMER_HIGH_ORDER_SCORE
-
-    # Signal 3: Velocity spike (multiple orders in short window)
-    window_start = datetime.now(timezone.utc) - timedelta(hours=_VELOCITY_WINDOW_HOURS)
-    velocity_result = await db.execute(
-        select(func.count(Order.id)).where(
-            Order.store_id == store_id,
-            Order.customer_email == customer_email,
-            Order.created_at >= window_start,
+    order = await db.get(Order, order_id)
+    if order is None:
+        # Not flushed yet: score it as a new pending order.
+        order = Order(
+            id=order_id,
+            store_id=store_id,
+            customer_email=customer_email,
+            status=OrderStatus.pending,
+            total=total,
         )
-    )
-    recent_order_count = velocity_result.scalar_one()
-
-    if recent_order_count >= _VELOCITY_COUNT_THRESHOLD:
-        signals.append("velocity_spike")
-        score += _VELOCITY_SCORE
-
-    # Signal 4: Suspicious email patterns
-    email_lower = customer_email.lower()
-    for pattern in _SUSPICIOUS_EMAIL_PATTERNS:
-        if pattern in email_lower:
-            signals.append("suspicious_email")
-            score += _SUSPICIOUS_EMAIL_SCORE
-            break
-
-    # Cap score at 100
-    score = min(score, 100)
-    risk_level = _map_risk_level(score)
+    features = await get_customer_features(db, order)
+    score, risk_level, signals = score_order(total, customer_email, features)
 
     # Determine if auto-flagged
     is_flagged = risk_level in ("high", "critical")
@@ -255,7 +245,7 @@ async def list_fraud_checks(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(FraudCheck).where(FraudCheck.store_id == store_id)
     count_query = select(func.count(FraudCheck.id)).where(
@@ -306,7 +296,7 @@ async def review_fraud_check(
         ValueError: If the store or fraud check doesn't exist, or the
             store belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(FraudCheck).where(
@@ -319,9 +309,136 @@ async def review_fraud_check(
         raise ValueError("Fraud check not found")
 
     fraud_check.is_flagged = is_flagged
+    fraud_check.reviewed_by = user_id
+    fraud_check.reviewed_at = datetime.now(timezone.utc)
     if notes is not None:
         fraud_check.notes = notes
 
     await db.flush()
     await db.refresh(fraud_check)
     return fraud_check
+
+
+def rescore_pending_orders_sync(
+    session: Session,
+    store_id: uuid.UUID | None = None,
+    after_order_id: uuid.UUID | None = None,
+    limit: int = 500,
+) -> dict:
+    """Re-apply the fraud rules to one batch of paid, unshipped orders.
+
+    Features for the whole batch come from one grouped self-join on
+    ``orders``. Velocity is measured over the window before each order
+    was placed, so rescoring an hours-old order reproduces what the live
+    check saw. Orders whose latest check was reviewed by the store owner
+    are skipped.
+
+    Args:
+        session: Sync database session (not committed).
+        store_id: Restrict rescoring to one store (all stores if None).
+        after_order_id: Keyset cursor; only orders with a greater ID are
+            processed.
+        limit: Maximum orders in the batch.
+
+    Returns:
+        Dict with ``orders`` (processed), ``updated``, ``created``,
+        ``last_order_id`` (cursor for the next batch, None when done),
+        and ``newly_flagged`` (list of ``(store_id, fraud_check_id)``
+        string pairs whose check became flagged).
+    """
+    target = aliased(Order)
+    other = aliased(Order)
+    query = (
+        select(
+            target.id,
+            target.store_id,
+            target.customer_email,
+            target.total,
+            func.count(other.id).filter(
+                other.status.in_(COUNTED_STATUSES), other.id != target.id
+            ),
+            func.count(other.id).filter(
+                other.created_at > target.created_at - VELOCITY_WINDOW,
+                other.created_at <= target.created_at,
+            ),
+        )
+        .join(
+            other,
+            and_(
+                other.store_id == target.store_id,
+                other.customer_email == target.customer_email,
+            ),
+        )
+        .where(target.status == OrderStatus.paid)
+        .group_by(target.id)
+        .order_by(target.id)
+        .limit(limit)
+    )
+    if store_id is not None:
+        query = query.where(target.store_id == store_id)
+    if after_order_id is not None:
+        query = query.where(target.id > after_order_id)
+    rows = session.execute(query).all()
+    if not rows:
+        return {"orders": 0, "updated": 0, "created": 0, "last_order_id": None, "newly_flagged": []}
+
+    latest_checks: dict[uuid.UUID, FraudCheck] = {}
+    for check in session.execute(
+        select(FraudCheck)
+        .where(FraudCheck.order_id.in_([row[0] for row in rows]))
+        .order_by(FraudCheck.created_at)
+    ).scalars():
+        latest_checks[check.order_id] = check
+
+    updates: list[dict] = []
+    inserts: list[dict] = []
+    newly_flagged: list[tuple[str, str]] = []
+    for order_id, order_store_id, email, total, previous, recent in rows:
+        score, risk_level, signals = score_order(
+            total, email, CustomerFeatures(previous_orders=previous, recent_orders=recent)
+        )
+        is_flagged = risk_level in ("high", "critical")
+        check = latest_checks.get(order_id)
+        if check is None:
+            check_id = uuid.uuid4()
+            inserts.append({
+                "id": check_id,
+                "store_id": order_store_id,
+                "order_id": order_id,
+                "risk_score": Decimal(score),
+                "risk_level": risk_level,
+                "signals": signals,
+                "is_flagged": is_flagged,
+            })
+            if is_flagged:
+                newly_flagged.append((str(order_store_id), str(check_id)))
+            continue
+        if check.reviewed_at is not None:
+            continue
+        if (
+            check.risk_score == score
+            and check.signals == signals
+            and check.is_flagged == is_flagged
+        ):
+            continue
+        updates.append({
+            "id": check.id,
+            "risk_score": Decimal(score),
+            "risk_level": risk_level,
+            "signals": signals,
+            "is_flagged": is_flagged,
+        })
+        if is_flagged and not check.is_flagged:
+            newly_flagged.append((str(order_store_id), str(check.id)))
+
+    if updates:
+        session.execute(update(FraudCheck), updates)
+    if inserts:
+        session.execute(insert(FraudCheck), inserts)
+    return {
+        "orders": len(rows),
+        "updated": len(updates),
+        "created": len(inserts),
+        "last_order_id": rows[-1][0],
+        "newly_flagged": newly_flagged,
+    }
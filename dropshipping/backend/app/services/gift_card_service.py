@@ -9,7 +9,24 @@ tracking, and a full transaction history.
     randomness in the format ``GC-XXXX-XXXX-XXXX``. Balance is tracked
     as ``current_balance`` and decremented via ``charge_gift_card``.
     Every charge and refund creates a ``GiftCardTransaction`` audit
-    record for reconciliation.
+    record for reconciliation; the transactions are an append-only
+    ledger and are never updated.
+
+    Charges and refunds change the balance with one conditional
+    ``UPDATE ... RETURNING`` (``current_balance >= amount`` for a
+    charge), so concurrent checkouts on the same card cannot overdraw
+    it and no row is read and written back from Python. The card is
+    only read when a charge is refused, to explain why.
+
+    ``validate_gift_card`` runs on every checkout attempt. It resolves
+    the code to the card's ID, status and expiry from a snapshot cached
+    in the Redis key ``gift-card:{store_id}:{code}`` for
+    ``settings.gift_card_cache_ttl_seconds``, and reads the balance live
+    by primary key, so checkout never prices from a stale balance.
+    Charging and disabling drop the snapshot once their transaction
+    commits (``database.on_commit``), so a validation racing the change
+    cannot re-cache the old status. If Redis is down, validation reads
+    the database.
 
 **For QA Engineers:**
     - ``generate_gift_card_code`` produces a 16-character alphanumeric
@@ -18,9 +35,11 @@ tracking, and a full transaction history.
       ``initial_balance``.
     - ``validate_gift_card`` checks active status, expiry, and positive
       balance.
-    - ``charge_gift_card`` prevents overdraft (amount > balance).
+    - ``charge_gift_card`` prevents overdraft (amount > balance), also
+      when many checkouts charge the same card at once.
     - ``refund_gift_card`` adds credit back to the card balance.
-    - ``disable_gift_card`` sets ``status`` to ``disabled``.
+    - ``disable_gift_card`` sets ``status`` to ``disabled``; the card
+      fails validation right away.
 
 **For Project Managers:**
     This service powers Feature 20 (Gift Cards) from the backlog. It
@@ -33,16 +52,24 @@ tracking, and a full transaction history.
     set expiry dates and disable cards if needed.
 """
 
+import json
+import logging
 import secrets
 import string
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from redis.exceptions import RedisError
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.store import Store, StoreStatus
+from app.config import settings
+from app.database import on_commit
+from app.redis_client import get_redis, get_sync_redis
+from app.services.store_access_service import verify_store_ownership
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -74,32 +101,6 @@ def generate_gift_card_code() -> str:
     return f"GC-{'-'.join(segments)}"
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_gift_card(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -128,7 +129,7 @@ async def create_gift_card(
         ValueError: If the store doesn't exist, belongs to another user,
             or the initial balance is not positive.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if initial_balance <= Decimal("0.00"):
         raise ValueError("Initial balance must be greater than zero")
@@ -185,7 +186,7 @@ async def list_gift_cards(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(GiftCard).where(GiftCard.store_id == store_id)
     count_query = select(func.count(GiftCard.id)).where(GiftCard.store_id == store_id)
@@ -223,7 +224,7 @@ async def get_gift_card(
         ValueError: If the store or gift card doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(GiftCard).where(
@@ -237,6 +238,72 @@ async def get_gift_card(
     return gift_card
 
 
+def _card_key(store_id: uuid.UUID, code: str) -> str:
+    """Redis key holding a gift card's cached validation snapshot."""
+    return f"gift-card:{store_id}:{code.upper()}"
+
+
+async def _load_card_snapshot(
+    db: AsyncSession, store_id: uuid.UUID, code: str
+) -> dict | None:
+    """Read a gift card's ID, status and expiry from the database."""
+    row = (
+        await db.execute(
+            select(GiftCard.id, GiftCard.status, GiftCard.expires_at).where(
+                GiftCard.store_id == store_id, GiftCard.code == code.upper()
+            )
+        )
+    ).first()
+    if row is None:
+        return None
+    return {
+        "id": str(row.id),
+        "status": row.status.value,
+        "expires_at": row.expires_at.isoformat() if row.expires_at else None,
+    }
+
+
+async def _card_snapshot(db: AsyncSession, store_id: uuid.UUID, code: str) -> dict | None:
+    """Get a gift card's validation snapshot, from Redis when possible."""
+    key = _card_key(store_id, code)
+    try:
+        raw = await get_redis().get(key)
+    except RedisError as exc:
+        logger.warning("Gift card cache unavailable: %s", exc)
+        return await _load_card_snapshot(db, store_id, code)
+    if raw is not None:
+        return json.loads(raw)
+
+    snapshot = await _load_card_snapshot(db, store_id, code)
+    if snapshot is not None:
+        try:
+            await get_redis().set(
+                key, json.dumps(snapshot), ex=settings.gift_card_cache_ttl_seconds
+            )
+        except RedisError as exc:
+            logger.warning("Gift card not cached: store=%s error=%s", store_id, exc)
+    return snapshot
+
+
+def _forget_card(store_id: uuid.UUID, code: str) -> None:
+    """Drop a gift card's cached snapshot from Redis."""
+    try:
+        get_sync_redis().delete(_card_key(store_id, code))
+    except RedisError as exc:
+        logger.warning("Gift card invalidation failed: store=%s error=%s", store_id, exc)
+
+
+def invalidate_gift_card(db: AsyncSession, store_id: uuid.UUID, code: str) -> None:
+    """Drop a gift card's cached snapshot once the session commits.
+
+    Args:
+        db: The session changing the card.
+        store_id: The card's store.
+        code: The card's code.
+    """
+    on_commit(db, lambda: _forget_card(store_id, code))
+
+
 async def validate_gift_card(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -246,7 +313,8 @@ async def validate_gift_card(
 
     Checks that the code exists, the card is active, not expired, and
     has a positive balance. Does NOT require store ownership as this
-    is called on behalf of customers.
+    is called on behalf of customers. Status and expiry come from the
+    cached snapshot when there is one; the balance is always read live.
 
     Args:
         db: Async database session.
@@ -257,25 +325,24 @@ async def validate_gift_card(
         A dict with ``valid`` (bool), ``balance`` (Decimal or None),
         and ``message`` (str).
     """
-    result = await db.execute(
-        select(GiftCard).where(
-            GiftCard.store_id == store_id,
-            GiftCard.code == code.upper(),
-        )
-    )
-    gift_card = result.scalar_one_or_none()
+    snapshot = await _card_snapshot(db, store_id, code)
 
-    if gift_card is None:
+    if snapshot is None:
         return {"valid": False, "balance": None, "message": "Invalid gift card code"}
 
-    if gift_card.status != GiftCardStatus.active:
+    if snapshot["status"] != GiftCardStatus.active.value:
         return {"valid": False, "balance": None, "message": "This gift card is not active"}
 
     now = datetime.now(timezone.utc)
-    if gift_card.expires_at and now > gift_card.expires_at:
+    if snapshot["expires_at"] and now > datetime.fromisoformat(snapshot["expires_at"]):
         return {"valid": False, "balance": None, "message": "This gift card has expired"}
 
-    if gift_card.current_balance <= Decimal("0.00"):
+    balance = await db.scalar(
+        select(GiftCard.current_balance).where(GiftCard.id == uuid.UUID(snapshot["id"]))
+    )
+    if balance is None:
+        return {"valid": False, "balance": None, "message": "Invalid gift card code"}
+    if balance <= Decimal("0.00"):
         return {
             "valid": False,
             "balance": Decimal("0.00"),
@@ -284,8 +351,8 @@ async def validate_gift_card(
 
     return {
         "valid": True,
-        "balance": gift_card.current_balance,
-        "message": f"Gift card valid. Balance: ${gift_card.current_balance}",
+        "balance": balance,
+        "message": f"Gift card valid. Balance: ${balance}",
     }
 
 
@@ -298,9 +365,10 @@ async def charge_gift_card(
 ) -> "GiftCardTransaction":
     """Charge (debit) an amount from a gift card.
 
-    Decrements the card's ``current_balance`` and creates a transaction
-    record. Prevents overdraft by validating the amount does not exceed
-    the remaining balance.
+    Decrements the card's ``current_balance`` with a single conditional
+    update and appends a transaction record. The update only matches an
+    active, unexpired card holding at least ``amount``, so concurrent
+    charges can never take the balance below zero.
 
     Args:
         db: Async database session.
@@ -316,46 +384,57 @@ async def charge_gift_card(
         ValueError: If the gift card is not found, not valid, or the
             amount exceeds the available balance.
     """
-    result = await db.execute(
-        select(GiftCard).where(
-            GiftCard.store_id == store_id,
-            GiftCard.code == code.upper(),
-        )
-    )
-    gift_card = result.scalar_one_or_none()
-    if gift_card is None:
-        raise ValueError("Gift card not found")
-
-    if gift_card.status != GiftCardStatus.active:
-        raise ValueError("Gift card is not active")
+    if amount <= Decimal("0.00"):
+        raise ValueError("Charge amount must be greater than zero")
 
     now = datetime.now(timezone.utc)
-    if gift_card.expires_at and now > gift_card.expires_at:
-        raise ValueError("Gift card has expired")
+    gift_card_id = (
+        await db.execute(
+            update(GiftCard)
+            .where(
+                GiftCard.store_id == store_id,
+                GiftCard.code == code.upper(),
+                GiftCard.status == GiftCardStatus.active,
+                or_(GiftCard.expires_at.is_(None), GiftCard.expires_at >= now),
+                GiftCard.current_balance >= amount,
+            )
+            .values(current_balance=GiftCard.current_balance - amount)
+            .returning(GiftCard.id)
+            .execution_options(synchronize_session="fetch")
+        )
+    ).scalar_one_or_none()
 
-    if amount > gift_card.current_balance:
+    if gift_card_id is None:
+        # Refused: read the card only to tell the caller why.
+        result = await db.execute(
+            select(GiftCard).where(
+                GiftCard.store_id == store_id,
+                GiftCard.code == code.upper(),
+            )
+        )
+        gift_card = result.scalar_one_or_none()
+        if gift_card is None:
+            raise ValueError("Gift card not found")
+        if gift_card.status != GiftCardStatus.active:
+            raise ValueError("Gift card is not active")
+        if gift_card.expires_at and now > gift_card.expires_at:
+            raise ValueError("Gift card has expired")
         raise ValueError(
             f"Charge amount (${amount}) exceeds gift card balance "
             f"(${gift_card.current_balance})"
         )
 
-    if amount <= Decimal("0.00"):
-        raise ValueError("Charge amount must be greater than zero")
-
-    # Debit the balance
-    gift_card.current_balance -= amount
-
-    # Create transaction record
     transaction = GiftCardTransaction(
-        gift_card_id=gift_card.id,
+        gift_card_id=gift_card_id,
         order_id=order_id,
         amount=-amount,  # Negative for debits
         transaction_type="charge",
-        note=f"Charged for order",
+        note="Charged for order",
     )
     db.add(transaction)
     await db.flush()
     await db.refresh(transaction)
+    invalidate_gift_card(db, store_id, code)
     return transaction
 
 
@@ -368,8 +447,8 @@ async def refund_gift_card(
 ) -> "GiftCardTransaction":
     """Refund (credit) an amount back to a gift card.
 
-    Increments the card's ``current_balance`` and creates a transaction
-    record.
+    Increments the card's ``current_balance`` with a single update and
+    appends a transaction record.
 
     Args:
         db: Async database session.
@@ -385,21 +464,23 @@ async def refund_gift_card(
         ValueError: If the gift card is not found or the amount is not
             positive.
     """
-    result = await db.execute(
-        select(GiftCard).where(GiftCard.id == gift_card_id)
-    )
-    gift_card = result.scalar_one_or_none()
-    if gift_card is None:
-        raise ValueError("Gift card not found")
-
     if amount <= Decimal("0.00"):
         raise ValueError("Refund amount must be greater than zero")
 
-    # Credit the balance
-    gift_card.current_balance += amount
+    updated = (
+        await db.execute(
+            update(GiftCard)
+            .where(GiftCard.id == gift_card_id)
+            .values(current_balance=GiftCard.current_balance + amount)
+            .returning(GiftCard.id)
+            .execution_options(synchronize_session="fetch")
+        )
+    ).scalar_one_or_none()
+    if updated is None:
+        raise ValueError("Gift card not found")
 
     transaction = GiftCardTransaction(
-        gift_card_id=gift_card.id,
+        gift_card_id=gift_card_id,
         order_id=order_id,
         amount=amount,  # Positive for credits
         transaction_type="refund",
@@ -438,4 +519,5 @@ async def disable_gift_card(
     gift_card.status = GiftCardStatus.disabled
     await db.flush()
     await db.refresh(gift_card)
+    invalidate_gift_card(db, store_id, gift_card.code)
     return gift_card
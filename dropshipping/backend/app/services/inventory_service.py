@@ -7,8 +7,10 @@ and reservation management for ecommerce and hybrid stores.
     All functions take ``store_id`` to enforce store scoping. The
     ``adjust_inventory`` function is the sole entry point for changing
     stock levels — it creates an InventoryAdjustment audit record for
-    every change. ``reserve_stock`` and ``release_stock`` manage the
-    reserved_quantity for order lifecycle.
+    every change. ``reserve_stock``, ``release_stock`` and
+    ``fulfill_stock`` manage ``reserved_quantity`` with single conditional
+    UPDATE statements; checkout holds with expiry live in
+    ``reservation_service``.
 
 **For QA Engineers:**
     - Creating an ecommerce store auto-creates a default warehouse.
@@ -39,6 +41,7 @@ from app.models.inventory import (
 )
 from app.models.product import ProductVariant
 from app.models.store import Store
+from app.services.reservation_service import refresh_hot_counter
 
 
 # ---------------------------------------------------------------------------
@@ -323,6 +326,7 @@ async def set_inventory_level(
             )
             db.add(adjustment)
             await db.flush()
+        await refresh_hot_counter(db, level.id)
 
     return level
 
@@ -338,7 +342,7 @@ async def adjust_inventory(
     """Apply a quantity adjustment to an inventory level.
 
     Creates an immutable adjustment record and updates the level's
-    quantity accordingly.
+    quantity with a single conditional UPDATE (never below zero).
 
     Args:
         db: Async database session.
@@ -356,23 +360,24 @@ async def adjust_inventory(
             adjustment would result in negative quantity.
     """
     result = await db.execute(
-        select(InventoryLevel).where(InventoryLevel.id == inventory_level_id)
+        update(InventoryLevel)
+        .where(
+            InventoryLevel.id == inventory_level_id,
+            InventoryLevel.quantity + quantity_change >= 0,
+        )
+        .values(quantity=InventoryLevel.quantity + quantity_change)
+        .returning(InventoryLevel.id)
+        .execution_options(synchronize_session=False)
     )
-    level = result.scalar_one_or_none()
-    if level is None:
-        raise ValueError("Inventory level not found")
-
-    new_qty = level.quantity + quantity_change
-    if new_qty < 0:
+    if result.scalar_one_or_none() is None:
+        level = await get_inventory_level(db, inventory_level_id)
         raise ValueError(
             f"Cannot adjust: would result in negative quantity "
             f"(current={level.quantity}, change={quantity_change})"
         )
 
-    level.quantity = new_qty
-
     adjustment = InventoryAdjustment(
-        inventory_level_id=level.id,
+        inventory_level_id=inventory_level_id,
         quantity_change=quantity_change,
         reason=reason,
         reference_id=reference_id,
@@ -380,8 +385,8 @@ async def adjust_inventory(
     )
     db.add(adjustment)
     await db.flush()
-    await db.refresh(level)
-    return level
+    await refresh_hot_counter(db, inventory_level_id)
+    return await get_inventory_level(db, inventory_level_id)
 
 
 async def get_inventory_levels(
@@ -425,7 +430,9 @@ async def get_inventory_level(
         ValueError: If the inventory level doesn't exist.
     """
     result = await db.execute(
-        select(InventoryLevel).where(InventoryLevel.id == inventory_level_id)
+        select(InventoryLevel)
+        .where(InventoryLevel.id == inventory_level_id)
+        .execution_options(populate_existing=True)
     )
     level = result.scalar_one_or_none()
     if level is None:
@@ -466,6 +473,69 @@ async def get_adjustments(
 # ---------------------------------------------------------------------------
 
 
+async def _level_by_variant(
+    db: AsyncSession, variant_id: uuid.UUID, warehouse_id: uuid.UUID
+) -> InventoryLevel:
+    """Load the inventory level for a variant/warehouse pair.
+
+    Uses ``populate_existing`` so values written by conditional UPDATE
+    statements are reflected on instances already in the session.
+
+    Args:
+        db: Async database session.
+        variant_id: The product variant's UUID.
+        warehouse_id: The warehouse's UUID.
+
+    Returns:
+        The InventoryLevel ORM instance.
+
+    Raises:
+        ValueError: If no inventory level exists for the pair.
+    """
+    result = await db.execute(
+        select(InventoryLevel)
+        .where(
+            InventoryLevel.variant_id == variant_id,
+            InventoryLevel.warehouse_id == warehouse_id,
+        )
+        .execution_options(populate_existing=True)
+    )
+    level = result.scalar_one_or_none()
+    if level is None:
+        raise ValueError("No inventory level found for this variant/warehouse")
+    return level
+
+
+async def _conditional_level_update(
+    db: AsyncSession,
+    variant_id: uuid.UUID,
+    warehouse_id: uuid.UUID,
+    condition,
+    **new_values,
+) -> uuid.UUID | None:
+    """Apply an UPDATE to one level only if ``condition`` holds.
+
+    The check and the write happen in a single statement, so concurrent
+    callers cannot both pass the check (no read-modify-write race).
+
+    Returns:
+        The updated level's id, or None if the condition failed or the
+        level doesn't exist.
+    """
+    result = await db.execute(
+        update(InventoryLevel)
+        .where(
+            InventoryLevel.variant_id == variant_id,
+            InventoryLevel.warehouse_id == warehouse_id,
+            condition,
+        )
+        .values(**new_values)
+        .returning(InventoryLevel.id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.scalar_one_or_none()
+
+
 async def reserve_stock(
     db: AsyncSession,
     variant_id: uuid.UUID,
@@ -475,8 +545,10 @@ async def reserve_stock(
 ) -> InventoryLevel:
     """Reserve stock for a pending order.
 
-    Increments ``reserved_quantity`` without changing the total quantity.
-    Creates an adjustment record with reason=reserved.
+    Increments ``reserved_quantity`` without changing the total quantity,
+    using a single conditional UPDATE so concurrent checkouts cannot
+    oversell. Creates an adjustment record with reason=reserved. For
+    order checkouts with expiring holds, use ``reservation_service``.
 
     Args:
         db: Async database session.
@@ -491,35 +563,28 @@ async def reserve_stock(
     Raises:
         ValueError: If insufficient available stock.
     """
-    result = await db.execute(
-        select(InventoryLevel).where(
-            InventoryLevel.variant_id == variant_id,
-            InventoryLevel.warehouse_id == warehouse_id,
-        )
+    level_id = await _conditional_level_update(
+        db, variant_id, warehouse_id,
+        InventoryLevel.quantity - InventoryLevel.reserved_quantity >= quantity,
+        reserved_quantity=InventoryLevel.reserved_quantity + quantity,
     )
-    level = result.scalar_one_or_none()
-    if level is None:
-        raise ValueError("No inventory level found for this variant/warehouse")
-
-    if level.available_quantity < quantity:
+    if level_id is None:
+        level = await _level_by_variant(db, variant_id, warehouse_id)
         raise ValueError(
             f"Insufficient stock: available={level.available_quantity}, "
             f"requested={quantity}"
         )
 
-    level.reserved_quantity += quantity
-
-    adjustment = InventoryAdjustment(
-        inventory_level_id=level.id,
+    db.add(InventoryAdjustment(
+        inventory_level_id=level_id,
         quantity_change=-quantity,
         reason=AdjustmentReason.reserved,
         reference_id=order_id,
         notes=f"Reserved {quantity} units for order",
-    )
-    db.add(adjustment)
+    ))
     await db.flush()
-    await db.refresh(level)
-    return level
+    await refresh_hot_counter(db, level_id)
+    return await _level_by_variant(db, variant_id, warehouse_id)
 
 
 async def release_stock(
@@ -531,7 +596,8 @@ async def release_stock(
 ) -> InventoryLevel:
     """Release reserved stock (order cancelled or adjusted).
 
-    Decrements ``reserved_quantity``. Does not change total quantity.
+    Decrements ``reserved_quantity`` with a single conditional UPDATE.
+    Does not change total quantity.
 
     Args:
         db: Async database session.
@@ -546,35 +612,28 @@ async def release_stock(
     Raises:
         ValueError: If release quantity exceeds reserved quantity.
     """
-    result = await db.execute(
-        select(InventoryLevel).where(
-            InventoryLevel.variant_id == variant_id,
-            InventoryLevel.warehouse_id == warehouse_id,
-        )
+    level_id = await _conditional_level_update(
+        db, variant_id, warehouse_id,
+        InventoryLevel.reserved_quantity >= quantity,
+        reserved_quantity=InventoryLevel.reserved_quantity - quantity,
     )
-    level = result.scalar_one_or_none()
-    if level is None:
-        raise ValueError("No inventory level found for this variant/warehouse")
-
-    if level.reserved_quantity < quantity:
+    if level_id is None:
+        level = await _level_by_variant(db, variant_id, warehouse_id)
         raise ValueError(
             f"Cannot release more than reserved: "
             f"reserved={level.reserved_quantity}, release={quantity}"
         )
 
-    level.reserved_quantity -= quantity
-
-    adjustment = InventoryAdjustment(
-        inventory_level_id=level.id,
+    db.add(InventoryAdjustment(
+        inventory_level_id=level_id,
         quantity_change=quantity,
         reason=AdjustmentReason.unreserved,
         reference_id=order_id,
         notes=f"Released {quantity} reserved units",
-    )
-    db.add(adjustment)
+    ))
     await db.flush()
-    await db.refresh(level)
-    return level
+    await refresh_hot_counter(db, level_id)
+    return await _level_by_variant(db, variant_id, warehouse_id)
 
 
 async def fulfill_stock(
@@ -586,8 +645,8 @@ async def fulfill_stock(
 ) -> InventoryLevel:
     """Fulfill reserved stock (order shipped).
 
-    Decrements both ``quantity`` and ``reserved_quantity``. Creates
-    an adjustment record with reason=sold.
+    Decrements both ``quantity`` and ``reserved_quantity`` with a single
+    conditional UPDATE. Creates an adjustment record with reason=sold.
 
     Args:
         db: Async database session.
@@ -602,35 +661,28 @@ async def fulfill_stock(
     Raises:
         ValueError: If insufficient reserved or total stock.
     """
-    result = await db.execute(
-        select(InventoryLevel).where(
-            InventoryLevel.variant_id == variant_id,
-            InventoryLevel.warehouse_id == warehouse_id,
-        )
+    level_id = await _conditional_level_update(
+        db, variant_id, warehouse_id,
+        (InventoryLevel.reserved_quantity >= quantity)
+        & (InventoryLevel.quantity >= quantity),
+        quantity=InventoryLevel.quantity - quantity,
+        reserved_quantity=InventoryLevel.reserved_quantity - quantity,
     )
-    level = result.scalar_one_or_none()
-    if level is None:
-        raise ValueError("No inventory level found for this variant/warehouse")
-
-    if level.reserved_quantity < quantity:
-        raise ValueError("Cannot fulfill more than reserved")
-    if level.quantity < quantity:
+    if level_id is None:
+        level = await _level_by_variant(db, variant_id, warehouse_id)
+        if level.reserved_quantity < quantity:
+            raise ValueError("Cannot fulfill more than reserved")
         raise ValueError("Cannot fulfill more than total quantity")
 
-    level.quantity -= quantity
-    level.reserved_quantity -= quantity
-
-    adjustment = InventoryAdjustment(
-        inventory_level_id=level.id,
+    db.add(InventoryAdjustment(
+        inventory_level_id=level_id,
         quantity_change=-quantity,
         reason=AdjustmentReason.sold,
         reference_id=order_id,
         notes=f"Fulfilled {quantity} units",
-    )
-    db.add(adjustment)
+    ))
     await db.flush()
-    await db.refresh(level)
-    return level
+    return await _level_by_variant(db, variant_id, warehouse_id)
 
 
 # ---------------------------------------------------------------------------
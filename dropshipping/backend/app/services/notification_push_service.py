@@ -0,0 +1,378 @@
+"""Cached unread counters and live push for dashboard notifications.
+
+The dashboard used to poll ``/notifications/unread-count`` (a ``COUNT``
+over the user's notifications) and the notification list. Unread counts
+are now kept per user in Redis, and new notifications and count changes
+are pushed to open dashboards over Server-Sent Events.
+
+**For Developers:**
+    - ``notifications:unread:<user_id>`` holds the user's unread count.
+      ``get_unread_count`` reads it and, on a miss, counts in PostgreSQL
+      and seeds the key (``SET NX``, ``UNREAD_TTL_SECONDS``). Writers only
+      adjust keys that already exist, so a counter is never started from a
+      partial count; the TTL bounds any drift. Decrements are clamped at
+      zero.
+    - Counters move and pushes go out only once the write has committed.
+      ``notification_tasks`` (and the tracking poller's bulk insert) call
+      ``notifications_created_sync`` after committing;
+      ``notification_service`` calls ``notification_created``,
+      ``unread_decreased`` and ``unread_cleared`` with its session next
+      to its writes, and they run through ``database.on_commit``, so a
+      rolled-back request pushes nothing. Each writer publishes one
+      message per user on ``CHANNEL``.
+    - Every API process runs ``listen_for_notifications`` (started in the
+      app lifespan next to the storefront route listener). It holds the
+      process's single subscription to ``CHANNEL`` and hands messages to
+      the process-wide ``NotificationHub``, which fans them out to the
+      in-memory queues of that user's open streams. An idle dashboard
+      therefore costs one queue and one parked coroutine, not a Redis
+      connection.
+    - ``stream_events`` produces the SSE body of one connection: the
+      current unread count, then ``notification`` and ``unread_count``
+      events as they arrive, and a comment line every
+      ``settings.notification_stream_heartbeat_seconds`` to keep proxies
+      from closing the connection. A slow client's queue drops its oldest
+      messages once ``settings.notification_stream_queue_size`` are
+      waiting; every message carries the absolute unread count, so the
+      badge recovers with the next one.
+    - Redis is an accelerator: on ``RedisError`` counts come from
+      PostgreSQL and pushes are skipped (the dashboard still shows new
+      notifications on its next list fetch).
+
+**For QA Engineers:**
+    - ``GET /api/v1/notifications/stream`` answers ``text/event-stream``.
+      Events are ``unread_count`` (``{"count": n}``) and ``notification``
+      (the notification as returned by the list endpoint plus
+      ``unread_count``, which is null if the server had no cached count).
+    - Marking notifications read, marking all read, and deleting an unread
+      notification push the new count to every open tab of the user.
+
+**For Project Managers:**
+    Notifications appear on the dashboard as they happen instead of up to
+    a minute later, and idle dashboards no longer generate database load.
+
+**For End Users:**
+    New orders, reviews and alerts show up in your notification bell the
+    moment they happen.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import on_commit
+from app.models.notification import Notification
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "notifications:push"
+"""Redis pub/sub channel carrying notification pushes for all users."""
+
+UNREAD_TTL_SECONDS = 24 * 3600
+"""Lifetime of an unread counter; it is recounted from PostgreSQL afterwards."""
+
+# KEYS: counter. ARGV: count, ttl. Returns the counter's value.
+_SEED_LUA = """
+redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2])
+return tonumber(redis.call('GET', KEYS[1]))
+"""
+
+# KEYS: counter. ARGV: delta. Returns the new value, or nil without a counter.
+_ADJUST_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    value = 0
+end
+return value
+"""
+
+
+def _unread_key(user_id: uuid.UUID) -> str:
+    """Return the unread counter key of a user."""
+    return f"notifications:unread:{user_id}"
+
+
+def _count_unread_stmt(user_id: uuid.UUID):
+    """Count a user's unread notifications in PostgreSQL."""
+    return select(func.count(Notification.id)).where(
+        Notification.user_id == user_id,
+        Notification.is_read.is_(False),
+    )
+
+
+def serialize_notification(notification: Notification) -> dict:
+    """Render a notification the way the list endpoint returns it."""
+    from app.schemas.notification import NotificationResponse
+
+    return NotificationResponse.model_validate(notification).model_dump(mode="json")
+
+
+def _message(user_id: uuid.UUID, event: str, data: dict) -> str:
+    return json.dumps({"user_id": str(user_id), "event": event, "data": data})
+
+
+# ---------------------------------------------------------------------------
+# Counters
+# ---------------------------------------------------------------------------
+
+
+async def get_unread_count(db: AsyncSession, user_id: uuid.UUID) -> int:
+    """Get a user's unread notification count.
+
+    Args:
+        db: Async database session (used only on a Redis miss).
+        user_id: The user's UUID.
+
+    Returns:
+        The number of unread notifications.
+    """
+    key = _unread_key(user_id)
+    try:
+        redis = get_redis()
+        cached = await redis.get(key)
+        if cached is not None:
+            return int(cached)
+    except RedisError as exc:
+        redis = None
+        logger.warning("Unread counter read failed, using PostgreSQL: %s", exc)
+
+    count = (await db.execute(_count_unread_stmt(user_id))).scalar_one()
+    if redis is not None:
+        try:
+            return int(
+                await redis.register_script(_SEED_LUA)(
+                    keys=[key], args=[count, UNREAD_TTL_SECONDS]
+                )
+            )
+        except RedisError as exc:
+            logger.warning("Unread counter seed failed: %s", exc)
+    return count
+
+
+def notification_created(db: AsyncSession, notification: Notification) -> None:
+    """Count a new unread notification and push it once ``db`` commits.
+
+    Args:
+        db: The session that created the notification.
+        notification: The notification that was just created (flushed).
+    """
+    data = serialize_notification(notification)
+    on_commit(db, lambda: notifications_created_sync([data]))
+
+
+def _decrease(user_id: uuid.UUID, by: int) -> None:
+    try:
+        redis = get_sync_redis()
+        count = redis.register_script(_ADJUST_LUA)(keys=[_unread_key(user_id)], args=[-by])
+        if count is not None:
+            redis.publish(CHANNEL, _message(user_id, "unread_count", {"count": int(count)}))
+    except RedisError as exc:
+        logger.warning("Unread counter update failed: user=%s error=%s", user_id, exc)
+
+
+def unread_decreased(db: AsyncSession, user_id: uuid.UUID, by: int) -> None:
+    """Take read or deleted notifications off the unread counter on commit.
+
+    Args:
+        db: The session that marked or deleted the notifications.
+        user_id: The user's UUID.
+        by: How many unread notifications went away.
+    """
+    if by > 0:
+        on_commit(db, lambda: _decrease(user_id, by))
+
+
+def _clear(user_id: uuid.UUID) -> None:
+    try:
+        redis = get_sync_redis()
+        redis.set(_unread_key(user_id), 0, ex=UNREAD_TTL_SECONDS)
+        redis.publish(CHANNEL, _message(user_id, "unread_count", {"count": 0}))
+    except RedisError as exc:
+        logger.warning("Unread counter update failed: user=%s error=%s", user_id, exc)
+
+
+def unread_cleared(db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Reset a user's unread counter to zero once marking all read commits.
+
+    Args:
+        db: The session that marked the notifications read.
+        user_id: The user's UUID.
+    """
+    on_commit(db, lambda: _clear(user_id))
+
+
+def notifications_created_sync(notifications: Iterable[Notification | dict]) -> None:
+    """Count and push notifications committed by a Celery worker.
+
+    Args:
+        notifications: Committed Notification instances, or dicts with
+            their serialized fields (for bulk ``INSERT ... RETURNING``).
+    """
+    notifications = [
+        n if isinstance(n, dict) else serialize_notification(n) for n in notifications
+    ]
+    if not notifications:
+        return
+    per_user: dict[str, int] = defaultdict(int)
+    for data in notifications:
+        per_user[str(data["user_id"])] += 1
+    try:
+        redis = get_sync_redis()
+        adjust = redis.register_script(_ADJUST_LUA)
+        with redis.pipeline(transaction=False) as pipe:
+            for user_id, delta in per_user.items():
+                adjust(keys=[_unread_key(user_id)], args=[delta], client=pipe)
+            counts = dict(zip(per_user, pipe.execute()))
+        with redis.pipeline(transaction=False) as pipe:
+            for data in notifications:
+                user_id = str(data["user_id"])
+                count = counts[user_id]
+                pipe.publish(CHANNEL, _message(
+                    user_id,
+                    "notification",
+                    data | {"unread_count": None if count is None else int(count)},
+                ))
+            pipe.execute()
+    except RedisError as exc:
+        logger.warning("Notification push failed: %s", exc)
+
+
+# ---------------------------------------------------------------------------
+# Fan-out
+# ---------------------------------------------------------------------------
+
+
+class NotificationHub:
+    """Fans pushed messages out to this process's open notification streams.
+
+    Attributes:
+        queue_size: Messages a stream may have waiting before the oldest
+            are dropped.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._streams: dict[str, set[asyncio.Queue]] = defaultdict(set)
+
+    @property
+    def connections(self) -> int:
+        """Number of open streams in this process."""
+        return sum(len(queues) for queues in self._streams.values())
+
+    def subscribe(self, user_id: uuid.UUID) -> asyncio.Queue:
+        """Register a new stream for a user and return its queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._streams[str(user_id)].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: uuid.UUID, queue: asyncio.Queue) -> None:
+        """Forget a closed stream."""
+        queues = self._streams.get(str(user_id))
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._streams[str(user_id)]
+
+    def dispatch(self, message: dict) -> int:
+        """Hand a message to every open stream of its user.
+
+        Args:
+            message: Decoded channel message (``user_id``, ``event``,
+                ``data``).
+
+        Returns:
+            The number of streams that received it.
+        """
+        queues = self._streams.get(message["user_id"], ())
+        for queue in queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((message["event"], message["data"]))
+        return len(queues)
+
+
+_hub: NotificationHub | None = None
+
+
+def get_notification_hub() -> NotificationHub:
+    """Return the process-wide notification hub."""
+    global _hub
+    if _hub is None:
+        _hub = NotificationHub(settings.notification_stream_queue_size)
+    return _hub
+
+
+def reset_notification_hub() -> None:
+    """Drop the hub (tests; open streams keep their old queues)."""
+    global _hub
+    _hub = None
+
+
+async def listen_for_notifications() -> None:
+    """Deliver pushed notifications to this process's streams, forever.
+
+    Reconnects after Redis errors.
+    """
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(CHANNEL)
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
+                    try:
+                        get_notification_hub().dispatch(json.loads(message["data"]))
+                    except (KeyError, ValueError) as exc:
+                        logger.warning("Malformed notification push: %s", exc)
+        except RedisError as exc:
+            logger.warning("Notification listener disconnected: %s", exc)
+            await asyncio.sleep(5)
+        finally:
+            await pubsub.aclose()
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_events(user_id: uuid.UUID, unread_count: int) -> AsyncIterator[str]:
+    """Produce the Server-Sent Events body of one dashboard connection.
+
+    Args:
+        user_id: The connected user's UUID.
+        unread_count: The user's unread count when the stream opened.
+
+    Yields:
+        SSE-formatted event and heartbeat chunks, until the client
+        disconnects (the response cancels the generator).
+    """
+    hub = get_notification_hub()
+    queue = hub.subscribe(user_id)
+    try:
+        yield _sse("unread_count", {"count": unread_count})
+        while True:
+            try:
+                event, data = await asyncio.wait_for(
+                    queue.get(), settings.notification_stream_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _sse(event, data)
+    finally:
+        hub.unsubscribe(user_id, queue)
@@ -11,7 +11,9 @@ associated with a store for context.
     refund service) to notify the user of important events. The
     ``action_url`` field provides a deep link to the relevant dashboard
     page. The ``metadata`` field stores arbitrary JSON for rich
-    notification rendering.
+    notification rendering. Unread counts are served from a Redis counter
+    and every write pushes the change to open dashboards once it commits
+    (see ``notification_push_service``).
 
 **For QA Engineers:**
     - ``list_notifications`` supports ``unread_only`` filtering and
@@ -19,7 +21,9 @@ associated with a store for context.
     - ``mark_as_read`` accepts a list of notification IDs for batch
       marking.
     - ``mark_all_as_read`` marks all unread notifications for the user.
-    - ``get_unread_count`` returns a scalar count for badge display.
+    - ``get_unread_count`` returns a scalar count for badge display; it
+      comes from the cached counter and only counts in PostgreSQL on a
+      cache miss.
     - ``delete_notification`` is a hard delete.
 
 **For Project Managers:**
@@ -39,6 +43,7 @@ from datetime import datetime, timezone
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services import notification_push_service
 
 # ---------------------------------------------------------------------------
 # Notification model -- import conditionally.
@@ -85,12 +90,13 @@ async def create_notification(
         title=title,
         message=message,
         action_url=action_url,
-        metadata=metadata or {},
+        metadata_=metadata or {},
         is_read=False,
     )
     db.add(notification)
     await db.flush()
     await db.refresh(notification)
+    notification_push_service.notification_created(db, notification)
     return notification
 
 
@@ -164,6 +170,7 @@ async def mark_as_read(
         .values(is_read=True)
     )
     await db.flush()
+    notification_push_service.unread_decreased(db, user_id, result.rowcount)
     return result.rowcount
 
 
@@ -189,6 +196,7 @@ async def mark_all_as_read(
         .values(is_read=True)
     )
     await db.flush()
+    notification_push_service.unread_cleared(db, user_id)
     return result.rowcount
 
 
@@ -198,7 +206,8 @@ async def get_unread_count(
 ) -> int:
     """Get the count of unread notifications for a user.
 
-    Used for displaying a notification badge count in the UI.
+    Used for displaying a notification badge count in the UI. Served from
+    the user's cached counter; PostgreSQL is only counted on a miss.
 
     Args:
         db: Async database session.
@@ -207,13 +216,7 @@ async def get_unread_count(
     Returns:
         The number of unread notifications.
     """
-    result = await db.execute(
-        select(func.count(Notification.id)).where(
-            Notification.user_id == user_id,
-            Notification.is_read.is_(False),
-        )
-    )
-    return result.scalar_one()
+    return await notification_push_service.get_unread_count(db, user_id)
 
 
 async def delete_notification(
@@ -244,5 +247,8 @@ async def delete_notification(
     if notification is None:
         raise ValueError("Notification not found")
 
+    was_unread = not notification.is_read
     await db.delete(notification)
     await db.flush()
+    if was_unread:
+        notification_push_service.unread_decreased(db, user_id, 1)
@@ -0,0 +1,236 @@
+"""Post-payment pipeline helpers: stage timings and low-stock digests.
+
+Supports the ``process_paid_order`` Celery pipeline with the sync
+queries it needs and the per-store aggregation of low-stock alerts.
+
+**For Developers:**
+    - ``record_stage_sync`` stores how many seconds after ``paid_at`` a
+      pipeline stage finished, in ``orders.pipeline_timings``. The merge
+      (``pipeline_timings || {stage: seconds}``) and the clock both run in
+      PostgreSQL, so stages finishing in parallel workers never overwrite
+      each other.
+    - ``find_low_stock_variants_sync`` joins the order's items to their
+      variants in one query and returns the variants at or below
+      ``settings.low_stock_threshold``.
+    - ``queue_low_stock_digest`` adds variant IDs to a per-store Redis set
+      and, once per ``settings.low_stock_digest_window_seconds``,
+      schedules ``send_low_stock_digest`` for the store. The digest task
+      takes the whole set with ``pop_low_stock_digest``.
+    - ``low_stock_digest_items_sync`` loads the variants of a digest with
+      their product titles, skipping variants restocked in the meantime.
+
+**For QA Engineers:**
+    - Stage names: ``pipeline_started``, ``fraud_checked``,
+      ``confirmation_sent``, ``webhooks_dispatched``, ``owner_notified``
+      and ``fulfilled``. Values are seconds since ``paid_at`` (or since
+      ``created_at`` for orders paid before ``paid_at`` existed).
+    - Many orders selling the same store's stock within one window give
+      the owner a single email and a single notification.
+
+**For Project Managers:**
+    Stage timings show how long paid orders take to be checked, confirmed
+    and fulfilled, and where that time goes.
+
+**For End Users:**
+    Low-stock warnings arrive as one summary per store instead of one
+    message per sold variant.
+"""
+
+import uuid
+
+from redis import Redis
+from sqlalchemy import extract, func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.order import Order, OrderItem
+from app.models.product import Product, ProductVariant
+from app.redis_client import get_sync_redis
+
+PIPELINE_STAGES = (
+    "pipeline_started",
+    "fraud_checked",
+    "confirmation_sent",
+    "webhooks_dispatched",
+    "owner_notified",
+    "fulfilled",
+)
+"""Post-payment stages recorded in ``Order.pipeline_timings``."""
+
+
+def _digest_key(store_id: str) -> str:
+    """Redis set holding a store's pending low-stock variant IDs."""
+    return f"low-stock:digest:{store_id}"
+
+
+def _digest_kick_key(store_id: str) -> str:
+    """Redis key marking that a digest is already scheduled for a store."""
+    return f"low-stock:digest:{store_id}:scheduled"
+
+
+def record_stage_sync(
+    session: Session, order_id: uuid.UUID, stage: str
+) -> float | None:
+    """Record that a pipeline stage finished for an order.
+
+    Args:
+        session: Sync database session (not committed).
+        order_id: The order's UUID.
+        stage: One of ``PIPELINE_STAGES``.
+
+    Returns:
+        Seconds from payment to this stage, or None if the order is gone.
+
+    Raises:
+        ValueError: If the stage name is unknown.
+    """
+    if stage not in PIPELINE_STAGES:
+        raise ValueError(f"Unknown pipeline stage: {stage}")
+    # clock_timestamp() rather than now(): the stage finished now, not when
+    # the surrounding transaction began.
+    elapsed = func.round(
+        extract(
+            "epoch",
+            func.clock_timestamp() - func.coalesce(Order.paid_at, Order.created_at),
+        ),
+        3,
+    )
+    timings = session.execute(
+        update(Order)
+        .where(Order.id == order_id)
+        .values(
+            pipeline_timings=func.coalesce(
+                Order.pipeline_timings, literal({}, JSONB)
+            ).op("||")(func.jsonb_build_object(stage, elapsed))
+        )
+        .returning(Order.pipeline_timings)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+    return timings.get(stage) if timings else None
+
+
+def find_low_stock_variants_sync(
+    session: Session, order_id: uuid.UUID
+) -> list[uuid.UUID]:
+    """Find the order's variants that are at or below the low-stock threshold.
+
+    Args:
+        session: Sync database session.
+        order_id: The paid order's UUID.
+
+    Returns:
+        Distinct variant UUIDs, in a stable order.
+    """
+    return list(
+        session.execute(
+            select(ProductVariant.id)
+            .join(OrderItem, OrderItem.variant_id == ProductVariant.id)
+            .where(
+                OrderItem.order_id == order_id,
+                ProductVariant.inventory_count <= settings.low_stock_threshold,
+            )
+            .distinct()
+            .order_by(ProductVariant.id)
+        ).scalars().all()
+    )
+
+
+def queue_low_stock_digest(
+    store_id: str, variant_ids: list[uuid.UUID], redis: Redis | None = None
+) -> bool:
+    """Add low-stock variants to the store's pending digest.
+
+    Args:
+        store_id: UUID string of the store.
+        variant_ids: The low-stock variants to report.
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        True if this call scheduled the store's next digest task.
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    if not variant_ids:
+        return False
+    redis = redis or get_sync_redis()
+    window = settings.low_stock_digest_window_seconds
+    key = _digest_key(store_id)
+    pipe = redis.pipeline()
+    pipe.sadd(key, *(str(v) for v in variant_ids))
+    # Outlive the scheduled digest so a delayed worker still finds the set.
+    pipe.expire(key, window * 4)
+    pipe.execute()
+    if redis.set(_digest_kick_key(store_id), "1", nx=True, ex=window):
+        from app.tasks.notification_tasks import send_low_stock_digest
+
+        send_low_stock_digest.apply_async((store_id,), countdown=window)
+        return True
+    return False
+
+
+def pop_low_stock_digest(store_id: str, redis: Redis | None = None) -> list[str]:
+    """Take every pending low-stock variant ID of a store.
+
+    Args:
+        store_id: UUID string of the store.
+        redis: Sync Redis client (defaults to ``get_sync_redis()``).
+
+    Returns:
+        The variant ID strings (empty if nothing is pending).
+
+    Raises:
+        redis.RedisError: If Redis is unavailable.
+    """
+    redis = redis or get_sync_redis()
+    pipe = redis.pipeline(transaction=True)
+    pipe.smembers(_digest_key(store_id))
+    pipe.delete(_digest_key(store_id))
+    members, _ = pipe.execute()
+    return sorted(members)
+
+
+def low_stock_digest_items_sync(
+    session: Session, store_id: uuid.UUID, variant_ids: list[uuid.UUID]
+) -> list[dict]:
+    """Load the variants of a digest that are still low on stock.
+
+    Args:
+        session: Sync database session.
+        store_id: The store's UUID (variants of other stores are ignored).
+        variant_ids: Candidate variant UUIDs.
+
+    Returns:
+        List of dicts with ``product_id``, ``product_title``,
+        ``variant_id``, ``variant_name`` and ``inventory_count``, lowest
+        stock first.
+    """
+    if not variant_ids:
+        return []
+    rows = session.execute(
+        select(
+            Product.id,
+            Product.title,
+            ProductVariant.id,
+            ProductVariant.name,
+            ProductVariant.inventory_count,
+        )
+        .join(Product, Product.id == ProductVariant.product_id)
+        .where(
+            ProductVariant.id.in_(variant_ids),
+            Product.store_id == store_id,
+            ProductVariant.inventory_count <= settings.low_stock_threshold,
+        )
+        .order_by(ProductVariant.inventory_count, Product.title, ProductVariant.name)
+    ).all()
+    return [
+        {
+            "product_id": str(product_id),
+            "product_title": product_title,
+            "variant_id": str(variant_id),
+            "variant_name": variant_name,
+            "inventory_count": inventory_count,
+        }
+        for product_id, product_title, variant_id, variant_name, inventory_count in rows
+    ]
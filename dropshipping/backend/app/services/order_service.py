@@ -13,7 +13,12 @@ performing operations.
 **For QA Engineers:**
     - ``create_order_from_checkout`` validates that all products are active
       and in-stock before creating the order.
-    - ``confirm_order`` transitions the order from ``pending`` to ``paid``.
+    - ``create_order_from_checkout`` reserves warehouse stock for tracked
+      variants; the hold expires if the order is never paid.
+    - ``confirm_order`` transitions the order from ``pending`` to ``paid``
+      and stamps ``paid_at``, the start of the post-payment pipeline.
+    - Status changes into or out of a revenue status rebuild the order's
+      analytics rollup day if that day has already been materialized.
     - ``list_orders`` supports pagination and optional status filtering.
     - Store ownership is verified for all store-owner operations.
 
@@ -27,38 +32,20 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product, ProductStatus, ProductVariant
-from app.models.store import Store, StoreStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services import (
+    analytics_rollup_service,
+    fraud_feature_service,
+    reservation_service,
+    segment_rules_service,
+)
+from app.services.store_access_service import verify_store_ownership
 
 
 async def validate_and_build_order_items(
@@ -158,7 +145,8 @@ async def create_order_from_checkout(
 
     Creates the order record with full financial breakdown and shipping
     address. All monetary calculations (discount, tax, gift card) should
-    be performed by the caller before invoking this function.
+    be performed by the caller before invoking this function. Warehouse
+    stock for tracked variants is reserved atomically with a TTL.
 
     Args:
         db: Async database session.
@@ -177,6 +165,9 @@ async def create_order_from_checkout(
 
     Returns:
         The newly created Order ORM instance with items loaded.
+
+    Raises:
+        InsufficientStockError: If a tracked variant lacks warehouse stock.
     """
     order = Order(
         store_id=store_id,
@@ -208,7 +199,9 @@ async def create_order_from_checkout(
         db.add(order_item)
 
     await db.flush()
+    await reservation_service.reserve_for_order(db, store_id, order.id, items_data)
     await db.refresh(order)
+    await fraud_feature_service.record_order_placed(order)
     return order
 
 
@@ -239,18 +232,52 @@ async def confirm_order(
         return None
 
     order.status = OrderStatus.paid
+    order.paid_at = datetime.now(timezone.utc)
 
-    # Decrement inventory for variants
+    # Decrement inventory for variants in one set-based statement. The
+    # subtraction happens in SQL, so concurrent confirmations cannot
+    # overwrite each other's decrements.
+    sold: dict[uuid.UUID, int] = {}
     for item in order.items:
         if item.variant_id:
-            variant_result = await db.execute(
-                select(ProductVariant).where(ProductVariant.id == item.variant_id)
+            sold[item.variant_id] = sold.get(item.variant_id, 0) + item.quantity
+    if sold:
+        deltas = values(
+            column("variant_id", UUID(as_uuid=True)),
+            column("qty", Integer),
+            name="sold",
+        ).data(sorted(sold.items()))
+        result = await db.execute(
+            update(ProductVariant)
+            .where(ProductVariant.id == deltas.c.variant_id)
+            .values(
+                inventory_count=func.greatest(
+                    ProductVariant.inventory_count - deltas.c.qty, 0
+                )
             )
-            variant = variant_result.scalar_one_or_none()
-            if variant:
-                variant.inventory_count = max(0, variant.inventory_count - item.quantity)
+            .returning(ProductVariant.id, ProductVariant.inventory_count)
+            .execution_options(synchronize_session=False)
+        )
+        counts = dict(result.all())
+        for item in order.items:
+            if item.variant is not None and item.variant.id in counts:
+                set_committed_value(
+                    item.variant, "inventory_count", counts[item.variant.id]
+                )
+
+    await reservation_service.commit_order_reservations(
+        db,
+        order.store_id,
+        order.id,
+        [{"variant_id": i.variant_id, "quantity": i.quantity} for i in order.items],
+    )
 
     await db.flush()
+    await analytics_rollup_service.refresh_order_rollups(
+        db, order, OrderStatus.pending
+    )
+    await fraud_feature_service.record_status_change(order, OrderStatus.pending)
+    await segment_rules_service.on_order_status_change(db, order, OrderStatus.pending)
     await db.refresh(order)
     return order
 
@@ -279,7 +306,7 @@ async def list_orders(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Order).where(Order.store_id == store_id)
     count_query = select(func.count(Order.id)).where(Order.store_id == store_id)
@@ -321,7 +348,7 @@ async def get_order(
         ValueError: If the store or order doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Order).where(
@@ -361,11 +388,17 @@ async def update_order_status(
             belongs to another user.
     """
     order = await get_order(db, store_id, user_id, order_id)
+    previous_status = order.status
     if new_status is not None:
+        if new_status == OrderStatus.cancelled and order.status != OrderStatus.cancelled:
+            await reservation_service.release_order_reservations(db, order.id)
         order.status = new_status
     if notes is not ...:
         order.notes = notes
     await db.flush()
+    await analytics_rollup_service.refresh_order_rollups(db, order, previous_status)
+    await fraud_feature_service.record_status_change(order, previous_status)
+    await segment_rules_service.on_order_status_change(db, order, previous_status)
     await db.refresh(order)
     return order
 
@@ -408,6 +441,7 @@ async def fulfill_order(
     order.tracking_number = tracking_number
     order.carrier = carrier
     order.shipped_at = datetime.now(timezone.utc)
+    await reservation_service.fulfill_order_reservations(db, order.id)
     await db.flush()
     await db.refresh(order)
     return order
@@ -27,34 +27,9 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product, ProductStatus, ProductVariant
-from app.models.store import Store, StoreStatus
+from app.services.category_service import invalidate_category_tree
 from app.utils.slug import generate_unique_slug
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services.store_access_service import verify_store_ownership
 
 
 async def _generate_product_slug(
@@ -136,7 +111,7 @@ async def create_product(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     slug = await _generate_product_slug(db, store_id, title)
 
@@ -198,7 +173,7 @@ async def list_products(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Product).where(Product.store_id == store_id)
     count_query = select(func.count(Product.id)).where(Product.store_id == store_id)
@@ -247,7 +222,7 @@ async def get_product(
         ValueError: If the store or product doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Product).where(
@@ -319,6 +294,8 @@ async def update_product(
 
     await db.flush()
     await db.refresh(product)
+    if fields.get("status") is not None:
+        invalidate_category_tree(db, store_id)
     return product
 
 
@@ -347,4 +324,5 @@ async def delete_product(
     product.status = ProductStatus.archived
     await db.flush()
     await db.refresh(product)
+    invalidate_category_tree(db, store_id)
     return product
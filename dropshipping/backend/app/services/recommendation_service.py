@@ -0,0 +1,289 @@
+"""Precomputed storefront recommendations from order co-occurrence.
+
+Learns "frequently bought together" products from paid orders and blends
+them with the store owner's manual upsells into one precomputed table,
+so a product page gets its recommendations with a single lookup.
+
+**For Developers:**
+    - ``product_co_purchases`` is the sparse co-occurrence matrix
+      ``C = AᵀA`` of each store's order-item incidence matrix ``A``
+      (orders × products): ``C[i][j]`` counts the paid orders containing
+      both products, the diagonal ``C[i][i]`` the orders containing ``i``.
+      The product ``AᵀA`` is a set-based ``INSERT ... SELECT`` over a
+      self-join of ``order_items`` grouped by product pair, so PostgreSQL
+      only ever touches non-zero cells.
+    - ``refresh_recommendations_sync`` (Beat) folds the orders paid since
+      ``RecommendationWatermark`` into the matrix with one upsert that
+      adds to existing cells, then re-ranks only the affected rows: the
+      products in new orders and their co-purchased neighbours (whose
+      normalization changed). Scores are cosine similarities
+      ``C[i][j] / sqrt(C[i][i] * C[j][j])``; the top
+      ``settings.recommendation_top_k`` neighbours with at least
+      ``settings.recommendation_min_co_purchases`` shared orders are
+      stored, ranked with a window function. Orders paid within the last
+      ``SETTLE_SECONDS`` wait for the next run, so orders committed late
+      are not skipped.
+    - ``sync_manual_recommendations`` mirrors a product's active upsells
+      into the same table; ``upsell_service`` calls it on every change.
+    - ``get_product_recommendations`` returns manual rows first (by
+      position), then learned rows (by score), one per target product.
+
+**For QA Engineers:**
+    - Only paid, shipped and delivered orders are counted.
+    - A product recommends neither itself nor inactive products.
+    - A target that is both an upsell and a learned neighbour appears
+      once, as the upsell.
+    - Re-running the refresh without new orders changes nothing.
+
+**For Project Managers:**
+    Every product page gets relevant cross-sells from real purchase
+    history, even products the owner never configured upsells for.
+
+**For End Users:**
+    Product pages show what other customers bought together with the
+    product, after any recommendations you set up yourself.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Float, and_, cast, delete, distinct, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.models.order import Order, OrderItem
+from app.models.product import Product, ProductStatus
+from app.models.upsell import (
+    ProductCoPurchase,
+    ProductRecommendation,
+    RecommendationWatermark,
+    Upsell,
+)
+from app.services.analytics_rollup_service import REVENUE_STATUSES
+
+# Watermark row of the co-purchase matrix
+CO_PURCHASES = "co_purchases"
+
+# Orders paid this recently are left for the next refresh
+SETTLE_SECONDS = 120
+
+# Products re-ranked per statement
+RERANK_CHUNK = 1000
+
+_REFRESH_LOCK = "product_recommendations"
+
+_RECOMMENDATION_COLUMNS = [
+    "id", "store_id", "product_id", "target_product_id", "upsell_id", "score", "rank",
+]
+
+
+def _co_purchase_upsert(since: datetime | None, through: datetime):
+    """Add the product pairs of orders paid in ``(since, through]``."""
+    item, other = aliased(OrderItem), aliased(OrderItem)
+    paid_at = func.coalesce(Order.paid_at, Order.created_at)
+    criteria = [
+        Order.status.in_(REVENUE_STATUSES),
+        paid_at <= through,
+        item.product_id.isnot(None),
+        other.product_id.isnot(None),
+    ]
+    if since is not None:
+        criteria.append(paid_at > since)
+    pairs = (
+        select(
+            item.product_id, other.product_id, Order.store_id,
+            func.count(distinct(Order.id)),
+        )
+        .select_from(Order)
+        .join(item, item.order_id == Order.id)
+        .join(other, other.order_id == Order.id)
+        .where(*criteria)
+        .group_by(item.product_id, other.product_id, Order.store_id)
+    )
+    stmt = pg_insert(ProductCoPurchase).from_select(
+        ["product_id", "other_product_id", "store_id", "orders"], pairs
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[ProductCoPurchase.product_id, ProductCoPurchase.other_product_id],
+        set_={"orders": ProductCoPurchase.orders + stmt.excluded.orders},
+    ).returning(ProductCoPurchase.product_id)
+
+
+def _rerank_stmt(product_ids: list[uuid.UUID]):
+    """Insert the top-K learned recommendations of ``product_ids``."""
+    cell = ProductCoPurchase
+    own, theirs = aliased(ProductCoPurchase), aliased(ProductCoPurchase)
+    score = cell.orders / func.sqrt(cast(own.orders * theirs.orders, Float))
+    ranked = (
+        select(
+            cell.store_id,
+            cell.product_id,
+            cell.other_product_id,
+            score.label("score"),
+            func.row_number().over(
+                partition_by=cell.product_id,
+                order_by=(score.desc(), cell.orders.desc(), cell.other_product_id),
+            ).label("rank"),
+        )
+        .join(own, and_(
+            own.product_id == cell.product_id, own.other_product_id == cell.product_id
+        ))
+        .join(theirs, and_(
+            theirs.product_id == cell.other_product_id,
+            theirs.other_product_id == cell.other_product_id,
+        ))
+        .where(
+            cell.product_id.in_(product_ids),
+            cell.product_id != cell.other_product_id,
+            cell.orders >= settings.recommendation_min_co_purchases,
+        )
+        .subquery()
+    )
+    return insert(ProductRecommendation).from_select(
+        _RECOMMENDATION_COLUMNS,
+        select(
+            func.gen_random_uuid(), ranked.c.store_id, ranked.c.product_id,
+            ranked.c.other_product_id, None, ranked.c.score, ranked.c.rank - 1,
+        ).where(ranked.c.rank <= settings.recommendation_top_k),
+    )
+
+
+def refresh_recommendations_sync(session: Session, now: datetime | None = None) -> dict:
+    """Fold newly paid orders into the matrix and re-rank affected products.
+
+    On the first run every past order is counted. The caller commits.
+
+    Args:
+        session: Sync database session.
+        now: Current time (defaults to now).
+
+    Returns:
+        Dict with ``cells`` (matrix cells added to) and ``products``
+        (products whose learned recommendations were rebuilt).
+    """
+    now = now or datetime.now(timezone.utc)
+    through = now - timedelta(seconds=SETTLE_SECONDS)
+
+    session.execute(select(func.pg_advisory_xact_lock(func.hashtext(_REFRESH_LOCK))))
+    since = session.execute(
+        select(RecommendationWatermark.processed_through)
+        .where(RecommendationWatermark.name == CO_PURCHASES)
+    ).scalar_one_or_none()
+    if since is not None and since >= through:
+        return {"cells": 0, "products": 0}
+
+    touched = session.execute(_co_purchase_upsert(since, through)).scalars().all()
+    affected: list[uuid.UUID] = []
+    if touched:
+        # Neighbours of a touched product are re-ranked too: their score
+        # against it depends on its diagonal count. The diagonal makes
+        # every touched product its own neighbour.
+        affected = list(session.execute(
+            select(distinct(ProductCoPurchase.other_product_id))
+            .where(ProductCoPurchase.product_id.in_(set(touched)))
+        ).scalars())
+    for start in range(0, len(affected), RERANK_CHUNK):
+        chunk = affected[start:start + RERANK_CHUNK]
+        session.execute(delete(ProductRecommendation).where(
+            ProductRecommendation.product_id.in_(chunk),
+            ProductRecommendation.upsell_id.is_(None),
+        ))
+        session.execute(_rerank_stmt(chunk))
+
+    watermark = pg_insert(RecommendationWatermark).values(
+        name=CO_PURCHASES, processed_through=through
+    )
+    session.execute(watermark.on_conflict_do_update(
+        index_elements=[RecommendationWatermark.name],
+        set_={"processed_through": watermark.excluded.processed_through, "updated_at": func.now()},
+    ))
+    return {"cells": len(touched), "products": len(affected)}
+
+
+async def sync_manual_recommendations(db: AsyncSession, product_id: uuid.UUID) -> None:
+    """Mirror a product's active upsells into its recommendations.
+
+    Call after the product's upsells changed and were flushed.
+
+    Args:
+        db: Async database session.
+        product_id: The upsells' source product.
+    """
+    await db.execute(delete(ProductRecommendation).where(
+        ProductRecommendation.product_id == product_id,
+        ProductRecommendation.upsell_id.isnot(None),
+    ))
+    await db.execute(insert(ProductRecommendation).from_select(
+        _RECOMMENDATION_COLUMNS,
+        select(
+            func.gen_random_uuid(), Upsell.store_id, Upsell.source_product_id,
+            Upsell.target_product_id, Upsell.id, None,
+            func.row_number().over(order_by=(Upsell.position, Upsell.created_at)) - 1,
+        ).where(Upsell.source_product_id == product_id, Upsell.is_active.is_(True)),
+    ))
+
+
+async def get_product_recommendations(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    product_id: uuid.UUID,
+    limit: int | None = None,
+) -> list[dict]:
+    """Return a product's blended storefront recommendations.
+
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        product_id: The product being viewed.
+        limit: Maximum recommendations (defaults to
+            ``settings.recommendation_top_k``).
+
+    Returns:
+        Dicts with the target product's ``target_product_id``,
+        ``target_product_title``, ``target_product_slug``,
+        ``target_product_price`` and ``target_product_image``, plus
+        ``upsell_type``, ``title``, ``description``,
+        ``discount_percentage`` and ``source`` (``"manual"`` or
+        ``"learned"``). Manual upsells come first, in position order.
+    """
+    rec = ProductRecommendation
+    per_target = (
+        select(
+            rec.target_product_id, rec.upsell_id, rec.rank, rec.score,
+            Product.title.label("target_title"), Product.slug, Product.price, Product.images,
+            Upsell.upsell_type, Upsell.title, Upsell.description, Upsell.discount_percentage,
+        )
+        .join(Product, Product.id == rec.target_product_id)
+        .outerjoin(Upsell, Upsell.id == rec.upsell_id)
+        .where(
+            rec.product_id == product_id,
+            rec.store_id == store_id,
+            rec.target_product_id != product_id,
+            Product.status == ProductStatus.active,
+        )
+        .distinct(rec.target_product_id)
+        .order_by(rec.target_product_id, rec.upsell_id.is_(None), rec.rank)
+        .subquery()
+    )
+    rows = await db.execute(
+        select(per_target)
+        .order_by(per_target.c.upsell_id.is_(None), per_target.c.rank)
+        .limit(limit or settings.recommendation_top_k)
+    )
+    return [
+        {
+            "target_product_id": row.target_product_id,
+            "target_product_title": row.target_title,
+            "target_product_slug": row.slug,
+            "target_product_price": row.price,
+            "target_product_image": row.images[0] if row.images else None,
+            "upsell_type": row.upsell_type.value if row.upsell_type else "cross_sell",
+            "title": row.title,
+            "description": row.description,
+            "discount_percentage": row.discount_percentage,
+            "source": "manual" if row.upsell_id else "learned",
+        }
+        for row in rows
+    ]
@@ -39,33 +39,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.order import Order, OrderStatus
 from app.models.refund import Refund, RefundReason, RefundStatus
-from app.models.store import Store, StoreStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services import (
+    analytics_rollup_service,
+    fraud_feature_service,
+    reservation_service,
+    segment_rules_service,
+)
+from app.services.store_access_service import verify_store_ownership
 
 
 async def create_refund(
@@ -100,7 +80,7 @@ async def create_refund(
             doesn't belong to the store, or the refund amount exceeds
             the refundable balance.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Verify order belongs to the store
     order_result = await db.execute(
@@ -174,7 +154,7 @@ async def list_refunds(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Refund).where(Refund.store_id == store_id)
     count_query = select(func.count(Refund.id)).where(Refund.store_id == store_id)
@@ -216,7 +196,7 @@ async def get_refund(
         ValueError: If the store or refund doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Refund).where(
@@ -313,6 +293,7 @@ async def process_refund(
         select(Order).where(Order.id == refund.order_id)
     )
     order = order_result.scalar_one_or_none()
+    previous_status = order.status if order is not None else None
     if order is not None:
         total_refunded_result = await db.execute(
             select(func.coalesce(func.sum(Refund.amount), Decimal("0.00"))).where(
@@ -323,7 +304,14 @@ async def process_refund(
         total_refunded = total_refunded_result.scalar_one()
         if total_refunded >= order.total:
             order.status = OrderStatus.cancelled
+            await reservation_service.release_order_reservations(db, order.id)
 
     await db.flush()
+    if order is not None:
+        await analytics_rollup_service.refresh_order_rollups(
+            db, order, previous_status
+        )
+        await fraud_feature_service.record_status_change(order, previous_status)
+        await segment_rules_service.on_order_status_change(db, order, previous_status)
     await db.refresh(refund)
     return refund
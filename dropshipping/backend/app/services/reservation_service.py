@@ -0,0 +1,827 @@
+"""Atomic stock reservation engine.
+
+Holds warehouse inventory for checkouts without read-check-write races.
+Every hold is a single conditional statement::
+
+    UPDATE inventory_levels
+       SET reserved_quantity = reserved_quantity + d.qty
+      FROM (VALUES ...) AS d(level_id, qty)
+     WHERE inventory_levels.id = d.level_id
+       AND quantity - reserved_quantity >= d.qty
+    RETURNING inventory_levels.id
+
+so PostgreSQL itself arbitrates concurrent buyers. Each hold is recorded
+as a ``StockReservation`` row that transitions out of ``active`` exactly
+once (fulfilled, released, or expired).
+
+**For Developers:**
+    - ``reserve_levels`` reserves a batch of (inventory level, quantity)
+      lines all-or-nothing inside a savepoint. Multi-line batches lock
+      the affected rows in primary-key order first, so two carts that
+      contain the same SKUs in a different order cannot deadlock.
+    - ``reserve_for_order`` maps order item dicts onto inventory levels
+      (default warehouse first) and calls ``reserve_levels``. Variants
+      without inventory levels, or that allow backorders, are untracked
+      and skipped.
+    - ``release_order_reservations`` / ``fulfill_order_reservations`` /
+      ``expire_reservations`` close reservations with a conditional
+      ``UPDATE ... WHERE status = 'active' RETURNING`` and apply the
+      aggregated deltas to ``inventory_levels`` in one statement. The
+      ``*_sync`` variants run the same statements from Celery workers.
+    - Hot SKUs can be fronted by a Redis counter (``mark_level_hot``).
+      A Lua script checks and decrements the counters atomically, so a
+      flash sale rejects surplus buyers without touching PostgreSQL.
+      PostgreSQL stays the source of truth: a PostgreSQL rejection gives
+      the units back to Redis, and ``reconcile_hot_counters_sync``
+      periodically overwrites the counters with ``quantity - reserved``.
+
+**For QA Engineers:**
+    - Concurrent reservations never push ``reserved_quantity`` above
+      ``quantity``.
+    - A multi-line reservation either reserves every line or none.
+    - Expired holds are released by the ``release-expired-reservations``
+      Beat task and can no longer be fulfilled.
+    - When Redis is unavailable, hot SKUs fall back to PostgreSQL-only
+      reservations transparently.
+
+**For Project Managers:**
+    This engine prevents overselling during flash sales while keeping
+    checkout fast: every reservation costs one database round trip.
+
+**For End Users:**
+    Items in a checkout are held for you for a limited time, and two
+    customers can never buy the last unit at the same time.
+"""
+
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from redis.exceptions import RedisError
+from sqlalchemy import Integer, column, func, insert, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.inventory import (
+    AdjustmentReason,
+    InventoryAdjustment,
+    InventoryLevel,
+    ReservationStatus,
+    StockReservation,
+    Warehouse,
+)
+from app.models.product import ProductVariant
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+HOT_LEVELS_KEY = "inventory:hot_levels"
+"""Redis set of inventory level ids fronted by a hot counter."""
+
+# Checks every existing counter first, then decrements them all, so a
+# multi-line cart is gated atomically. Missing keys are not hot and pass.
+_TAKE_LUA = """
+for i, key in ipairs(KEYS) do
+    local avail = redis.call('GET', key)
+    if avail and tonumber(avail) < tonumber(ARGV[i]) then
+        return -i
+    end
+end
+local taken = 0
+for i, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('DECRBY', key, ARGV[i])
+        taken = taken + 1
+    end
+end
+return taken
+"""
+
+_GIVE_LUA = """
+for i, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        redis.call('INCRBY', key, ARGV[i])
+    end
+end
+return 1
+"""
+
+
+class InsufficientStockError(ValueError):
+    """Raised when a reservation cannot be satisfied.
+
+    Attributes:
+        level_ids: Inventory levels that did not have enough stock.
+    """
+
+    def __init__(self, message: str, level_ids: list[uuid.UUID] | None = None):
+        super().__init__(message)
+        self.level_ids = level_ids or []
+
+
+# ---------------------------------------------------------------------------
+# Statement builders (shared by the async API and sync Celery paths)
+# ---------------------------------------------------------------------------
+
+
+def _deltas_table(deltas: dict[uuid.UUID, int]):
+    """Build a ``VALUES`` table of (level_id, qty) sorted by level id.
+
+    Args:
+        deltas: Mapping of inventory level id to unit count.
+
+    Returns:
+        A SQLAlchemy ``Values`` construct usable in ``UPDATE ... FROM``.
+    """
+    return values(
+        column("level_id", UUID(as_uuid=True)),
+        column("qty", Integer),
+        name="deltas",
+    ).data(sorted(deltas.items()))
+
+
+def _lock_levels_stmt(level_ids: list[uuid.UUID]):
+    """Lock inventory level rows in primary-key order (deadlock avoidance)."""
+    return (
+        select(InventoryLevel.id)
+        .where(InventoryLevel.id.in_(level_ids))
+        .order_by(InventoryLevel.id)
+        .with_for_update()
+    )
+
+
+def _reserve_stmt(deltas: dict[uuid.UUID, int]):
+    """Conditionally add each delta to ``reserved_quantity``.
+
+    Only rows with enough available stock are updated; the ids of the
+    updated rows are returned.
+    """
+    d = _deltas_table(deltas)
+    return (
+        update(InventoryLevel)
+        .where(
+            InventoryLevel.id == d.c.level_id,
+            InventoryLevel.quantity - InventoryLevel.reserved_quantity >= d.c.qty,
+        )
+        .values(reserved_quantity=InventoryLevel.reserved_quantity + d.c.qty)
+        .returning(InventoryLevel.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _unreserve_stmt(deltas: dict[uuid.UUID, int], fulfill: bool):
+    """Subtract each delta from ``reserved_quantity`` (and ``quantity``).
+
+    Args:
+        deltas: Mapping of inventory level id to unit count.
+        fulfill: When True the units left the warehouse, so ``quantity``
+            is decremented as well.
+    """
+    d = _deltas_table(deltas)
+    new_values = {
+        "reserved_quantity": func.greatest(InventoryLevel.reserved_quantity - d.c.qty, 0),
+    }
+    if fulfill:
+        new_values["quantity"] = func.greatest(InventoryLevel.quantity - d.c.qty, 0)
+    return (
+        update(InventoryLevel)
+        .where(InventoryLevel.id == d.c.level_id)
+        .values(**new_values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _close_reservations_stmt(new_status: ReservationStatus, *criteria):
+    """Move matching ``active`` reservations to ``new_status``.
+
+    Returns the closed rows' level, quantity, and order ids so that the
+    caller can apply exactly the released units.
+    """
+    return (
+        update(StockReservation)
+        .where(StockReservation.status == ReservationStatus.active.value, *criteria)
+        .values(status=new_status.value)
+        .returning(
+            StockReservation.inventory_level_id,
+            StockReservation.quantity,
+            StockReservation.order_id,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _expired_criteria(now: datetime, limit: int):
+    """Criteria selecting a batch of lapsed holds, skipping locked rows.
+
+    ``SKIP LOCKED`` lets several sweepers run concurrently without
+    blocking each other or a checkout that is closing the same hold.
+    """
+    batch = (
+        select(StockReservation.id)
+        .where(
+            StockReservation.status == ReservationStatus.active.value,
+            StockReservation.expires_at.is_not(None),
+            StockReservation.expires_at <= now,
+        )
+        .order_by(StockReservation.expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (StockReservation.id.in_(batch.scalar_subquery()),)
+
+
+def _aggregate_closed(rows) -> tuple[dict[uuid.UUID, int], list[dict]]:
+    """Aggregate closed reservation rows per level and build audit rows.
+
+    Args:
+        rows: ``(inventory_level_id, quantity, order_id)`` tuples.
+
+    Returns:
+        Tuple of (per-level unit deltas, per-(level, order) groups).
+    """
+    deltas: dict[uuid.UUID, int] = defaultdict(int)
+    groups: dict[tuple, int] = defaultdict(int)
+    for level_id, quantity, order_id in rows:
+        deltas[level_id] += quantity
+        groups[(level_id, order_id)] += quantity
+    return dict(deltas), [
+        {"inventory_level_id": level_id, "order_id": order_id, "quantity": qty}
+        for (level_id, order_id), qty in groups.items()
+    ]
+
+
+def _adjustment_rows(groups: list[dict], reason: AdjustmentReason, note: str) -> list[dict]:
+    """Build ``InventoryAdjustment`` insert rows for closed reservations."""
+    sign = -1 if reason == AdjustmentReason.sold else 1
+    return [
+        {
+            "inventory_level_id": g["inventory_level_id"],
+            "quantity_change": sign * g["quantity"],
+            "reason": reason.value,
+            "reference_id": g["order_id"],
+            "notes": f"{note} {g['quantity']} units",
+        }
+        for g in groups
+    ]
+
+
+def _expiry(ttl_minutes: int | None) -> datetime | None:
+    """Compute a reservation expiry (``0`` means the hold never expires)."""
+    ttl = settings.stock_reservation_ttl_minutes if ttl_minutes is None else ttl_minutes
+    if ttl <= 0:
+        return None
+    return datetime.now(timezone.utc) + timedelta(minutes=ttl)
+
+
+# ---------------------------------------------------------------------------
+# Redis hot counters
+# ---------------------------------------------------------------------------
+
+
+def _counter_key(level_id: uuid.UUID | str) -> str:
+    """Redis key of the available-units counter for an inventory level."""
+    return f"inventory:avail:{level_id}"
+
+
+async def _hot_take(deltas: dict[uuid.UUID, int]) -> bool:
+    """Gate a reservation through the hot counters.
+
+    Args:
+        deltas: Mapping of inventory level id to requested units.
+
+    Returns:
+        False if a hot counter rejected the request, True otherwise
+        (including when no level is hot or Redis is unavailable).
+    """
+    if not settings.inventory_hot_counters_enabled:
+        return True
+    items = sorted(deltas.items())
+    try:
+        script = get_redis().register_script(_TAKE_LUA)
+        result = await script(
+            keys=[_counter_key(level_id) for level_id, _ in items],
+            args=[qty for _, qty in items],
+        )
+    except RedisError as exc:
+        logger.warning("Hot stock counters unavailable, using PostgreSQL only: %s", exc)
+        return True
+    return int(result) >= 0
+
+
+async def _hot_give(deltas: dict[uuid.UUID, int]) -> None:
+    """Return units to any hot counters (compensation or release)."""
+    if not settings.inventory_hot_counters_enabled or not deltas:
+        return
+    items = sorted(deltas.items())
+    try:
+        script = get_redis().register_script(_GIVE_LUA)
+        await script(
+            keys=[_counter_key(level_id) for level_id, _ in items],
+            args=[qty for _, qty in items],
+        )
+    except RedisError as exc:
+        logger.warning("Could not credit hot stock counters: %s", exc)
+
+
+def _hot_give_sync(deltas: dict[uuid.UUID, int]) -> None:
+    """Sync variant of ``_hot_give`` for Celery workers."""
+    if not settings.inventory_hot_counters_enabled or not deltas:
+        return
+    items = sorted(deltas.items())
+    try:
+        script = get_sync_redis().register_script(_GIVE_LUA)
+        script(
+            keys=[_counter_key(level_id) for level_id, _ in items],
+            args=[qty for _, qty in items],
+        )
+    except RedisError as exc:
+        logger.warning("Could not credit hot stock counters: %s", exc)
+
+
+async def _available(
+    db: AsyncSession, level_id: uuid.UUID, store_id: uuid.UUID | None = None
+) -> int | None:
+    """Read ``quantity - reserved_quantity`` for one level (no ORM load).
+
+    Args:
+        db: Async database session.
+        level_id: The inventory level's UUID.
+        store_id: When given, the level must belong to this store.
+
+    Returns:
+        Available units, or None if the level doesn't exist.
+    """
+    query = select(InventoryLevel.quantity - InventoryLevel.reserved_quantity).where(
+        InventoryLevel.id == level_id
+    )
+    if store_id is not None:
+        query = query.join(Warehouse, InventoryLevel.warehouse_id == Warehouse.id).where(
+            Warehouse.store_id == store_id
+        )
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
+
+
+async def mark_level_hot(
+    db: AsyncSession, store_id: uuid.UUID, level_id: uuid.UUID
+) -> int:
+    """Front an inventory level with a Redis hot counter.
+
+    Seeds the counter from PostgreSQL and registers the level for
+    periodic reconciliation.
+
+    Args:
+        db: Async database session.
+        store_id: The store that owns the level.
+        level_id: The inventory level to front.
+
+    Returns:
+        The seeded available-units value.
+
+    Raises:
+        ValueError: If the inventory level doesn't exist in the store.
+        RedisError: If Redis is unavailable.
+    """
+    available = await _available(db, level_id, store_id)
+    if available is None:
+        raise ValueError("Inventory level not found")
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.sadd(HOT_LEVELS_KEY, str(level_id))
+        pipe.set(_counter_key(level_id), available)
+        await pipe.execute()
+    return available
+
+
+async def unmark_level_hot(
+    db: AsyncSession, store_id: uuid.UUID, level_id: uuid.UUID
+) -> None:
+    """Stop fronting an inventory level with a hot counter.
+
+    Args:
+        db: Async database session.
+        store_id: The store that owns the level.
+        level_id: The inventory level to release from Redis.
+
+    Raises:
+        ValueError: If the inventory level doesn't exist in the store.
+    """
+    if await _available(db, level_id, store_id) is None:
+        raise ValueError("Inventory level not found")
+    try:
+        redis = get_redis()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.srem(HOT_LEVELS_KEY, str(level_id))
+            pipe.delete(_counter_key(level_id))
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Could not remove hot stock counter %s: %s", level_id, exc)
+
+
+async def refresh_hot_counter(db: AsyncSession, level_id: uuid.UUID) -> None:
+    """Resync a hot counter after a manual stock change (no-op if not hot).
+
+    Args:
+        db: Async database session.
+        level_id: The inventory level whose stock changed.
+    """
+    if not settings.inventory_hot_counters_enabled:
+        return
+    try:
+        redis = get_redis()
+        if not await redis.sismember(HOT_LEVELS_KEY, str(level_id)):
+            return
+        available = await _available(db, level_id)
+        if available is not None:
+            await redis.set(_counter_key(level_id), available)
+    except RedisError as exc:
+        logger.warning("Could not refresh hot stock counter %s: %s", level_id, exc)
+
+
+def reconcile_hot_counters_sync(session: Session) -> int:
+    """Overwrite every hot counter with PostgreSQL's available units.
+
+    Reservations that race with the reconciliation can leave a counter
+    briefly off by their quantity; PostgreSQL still arbitrates every
+    hold, and the next run corrects the drift.
+
+    Args:
+        session: Sync database session.
+
+    Returns:
+        Number of counters reconciled.
+    """
+    redis = get_sync_redis()
+    level_ids = [uuid.UUID(v) for v in redis.smembers(HOT_LEVELS_KEY)]
+    if not level_ids:
+        return 0
+    rows = session.execute(
+        select(
+            InventoryLevel.id,
+            InventoryLevel.quantity - InventoryLevel.reserved_quantity,
+        ).where(InventoryLevel.id.in_(level_ids))
+    ).all()
+    found = {level_id: available for level_id, available in rows}
+    pipe = redis.pipeline(transaction=False)
+    for level_id in level_ids:
+        if level_id in found:
+            pipe.set(_counter_key(level_id), found[level_id])
+        else:
+            # Level deleted: stop tracking it.
+            pipe.srem(HOT_LEVELS_KEY, str(level_id))
+            pipe.delete(_counter_key(level_id))
+    pipe.execute()
+    return len(found)
+
+
+# ---------------------------------------------------------------------------
+# Reserving
+# ---------------------------------------------------------------------------
+
+
+async def reserve_levels(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    lines: list[dict],
+    order_id: uuid.UUID | None = None,
+    ttl_minutes: int | None = None,
+) -> list[StockReservation]:
+    """Reserve stock for a batch of lines, all-or-nothing.
+
+    Args:
+        db: Async database session.
+        store_id: The store that owns the inventory.
+        lines: Dicts with ``inventory_level_id``, ``variant_id``, and
+            ``quantity``. Lines for the same level are merged.
+        order_id: Optional order the holds belong to.
+        ttl_minutes: Hold lifetime; ``None`` uses the configured default
+            and ``0`` creates holds that never expire.
+
+    Returns:
+        The created StockReservation records (one per inventory level).
+
+    Raises:
+        InsufficientStockError: If any line lacks available stock. No
+            line is reserved in that case.
+    """
+    deltas: dict[uuid.UUID, int] = defaultdict(int)
+    variants: dict[uuid.UUID, uuid.UUID] = {}
+    for line in lines:
+        if line["quantity"] <= 0:
+            raise ValueError("Reservation quantity must be positive")
+        deltas[line["inventory_level_id"]] += line["quantity"]
+        variants[line["inventory_level_id"]] = line["variant_id"]
+    deltas = dict(deltas)
+    if not deltas:
+        return []
+
+    if not await _hot_take(deltas):
+        raise InsufficientStockError("Insufficient stock", list(deltas))
+
+    try:
+        async with db.begin_nested():
+            if len(deltas) > 1:
+                await db.execute(_lock_levels_stmt(list(deltas)))
+            result = await db.execute(_reserve_stmt(deltas))
+            reserved = set(result.scalars().all())
+            missing = [level_id for level_id in deltas if level_id not in reserved]
+            if missing:
+                raise InsufficientStockError("Insufficient stock", missing)
+
+            await db.execute(
+                insert(InventoryAdjustment),
+                [
+                    {
+                        "inventory_level_id": level_id,
+                        "quantity_change": -qty,
+                        "reason": AdjustmentReason.reserved.value,
+                        "reference_id": order_id,
+                        "notes": f"Reserved {qty} units for order",
+                    }
+                    for level_id, qty in deltas.items()
+                ],
+            )
+            expires_at = _expiry(ttl_minutes)
+            created = await db.scalars(
+                insert(StockReservation).returning(StockReservation),
+                [
+                    {
+                        "store_id": store_id,
+                        "inventory_level_id": level_id,
+                        "variant_id": variants[level_id],
+                        "order_id": order_id,
+                        "quantity": qty,
+                        "status": ReservationStatus.active.value,
+                        "expires_at": expires_at,
+                    }
+                    for level_id, qty in deltas.items()
+                ],
+            )
+            return list(created.all())
+    except Exception:
+        await _hot_give(deltas)
+        raise
+
+
+async def _resolve_levels(
+    db: AsyncSession, store_id: uuid.UUID, wanted: dict[uuid.UUID, int]
+) -> dict[uuid.UUID, uuid.UUID]:
+    """Pick the inventory level to reserve from for each tracked variant.
+
+    Prefers a level that can cover the whole quantity, then the default
+    warehouse, then the level with the most available units. Variants
+    without levels or that allow backorders are omitted.
+
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        wanted: Mapping of variant id to requested units.
+
+    Returns:
+        Mapping of variant id to chosen inventory level id.
+    """
+    result = await db.execute(
+        select(
+            InventoryLevel.id,
+            InventoryLevel.variant_id,
+            (InventoryLevel.quantity - InventoryLevel.reserved_quantity).label("available"),
+            Warehouse.is_default,
+        )
+        .join(Warehouse, InventoryLevel.warehouse_id == Warehouse.id)
+        .join(ProductVariant, InventoryLevel.variant_id == ProductVariant.id)
+        .where(
+            Warehouse.store_id == store_id,
+            Warehouse.is_active.is_(True),
+            InventoryLevel.variant_id.in_(list(wanted)),
+            ProductVariant.allow_backorder.is_(False),
+        )
+    )
+    best: dict[uuid.UUID, tuple] = {}
+    for level_id, variant_id, available, is_default in result.all():
+        rank = (available >= wanted[variant_id], is_default, available)
+        if variant_id not in best or rank > best[variant_id][0]:
+            best[variant_id] = (rank, level_id)
+    return {variant_id: level_id for variant_id, (_, level_id) in best.items()}
+
+
+async def reserve_for_order(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    order_id: uuid.UUID,
+    items: list[dict],
+    ttl_minutes: int | None = None,
+) -> list[StockReservation]:
+    """Reserve warehouse stock for every tracked line of an order.
+
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        order_id: The order the holds belong to.
+        items: Order item dicts with ``variant_id`` and ``quantity``.
+        ttl_minutes: Hold lifetime (see ``reserve_levels``).
+
+    Returns:
+        The created StockReservation records (empty if nothing is tracked).
+
+    Raises:
+        InsufficientStockError: If any tracked variant lacks stock.
+    """
+    wanted: dict[uuid.UUID, int] = defaultdict(int)
+    for item in items:
+        if item.get("variant_id"):
+            wanted[item["variant_id"]] += item["quantity"]
+    if not wanted:
+        return []
+
+    levels = await _resolve_levels(db, store_id, wanted)
+    lines = [
+        {"inventory_level_id": level_id, "variant_id": variant_id, "quantity": wanted[variant_id]}
+        for variant_id, level_id in levels.items()
+    ]
+    try:
+        return await reserve_levels(db, store_id, lines, order_id, ttl_minutes)
+    except InsufficientStockError as exc:
+        short = [v for v, level_id in levels.items() if level_id in set(exc.level_ids)]
+        names = await db.execute(
+            select(ProductVariant.name).where(ProductVariant.id.in_(short))
+        )
+        label = ", ".join(f"'{n}'" for n in names.scalars().all())
+        raise InsufficientStockError(
+            f"Insufficient stock for variant {label}", exc.level_ids
+        ) from None
+
+
+async def commit_order_reservations(
+    db: AsyncSession,
+    store_id: uuid.UUID,
+    order_id: uuid.UUID,
+    items: list[dict],
+) -> None:
+    """Turn an order's checkout holds into holds that never expire.
+
+    Called when payment succeeds. Lines whose hold already lapsed are
+    re-reserved best-effort; if stock ran out meanwhile the order is
+    still accepted (payment was taken) and a warning is logged.
+
+    Args:
+        db: Async database session.
+        store_id: The store's UUID.
+        order_id: The paid order's UUID.
+        items: Order item dicts with ``variant_id`` and ``quantity``.
+    """
+    result = await db.execute(
+        update(StockReservation)
+        .where(
+            StockReservation.order_id == order_id,
+            StockReservation.status == ReservationStatus.active.value,
+        )
+        .values(expires_at=None)
+        .returning(StockReservation.variant_id, StockReservation.quantity)
+        .execution_options(synchronize_session=False)
+    )
+    held: dict[uuid.UUID, int] = defaultdict(int)
+    for variant_id, quantity in result.all():
+        held[variant_id] += quantity
+
+    needed: dict[uuid.UUID, int] = defaultdict(int)
+    for item in items:
+        if item.get("variant_id"):
+            needed[item["variant_id"]] += item["quantity"]
+    lapsed = [
+        {"variant_id": variant_id, "quantity": qty - held[variant_id]}
+        for variant_id, qty in needed.items()
+        if qty > held[variant_id]
+    ]
+    if not lapsed:
+        return
+    try:
+        await reserve_for_order(db, store_id, order_id, lapsed, ttl_minutes=0)
+    except InsufficientStockError as exc:
+        logger.warning(
+            "Order %s was paid after its stock hold lapsed and stock ran out: %s",
+            order_id, exc,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Closing reservations
+# ---------------------------------------------------------------------------
+
+
+async def _close(
+    db: AsyncSession,
+    stmt,
+    reason: AdjustmentReason,
+    note: str,
+    fulfill: bool,
+) -> int:
+    """Close reservations and apply their units to inventory levels.
+
+    Args:
+        db: Async database session.
+        stmt: A ``_close_reservations_stmt`` statement.
+        reason: Adjustment reason recorded for the audit trail.
+        note: Prefix for the adjustment notes.
+        fulfill: Whether the units left the warehouse.
+
+    Returns:
+        Number of units closed.
+    """
+    rows = (await db.execute(stmt)).all()
+    deltas, groups = _aggregate_closed(rows)
+    if not deltas:
+        return 0
+    await db.execute(_unreserve_stmt(deltas, fulfill))
+    await db.execute(insert(InventoryAdjustment), _adjustment_rows(groups, reason, note))
+    if not fulfill:
+        await _hot_give(deltas)
+    return sum(deltas.values())
+
+
+def _close_sync(
+    session: Session,
+    stmt,
+    reason: AdjustmentReason,
+    note: str,
+    fulfill: bool,
+) -> int:
+    """Sync variant of ``_close`` for Celery workers."""
+    rows = session.execute(stmt).all()
+    deltas, groups = _aggregate_closed(rows)
+    if not deltas:
+        return 0
+    session.execute(_unreserve_stmt(deltas, fulfill))
+    session.execute(insert(InventoryAdjustment), _adjustment_rows(groups, reason, note))
+    if not fulfill:
+        _hot_give_sync(deltas)
+    return sum(deltas.values())
+
+
+async def release_order_reservations(db: AsyncSession, order_id: uuid.UUID) -> int:
+    """Release every active hold of an order (cancelled or refunded).
+
+    Args:
+        db: Async database session.
+        order_id: The order's UUID.
+
+    Returns:
+        Number of units released (0 if nothing was held).
+    """
+    stmt = _close_reservations_stmt(
+        ReservationStatus.released, StockReservation.order_id == order_id
+    )
+    return await _close(db, stmt, AdjustmentReason.unreserved, "Released", fulfill=False)
+
+
+async def fulfill_order_reservations(db: AsyncSession, order_id: uuid.UUID) -> int:
+    """Convert every active hold of an order into shipped stock.
+
+    Args:
+        db: Async database session.
+        order_id: The order's UUID.
+
+    Returns:
+        Number of units fulfilled (0 if nothing was held).
+    """
+    stmt = _close_reservations_stmt(
+        ReservationStatus.fulfilled, StockReservation.order_id == order_id
+    )
+    return await _close(db, stmt, AdjustmentReason.sold, "Fulfilled", fulfill=True)
+
+
+def fulfill_order_reservations_sync(session: Session, order_id: uuid.UUID) -> int:
+    """Sync variant of ``fulfill_order_reservations`` for Celery workers."""
+    stmt = _close_reservations_stmt(
+        ReservationStatus.fulfilled, StockReservation.order_id == order_id
+    )
+    return _close_sync(session, stmt, AdjustmentReason.sold, "Fulfilled", fulfill=True)
+
+
+async def expire_reservations(
+    db: AsyncSession, now: datetime | None = None, limit: int = 500
+) -> int:
+    """Release one batch of holds whose TTL has elapsed.
+
+    Args:
+        db: Async database session.
+        now: Reference time (defaults to the current UTC time).
+        limit: Maximum number of reservations to expire.
+
+    Returns:
+        Number of units released.
+    """
+    now = now or datetime.now(timezone.utc)
+    stmt = _close_reservations_stmt(ReservationStatus.expired, *_expired_criteria(now, limit))
+    return await _close(db, stmt, AdjustmentReason.unreserved, "Expired hold on", fulfill=False)
+
+
+def expire_reservations_sync(
+    session: Session, now: datetime | None = None, limit: int = 500
+) -> int:
+    """Sync variant of ``expire_reservations`` for Celery workers."""
+    now = now or datetime.now(timezone.utc)
+    stmt = _close_reservations_stmt(ReservationStatus.expired, *_expired_criteria(now, limit))
+    return _close_sync(session, stmt, AdjustmentReason.unreserved, "Expired hold on", fulfill=False)
@@ -7,18 +7,23 @@ owners approve or reject submissions before they appear publicly.
 **For Developers:**
     ``create_review`` automatically checks if the customer has purchased
     the product to set the ``is_verified_purchase`` flag. Rating
-    aggregation (average and count) is denormalised onto the Product
-    model via ``_update_product_rating_stats`` for performance.
+    aggregates (count, sum, per-star histogram, average) are denormalised
+    onto the Product model and moved with one atomic ``UPDATE`` whenever a
+    review enters or leaves ``approved`` (``_apply_status_change``), so
+    stats never scan reviews. ``reconcile_rating_stats_sync`` (the daily
+    ``reconcile_review_stats`` task) recomputes them in batches to repair
+    any drift.
 
 **For QA Engineers:**
     - ``create_review`` checks for verified purchase by querying paid
       orders containing the product for the given customer email.
-    - ``update_review_status`` recalculates the product's average rating
-      whenever a review is approved or rejected.
+    - ``update_review_status`` moves the product's rating aggregates
+      whenever a review is approved, or an approved review is rejected
+      or set back to pending.
     - ``get_public_reviews`` returns only approved reviews, sorted newest
       first.
-    - ``get_review_stats`` computes rating distribution (count per star
-      level) for a product.
+    - ``get_review_stats`` returns the rating distribution (count per star
+      level) for a product from its aggregates.
 
 **For Project Managers:**
     This service powers Feature 12 (Product Reviews) from the backlog.
@@ -33,40 +38,16 @@ owners approve or reject submissions before they appear publicly.
 """
 
 import uuid
+from decimal import Decimal
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Numeric, case, cast, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.models.order import Order, OrderItem, OrderStatus
 from app.models.product import Product
 from app.models.review import Review, ReviewStatus
-from app.models.store import Store, StoreStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services.store_access_service import verify_store_ownership
 
 
 async def _check_verified_purchase(
@@ -105,45 +86,157 @@ async def _check_verified_purchase(
     return count > 0
 
 
-async def _update_product_rating_stats(
+def _rating_change_stmt(product_id: uuid.UUID, rating: int, delta: int):
+    """Build the UPDATE adding (+1) or removing (-1) one approved rating.
+
+    All right-hand sides see the row's old values, so the statement is a
+    single atomic O(1) update however many reviews the product has.
+    """
+    new_sum = Product.rating_sum + delta * rating
+    new_count = Product.review_count + delta
+    star = getattr(Product, f"rating_{rating}_count")
+    return (
+        update(Product)
+        .where(Product.id == product_id)
+        .values(
+            {
+                Product.rating_sum: new_sum,
+                Product.review_count: new_count,
+                star: star + delta,
+                Product.avg_rating: case(
+                    (new_count > 0, func.round(cast(new_sum, Numeric) / new_count, 2)),
+                    else_=None,
+                ),
+            }
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+async def _apply_status_change(
     db: AsyncSession,
-    product_id: uuid.UUID,
+    review: Review,
+    old_status: ReviewStatus,
 ) -> None:
-    """Recalculate and update the denormalised rating stats on a Product.
+    """Move the product's rating aggregates for a review's status change.
 
-    Computes the average rating and review count from all approved
-    reviews and writes them to the product record. If the Product model
-    does not have ``avg_rating`` or ``review_count`` columns yet, this
-    function silently returns without error.
+    Only entering or leaving ``approved`` changes the aggregates.
 
     Args:
         db: Async database session.
-        product_id: The UUID of the product to update.
+        review: The review, already carrying its new status.
+        old_status: The status before the change.
     """
-    result = await db.execute(
-        select(
-            func.avg(Review.rating),
-            func.count(Review.id),
-        ).where(
-            Review.product_id == product_id,
+    was_approved = old_status == ReviewStatus.approved
+    is_approved = review.status == ReviewStatus.approved
+    if was_approved == is_approved:
+        return
+    delta = 1 if is_approved else -1
+    await db.execute(_rating_change_stmt(review.product_id, review.rating, delta))
+
+
+def rating_stats(product: Product) -> dict:
+    """Read a product's rating statistics from its aggregates.
+
+    Args:
+        product: The Product ORM instance.
+
+    Returns:
+        A dict with ``average_rating`` (float), ``total_reviews`` (int),
+        and ``rating_distribution`` (dict mapping star levels 1-5 to counts).
+    """
+    total = product.review_count or 0
+    average = (product.rating_sum or 0) / total if total else 0.0
+    return {
+        "average_rating": round(average, 2),
+        "total_reviews": total,
+        "rating_distribution": {
+            star: getattr(product, f"rating_{star}_count") or 0 for star in range(1, 6)
+        },
+    }
+
+
+def _approved_histograms(
+    session: Session, product_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, list[int]]:
+    """Count approved reviews per star level for each product."""
+    rows = session.execute(
+        select(Review.product_id, Review.rating, func.count(Review.id))
+        .where(
+            Review.product_id.in_(product_ids),
             Review.status == ReviewStatus.approved,
         )
-    )
-    row = result.one()
-    avg_rating = float(row[0]) if row[0] is not None else 0.0
-    review_count = row[1]
+        .group_by(Review.product_id, Review.rating)
+    ).all()
+    histograms = {product_id: [0] * 5 for product_id in product_ids}
+    for product_id, rating, count in rows:
+        histograms[product_id][rating - 1] = count
+    return histograms
+
+
+def reconcile_rating_stats_sync(
+    session: Session,
+    after_product_id: uuid.UUID | None = None,
+    limit: int = 1000,
+) -> dict:
+    """Recompute one batch of products' rating aggregates and fix drift.
 
-    product_result = await db.execute(
-        select(Product).where(Product.id == product_id)
-    )
-    product = product_result.scalar_one_or_none()
-    if product is not None:
-        # Update denormalised fields if they exist on the model
-        if hasattr(product, "avg_rating"):
-            product.avg_rating = round(avg_rating, 2)
-        if hasattr(product, "review_count"):
-            product.review_count = review_count
-        await db.flush()
+    Products are walked in primary-key order and the batch's approved
+    reviews are counted in one grouped query. Products whose aggregates
+    differ are then locked and counted again before being overwritten:
+    a moderation change still in flight waits for the lock and applies
+    its increment on top of the corrected values.
+
+    Args:
+        session: Sync SQLAlchemy session (the caller commits).
+        after_product_id: Keyset cursor; start after this product ID.
+        limit: Products per batch.
+
+    Returns:
+        Dict with ``products`` (checked), ``corrected``, and
+        ``last_product_id`` (None once the walk is complete).
+    """
+    stars = [getattr(Product, f"rating_{star}_count") for star in range(1, 6)]
+    query = select(
+        Product.id, Product.review_count, Product.rating_sum, *stars
+    ).order_by(Product.id).limit(limit)
+    if after_product_id is not None:
+        query = query.where(Product.id > after_product_id)
+    products = session.execute(query).all()
+    if not products:
+        return {"products": 0, "corrected": 0, "last_product_id": None}
+
+    histograms = _approved_histograms(session, [row.id for row in products])
+    drifted = [
+        row.id
+        for row in products
+        if list(row[3:]) != histograms[row.id]
+        or row.review_count != sum(histograms[row.id])
+        or row.rating_sum != sum(star * n for star, n in enumerate(histograms[row.id], 1))
+    ]
+
+    fixes = []
+    if drifted:
+        session.execute(
+            select(Product.id).where(Product.id.in_(drifted)).with_for_update()
+        )
+        for product_id, histogram in _approved_histograms(session, drifted).items():
+            total = sum(histogram)
+            rating_sum = sum(star * n for star, n in enumerate(histogram, 1))
+            fixes.append({
+                "id": product_id,
+                "review_count": total,
+                "rating_sum": rating_sum,
+                "avg_rating": round(Decimal(rating_sum) / total, 2) if total else None,
+                **{f"rating_{star}_count": n for star, n in enumerate(histogram, 1)},
+            })
+        session.execute(update(Product), fixes)
+
+    return {
+        "products": len(products),
+        "corrected": len(fixes),
+        "last_product_id": products[-1].id,
+    }
 
 
 async def create_review(
@@ -297,8 +390,8 @@ async def update_review_status(
 ) -> Review:
     """Update a review's moderation status.
 
-    Recalculates the product's denormalised average rating and review
-    count after the status change takes effect.
+    Updates the product's denormalised rating aggregates in O(1) when the
+    review enters or leaves ``approved``.
 
     Args:
         db: Async database session.
@@ -314,17 +407,21 @@ async def update_review_status(
         ValueError: If the store or review doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
-    review = await get_review(db, review_id)
-    if review.store_id != store_id:
+    # Row lock: concurrent moderation of the same review must see each
+    # other's status, or the aggregates would move twice.
+    result = await db.execute(
+        select(Review).where(Review.id == review_id).with_for_update()
+    )
+    review = result.scalar_one_or_none()
+    if review is None or review.store_id != store_id:
         raise ValueError("Review not found in this store")
 
+    old_status = review.status
     review.status = status
     await db.flush()
-
-    # Recalculate denormalised rating stats
-    await _update_product_rating_stats(db, review.product_id)
+    await _apply_status_change(db, review, old_status)
 
     await db.refresh(review)
     return review
@@ -337,8 +434,8 @@ async def get_review_stats(
 ) -> dict:
     """Get review statistics for a product.
 
-    Computes the average rating, total approved review count, and a
-    rating distribution (count of reviews per star level 1-5).
+    Reads the product's incrementally maintained aggregates; no reviews
+    are scanned.
 
     Args:
         db: Async database session.
@@ -348,42 +445,19 @@ async def get_review_stats(
     Returns:
         A dict with ``average_rating`` (float), ``total_reviews`` (int),
         and ``rating_distribution`` (dict mapping star levels 1-5 to counts).
+        All zero if the product is not in the store.
     """
-    # Overall stats
-    stats_result = await db.execute(
-        select(
-            func.avg(Review.rating),
-            func.count(Review.id),
-        ).where(
-            Review.store_id == store_id,
-            Review.product_id == product_id,
-            Review.status == ReviewStatus.approved,
-        )
-    )
-    stats_row = stats_result.one()
-    avg_rating = float(stats_row[0]) if stats_row[0] is not None else 0.0
-    total_reviews = stats_row[1]
-
-    # Rating distribution
-    distribution_result = await db.execute(
-        select(
-            Review.rating,
-            func.count(Review.id),
-        ).where(
-            Review.store_id == store_id,
-            Review.product_id == product_id,
-            Review.status == ReviewStatus.approved,
-        ).group_by(Review.rating)
+    result = await db.execute(
+        select(Product).where(Product.id == product_id, Product.store_id == store_id)
     )
-    distribution = {i: 0 for i in range(1, 6)}
-    for row in distribution_result.fetchall():
-        distribution[row[0]] = row[1]
-
-    return {
-        "average_rating": round(avg_rating, 2),
-        "total_reviews": total_reviews,
-        "rating_distribution": distribution,
-    }
+    product = result.scalar_one_or_none()
+    if product is None:
+        return {
+            "average_rating": 0.0,
+            "total_reviews": 0,
+            "rating_distribution": {star: 0 for star in range(1, 6)},
+        }
+    return rating_stats(product)
 
 
 async def get_public_reviews(
@@ -413,14 +487,13 @@ async def get_public_reviews(
         Review.product_id == product_id,
         Review.status == ReviewStatus.approved,
     )
-    count_query = select(func.count(Review.id)).where(
-        Review.store_id == store_id,
-        Review.product_id == product_id,
-        Review.status == ReviewStatus.approved,
+    # The approved count is kept on the product; no count over reviews.
+    total_result = await db.execute(
+        select(Product.review_count).where(
+            Product.id == product_id, Product.store_id == store_id
+        )
     )
-
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    total = total_result.scalar_one_or_none() or 0
 
     offset = (page - 1) * per_page
     query = query.order_by(Review.created_at.desc()).offset(offset).limit(per_page)
@@ -6,15 +6,19 @@ used for targeted marketing, email campaigns, and analytics.
 
 **For Developers:**
     Segments support two types: ``manual`` (customers are explicitly
-    added/removed) and ``dynamic`` (customers match a set of rules,
-    though rule evaluation is not yet implemented). The ``rules``
-    field stores a JSON structure defining filter criteria for dynamic
-    segments. The ``segment_customers`` junction table links customers
-    to manual segments.
+    added/removed) and ``automatic`` (customers match a set of rules;
+    ``"dynamic"`` is accepted as an alias). The ``segment_customers``
+    junction table links customers to manual segments. The ``rules`` of
+    automatic segments are compiled and their members materialized by
+    ``segment_rules_service`` whenever the rules or type are saved.
+    ``customer_count`` is maintained as a counter for both types and is
+    what listings report as the segment's size.
 
 **For QA Engineers:**
-    - ``create_segment`` validates that the name is not empty.
-    - ``add_customers_to_segment`` is idempotent (skips duplicates).
+    - ``create_segment`` validates that the name is not empty and that
+      the type and rules are valid.
+    - ``add_customers_to_segment`` is idempotent (skips duplicates) and
+      only applies to manual segments.
     - ``get_segment_customers`` paginates the customer list.
     - ``delete_segment`` is a hard delete with cascade on junction records.
 
@@ -31,10 +35,14 @@ used for targeted marketing, email campaigns, and analytics.
 
 import uuid
 
-from sqlalchemy import func, select
+from sqlalchemy import func, null, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.store import Store, StoreStatus
+from app.models.customer import CustomerAccount
+from app.models.user import User
+from app.services import segment_rules_service
+from app.services.store_access_service import verify_store_ownership
 
 
 # ---------------------------------------------------------------------------
@@ -42,36 +50,27 @@ from app.models.store import Store, StoreStatus
 # another agent.
 # ---------------------------------------------------------------------------
 try:
-    from app.models.segment import Segment, SegmentCustomer
+    from app.models.segment import Segment, SegmentCustomer, SegmentMember, SegmentType
 except ImportError:
     Segment = None  # type: ignore[assignment,misc]
     SegmentCustomer = None  # type: ignore[assignment,misc]
+    SegmentMember = None  # type: ignore[assignment,misc]
+    SegmentType = None  # type: ignore[assignment,misc]
 
+# Accepted spellings of the segment types (the dashboard says "dynamic").
+_SEGMENT_TYPES = {"manual": "manual", "automatic": "automatic", "dynamic": "automatic"}
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
 
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
+def _segment_type(segment_type: str) -> str:
+    """Normalize a requested segment type.
 
     Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
+        ValueError: If the type is not manual, automatic, or dynamic.
     """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+    value = getattr(segment_type, "value", segment_type)
+    if value not in _SEGMENT_TYPES:
+        raise ValueError(f"Invalid segment type: {value}")
+    return _SEGMENT_TYPES[value]
 
 
 async def create_segment(
@@ -91,20 +90,25 @@ async def create_segment(
         user_id: The requesting user's UUID (for ownership check).
         name: Display name of the segment.
         description: Optional description of the segment's purpose.
-        segment_type: Type of segment: ``"manual"`` or ``"dynamic"``.
-        rules: Optional JSON rules for dynamic segment filtering.
+        segment_type: Type of segment: ``"manual"`` or ``"automatic"``
+            (``"dynamic"`` is accepted as an alias).
+        rules: Optional JSON rules for automatic segment filtering.
 
     Returns:
-        The newly created Segment ORM instance.
+        The newly created Segment ORM instance. An automatic segment
+        already holds its matching customers.
 
     Raises:
         ValueError: If the store doesn't exist, belongs to another user,
-            or the name is empty.
+            the name is empty, or the type or rules are invalid.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if not name or not name.strip():
         raise ValueError("Segment name cannot be empty")
+    segment_type = _segment_type(segment_type)
+    if segment_type == "automatic":
+        segment_rules_service.compile_rules(rules)
 
     segment = Segment(
         store_id=store_id,
@@ -115,6 +119,8 @@ async def create_segment(
     )
     db.add(segment)
     await db.flush()
+    if segment_type == "automatic":
+        await segment_rules_service.rebuild_segment_members(db, segment)
     await db.refresh(segment)
     return segment
 
@@ -141,7 +147,7 @@ async def list_segments(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Segment).where(Segment.store_id == store_id)
     count_query = select(func.count(Segment.id)).where(Segment.store_id == store_id)
@@ -179,7 +185,7 @@ async def get_segment(
         ValueError: If the store or segment doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Segment).where(
@@ -202,7 +208,9 @@ async def update_segment(
 ) -> "Segment":
     """Update a segment's fields (partial update).
 
-    Only provided (non-None) keyword arguments are applied.
+    Only provided (non-None) keyword arguments are applied. Saving the
+    rules or type of an automatic segment rebuilds its membership;
+    turning it into a manual segment restores the manual membership.
 
     Args:
         db: Async database session.
@@ -216,16 +224,34 @@ async def update_segment(
         The updated Segment ORM instance.
 
     Raises:
-        ValueError: If the store or segment doesn't exist, or the store
-            belongs to another user.
+        ValueError: If the store or segment doesn't exist, the store
+            belongs to another user, or the type or rules are invalid.
     """
     segment = await get_segment(db, store_id, user_id, segment_id)
 
+    if kwargs.get("segment_type") is not None:
+        kwargs["segment_type"] = _segment_type(kwargs["segment_type"])
+    was_automatic = segment.segment_type == SegmentType.automatic
+    is_automatic = (kwargs.get("segment_type") or segment.segment_type) == "automatic"
+    if is_automatic:
+        segment_rules_service.compile_rules(
+            kwargs["rules"] if kwargs.get("rules") is not None else segment.rules
+        )
+
     for key, value in kwargs.items():
         if value is not None:
             setattr(segment, key, value)
-
     await db.flush()
+
+    if is_automatic and (not was_automatic or kwargs.get("rules") is not None):
+        await segment_rules_service.rebuild_segment_members(db, segment)
+    elif was_automatic and not is_automatic:
+        await segment_rules_service.clear_segment_members(db, segment.id)
+        segment.customer_count = await db.scalar(
+            select(func.count()).where(SegmentCustomer.segment_id == segment.id)
+        )
+        await db.flush()
+
     await db.refresh(segment)
     return segment
 
@@ -260,9 +286,11 @@ async def add_customers_to_segment(
     segment_id: uuid.UUID,
     customer_ids: list[uuid.UUID],
 ) -> int:
-    """Add customers to a segment.
+    """Add customers to a manual segment.
 
     Idempotent: customers already in the segment are silently skipped.
+    All customers are added with one ``INSERT ... ON CONFLICT DO
+    NOTHING`` and the segment's counter grows by the rows inserted.
 
     Args:
         db: Async database session.
@@ -275,30 +303,42 @@ async def add_customers_to_segment(
         The number of customers newly added (excludes duplicates).
 
     Raises:
-        ValueError: If the store or segment doesn't exist, or the store
-            belongs to another user.
+        ValueError: If the store or segment doesn't exist, the store
+            belongs to another user, or the segment is automatic.
     """
-    await get_segment(db, store_id, user_id, segment_id)
-
-    added_count = 0
-    for customer_id in customer_ids:
-        existing = await db.execute(
-            select(SegmentCustomer).where(
-                SegmentCustomer.segment_id == segment_id,
-                SegmentCustomer.customer_id == customer_id,
-            )
-        )
-        if existing.scalar_one_or_none() is None:
-            db.add(SegmentCustomer(
-                segment_id=segment_id,
-                customer_id=customer_id,
-            ))
-            added_count += 1
+    segment = await get_segment(db, store_id, user_id, segment_id)
+    if segment.segment_type == SegmentType.automatic:
+        raise ValueError("Invalid operation: automatic segment membership follows its rules")
+    if not customer_ids:
+        return 0
 
-    await db.flush()
+    result = await db.execute(
+        pg_insert(SegmentCustomer)
+        .values([
+            {"segment_id": segment_id, "customer_id": customer_id}
+            for customer_id in dict.fromkeys(customer_ids)
+        ])
+        .on_conflict_do_nothing(index_elements=["segment_id", "customer_id"])
+        .returning(SegmentCustomer.id)
+    )
+    added_count = len(result.all())
+    if added_count:
+        await _adjust_customer_count(db, segment_id, added_count)
     return added_count
 
 
+async def _adjust_customer_count(
+    db: AsyncSession, segment_id: uuid.UUID, delta: int
+) -> None:
+    """Atomically move a segment's member counter."""
+    await db.execute(
+        update(Segment)
+        .where(Segment.id == segment_id)
+        .values(customer_count=Segment.customer_count + delta)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
 async def remove_customer_from_segment(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -333,6 +373,7 @@ async def remove_customer_from_segment(
 
     await db.delete(link)
     await db.flush()
+    await _adjust_customer_count(db, segment_id, -1)
 
 
 async def get_segment_customers(
@@ -345,6 +386,10 @@ async def get_segment_customers(
 ) -> tuple[list, int]:
     """Get customers belonging to a segment with pagination.
 
+    Manual segments list the users added to them; automatic segments list
+    their materialized store customers. The total is the segment's
+    ``customer_count`` counter, not a count of the membership rows.
+
     Args:
         db: Async database session.
         store_id: The store's UUID.
@@ -354,26 +399,47 @@ async def get_segment_customers(
         per_page: Number of items per page.
 
     Returns:
-        A tuple of (SegmentCustomer link records, total count).
+        A tuple of (list of dicts with ``customer_id``, ``email``,
+        ``name``, and ``added_at``, total count).
 
     Raises:
         ValueError: If the store or segment doesn't exist, or the store
             belongs to another user.
     """
-    await get_segment(db, store_id, user_id, segment_id)
-
-    query = select(SegmentCustomer).where(SegmentCustomer.segment_id == segment_id)
-    count_query = select(func.count(SegmentCustomer.id)).where(
-        SegmentCustomer.segment_id == segment_id
-    )
+    segment = await get_segment(db, store_id, user_id, segment_id)
 
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    if segment.segment_type == SegmentType.automatic:
+        query = (
+            select(
+                SegmentMember.customer_id,
+                CustomerAccount.email,
+                func.nullif(
+                    func.trim(
+                        func.concat_ws(" ", CustomerAccount.first_name, CustomerAccount.last_name)
+                    ),
+                    "",
+                ).label("name"),
+                SegmentMember.added_at,
+            )
+            .join(CustomerAccount, CustomerAccount.id == SegmentMember.customer_id)
+            .where(SegmentMember.segment_id == segment_id)
+            .order_by(SegmentMember.added_at.desc(), SegmentMember.customer_id)
+        )
+    else:
+        query = (
+            select(
+                SegmentCustomer.customer_id,
+                User.email,
+                null().label("name"),
+                SegmentCustomer.added_at,
+            )
+            .join(User, User.id == SegmentCustomer.customer_id)
+            .where(SegmentCustomer.segment_id == segment_id)
+            .order_by(SegmentCustomer.added_at.desc(), SegmentCustomer.customer_id)
+        )
 
     offset = (page - 1) * per_page
-    query = query.order_by(SegmentCustomer.created_at.desc()).offset(offset).limit(per_page)
-
-    result = await db.execute(query)
-    customers = list(result.scalars().all())
+    result = await db.execute(query.offset(offset).limit(per_page))
+    customers = [dict(row._mapping) for row in result.all()]
 
-    return customers, total
+    return customers, segment.customer_count
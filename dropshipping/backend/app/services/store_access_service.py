@@ -0,0 +1,222 @@
+"""Cached store access checks for dashboard endpoints.
+
+Every dashboard service starts by checking that the caller may act on the
+store in the URL, and a single dashboard page fans out into many API
+calls that all ask the same question. This module answers it once per
+``(store_id, user_id)`` and serves the answer from memory and Redis until
+it expires or a team or store change invalidates it.
+
+**For Developers:**
+    - ``resolve_store_role`` returns ``"owner"``, the caller's team role
+      (``"admin"``, ``"editor"``, ``"viewer"``), or None. A miss costs one
+      query: the store joined with the caller's membership.
+    - ``verify_store_ownership`` raises ``ValueError("Store not found")``
+      unless the caller owns the store; services call it in place of
+      their own store lookup. ``app.api.deps.get_store_role`` and
+      ``require_store_owner`` expose the same checks as FastAPI
+      dependencies, and because the service checks hit the local entry
+      the dependency warmed, a request pays for at most one lookup.
+    - Answers (including "no access") are kept per process for
+      ``settings.store_access_local_ttl_seconds`` and in Redis, one key
+      ``store-access:{store_id}:{user_id}`` per caller, for
+      ``settings.store_access_cache_ttl_seconds``. Every answer has its
+      own expiry, so no later lookup can extend the life of a stale one.
+    - ``invalidate_store_access`` is called by store deletion and by team
+      membership changes, in the session that made the change. Nothing
+      is dropped until that transaction commits (``database.on_commit``);
+      then this process's entries and the Redis keys go, so a lookup
+      that ran before the commit cannot leave the old answer behind.
+      Other processes still answer from their local entry until it
+      expires, so the local TTL is kept to seconds.
+    - If Redis is down, lookups fall back to the local entry and the
+      database.
+    - At most ``settings.store_access_cache_max_entries`` answers are
+      kept per process; the least recently used are dropped.
+
+**For QA Engineers:**
+    - Repeated checks for the same caller and store do not query the
+      database.
+    - Deleting a store, removing a member, changing a member's role, and
+      accepting an invite take effect once committed: on the next request
+      in the process that made the change, and within the local TTL
+      everywhere else.
+
+**For Project Managers:**
+    Dashboard pages that fire a dozen API calls no longer re-check store
+    ownership against the database for each of them.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import on_commit
+from app.models.store import Store, StoreStatus
+from app.models.team import TeamMember
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+OWNER = "owner"
+
+# Stored in Redis for "no access", since a key cannot hold None.
+_NO_ACCESS = "-"
+
+
+@dataclass
+class _Entry:
+    """A cached answer and when this process learned it."""
+
+    role: str | None
+    cached_at: float
+
+
+# Per-process cache: (store_id, user_id) -> _Entry, least recently used first.
+_cache: "OrderedDict[tuple[uuid.UUID, uuid.UUID], _Entry]" = OrderedDict()
+
+
+def _access_key(store_id: uuid.UUID, user_id: uuid.UUID | str) -> str:
+    """Redis key holding a caller's cached role in a store."""
+    return f"store-access:{store_id}:{user_id}"
+
+
+def _remember(store_id: uuid.UUID, user_id: uuid.UUID, role: str | None) -> None:
+    """Store an answer in the local cache, evicting the oldest if full."""
+    _cache[(store_id, user_id)] = _Entry(role, time.monotonic())
+    _cache.move_to_end((store_id, user_id))
+    while len(_cache) > settings.store_access_cache_max_entries:
+        _cache.popitem(last=False)
+
+
+async def _load_role(
+    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
+) -> str | None:
+    """Resolve a caller's role from the database."""
+    row = (
+        await db.execute(
+            select(Store.user_id, TeamMember.role)
+            .outerjoin(
+                TeamMember,
+                and_(TeamMember.store_id == Store.id, TeamMember.user_id == user_id),
+            )
+            .where(Store.id == store_id, Store.status != StoreStatus.deleted)
+        )
+    ).first()
+    if row is None:
+        return None
+    owner_id, member_role = row
+    if owner_id == user_id:
+        return OWNER
+    return member_role.value if member_role is not None else None
+
+
+async def resolve_store_role(
+    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
+) -> str | None:
+    """Get the caller's role in a store, from cache when possible.
+
+    Args:
+        db: Async database session (used only on a cache miss).
+        store_id: The store's UUID.
+        user_id: The caller's UUID.
+
+    Returns:
+        ``"owner"`` for the store's owner, the team role for a member, or
+        None if the store does not exist, is deleted, or the caller has no
+        access.
+    """
+    key = (store_id, user_id)
+    cached = _cache.get(key)
+    if (
+        cached is not None
+        and time.monotonic() - cached.cached_at < settings.store_access_local_ttl_seconds
+    ):
+        _cache.move_to_end(key)
+        return cached.role
+
+    try:
+        stored = await get_redis().get(_access_key(store_id, user_id))
+    except RedisError as exc:
+        logger.warning("Store access cache unavailable: %s", exc)
+        stored = None
+    if stored is not None:
+        role = None if stored == _NO_ACCESS else stored
+        _remember(store_id, user_id, role)
+        return role
+
+    role = await _load_role(db, store_id, user_id)
+    _remember(store_id, user_id, role)
+    try:
+        await get_redis().set(
+            _access_key(store_id, user_id),
+            role or _NO_ACCESS,
+            ex=settings.store_access_cache_ttl_seconds,
+        )
+    except RedisError as exc:
+        logger.warning("Store access not cached: store=%s error=%s", store_id, exc)
+    return role
+
+
+async def verify_store_ownership(
+    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
+) -> None:
+    """Verify that a store exists and belongs to the given user.
+
+    Args:
+        db: Async database session.
+        store_id: The UUID of the store.
+        user_id: The requesting user's UUID.
+
+    Raises:
+        ValueError: If the store doesn't exist, is deleted, or belongs
+            to a different user.
+    """
+    if await resolve_store_role(db, store_id, user_id) != OWNER:
+        raise ValueError("Store not found")
+
+
+def _forget(store_id: uuid.UUID, user_id: uuid.UUID | None) -> None:
+    """Drop cached roles from this process and Redis."""
+    if user_id is not None:
+        _cache.pop((store_id, user_id), None)
+    else:
+        for key in [key for key in _cache if key[0] == store_id]:
+            del _cache[key]
+    try:
+        redis = get_sync_redis()
+        if user_id is not None:
+            redis.delete(_access_key(store_id, user_id))
+        else:
+            keys = list(redis.scan_iter(match=_access_key(store_id, "*"), count=500))
+            if keys:
+                redis.delete(*keys)
+    except RedisError as exc:
+        logger.warning(
+            "Store access invalidation not broadcast: store=%s error=%s", store_id, exc
+        )
+
+
+def invalidate_store_access(
+    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID | None = None
+) -> None:
+    """Forget cached roles once a store or team change commits.
+
+    Args:
+        db: The session making the change.
+        store_id: The store whose access changed.
+        user_id: The one user whose role changed, or None for every user
+            of the store (e.g. when the store is deleted).
+    """
+    on_commit(db, lambda: _forget(store_id, user_id))
+
+
+def clear_access_cache() -> None:
+    """Drop this process's cached roles (all stores)."""
+    _cache.clear()
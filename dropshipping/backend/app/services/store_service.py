@@ -12,7 +12,10 @@ can only access their own stores.
     - ``list_stores`` excludes soft-deleted stores by default.
     - ``get_store`` raises ``ValueError`` if the store doesn't exist or
       belongs to another user.
-    - ``delete_store`` performs a soft-delete (sets status to ``deleted``).
+    - ``delete_store`` performs a soft-delete (sets status to ``deleted``)
+      and drops every cached access answer for the store.
+    - Creating, updating, and deleting a store publishes its slug and
+      status to the storefront routing table of every API process.
 """
 
 import uuid
@@ -21,6 +24,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.store import Store, StoreStatus, StoreType
+from app.services.store_access_service import invalidate_store_access
+from app.services.storefront_routing_service import publish_store_route
 from app.services.theme_service import seed_preset_themes
 from app.utils.slug import generate_unique_slug
 
@@ -61,6 +66,7 @@ async def create_store(
     )
     db.add(store)
     await db.flush()
+    publish_store_route(db, store)
 
     # Seed preset themes so the store has a default appearance.
     await seed_preset_themes(db, store.id)
@@ -158,6 +164,7 @@ async def update_store(
 
     await db.flush()
     await db.refresh(store)
+    publish_store_route(db, store)
     return store
 
 
@@ -180,5 +187,7 @@ async def delete_store(
     store = await get_store(db, user_id, store_id)
     store.status = StoreStatus.deleted
     await db.flush()
+    invalidate_store_access(db, store.id)
     await db.refresh(store)
+    publish_store_route(db, store)
     return store
@@ -0,0 +1,454 @@
+"""In-memory routing of storefront requests to stores.
+
+Every storefront request names its store, by slug in the URL or by the
+custom domain in the ``Host`` header, and every one of them used to look
+the store up in PostgreSQL. Each API process instead keeps a map of all
+store slugs and routable custom domains in memory and is told about
+changes over Redis pub/sub.
+
+**For Developers:**
+    - ``StoreRoute`` is a snapshot of the store fields storefront
+      endpoints need (``id``, ``slug``, ``status``, ``user_id``, ``name``,
+      ``default_currency``); it is what ``_get_active_store`` in the
+      public API modules returns.
+    - The map holds every non-deleted store and every ``verified`` or
+      ``active`` custom domain. It is loaded on first use and reloaded
+      every ``settings.storefront_routes_refresh_seconds``, so a change
+      whose message was lost is picked up within that interval.
+    - Writes that change routing call ``publish_store_route`` (store
+      create, update, delete, clone) or ``publish_domain_route`` (domain
+      verify, SSL activation, purchase, delete, health sweep) with the
+      writing session, async or sync. Once the transaction commits
+      (``database.on_commit``), the change is applied to this process's
+      map and published on ``ROUTES_CHANNEL`` with the new values, so
+      other processes apply it without a query. A rolled-back change is
+      never published.
+    - ``listen_for_route_changes`` is the subscriber; ``app.main`` runs it
+      for the life of each API process. After (re)subscribing it marks the
+      map stale, since messages may have been missed. Changes applied
+      while the map is being reloaded are replayed on the new map, and a
+      load that started before the map was marked stale does not count
+      as fresh.
+    - While the subscriber is connected and the map is loaded, the map is
+      complete: a slug or host missing from it is answered without a
+      query, so scanners probing random hosts and slugs never reach
+      PostgreSQL. Without the subscriber (Redis down, or a process that
+      does not run it), a missing slug or host is looked up once and, if
+      still unknown, remembered as a miss for
+      ``settings.storefront_negative_cache_ttl_seconds`` (at most
+      ``settings.storefront_negative_cache_max_entries``).
+
+**For QA Engineers:**
+    - Store and domain changes are visible to storefront requests
+      immediately in every API process while Redis is up, and within the
+      refresh interval otherwise.
+    - Unknown slugs and hosts are answered from memory (after one
+      lookup each while Redis is unavailable).
+
+**For Project Managers:**
+    Storefront traffic (including bots hitting unknown domains) no longer
+    costs a database query just to find out which store it is for.
+
+**For End Users:**
+    Verifying a custom domain makes your storefront reachable on it right
+    away.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import on_commit
+from app.models.domain import CustomDomain, DomainStatus
+from app.models.store import Store, StoreStatus
+from app.redis_client import get_redis, get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+ROUTES_CHANNEL = "storefront-routes"
+
+# Custom domain statuses that serve the storefront.
+ROUTABLE_DOMAIN_STATUSES = (DomainStatus.verified, DomainStatus.active)
+
+
+@dataclass(frozen=True)
+class StoreRoute:
+    """The routing-relevant fields of a store, detached from the session."""
+
+    id: uuid.UUID
+    slug: str
+    status: StoreStatus
+    user_id: uuid.UUID
+    name: str
+    default_currency: str
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the storefront is open."""
+        return self.status == StoreStatus.active
+
+    @classmethod
+    def from_store(cls, store: Store) -> "StoreRoute":
+        """Snapshot a ``Store`` row."""
+        return cls(
+            id=store.id,
+            slug=store.slug,
+            status=store.status,
+            user_id=store.user_id,
+            name=store.name,
+            default_currency=store.default_currency,
+        )
+
+
+# Per-process routing table.
+_stores: dict[uuid.UUID, StoreRoute] = {}
+_slugs: dict[str, uuid.UUID] = {}
+_hosts: dict[str, uuid.UUID] = {}
+_host_by_store: dict[uuid.UUID, str] = {}
+# "slug:<slug>" / "host:<host>" -> monotonic expiry, oldest first.
+_misses: "OrderedDict[str, float]" = OrderedDict()
+_loaded_at: float | None = None
+# Bumped by mark_routes_stale; a load only counts if it did not change.
+_generation = 0
+# Changes applied while loads are running, replayed on their new table.
+_load_recorders: list[list[dict]] = []
+# Whether listen_for_route_changes is subscribed to ROUTES_CHANNEL.
+_subscribed = False
+
+
+def normalize_host(host: str) -> str:
+    """Lowercase a ``Host`` header value and strip its port and trailing dot."""
+    host = host.strip().lower()
+    if host.startswith("["):
+        return host
+    return host.rsplit(":", 1)[0].rstrip(".")
+
+
+# ---------------------------------------------------------------------------
+# Table maintenance
+# ---------------------------------------------------------------------------
+
+
+def _put_store(route: StoreRoute) -> None:
+    """Insert or replace a store, dropping its previous slug."""
+    previous = _stores.get(route.id)
+    if previous is not None and _slugs.get(previous.slug) == route.id:
+        del _slugs[previous.slug]
+    if route.status == StoreStatus.deleted:
+        _stores.pop(route.id, None)
+        return
+    _stores[route.id] = route
+    _slugs[route.slug] = route.id
+    _misses.pop(f"slug:{route.slug}", None)
+
+
+def _put_domain(store_id: uuid.UUID, host: str | None) -> None:
+    """Point a store's custom domain at ``host`` (None removes it)."""
+    previous = _host_by_store.pop(store_id, None)
+    if previous is not None and _hosts.get(previous) == store_id:
+        del _hosts[previous]
+    if host is not None:
+        host = normalize_host(host)
+        _hosts[host] = store_id
+        _host_by_store[store_id] = host
+        _misses.pop(f"host:{host}", None)
+
+
+def apply_route_change(message: dict) -> None:
+    """Apply a message published on ``ROUTES_CHANNEL`` to this process."""
+    for recorder in _load_recorders:
+        recorder.append(message)
+    if message["type"] == "store":
+        _put_store(
+            StoreRoute(
+                id=uuid.UUID(message["id"]),
+                slug=message["slug"],
+                status=StoreStatus(message["status"]),
+                user_id=uuid.UUID(message["user_id"]),
+                name=message["name"],
+                default_currency=message["default_currency"],
+            )
+        )
+    elif message["type"] == "domain":
+        _put_domain(uuid.UUID(message["store_id"]), message["host"])
+
+
+async def load_routes(db: AsyncSession) -> None:
+    """Replace the table with every live store and routable domain."""
+    global _loaded_at
+    generation = _generation
+    applied: list[dict] = []
+    _load_recorders.append(applied)
+    try:
+        stores = (
+            await db.execute(
+                select(
+                    Store.id, Store.slug, Store.status, Store.user_id,
+                    Store.name, Store.default_currency,
+                ).where(Store.status != StoreStatus.deleted)
+            )
+        ).all()
+        domains = (
+            await db.execute(
+                select(CustomDomain.store_id, CustomDomain.domain).where(
+                    CustomDomain.status.in_(ROUTABLE_DOMAIN_STATUSES)
+                )
+            )
+        ).all()
+    finally:
+        _load_recorders.remove(applied)
+    _clear_table()
+    for row in stores:
+        _put_store(StoreRoute(*row))
+    for store_id, host in domains:
+        _put_domain(store_id, host)
+    for message in applied:
+        apply_route_change(message)
+    if generation == _generation:
+        _loaded_at = time.monotonic()
+
+
+def mark_routes_stale() -> None:
+    """Make the next lookup reload the table."""
+    global _loaded_at, _generation
+    _loaded_at = None
+    _generation += 1
+
+
+def _clear_table() -> None:
+    _stores.clear()
+    _slugs.clear()
+    _hosts.clear()
+    _host_by_store.clear()
+    _misses.clear()
+
+
+def reset_routing_table() -> None:
+    """Forget every route and miss (the table reloads on next use)."""
+    _clear_table()
+    mark_routes_stale()
+
+
+async def _ensure_loaded(db: AsyncSession) -> None:
+    if (
+        _loaded_at is None
+        or time.monotonic() - _loaded_at >= settings.storefront_routes_refresh_seconds
+    ):
+        await load_routes(db)
+
+
+def _is_complete() -> bool:
+    """Whether a slug or host missing from the table does not exist."""
+    return _subscribed and _loaded_at is not None
+
+
+def _known_miss(key: str) -> bool:
+    expires = _misses.get(key)
+    if expires is None:
+        return False
+    if expires > time.monotonic():
+        return True
+    del _misses[key]
+    return False
+
+
+def _remember_miss(key: str) -> None:
+    _misses[key] = time.monotonic() + settings.storefront_negative_cache_ttl_seconds
+    _misses.move_to_end(key)
+    while len(_misses) > settings.storefront_negative_cache_max_entries:
+        _misses.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Lookups
+# ---------------------------------------------------------------------------
+
+
+def lookup_host(host: str) -> StoreRoute | None:
+    """Resolve a host from memory only (no query, no miss bookkeeping).
+
+    Args:
+        host: A ``Host`` header value.
+
+    Returns:
+        The store the host routes to, or None if it is not in the table.
+    """
+    store_id = _hosts.get(normalize_host(host))
+    return _stores.get(store_id) if store_id is not None else None
+
+
+async def resolve_slug(db: AsyncSession, slug: str) -> StoreRoute | None:
+    """Resolve a storefront slug to its store.
+
+    Args:
+        db: Async database session (used to load the table, and on misses
+            while the table may be incomplete).
+        slug: The store's URL slug.
+
+    Returns:
+        The store's route (any status but deleted), or None if no live
+        store has the slug.
+    """
+    await _ensure_loaded(db)
+    store_id = _slugs.get(slug)
+    if store_id is not None:
+        return _stores[store_id]
+    key = f"slug:{slug}"
+    if _is_complete() or _known_miss(key):
+        return None
+    store = (
+        await db.execute(
+            select(Store).where(Store.slug == slug, Store.status != StoreStatus.deleted)
+        )
+    ).scalar_one_or_none()
+    if store is None:
+        _remember_miss(key)
+        return None
+    route = StoreRoute.from_store(store)
+    _put_store(route)
+    return route
+
+
+async def resolve_host(db: AsyncSession, host: str) -> StoreRoute | None:
+    """Resolve a custom domain to its store.
+
+    Args:
+        db: Async database session (used to load the table, and on misses
+            while the table may be incomplete).
+        host: A ``Host`` header value.
+
+    Returns:
+        The store's route, or None if the host is not a verified custom
+        domain of a live store.
+    """
+    await _ensure_loaded(db)
+    host = normalize_host(host)
+    route = lookup_host(host)
+    if route is not None:
+        return route
+    key = f"host:{host}"
+    if _is_complete() or _known_miss(key):
+        return None
+    store = (
+        await db.execute(
+            select(Store)
+            .join(CustomDomain, CustomDomain.store_id == Store.id)
+            .where(
+                CustomDomain.domain == host,
+                CustomDomain.status.in_(ROUTABLE_DOMAIN_STATUSES),
+                Store.status != StoreStatus.deleted,
+            )
+        )
+    ).scalar_one_or_none()
+    if store is None:
+        _remember_miss(key)
+        return None
+    route = StoreRoute.from_store(store)
+    _put_store(route)
+    _put_domain(store.id, host)
+    return route
+
+
+# ---------------------------------------------------------------------------
+# Publishing
+# ---------------------------------------------------------------------------
+
+
+def _store_message(store: Store) -> dict:
+    return {
+        "type": "store",
+        "id": str(store.id),
+        "slug": store.slug,
+        "status": store.status.value,
+        "user_id": str(store.user_id),
+        "name": store.name,
+        "default_currency": store.default_currency,
+    }
+
+
+def _domain_message(domain: CustomDomain, deleted: bool = False) -> dict:
+    routable = not deleted and domain.status in ROUTABLE_DOMAIN_STATUSES
+    return {
+        "type": "domain",
+        "store_id": str(domain.store_id),
+        "host": domain.domain if routable else None,
+    }
+
+
+def _publish(message: dict) -> None:
+    apply_route_change(message)
+    try:
+        get_sync_redis().publish(ROUTES_CHANNEL, json.dumps(message))
+    except RedisError as exc:
+        logger.warning("Storefront route change not broadcast: %s", exc)
+
+
+def publish_store_route(db: AsyncSession | Session, store: Store) -> None:
+    """Announce a store's current slug and status once ``db`` commits.
+
+    Args:
+        db: The session making the change.
+        store: The created, updated, or deleted store (flushed).
+    """
+    message = _store_message(store)
+    on_commit(db, lambda: _publish(message))
+
+
+def publish_domain_route(
+    db: AsyncSession | Session, domain: CustomDomain, deleted: bool = False
+) -> None:
+    """Announce where a store's custom domain routes once ``db`` commits.
+
+    Args:
+        db: The session making the change.
+        domain: The store's custom domain (flushed).
+        deleted: True if the domain is being removed.
+    """
+    message = _domain_message(domain, deleted)
+    on_commit(db, lambda: _publish(message))
+
+
+# ---------------------------------------------------------------------------
+# Subscriber
+# ---------------------------------------------------------------------------
+
+
+async def listen_for_route_changes() -> None:
+    """Apply route changes published by other processes, forever.
+
+    Reconnects after Redis errors; each (re)subscription marks the table
+    stale so changes published while disconnected are picked up. While
+    subscribed, lookups treat the loaded table as complete.
+    """
+    global _subscribed
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(ROUTES_CHANNEL)
+            mark_routes_stale()
+            _subscribed = True
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
+                    try:
+                        apply_route_change(json.loads(message["data"]))
+                    except (KeyError, ValueError) as exc:
+                        logger.warning("Malformed storefront route message: %s", exc)
+        except RedisError as exc:
+            logger.warning("Storefront route listener disconnected: %s", exc)
+            await asyncio.sleep(5)
+        finally:
+            _subscribed = False
+            await pubsub.aclose()
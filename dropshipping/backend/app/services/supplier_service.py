@@ -37,34 +37,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product
-from app.models.store import Store, StoreStatus
 from app.models.supplier import ProductSupplier, Supplier, SupplierStatus
-
-
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
+from app.services.store_access_service import verify_store_ownership
 
 
 async def create_supplier(
@@ -95,7 +69,7 @@ async def create_supplier(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     supplier = Supplier(
         store_id=store_id,
@@ -137,7 +111,7 @@ async def list_suppliers(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Supplier).where(Supplier.store_id == store_id)
     count_query = select(func.count(Supplier.id)).where(Supplier.store_id == store_id)
@@ -179,7 +153,7 @@ async def get_supplier(
         ValueError: If the store or supplier doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Supplier).where(
@@ -291,7 +265,7 @@ async def link_product_supplier(
         ValueError: If the store, product, or supplier doesn't exist, the
             store belongs to another user, or the link already exists.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Verify product belongs to the store
     product_result = await db.execute(
@@ -368,7 +342,7 @@ async def unlink_product_supplier(
         ValueError: If the store doesn't exist, belongs to another user,
             or the product-supplier link doesn't exist.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(ProductSupplier).where(
@@ -0,0 +1,331 @@
+"""Supplier catalog sync for linked products.
+
+Keeps the cost, price and stock of dropshipped products in line with what
+their suppliers currently charge and hold, a page of product-supplier
+links at a time.
+
+**For Developers:**
+    - ``sync_supplier_links_sync`` handles one keyset page
+      (``ProductSupplier.id > after_link_id``, at most
+      ``settings.supplier_sync_batch_size`` links) of links of active
+      suppliers that have a ``supplier_url``. The platform is taken from
+      the URL's host (``supplier_platform``); links to platforms without
+      a client are skipped.
+    - The page's URLs are deduplicated and fetched with
+      ``fetch_supplier_products``: one ``ecomm_suppliers`` client per
+      platform (``get_supplier_client``; demo mode without an API key),
+      at most ``settings.supplier_sync_concurrency`` lookups in flight per
+      platform. A failed lookup is logged and retried on the next run.
+    - Each fetched product is reduced to what the sync applies (price and
+      per-variant SKU, price and stock) and hashed (``payload_hash``).
+      Links whose ``sync_hash`` matches are skipped without any write.
+    - Changes are applied with one ``UPDATE ... FROM (VALUES ...)`` per
+      table: the links' ``supplier_cost`` and ``sync_hash``; for primary
+      links the product's ``cost`` and ``price``; and the
+      ``inventory_count`` of product variants whose SKU matches a supplier
+      variant. The new price keeps the owner's current markup over cost
+      (``ProductNormalizer.calculate_markup``) with charm pricing
+      (``ProductNormalizer.apply_psychological_pricing``).
+    - ``notify_supplier_sync`` sends one ``product.updated`` webhook per
+      store for a whole run; call it after committing.
+
+**For QA Engineers:**
+    - A link's cost is the price of the supplier variant matching its
+      ``supplier_sku``, otherwise the supplier's product price.
+    - Only primary links change the product; a product without a cost
+      (or priced below it) keeps its price.
+    - Running the sync twice without supplier changes writes nothing the
+      second time.
+    - Development uses the suppliers' demo catalogs, so the first run
+      applies their prices and stock and later runs find no changes.
+
+**For Project Managers:**
+    Store owners no longer sell at stale margins or oversell items their
+    supplier ran out of; unchanged products cost one hash comparison.
+
+**For End Users:**
+    Your product costs, prices and stock follow your suppliers
+    automatically, and your integrations get one update per sync.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+from urllib.parse import urlsplit
+
+from ecomm_suppliers import BaseSupplierClient, ProductNormalizer, SupplierFactory, SupplierProduct
+from sqlalchemy import Integer, Numeric, String, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.http_client import run_async
+from app.models.product import Product, ProductVariant
+from app.models.supplier import ProductSupplier, Supplier, SupplierStatus
+
+logger = logging.getLogger(__name__)
+
+# Host label -> ``SupplierFactory`` platform name
+_PLATFORM_HOSTS = {"aliexpress": "aliexpress", "cjdropshipping": "cjdropship"}
+
+
+def supplier_platform(url: str | None) -> str | None:
+    """Return the supplier platform a product URL belongs to.
+
+    Args:
+        url: The link's ``supplier_url``.
+
+    Returns:
+        ``"aliexpress"`` or ``"cjdropship"``, or None for other hosts.
+    """
+    labels = (urlsplit(url or "").hostname or "").split(".")
+    return next((_PLATFORM_HOSTS[label] for label in labels if label in _PLATFORM_HOSTS), None)
+
+
+def get_supplier_client(platform: str) -> BaseSupplierClient:
+    """Create the client of a supplier platform.
+
+    Args:
+        platform: ``"aliexpress"`` or ``"cjdropship"``.
+
+    Returns:
+        The platform's client; in demo mode when no API key is configured.
+    """
+    api_key = {
+        "aliexpress": settings.aliexpress_api_key,
+        "cjdropship": settings.cjdropship_api_key,
+    }[platform]
+    return SupplierFactory.create(platform, api_key=api_key or None)
+
+
+def payload_hash(product: SupplierProduct) -> str:
+    """Hash the parts of a supplier product that the sync applies.
+
+    Titles, images, ratings and fetch times are left out, so only a
+    change of price or variant price/stock produces a new hash.
+
+    Args:
+        product: The fetched supplier product.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    variants = sorted(
+        ([v.sku or v.name, str(v.price), v.stock] for v in product.variants),
+        key=lambda v: (v[0], v[1]),
+    )
+    normalized = {"price": str(product.price), "variants": variants}
+    return hashlib.sha256(json.dumps(normalized, separators=(",", ":")).encode()).hexdigest()
+
+
+async def fetch_supplier_products(
+    urls: dict[str, list[str]],
+) -> dict[str, SupplierProduct]:
+    """Fetch supplier products, concurrently per platform.
+
+    Args:
+        urls: Product URLs grouped by platform.
+
+    Returns:
+        Dict mapping URL to its product. URLs whose lookup failed are
+        missing.
+    """
+
+    async def _fetch_platform(platform: str, platform_urls: list[str]) -> list[tuple]:
+        slots = asyncio.Semaphore(settings.supplier_sync_concurrency)
+        async with get_supplier_client(platform) as client:
+
+            async def _fetch(url: str) -> tuple | None:
+                async with slots:
+                    try:
+                        return url, await client.get_product_by_url(url)
+                    except Exception as exc:
+                        logger.warning(
+                            "Supplier lookup failed: platform=%s url=%s error=%s",
+                            platform, url, exc,
+                        )
+                        return None
+
+            fetched = await asyncio.gather(*(_fetch(url) for url in platform_urls))
+        return [item for item in fetched if item is not None]
+
+    results = await asyncio.gather(*(
+        _fetch_platform(platform, platform_urls) for platform, platform_urls in urls.items()
+    ))
+    return {url: product for chunk in results for url, product in chunk}
+
+
+def _link_cost(product: SupplierProduct, supplier_sku: str | None) -> Decimal:
+    """Return the supplier's cost for a link: its variant's, else the product's."""
+    for variant in product.variants:
+        if supplier_sku and variant.sku == supplier_sku:
+            return variant.price
+    return product.price
+
+
+def _repriced(price: Decimal, old_cost: Decimal | None, new_cost: Decimal) -> Decimal:
+    """Carry the owner's markup over ``old_cost`` onto ``new_cost``."""
+    if not old_cost or old_cost <= 0 or price < old_cost:
+        return price
+    markup_percent = float((price / old_cost - 1) * 100)
+    return ProductNormalizer.apply_psychological_pricing(
+        ProductNormalizer.calculate_markup(new_cost, markup_percent)
+    )
+
+
+def sync_supplier_links_sync(
+    session: Session,
+    after_link_id: uuid.UUID | None = None,
+    limit: int | None = None,
+) -> dict:
+    """Sync one page of product-supplier links with their suppliers.
+
+    Args:
+        session: Sync database session (not committed).
+        after_link_id: Keyset cursor; only links with a greater ID are
+            synced.
+        limit: Maximum links in the page (defaults to
+            ``settings.supplier_sync_batch_size``).
+
+    Returns:
+        Dict with ``checked`` (links in the page), ``unchanged``,
+        ``updated``, ``failed`` and ``skipped`` (unsupported platform)
+        link counts, ``changed`` (product ID
+        strings whose cost, price or stock changed, keyed by store ID
+        string), and ``last_link_id`` (cursor for the next page, None when
+        done).
+    """
+    limit = limit or settings.supplier_sync_batch_size
+    query = (
+        select(
+            ProductSupplier.id, ProductSupplier.product_id, ProductSupplier.supplier_url,
+            ProductSupplier.supplier_sku, ProductSupplier.is_primary, ProductSupplier.sync_hash,
+            Product.store_id, Product.price, Product.cost,
+        )
+        .join(Product, Product.id == ProductSupplier.product_id)
+        .join(Supplier, Supplier.id == ProductSupplier.supplier_id)
+        .where(
+            ProductSupplier.supplier_url.isnot(None),
+            Supplier.status == SupplierStatus.active,
+        )
+        .order_by(ProductSupplier.id)
+        .limit(limit)
+    )
+    if after_link_id is not None:
+        query = query.where(ProductSupplier.id > after_link_id)
+    rows = session.execute(query).all()
+    counts = {"checked": len(rows), "unchanged": 0, "updated": 0, "failed": 0, "skipped": 0}
+    if not rows:
+        return counts | {"changed": {}, "last_link_id": None}
+
+    urls: dict[str, set[str]] = defaultdict(set)
+    for row in rows:
+        platform = supplier_platform(row.supplier_url)
+        if platform is not None:
+            urls[platform].add(row.supplier_url)
+    fetched = run_async(fetch_supplier_products(
+        {platform: sorted(platform_urls) for platform, platform_urls in urls.items()}
+    )) if urls else {}
+
+    link_rows, product_rows, stock_rows = [], [], []
+    for row in rows:
+        product = fetched.get(row.supplier_url)
+        if product is None:
+            supported = supplier_platform(row.supplier_url) is not None
+            counts["failed" if supported else "skipped"] += 1
+            continue
+        digest = payload_hash(product)
+        if digest == row.sync_hash:
+            counts["unchanged"] += 1
+            continue
+        counts["updated"] += 1
+        cost = _link_cost(product, row.supplier_sku)
+        link_rows.append((row.id, cost, digest))
+        if not row.is_primary:
+            continue
+        if cost != row.cost:
+            product_rows.append((row.product_id, cost, _repriced(row.price, row.cost, cost)))
+        stock_rows.extend(
+            (row.product_id, variant.sku, variant.stock)
+            for variant in product.variants
+            if variant.sku and variant.stock is not None
+        )
+
+    changed: dict[str, set[str]] = defaultdict(set)
+    if link_rows:
+        links = values(
+            column("id", UUID(as_uuid=True)),
+            column("cost", Numeric(10, 2)),
+            column("sync_hash", String(64)),
+            name="synced_links",
+        ).data(link_rows)
+        session.execute(
+            update(ProductSupplier)
+            .where(ProductSupplier.id == links.c.id)
+            .values(supplier_cost=links.c.cost, sync_hash=links.c.sync_hash)
+            .execution_options(synchronize_session=False)
+        )
+    if product_rows:
+        costs = values(
+            column("id", UUID(as_uuid=True)),
+            column("cost", Numeric(10, 2)),
+            column("price", Numeric(10, 2)),
+            name="synced_costs",
+        ).data(product_rows)
+        for store_id, product_id in session.execute(
+            update(Product)
+            .where(Product.id == costs.c.id)
+            .values(cost=costs.c.cost, price=costs.c.price)
+            .returning(Product.store_id, Product.id)
+            .execution_options(synchronize_session=False)
+        ):
+            changed[str(store_id)].add(str(product_id))
+    if stock_rows:
+        stock = values(
+            column("product_id", UUID(as_uuid=True)),
+            column("sku", String(100)),
+            column("stock", Integer),
+            name="synced_stock",
+        ).data(stock_rows)
+        for store_id, product_id in session.execute(
+            update(ProductVariant)
+            .where(
+                ProductVariant.product_id == stock.c.product_id,
+                ProductVariant.sku == stock.c.sku,
+                ProductVariant.inventory_count.is_distinct_from(stock.c.stock),
+                Product.id == ProductVariant.product_id,
+            )
+            .values(inventory_count=stock.c.stock)
+            .returning(Product.store_id, Product.id)
+            .execution_options(synchronize_session=False)
+        ):
+            changed[str(store_id)].add(str(product_id))
+
+    return counts | {
+        "changed": {store_id: sorted(ids) for store_id, ids in changed.items()},
+        "last_link_id": rows[-1].id if len(rows) == limit else None,
+    }
+
+
+def notify_supplier_sync(changed: dict[str, list[str]]) -> None:
+    """Send one ``product.updated`` webhook per store for a sync run.
+
+    Call after the sync's transactions have committed.
+
+    Args:
+        changed: Changed product ID strings keyed by store ID string.
+    """
+    from app.tasks.webhook_tasks import dispatch_webhook_event
+
+    for store_id, product_ids in changed.items():
+        if product_ids:
+            dispatch_webhook_event.delay(store_id, "product.updated", {
+                "bulk": True,
+                "operation": "supplier_sync",
+                "product_ids": product_ids,
+                "count": len(product_ids),
+            })
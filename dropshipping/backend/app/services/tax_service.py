@@ -37,7 +37,8 @@ from decimal import Decimal
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.store import Store, StoreStatus
+from app.services.checkout_rules_service import get_store_rules, invalidate_store_rules
+from app.services.store_access_service import verify_store_ownership
 
 
 # ---------------------------------------------------------------------------
@@ -52,32 +53,6 @@ except ImportError:
     TaxRate = None  # type: ignore[assignment,misc]
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_tax_rate(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -112,7 +87,7 @@ async def create_tax_rate(
         ValueError: If the store doesn't exist, belongs to another user,
             or the rate is negative.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if rate < Decimal("0"):
         raise ValueError("Tax rate cannot be negative")
@@ -131,6 +106,7 @@ async def create_tax_rate(
     db.add(tax_rate)
     await db.flush()
     await db.refresh(tax_rate)
+    invalidate_store_rules(db, store_id)
     return tax_rate
 
 
@@ -155,7 +131,7 @@ async def list_tax_rates(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TaxRate)
@@ -191,7 +167,7 @@ async def update_tax_rate(
         ValueError: If the store or tax rate doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TaxRate).where(
@@ -213,6 +189,7 @@ async def update_tax_rate(
 
     await db.flush()
     await db.refresh(tax_rate)
+    invalidate_store_rules(db, store_id)
     return tax_rate
 
 
@@ -234,7 +211,7 @@ async def delete_tax_rate(
         ValueError: If the store or tax rate doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TaxRate).where(
@@ -248,6 +225,7 @@ async def delete_tax_rate(
 
     await db.delete(tax_rate)
     await db.flush()
+    invalidate_store_rules(db, store_id)
 
 
 async def calculate_tax(
@@ -263,7 +241,9 @@ async def calculate_tax(
     Finds matching active tax rates by geographic hierarchy (most specific
     first: zip > state > country) and applies them in priority order.
     Compound rates are applied on the running total; non-compound rates
-    are applied on the original subtotal.
+    are applied on the original subtotal. The rates come from the store's
+    compiled checkout rules, so repeated estimates do not query the
+    database.
 
     This function does NOT require store ownership verification as it
     is called during public checkout.
@@ -280,44 +260,8 @@ async def calculate_tax(
         A dict with ``tax_amount`` (total tax), ``effective_rate``
         (percentage), and ``breakdown`` (list of applied rate details).
     """
-    # Build conditions for geographic matching
-    from sqlalchemy import or_, and_
-
-    conditions = [
-        TaxRate.store_id == store_id,
-        TaxRate.is_active.is_(True),
-    ]
-
-    # Match by geographic hierarchy
-    geo_conditions = [TaxRate.country == country.upper()]
-    if state:
-        geo_conditions.append(
-            or_(
-                TaxRate.state == state.upper(),
-                TaxRate.state.is_(None),
-            )
-        )
-    else:
-        geo_conditions.append(TaxRate.state.is_(None))
-
-    if zip_code:
-        geo_conditions.append(
-            or_(
-                TaxRate.zip_code == zip_code,
-                TaxRate.zip_code.is_(None),
-            )
-        )
-    else:
-        geo_conditions.append(TaxRate.zip_code.is_(None))
-
-    conditions.extend(geo_conditions)
-
-    result = await db.execute(
-        select(TaxRate)
-        .where(*conditions)
-        .order_by(TaxRate.priority)
-    )
-    matching_rates = list(result.scalars().all())
+    rules = await get_store_rules(db, store_id)
+    matching_rates = rules.match_tax_rates(country, state, zip_code)
 
     if not matching_rates:
         return {
@@ -10,7 +10,10 @@ team member access.
     ``TeamInvite`` record represents a pending invitation. Update and
     remove operations transparently handle both record types.
     The ``check_store_access`` function is intended for use in API
-    dependencies to verify team-based access beyond direct ownership.
+    dependencies to verify team-based access beyond direct ownership;
+    it and the ownership checks go through ``store_access_service``,
+    and every membership change invalidates the member's cached role
+    when its transaction commits.
 
 **For QA Engineers:**
     - ``invite_member`` checks that the invitee is not already a member
@@ -45,6 +48,11 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.store import Store, StoreStatus
+from app.services.store_access_service import (
+    invalidate_store_access,
+    resolve_store_role,
+    verify_store_ownership,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -57,32 +65,6 @@ except ImportError:
     TeamMember = None  # type: ignore[assignment,misc]
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def invite_member(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -112,7 +94,7 @@ async def invite_member(
             the invitee is the store owner, or the email is already a
             team member.
     """
-    store = await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Prevent inviting yourself (the store owner)
     from app.models.user import User
@@ -181,7 +163,7 @@ async def list_members(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TeamMember)
@@ -215,7 +197,7 @@ async def list_members_and_invites(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Fetch accepted members
     members_result = await db.execute(
@@ -277,7 +259,7 @@ async def update_member_role(
             belongs to another user, or attempting to change the owner's
             role.
     """
-    store = await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TeamMember).where(
@@ -290,11 +272,12 @@ async def update_member_role(
         raise ValueError("Team member not found")
 
     # Prevent changing the store owner's role
-    if member.user_id == store.user_id:
+    if member.user_id == user_id:
         raise ValueError("Cannot change the store owner's role")
 
     member.role = role
     await db.flush()
+    invalidate_store_access(db, store_id, member.user_id)
     await db.refresh(member)
     return member
 
@@ -326,7 +309,7 @@ async def update_member_or_invite_role(
             belongs to another user, or attempting to change the owner's
             role.
     """
-    store = await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Try TeamMember first
     result = await db.execute(
@@ -337,10 +320,11 @@ async def update_member_or_invite_role(
     )
     member = result.scalar_one_or_none()
     if member is not None:
-        if member.user_id == store.user_id:
+        if member.user_id == user_id:
             raise ValueError("Cannot change the store owner's role")
         member.role = role
         await db.flush()
+        invalidate_store_access(db, store_id, member.user_id)
         await db.refresh(member)
         # Set transient email for response serialization
         member.email = member.invited_email  # type: ignore[attr-defined]
@@ -384,7 +368,7 @@ async def remove_member(
         ValueError: If the store or member doesn't exist, the store
             belongs to another user, or attempting to remove the owner.
     """
-    store = await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(TeamMember).where(
@@ -396,11 +380,12 @@ async def remove_member(
     if member is None:
         raise ValueError("Team member not found")
 
-    if member.user_id == store.user_id:
+    if member.user_id == user_id:
         raise ValueError("Cannot remove the store owner from the team")
 
     await db.delete(member)
     await db.flush()
+    invalidate_store_access(db, store_id, member.user_id)
 
 
 async def remove_member_or_invite(
@@ -424,7 +409,7 @@ async def remove_member_or_invite(
         ValueError: If neither a member nor invite is found, the store
             belongs to another user, or attempting to remove the owner.
     """
-    store = await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     # Try TeamMember first
     result = await db.execute(
@@ -435,10 +420,11 @@ async def remove_member_or_invite(
     )
     member = result.scalar_one_or_none()
     if member is not None:
-        if member.user_id == store.user_id:
+        if member.user_id == user_id:
             raise ValueError("Cannot remove the store owner from the team")
         await db.delete(member)
         await db.flush()
+        invalidate_store_access(db, store_id, member.user_id)
         return
 
     # Try TeamInvite
@@ -516,6 +502,7 @@ async def accept_invite(
     await db.delete(invite)
 
     await db.flush()
+    invalidate_store_access(db, member.store_id, user_id)
     await db.refresh(member)
     return member
 
@@ -556,6 +543,7 @@ async def check_store_access(
 
     First checks if the user is the store owner (returns ``"owner"``),
     then checks for a team membership and returns the assigned role.
+    Answers come from ``store_access_service``'s cache.
 
     Args:
         db: Async database session.
@@ -566,29 +554,4 @@ async def check_store_access(
         The role string (``"owner"``, ``"admin"``, ``"editor"``,
         ``"viewer"``) or None if the user has no access.
     """
-    # Check direct ownership first
-    store_result = await db.execute(
-        select(Store).where(
-            Store.id == store_id,
-            Store.status != StoreStatus.deleted,
-        )
-    )
-    store = store_result.scalar_one_or_none()
-    if store is None:
-        return None
-
-    if store.user_id == user_id:
-        return "owner"
-
-    # Check team membership
-    member_result = await db.execute(
-        select(TeamMember).where(
-            TeamMember.store_id == store_id,
-            TeamMember.user_id == user_id,
-        )
-    )
-    member = member_result.scalar_one_or_none()
-    if member is not None:
-        return member.role
-
-    return None
+    return await resolve_store_role(db, store_id, user_id)
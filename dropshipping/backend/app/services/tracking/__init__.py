@@ -0,0 +1,17 @@
+"""Carrier tracking abstraction package.
+
+Provides a unified bulk tracking interface across shipping carriers,
+with a mock tracker for development and testing.
+"""
+
+from app.services.tracking.base import AbstractCarrierTracker, TrackingStatus, TrackingUpdate
+from app.services.tracking.factory import get_carrier_tracker
+from app.services.tracking.mock import MockCarrierTracker
+
+__all__ = [
+    "AbstractCarrierTracker",
+    "MockCarrierTracker",
+    "TrackingStatus",
+    "TrackingUpdate",
+    "get_carrier_tracker",
+]
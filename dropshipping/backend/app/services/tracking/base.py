@@ -0,0 +1,84 @@
+"""Abstract carrier tracking client and data classes.
+
+Defines the contract that every carrier tracking integration follows,
+along with the shared result type.
+
+**For Developers:**
+    Subclass ``AbstractCarrierTracker`` to add a carrier. ``track_many``
+    receives up to ``max_batch_size`` tracking numbers and answers them
+    with one bulk lookup (most carrier APIs accept a list of numbers per
+    request). Numbers the carrier does not know are simply left out of
+    the result.
+
+**For QA Engineers:**
+    - ``track_many`` returns a dict keyed by tracking number.
+    - ``TrackingUpdate.delivered_at`` is only set for delivered shipments.
+    - Lookups may raise on carrier outages; the poller logs the error and
+      tries those shipments again on its next run.
+
+**For Project Managers:**
+    One interface for all carriers means adding a carrier does not touch
+    the order polling logic.
+
+**For End Users:**
+    Your orders are marked delivered automatically once the carrier
+    reports the package as delivered.
+"""
+
+import enum
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+
+class TrackingStatus(str, enum.Enum):
+    """Shipment states reported by carriers.
+
+    Attributes:
+        in_transit: The carrier has the package and it is on its way.
+        delivered: The package was delivered.
+        exception: Delivery failed or is held (address issue, returned).
+    """
+
+    in_transit = "in_transit"
+    delivered = "delivered"
+    exception = "exception"
+
+
+@dataclass(frozen=True)
+class TrackingUpdate:
+    """A carrier's current answer for one tracking number.
+
+    Attributes:
+        tracking_number: The tracking number looked up.
+        status: The shipment state.
+        delivered_at: When the carrier recorded the delivery (None unless
+            delivered).
+    """
+
+    tracking_number: str
+    status: TrackingStatus
+    delivered_at: datetime | None = None
+
+
+class AbstractCarrierTracker(ABC):
+    """Base carrier tracking interface.
+
+    Attributes:
+        max_batch_size: Most tracking numbers one ``track_many`` call
+            accepts.
+    """
+
+    max_batch_size: int = 100
+
+    @abstractmethod
+    async def track_many(self, tracking_numbers: list[str]) -> dict[str, TrackingUpdate]:
+        """Look up several shipments with one carrier request.
+
+        Args:
+            tracking_numbers: Up to ``max_batch_size`` tracking numbers.
+
+        Returns:
+            Dict mapping each known tracking number to its update.
+        """
+        ...
@@ -0,0 +1,37 @@
+"""Carrier tracker factory.
+
+Returns the tracking client for an order's carrier. Defaults to the mock
+tracker for development.
+
+**For Developers:**
+    Call ``get_carrier_tracker(carrier)`` with ``Order.carrier``. Only the
+    mock tracker exists today, so it serves every carrier; real
+    integrations are selected here by carrier name.
+
+**For QA Engineers:**
+    - Unknown carriers fall back to the ``MockCarrierTracker``.
+    - The factory returns a new instance on each call (no singleton).
+
+**For Project Managers:**
+    Carriers are added by writing one tracker class, without touching the
+    polling job.
+
+**For End Users:**
+    The platform picks the right carrier integration for each shipment
+    automatically.
+"""
+
+from app.services.tracking.base import AbstractCarrierTracker
+from app.services.tracking.mock import MockCarrierTracker
+
+
+def get_carrier_tracker(carrier: str | None) -> AbstractCarrierTracker:
+    """Create and return the tracker for a carrier.
+
+    Args:
+        carrier: The carrier name stored on the order (may be None).
+
+    Returns:
+        An instance of AbstractCarrierTracker for that carrier.
+    """
+    return MockCarrierTracker()
@@ -0,0 +1,71 @@
+"""Mock carrier tracker for development and testing.
+
+Simulates a carrier's bulk tracking endpoint without network access.
+
+**For Developers:**
+    Each tracking number is reported delivered with probability
+    ``delivery_rate`` (30% by default, matching the old per-order dev
+    simulation) and in transit otherwise. ``latency`` makes every bulk
+    call sleep first, and ``calls`` records the batches it received, so
+    tests can assert on the number and size of carrier requests.
+
+**For QA Engineers:**
+    - ``MockCarrierTracker(delivery_rate=1.0)`` delivers everything;
+      ``delivery_rate=0.0`` delivers nothing.
+    - Delivered updates carry the current time as ``delivered_at``.
+
+**For Project Managers:**
+    Lets the delivery automation run end to end in development and CI
+    without carrier accounts.
+
+**For End Users:**
+    Used internally during development only.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+
+from app.services.tracking.base import AbstractCarrierTracker, TrackingStatus, TrackingUpdate
+
+
+class MockCarrierTracker(AbstractCarrierTracker):
+    """In-memory carrier tracker with random deliveries.
+
+    Attributes:
+        delivery_rate: Chance that a shipment is reported delivered.
+        latency: Seconds each ``track_many`` call waits.
+        calls: The tracking number lists passed to ``track_many``.
+    """
+
+    def __init__(self, delivery_rate: float = 0.3, latency: float = 0.0):
+        """Initialize the mock tracker.
+
+        Args:
+            delivery_rate: Chance that a shipment is reported delivered.
+            latency: Simulated carrier latency per bulk call.
+        """
+        self.delivery_rate = delivery_rate
+        self.latency = latency
+        self.calls: list[list[str]] = []
+
+    async def track_many(self, tracking_numbers: list[str]) -> dict[str, TrackingUpdate]:
+        """Report each shipment as delivered or in transit.
+
+        Args:
+            tracking_numbers: Up to ``max_batch_size`` tracking numbers.
+
+        Returns:
+            Dict mapping every tracking number to its simulated update.
+        """
+        self.calls.append(list(tracking_numbers))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        now = datetime.now(timezone.utc)
+        updates = {}
+        for number in tracking_numbers:
+            if random.random() < self.delivery_rate:
+                updates[number] = TrackingUpdate(number, TrackingStatus.delivered, now)
+            else:
+                updates[number] = TrackingUpdate(number, TrackingStatus.in_transit)
+        return updates
@@ -0,0 +1,339 @@
+"""Batched carrier tracking for shipped orders.
+
+Polls the carriers of shipped orders for delivery updates a page at a
+time, instead of loading every shipped order and handling it one by one.
+
+**For Developers:**
+    - ``poll_shipments_sync`` handles one keyset page (``Order.id >
+      after_order_id``, at most ``settings.tracking_batch_size`` orders)
+      of shipped orders older than ``settings.tracking_min_transit_days``.
+      Only ``id``, ``carrier`` and ``tracking_number`` are selected; the
+      partial index ``ix_orders_shipped_id`` serves the page.
+    - The page's tracking numbers are grouped per carrier and split into
+      chunks of the carrier's ``max_batch_size``; every chunk is one
+      ``track_many`` call (``app.services.tracking``), with at most
+      ``settings.tracking_lookup_concurrency`` calls in flight. A failed
+      call is logged and its shipments are retried on the next poll.
+    - All deliveries in the page are applied with a single ``UPDATE ...
+      FROM (VALUES ...)`` that sets each order's carrier-reported
+      ``delivered_at``. The update still requires ``status = 'shipped'``,
+      so an order changed by its owner in the meantime is left alone.
+    - The side effects for one page of deliveries come in two steps.
+      ``create_delivery_notifications_sync`` adds the dashboard
+      notifications with one ``INSERT`` and returns them with the
+      delivered orders; the caller commits them before anything leaves
+      the process. ``send_delivery_events_sync`` then makes one query
+      for the subscribed webhooks of all affected stores and one
+      concurrent ``deliver_all`` round, and queues the customer emails
+      through the batched email outbox. It runs once per page and is not
+      retried as a whole: failed webhook attempts get their own durable
+      retries, so a database error can never resend the page.
+
+**For QA Engineers:**
+    - Orders without a tracking number cannot be polled and stay
+      ``shipped`` until the owner updates them.
+    - A delivered order gets ``delivered_at`` from the carrier, one
+      ``order_delivered`` notification, one ``order.delivered`` webhook
+      event and one delivery email.
+    - In development the mock carrier delivers 30% of polled shipments
+      per run.
+
+**For Project Managers:**
+    The delivery check now costs the same per order no matter how large
+    the order book grows, and carriers are asked in bulk instead of once
+    per package.
+
+**For End Users:**
+    Orders are marked delivered automatically once the carrier confirms
+    delivery, and your customers get their delivery email shortly after.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, column, insert, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.http_client import run_async
+from app.models.notification import Notification, NotificationType
+from app.models.order import Order, OrderStatus
+from app.models.store import Store
+from app.services.tracking import TrackingStatus, TrackingUpdate, get_carrier_tracker
+
+logger = logging.getLogger(__name__)
+
+DELIVERED_EVENT = "order.delivered"
+
+
+async def lookup_shipments(
+    shipments: dict[str | None, list[str]],
+) -> dict[tuple[str | None, str], TrackingUpdate]:
+    """Look up shipments with bulk carrier calls, concurrently.
+
+    Args:
+        shipments: Tracking numbers grouped by carrier name.
+
+    Returns:
+        Dict mapping ``(carrier, tracking_number)`` to the carrier's
+        update. Shipments whose lookup failed are missing.
+    """
+    slots = asyncio.Semaphore(settings.tracking_lookup_concurrency)
+    calls = []
+    for carrier, numbers in shipments.items():
+        tracker = get_carrier_tracker(carrier)
+        size = tracker.max_batch_size
+        calls.extend((carrier, tracker, numbers[i:i + size]) for i in range(0, len(numbers), size))
+
+    async def _track(carrier, tracker, numbers) -> list[tuple]:
+        async with slots:
+            try:
+                updates = await tracker.track_many(numbers)
+            except Exception as exc:
+                logger.warning(
+                    "Tracking lookup failed: carrier=%s shipments=%d error=%s",
+                    carrier, len(numbers), exc,
+                )
+                return []
+        return [((carrier, number), update) for number, update in updates.items()]
+
+    results = await asyncio.gather(*(_track(*call) for call in calls))
+    return {key: update for chunk in results for key, update in chunk}
+
+
+def poll_shipments_sync(
+    session: Session,
+    after_order_id: uuid.UUID | None = None,
+    limit: int | None = None,
+    now: datetime | None = None,
+) -> dict:
+    """Poll the carriers for one page of shipped orders.
+
+    Args:
+        session: Sync database session (not committed).
+        after_order_id: Keyset cursor; only orders with a greater ID are
+            polled.
+        limit: Maximum orders in the page (defaults to
+            ``settings.tracking_batch_size``).
+        now: Current time (defaults to now), used for the transit cutoff.
+
+    Returns:
+        Dict with ``checked`` (orders polled), ``delivered`` (list of
+        delivered order ID strings), and ``last_order_id`` (cursor for the
+        next page, None when done).
+    """
+    now = now or datetime.now(timezone.utc)
+    limit = limit or settings.tracking_batch_size
+    query = (
+        select(Order.id, Order.carrier, Order.tracking_number)
+        .where(
+            Order.status == OrderStatus.shipped,
+            Order.tracking_number.isnot(None),
+            Order.shipped_at <= now - timedelta(days=settings.tracking_min_transit_days),
+        )
+        .order_by(Order.id)
+        .limit(limit)
+    )
+    if after_order_id is not None:
+        query = query.where(Order.id > after_order_id)
+    rows = session.execute(query).all()
+    if not rows:
+        return {"checked": 0, "delivered": [], "last_order_id": None}
+
+    shipments: dict[str | None, list[str]] = defaultdict(list)
+    for _, carrier, number in rows:
+        shipments[carrier].append(number)
+    updates = run_async(lookup_shipments(shipments))
+
+    deliveries = []
+    for order_id, carrier, number in rows:
+        found = updates.get((carrier, number))
+        if found is not None and found.status == TrackingStatus.delivered:
+            deliveries.append((order_id, found.delivered_at or now))
+
+    delivered: list[str] = []
+    if deliveries:
+        delivered_rows = values(
+            column("id", UUID(as_uuid=True)),
+            column("delivered_at", DateTime(timezone=True)),
+            name="deliveries",
+        ).data(deliveries)
+        delivered = [
+            str(order_id)
+            for order_id in session.execute(
+                update(Order)
+                .where(
+                    Order.id == delivered_rows.c.id,
+                    Order.status == OrderStatus.shipped,
+                )
+                .values(
+                    status=OrderStatus.delivered,
+                    delivered_at=delivered_rows.c.delivered_at,
+                )
+                .returning(Order.id)
+                .execution_options(synchronize_session=False)
+            ).scalars()
+        ]
+
+    return {
+        "checked": len(rows),
+        "delivered": delivered,
+        "last_order_id": rows[-1][0] if len(rows) == limit else None,
+    }
+
+
+def create_delivery_notifications_sync(
+    session: Session, order_ids: list[uuid.UUID]
+) -> tuple[list, list[Notification]]:
+    """Add the dashboard notifications for delivered orders.
+
+    Args:
+        session: Sync database session (not committed).
+        order_ids: Orders that were just marked delivered.
+
+    Returns:
+        Tuple of the delivered orders (rows of ``id``, ``store_id``,
+        ``customer_email``, ``total``, ``user_id`` and ``name``, for
+        ``send_delivery_events_sync``) and the created notifications.
+    """
+    rows = session.execute(
+        select(
+            Order.id, Order.store_id, Order.customer_email, Order.total,
+            Store.user_id, Store.name,
+        )
+        .join(Store, Store.id == Order.store_id)
+        .where(Order.id.in_(order_ids))
+    ).all()
+    if not rows:
+        return [], []
+
+    notifications = list(session.scalars(insert(Notification).returning(Notification), [
+        {
+            "user_id": user_id,
+            "store_id": store_id,
+            "notification_type": NotificationType.order_delivered,
+            "title": "Order Delivered",
+            "message": f"Order #{str(order_id)[:8]} has been delivered to {email}",
+            "action_url": f"/stores/{store_id}/orders/{order_id}",
+            "metadata_": {
+                "order_id": str(order_id), "total": str(total), "event": "order_delivered",
+            },
+        }
+        for order_id, store_id, email, total, user_id, _ in rows
+    ]))
+    return rows, notifications
+
+
+def send_delivery_events_sync(session: Session, deliveries: list) -> dict:
+    """Send the webhooks and emails for delivered orders.
+
+    Call once the delivery notifications are committed, and only once
+    per page: the webhooks and emails leave the process as soon as this
+    runs. The delivery attempts are recorded last.
+
+    Args:
+        session: Sync database session (not committed; records the
+            webhook delivery attempts).
+        deliveries: Delivered orders from
+            ``create_delivery_notifications_sync``.
+
+    Returns:
+        Dict with ``webhooks`` (delivery attempts) and ``emails`` counts.
+    """
+    from app.services.email_service import email_service
+    from app.services.webhook_delivery_service import (
+        DeliveryAttempt,
+        build_event_payload,
+        deliver_all,
+        record_delivery_results,
+        subscribed_webhooks_for_stores_sync,
+    )
+
+    counts = {"webhooks": 0, "emails": 0}
+    if not deliveries:
+        return counts
+
+    webhooks = subscribed_webhooks_for_stores_sync(
+        session, {row.store_id for row in deliveries}, DELIVERED_EVENT
+    )
+    by_store = defaultdict(list)
+    for webhook in webhooks:
+        by_store[webhook.store_id].append(webhook)
+    attempts = [
+        DeliveryAttempt(
+            webhook_id=webhook.id,
+            url=webhook.url,
+            secret=webhook.secret,
+            event=DELIVERED_EVENT,
+            payload=build_event_payload(store_id, DELIVERED_EVENT, {"order_id": str(order_id)}),
+        )
+        for order_id, store_id, *_ in deliveries
+        for webhook in by_store[store_id]
+    ]
+    results = deliver_all(attempts) if attempts else []
+    counts["webhooks"] = len(attempts)
+
+    for order_id, _, email, _, _, store_name in deliveries:
+        try:
+            email_service.send_email_sync(
+                to=email,
+                subject=f"Your Order Has Been Delivered - {store_name}",
+                template_name="order_delivered.html",
+                context={
+                    "store_name": store_name,
+                    "order_id": str(order_id),
+                    "customer_email": email,
+                },
+            )
+            counts["emails"] += 1
+        except Exception as exc:
+            logger.error("Delivery email failed: order=%s error=%s", str(order_id)[:8], exc)
+
+    # Recorded last, so a database error cannot keep the emails back.
+    if results:
+        record_delivery_results(session, results)
+    return counts
+
+
+    webhooks = subscribed_webhooks_for_stores_sync(
+        session, {row.store_id for row in rows}, DELIVERED_EVENT
+    )
+    by_store = defaultdict(list)
+    for webhook in webhooks:
+        by_store[webhook.store_id].append(webhook)
+    attempts = [
+        DeliveryAttempt(
+            webhook_id=webhook.id,
+            url=webhook.url,
+            secret=webhook.secret,
+            event=DELIVERED_EVENT,
+            payload=build_event_payload(store_id, DELIVERED_EVENT, {"order_id": str(order_id)}),
+        )
+        for order_id, store_id, *_ in rows
+        for webhook in by_store[store_id]
+    ]
+    if attempts:
+        record_delivery_results(session, deliver_all(attempts))
+    counts["webhooks"] = len(attempts)
+
+    for order_id, _, email, _, _, store_name in rows:
+        try:
+            email_service.send_email_sync(
+                to=email,
+                subject=f"Your Order Has Been Delivered - {store_name}",
+                template_name="order_delivered.html",
+                context={
+                    "store_name": store_name,
+                    "order_id": str(order_id),
+                    "customer_email": email,
+                },
+            )
+            counts["emails"] += 1
+        except Exception as exc:
+            logger.error("Delivery email failed: order=%s error=%s", str(order_id)[:8], exc)
+
+    return counts
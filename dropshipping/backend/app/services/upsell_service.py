@@ -9,7 +9,10 @@ browsing and checkout to increase average order value.
     discount incentives. The ``upsell_type`` field distinguishes between
     ``upsell`` (more expensive alternative), ``cross_sell`` (complementary
     product), and ``bundle`` (buy-together offer). The ``position`` field
-    controls display order.
+    controls display order. Every change also rewrites the source
+    product's manual rows in ``product_recommendations``
+    (``recommendation_service.sync_manual_recommendations``), which the
+    storefront reads blended with learned co-purchase recommendations.
 
 **For QA Engineers:**
     - ``create_upsell`` validates that both products exist in the store.
@@ -37,7 +40,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.product import Product, ProductStatus
-from app.models.store import Store, StoreStatus
+from app.services.recommendation_service import sync_manual_recommendations
+from app.services.store_access_service import verify_store_ownership
 
 
 # ---------------------------------------------------------------------------
@@ -52,32 +56,6 @@ except ImportError:
     Upsell = None  # type: ignore[assignment,misc]
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_upsell(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -116,7 +94,7 @@ async def create_upsell(
             either product doesn't exist, or a self-referential upsell
             is attempted.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if source_product_id == target_product_id:
         raise ValueError("A product cannot upsell to itself")
@@ -154,6 +132,7 @@ async def create_upsell(
     )
     db.add(upsell)
     await db.flush()
+    await sync_manual_recommendations(db, source_product_id)
     await db.refresh(upsell)
     return upsell
 
@@ -180,7 +159,7 @@ async def list_upsells(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     query = select(Upsell).where(Upsell.store_id == store_id)
     count_query = select(func.count(Upsell.id)).where(Upsell.store_id == store_id)
@@ -223,7 +202,7 @@ async def update_upsell(
         ValueError: If the store or upsell doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Upsell).where(
@@ -240,6 +219,7 @@ async def update_upsell(
             setattr(upsell, key, value)
 
     await db.flush()
+    await sync_manual_recommendations(db, upsell.source_product_id)
     await db.refresh(upsell)
     return upsell
 
@@ -262,7 +242,7 @@ async def delete_upsell(
         ValueError: If the store or upsell doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(Upsell).where(
@@ -274,8 +254,10 @@ async def delete_upsell(
     if upsell is None:
         raise ValueError("Upsell not found")
 
+    source_product_id = upsell.source_product_id
     await db.delete(upsell)
     await db.flush()
+    await sync_manual_recommendations(db, source_product_id)
 
 
 async def get_product_upsells(
@@ -0,0 +1,470 @@
+"""Concurrent store webhook delivery engine.
+
+Sends store webhook events to their subscribed endpoints concurrently
+over one pooled HTTP client, schedules failed deliveries for retry with
+exponential backoff, and disables endpoints that keep failing.
+
+**For Developers:**
+    - Every endpoint is its own unit of work: a ``DeliveryAttempt``
+      (webhook, event, payload, attempt number) yields exactly one
+      ``DeliveryResult`` and one ``WebhookDelivery`` row.
+    - ``deliver_all`` is the synchronous entry point used by Celery
+      workers. It runs the attempts with the worker's pooled client from
+      ``app.http_client`` (keep-alive connections are reused across
+      tasks) and caps in-flight requests per destination host at
+      ``settings.webhook_max_per_host``, so one slow receiver only ever
+      ties up its own slots. Transport errors never propagate; they are
+      reported as failed results.
+    - ``record_delivery_results`` applies the results: it updates every
+      webhook's ``failure_count`` in the database with one
+      ``UPDATE ... RETURNING`` (a success resets it, failures add to
+      it), so concurrent dispatches to one webhook never lose
+      increments. The circuit breaker compares the returned counts with
+      ``settings.webhook_circuit_breaker_threshold`` and sets
+      ``is_active=False`` in the same statement. It then sets
+      ``next_retry_at`` on failed attempts using ``retry_delay`` and
+      writes all delivery rows with a single batched ``INSERT``.
+    - Retries are sent without holding row locks across HTTP calls:
+      ``claim_due_retries_sync`` leases due rows (``FOR UPDATE SKIP
+      LOCKED``) by pushing their ``next_retry_at`` forward by
+      ``settings.webhook_retry_claim_seconds``, the caller commits, and
+      ``resend_claimed_retries_sync`` re-sends them and clears the
+      claimed rows' ``next_retry_at`` in the same transaction as the
+      new attempt rows. If a worker dies in between, the lease expires
+      and the next sweep picks the retries up again.
+
+**For QA Engineers:**
+    - Requests carry ``X-Webhook-Signature: sha256=<hex>``,
+      ``X-Webhook-Event``, and ``X-Webhook-Attempt`` headers.
+    - Retries happen after roughly 30s, 1m, 2m, 4m, ... (±10% jitter,
+      capped at ``settings.webhook_retry_max_seconds``) until
+      ``settings.webhook_max_attempts`` attempts were made.
+    - When a webhook is disabled by the circuit breaker, its pending
+      retries are cancelled.
+
+**For Project Managers:**
+    A slow or broken integration no longer delays webhooks for other
+    integrations, and temporary outages on the receiver side no longer
+    lose events.
+
+**For End Users:**
+    If your endpoint is briefly unavailable, we keep retrying the event
+    for a while. After repeated failures the webhook is paused; re-enable
+    it once your endpoint is healthy again.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import httpx
+from sqlalchemy import Boolean, Integer, and_, case, cast, column, insert, select, update, values
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.http_client import get_async_http_client, run_async
+from app.models.webhook import StoreWebhook, WebhookDelivery
+from app.services.webhook_service import sign_payload
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class DeliveryAttempt:
+    """One event delivery to one webhook endpoint.
+
+    Attributes:
+        webhook_id: The receiving StoreWebhook's UUID.
+        url: The endpoint URL.
+        secret: The webhook's HMAC signing secret.
+        event: The event type string (e.g. ``"order.paid"``).
+        payload: The full event envelope that is POSTed as JSON.
+        attempt: Attempt number for this event (1 for the first delivery).
+    """
+
+    webhook_id: uuid.UUID
+    url: str
+    secret: str
+    event: str
+    payload: dict
+    attempt: int = 1
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    """The outcome of a ``DeliveryAttempt``.
+
+    Attributes:
+        attempt: The attempt that was made.
+        response_status: HTTP status received (None on transport errors).
+        response_body: Response body or error text, truncated to 1000 chars.
+        success: Whether the receiver answered with a 2xx status.
+    """
+
+    attempt: DeliveryAttempt
+    response_status: int | None
+    response_body: str | None
+    success: bool
+
+
+def build_event_payload(store_id: uuid.UUID, event: str, data: dict) -> dict:
+    """Wrap event data in the envelope sent to every subscriber.
+
+    Args:
+        store_id: The store the event belongs to.
+        event: The event type string.
+        data: The event-specific payload.
+
+    Returns:
+        Dict with ``event``, ``store_id``, ``timestamp``, and ``data``.
+    """
+    return {
+        "event": event,
+        "store_id": str(store_id),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "data": data,
+    }
+
+
+def retry_delay(attempt: int) -> timedelta:
+    """Compute the backoff before retrying a failed attempt.
+
+    Args:
+        attempt: Number of the attempt that just failed (1-based).
+
+    Returns:
+        ``webhook_retry_base_seconds * 2 ** (attempt - 1)``, capped at
+        ``webhook_retry_max_seconds``, with ±10% jitter so retries of
+        many webhooks failing together do not arrive in lockstep.
+    """
+    seconds = min(
+        settings.webhook_retry_base_seconds * 2 ** (attempt - 1),
+        settings.webhook_retry_max_seconds,
+    )
+    return timedelta(seconds=seconds * random.uniform(0.9, 1.1))
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    host_slots: dict[str, asyncio.Semaphore],
+    attempt: DeliveryAttempt,
+) -> DeliveryResult:
+    """POST one signed attempt, waiting for a free slot on its host."""
+    body = json.dumps(attempt.payload, default=str)
+    headers = {
+        "Content-Type": "application/json",
+        "X-Webhook-Signature": f"sha256={sign_payload(body, attempt.secret)}",
+        "X-Webhook-Event": attempt.event,
+        "X-Webhook-Attempt": str(attempt.attempt),
+    }
+    async with host_slots[urlsplit(attempt.url).netloc]:
+        try:
+            resp = await client.post(
+                attempt.url,
+                content=body,
+                headers=headers,
+                timeout=settings.webhook_timeout_seconds,
+            )
+        except httpx.TimeoutException:
+            logger.warning(
+                "Webhook timeout: url=%s event=%s", attempt.url, attempt.event
+            )
+            return DeliveryResult(
+                attempt, None, f"Timeout after {settings.webhook_timeout_seconds:g}s", False
+            )
+        except Exception as exc:
+            logger.warning(
+                "Webhook delivery failed: url=%s event=%s error=%s",
+                attempt.url, attempt.event, str(exc)[:200],
+            )
+            return DeliveryResult(attempt, None, str(exc)[:1000], False)
+    return DeliveryResult(
+        attempt, resp.status_code, resp.text[:1000], 200 <= resp.status_code < 300
+    )
+
+
+async def _deliver_all(attempts: list[DeliveryAttempt]) -> list[DeliveryResult]:
+    """Send all attempts concurrently, bounded per destination host."""
+    host_slots: dict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.webhook_max_per_host)
+    )
+    client = get_async_http_client()
+    return list(
+        await asyncio.gather(*(_send(client, host_slots, a) for a in attempts))
+    )
+
+
+def deliver_all(attempts: list[DeliveryAttempt]) -> list[DeliveryResult]:
+    """Deliver attempts concurrently from synchronous (Celery) code.
+
+    Args:
+        attempts: The deliveries to make.
+
+    Returns:
+        One DeliveryResult per attempt, in the same order.
+    """
+    if not attempts:
+        return []
+    return run_async(_deliver_all(attempts))
+
+
+def subscribed_webhooks_sync(
+    session: Session, store_id: uuid.UUID, event: str
+) -> list[StoreWebhook]:
+    """Load a store's active webhooks that subscribe to an event.
+
+    The subscription check runs in PostgreSQL (JSONB containment), so
+    unrelated webhooks are never loaded.
+
+    Args:
+        session: Sync database session.
+        store_id: The store's UUID.
+        event: The event type string.
+
+    Returns:
+        List of matching StoreWebhook instances.
+    """
+    return list(
+        session.execute(
+            select(StoreWebhook).where(
+                StoreWebhook.store_id == store_id,
+                StoreWebhook.is_active.is_(True),
+                cast(StoreWebhook.events, JSONB).contains([event]),
+            )
+        ).scalars().all()
+    )
+
+
+def subscribed_webhooks_for_stores_sync(
+    session: Session, store_ids: set[uuid.UUID], event: str
+) -> list[StoreWebhook]:
+    """Load the active webhooks of several stores that subscribe to an event.
+
+    Batched form of ``subscribed_webhooks_sync`` for jobs that emit the
+    same event for many stores at once.
+
+    Args:
+        session: Sync database session.
+        store_ids: The stores' UUIDs.
+        event: The event type string.
+
+    Returns:
+        List of matching StoreWebhook instances.
+    """
+    if not store_ids:
+        return []
+    return list(
+        session.execute(
+            select(StoreWebhook).where(
+                StoreWebhook.store_id.in_(store_ids),
+                StoreWebhook.is_active.is_(True),
+                cast(StoreWebhook.events, JSONB).contains([event]),
+            )
+        ).scalars().all()
+    )
+
+
+def record_delivery_results(
+    session: Session,
+    results: list[DeliveryResult],
+    now: datetime | None = None,
+) -> tuple[int, int]:
+    """Apply delivery results to webhooks and batch-insert delivery rows.
+
+    Args:
+        session: Sync database session (not committed).
+        results: Results returned by ``deliver_all``.
+        now: Timestamp used for ``last_triggered_at`` and retry scheduling
+            (defaults to the current time).
+
+    Returns:
+        Tuple of (success_count, failure_count).
+    """
+    now = now or datetime.now(timezone.utc)
+    if not results:
+        return 0, 0
+    threshold = settings.webhook_circuit_breaker_threshold
+
+    # Per webhook: failures since its last success in this batch, and
+    # whether a success reset the count.
+    failures: dict[uuid.UUID, int] = {}
+    reset: set[uuid.UUID] = set()
+    for result in results:
+        webhook_id = result.attempt.webhook_id
+        if result.success:
+            failures[webhook_id] = 0
+            reset.add(webhook_id)
+        else:
+            failures[webhook_id] = failures.get(webhook_id, 0) + 1
+
+    outcomes = values(
+        column("id", UUID(as_uuid=True)),
+        column("failures", Integer),
+        column("reset", Boolean),
+        name="delivery_outcomes",
+    ).data([(webhook_id, n, webhook_id in reset) for webhook_id, n in failures.items()])
+    new_count = case(
+        (outcomes.c.reset, outcomes.c.failures),
+        else_=StoreWebhook.failure_count + outcomes.c.failures,
+    )
+    # Lock in a fixed order so concurrent batches cannot deadlock.
+    session.execute(
+        select(StoreWebhook.id)
+        .where(StoreWebhook.id.in_(failures))
+        .order_by(StoreWebhook.id)
+        .with_for_update()
+    )
+    counts = dict(session.execute(
+        update(StoreWebhook)
+        .where(StoreWebhook.id == outcomes.c.id)
+        .values(
+            failure_count=new_count,
+            is_active=and_(StoreWebhook.is_active, new_count < threshold),
+            last_triggered_at=now,
+        )
+        .returning(StoreWebhook.id, StoreWebhook.failure_count)
+        .execution_options(synchronize_session=False)
+    ).all())
+
+    tripped = {webhook_id for webhook_id, count in counts.items() if count >= threshold}
+    for webhook_id in tripped:
+        before = 0 if webhook_id in reset else counts[webhook_id] - failures[webhook_id]
+        if before < threshold:
+            logger.warning(
+                "Webhook auto-disabled after %d failures: id=%s",
+                counts[webhook_id], webhook_id,
+            )
+
+    rows: list[dict] = []
+    success_count = 0
+    for result in results:
+        attempt = result.attempt
+        if attempt.webhook_id not in counts:
+            continue  # webhook deleted meanwhile
+        next_retry_at = None
+        if result.success:
+            success_count += 1
+        elif attempt.webhook_id not in tripped and attempt.attempt < settings.webhook_max_attempts:
+            next_retry_at = now + retry_delay(attempt.attempt)
+        rows.append({
+            "id": uuid.uuid4(),
+            "webhook_id": attempt.webhook_id,
+            "event": attempt.event,
+            "payload": attempt.payload,
+            "response_status": result.response_status,
+            "response_body": result.response_body,
+            "success": result.success,
+            "attempt": attempt.attempt,
+            "next_retry_at": next_retry_at,
+            "created_at": now,
+        })
+
+    if rows:
+        session.execute(insert(WebhookDelivery), rows)
+    if tripped:
+        # An open breaker cancels every retry still pending for the webhook.
+        session.execute(
+            update(WebhookDelivery)
+            .where(
+                WebhookDelivery.webhook_id.in_(tripped),
+                WebhookDelivery.next_retry_at.is_not(None),
+            )
+            .values(next_retry_at=None)
+            .execution_options(synchronize_session=False)
+        )
+    return success_count, len(results) - success_count
+
+
+def claim_due_retries_sync(
+    session: Session, limit: int | None = None
+) -> dict[uuid.UUID, DeliveryAttempt]:
+    """Lease failed deliveries whose ``next_retry_at`` has passed.
+
+    Claimed rows get ``next_retry_at`` pushed forward by
+    ``settings.webhook_retry_claim_seconds``, so once the caller commits,
+    other sweeps skip them without any lock being held while they are
+    re-sent.
+
+    Args:
+        session: Sync database session (not committed).
+        limit: Maximum retries to claim (defaults to
+            ``settings.webhook_retry_batch_size``).
+
+    Returns:
+        The next attempts to make, keyed by the claimed delivery's UUID.
+    """
+    now = datetime.now(timezone.utc)
+    due = (
+        select(WebhookDelivery.id)
+        .join(StoreWebhook, StoreWebhook.id == WebhookDelivery.webhook_id)
+        .where(
+            WebhookDelivery.next_retry_at <= now,
+            StoreWebhook.is_active.is_(True),
+        )
+        .order_by(WebhookDelivery.next_retry_at)
+        .limit(limit or settings.webhook_retry_batch_size)
+        .with_for_update(of=WebhookDelivery, skip_locked=True)
+    )
+    rows = session.execute(
+        update(WebhookDelivery)
+        .where(
+            WebhookDelivery.id.in_(due.scalar_subquery()),
+            StoreWebhook.id == WebhookDelivery.webhook_id,
+        )
+        .values(next_retry_at=now + timedelta(seconds=settings.webhook_retry_claim_seconds))
+        .returning(
+            WebhookDelivery.id, StoreWebhook.id, StoreWebhook.url, StoreWebhook.secret,
+            WebhookDelivery.event, WebhookDelivery.payload, WebhookDelivery.attempt,
+        )
+        .execution_options(synchronize_session=False)
+    ).all()
+    return {
+        delivery_id: DeliveryAttempt(
+            webhook_id=webhook_id,
+            url=url,
+            secret=secret,
+            event=event,
+            payload=payload,
+            attempt=attempt + 1,
+        )
+        for delivery_id, webhook_id, url, secret, event, payload, attempt in rows
+    }
+
+
+def resend_claimed_retries_sync(
+    session: Session, claimed: dict[uuid.UUID, DeliveryAttempt]
+) -> dict:
+    """Re-send claimed retries and record their results.
+
+    Call with the claim committed; the HTTP requests are made before
+    this session touches the database again.
+
+    Args:
+        session: Sync database session (not committed).
+        claimed: Result of ``claim_due_retries_sync``.
+
+    Returns:
+        Dict with ``retried``, ``success_count``, and ``failure_count``.
+    """
+    if not claimed:
+        return {"retried": 0, "success_count": 0, "failure_count": 0}
+
+    results = deliver_all(list(claimed.values()))
+    session.execute(
+        update(WebhookDelivery)
+        .where(WebhookDelivery.id.in_(claimed))
+        .values(next_retry_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    success_count, failure_count = record_delivery_results(session, results)
+    return {
+        "retried": len(claimed),
+        "success_count": success_count,
+        "failure_count": failure_count,
+    }
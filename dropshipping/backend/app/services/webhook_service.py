@@ -41,7 +41,7 @@ import uuid
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.store import Store, StoreStatus
+from app.services.store_access_service import verify_store_ownership
 
 
 logger = logging.getLogger(__name__)
@@ -85,32 +85,6 @@ def sign_payload(payload: str | bytes, secret: str) -> str:
     ).hexdigest()
 
 
-async def _verify_store_ownership(
-    db: AsyncSession, store_id: uuid.UUID, user_id: uuid.UUID
-) -> Store:
-    """Verify that a store exists and belongs to the given user.
-
-    Args:
-        db: Async database session.
-        store_id: The UUID of the store.
-        user_id: The requesting user's UUID.
-
-    Returns:
-        The Store ORM instance.
-
-    Raises:
-        ValueError: If the store doesn't exist, is deleted, or belongs
-            to a different user.
-    """
-    result = await db.execute(select(Store).where(Store.id == store_id))
-    store = result.scalar_one_or_none()
-    if store is None or store.status == StoreStatus.deleted:
-        raise ValueError("Store not found")
-    if store.user_id != user_id:
-        raise ValueError("Store not found")
-    return store
-
-
 async def create_webhook(
     db: AsyncSession,
     store_id: uuid.UUID,
@@ -137,7 +111,7 @@ async def create_webhook(
         ValueError: If the store doesn't exist, belongs to another user,
             or the URL is empty.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     if not url or not url.strip():
         raise ValueError("Webhook URL cannot be empty")
@@ -176,7 +150,7 @@ async def list_webhooks(
     Raises:
         ValueError: If the store doesn't exist or belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(StoreWebhook)
@@ -212,7 +186,7 @@ async def update_webhook(
         ValueError: If the store or webhook doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(StoreWebhook).where(
@@ -251,7 +225,7 @@ async def delete_webhook(
         ValueError: If the store or webhook doesn't exist, or the store
             belongs to another user.
     """
-    await _verify_store_ownership(db, store_id, user_id)
+    await verify_store_ownership(db, store_id, user_id)
 
     result = await db.execute(
         select(StoreWebhook).where(
@@ -8,9 +8,14 @@ worker starts.
     - ``celery_app``: Celery configuration and Beat schedule.
     - ``db``: Synchronous session factory for task DB access.
     - ``email_tasks``: Transactional email dispatch tasks.
-    - ``webhook_tasks``: Store webhook HTTP delivery tasks.
+    - ``webhook_tasks``: Store webhook delivery and retry sweep tasks.
     - ``notification_tasks``: In-app notification creation tasks.
     - ``fraud_tasks``: Automated fraud scoring tasks.
     - ``order_tasks``: Order processing orchestration tasks.
     - ``analytics_tasks``: Periodic analytics and cleanup tasks.
+    - ``inventory_tasks``: Stock reservation expiry and hot-counter sync.
+    - ``export_tasks``: Background CSV/NDJSON export file generation.
+    - ``bulk_tasks``: Large bulk product operations with progress tracking.
+    - ``clone_tasks``: Background copies of large stores.
+    - ``currency_tasks``: Hourly exchange-rate refresh.
 """
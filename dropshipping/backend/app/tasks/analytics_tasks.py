@@ -1,20 +1,36 @@
 """Periodic analytics and maintenance Celery tasks.
 
 These tasks run on a Celery Beat schedule to aggregate analytics data
-and perform housekeeping operations like cleaning up old notifications.
+and perform housekeeping operations like cleaning up old notifications,
+repairing drift in the products' review rating aggregates, flushing
+buffered A/B test event counters, and refreshing the learned product
+recommendations.
 
 **For Developers:**
-    Both tasks are registered in the ``beat_schedule`` in
-    ``celery_app.py``. ``aggregate_daily_analytics`` runs at 2 AM UTC
-    and ``cleanup_old_notifications`` runs at 3 AM UTC. They use the
-    sync session factory and operate across all active stores.
+    All tasks are registered in the ``beat_schedule`` in
+    ``celery_app.py``. ``aggregate_daily_analytics`` runs at 2 AM UTC,
+    ``cleanup_old_notifications`` at 3 AM UTC, and
+    ``reconcile_review_stats`` at 4 AM UTC,
+    ``flush_ab_test_counters`` every 30 seconds, and
+    ``refresh_product_recommendations`` every 15 minutes. They use the
+    sync session factory. ``aggregate_daily_analytics`` delegates to
+    ``app.services.analytics_rollup_service``, which materializes the
+    ``daily_store_metrics`` and ``daily_product_metrics`` fact tables
+    read by the analytics dashboard.
 
 **For QA Engineers:**
-    - ``aggregate_daily_analytics`` computes yesterday's revenue, order
-      count, and profit per active store. Results are logged (future:
-      cached to Redis or written to an analytics table).
+    - ``aggregate_daily_analytics`` rolls every closed day after the
+      rollup watermark (backfilling a year on its first run) and reports
+      yesterday's store count and revenue. Re-running it is a no-op.
     - ``cleanup_old_notifications`` deletes read notifications older than
       90 days. Only ``is_read=True`` notifications are removed.
+    - ``reconcile_review_stats`` recounts approved reviews per product and
+      overwrites rating aggregates that drifted; a healthy run corrects 0.
+    - ``flush_ab_test_counters`` adds the impressions, conversions, and
+      revenue recorded since its last run to the A/B test variants.
+    - ``refresh_product_recommendations`` counts the orders paid since
+      its last run into the co-purchase matrix and re-ranks the affected
+      products' recommendations (``recommendation_service``).
 
 **For Project Managers:**
     These tasks automate daily analytics rollups (Feature 13 enhancement)
@@ -29,9 +45,8 @@ and perform housekeeping operations like cleaning up old notifications.
 
 import logging
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 
-from sqlalchemy import delete, func
+from sqlalchemy import delete
 
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
@@ -43,78 +58,47 @@ logger = logging.getLogger(__name__)
     name="app.tasks.analytics_tasks.aggregate_daily_analytics",
 )
 def aggregate_daily_analytics() -> dict:
-    """Aggregate yesterday's revenue, orders, and profit for each active store.
+    """Materialize daily analytics rollups for every closed day.
 
-    Runs daily at 2 AM UTC via Celery Beat. Currently logs results;
-    future versions will write to a Redis cache or analytics table for
-    faster dashboard queries.
+    Runs daily at 2 AM UTC via Celery Beat. Rolls all days after the
+    rollup watermark through yesterday for every store at once with
+    set-based ``INSERT ... SELECT ... GROUP BY`` statements, then reports
+    yesterday's totals.
 
     Returns:
-        Dict with ``stores_processed``, ``date``, and ``total_revenue``
-        keys.
+        Dict with ``stores_processed`` (stores with revenue yesterday),
+        ``date``, ``total_revenue``, and ``days_rolled`` keys.
     """
-    from app.models.order import Order, OrderStatus
-    from app.models.store import Store, StoreStatus
+    from app.services.analytics_rollup_service import (
+        rollup_closed_days_sync,
+        summarize_day_sync,
+    )
 
     session = SyncSessionFactory()
     try:
-        yesterday_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=1)
-        yesterday_end = yesterday_start + timedelta(days=1)
-
-        # Get all active stores
-        stores = (
-            session.query(Store)
-            .filter(Store.status == StoreStatus.active)
-            .all()
-        )
-
-        total_platform_revenue = Decimal("0")
-        stores_processed = 0
-
-        for store in stores:
-            # Revenue from paid/shipped/delivered orders yesterday
-            result = (
-                session.query(
-                    func.count(Order.id).label("order_count"),
-                    func.coalesce(func.sum(Order.total), 0).label("revenue"),
-                )
-                .filter(
-                    Order.store_id == store.id,
-                    Order.status.in_([
-                        OrderStatus.paid,
-                        OrderStatus.shipped,
-                        OrderStatus.delivered,
-                    ]),
-                    Order.created_at >= yesterday_start,
-                    Order.created_at < yesterday_end,
-                )
-                .first()
-            )
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
 
-            order_count = result.order_count if result else 0
-            revenue = Decimal(str(result.revenue)) if result else Decimal("0")
-            total_platform_revenue += revenue
-            stores_processed += 1
+        rolled = rollup_closed_days_sync(session, today)
+        session.commit()
+        days_rolled = (rolled[1] - rolled[0]).days + 1 if rolled else 0
 
-            if order_count > 0:
-                logger.info(
-                    "ANALYTICS: store=%s (%s) orders=%d revenue=$%s",
-                    str(store.id)[:8], store.name, order_count, revenue,
-                )
+        stores_processed, total_revenue = summarize_day_sync(session, yesterday)
 
-        date_str = yesterday_start.strftime("%Y-%m-%d")
+        date_str = yesterday.strftime("%Y-%m-%d")
         logger.info(
-            "Daily analytics aggregation complete: date=%s stores=%d total_revenue=$%s",
-            date_str, stores_processed, total_platform_revenue,
+            "Daily analytics rollup complete: date=%s days_rolled=%d stores=%d "
+            "total_revenue=$%s",
+            date_str, days_rolled, stores_processed, total_revenue,
         )
         return {
             "stores_processed": stores_processed,
             "date": date_str,
-            "total_revenue": str(total_platform_revenue),
+            "total_revenue": str(total_revenue),
+            "days_rolled": days_rolled,
         }
     except Exception as exc:
+        session.rollback()
         logger.error("aggregate_daily_analytics failed: %s", exc)
         return {"error": str(exc)}
     finally:
@@ -159,3 +143,114 @@ def cleanup_old_notifications() -> dict:
         return {"error": str(exc)}
     finally:
         session.close()
+
+
+@celery_app.task(
+    name="app.tasks.analytics_tasks.reconcile_review_stats",
+)
+def reconcile_review_stats() -> dict:
+    """Repair drift in the products' incremental rating aggregates.
+
+    Runs daily at 4 AM UTC via Celery Beat. Walks every product in keyset
+    batches of ``review_service.reconcile_rating_stats_sync``, committing
+    each batch.
+
+    Returns:
+        Dict with ``products`` (checked) and ``corrected`` counts.
+    """
+    from app.services.review_service import reconcile_rating_stats_sync
+
+    session = SyncSessionFactory()
+    totals = {"products": 0, "corrected": 0}
+    cursor = None
+    try:
+        while True:
+            batch = reconcile_rating_stats_sync(session, after_product_id=cursor)
+            session.commit()
+            totals["products"] += batch["products"]
+            totals["corrected"] += batch["corrected"]
+            cursor = batch["last_product_id"]
+            if cursor is None:
+                break
+
+        if totals["corrected"]:
+            logger.warning(
+                "Review stats reconcile: corrected %d of %d products",
+                totals["corrected"], totals["products"],
+            )
+        return totals
+    except Exception as exc:
+        session.rollback()
+        logger.error("reconcile_review_stats failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
+
+
+@celery_app.task(
+    name="app.tasks.analytics_tasks.flush_ab_test_counters",
+)
+def flush_ab_test_counters() -> dict:
+    """Move buffered A/B test event counts into the variant rows.
+
+    Runs every 30 seconds via Celery Beat. Drains the pending counters
+    from Redis, adds them to the variants with one batched UPDATE, and
+    discards them only after the commit, so a failed flush is retried
+    by the next run.
+
+    Returns:
+        Dict with the number of ``variants`` updated.
+    """
+    from app.services.ab_test_service import (
+        ack_event_counters_sync,
+        apply_event_counters_sync,
+        drain_event_counters_sync,
+    )
+
+    session = SyncSessionFactory()
+    try:
+        counters = drain_event_counters_sync()
+        updated = apply_event_counters_sync(session, counters)
+        session.commit()
+        if counters:
+            ack_event_counters_sync()
+        return {"variants": updated}
+    except Exception as exc:
+        session.rollback()
+        logger.error("flush_ab_test_counters failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
+
+
+@celery_app.task(
+    name="app.tasks.analytics_tasks.refresh_product_recommendations",
+)
+def refresh_product_recommendations() -> dict:
+    """Fold newly paid orders into the learned recommendations.
+
+    Runs every 15 minutes via Celery Beat; see
+    ``recommendation_service.refresh_recommendations_sync``.
+
+    Returns:
+        Dict with ``cells`` and ``products`` counts, or ``error`` on
+        failure.
+    """
+    from app.services.recommendation_service import refresh_recommendations_sync
+
+    session = SyncSessionFactory()
+    try:
+        counts = refresh_recommendations_sync(session)
+        session.commit()
+        if counts["products"]:
+            logger.info(
+                "Recommendations refreshed: cells=%d products=%d",
+                counts["cells"], counts["products"],
+            )
+        return counts
+    except Exception as exc:
+        session.rollback()
+        logger.error("refresh_product_recommendations failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
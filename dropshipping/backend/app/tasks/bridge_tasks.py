@@ -1,15 +1,22 @@
-"""ServiceBridge platform event dispatch Celery task.
+"""ServiceBridge platform event delivery Celery tasks.
 
 Delivers platform lifecycle events (product.created, order.shipped, etc.) to
 connected SaaS microservices via HMAC-signed HTTP POST requests. Each delivery
 attempt is recorded as a ``BridgeDelivery`` row for dashboard visibility.
 
 **For Developers:**
-    The task queries ``ServiceIntegration`` for the user's active services,
-    filters by ``EVENT_SERVICE_MAP``, and delivers the event payload via
-    sync ``httpx.Client``. Uses ``SyncSessionFactory`` (psycopg2) because
-    Celery workers run synchronously. Follow the same pattern as
-    ``webhook_tasks.py``.
+    ``drain_platform_events`` is the main path: it drains the bridge Redis
+    Stream in batches through ``bridge_delivery_service`` (one bulk POST
+    per service and chunk, services in parallel), commits the delivery
+    rows, and only then acknowledges the stream entries. It is kicked by
+    ``publish_platform_event`` and also runs from Beat as a safety net.
+
+    ``dispatch_platform_event`` is the per-event fallback used when Redis
+    is unavailable. It queries ``ServiceIntegration`` for the user's
+    active services, filters by ``EVENT_SERVICE_MAP``, and delivers the
+    event payload via sync ``httpx.Client``. Both use
+    ``SyncSessionFactory`` (psycopg2) because Celery workers run
+    synchronously.
 
 **For QA Engineers:**
     - ``EVENT_SERVICE_MAP`` defines which events go to which services.
@@ -17,6 +24,7 @@ attempt is recorded as a ``BridgeDelivery`` row for dashboard visibility.
     - A delivery is successful when the service responds with HTTP 2xx.
     - Each dispatch creates one ``BridgeDelivery`` row per matched service.
     - If no integrations match, the task returns early with zero counts.
+    - Only one drain runs at a time; overlapping runs return ``skipped``.
 
 **For Project Managers:**
     This is the core "glue" that automatically notifies connected AI tools
@@ -38,48 +46,13 @@ from datetime import datetime, timezone
 import httpx
 
 from app.models.service_integration import ServiceName
+from app.services.bridge_delivery_service import EVENT_SERVICE_MAP
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
 
 logger = logging.getLogger(__name__)
 
 
-# ---------------------------------------------------------------------------
-# Event-to-service mapping
-# ---------------------------------------------------------------------------
-
-EVENT_SERVICE_MAP: dict[str, list[ServiceName]] = {
-    "product.created": [
-        ServiceName.contentforge,
-        ServiceName.rankpilot,
-        ServiceName.trendscout,
-        ServiceName.postpilot,
-        ServiceName.adscale,
-        ServiceName.shopchat,
-    ],
-    "product.updated": [
-        ServiceName.contentforge,
-        ServiceName.rankpilot,
-        ServiceName.shopchat,
-    ],
-    "order.created": [
-        ServiceName.flowsend,
-        ServiceName.spydrop,
-    ],
-    "order.shipped": [
-        ServiceName.flowsend,
-    ],
-    "customer.created": [
-        ServiceName.flowsend,
-    ],
-}
-"""Maps platform event names to the list of services that should be notified.
-
-Each service in the list will receive an HTTP POST when the corresponding
-event fires, provided the user has an active integration for that service.
-"""
-
-
 # ---------------------------------------------------------------------------
 # Service base URL lookup (mirrors SERVICE_CATALOG)
 # ---------------------------------------------------------------------------
@@ -277,3 +250,75 @@ def dispatch_platform_event(
         raise self.retry(exc=exc)
     finally:
         session.close()
+
+
+@celery_app.task(
+    name="app.tasks.bridge_tasks.drain_platform_events",
+)
+def drain_platform_events() -> dict:
+    """Deliver queued platform events from the bridge stream in batches.
+
+    Processes up to ``settings.bridge_max_batches_per_drain`` batches,
+    committing the delivery rows of each batch before acknowledging its
+    stream entries.
+
+    Returns:
+        Dict with ``batches``, ``events``, ``deliveries``,
+        ``success_count``, and ``failure_count``; ``status="skipped"`` if
+        another drain holds the lock; or ``error`` on failure.
+    """
+    from redis.exceptions import RedisError
+
+    from app.config import settings
+    from app.redis_client import get_sync_redis
+    from app.services.bridge_delivery_service import (
+        ack_platform_events,
+        drain_batch_sync,
+        drain_lock,
+        ensure_consumer_group,
+        release_drain_lock,
+    )
+
+    totals = {
+        "batches": 0,
+        "events": 0,
+        "deliveries": 0,
+        "success_count": 0,
+        "failure_count": 0,
+    }
+    try:
+        redis = get_sync_redis()
+        lock = drain_lock(redis)
+        if not lock.acquire(blocking=False):
+            return {"status": "skipped", "reason": "Drain already running"}
+    except RedisError as exc:
+        logger.warning("drain_platform_events skipped: %s", exc)
+        return {"error": str(exc)}
+
+    session = SyncSessionFactory()
+    try:
+        ensure_consumer_group(redis)
+        for _ in range(settings.bridge_max_batches_per_drain):
+            batch = drain_batch_sync(session, redis)
+            if batch is None:
+                break
+            session.commit()
+            ack_platform_events(redis, batch.pop("entry_ids"))
+            totals["batches"] += 1
+            for key, value in batch.items():
+                totals[key] += value
+
+        if totals["batches"]:
+            logger.info(
+                "Bridge drain: batches=%d events=%d deliveries=%d success=%d failed=%d",
+                totals["batches"], totals["events"], totals["deliveries"],
+                totals["success_count"], totals["failure_count"],
+            )
+        return totals
+    except Exception as exc:
+        session.rollback()
+        logger.error("drain_platform_events failed: %s", exc)
+        return {**totals, "error": str(exc)}
+    finally:
+        session.close()
+        release_drain_lock(lock)
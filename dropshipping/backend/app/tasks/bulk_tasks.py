@@ -0,0 +1,119 @@
+"""Background bulk product operation Celery tasks.
+
+Applies bulk updates, archives, and price adjustments that are too large
+to run inside the API request.
+
+**For Developers:**
+    ``run_bulk_job`` is dispatched by the ``/stores/{store_id}/bulk/*``
+    endpoints after the ``BulkJob`` row is committed, whenever a request
+    names more than ``settings.bulk_job_threshold`` products. Each chunk
+    is applied with ``bulk_service.apply_bulk_chunk_sync`` and committed
+    together with the job's progress counters, so a crash loses at most
+    one chunk of progress. One batched webhook is sent when the job
+    finishes. If a chunk fails, the job is marked ``failed`` and the
+    webhook (and category tree invalidation) still covers the products
+    of the chunks already committed, the first ``processed`` ids.
+
+**For QA Engineers:**
+    - The job moves to ``running`` before the first chunk and to
+      ``completed`` or ``failed`` (with ``error_message``) at the end.
+    - ``processed`` increases by up to ``BULK_CHUNK_SIZE`` per chunk.
+    - Jobs that are not ``pending`` are skipped, so a redelivered task
+      does not apply the operation twice.
+
+**For Project Managers:**
+    Merchants can reprice or archive thousands of products in one action.
+
+**For End Users:**
+    Large bulk edits keep running after you leave the page; check the
+    job's progress to see when they are done.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from app.tasks.celery_app import celery_app
+from app.tasks.db import SyncSessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.bulk_tasks.run_bulk_job",
+)
+def run_bulk_job(job_id: str) -> dict:
+    """Apply a background bulk job chunk by chunk.
+
+    Args:
+        job_id: UUID string of the BulkJob.
+
+    Returns:
+        Dict with ``status`` and, on success, ``succeeded`` and ``failed``.
+    """
+    from app.models.bulk_job import BulkJob, BulkJobStatus
+    from app.services.bulk_service import (
+        BulkOperation,
+        apply_bulk_chunk_sync,
+        bulk_chunks,
+        notify_bulk_change,
+    )
+
+    session = SyncSessionFactory()
+    try:
+        job = session.query(BulkJob).filter(BulkJob.id == uuid.UUID(job_id)).first()
+        if not job:
+            return {"status": "skipped", "reason": "Bulk job not found"}
+        if job.status != BulkJobStatus.pending:
+            return {"status": "skipped", "reason": f"Bulk job is {job.status.value}"}
+
+        job.status = BulkJobStatus.running
+        session.commit()
+
+        operation = BulkOperation(job.operation)
+        product_ids = [uuid.UUID(pid) for pid in job.product_ids]
+        errors: list[dict] = []
+        for chunk in bulk_chunks(product_ids):
+            chunk_errors = apply_bulk_chunk_sync(
+                session, operation, job.store_id, chunk, job.params
+            )
+            errors.extend(chunk_errors)
+            job.processed += len(chunk)
+            job.succeeded += len(chunk) - len(chunk_errors)
+            job.failed += len(chunk_errors)
+            job.errors = list(errors)
+            session.commit()
+
+        job.status = BulkJobStatus.completed
+        job.completed_at = datetime.now(timezone.utc)
+        session.commit()
+
+        notify_bulk_change(job.store_id, operation, product_ids, errors)
+        logger.info(
+            "BULK: job=%s op=%s succeeded=%d failed=%d",
+            job_id[:8], operation.value, job.succeeded, job.failed,
+        )
+        return {"status": "completed", "succeeded": job.succeeded, "failed": job.failed}
+    except Exception as exc:
+        session.rollback()
+        logger.error("run_bulk_job failed: %s", exc)
+        job = session.query(BulkJob).filter(BulkJob.id == uuid.UUID(job_id)).first()
+        if job:
+            job.status = BulkJobStatus.failed
+            job.error_message = str(exc)[:1000]
+            job.completed_at = datetime.now(timezone.utc)
+            session.commit()
+            if job.processed:
+                # The chunks committed before the failure did change products.
+                try:
+                    notify_bulk_change(
+                        job.store_id,
+                        BulkOperation(job.operation),
+                        [uuid.UUID(pid) for pid in job.product_ids[: job.processed]],
+                        job.errors or [],
+                    )
+                except Exception as notify_exc:
+                    logger.error("run_bulk_job notify failed: %s", notify_exc)
+        return {"status": "failed", "error": str(exc)}
+    finally:
+        session.close()
@@ -19,10 +19,24 @@ from anywhere in the codebase.
         celery -A app.tasks.celery_app beat --loglevel=info
 
 **For QA Engineers:**
-    The Beat schedule defines three periodic tasks:
+    The Beat schedule defines these periodic tasks:
     - ``aggregate-daily-analytics``: Runs at 2:00 AM UTC daily.
     - ``cleanup-old-notifications``: Runs at 3:00 AM UTC daily.
+    - ``reconcile-review-stats``: Runs at 4:00 AM UTC daily.
     - ``check-fulfillment-status``: Runs every 30 minutes.
+    - ``release-expired-reservations``: Runs every minute.
+    - ``reconcile-hot-stock-counters``: Runs every 5 minutes.
+    - ``retry-webhook-deliveries``: Runs every 30 seconds.
+    - ``drain-platform-events``: Runs every 15 seconds (publishing an
+      event also schedules a drain within seconds).
+    - ``flush-email-outbox``: Runs every 30 seconds (queueing an email
+      also schedules a flush within seconds).
+    - ``refresh-exchange-rates``: Runs hourly at five past the hour.
+    - ``flush-ab-test-counters``: Runs every 30 seconds.
+    - ``sweep-domain-health``: Runs every minute.
+    - ``sync-supplier-catalogs``: Runs hourly at twenty past the hour.
+    - ``refresh-product-recommendations``: Runs every 15 minutes.
+    - ``expire-exports``: Runs hourly at twenty to the hour.
 
 **For Project Managers:**
     Celery handles all background processing: sending emails, delivering
@@ -60,10 +74,58 @@ celery_app.conf.update(
             "task": "app.tasks.analytics_tasks.cleanup_old_notifications",
             "schedule": crontab(hour=3, minute=0),
         },
+        "reconcile-review-stats": {
+            "task": "app.tasks.analytics_tasks.reconcile_review_stats",
+            "schedule": crontab(hour=4, minute=0),
+        },
         "check-fulfillment-status": {
             "task": "app.tasks.order_tasks.check_fulfillment_status",
             "schedule": crontab(minute="*/30"),
         },
+        "release-expired-reservations": {
+            "task": "app.tasks.inventory_tasks.release_expired_reservations",
+            "schedule": 60.0,
+        },
+        "reconcile-hot-stock-counters": {
+            "task": "app.tasks.inventory_tasks.reconcile_hot_stock_counters",
+            "schedule": 300.0,
+        },
+        "retry-webhook-deliveries": {
+            "task": "app.tasks.webhook_tasks.retry_webhook_deliveries",
+            "schedule": 30.0,
+        },
+        "drain-platform-events": {
+            "task": "app.tasks.bridge_tasks.drain_platform_events",
+            "schedule": 15.0,
+        },
+        "flush-email-outbox": {
+            "task": "app.tasks.email_tasks.flush_email_outbox",
+            "schedule": 30.0,
+        },
+        "refresh-exchange-rates": {
+            "task": "app.tasks.currency_tasks.refresh_exchange_rates",
+            "schedule": crontab(minute=5),
+        },
+        "flush-ab-test-counters": {
+            "task": "app.tasks.analytics_tasks.flush_ab_test_counters",
+            "schedule": 30.0,
+        },
+        "sweep-domain-health": {
+            "task": "app.tasks.domain_tasks.sweep_domain_health",
+            "schedule": 60.0,
+        },
+        "sync-supplier-catalogs": {
+            "task": "app.tasks.supplier_tasks.sync_supplier_catalogs",
+            "schedule": crontab(minute=20),
+        },
+        "refresh-product-recommendations": {
+            "task": "app.tasks.analytics_tasks.refresh_product_recommendations",
+            "schedule": crontab(minute="*/15"),
+        },
+        "expire-exports": {
+            "task": "app.tasks.export_tasks.expire_exports",
+            "schedule": crontab(minute=40),
+        },
     },
 )
 
@@ -0,0 +1,114 @@
+"""Background store clone Celery tasks.
+
+Copies the catalog of large stores into their clone outside the API
+request.
+
+**For Developers:**
+    ``clone_store_contents`` is dispatched by
+    ``POST /stores/{store_id}/clone`` after the paused target store and
+    its ``StoreCloneJob`` are committed. The clone steps from
+    ``clone_service.clone_store_contents_sync`` run in one transaction on
+    a dedicated session, so a failure leaves the target store empty
+    rather than half-copied. Step progress is committed on the job
+    through a second session while that transaction is still open.
+
+**For QA Engineers:**
+    - The job moves to ``running`` before the first step and to
+      ``completed`` or ``failed`` (with ``error_message``) at the end.
+    - ``completed_steps`` reaches ``total_steps`` on success and the
+      target store becomes ``active``.
+    - Jobs that are not ``pending`` are skipped, so a redelivered task
+      does not clone twice.
+
+**For Project Managers:**
+    Merchants can clone stores with tens of thousands of products.
+
+**For End Users:**
+    Large store clones finish in the background; the new store goes live
+    automatically once the copy is complete.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from app.tasks.celery_app import celery_app
+from app.tasks.db import SyncSessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.clone_tasks.clone_store_contents",
+)
+def clone_store_contents(job_id: str) -> dict:
+    """Copy a store's contents into the target store of a clone job.
+
+    Args:
+        job_id: UUID string of the StoreCloneJob.
+
+    Returns:
+        Dict with ``status`` and, on success, the target ``store_id``.
+    """
+    from app.models.store import Store, StoreStatus
+    from app.models.store_clone_job import CloneJobStatus, StoreCloneJob
+    from app.services.clone_service import clone_store_contents_sync
+    from app.services.storefront_routing_service import publish_store_route
+
+    session = SyncSessionFactory()
+    try:
+        job = (
+            session.query(StoreCloneJob)
+            .filter(StoreCloneJob.id == uuid.UUID(job_id))
+            .first()
+        )
+        if not job:
+            return {"status": "skipped", "reason": "Clone job not found"}
+        if job.status != CloneJobStatus.pending:
+            return {"status": "skipped", "reason": f"Clone job is {job.status.value}"}
+
+        job.status = CloneJobStatus.running
+        session.commit()
+
+        def record_step(name: str, done: int) -> None:
+            job.current_step = name
+            job.completed_steps = done
+            session.commit()
+
+        work = SyncSessionFactory()
+        try:
+            clone_store_contents_sync(
+                work, job.source_store_id, job.store_id, on_step=record_step
+            )
+            store = work.query(Store).filter(Store.id == job.store_id).first()
+            store.status = StoreStatus.active
+            publish_store_route(work, store)
+            work.commit()
+        except Exception:
+            work.rollback()
+            raise
+        finally:
+            work.close()
+
+        job.status = CloneJobStatus.completed
+        job.completed_at = datetime.now(timezone.utc)
+        session.commit()
+
+        logger.info("CLONE: job=%s store=%s", job_id[:8], str(job.store_id)[:8])
+        return {"status": "completed", "store_id": str(job.store_id)}
+    except Exception as exc:
+        session.rollback()
+        logger.error("clone_store_contents failed: %s", exc)
+        job = (
+            session.query(StoreCloneJob)
+            .filter(StoreCloneJob.id == uuid.UUID(job_id))
+            .first()
+        )
+        if job:
+            job.status = CloneJobStatus.failed
+            job.error_message = str(exc)[:1000]
+            job.completed_at = datetime.now(timezone.utc)
+            session.commit()
+        return {"status": "failed", "error": str(exc)}
+    finally:
+        session.close()
@@ -0,0 +1,61 @@
+"""Exchange-rate refresh Celery task.
+
+Fetches exchange rates from the configured rate source and publishes them
+to Redis, where every API process picks them up on its next conversion.
+
+**For Developers:**
+    ``refresh_exchange_rates`` is a Beat task registered in
+    ``celery_app.py`` (hourly). It wraps
+    ``currency_service.refresh_exchange_rates_sync``; a snapshot is only
+    written when the rates changed, so unchanged refreshes do not make
+    the API processes reload.
+
+**For QA Engineers:**
+    - A failing source or Redis outage is retried; the previous snapshot
+      stays live meanwhile.
+    - Run the task by hand after editing the ``file`` source's JSON.
+
+**For Project Managers:**
+    Storefront prices in other currencies follow market rates within the
+    hour.
+
+**For End Users:**
+    Converted prices are kept up to date automatically.
+"""
+
+import logging
+
+from redis.exceptions import RedisError
+
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.currency_tasks.refresh_exchange_rates",
+    max_retries=3,
+    default_retry_delay=120,
+)
+def refresh_exchange_rates(self) -> dict:
+    """Fetch the latest exchange rates and publish them if they changed.
+
+    Returns:
+        Dict with the live ``version``, whether it ``changed``, and the
+        number of ``currencies`` covered.
+    """
+    from app.services.currency_service import refresh_exchange_rates_sync
+
+    try:
+        result = refresh_exchange_rates_sync()
+    except (OSError, ValueError, RedisError) as exc:
+        logger.error("refresh_exchange_rates failed: %s", exc)
+        raise self.retry(exc=exc)
+
+    if result["changed"]:
+        logger.info(
+            "CURRENCY: published exchange rates version=%s currencies=%d",
+            result["version"], result["currencies"],
+        )
+    return result
@@ -0,0 +1,76 @@
+"""Custom domain health Celery tasks.
+
+Keeps the verification and DNS state of custom domains current without
+waiting for the store owner to open the domain settings page.
+
+**For Developers:**
+    ``sweep_domain_health`` (Beat, every minute) leases the domains whose
+    ``dns_next_check_at`` has passed with
+    ``dns_management_service.claim_due_domains_sync`` and commits the
+    lease. ``check_claimed_domains_sync`` then runs their propagation
+    checks concurrently through the worker's event loop
+    (``app.http_client.run_async``) with no transaction open, stores the
+    results, and schedules each domain's next check with exponential
+    backoff while it keeps failing.
+
+**For QA Engineers:**
+    - A pending domain becomes verified within a minute of its TXT
+      record resolving, and its storefront starts answering on the
+      custom domain.
+    - ``GET /stores/{id}/domain/dns/status`` reports the sweep's last
+      result and ``checked_at`` without waiting for DNS lookups.
+    - Domains that keep failing are re-checked less and less often, up
+      to ``settings.domain_health_retry_max_seconds`` apart.
+
+**For Project Managers:**
+    Merchants no longer have to click "verify" repeatedly while DNS
+    propagates; the platform finishes the setup as soon as it can.
+
+**For End Users:**
+    After adding the DNS records for your domain, your store goes live on
+    it automatically once the records are visible on the internet.
+"""
+
+import logging
+
+from app.tasks.celery_app import celery_app
+from app.tasks.db import SyncSessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.domain_tasks.sweep_domain_health",
+)
+def sweep_domain_health() -> dict:
+    """Re-check custom domains whose next health check is due (Beat task).
+
+    Returns:
+        Dict with ``checked``, ``verified``, ``propagated``, ``failing``,
+        and ``ssl_expired`` counts, or ``error`` on failure.
+    """
+    from app.services.dns_management_service import (
+        check_claimed_domains_sync,
+        claim_due_domains_sync,
+    )
+
+    session = SyncSessionFactory()
+    try:
+        claimed = claim_due_domains_sync(session)
+        session.commit()
+        counts = check_claimed_domains_sync(session, claimed)
+        session.commit()
+        if counts["checked"]:
+            logger.info(
+                "Domain health: checked=%d verified=%d propagated=%d failing=%d "
+                "ssl_expired=%d",
+                counts["checked"], counts["verified"], counts["propagated"],
+                counts["failing"], counts["ssl_expired"],
+            )
+        return counts
+    except Exception as exc:
+        session.rollback()
+        logger.error("sweep_domain_health failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
@@ -11,10 +11,16 @@ delegates to ``EmailService`` for rendering and sending.
     serialization). Tasks retry up to 3 times on failure with a 30-second
     delay between attempts.
 
+    Outside dev mode each task renders its email and queues it in the
+    outbox of ``email_delivery_service``. ``flush_email_outbox`` sends
+    the queued emails in batches over pooled SMTP connections; it is
+    scheduled by the first email of every batch window and also runs
+    from Beat every 30 seconds to pick up retries.
+
 **For QA Engineers:**
     - In dev mode, emails are logged to stdout (not actually sent).
     - Tasks return a dict with ``status`` ("sent" or "skipped") and
-      the recipient ``email``.
+      the recipient ``email``. "sent" means handed to the outbox.
     - If the entity is not found, the task returns ``status: "skipped"``
       without raising an error or retrying.
 
@@ -39,13 +45,16 @@ logger = logging.getLogger(__name__)
 
 
 def _get_email_service():
-    """Lazy-import EmailService to avoid circular imports.
+    """Lazy-import the EmailService singleton to avoid circular imports.
+
+    The singleton shares the process-wide compiled template cache, so
+    templates are not reparsed for every task.
 
     Returns:
-        An ``EmailService`` instance.
+        The ``EmailService`` instance.
     """
-    from app.services.email_service import EmailService
-    return EmailService()
+    from app.services.email_service import email_service
+    return email_service
 
 
 @celery_app.task(
@@ -91,7 +100,12 @@ def send_order_confirmation(self, order_id: str) -> dict:
                 for item in order.items
             ],
         }
-        svc._render_template("order_confirmation.html", context)
+        svc.send_email_sync(
+            to=order.customer_email,
+            subject=f"Order Confirmation - {store.name} (#{str(order.id)[:8]})",
+            template_name="order_confirmation.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: order_confirmation to=%s order=%s store=%s",
             order.customer_email, order_id[:8], store.name,
@@ -140,7 +154,12 @@ def send_order_shipped(self, order_id: str, tracking_number: str | None = None)
             "customer_email": order.customer_email,
             "tracking_number": tracking_number or order.tracking_number,
         }
-        svc._render_template("order_shipped.html", context)
+        svc.send_email_sync(
+            to=order.customer_email,
+            subject=f"Your Order Has Shipped - {store.name}",
+            template_name="order_shipped.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: order_shipped to=%s order=%s tracking=%s",
             order.customer_email, order_id[:8], tracking_number,
@@ -187,7 +206,12 @@ def send_order_delivered(self, order_id: str) -> dict:
             "order_id": str(order.id),
             "customer_email": order.customer_email,
         }
-        svc._render_template("order_delivered.html", context)
+        svc.send_email_sync(
+            to=order.customer_email,
+            subject=f"Your Order Has Been Delivered - {store.name}",
+            template_name="order_delivered.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: order_delivered to=%s order=%s",
             order.customer_email, order_id[:8],
@@ -236,7 +260,12 @@ def send_refund_notification(self, refund_id: str) -> dict:
             "customer_email": refund.customer_email,
             "reason": refund.reason.value if hasattr(refund.reason, "value") else str(refund.reason),
         }
-        svc._render_template("refund_notification.html", context)
+        svc.send_email_sync(
+            to=refund.customer_email,
+            subject=f"Refund Processed - {store.name}",
+            template_name="refund_notification.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: refund_notification to=%s refund=%s amount=%s",
             refund.customer_email, refund_id[:8], refund.amount,
@@ -288,7 +317,12 @@ def send_welcome_email(self, customer_id: str, store_id: str) -> dict:
             "customer_name": customer.name or customer.email,
             "customer_email": customer.email,
         }
-        svc._render_template("welcome.html", context)
+        svc.send_email_sync(
+            to=customer.email,
+            subject=f"Welcome to {store.name}!",
+            template_name="welcome.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: welcome to=%s store=%s",
             customer.email, store.name,
@@ -335,7 +369,12 @@ def send_password_reset(self, email: str, reset_token: str, store_id: str | None
             "reset_url": f"/reset-password?token={reset_token}",
             "email": email,
         }
-        svc._render_template("password_reset.html", context)
+        svc.send_email_sync(
+            to=email,
+            subject=f"Password Reset - {store_name}",
+            template_name="password_reset.html",
+            context=context,
+        )
         logger.info("EMAIL: password_reset to=%s", email)
         return {"status": "sent", "email": email}
     except Exception as exc:
@@ -382,7 +421,12 @@ def send_gift_card_email(self, gift_card_id: str) -> dict:
             "balance": str(gc.initial_balance),
             "customer_email": gc.customer_email,
         }
-        svc._render_template("gift_card.html", context)
+        svc.send_email_sync(
+            to=gc.customer_email,
+            subject=f"You've Received a Gift Card from {store.name}!",
+            template_name="gift_card.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: gift_card to=%s code=%s",
             gc.customer_email, gc.code[:6],
@@ -436,7 +480,12 @@ def send_team_invite(self, invite_id: str, store_id: str) -> dict:
             "invite_url": f"/accept-invite?token={invite.token}",
             "token": invite.token,
         }
-        svc._render_template("team_invite.html", context)
+        svc.send_email_sync(
+            to=invite.email,
+            subject=f"You've Been Invited to Join {store.name}",
+            template_name="team_invite.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: team_invite to=%s store=%s role=%s",
             invite.email, store.name, invite.role,
@@ -490,7 +539,12 @@ def send_low_stock_alert(self, store_id: str, product_id: str, variant_id: str)
             "variant_name": variant.name if variant else "Unknown Variant",
             "inventory_count": variant.inventory_count if variant else 0,
         }
-        svc._render_template("low_stock_alert.html", context)
+        svc.send_email_sync(
+            to=owner.email,
+            subject=f"Low Stock Alert - {store.name}",
+            template_name="low_stock_alert.html",
+            context=context,
+        )
         logger.info(
             "EMAIL: low_stock_alert to=%s product=%s variant=%s stock=%d",
             owner.email, product_id[:8], variant_id[:8],
@@ -502,3 +556,34 @@ def send_low_stock_alert(self, store_id: str, product_id: str, variant_id: str)
         raise self.retry(exc=exc)
     finally:
         session.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.email_tasks.flush_email_outbox",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def flush_email_outbox(self) -> dict:
+    """Send every queued email in batches over the worker's SMTP pool.
+
+    Returns:
+        Dict with ``batches``, ``sent``, ``requeued``, and ``dropped``
+        counts.
+    """
+    from redis.exceptions import RedisError
+
+    from app.services.email_delivery_service import flush_outbox_sync
+
+    try:
+        result = flush_outbox_sync()
+    except RedisError as exc:
+        logger.error("flush_email_outbox failed: %s", exc)
+        raise self.retry(exc=exc)
+
+    if result["batches"]:
+        logger.info(
+            "EMAIL: outbox flushed batches=%d sent=%d requeued=%d dropped=%d",
+            result["batches"], result["sent"], result["requeued"], result["dropped"],
+        )
+    return result
@@ -0,0 +1,216 @@
+"""Background data export Celery tasks.
+
+Writes large store exports to files so the dashboard does not have to
+keep a download open for the whole export.
+
+**For Developers:**
+    ``generate_export`` is dispatched by
+    ``POST /stores/{store_id}/exports/{dataset}/jobs`` after the
+    ``ExportJob`` row is committed. It streams rows through
+    ``export_service.write_export_sync`` (server-side cursor, batched)
+    into a temporary file under ``settings.export_dir`` and renames it
+    into place, so a partially written file is never downloadable.
+
+    ``expire_exports`` runs hourly via Celery Beat. It deletes the files
+    of jobs completed more than ``settings.export_retention_hours`` ago,
+    moves those jobs to ``expired`` and clears ``file_path``, and removes
+    ``.part`` files left behind by workers that died mid-export.
+
+**For QA Engineers:**
+    - The job moves to ``running`` before the export starts and to
+      ``completed`` (with ``row_count`` and ``file_path``) or ``failed``
+      (with ``error_message``) at the end.
+    - Jobs that are not ``pending`` are skipped, so a redelivered task
+      does not export twice.
+    - After the retention period the file is gone and the job reports
+      ``expired``; a file that was already missing does not stop the
+      sweep.
+
+**For Project Managers:**
+    Very large stores can export years of orders without timeouts, and
+    old export files do not pile up on the worker's disk.
+
+**For End Users:**
+    Large exports are prepared in the background; download them from the
+    export status page when they are ready. Files are available for a
+    limited time before they have to be exported again.
+"""
+
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.config import settings
+from app.tasks.celery_app import celery_app
+from app.tasks.db import SyncSessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.export_tasks.generate_export",
+)
+def generate_export(job_id: str) -> dict:
+    """Write a background export job's file.
+
+    Args:
+        job_id: UUID string of the ExportJob.
+
+    Returns:
+        Dict with ``status`` and, on success, ``row_count`` and
+        ``file_path``.
+    """
+    from app.models.export_job import ExportJob, ExportJobStatus
+    from app.services.export_service import (
+        ExportDataset,
+        ExportFormat,
+        export_filename,
+        write_export_sync,
+    )
+
+    session = SyncSessionFactory()
+    tmp_path = None
+    try:
+        job = session.query(ExportJob).filter(ExportJob.id == uuid.UUID(job_id)).first()
+        if not job:
+            return {"status": "skipped", "reason": "Export job not found"}
+        if job.status != ExportJobStatus.pending:
+            return {"status": "skipped", "reason": f"Export job is {job.status.value}"}
+
+        job.status = ExportJobStatus.running
+        session.commit()
+
+        dataset = ExportDataset(job.dataset)
+        fmt = ExportFormat(job.format)
+        directory = os.path.join(settings.export_dir, str(job.store_id))
+        os.makedirs(directory, exist_ok=True)
+        file_path = os.path.join(
+            directory,
+            f"{job.id}-{export_filename(dataset, job.store_id, fmt, job.compressed)}",
+        )
+        tmp_path = f"{file_path}.part"
+
+        with open(tmp_path, "wb") as out:
+            row_count = write_export_sync(
+                session, job.store_id, dataset, fmt, job.compressed, out
+            )
+        os.replace(tmp_path, file_path)
+        tmp_path = None
+
+        job.status = ExportJobStatus.completed
+        job.row_count = row_count
+        job.file_path = file_path
+        job.completed_at = datetime.now(timezone.utc)
+        session.commit()
+
+        logger.info(
+            "EXPORT: job=%s dataset=%s rows=%d", job_id[:8], dataset.value, row_count
+        )
+        return {"status": "completed", "row_count": row_count, "file_path": file_path}
+    except Exception as exc:
+        session.rollback()
+        logger.error("generate_export failed: %s", exc)
+        job = session.query(ExportJob).filter(ExportJob.id == uuid.UUID(job_id)).first()
+        if job:
+            job.status = ExportJobStatus.failed
+            job.error_message = str(exc)[:1000]
+            job.completed_at = datetime.now(timezone.utc)
+            session.commit()
+        return {"status": "failed", "error": str(exc)}
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        session.close()
+
+
+@celery_app.task(
+    name="app.tasks.export_tasks.expire_exports",
+)
+def expire_exports(batch_size: int = 500) -> dict:
+    """Delete export files older than the retention period.
+
+    Runs hourly via Celery Beat. Completed jobs older than
+    ``settings.export_retention_hours`` lose their file and move to
+    ``expired``, one committed batch at a time. Files are deleted before
+    the commit and a missing file is ignored, so a batch that fails to
+    commit is simply expired again on the next run.
+
+    Args:
+        batch_size: Jobs expired per transaction.
+
+    Returns:
+        Dict with ``expired`` (jobs) and ``orphans`` (stale ``.part``
+        files removed) counts.
+    """
+    from app.models.export_job import ExportJob, ExportJobStatus
+
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        hours=settings.export_retention_hours
+    )
+    session = SyncSessionFactory()
+    expired = 0
+    try:
+        while True:
+            jobs = (
+                session.query(ExportJob)
+                .filter(
+                    ExportJob.status == ExportJobStatus.completed,
+                    ExportJob.completed_at < cutoff,
+                )
+                .order_by(ExportJob.completed_at)
+                .limit(batch_size)
+                .all()
+            )
+            if not jobs:
+                break
+            for job in jobs:
+                if job.file_path:
+                    try:
+                        os.remove(job.file_path)
+                    except FileNotFoundError:
+                        pass
+                job.status = ExportJobStatus.expired
+                job.file_path = None
+            session.commit()
+            expired += len(jobs)
+            if len(jobs) < batch_size:
+                break
+    except Exception as exc:
+        session.rollback()
+        logger.error("expire_exports failed: %s", exc)
+        return {"expired": expired, "error": str(exc)}
+    finally:
+        session.close()
+
+    orphans = _remove_stale_parts(cutoff.timestamp())
+    if expired or orphans:
+        logger.info("EXPORT EXPIRY: jobs=%d orphans=%d", expired, orphans)
+    return {"expired": expired, "orphans": orphans}
+
+
+def _remove_stale_parts(cutoff: float) -> int:
+    """Remove ``.part`` files last written before ``cutoff``.
+
+    ``generate_export`` removes its own temporary file, so these are only
+    left by workers that were killed mid-export.
+
+    Args:
+        cutoff: POSIX timestamp; older partial files are removed.
+
+    Returns:
+        Number of files removed.
+    """
+    removed = 0
+    for root, _dirs, files in os.walk(settings.export_dir):
+        for name in files:
+            if not name.endswith(".part"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
@@ -5,11 +5,18 @@ High-risk orders are flagged for manual review and trigger dashboard
 notifications.
 
 **For Developers:**
-    The scoring logic mirrors ``fraud_service.check_order_fraud()`` but
-    runs synchronously in the Celery worker. Five heuristic signals
+    ``run_fraud_check`` scores an order with ``fraud_service.score_order``,
+    reading the customer's features from ``fraud_feature_service`` (Redis
+    counters, rebuilt from PostgreSQL on a miss). Five heuristic signals
     contribute to a 0-100 risk score. The task creates a ``FraudCheck``
     record and dispatches a notification task if the order is flagged.
 
+    ``rescore_pending_orders`` re-applies the rules to every paid order
+    that has not shipped yet, in keyset batches committed one at a time.
+    Run it after changing the scoring rules::
+
+        celery -A app.tasks.celery_app call app.tasks.fraud_tasks.rescore_pending_orders
+
 **For QA Engineers:**
     - Signals and their point values:
       - ``high_amount`` (>= $500): +20 points
@@ -19,6 +26,8 @@ notifications.
       - ``first_order`` (no previous paid orders): +10 points
     - Risk levels: low (0-25), medium (26-50), high (51-75), critical (76-100).
     - Orders at ``high`` or ``critical`` risk are auto-flagged.
+    - Rescoring never touches checks a store owner has reviewed, and only
+      notifies for checks that become flagged.
 
 **For Project Managers:**
     This task powers the automated fraud detection system (Feature 28),
@@ -33,11 +42,8 @@ notifications.
 
 import logging
 import uuid
-from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import func
-
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
 
@@ -65,7 +71,8 @@ def run_fraud_check(self, order_id: str) -> dict:
         ``is_flagged``, and ``signals`` keys.
     """
     from app.models.fraud import FraudCheck, FraudRiskLevel
-    from app.models.order import Order, OrderStatus
+    from app.models.order import Order
+    from app.services import fraud_feature_service, fraud_service
 
     session = SyncSessionFactory()
     try:
@@ -73,71 +80,11 @@ def run_fraud_check(self, order_id: str) -> dict:
         if not order:
             return {"status": "skipped", "reason": "Order not found"}
 
-        signals = []
-        score = 0
-
-        # Signal 1: High order amount (>= $500)
-        if order.total >= Decimal("500"):
-            signals.append("high_amount")
-            score += 20
-
-        # Signal 2: New customer with high order (first order >= $200)
-        previous_orders = (
-            session.query(func.count(Order.id))
-            .filter(
-                Order.customer_email == order.customer_email,
-                Order.store_id == order.store_id,
-                Order.status.in_([OrderStatus.paid, OrderStatus.shipped, OrderStatus.delivered]),
-                Order.id != order.id,
-            )
-            .scalar()
+        features = fraud_feature_service.get_customer_features_sync(session, order)
+        score, level, signals = fraud_service.score_order(
+            order.total, order.customer_email, features
         )
-        is_first_order = (previous_orders or 0) == 0
-
-        if is_first_order and order.total >= Decimal("200"):
-            signals.append("new_customer_high_order")
-            score += 25
-
-        # Signal 3: Velocity spike (3+ orders from same email in 1 hour)
-        one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-        recent_orders = (
-            session.query(func.count(Order.id))
-            .filter(
-                Order.customer_email == order.customer_email,
-                Order.store_id == order.store_id,
-                Order.created_at >= one_hour_ago,
-            )
-            .scalar()
-        )
-        if (recent_orders or 0) >= 3:
-            signals.append("velocity_spike")
-            score += 30
-
-        # Signal 4: Suspicious email patterns
-        email_lower = order.customer_email.lower()
-        suspicious_patterns = ["+", "test", "fake", "temp"]
-        if any(pattern in email_lower for pattern in suspicious_patterns):
-            signals.append("suspicious_email")
-            score += 15
-
-        # Signal 5: First order (mild risk signal)
-        if is_first_order:
-            signals.append("first_order")
-            score += 10
-
-        # Cap score at 100
-        score = min(score, 100)
-
-        # Determine risk level
-        if score <= 25:
-            risk_level = FraudRiskLevel.low
-        elif score <= 50:
-            risk_level = FraudRiskLevel.medium
-        elif score <= 75:
-            risk_level = FraudRiskLevel.high
-        else:
-            risk_level = FraudRiskLevel.critical
-
+        risk_level = FraudRiskLevel(level)
         is_flagged = risk_level in (FraudRiskLevel.high, FraudRiskLevel.critical)
 
         # Create fraud check record
@@ -178,3 +125,61 @@ def run_fraud_check(self, order_id: str) -> dict:
         raise self.retry(exc=exc)
     finally:
         session.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.fraud_tasks.rescore_pending_orders",
+    max_retries=2,
+    default_retry_delay=60,
+)
+def rescore_pending_orders(self, store_id: str | None = None) -> dict:
+    """Re-apply the fraud rules to all paid orders that have not shipped.
+
+    Walks the orders in keyset batches of
+    ``fraud_service.rescore_pending_orders_sync``, committing each batch,
+    and dispatches a fraud alert for every check that becomes flagged.
+
+    Args:
+        store_id: Optional UUID string restricting rescoring to one store.
+
+    Returns:
+        Dict with ``orders``, ``updated``, ``created``, and ``flagged``
+        counts.
+    """
+    from app.services import fraud_service
+    from app.tasks.notification_tasks import create_fraud_alert_notification
+
+    session = SyncSessionFactory()
+    totals = {"orders": 0, "updated": 0, "created": 0, "flagged": 0}
+    cursor = None
+    try:
+        while True:
+            batch = fraud_service.rescore_pending_orders_sync(
+                session,
+                store_id=uuid.UUID(store_id) if store_id else None,
+                after_order_id=cursor,
+            )
+            session.commit()
+            for flagged_store_id, fraud_check_id in batch["newly_flagged"]:
+                create_fraud_alert_notification.delay(flagged_store_id, fraud_check_id)
+            totals["orders"] += batch["orders"]
+            totals["updated"] += batch["updated"]
+            totals["created"] += batch["created"]
+            totals["flagged"] += len(batch["newly_flagged"])
+            cursor = batch["last_order_id"]
+            if cursor is None:
+                break
+
+        logger.info(
+            "FRAUD RESCORE: store=%s orders=%d updated=%d created=%d flagged=%d",
+            store_id or "all", totals["orders"], totals["updated"],
+            totals["created"], totals["flagged"],
+        )
+        return totals
+    except Exception as exc:
+        session.rollback()
+        logger.error("rescore_pending_orders failed: %s", exc)
+        raise self.retry(exc=exc)
+    finally:
+        session.close()
@@ -7,7 +7,10 @@ to the relevant page.
 **For Developers:**
     Each task creates a ``Notification`` row with the appropriate type,
     title, message, action URL, and metadata. The ``user_id`` is resolved
-    from the store's owner. Tasks use the sync session factory.
+    from the store's owner. Tasks use the sync session factory. After
+    committing, each task bumps the owner's cached unread counter and
+    pushes the notification to their open dashboards
+    (``notification_push_service.notifications_created_sync``).
 
 **For QA Engineers:**
     - Notification types match the ``NotificationType`` enum values.
@@ -15,6 +18,8 @@ to the relevant page.
     - ``metadata_`` stores structured event data for rich rendering.
     - If the store or related entity is not found, the task skips
       without raising an error.
+    - A low-stock digest skips variants that were restocked above
+      ``settings.low_stock_threshold`` before it ran.
 
 **For Project Managers:**
     These tasks power the notification system (Feature 25), automatically
@@ -31,12 +36,28 @@ to the relevant page.
 import logging
 import uuid
 
+from redis.exceptions import RedisError
+
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
 
 logger = logging.getLogger(__name__)
 
 
+def _push(notification) -> None:
+    """Count a committed notification and push it to open dashboards.
+
+    The notification is already committed, so a failed push is logged
+    rather than raised (a task retry would create it twice).
+    """
+    from app.services.notification_push_service import notifications_created_sync
+
+    try:
+        notifications_created_sync([notification])
+    except Exception as exc:
+        logger.warning("Notification push skipped: %s", exc)
+
+
 def _get_store_owner_id(session, store_id: str) -> uuid.UUID | None:
     """Resolve the store owner's user_id from a store_id.
 
@@ -118,6 +139,7 @@ def create_order_notification(self, store_id: str, order_id: str, event_type: st
         session.add(notification)
         session.commit()
         session.refresh(notification)
+        _push(notification)
 
         logger.info(
             "NOTIFICATION: %s for order=%s store=%s",
@@ -173,6 +195,7 @@ def create_review_notification(self, store_id: str, review_id: str) -> dict:
         session.add(notification)
         session.commit()
         session.refresh(notification)
+        _push(notification)
 
         logger.info("NOTIFICATION: review=%s store=%s", review_id[:8], store_id[:8])
         return {"status": "created", "notification_id": str(notification.id)}
@@ -233,6 +256,7 @@ def create_low_stock_notification(self, store_id: str, product_id: str, variant_
         session.add(notification)
         session.commit()
         session.refresh(notification)
+        _push(notification)
 
         logger.info(
             "NOTIFICATION: low_stock product=%s variant=%s stock=%d",
@@ -293,6 +317,7 @@ def create_fraud_alert_notification(self, store_id: str, fraud_check_id: str) ->
         session.add(notification)
         session.commit()
         session.refresh(notification)
+        _push(notification)
 
         logger.info(
             "NOTIFICATION: fraud_alert order=%s risk=%s score=%s",
@@ -305,3 +330,106 @@ def create_fraud_alert_notification(self, store_id: str, fraud_check_id: str) ->
         raise self.retry(exc=exc)
     finally:
         session.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.notification_tasks.send_low_stock_digest",
+    max_retries=3,
+    default_retry_delay=30,
+)
+def send_low_stock_digest(self, store_id: str, variant_ids: list[str] | None = None) -> dict:
+    """Notify and email a store owner about all of the store's low-stock variants.
+
+    Args:
+        store_id: UUID string of the store.
+        variant_ids: Variant UUID strings to report. When omitted, the
+            variants collected in the store's Redis digest are taken.
+
+    Returns:
+        Dict with ``status``, ``notification_id``, ``variant_count``, and
+        ``email`` keys.
+    """
+    from app.models.notification import Notification, NotificationType
+    from app.models.store import Store
+    from app.models.user import User
+    from app.services.email_service import email_service
+    from app.services.order_pipeline_service import (
+        low_stock_digest_items_sync,
+        pop_low_stock_digest,
+    )
+
+    if variant_ids is None:
+        try:
+            variant_ids = pop_low_stock_digest(store_id)
+        except RedisError as exc:
+            raise self.retry(exc=exc)
+    if not variant_ids:
+        return {"status": "skipped", "reason": "No low-stock variants"}
+
+    session = SyncSessionFactory()
+    try:
+        store = session.query(Store).filter(Store.id == uuid.UUID(store_id)).first()
+        if not store:
+            return {"status": "skipped", "reason": "Store not found"}
+
+        items = low_stock_digest_items_sync(
+            session, store.id, [uuid.UUID(v) for v in variant_ids]
+        )
+        if not items:
+            return {"status": "skipped", "reason": "Variants restocked"}
+
+        if len(items) == 1:
+            item = items[0]
+            message = (
+                f"{item['product_title']} ({item['variant_name']}) has only "
+                f"{item['inventory_count']} units left"
+            )
+            action_url = f"/stores/{store_id}/products/{item['product_id']}"
+        else:
+            message = f"{len(items)} variants are running low on stock"
+            action_url = f"/stores/{store_id}/products"
+
+        notification = Notification(
+            user_id=store.user_id,
+            store_id=store.id,
+            notification_type=NotificationType.low_stock,
+            title="Low Stock Alert",
+            message=message,
+            action_url=action_url,
+            metadata_={"items": items},
+        )
+        session.add(notification)
+        session.commit()
+        session.refresh(notification)
+        _push(notification)
+
+        owner = session.query(User).filter(User.id == store.user_id).first()
+        if owner:
+            email_service.send_email_sync(
+                to=owner.email,
+                subject=f"Low Stock Alert - {store.name}",
+                template_name="low_stock_digest.html",
+                context={"store_name": store.name, "items": items},
+            )
+            logger.info(
+                "EMAIL: low_stock_digest to=%s store=%s variants=%d",
+                owner.email, store_id[:8], len(items),
+            )
+
+        logger.info(
+            "NOTIFICATION: low_stock_digest store=%s variants=%d",
+            store_id[:8], len(items),
+        )
+        return {
+            "status": "created",
+            "notification_id": str(notification.id),
+            "variant_count": len(items),
+            "email": owner.email if owner else None,
+        }
+    except Exception as exc:
+        session.rollback()
+        logger.error("send_low_stock_digest failed: %s", exc)
+        raise self.retry(exc=exc)
+    finally:
+        session.close()
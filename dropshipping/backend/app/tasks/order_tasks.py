@@ -6,33 +6,53 @@ and automatic supplier fulfillment.
 
 **For Developers:**
     ``process_paid_order`` is the main orchestrator triggered by the
-    Stripe webhook handler. It coordinates all downstream tasks:
-    fraud check (sync call), then fan-out email, webhook, notification,
-    low-stock alert, and auto-fulfillment tasks via ``.delay()``.
+    Stripe webhook handler. It finds the order's low-stock variants with
+    one joined query, queues them for the store's low-stock digest, and
+    starts the post-payment canvas, whose branches run in parallel:
+
+    - ``run_fraud_check`` chained into ``complete_paid_order``, which
+      dispatches ``auto_fulfill_order`` unless the order was flagged;
+    - ``send_order_confirmation``;
+    - ``dispatch_webhook_event`` (``order.paid``);
+    - ``create_order_notification`` (``order_placed``).
+
+    The branches are a ``group`` rather than a chord: a failing email or
+    notification must never hold back fulfillment, so only the fraud
+    check gates it. Each branch links ``record_order_stage``, which
+    stores the stage's finishing time in ``Order.pipeline_timings`` (see
+    ``order_pipeline_service.record_stage_sync``).
 
     ``auto_fulfill_order`` checks if all order items have a primary
     supplier and transitions the order to ``shipped`` with a mock
     tracking number (dev mode).
 
-    ``check_fulfillment_status`` is a Beat task (every 30 min) that
-    simulates tracking updates by transitioning shipped orders to
-    delivered after 7+ days.
+    ``check_fulfillment_status`` is a Beat task (every 30 min) that polls
+    the carriers of shipped orders in keyset pages with bulk lookups (see
+    ``tracking_service``) and hands each page's deliveries to one
+    ``notify_orders_delivered`` task (notifications, webhooks, emails).
 
 **For QA Engineers:**
-    - ``process_paid_order`` always runs the fraud check synchronously
-      (not ``.delay()``) because the result determines whether to
-      auto-fulfill.
-    - Low-stock threshold is 5 units per variant.
+    - Auto-fulfillment waits for the fraud check result and is skipped
+      for flagged orders; the email, webhook, and notification do not
+      wait for it.
+    - Low-stock threshold is ``settings.low_stock_threshold`` (5) units
+      per variant. Alerts are sent as one digest per store every
+      ``settings.low_stock_digest_window_seconds``.
+    - ``Order.pipeline_timings`` holds seconds since payment for
+      ``pipeline_started``, ``fraud_checked``, ``confirmation_sent``,
+      ``webhooks_dispatched``, ``owner_notified``, and ``fulfilled``.
     - ``auto_fulfill_order`` only transitions orders that are still in
       ``paid`` status (prevents double-fulfillment).
-    - ``check_fulfillment_status`` uses a random 30% chance per order
-      in dev mode to simulate delivery.
+    - ``check_fulfillment_status`` polls shipments older than
+      ``settings.tracking_min_transit_days`` that have a tracking number;
+      in dev mode the mock carrier delivers 30% of them per run.
 
 **For Project Managers:**
     These tasks form the core dropshipping automation loop (Feature 10
     enhancement): payment confirmed → fraud check → email + webhook +
     notification → auto-fulfill → track → deliver. This is the heart
-    of the "minimal manual intervention" promise.
+    of the "minimal manual intervention" promise. Stage timings on each
+    order show the paid-to-fulfilled latency and where it is spent.
 
 **For End Users:**
     When a customer pays for an order, the system automatically checks
@@ -42,16 +62,23 @@ and automatic supplier fulfillment.
 """
 
 import logging
-import random
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+
+from celery import chain, group
+from celery.canvas import Signature
+from redis.exceptions import RedisError
 
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
 
 logger = logging.getLogger(__name__)
 
-LOW_STOCK_THRESHOLD = 5
+
+def _with_stage(signature: Signature, order_id: str, stage: str) -> Signature:
+    """Link ``record_order_stage`` to a pipeline task signature."""
+    signature.link(record_order_stage.si(order_id, stage))
+    return signature
 
 
 @celery_app.task(
@@ -64,27 +91,32 @@ def process_paid_order(self, order_id: str) -> dict:
     """Orchestrate all post-payment processing for an order.
 
     This is the main entry point called from the Stripe webhook handler
-    after an order transitions to ``paid``. It coordinates:
+    after an order transitions to ``paid``. It:
 
-    1. Fraud check (synchronous — result needed for fulfillment decision)
-    2. Order confirmation email
-    3. Webhook dispatch (``order.paid``)
-    4. Dashboard notification (``order_placed``)
-    5. Low-stock alerts for variants with <= 5 units
-    6. Auto-fulfillment (if not fraud-flagged and suppliers configured)
+    1. Records the ``pipeline_started`` stage
+    2. Queues the order's low-stock variants for the store's digest
+    3. Starts, in parallel: fraud check → auto-fulfillment decision,
+       order confirmation email, ``order.paid`` webhooks, and the
+       ``order_placed`` dashboard notification
 
     Args:
         order_id: UUID string of the paid order.
 
     Returns:
-        Dict with processing results including fraud status.
+        Dict with ``order_id``, ``store_id``, ``low_stock_alerts``, and
+        ``pipeline`` (``"dispatched"``) keys.
     """
-    from app.models.order import Order, OrderItem, OrderStatus
-    from app.models.product import ProductVariant
-    from app.tasks.email_tasks import send_low_stock_alert, send_order_confirmation
+    from app.models.order import Order, OrderStatus
+    from app.services.order_pipeline_service import (
+        find_low_stock_variants_sync,
+        queue_low_stock_digest,
+        record_stage_sync,
+    )
+    from app.tasks.email_tasks import send_order_confirmation
+    from app.tasks.fraud_tasks import run_fraud_check
     from app.tasks.notification_tasks import (
-        create_low_stock_notification,
         create_order_notification,
+        send_low_stock_digest,
     )
     from app.tasks.webhook_tasks import dispatch_webhook_event
 
@@ -98,74 +130,137 @@ def process_paid_order(self, order_id: str) -> dict:
             return {"status": "skipped", "reason": f"Order status is {order.status.value}, not paid"}
 
         store_id = str(order.store_id)
-        result = {"order_id": order_id, "store_id": store_id}
-
-        # 1. Run fraud check synchronously (need result for auto-fulfill decision)
-        from app.tasks.fraud_tasks import run_fraud_check
-        fraud_result = run_fraud_check(order_id)
-        result["fraud"] = fraud_result
-
-        # 2. Send order confirmation email
-        send_order_confirmation.delay(order_id)
-
-        # 3. Dispatch webhook event
-        dispatch_webhook_event.delay(store_id, "order.paid", {
+        webhook_data = {
             "order_id": order_id,
             "customer_email": order.customer_email,
             "total": str(order.total),
             "currency": order.currency,
-        })
+        }
 
-        # 4. Create dashboard notification
-        create_order_notification.delay(store_id, order_id, "order_placed")
+        low_stock = find_low_stock_variants_sync(session, order.id)
+        started_after = record_stage_sync(session, order.id, "pipeline_started")
+        session.commit()
 
-        # 5. Check for low-stock variants
-        order_items = (
-            session.query(OrderItem)
-            .filter(OrderItem.order_id == order.id)
-            .all()
-        )
-        low_stock_variants = []
-        for item in order_items:
-            if item.variant_id:
-                variant = (
-                    session.query(ProductVariant)
-                    .filter(ProductVariant.id == item.variant_id)
-                    .first()
-                )
-                if variant and variant.inventory_count <= LOW_STOCK_THRESHOLD:
-                    low_stock_variants.append(variant)
-                    send_low_stock_alert.delay(
-                        store_id, str(item.product_id), str(variant.id)
-                    )
-                    create_low_stock_notification.delay(
-                        store_id, str(item.product_id), str(variant.id)
-                    )
-        result["low_stock_alerts"] = len(low_stock_variants)
-
-        # 6. Auto-fulfill if not fraud-flagged
-        is_flagged = fraud_result.get("is_flagged", False) if isinstance(fraud_result, dict) else False
-        if not is_flagged:
-            auto_fulfill_order.delay(order_id)
-            result["auto_fulfill"] = "dispatched"
-        else:
-            result["auto_fulfill"] = "skipped_fraud_flagged"
+        try:
+            queue_low_stock_digest(store_id, low_stock)
+        except RedisError:
+            send_low_stock_digest.delay(store_id, [str(v) for v in low_stock])
+
+        group(
+            chain(run_fraud_check.si(order_id), complete_paid_order.s(order_id)),
+            _with_stage(send_order_confirmation.si(order_id), order_id, "confirmation_sent"),
+            _with_stage(
+                dispatch_webhook_event.si(store_id, "order.paid", webhook_data),
+                order_id,
+                "webhooks_dispatched",
+            ),
+            _with_stage(
+                create_order_notification.si(store_id, order_id, "order_placed"),
+                order_id,
+                "owner_notified",
+            ),
+        ).apply_async()
 
         logger.info(
-            "PROCESS ORDER: order=%s fraud=%s low_stock=%d auto_fulfill=%s",
-            order_id[:8],
-            fraud_result.get("risk_level", "unknown") if isinstance(fraud_result, dict) else "error",
-            len(low_stock_variants),
-            result["auto_fulfill"],
+            "PROCESS ORDER: order=%s started_after=%ss low_stock=%d",
+            order_id[:8], started_after, len(low_stock),
         )
-        return result
+        return {
+            "order_id": order_id,
+            "store_id": store_id,
+            "low_stock_alerts": len(low_stock),
+            "pipeline": "dispatched",
+        }
     except Exception as exc:
+        session.rollback()
         logger.error("process_paid_order failed: %s", exc)
         raise self.retry(exc=exc)
     finally:
         session.close()
 
 
+@celery_app.task(
+    bind=True,
+    name="app.tasks.order_tasks.complete_paid_order",
+    max_retries=2,
+    default_retry_delay=30,
+)
+def complete_paid_order(self, fraud_result: dict, order_id: str) -> dict:
+    """Decide on auto-fulfillment once the fraud check has finished.
+
+    Runs as the second link of the fraud branch of ``process_paid_order``
+    and receives ``run_fraud_check``'s result.
+
+    Args:
+        fraud_result: The dict returned by ``run_fraud_check``.
+        order_id: UUID string of the paid order.
+
+    Returns:
+        Dict with ``order_id``, ``fraud``, and ``auto_fulfill`` keys.
+    """
+    from app.services.order_pipeline_service import record_stage_sync
+
+    is_flagged = fraud_result.get("is_flagged", False) if isinstance(fraud_result, dict) else False
+    session = SyncSessionFactory()
+    try:
+        checked_after = record_stage_sync(session, uuid.UUID(order_id), "fraud_checked")
+        session.commit()
+    except Exception as exc:
+        session.rollback()
+        logger.error("complete_paid_order failed: %s", exc)
+        raise self.retry(exc=exc)
+    finally:
+        session.close()
+
+    if not is_flagged:
+        auto_fulfill_order.delay(order_id)
+        auto_fulfill = "dispatched"
+    else:
+        auto_fulfill = "skipped_fraud_flagged"
+
+    logger.info(
+        "PROCESS ORDER: order=%s fraud=%s checked_after=%ss auto_fulfill=%s",
+        order_id[:8],
+        fraud_result.get("risk_level", "unknown") if isinstance(fraud_result, dict) else "error",
+        checked_after,
+        auto_fulfill,
+    )
+    return {"order_id": order_id, "fraud": fraud_result, "auto_fulfill": auto_fulfill}
+
+
+@celery_app.task(
+    name="app.tasks.order_tasks.record_order_stage",
+    ignore_result=True,
+)
+def record_order_stage(order_id: str, stage: str) -> dict:
+    """Record the finishing time of a post-payment stage.
+
+    Linked to the pipeline's parallel branches; it runs only when the
+    branch succeeded. Failures are logged and never retried, since stage
+    timings are instrumentation only.
+
+    Args:
+        order_id: UUID string of the order.
+        stage: One of ``order_pipeline_service.PIPELINE_STAGES``.
+
+    Returns:
+        Dict with ``stage`` and ``seconds`` (since payment) keys.
+    """
+    from app.services.order_pipeline_service import record_stage_sync
+
+    session = SyncSessionFactory()
+    try:
+        seconds = record_stage_sync(session, uuid.UUID(order_id), stage)
+        session.commit()
+        return {"stage": stage, "seconds": seconds}
+    except Exception as exc:
+        session.rollback()
+        logger.warning("record_order_stage failed: order=%s stage=%s error=%s", order_id[:8], stage, exc)
+        return {"stage": stage, "error": str(exc)}
+    finally:
+        session.close()
+
+
 @celery_app.task(
     bind=True,
     name="app.tasks.order_tasks.auto_fulfill_order",
@@ -187,6 +282,8 @@ def auto_fulfill_order(self, order_id: str) -> dict:
     """
     from app.models.order import Order, OrderItem, OrderStatus
     from app.models.supplier import ProductSupplier, Supplier, SupplierStatus
+    from app.services.order_pipeline_service import record_stage_sync
+    from app.services.reservation_service import fulfill_order_reservations_sync
     from app.tasks.email_tasks import send_order_shipped
     from app.tasks.notification_tasks import create_order_notification
     from app.tasks.webhook_tasks import dispatch_webhook_event
@@ -245,6 +342,8 @@ def auto_fulfill_order(self, order_id: str) -> dict:
         order.tracking_number = tracking_number
         order.carrier = "Auto-Fulfill"
         order.shipped_at = datetime.now(timezone.utc)
+        fulfill_order_reservations_sync(session, order.id)
+        fulfilled_after = record_stage_sync(session, order.id, "fulfilled")
         session.commit()
 
         # Dispatch shipped notifications
@@ -257,8 +356,8 @@ def auto_fulfill_order(self, order_id: str) -> dict:
         create_order_notification.delay(store_id, order_id, "order_shipped")
 
         logger.info(
-            "AUTO-FULFILL: order=%s tracking=%s",
-            order_id[:8], tracking_number,
+            "AUTO-FULFILL: order=%s tracking=%s paid_to_fulfilled=%ss",
+            order_id[:8], tracking_number, fulfilled_after,
         )
         return {
             "status": "fulfilled",
@@ -277,67 +376,103 @@ def auto_fulfill_order(self, order_id: str) -> dict:
     name="app.tasks.order_tasks.check_fulfillment_status",
 )
 def check_fulfillment_status() -> dict:
-    """Check shipped orders for delivery status updates (Beat task).
+    """Poll carriers for delivery updates of shipped orders (Beat task).
 
-    Runs every 30 minutes via Celery Beat. In dev mode, simulates
-    tracking updates by randomly transitioning orders shipped 7+ days
-    ago to ``delivered`` (30% chance per order per check).
-
-    In production, this would poll supplier tracking APIs for real
-    status updates.
+    Runs every 30 minutes via Celery Beat. Walks the shipped orders in
+    keyset pages of ``tracking_service.poll_shipments_sync`` (bulk carrier
+    lookups, one status update per page), commits each page, and queues
+    one ``notify_orders_delivered`` task per page that had deliveries.
 
     Returns:
-        Dict with ``checked_count`` and ``delivered_count`` keys.
+        Dict with ``checked_count``, ``delivered_count`` and ``batches``
+        keys.
     """
-    from app.models.order import Order, OrderStatus
-    from app.tasks.email_tasks import send_order_delivered
-    from app.tasks.notification_tasks import create_order_notification
-    from app.tasks.webhook_tasks import dispatch_webhook_event
+    from app.services.tracking_service import poll_shipments_sync
 
     session = SyncSessionFactory()
+    checked = delivered = batches = 0
+    cursor = None
     try:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
-
-        shipped_orders = (
-            session.query(Order)
-            .filter(
-                Order.status == OrderStatus.shipped,
-                Order.shipped_at.isnot(None),
-                Order.shipped_at <= cutoff,
-            )
-            .all()
+        while True:
+            page = poll_shipments_sync(session, after_order_id=cursor)
+            session.commit()
+            if page["checked"]:
+                batches += 1
+            if page["delivered"]:
+                notify_orders_delivered.delay(page["delivered"])
+            checked += page["checked"]
+            delivered += len(page["delivered"])
+            cursor = page["last_order_id"]
+            if cursor is None:
+                break
+
+        logger.info(
+            "FULFILLMENT CHECK: checked=%d delivered=%d batches=%d",
+            checked, delivered, batches,
         )
+        return {"checked_count": checked, "delivered_count": delivered, "batches": batches}
+    except Exception as exc:
+        session.rollback()
+        logger.error("check_fulfillment_status failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
 
-        checked = len(shipped_orders)
-        delivered = 0
 
-        for order in shipped_orders:
-            # Dev mode: 30% chance of delivery per check
-            if random.random() < 0.3:
-                order.status = OrderStatus.delivered
-                order.delivered_at = datetime.now(timezone.utc)
-                delivered += 1
+@celery_app.task(
+    bind=True,
+    name="app.tasks.order_tasks.notify_orders_delivered",
+    max_retries=3,
+    default_retry_delay=60,
+)
+def notify_orders_delivered(self, order_ids: list[str]) -> dict:
+    """Send the delivery side effects for a page of delivered orders.
 
-                order_id = str(order.id)
-                store_id = str(order.store_id)
+    Replaces the three per-order tasks (email, webhook, notification)
+    with one task per tracking page. The notifications are committed
+    first, and only that step is retried; the webhooks and emails are
+    sent once after it (see ``tracking_service``), so a retry never
+    resends them.
 
-                send_order_delivered.delay(order_id)
-                dispatch_webhook_event.delay(store_id, "order.delivered", {
-                    "order_id": order_id,
-                })
-                create_order_notification.delay(store_id, order_id, "order_delivered")
+    Args:
+        order_ids: UUID strings of orders that were marked delivered.
 
-        if delivered > 0:
-            session.commit()
+    Returns:
+        Dict with ``notifications``, ``webhooks`` and ``emails`` counts.
+    """
+    from app.services.notification_push_service import notifications_created_sync
+    from app.services.tracking_service import (
+        create_delivery_notifications_sync,
+        send_delivery_events_sync,
+    )
 
+    session = SyncSessionFactory()
+    try:
+        try:
+            deliveries, notifications = create_delivery_notifications_sync(
+                session, [uuid.UUID(oid) for oid in order_ids]
+            )
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            logger.error("notify_orders_delivered failed: %s", exc)
+            raise self.retry(exc=exc)
+        notifications_created_sync(notifications)
+
+        counts = {"notifications": len(notifications), "webhooks": 0, "emails": 0}
+        try:
+            counts.update(send_delivery_events_sync(session, deliveries))
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            logger.error(
+                "Delivery events incomplete (not retried): orders=%d error=%s",
+                len(order_ids), exc,
+            )
         logger.info(
-            "FULFILLMENT CHECK: checked=%d delivered=%d",
-            checked, delivered,
+            "DELIVERY EVENTS: orders=%d notifications=%d webhooks=%d emails=%d",
+            len(order_ids), counts["notifications"], counts["webhooks"], counts["emails"],
         )
-        return {"checked_count": checked, "delivered_count": delivered}
-    except Exception as exc:
-        session.rollback()
-        logger.error("check_fulfillment_status failed: %s", exc)
-        return {"error": str(exc)}
+        return counts
     finally:
         session.close()
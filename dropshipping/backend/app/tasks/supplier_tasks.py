@@ -0,0 +1,87 @@
+"""Supplier catalog sync Celery tasks.
+
+Keeps the cost, price and stock of supplier-linked products current
+without store owners re-importing them.
+
+**For Developers:**
+    ``sync_supplier_catalogs`` (Beat, hourly) walks the product-supplier
+    links in keyset pages of
+    ``supplier_sync_service.sync_supplier_links_sync`` (supplier lookups
+    batched per platform, unchanged payloads skipped by hash, one bulk
+    update per table), commits each page, and then sends one
+    ``product.updated`` webhook per store for the whole run
+    (``notify_supplier_sync``).
+
+**For QA Engineers:**
+    - Set ``ALIEXPRESS_API_KEY`` / ``CJDROPSHIP_API_KEY`` to sync against
+      the real platforms; without them the demo catalogs are used.
+    - The task result reports ``checked``, ``updated``, ``unchanged``,
+      ``failed`` and ``skipped`` links, ``stores`` notified and
+      ``batches``. Links to other platforms are skipped.
+
+**For Project Managers:**
+    Supplier price rises reach store prices within the hour, and items
+    the supplier sold out of stop being sold.
+
+**For End Users:**
+    Costs, prices and stock of products linked to AliExpress or
+    CJDropshipping update automatically every hour.
+"""
+
+import logging
+from collections import defaultdict
+
+from app.tasks.celery_app import celery_app
+from app.tasks.db import SyncSessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="app.tasks.supplier_tasks.sync_supplier_catalogs",
+)
+def sync_supplier_catalogs() -> dict:
+    """Sync linked products with their suppliers' catalogs (Beat task).
+
+    Products changed by pages that were committed before a failure are
+    still announced.
+
+    Returns:
+        Dict with ``checked``, ``updated``, ``unchanged``, ``failed``,
+        ``skipped``, ``stores`` and ``batches`` counts, or ``error`` on failure.
+    """
+    from app.services.supplier_sync_service import notify_supplier_sync, sync_supplier_links_sync
+
+    session = SyncSessionFactory()
+    counts = {
+        "checked": 0, "updated": 0, "unchanged": 0, "failed": 0, "skipped": 0, "batches": 0,
+    }
+    changed: dict[str, set[str]] = defaultdict(set)
+    cursor = None
+    try:
+        while True:
+            page = sync_supplier_links_sync(session, after_link_id=cursor)
+            session.commit()
+            if page["checked"]:
+                counts["batches"] += 1
+            for key in ("checked", "updated", "unchanged", "failed", "skipped"):
+                counts[key] += page[key]
+            for store_id, product_ids in page["changed"].items():
+                changed[store_id].update(product_ids)
+            cursor = page["last_link_id"]
+            if cursor is None:
+                break
+
+        logger.info(
+            "Supplier sync: checked=%d updated=%d unchanged=%d failed=%d stores=%d batches=%d",
+            counts["checked"], counts["updated"], counts["unchanged"], counts["failed"],
+            len(changed), counts["batches"],
+        )
+        return counts | {"stores": len(changed)}
+    except Exception as exc:
+        session.rollback()
+        logger.error("sync_supplier_catalogs failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
+        notify_supplier_sync({store_id: sorted(ids) for store_id, ids in changed.items()})
@@ -5,18 +5,25 @@ when business events occur. Payloads are signed with HMAC-SHA256 for
 authenticity verification.
 
 **For Developers:**
-    The task queries active ``StoreWebhook`` rows subscribed to the event,
-    signs the payload with each webhook's secret, and sends an HTTP POST
-    via ``httpx.Client``. Delivery attempts are recorded in
-    ``WebhookDelivery``. Webhooks are auto-disabled after 10 consecutive
-    failures.
+    ``dispatch_webhook_event`` loads the active webhooks subscribed to the
+    event (filtered in SQL) and hands one ``DeliveryAttempt`` per
+    endpoint to ``webhook_delivery_service.deliver_all``, which sends
+    them concurrently over a pooled client with a per-host concurrency
+    cap. Results are recorded in one batched ``WebhookDelivery`` insert.
+    Failed attempts get a ``next_retry_at`` with exponential backoff and
+    are re-sent by the ``retry_webhook_deliveries`` Beat task, which
+    commits its claim on the due retries before sending them. Webhooks
+    are auto-disabled (circuit breaker) after
+    ``settings.webhook_circuit_breaker_threshold`` consecutive failures.
 
 **For QA Engineers:**
     - The ``X-Webhook-Signature`` header contains ``sha256=<hex_digest>``.
     - A delivery is considered successful if the HTTP status is 2xx.
     - ``failure_count`` increments on each failed delivery and resets to
       0 on success.
-    - Webhooks with ``failure_count >= 10`` are set to ``is_active=False``.
+    - Webhooks with ``failure_count >= 10`` are set to ``is_active=False``
+      and their pending retries are cancelled.
+    - ``retry-webhook-deliveries`` runs every 30 seconds.
 
 **For Project Managers:**
     This task powers the webhook delivery system (Feature 23) enabling
@@ -29,12 +36,8 @@ authenticity verification.
     can automate inventory sync, fulfillment, and other workflows.
 """
 
-import json
 import logging
 import uuid
-from datetime import datetime, timezone
-
-import httpx
 
 from app.tasks.celery_app import celery_app
 from app.tasks.db import SyncSessionFactory
@@ -52,8 +55,8 @@ def dispatch_webhook_event(self, store_id: str, event: str, payload: dict) -> di
     """Dispatch a webhook event to all subscribed endpoints for a store.
 
     Finds all active webhooks for the store that subscribe to the given
-    event, signs the payload, sends HTTP POST requests, and records
-    delivery results.
+    event, delivers the signed payload to every endpoint concurrently,
+    and records the delivery results.
 
     Args:
         store_id: UUID string of the store.
@@ -64,99 +67,34 @@ def dispatch_webhook_event(self, store_id: str, event: str, payload: dict) -> di
         Dict with ``delivery_count``, ``success_count``, and
         ``failure_count`` keys.
     """
-    from app.models.webhook import StoreWebhook, WebhookDelivery
-    from app.services.webhook_service import sign_payload
+    from app.services.webhook_delivery_service import (
+        DeliveryAttempt,
+        build_event_payload,
+        deliver_all,
+        record_delivery_results,
+        subscribed_webhooks_sync,
+    )
 
     session = SyncSessionFactory()
     try:
-        webhooks = (
-            session.query(StoreWebhook)
-            .filter(
-                StoreWebhook.store_id == uuid.UUID(store_id),
-                StoreWebhook.is_active.is_(True),
-            )
-            .all()
-        )
-
-        # Filter to webhooks subscribed to this event
-        matching = [w for w in webhooks if event in (w.events or [])]
-
+        matching = subscribed_webhooks_sync(session, uuid.UUID(store_id), event)
         if not matching:
             return {"delivery_count": 0, "success_count": 0, "failure_count": 0}
 
-        success_count = 0
-        failure_count = 0
-
-        full_payload = {
-            "event": event,
-            "store_id": store_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "data": payload,
-        }
-        payload_json = json.dumps(full_payload, default=str)
-
-        for webhook in matching:
-            signature = sign_payload(payload_json, webhook.secret)
-            headers = {
-                "Content-Type": "application/json",
-                "X-Webhook-Signature": f"sha256={signature}",
-                "X-Webhook-Event": event,
-            }
-
-            response_status = None
-            response_body = None
-            success = False
-
-            try:
-                with httpx.Client(timeout=10.0) as client:
-                    resp = client.post(
-                        webhook.url,
-                        content=payload_json,
-                        headers=headers,
-                    )
-                    response_status = resp.status_code
-                    response_body = resp.text[:1000]
-                    success = 200 <= resp.status_code < 300
-            except httpx.TimeoutException:
-                response_body = "Timeout after 10s"
-                logger.warning(
-                    "Webhook timeout: url=%s event=%s", webhook.url, event
-                )
-            except Exception as e:
-                response_body = str(e)[:1000]
-                logger.warning(
-                    "Webhook delivery failed: url=%s event=%s error=%s",
-                    webhook.url, event, str(e)[:200],
-                )
-
-            # Record the delivery attempt
-            delivery = WebhookDelivery(
+        full_payload = build_event_payload(uuid.UUID(store_id), event, payload)
+        results = deliver_all([
+            DeliveryAttempt(
                 webhook_id=webhook.id,
+                url=webhook.url,
+                secret=webhook.secret,
                 event=event,
                 payload=full_payload,
-                response_status=response_status,
-                response_body=response_body,
-                success=success,
             )
-            session.add(delivery)
-
-            # Update webhook state
-            webhook.last_triggered_at = datetime.now(timezone.utc)
-            if success:
-                webhook.failure_count = 0
-                success_count += 1
-            else:
-                webhook.failure_count = (webhook.failure_count or 0) + 1
-                failure_count += 1
-                # Auto-disable after 10 consecutive failures
-                if webhook.failure_count >= 10:
-                    webhook.is_active = False
-                    logger.warning(
-                        "Webhook auto-disabled after 10 failures: id=%s url=%s",
-                        webhook.id, webhook.url,
-                    )
-
+            for webhook in matching
+        ])
+        success_count, failure_count = record_delivery_results(session, results)
         session.commit()
+
         logger.info(
             "Webhook dispatch: event=%s store=%s matched=%d success=%d failed=%d",
             event, store_id[:8], len(matching), success_count, failure_count,
@@ -172,3 +110,41 @@ def dispatch_webhook_event(self, store_id: str, event: str, payload: dict) -> di
         raise self.retry(exc=exc)
     finally:
         session.close()
+
+
+@celery_app.task(
+    name="app.tasks.webhook_tasks.retry_webhook_deliveries",
+)
+def retry_webhook_deliveries() -> dict:
+    """Re-send failed webhook deliveries whose backoff has elapsed (Beat task).
+
+    The claim is committed first, so no row lock is held while the
+    requests are made.
+
+    Returns:
+        Dict with ``retried``, ``success_count``, and ``failure_count``
+        keys, or ``error`` on failure.
+    """
+    from app.services.webhook_delivery_service import (
+        claim_due_retries_sync,
+        resend_claimed_retries_sync,
+    )
+
+    session = SyncSessionFactory()
+    try:
+        claimed = claim_due_retries_sync(session)
+        session.commit()
+        counts = resend_claimed_retries_sync(session, claimed)
+        session.commit()
+        if counts["retried"]:
+            logger.info(
+                "Webhook retries: retried=%d success=%d failed=%d",
+                counts["retried"], counts["success_count"], counts["failure_count"],
+            )
+        return counts
+    except Exception as exc:
+        session.rollback()
+        logger.error("retry_webhook_deliveries failed: %s", exc)
+        return {"error": str(exc)}
+    finally:
+        session.close()
@@ -0,0 +1,18 @@
+"""Performance benchmarks for the dropshipping backend.
+
+Benchmarks are standalone scripts that print a JSON result line.
+Database benchmarks run against a local PostgreSQL (the ``DATABASE_URL``
+from settings) in their own throwaway schema; network benchmarks start
+local stub servers instead, e.g.::
+
+    python -m benchmarks.bench_clone_store --products 50000
+    python -m benchmarks.bench_webhook_delivery --endpoints 200
+    python -m benchmarks.bench_email_delivery --emails 500
+
+``suite`` is the regression gate: it seeds a deterministic data set
+(``datagen``), times the hot service functions (``bench_services``),
+runs the storefront and dashboard load scenarios (``bench_load``), and
+compares the numbers with the JSON baselines in ``baselines/``::
+
+    python -m benchmarks.suite --scale small
+"""
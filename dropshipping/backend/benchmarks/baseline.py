@@ -0,0 +1,134 @@
+"""JSON baselines and regression checks for benchmark results.
+
+A baseline records, per scale, the metrics of a reference run and how
+far each may move before it counts as a regression. Baselines live in
+``benchmarks/baselines/<scale>.json`` and are committed, so a change that
+slows a hot path fails ``python -m benchmarks.suite`` instead of going
+unnoticed.
+
+**For Developers:**
+    - Results are nested dicts; ``flatten`` turns them into dotted metric
+      names (``services.search_products.p50_ms``). Only ``p50_ms``,
+      ``p95_ms`` and ``*_per_second`` metrics are tracked.
+    - A latency regresses when it exceeds the baseline by more than its
+      ``tolerance`` (a fraction) *and* by more than ``MIN_DELTA_MS``, so
+      sub-millisecond jitter never fails a run. A throughput regresses
+      when it falls below the baseline by more than its tolerance.
+    - ``record`` writes a new baseline from a result; hand-tuned
+      per-metric tolerances in an existing file are kept.
+
+**For QA Engineers:**
+    Baselines are only comparable on similar hardware. After moving CI to
+    a different machine, re-record them with ``--update-baseline``.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+LATENCY_TOLERANCE = 0.5
+"""Allowed latency increase over the baseline (0.5 = 50% slower)."""
+
+THROUGHPUT_TOLERANCE = 0.3
+"""Allowed throughput decrease below the baseline (0.3 = 30% lower)."""
+
+MIN_DELTA_MS = 2.0
+"""Latency increases smaller than this never count as regressions."""
+
+_TRACKED = ("p50_ms", "p95_ms")
+
+
+def flatten(result: dict, prefix: str = "") -> dict[str, float]:
+    """Return the tracked metrics of a nested result as dotted names."""
+    metrics: dict[str, float] = {}
+    for key, value in result.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics |= flatten(value, f"{name}.")
+        elif isinstance(value, (int, float)) and (
+            key in _TRACKED or key.endswith("_per_second")
+        ):
+            metrics[name] = value
+    return metrics
+
+
+def baseline_path(scale: str) -> Path:
+    """Return the baseline file of a scale."""
+    return BASELINE_DIR / f"{scale}.json"
+
+
+def load(scale: str) -> dict | None:
+    """Load the baseline of a scale, or None if none was recorded."""
+    path = baseline_path(scale)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def compare(result: dict, baseline: dict) -> list[dict]:
+    """Find the metrics of ``result`` that regressed against ``baseline``.
+
+    Metrics missing from either side are ignored, so adding a benchmark
+    does not fail runs until its baseline is recorded.
+
+    Args:
+        result: A nested benchmark result.
+        baseline: A loaded baseline.
+
+    Returns:
+        One dict per regression with ``metric``, ``baseline``, ``value``,
+        ``change`` (relative, signed) and ``tolerance``.
+    """
+    regressions = []
+    metrics = flatten(result)
+    for name, entry in sorted(baseline["metrics"].items()):
+        if name not in metrics or not entry["value"]:
+            continue
+        base, value = entry["value"], metrics[name]
+        change = (value - base) / base
+        if name.endswith("_per_second"):
+            regressed = change < -entry["tolerance"]
+        else:
+            regressed = change > entry["tolerance"] and value - base > MIN_DELTA_MS
+        if regressed:
+            regressions.append({
+                "metric": name,
+                "baseline": base,
+                "value": value,
+                "change": round(change, 3),
+                "tolerance": entry["tolerance"],
+            })
+    return regressions
+
+
+def record(scale: str, result: dict, environment: dict) -> Path:
+    """Write ``result`` as the new baseline of ``scale``.
+
+    Args:
+        scale: Scale name the result was measured at.
+        result: A nested benchmark result.
+        environment: Description of the run (data set fingerprint,
+            options) stored alongside the metrics.
+
+    Returns:
+        Path of the written file.
+    """
+    previous = (load(scale) or {}).get("metrics", {})
+    metrics = {}
+    for name, value in flatten(result).items():
+        default = THROUGHPUT_TOLERANCE if name.endswith("_per_second") else LATENCY_TOLERANCE
+        metrics[name] = {
+            "value": value,
+            "tolerance": previous.get(name, {}).get("tolerance", default),
+        }
+    path = baseline_path(scale)
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps({
+        "scale": scale,
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment,
+        "metrics": metrics,
+    }, indent=2) + "\n")
+    return path
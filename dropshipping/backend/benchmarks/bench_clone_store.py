@@ -0,0 +1,174 @@
+"""Benchmark: clone a store with a large catalog.
+
+Seeds a store with ``--products`` products (two variants each, one
+category link and one supplier link each) in the ``dropshipping_bench``
+schema, then times ``clone_service.clone_store`` end to end.
+
+**For Developers:**
+    Seeding uses ``generate_series`` so a 50k-product store is created in
+    seconds. The clone runs in a single transaction exactly as the inline
+    API path does; the background job runs the same statements.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.bench_clone_store --products 50000
+
+**For QA Engineers:**
+    The script verifies the cloned product, variant, and link counts
+    match the source before reporting a timing.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.database import Base
+from app.models import *  # noqa: F401,F403
+from app.models.store import Store
+from app.models.user import User
+from app.services.clone_service import clone_store
+
+SCHEMA = "dropshipping_bench"
+
+_SEED_STATEMENTS = [
+    """
+    INSERT INTO categories (id, store_id, name, slug, position, is_active)
+    SELECT gen_random_uuid(), :store_id, 'Category ' || g, 'category-' || g, g, true
+    FROM generate_series(1, 50) AS g
+    """,
+    """
+    INSERT INTO suppliers (id, store_id, name, status)
+    SELECT gen_random_uuid(), :store_id, 'Supplier ' || g, 'active'
+    FROM generate_series(1, 10) AS g
+    """,
+    """
+    INSERT INTO products (id, store_id, title, slug, description, price, status,
+                          review_count, images, tags)
+    SELECT gen_random_uuid(), :store_id, 'Product ' || g, 'product-' || g,
+           'Benchmark product ' || g, 10 + (g % 90), 'active', 0,
+           '["https://img.example.com/p.png"]', '["bench"]'
+    FROM generate_series(1, :products) AS g
+    """,
+    """
+    INSERT INTO product_variants (id, product_id, name, sku, price, inventory_count,
+                                  weight_unit, track_inventory, allow_backorder)
+    SELECT gen_random_uuid(), p.id, v.name, p.slug || '-' || v.name, p.price, 10,
+           'kg', false, false
+    FROM products p CROSS JOIN (VALUES ('S'), ('L')) AS v(name)
+    WHERE p.store_id = :store_id
+    """,
+    """
+    INSERT INTO product_categories (id, product_id, category_id)
+    SELECT gen_random_uuid(), p.id, c.id
+    FROM (SELECT id, row_number() OVER () % 50 AS bucket
+          FROM products WHERE store_id = :store_id) AS p
+    JOIN (SELECT id, row_number() OVER () % 50 AS bucket
+          FROM categories WHERE store_id = :store_id) AS c USING (bucket)
+    """,
+    """
+    INSERT INTO product_suppliers (id, product_id, supplier_id, supplier_cost, is_primary)
+    SELECT gen_random_uuid(), p.id, s.id, 5, true
+    FROM (SELECT id, row_number() OVER () % 10 AS bucket
+          FROM products WHERE store_id = :store_id) AS p
+    JOIN (SELECT id, row_number() OVER () % 10 AS bucket
+          FROM suppliers WHERE store_id = :store_id) AS s USING (bucket)
+    """,
+]
+
+_COUNT_SQL = """
+SELECT
+    (SELECT count(*) FROM products WHERE store_id = :store_id),
+    (SELECT count(*) FROM product_variants v JOIN products p ON p.id = v.product_id
+      WHERE p.store_id = :store_id),
+    (SELECT count(*) FROM product_categories pc JOIN products p ON p.id = pc.product_id
+      WHERE p.store_id = :store_id),
+    (SELECT count(*) FROM product_suppliers ps JOIN products p ON p.id = ps.product_id
+      WHERE p.store_id = :store_id)
+"""
+
+
+def _make_engine():
+    """Create a NullPool engine whose connections use the bench schema."""
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_search_path(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"SET search_path TO {SCHEMA}")
+        cursor.close()
+
+    return engine
+
+
+async def _seed(factory: async_sessionmaker, products: int) -> tuple[uuid.UUID, uuid.UUID]:
+    """Create the owner, the source store, and its catalog."""
+    async with factory() as db:
+        user = User(email=f"bench-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x")
+        db.add(user)
+        await db.flush()
+        store = Store(user_id=user.id, name="Bench Store", slug="bench-store", niche="bench")
+        db.add(store)
+        await db.flush()
+        for sql in _SEED_STATEMENTS:
+            await db.execute(text(sql), {"store_id": store.id, "products": products})
+        await db.commit()
+        await db.execute(text("ANALYZE"))
+        return user.id, store.id
+
+
+async def run(products: int) -> dict:
+    """Seed a store, clone it, and return the timing result."""
+    engine = _make_engine()
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        seed_started = time.perf_counter()
+        user_id, store_id = await _seed(factory, products)
+        seed_seconds = time.perf_counter() - seed_started
+
+        async with factory() as db:
+            started = time.perf_counter()
+            clone = await clone_store(db, user_id, store_id)
+            await db.commit()
+            clone_seconds = time.perf_counter() - started
+
+            source_counts = (await db.execute(text(_COUNT_SQL), {"store_id": store_id})).one()
+            clone_counts = (await db.execute(text(_COUNT_SQL), {"store_id": clone.id})).one()
+        if tuple(source_counts) != tuple(clone_counts):
+            raise RuntimeError(f"clone mismatch: {source_counts} != {clone_counts}")
+
+        return {
+            "benchmark": "clone_store",
+            "products": products,
+            "rows_copied": sum(clone_counts),
+            "seed_seconds": round(seed_seconds, 3),
+            "clone_seconds": round(clone_seconds, 3),
+            "products_per_second": round(products / clone_seconds),
+        }
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print a JSON result line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=50_000)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.products))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Benchmark: transactional emails per second per worker.
+
+Starts a local stub SMTP relay that answers every command after
+``--latency-ms`` (a stand-in for the network round trip to a real relay),
+then renders and sends ``--emails`` order confirmations twice:
+
+- ``per_email``: the previous task path, a fresh ``Environment`` (the
+  template reparsed) and a fresh ``smtplib`` session per email;
+- ``engine``: the shared compiled template environment and
+  ``email_delivery_service.send_emails`` in outbox-sized batches over the
+  pooled SMTP connections.
+
+**For Developers:**
+    No database or Redis is needed; the outbox is bypassed and batches go
+    straight to the sender, as a flush would send them.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.bench_email_delivery --emails 500
+
+**For QA Engineers:**
+    The script checks the relay received every email from both strategies
+    before reporting timings.
+"""
+
+import argparse
+import asyncio
+import json
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from jinja2 import Environment, FileSystemLoader
+
+from app.config import settings
+from app.services.email_delivery_service import OutgoingEmail, reset_smtp_pool, send_emails
+from app.services.email_service import TEMPLATE_DIR, email_service
+
+
+class _Relay:
+    """Stub SMTP relay counting accepted messages."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.accepted = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one SMTP session."""
+        writer.write(b"220 relay ESMTP\r\n")
+        try:
+            while True:
+                line = (await reader.readline()).decode().strip()
+                if not line:
+                    break
+                command = line[:4].upper()
+                await asyncio.sleep(self.latency)
+                if command == "DATA":
+                    writer.write(b"354 Go ahead\r\n")
+                    await reader.readuntil(b"\r\n.\r\n")
+                    await asyncio.sleep(self.latency)
+                    self.accepted += 1
+                    writer.write(b"250 Queued\r\n")
+                elif command == "QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    break
+                else:
+                    writer.write(b"250 relay\r\n" if command in ("EHLO", "HELO") else b"250 OK\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _start_relay(relay: _Relay) -> tuple[int, asyncio.AbstractEventLoop]:
+    """Start the relay on a background loop; return its port."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    server = asyncio.run_coroutine_threadsafe(
+        asyncio.start_server(relay.handle, "127.0.0.1", 0), loop
+    ).result()
+    return server.sockets[0].getsockname()[1], loop
+
+
+def _context(n: int) -> dict:
+    """Template context of an order confirmation with three lines."""
+    return {
+        "store_name": "Bench Store",
+        "customer_email": f"buyer{n}@example.com",
+        "order_id_short": f"{n:08d}",
+        "order_date": "2026-10-18",
+        "order_url": f"/orders/{n}",
+        "total": 59.97,
+        "items": [
+            {"product_title": f"Item {i}", "variant_name": "M", "quantity": 1, "unit_price": 19.99}
+            for i in range(3)
+        ],
+    }
+
+
+def _per_email(count: int, port: int) -> int:
+    """Send the way the old tasks did: parse and connect per email."""
+    sent = 0
+    for n in range(count):
+        env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), autoescape=True)
+        html = env.get_template("order_confirmation.html").render(**_context(n))
+        message = EmailMessage()
+        message["From"] = settings.email_from_address
+        message["To"] = f"buyer{n}@example.com"
+        message["Subject"] = "Order Confirmation"
+        message.set_content(html, subtype="html")
+        with smtplib.SMTP("127.0.0.1", port) as smtp:
+            smtp.send_message(message)
+        sent += 1
+    return sent
+
+
+def _engine(count: int) -> int:
+    """Send through the cached templates and the pooled batch sender."""
+    emails = [
+        OutgoingEmail(
+            to=f"buyer{n}@example.com",
+            subject="Order Confirmation",
+            html=email_service._render_template("order_confirmation.html", _context(n)),
+            template_name="order_confirmation.html",
+        )
+        for n in range(count)
+    ]
+    sent = 0
+    for start in range(0, count, settings.email_batch_size):
+        sent += sum(send_emails(emails[start:start + settings.email_batch_size]))
+    return sent
+
+
+def run(emails: int, latency_ms: float) -> dict:
+    """Send ``emails`` emails with both strategies and time them.
+
+    Args:
+        emails: Number of emails per strategy.
+        latency_ms: Relay reply latency in milliseconds.
+
+    Returns:
+        Dict with per-strategy seconds and emails per second.
+    """
+    relay = _Relay(latency_ms / 1000)
+    port, loop = _start_relay(relay)
+    settings.smtp_host = "127.0.0.1"
+    settings.smtp_port = port
+    settings.smtp_start_tls = False
+
+    result: dict = {
+        "emails": emails,
+        "latency_ms": latency_ms,
+        "pool_size": settings.smtp_pool_size,
+    }
+    strategies = (
+        ("per_email", lambda: _per_email(emails, port)),
+        ("engine", lambda: _engine(emails)),
+    )
+    for name, strategy in strategies:
+        before = relay.accepted
+        started = time.perf_counter()
+        sent = strategy()
+        elapsed = time.perf_counter() - started
+        assert sent == emails == relay.accepted - before, (name, sent, relay.accepted - before)
+        result[f"{name}_seconds"] = round(elapsed, 3)
+        result[f"{name}_per_second"] = round(emails / elapsed, 1)
+
+    result["speedup"] = round(result["per_email_seconds"] / result["engine_seconds"], 1)
+    reset_smtp_pool()
+    loop.call_soon_threadsafe(loop.stop)
+    return result
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print a JSON result line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.emails, args.latency_ms)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Load test: concurrent storefront shoppers and dashboard users over HTTP.
+
+Runs ``--users`` virtual users for ``--duration`` seconds against the API
+with ``httpx.AsyncClient`` and reports latency per step, overall
+throughput, and errors:
+
+- storefront shoppers loop: store page, catalog page, search, product
+  page, and a checkout on ``--checkout-rate`` of their visits;
+- dashboard users (``--dashboard-share`` of the users) log in once, then
+  loop: 30-day analytics dashboard, order list, unread notification
+  count.
+
+**For Developers:**
+    By default the app runs in-process (``httpx.ASGITransport``) with
+    ``get_db`` pointed at a freshly generated data set, so one command
+    measures the full request path without a server. With ``--base-url``
+    the same scenarios hit a running server instead; seed its database
+    first with ``python -m benchmarks.datagen --schema public --output
+    dataset.json`` and pass ``--dataset dataset.json``.
+
+    Users are closed-loop (each waits for its response before the next
+    request, plus ``--think-ms``). Each user draws its choices from its
+    own ``random.Random``, so runs issue the same request mix.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.bench_load --scale small --users 50 --duration 30
+
+**For QA Engineers:**
+    Any 4xx/5xx answer counts as an error and is reported per step; the
+    suite fails on errors regardless of timings.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.database import get_db
+from app.main import app
+from app.services.storefront_routing_service import reset_routing_table
+from benchmarks.bench_services import checkout_request
+from benchmarks.datagen import (
+    PASSWORD,
+    SCALES,
+    Dataset,
+    drop_schema,
+    generate,
+    make_engine,
+    reset_schema,
+)
+from benchmarks.timing import summarize
+
+API = "/api/v1"
+
+
+class _Recorder:
+    """Collects per-step latencies and errors of all virtual users."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, step: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[step] += 1
+            return None
+        self.samples[step].append(time.perf_counter() - started)
+        if resp.status_code >= 400:
+            self.errors[step] += 1
+        return resp
+
+
+async def _shopper(
+    client, recorder, dataset: Dataset, rng: random.Random, deadline: float,
+    think: float, checkout_rate: float,
+) -> None:
+    while time.perf_counter() < deadline:
+        store = rng.choice(dataset.stores)
+        base = f"{API}/public/stores/{store.slug}"
+        _, product_slug, _ = rng.choice(store.products)
+        await recorder.call(client, "store", "GET", base)
+        await recorder.call(client, "catalog", "GET", f"{base}/products",
+                            params={"page": rng.randint(1, 5)})
+        await recorder.call(client, "search", "GET", f"{base}/search",
+                            params={"query": rng.choice(dataset.search_terms)})
+        await recorder.call(client, "product", "GET", f"{base}/products/{product_slug}")
+        if rng.random() < checkout_rate:
+            body = checkout_request(store, rng.randrange(len(store.products)))
+            await recorder.call(client, "checkout", "POST", f"{base}/checkout",
+                                content=body.model_dump_json(),
+                                headers={"Content-Type": "application/json"})
+        await asyncio.sleep(think)
+
+
+async def _dashboard_user(
+    client, recorder, dataset: Dataset, rng: random.Random, deadline: float, think: float,
+) -> None:
+    store = rng.choice(dataset.stores)
+    resp = await recorder.call(client, "login", "POST", f"{API}/auth/login",
+                               json={"email": store.owner_email, "password": PASSWORD})
+    if resp is None or resp.status_code != 200:
+        return
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    while time.perf_counter() < deadline:
+        await recorder.call(client, "dashboard_analytics", "GET",
+                            f"{API}/stores/{store.id}/analytics/dashboard",
+                            params={"period": "30d"}, headers=headers)
+        await recorder.call(client, "orders", "GET", f"{API}/stores/{store.id}/orders",
+                            params={"page": rng.randint(1, 3)}, headers=headers)
+        await recorder.call(client, "unread_count", "GET",
+                            f"{API}/notifications/unread-count", headers=headers)
+        await asyncio.sleep(think)
+
+
+async def run(
+    client: httpx.AsyncClient,
+    dataset: Dataset,
+    users: int = 20,
+    duration: float = 10.0,
+    dashboard_share: float = 0.2,
+    checkout_rate: float = 0.2,
+    think_ms: float = 0.0,
+    seed: int = 42,
+) -> dict:
+    """Drive the scenarios against ``client`` and summarize them.
+
+    Args:
+        client: Client whose base URL is the API server.
+        dataset: The data set the server is serving.
+        users: Concurrent virtual users.
+        duration: Seconds to keep issuing requests.
+        dashboard_share: Fraction of users that are dashboard users.
+        checkout_rate: Fraction of shopper visits that end in a checkout.
+        think_ms: Pause between a user's visits.
+        seed: Seed of the users' random choices.
+
+    Returns:
+        Dict with ``users``, ``requests``, ``requests_per_second``,
+        ``errors``, and per-step ``steps`` statistics (each with its own
+        ``errors``).
+    """
+    recorder = _Recorder()
+    dashboards = round(users * dashboard_share)
+    think = think_ms / 1000
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(
+        _dashboard_user(client, recorder, dataset, random.Random(seed + i), deadline, think)
+        if i < dashboards else
+        _shopper(client, recorder, dataset, random.Random(seed + i), deadline, think,
+                 checkout_rate)
+        for i in range(users)
+    ))
+    elapsed = time.perf_counter() - started
+    requests = sum(len(samples) for samples in recorder.samples.values())
+    return {
+        "users": users,
+        "duration_seconds": round(elapsed, 3),
+        "requests": requests,
+        "requests_per_second": round(requests / elapsed, 1),
+        "errors": sum(recorder.errors.values()),
+        "steps": {
+            step: summarize(samples) | {"errors": recorder.errors[step]}
+            for step, samples in sorted(recorder.samples.items())
+        },
+    }
+
+
+def in_process_client(factory: async_sessionmaker) -> httpx.AsyncClient:
+    """Return a client for the in-process app serving ``factory``'s schema."""
+
+    async def bench_db():
+        async with factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db] = bench_db
+    reset_routing_table()
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60.0
+    )
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    options = dict(
+        users=args.users, duration=args.duration, dashboard_share=args.dashboard_share,
+        checkout_rate=args.checkout_rate, think_ms=args.think_ms, seed=args.seed,
+    )
+    if args.base_url:
+        with open(args.dataset) as f:
+            dataset = Dataset.from_dict(json.load(f))
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=60.0) as client:
+            return {"benchmark": "load", "load": await run(client, dataset, **options)}
+
+    engine = make_engine()
+    try:
+        await reset_schema(engine)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        dataset = await generate(factory, args.scale, args.seed)
+        async with in_process_client(factory) as client:
+            result = await run(client, dataset, **options)
+        return {"benchmark": "load", "scale": args.scale, "load": result}
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        await drop_schema(engine)
+        await engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments, run the load test, and print a JSON result line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--dashboard-share", type=float, default=0.2)
+    parser.add_argument("--checkout-rate", type=float, default=0.2)
+    parser.add_argument("--think-ms", type=float, default=0.0)
+    parser.add_argument("--base-url", help="Load a running server instead of the in-process app")
+    parser.add_argument("--dataset", help="Data set JSON from datagen --output (with --base-url)")
+    args = parser.parse_args()
+    if args.base_url and not args.dataset:
+        parser.error("--base-url needs --dataset")
+    print(json.dumps(asyncio.run(_main(args))))
+
+
+if __name__ == "__main__":
+    main()
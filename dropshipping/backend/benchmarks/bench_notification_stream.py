@@ -0,0 +1,194 @@
+"""Benchmark: thousands of idle dashboards on the notification stream.
+
+Opens ``--dashboards`` connections to ``GET /api/v1/notifications/stream``
+through the real ASGI app and keeps them idle, then measures:
+
+- the memory held per idle connection and the CPU time spent while idle;
+- Redis subscriptions used by the process (should stay at one);
+- ``--pushes`` single notifications from a worker
+  (``notifications_created_sync``) to random dashboards, end to end
+  through Redis pub/sub, the hub, and the SSE response;
+- one broadcast round that pushes a notification to every dashboard.
+
+**For Developers:**
+    Needs Redis, but no database: the stream's authentication dependency
+    is overridden to take the user from an ``X-Bench-User`` header.
+    Connections are driven with raw ASGI messages on one event loop, as
+    the dashboards would be served by one API worker process.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.bench_notification_stream --dashboards 5000
+
+**For QA Engineers:**
+    The script checks every push reached its dashboard and that closing
+    the connections empties the hub before reporting results.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from fastapi import Request
+
+from app.api.notifications import _stream_subscriber
+from app.main import app
+from app.redis_client import get_redis
+from app.services.notification_push_service import (
+    CHANNEL,
+    get_notification_hub,
+    listen_for_notifications,
+    notifications_created_sync,
+)
+
+
+async def _bench_subscriber(request: Request) -> tuple[uuid.UUID, int]:
+    """Stand-in for token authentication."""
+    return uuid.UUID(request.headers["x-bench-user"]), 0
+
+
+class _Dashboard:
+    """One connected dashboard, driven with raw ASGI messages."""
+
+    def __init__(self, user_id: uuid.UUID) -> None:
+        self.user_id = user_id
+        self.events: asyncio.Queue = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self._requested = False
+        self.task: asyncio.Task | None = None
+
+    async def _receive(self) -> dict:
+        if not self._requested:
+            self._requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: dict) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            self.events.put_nowait((time.perf_counter(), message["body"]))
+
+    def connect(self) -> None:
+        """Start the request."""
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/notifications/stream",
+            "raw_path": b"/api/v1/notifications/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"x-bench-user", str(self.user_id).encode())],
+            "client": ("127.0.0.1", 1),
+            "server": ("bench", 80),
+        }
+        self.task = asyncio.create_task(app(scope, self._receive, self._send))
+
+
+def _push(user_ids: list[uuid.UUID]) -> None:
+    """Publish one notification per user, as a Celery task would."""
+    notifications_created_sync([
+        {"id": str(uuid.uuid4()), "user_id": str(user_id), "title": "Bench"}
+        for user_id in user_ids
+    ])
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+async def _run(dashboards: int, pushes: int, idle_seconds: float) -> dict:
+    app.dependency_overrides[_stream_subscriber] = _bench_subscriber
+    listener = asyncio.create_task(listen_for_notifications())
+    while not (await get_redis().pubsub_numsub(CHANNEL))[0][1]:
+        await asyncio.sleep(0.01)
+    hub = get_notification_hub()
+    result: dict = {"dashboards": dashboards}
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    clients = [_Dashboard(uuid.uuid4()) for _ in range(dashboards)]
+    for dashboard in clients:
+        dashboard.connect()
+    await asyncio.gather(*(dashboard.events.get() for dashboard in clients))
+    result["connect_seconds"] = round(time.perf_counter() - started, 3)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["bytes_per_idle_connection"] = (after - before) // dashboards
+    result["hub_connections"] = hub.connections
+    result["redis_subscriptions"] = (await get_redis().pubsub_numsub(CHANNEL))[0][1]
+
+    cpu = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    result["idle_cpu_ms"] = _ms(time.process_time() - cpu)
+    result["idle_seconds"] = idle_seconds
+
+    latencies = []
+    for _ in range(pushes):
+        target = random.choice(clients)
+        sent = time.perf_counter()
+        await asyncio.to_thread(_push, [target.user_id])
+        received, body = await asyncio.wait_for(target.events.get(), 10)
+        assert body.startswith(b"event: notification"), body
+        latencies.append(received - sent)
+    result["push_p50_ms"] = _ms(statistics.median(latencies))
+    result["push_max_ms"] = _ms(max(latencies))
+
+    sent = time.perf_counter()
+    await asyncio.to_thread(_push, [dashboard.user_id for dashboard in clients])
+    arrivals = await asyncio.wait_for(
+        asyncio.gather(*(dashboard.events.get() for dashboard in clients)), 60
+    )
+    result["broadcast_seconds"] = round(max(at for at, _ in arrivals) - sent, 3)
+    result["broadcast_per_second"] = round(dashboards / result["broadcast_seconds"], 1)
+    # The dashboard polled /unread-count once a minute per open tab.
+    result["count_queries_per_second_avoided"] = round(dashboards / 60, 1)
+
+    for dashboard in clients:
+        dashboard.disconnected.set()
+    await asyncio.gather(*(dashboard.task for dashboard in clients))
+    assert hub.connections == 0, hub.connections
+
+    listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await listener
+    app.dependency_overrides.pop(_stream_subscriber, None)
+    return result
+
+
+def run(dashboards: int, pushes: int, idle_seconds: float) -> dict:
+    """Connect ``dashboards`` idle streams and measure pushes to them.
+
+    Args:
+        dashboards: Number of concurrently connected dashboards.
+        pushes: Single-dashboard pushes to time.
+        idle_seconds: How long the connections sit idle before pushing.
+
+    Returns:
+        Dict with connection cost, idle CPU, push latency and broadcast
+        throughput.
+    """
+    return asyncio.run(_run(dashboards, pushes, idle_seconds))
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print a JSON result line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dashboards", type=int, default=5000)
+    parser.add_argument("--pushes", type=int, default=50)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.dashboards, args.pushes, args.idle_seconds)))
+
+
+if __name__ == "__main__":
+    main()
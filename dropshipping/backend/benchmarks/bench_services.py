@@ -0,0 +1,206 @@
+"""Micro-benchmarks of the hot service functions.
+
+Times, one call after another against a generated data set:
+
+- ``search_products``: storefront search, rotating ``Dataset.search_terms``;
+- ``list_public_products``: a storefront catalog page (rotating pages);
+- ``create_checkout``: the full public checkout path (cart validation,
+  tax, order creation), rolled back after every call;
+- ``dashboard_analytics``: ``get_dashboard_analytics`` for 30 days;
+- ``webhook_dispatch``: the ``dispatch_webhook_event`` task for one event
+  fanned out to ``--webhooks`` endpoints on local stub receivers.
+
+**For Developers:**
+    Every call gets a fresh session from the benchmark engine, as a
+    request would. Route functions are called directly with explicit
+    arguments, so FastAPI's request handling is not part of these numbers
+    (``bench_load`` covers it). The webhook task runs in a worker thread
+    with ``SyncSessionFactory`` pointed at the benchmark schema.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.bench_services --scale small --rounds 50
+
+**For QA Engineers:**
+    Each benchmark checks its first answer (results found, checkout
+    created, every webhook delivered) before timing starts.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import uuid
+from unittest.mock import patch
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.api.public import create_checkout, list_public_products
+from app.models.webhook import StoreWebhook
+from app.schemas.order import CheckoutRequest
+from app.services.analytics_service import get_dashboard_analytics
+from app.services.search_service import search_products
+from app.services.storefront_routing_service import reset_routing_table
+from app.tasks import webhook_tasks
+from benchmarks.bench_webhook_delivery import start_receivers, stop_receivers
+from benchmarks.datagen import (
+    SCALES,
+    BenchStore,
+    Dataset,
+    drop_schema,
+    generate,
+    make_engine,
+    make_sync_engine,
+    reset_schema,
+)
+from benchmarks.timing import time_async
+
+WEBHOOK_EVENT = "order.paid"
+
+
+def checkout_request(store: BenchStore, index: int) -> CheckoutRequest:
+    """Build the ``index``-th deterministic two-item cart for a store."""
+    products = store.products
+    return CheckoutRequest(
+        customer_email=f"checkout{index}@bench.example.com",
+        items=[
+            {"product_id": product_id, "variant_id": variant_id, "quantity": 1}
+            for product_id, _, variant_id in (
+                products[index % len(products)], products[(index + 1) % len(products)]
+            )
+        ],
+        shipping_address={
+            "name": "Bench Customer",
+            "line1": "1 Main St",
+            "city": "Austin",
+            "state": "TX",
+            "postal_code": "73301",
+            "country": "US",
+        },
+    )
+
+
+async def _add_webhooks(
+    factory: async_sessionmaker, store_id: str, urls: list[str], count: int
+) -> None:
+    """Subscribe ``count`` endpoints, spread over ``urls``, to the event."""
+    async with factory() as db:
+        await db.execute(insert(StoreWebhook), [
+            {
+                "store_id": uuid.UUID(store_id),
+                "url": urls[i % len(urls)],
+                "secret": f"whsec_bench_{i}",
+                "events": [WEBHOOK_EVENT],
+            }
+            for i in range(count)
+        ])
+        await db.commit()
+
+
+async def run(
+    dataset: Dataset,
+    factory: async_sessionmaker,
+    sync_factory: sessionmaker,
+    rounds: int = 50,
+    webhooks: int = 20,
+) -> dict:
+    """Run every service micro-benchmark against a seeded data set.
+
+    Args:
+        dataset: The generated data set.
+        factory: Async session factory of the data set's schema.
+        sync_factory: Sync session factory of the same schema.
+        rounds: Timed calls per benchmark.
+        webhooks: Endpoints subscribed to the dispatched event.
+
+    Returns:
+        Dict mapping benchmark name to its ``summarize`` statistics.
+    """
+    store = dataset.stores[0]
+    store_id, owner_id = uuid.UUID(store.id), uuid.UUID(store.owner_id)
+    reset_routing_table()
+
+    async def in_session(call):
+        async with factory() as db:
+            try:
+                return await call(db)
+            finally:
+                await db.rollback()
+
+    terms = itertools.cycle(dataset.search_terms)
+    pages = itertools.cycle(range(1, 6))
+    carts = itertools.count()
+
+    def search():
+        return in_session(lambda db: search_products(db, store_id, next(terms)))
+
+    def catalog():
+        return in_session(lambda db: list_public_products(
+            store.slug, page=next(pages), per_page=20, currency=None, db=db
+        ))
+
+    def checkout():
+        return in_session(lambda db: create_checkout(
+            store.slug, checkout_request(store, next(carts)), db=db
+        ))
+
+    def analytics():
+        return in_session(lambda db: get_dashboard_analytics(db, store_id, owner_id, "30d"))
+
+    def dispatch():
+        with patch.object(webhook_tasks, "SyncSessionFactory", sync_factory):
+            return webhook_tasks.dispatch_webhook_event.run(
+                store.id, WEBHOOK_EVENT, {"order_id": str(uuid.uuid4()), "total": "49.99"}
+            )
+
+    _, total, _ = await search()
+    assert total > 0, "search found nothing"
+    assert (await checkout()).order_id
+
+    urls, loop = start_receivers([(0.002, 200)] * 4)
+    try:
+        await _add_webhooks(factory, store.id, urls, webhooks)
+        first = await asyncio.to_thread(dispatch)
+        assert first["success_count"] == webhooks, first
+
+        return {
+            "search_products": await time_async(search, rounds),
+            "list_public_products": await time_async(catalog, rounds),
+            "create_checkout": await time_async(checkout, rounds),
+            "dashboard_analytics": await time_async(analytics, rounds),
+            "webhook_dispatch": await time_async(lambda: asyncio.to_thread(dispatch), rounds),
+        }
+    finally:
+        stop_receivers(loop)
+
+
+async def _main(scale: str, seed: int, rounds: int, webhooks: int) -> dict:
+    engine = make_engine()
+    sync_engine = make_sync_engine()
+    try:
+        await reset_schema(engine)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        dataset = await generate(factory, scale, seed)
+        result = await run(dataset, factory, sessionmaker(bind=sync_engine), rounds, webhooks)
+        return {"benchmark": "services", "scale": scale, "services": result}
+    finally:
+        await drop_schema(engine)
+        await engine.dispose()
+        sync_engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks, and print a JSON result line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--webhooks", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_main(args.scale, args.seed, args.rounds, args.webhooks))))
+
+
+if __name__ == "__main__":
+    main()
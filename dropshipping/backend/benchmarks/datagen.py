@@ -0,0 +1,420 @@
+"""Deterministic benchmark data: stores, catalogs, customers and orders.
+
+Generates the same data set for the same ``--scale`` and ``--seed`` on
+every run, so timings from different commits (and machines) are measured
+against identical catalogs and order books.
+
+**For Developers:**
+    - ``SCALES`` are the named presets; ``Scale`` counts are per store.
+      ``tiny`` is a smoke test, ``small`` is what the committed baselines
+      are recorded at.
+    - Every ID, title, price and timestamp comes from one
+      ``random.Random(seed)``. Timestamps are spread over the ``days``
+      closed days before today (UTC), so period-based analytics always have
+      data; the same seed yields identical rows, only shifted to end
+      today. ``Dataset.fingerprint`` hashes every generated row (with
+      timestamps relative to today) and so proves it across days.
+    - Rows are bulk inserted with Core ``insert()`` in chunks of
+      ``_CHUNK`` rows. Titles combine an adjective and a noun from fixed
+      lists, so ``Dataset.search_terms`` match a predictable share of the
+      catalog. Variants do not track inventory, so checkouts never run
+      out of stock.
+    - After seeding, closed days are rolled up with
+      ``analytics_rollup_service`` exactly as the nightly task would.
+    - Data lives in its own schema (``SCHEMA`` by default). ``make_engine``
+      and ``make_sync_engine`` return engines whose connections use it.
+
+    Seed a schema for a separately started server and save the data set
+    description for ``bench_load --dataset``::
+
+        python -m benchmarks.datagen --scale small --schema public --output dataset.json
+
+**For QA Engineers:**
+    Every store has one owner (``owner_email`` / ``PASSWORD``), active
+    products with ``variants`` variants each, customer accounts, and
+    orders in every status. The command prints the row counts and the
+    fingerprint.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import Base
+from app.models import *  # noqa: F401,F403
+from app.models.customer import CustomerAccount
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product, ProductStatus, ProductVariant
+from app.models.store import Store
+from app.models.user import User
+from app.services.analytics_rollup_service import rollup_closed_days_sync
+from app.services.auth_service import hash_password
+
+SCHEMA = "dropshipping_bench"
+
+PASSWORD = "benchpass123"
+"""Password of every generated store owner and customer."""
+
+_CHUNK = 5000
+
+_ADJECTIVES = [
+    "Wireless", "Organic", "Vintage", "Portable", "Premium", "Compact", "Handmade",
+    "Smart", "Classic", "Ergonomic", "Waterproof", "Minimalist",
+]
+_NOUNS = [
+    "Headphones", "Yoga Mat", "Backpack", "Desk Lamp", "Water Bottle", "Phone Case",
+    "Notebook", "Sunglasses", "Coffee Grinder", "Pet Bed", "Wall Clock", "Candle",
+    "Keyboard", "Plant Pot", "Watch Strap", "Blender",
+]
+_NICHES = ["home", "fitness", "tech", "pets", "outdoor"]
+_VARIANTS = ["Small", "Medium", "Large", "Black", "White", "Blue"]
+
+# Order status mix: (status, weight).
+_STATUS_MIX = [
+    (OrderStatus.pending, 5),
+    (OrderStatus.paid, 40),
+    (OrderStatus.shipped, 20),
+    (OrderStatus.delivered, 30),
+    (OrderStatus.cancelled, 5),
+]
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of a generated data set; every count except ``stores`` is per store."""
+
+    stores: int
+    products: int
+    variants: int
+    customers: int
+    orders: int
+    days: int = 90
+
+
+SCALES = {
+    "tiny": Scale(stores=1, products=200, variants=2, customers=50, orders=300, days=30),
+    "small": Scale(stores=2, products=2_000, variants=2, customers=500, orders=5_000),
+    "medium": Scale(stores=5, products=20_000, variants=3, customers=5_000, orders=50_000),
+    "large": Scale(
+        stores=10, products=100_000, variants=3, customers=50_000, orders=250_000, days=365
+    ),
+}
+
+
+@dataclass
+class BenchStore:
+    """One generated store and the handles scenarios need to drive it.
+
+    Attributes:
+        id: The store's UUID string.
+        slug: The store's URL slug.
+        owner_id: The store owner's UUID string.
+        owner_email: Login of the store owner (password ``PASSWORD``).
+        products: Sample of ``[product_id, product_slug, variant_id]``
+            triples (strings) for product pages and carts.
+    """
+
+    id: str
+    slug: str
+    owner_id: str
+    owner_email: str
+    products: list[list[str]] = field(default_factory=list)
+
+
+@dataclass
+class Dataset:
+    """Description of a generated data set.
+
+    Attributes:
+        scale: Name of the scale preset.
+        seed: Random seed the data was generated from.
+        stores: The generated stores.
+        search_terms: Queries for search scenarios (the last one matches
+            nothing).
+        rows: Rows inserted per table.
+        fingerprint: SHA-256 over every generated row.
+    """
+
+    scale: str
+    seed: int
+    stores: list[BenchStore]
+    search_terms: list[str]
+    rows: dict[str, int]
+    fingerprint: str
+
+    def to_dict(self) -> dict:
+        """Return the data set as JSON-serializable dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Dataset":
+        """Rebuild a data set saved with ``to_dict``."""
+        return cls(**(data | {"stores": [BenchStore(**s) for s in data["stores"]]}))
+
+
+def make_engine(schema: str = SCHEMA) -> AsyncEngine:
+    """Create a pooled async engine whose connections use ``schema``.
+
+    Pooled like the app's engine, so timings do not include connecting.
+    """
+    engine = create_async_engine(settings.database_url, pool_size=20, max_overflow=20)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_search_path(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.close()
+
+    return engine
+
+
+def make_sync_engine(schema: str = SCHEMA):
+    """Create a pooled sync engine (as Celery tasks use) whose connections use ``schema``."""
+    engine = create_engine(settings.database_url_sync, pool_size=5, max_overflow=10)
+
+    @event.listens_for(engine, "connect")
+    def set_search_path(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.close()
+
+    return engine
+
+
+async def reset_schema(engine: AsyncEngine, schema: str = SCHEMA) -> None:
+    """Drop and recreate ``schema`` with every table."""
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def drop_schema(engine: AsyncEngine, schema: str = SCHEMA) -> None:
+    """Drop ``schema`` and everything in it."""
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+
+
+class _Generator:
+    """Builds the rows of one data set from a single seeded RNG."""
+
+    def __init__(self, scale: Scale, seed: int, today: date) -> None:
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.midnight = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+        self.digest = hashlib.sha256()
+        self.tables: dict[str, list[dict]] = {
+            "users": [], "stores": [], "products": [], "product_variants": [],
+            "customer_accounts": [], "orders": [], "order_items": [],
+        }
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _stable(self, value) -> str:
+        if isinstance(value, datetime):
+            return f"today{(value - self.midnight).total_seconds():+}"
+        return str(value)
+
+    def _add(self, table: str, row: dict) -> dict:
+        self.digest.update(json.dumps(row, default=self._stable, sort_keys=True).encode())
+        self.tables[table].append(row)
+        return row
+
+    def _timestamp(self) -> datetime:
+        day = self.midnight - timedelta(days=self.rng.randint(1, self.scale.days))
+        return day + timedelta(seconds=self.rng.randrange(24 * 3600))
+
+    def store(self, index: int) -> BenchStore:
+        """Generate one store with its owner, catalog, customers and orders."""
+        owner = self._add("users", {
+            "id": self._uuid(),
+            "email": f"owner{index}@bench.example.com",
+            "is_active": True,
+        })
+        store = self._add("stores", {
+            "id": self._uuid(),
+            "user_id": owner["id"],
+            "name": f"Bench Store {index}",
+            "slug": f"bench-store-{index}",
+            "niche": _NICHES[index % len(_NICHES)],
+        })
+        catalog = [self._product(store["id"], i) for i in range(self.scale.products)]
+        customers = [
+            self._add("customer_accounts", {
+                "id": self._uuid(),
+                "store_id": store["id"],
+                "email": f"customer{i}.store{index}@bench.example.com",
+                "first_name": "Customer",
+                "last_name": str(i),
+            })["email"]
+            for i in range(self.scale.customers)
+        ]
+        for _ in range(self.scale.orders):
+            self._order(store["id"], catalog, customers)
+
+        sample = self.rng.sample(catalog, min(200, len(catalog)))
+        return BenchStore(
+            id=str(store["id"]),
+            slug=store["slug"],
+            owner_id=str(owner["id"]),
+            owner_email=owner["email"],
+            products=[[str(p["id"]), p["slug"], str(v["id"])] for p, v in
+                      ((p, self.rng.choice(p["variants"])) for p in sample)],
+        )
+
+    def _product(self, store_id: uuid.UUID, index: int) -> dict:
+        adjective, noun = self.rng.choice(_ADJECTIVES), self.rng.choice(_NOUNS)
+        price = Decimal(self.rng.randrange(500, 20_000)) / 100
+        product = self._add("products", {
+            "id": self._uuid(),
+            "store_id": store_id,
+            "title": f"{adjective} {noun} {index}",
+            "slug": f"{adjective}-{noun}-{index}".lower().replace(" ", "-"),
+            "description": f"A {adjective.lower()} {noun.lower()} for everyday use.",
+            "price": price,
+            "cost": (price * Decimal("0.4")).quantize(Decimal("0.01")),
+            "status": ProductStatus.active,
+            "images": [f"https://img.example.com/{index}.png"],
+            "tags": [noun.lower()],
+            "created_at": self._timestamp(),
+        })
+        product["variants"] = [
+            self._add("product_variants", {
+                "id": self._uuid(),
+                "product_id": product["id"],
+                "name": name,
+                "sku": f"{product['slug']}-{name}".lower(),
+                "price": price,
+                "inventory_count": 1_000_000,
+                "track_inventory": False,
+            })
+            for name in self.rng.sample(_VARIANTS, self.scale.variants)
+        ]
+        return product
+
+    def _order(self, store_id: uuid.UUID, catalog: list[dict], customers: list[str]) -> None:
+        status = self.rng.choices(
+            [s for s, _ in _STATUS_MIX], weights=[w for _, w in _STATUS_MIX]
+        )[0]
+        created_at = self._timestamp()
+        order_id = self._uuid()
+        items = []
+        for _ in range(self.rng.randint(1, 3)):
+            product = self.rng.choice(catalog)
+            variant = self.rng.choice(product["variants"])
+            items.append(self._add("order_items", {
+                "id": self._uuid(),
+                "order_id": order_id,
+                "product_id": product["id"],
+                "variant_id": variant["id"],
+                "product_title": product["title"],
+                "variant_name": variant["name"],
+                "quantity": self.rng.randint(1, 3),
+                "unit_price": product["price"],
+                "created_at": created_at,
+            }))
+        total = sum(item["unit_price"] * item["quantity"] for item in items)
+        paid = status not in (OrderStatus.pending, OrderStatus.cancelled)
+        self._add("orders", {
+            "id": order_id,
+            "store_id": store_id,
+            "customer_email": self.rng.choice(customers),
+            "status": status,
+            "total": total,
+            "subtotal": total,
+            "paid_at": created_at if paid else None,
+            "shipped_at": (
+                created_at + timedelta(days=1)
+                if status in (OrderStatus.shipped, OrderStatus.delivered) else None
+            ),
+            "delivered_at": (
+                created_at + timedelta(days=5) if status == OrderStatus.delivered else None
+            ),
+            "created_at": created_at,
+        })
+
+
+async def generate(
+    factory: async_sessionmaker, scale_name: str = "small", seed: int = 42
+) -> Dataset:
+    """Generate and insert a data set, then roll up closed analytics days.
+
+    Args:
+        factory: Session factory bound to an empty schema.
+        scale_name: Key of ``SCALES``.
+        seed: Random seed.
+
+    Returns:
+        The Dataset description.
+    """
+    scale = SCALES[scale_name]
+    generator = _Generator(scale, seed, datetime.now(timezone.utc).date())
+    stores = [generator.store(i) for i in range(scale.stores)]
+
+    hashed = hash_password(PASSWORD)
+    models = {
+        "users": User, "stores": Store, "products": Product,
+        "product_variants": ProductVariant, "customer_accounts": CustomerAccount,
+        "orders": Order, "order_items": OrderItem,
+    }
+    async with factory() as db:
+        for table, model in models.items():
+            rows = generator.tables[table]
+            if table in ("users", "customer_accounts"):
+                rows = [row | {"hashed_password": hashed} for row in rows]
+            if table == "products":
+                rows = [{k: v for k, v in row.items() if k != "variants"} for row in rows]
+            for start in range(0, len(rows), _CHUNK):
+                await db.execute(insert(model), rows[start:start + _CHUNK])
+        await db.run_sync(rollup_closed_days_sync)
+        await db.commit()
+        await db.execute(text("ANALYZE"))
+
+    return Dataset(
+        scale=scale_name,
+        seed=seed,
+        stores=stores,
+        search_terms=[_NOUNS[0].lower(), _ADJECTIVES[1].lower(), "lamp", "zzz-no-match"],
+        rows={table: len(rows) for table, rows in generator.tables.items()},
+        fingerprint=generator.digest.hexdigest(),
+    )
+
+
+async def _main(scale: str, seed: int, schema: str, output: str | None) -> dict:
+    engine = make_engine(schema)
+    try:
+        await reset_schema(engine, schema)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        dataset = await generate(factory, scale, seed)
+    finally:
+        await engine.dispose()
+    if output:
+        with open(output, "w") as f:
+            json.dump(dataset.to_dict(), f, indent=2)
+    return {"scale": scale, "schema": schema, "rows": dataset.rows, "fingerprint": dataset.fingerprint}
+
+
+def main() -> None:
+    """Parse arguments, seed the schema, and print a JSON summary line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--schema", default=SCHEMA, help="Schema to (re)create and fill")
+    parser.add_argument("--output", help="Write the data set description to this JSON file")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(_main(args.scale, args.seed, args.schema, args.output))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark suite: service micro-benchmarks and load test with baselines.
+
+Generates one data set, runs ``bench_services`` and ``bench_load``
+against it, and compares the result with the committed baseline of the
+scale (``benchmarks/baselines/<scale>.json``). Exits with status 1 when a
+tracked metric regressed past its tolerance or any load request failed.
+
+**For Developers:**
+    Needs the local PostgreSQL and Redis from ``docker-compose`` (the
+    ``DATABASE_URL`` / ``REDIS_URL`` settings); data lives in the
+    ``dropshipping_bench`` schema, which is dropped afterwards. Record a
+    new baseline after an intended performance change, or on new
+    reference hardware, with ``--update-baseline``.
+
+    Run from ``dropshipping/backend``::
+
+        python -m benchmarks.suite --scale small
+        python -m benchmarks.suite --scale small --update-baseline
+
+**For QA Engineers:**
+    The printed report holds the full result, the data set fingerprint,
+    and a ``regressions`` list naming each slower metric with its
+    baseline value, new value and relative change.
+
+**For Project Managers:**
+    Slowdowns of search, catalog, checkout, analytics and webhook
+    dispatch are caught when they are introduced, not by store owners.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.main import app
+from benchmarks import baseline, bench_load, bench_services
+from benchmarks.datagen import (
+    SCALES,
+    drop_schema,
+    generate,
+    make_engine,
+    make_sync_engine,
+    reset_schema,
+)
+
+
+async def run(scale: str, seed: int, rounds: int, users: int, duration: float) -> dict:
+    """Generate the data set and run every benchmark against it.
+
+    Args:
+        scale: Key of ``datagen.SCALES``.
+        seed: Data set and scenario seed.
+        rounds: Timed calls per service micro-benchmark.
+        users: Concurrent virtual users of the load test.
+        duration: Load test length in seconds.
+
+    Returns:
+        Dict with ``dataset`` (scale, seed, rows, fingerprint),
+        ``services`` and ``load`` results.
+    """
+    engine = make_engine()
+    sync_engine = make_sync_engine()
+    try:
+        await reset_schema(engine)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        dataset = await generate(factory, scale, seed)
+        services = await bench_services.run(
+            dataset, factory, sessionmaker(bind=sync_engine), rounds
+        )
+        async with bench_load.in_process_client(factory) as client:
+            load = await bench_load.run(client, dataset, users=users, duration=duration, seed=seed)
+        return {
+            "dataset": {
+                "scale": scale, "seed": seed, "rows": dataset.rows,
+                "fingerprint": dataset.fingerprint,
+            },
+            "services": services,
+            "load": load,
+        }
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        await drop_schema(engine)
+        await engine.dispose()
+        sync_engine.dispose()
+
+
+def main() -> None:
+    """Run the suite, print the JSON report, and exit 1 on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Record this run as the scale's baseline")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.scale, args.seed, args.rounds, args.users, args.duration))
+    metrics = {"services": result["services"], "load": result["load"]}
+    report = {"result": result, "errors": result["load"]["errors"]}
+
+    if args.update_baseline:
+        environment = result["dataset"] | {
+            "rounds": args.rounds, "users": args.users, "duration": args.duration,
+        }
+        report["baseline"] = str(baseline.record(args.scale, metrics, environment))
+        report["regressions"] = []
+    else:
+        recorded = baseline.load(args.scale)
+        if recorded is None:
+            report["baseline"] = None
+            report["regressions"] = []
+        else:
+            report["baseline"] = recorded["recorded_at"]
+            if recorded["environment"].get("fingerprint") != result["dataset"]["fingerprint"]:
+                report["warning"] = "data set differs from the baseline's"
+            report["regressions"] = baseline.compare(metrics, recorded)
+
+    print(json.dumps(report, indent=2))
+    if report["errors"] or report["regressions"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Latency sampling and summary statistics shared by the benchmarks.
+
+**For Developers:**
+    ``time_async`` runs a coroutine factory ``warmup`` times untimed and
+    then ``rounds`` times timed, one call after another, as a
+    micro-benchmark; ``summarize`` turns any list of samples (seconds) into
+    the millisecond statistics that results and baselines use. Metric
+    names ending in ``_ms`` are latencies and ``_per_second`` are
+    throughputs; ``baseline`` relies on these suffixes.
+"""
+
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+
+def summarize(samples: list[float]) -> dict:
+    """Summarize latency samples.
+
+    Args:
+        samples: Durations in seconds (at least one).
+
+    Returns:
+        Dict with ``rounds``, ``mean_ms``, ``p50_ms``, ``p95_ms`` and
+        ``max_ms``.
+    """
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return {
+        "rounds": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def time_async(
+    call: Callable[[], Awaitable[object]], rounds: int, warmup: int = 3
+) -> dict:
+    """Time repeated awaits of ``call()``.
+
+    Args:
+        call: Zero-argument function returning a new awaitable per call.
+        rounds: Timed calls.
+        warmup: Untimed calls first (fills caches and connection pools).
+
+    Returns:
+        The ``summarize`` statistics of the timed calls.
+    """
+    for _ in range(warmup):
+        await call()
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return summarize(samples)
@@ -181,12 +181,15 @@ async def truncate_tables():
     that could block TRUNCATE's AccessExclusiveLock. Uses unqualified
     table names; the search_path resolves each table within the
     dropshipping_test schema. Retries up to 3 times on transient
-    connection errors.
+    connection errors. Also empties the storefront routing table, which
+    would otherwise keep routes to the previous test's stores.
     """
     # Dispose the app's engine to prevent its pooled connections from
     # interfering with the test schema operations.
     from app.database import engine as app_engine
+    from app.services.storefront_routing_service import reset_routing_table
     await app_engine.dispose()
+    reset_routing_table()
 
     table_names = ", ".join(
         f'"{t.name}"' for t in reversed(Base.metadata.sorted_tables)
@@ -213,6 +216,17 @@ async def db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+def session_factory():
+    """Provide the test session factory for tests that need several
+    independent sessions (e.g. concurrency tests simulating many buyers).
+
+    Returns:
+        async_sessionmaker bound to the test schema engine.
+    """
+    return _session_factory
+
+
 @pytest_asyncio.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Provide an httpx AsyncClient for API testing.
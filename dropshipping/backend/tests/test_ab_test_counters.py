@@ -0,0 +1,192 @@
+"""Tests for cached A/B test assignment, buffered event counters, and stats.
+
+Covers ``ab_test_service.get_assigned_variant``, ``record_event`` with
+its Redis counters and their flush, and ``get_test_stats``.
+
+**For Developers:**
+    Tests use the ``db`` fixture and the Redis from ``REDIS_URL``. The
+    ``counters`` fixture clears the global counter hashes before and after
+    each test. Flushes run the task's drain/apply/ack steps through
+    ``db.run_sync``.
+
+**For QA Engineers:**
+    - Assignment is deterministic, follows the weights, and does not
+      reload the test until a change to it commits.
+    - A test is not found under another store's URL.
+    - Events reach the variant rows on flush; stats include them before.
+    - Without Redis, events are written to the variant rows directly.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.models.ab_test import ABTestVariant
+from app.models.store import Store
+from app.models.user import User
+from app.redis_client import get_sync_redis
+from app.services import ab_test_service
+from app.services.ab_test_service import (
+    ack_event_counters_sync,
+    apply_event_counters_sync,
+    create_test,
+    drain_event_counters_sync,
+    get_assigned_variant,
+    get_test_stats,
+    record_event,
+    update_test,
+)
+
+
+@pytest.fixture
+def counters():
+    """Start and end without buffered counters."""
+    redis = get_sync_redis()
+    keys = (ab_test_service.PENDING_COUNTERS_KEY, ab_test_service.FLUSHING_COUNTERS_KEY)
+    redis.delete(*keys)
+    yield redis
+    redis.delete(*keys)
+
+
+async def _running_test(db, weights=(50, 50)):
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="AB Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    test = await create_test(
+        db, store.id, user.id, "Headline",
+        variants=[{"name": f"v{i}", "weight": w} for i, w in enumerate(weights)],
+    )
+    await update_test(db, store.id, user.id, test.id, status="running")
+    control, treatment = sorted(test.variants, key=lambda v: not v.is_control)[:2]
+    return store, test, control, treatment
+
+
+def _flush(session):
+    counters = drain_event_counters_sync()
+    updated = apply_event_counters_sync(session, counters)
+    session.commit()
+    ack_event_counters_sync()
+    return updated
+
+
+async def test_assignment_is_deterministic_weighted_and_cached(db):
+    """Same visitor, same variant; splits follow weights; one load."""
+    _, test, _, _ = await _running_test(db, weights=(90, 10))
+
+    with patch.object(ab_test_service, "_compile", wraps=ab_test_service._compile) as compile_:
+        picks = [
+            (await get_assigned_variant(db, test.id, f"visitor-{n}")).name for n in range(4000)
+        ]
+        assert compile_.call_count == 1
+    assert 0.87 < picks.count("v0") / len(picks) < 0.93
+    assert (await get_assigned_variant(db, test.id, "visitor-7")).name == picks[7]
+
+
+async def test_status_change_is_seen_on_next_event(db, counters):
+    """Pausing a test rejects events without waiting for the TTL."""
+    store, test, control, _ = await _running_test(db)
+    await record_event(db, test.id, control.id, "impression")
+
+    await update_test(db, store.id, store.user_id, test.id, status="paused")
+    await db.commit()
+    with pytest.raises(ValueError, match="not running"):
+        await record_event(db, test.id, control.id, "impression")
+    with pytest.raises(ValueError, match="Variant not found"):
+        await record_event(db, test.id, uuid.uuid4(), "impression")
+
+
+async def test_rolled_back_change_keeps_the_definition(db, counters):
+    """Invalidation waits for the commit; a rollback leaves the cache alone."""
+    store, test, control, _ = await _running_test(db)
+    store_id, user_id, test_id, control_id = store.id, store.user_id, test.id, control.id
+    await db.commit()
+    await record_event(db, test_id, control_id, "impression")
+
+    with patch.object(ab_test_service, "_compile", wraps=ab_test_service._compile) as compile_:
+        await update_test(db, store_id, user_id, test_id, status="paused")
+        await record_event(db, test_id, control_id, "impression")
+        await db.rollback()
+        await record_event(db, test_id, control_id, "impression")
+        assert compile_.call_count == 0
+
+
+async def test_store_scope_hides_other_stores_tests(db):
+    """A test is only found under the store that owns it."""
+    store, test, control, _ = await _running_test(db)
+    assert (await get_assigned_variant(db, test.id, "v-1", store_id=store.id)).id in {
+        v.id for v in test.variants
+    }
+    with pytest.raises(ValueError, match="A/B test not found"):
+        await get_assigned_variant(db, test.id, "v-1", store_id=uuid.uuid4())
+    with pytest.raises(ValueError, match="A/B test not found"):
+        await record_event(db, test.id, control.id, "impression", store_id=uuid.uuid4())
+
+
+async def test_events_are_buffered_until_flush(db, counters):
+    """Counters reach the variant rows on flush; stats see them before."""
+    store, test, control, treatment = await _running_test(db)
+    for _ in range(3):
+        await record_event(db, test.id, control.id, "impression")
+    await record_event(db, test.id, treatment.id, "impression")
+    await record_event(db, test.id, treatment.id, "conversion", Decimal("12.345"))
+
+    await db.refresh(treatment)
+    assert (treatment.impressions, treatment.conversions) == (0, 0)
+    before = await get_test_stats(db, store.id, store.user_id, test.id)
+    assert (before["total_impressions"], before["total_conversions"]) == (4, 1)
+
+    assert await db.run_sync(_flush) == 2
+    await db.refresh(control)
+    await db.refresh(treatment)
+    assert control.impressions == 3
+    assert (treatment.impressions, treatment.conversions) == (1, 1)
+    assert treatment.revenue == Decimal("12.35")
+    assert await get_test_stats(db, store.id, store.user_id, test.id) == before
+    assert await db.run_sync(_flush) == 0
+
+
+async def test_without_redis_events_write_through(db, counters):
+    """A Redis outage adds the event to the variant row."""
+    _, test, control, _ = await _running_test(db)
+    broken = MagicMock()
+    broken.get.side_effect = RedisError("down")
+    broken.pipeline.return_value.execute.side_effect = RedisError("down")
+    with patch.object(ab_test_service, "get_redis", return_value=broken):
+        await record_event(db, test.id, control.id, "conversion", Decimal("5"))
+
+    await db.refresh(control)
+    assert (control.conversions, control.revenue) == (1, Decimal("5.00"))
+
+
+async def test_stats_significance_from_counters(db, counters):
+    """A clearly better treatment is significant and wins."""
+    store, test, control, treatment = await _running_test(db)
+    await db.execute(
+        ABTestVariant.__table__.update()
+        .where(ABTestVariant.id == control.id)
+        .values(impressions=1000, conversions=100)
+    )
+    await db.execute(
+        ABTestVariant.__table__.update()
+        .where(ABTestVariant.id == treatment.id)
+        .values(impressions=1000, conversions=150)
+    )
+
+    stats = await get_test_stats(db, store.id, store.user_id, test.id)
+    by_id = {v["variant_id"]: v for v in stats["variants"]}
+    control_stats, treatment_stats = by_id[control.id], by_id[treatment.id]
+    assert control_stats["is_control"] and control_stats["p_value"] is None
+    assert treatment_stats["lift"] == pytest.approx(0.5)
+    assert treatment_stats["z_score"] == pytest.approx(3.38, abs=0.01)
+    assert treatment_stats["p_value"] < 0.001
+    assert treatment_stats["significant"] is True
+    assert stats["winner_variant_id"] == treatment.id
+
+    strict = await get_test_stats(db, store.id, store.user_id, test.id, confidence_level=0.9999)
+    assert strict["winner_variant_id"] is None
@@ -348,6 +348,32 @@ async def test_record_event_on_draft_test_fails(client):
     assert response.status_code == 400
 
 
+@pytest.mark.asyncio
+async def test_variant_assignment_and_stats(client):
+    """An assigned variant's events show up in the stats right away."""
+    token = await register_and_get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    store = await create_test_store(client, token)
+    test = await create_ab_test(client, token, store["id"])
+    base = f"/api/v1/stores/{store['id']}/ab-tests/{test['id']}"
+    await client.patch(base, json={"status": "running"}, headers=headers)
+
+    assigned = (await client.get(f"{base}/variant?visitor_id=v-1", headers=headers)).json()
+    await client.post(
+        f"{base}/events",
+        json={"variant_id": assigned["variant_id"], "event_type": "impression"},
+        headers=headers,
+    )
+
+    response = await client.get(f"{base}/stats", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_impressions"] == 1
+    (variant,) = [v for v in data["variants"] if v["variant_id"] == assigned["variant_id"]]
+    assert variant["name"] == assigned["variant_name"]
+    assert data["winner_variant_id"] is None
+
+
 # ---------------------------------------------------------------------------
 # Delete A/B Test
 # ---------------------------------------------------------------------------
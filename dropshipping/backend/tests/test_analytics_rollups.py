@@ -0,0 +1,292 @@
+"""Tests for the materialized daily analytics rollups.
+
+Covers the set-based nightly rollup, watermark handling, incremental
+rebuilds on order status changes, and that the analytics service returns
+identical numbers whether it reads rollups or raw orders.
+
+**For Developers:**
+    The nightly path is exercised through ``db.run_sync`` so the sync
+    statement builders run against the test schema. Orders are created
+    with explicit ``created_at`` values to place them on closed days.
+
+**For QA Engineers:**
+    - Pending and cancelled orders never appear in rollups.
+    - Cancelling an order from a rolled day rebuilds that day only.
+    - Dashboard numbers are unchanged by materialization.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.models.analytics import (
+    AnalyticsRollupWatermark,
+    DailyProductMetrics,
+    DailyStoreMetrics,
+)
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product, ProductStatus
+from app.models.store import Store, StoreType
+from app.models.user import User
+from app.services import analytics_service, order_service
+from app.services.analytics_rollup_service import (
+    BACKFILL_DAYS,
+    rollup_closed_days_sync,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _make_store(db) -> tuple[User, Store, Product]:
+    """Create an owner, a store, and a product with a supplier cost."""
+    user = User(email=f"rollup-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    store = Store(
+        user_id=user.id,
+        name="Rollup Store",
+        slug=f"rollup-{uuid.uuid4().hex[:8]}",
+        niche="electronics",
+        store_type=StoreType.ecommerce,
+    )
+    db.add(store)
+    await db.flush()
+    product = Product(
+        store_id=store.id,
+        title="Headphones",
+        slug=f"headphones-{uuid.uuid4().hex[:8]}",
+        price=Decimal("50.00"),
+        cost=Decimal("20.00"),
+        status=ProductStatus.active,
+    )
+    db.add(product)
+    await db.flush()
+    return user, store, product
+
+
+async def _make_order(
+    db,
+    store: Store,
+    product: Product,
+    days_ago: int,
+    quantity: int = 1,
+    status: OrderStatus = OrderStatus.paid,
+) -> Order:
+    """Create an order with one item placed ``days_ago`` days ago at noon UTC."""
+    created = datetime.now(timezone.utc).replace(
+        hour=12, minute=0, second=0, microsecond=0
+    ) - timedelta(days=days_ago)
+    total = product.price * quantity
+    order = Order(
+        store_id=store.id,
+        customer_email="buyer@example.com",
+        status=status,
+        total=total,
+        created_at=created,
+    )
+    db.add(order)
+    await db.flush()
+    db.add(
+        OrderItem(
+            order_id=order.id,
+            product_id=product.id,
+            product_title=product.title,
+            quantity=quantity,
+            unit_price=product.price,
+        )
+    )
+    await db.flush()
+    return order
+
+
+async def _roll(db, today=None):
+    """Run the nightly rollup through the sync code path."""
+    return await db.run_sync(lambda session: rollup_closed_days_sync(session, today))
+
+
+async def _dashboard(db, store: Store, user: User) -> dict:
+    """Read the full dashboard payload for a store."""
+    return await analytics_service.get_dashboard_analytics(
+        db, store.id, user.id, period="30d"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Nightly rollup
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_rollup_materializes_closed_days(db):
+    """Closed revenue days become store and product rows; today does not."""
+    _, store, product = await _make_store(db)
+    await _make_order(db, store, product, days_ago=3, quantity=2)
+    await _make_order(db, store, product, days_ago=3, quantity=1)
+    await _make_order(db, store, product, days_ago=1, quantity=1)
+    await _make_order(db, store, product, days_ago=1, status=OrderStatus.pending)
+    await _make_order(db, store, product, days_ago=0, quantity=5)
+    await db.commit()
+
+    today = datetime.now(timezone.utc).date()
+    rolled = await _roll(db, today)
+    await db.commit()
+
+    assert rolled == (today - timedelta(days=BACKFILL_DAYS), today - timedelta(days=1))
+
+    rows = (
+        await db.execute(
+            select(DailyStoreMetrics).where(DailyStoreMetrics.store_id == store.id)
+            .order_by(DailyStoreMetrics.day)
+        )
+    ).scalars().all()
+    assert [(r.day, r.order_count, r.revenue, r.cost, r.units_sold) for r in rows] == [
+        (today - timedelta(days=3), 2, Decimal("150.00"), Decimal("60.00"), 3),
+        (today - timedelta(days=1), 1, Decimal("50.00"), Decimal("20.00"), 1),
+    ]
+
+    products = (
+        await db.execute(
+            select(DailyProductMetrics).where(DailyProductMetrics.store_id == store.id)
+            .order_by(DailyProductMetrics.day)
+        )
+    ).scalars().all()
+    assert [(p.product_id, p.units_sold, p.revenue) for p in products] == [
+        (product.id, 3, Decimal("150.00")),
+        (product.id, 1, Decimal("50.00")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rollup_advances_watermark_and_is_idempotent(db):
+    """A second run on the same day is a no-op; the next day rolls one day."""
+    today = datetime.now(timezone.utc).date()
+    assert await _roll(db, today) is not None
+    await db.commit()
+    assert await _roll(db, today) is None
+
+    tomorrow = today + timedelta(days=1)
+    assert await _roll(db, tomorrow) == (today, today)
+    await db.commit()
+
+    watermark = (await db.execute(select(AnalyticsRollupWatermark))).scalar_one()
+    assert watermark.rolled_through == today
+    assert watermark.rolled_from == today - timedelta(days=BACKFILL_DAYS)
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_dashboard_matches_raw_after_rollup(db):
+    """Reading rollups plus today's orders yields the raw-order numbers."""
+    user, store, product = await _make_store(db)
+    other = Product(
+        store_id=store.id,
+        title="Charger",
+        slug=f"charger-{uuid.uuid4().hex[:8]}",
+        price=Decimal("15.00"),
+        status=ProductStatus.active,
+    )
+    db.add(other)
+    await db.flush()
+    await _make_order(db, store, product, days_ago=10, quantity=2)
+    await _make_order(db, store, other, days_ago=10, quantity=4)
+    await _make_order(db, store, product, days_ago=2)
+    await _make_order(db, store, other, days_ago=0, quantity=1)
+    await _make_order(db, store, product, days_ago=45)
+    await db.commit()
+
+    raw = await _dashboard(db, store, user)
+    await _roll(db)
+    await db.commit()
+    rolled = await _dashboard(db, store, user)
+
+    assert rolled == raw
+    assert raw["summary"]["order_count"] == 4
+    assert raw["summary"]["total_revenue"] == Decimal("225.00")
+    assert raw["summary"]["total_cost"] == Decimal("60.00")
+    assert len(raw["time_series"]) == 3
+    assert [p["product_title"] for p in raw["top_products"]] == ["Headphones", "Charger"]
+
+
+@pytest.mark.asyncio
+async def test_weekly_series_merges_rollups_and_today(db):
+    """Week and month buckets sum rolled days with today's raw orders."""
+    user, store, product = await _make_store(db)
+    await _make_order(db, store, product, days_ago=1)
+    await _make_order(db, store, product, days_ago=0)
+    await db.commit()
+    await _roll(db)
+    await db.commit()
+
+    series = await analytics_service.get_revenue_time_series(
+        db, store.id, user.id, period="7d", granularity="month"
+    )
+    assert sum(point["order_count"] for point in series) == 2
+    assert sum(point["revenue"] for point in series) == Decimal("100.00")
+
+
+# ---------------------------------------------------------------------------
+# Incremental rebuilds
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_cancelling_rolled_order_rebuilds_its_day(db):
+    """Cancelling an order from a closed day removes it from the rollup."""
+    user, store, product = await _make_store(db)
+    keep = await _make_order(db, store, product, days_ago=2)
+    cancel = await _make_order(db, store, product, days_ago=2, quantity=3)
+    await db.commit()
+    await _roll(db)
+    await db.commit()
+
+    await order_service.update_order_status(
+        db, store.id, user.id, cancel.id, OrderStatus.cancelled
+    )
+    await db.commit()
+
+    row = (
+        await db.execute(
+            select(DailyStoreMetrics).where(DailyStoreMetrics.store_id == store.id)
+        )
+    ).scalar_one()
+    assert (row.order_count, row.revenue, row.units_sold) == (1, keep.total, 1)
+
+    summary = await analytics_service.get_profit_summary(db, store.id, user.id, "7d")
+    assert summary["order_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_status_change_within_revenue_skips_rebuild(db):
+    """Shipping a paid order leaves the rollup rows untouched."""
+    user, store, product = await _make_store(db)
+    order = await _make_order(db, store, product, days_ago=2)
+    await db.commit()
+    await _roll(db)
+    await db.commit()
+    before = (
+        await db.execute(
+            select(DailyStoreMetrics.id).where(DailyStoreMetrics.store_id == store.id)
+        )
+    ).scalar_one()
+
+    await order_service.update_order_status(
+        db, store.id, user.id, order.id, OrderStatus.shipped
+    )
+    await db.commit()
+
+    after = (
+        await db.execute(
+            select(DailyStoreMetrics.id).where(DailyStoreMetrics.store_id == store.id)
+        )
+    ).scalar_one()
+    assert after == before
@@ -10,13 +10,13 @@ notifications older than 90 days.
     mock verifies rowcount behavior.
 
 **For QA Engineers:**
-    - ``aggregate_daily_analytics`` processes only active stores.
-    - Revenue calculation includes paid, shipped, and delivered orders.
+    - ``aggregate_daily_analytics`` delegates to the rollup service and
+      reports yesterday's totals (see ``test_analytics_rollups.py`` for
+      the database-backed rollup tests).
     - ``cleanup_old_notifications`` only deletes read notifications (is_read=True).
     - Notifications younger than 90 days are preserved.
 """
 
-import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch, call
@@ -32,110 +32,65 @@ import pytest
 class TestAggregateDailyAnalytics:
     """Tests for the aggregate_daily_analytics Beat task."""
 
+    @patch("app.services.analytics_rollup_service.summarize_day_sync")
+    @patch("app.services.analytics_rollup_service.rollup_closed_days_sync")
     @patch("app.tasks.analytics_tasks.SyncSessionFactory")
-    def test_processes_active_stores(self, mock_factory):
-        """Processes all active stores and returns correct counts."""
-        from app.models.store import Store, StoreStatus
+    def test_rolls_closed_days_and_reports_yesterday(
+        self, mock_factory, mock_rollup, mock_summary
+    ):
+        """Rolls pending days, commits, and reports yesterday's totals."""
         from app.tasks.analytics_tasks import aggregate_daily_analytics
 
-        mock_store1 = MagicMock(spec=Store)
-        mock_store1.id = uuid.uuid4()
-        mock_store1.name = "Store A"
-        mock_store1.status = StoreStatus.active
-
-        mock_store2 = MagicMock(spec=Store)
-        mock_store2.id = uuid.uuid4()
-        mock_store2.name = "Store B"
-        mock_store2.status = StoreStatus.active
-
-        # Mock the revenue query result
-        mock_result = MagicMock()
-        mock_result.order_count = 5
-        mock_result.revenue = Decimal("249.95")
-
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
+        mock_rollup.return_value = (yesterday - timedelta(days=2), yesterday)
+        mock_summary.return_value = (2, Decimal("249.95"))
         session = MagicMock()
-
-        call_count = [0]
-        def query_side_effect(model_or_cols, *args, **kwargs):
-            chain = MagicMock()
-            if hasattr(model_or_cols, '__name__') and model_or_cols.__name__ == "Store":
-                chain.filter.return_value.all.return_value = [mock_store1, mock_store2]
-            else:
-                # Revenue aggregation query
-                chain.filter.return_value.first.return_value = mock_result
-            return chain
-
-        session.query.side_effect = query_side_effect
         mock_factory.return_value = session
 
         result = aggregate_daily_analytics()
-        assert result["stores_processed"] == 2
-        assert "date" in result
-        assert "total_revenue" in result
 
+        mock_rollup.assert_called_once_with(session, today)
+        mock_summary.assert_called_once_with(session, yesterday)
+        session.commit.assert_called_once()
+        assert result == {
+            "stores_processed": 2,
+            "date": yesterday.strftime("%Y-%m-%d"),
+            "total_revenue": "249.95",
+            "days_rolled": 3,
+        }
+
+    @patch("app.services.analytics_rollup_service.summarize_day_sync")
+    @patch("app.services.analytics_rollup_service.rollup_closed_days_sync")
     @patch("app.tasks.analytics_tasks.SyncSessionFactory")
-    def test_handles_no_active_stores(self, mock_factory):
-        """Returns zero when no active stores exist."""
+    def test_up_to_date_rollups_roll_nothing(
+        self, mock_factory, mock_rollup, mock_summary
+    ):
+        """Reports zero rolled days when the watermark already covers yesterday."""
         from app.tasks.analytics_tasks import aggregate_daily_analytics
 
-        session = MagicMock()
-
-        def query_side_effect(model_or_cols, *args, **kwargs):
-            chain = MagicMock()
-            chain.filter.return_value.all.return_value = []
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_rollup.return_value = None
+        mock_summary.return_value = (0, Decimal("0"))
+        mock_factory.return_value = MagicMock()
 
         result = aggregate_daily_analytics()
+        assert result["days_rolled"] == 0
         assert result["stores_processed"] == 0
         assert result["total_revenue"] == "0"
 
-    @patch("app.tasks.analytics_tasks.SyncSessionFactory")
-    def test_handles_store_with_zero_revenue(self, mock_factory):
-        """Correctly handles stores with no orders yesterday."""
-        from app.models.store import Store, StoreStatus
-        from app.tasks.analytics_tasks import aggregate_daily_analytics
-
-        mock_store = MagicMock(spec=Store)
-        mock_store.id = uuid.uuid4()
-        mock_store.name = "Empty Store"
-        mock_store.status = StoreStatus.active
-
-        mock_result = MagicMock()
-        mock_result.order_count = 0
-        mock_result.revenue = 0
-
-        session = MagicMock()
-
-        def query_side_effect(model_or_cols, *args, **kwargs):
-            chain = MagicMock()
-            if hasattr(model_or_cols, '__name__') and model_or_cols.__name__ == "Store":
-                chain.filter.return_value.all.return_value = [mock_store]
-            else:
-                chain.filter.return_value.first.return_value = mock_result
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
-
-        result = aggregate_daily_analytics()
-        assert result["stores_processed"] == 1
-        assert result["total_revenue"] == "0"
-
     @patch("app.tasks.analytics_tasks.SyncSessionFactory")
     def test_returns_error_on_exception(self, mock_factory):
         """Returns error dict on unexpected exception."""
         from app.tasks.analytics_tasks import aggregate_daily_analytics
 
         session = MagicMock()
-        session.query.side_effect = Exception("DB connection lost")
+        session.execute.side_effect = Exception("DB connection lost")
         mock_factory.return_value = session
 
         result = aggregate_daily_analytics()
         assert "error" in result
         assert "DB connection lost" in result["error"]
+        session.rollback.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,295 @@
+"""Tests for the batched ServiceBridge event bus.
+
+Covers the Redis Stream consumer group (read, redelivery, ack), batch
+planning per destination service, bulk POSTs to a stub service, and the
+``drain_platform_events`` task.
+
+**For Developers:**
+    Stream tests use the Redis from ``REDIS_URL`` with a unique stream key
+    per test. Network tests are synchronous and post to a local
+    ``ThreadingHTTPServer``; planning tests use the ``db`` fixture.
+
+**For QA Engineers:**
+    - Unacknowledged entries are re-read before new ones.
+    - Each service receives its events in publish order, in chunks of
+      ``bridge_max_events_per_post``, signed over the whole body.
+    - One ``BridgeDelivery`` row is recorded per (event, service).
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.service_integration import ServiceIntegration, ServiceName, ServiceTier
+from app.models.user import User
+from app.redis_client import get_sync_redis
+from app.services import bridge_delivery_service
+from app.services.bridge_delivery_service import (
+    ack_platform_events,
+    build_platform_envelope,
+    deliver_service_batches,
+    ensure_consumer_group,
+    publish_platform_event,
+    read_platform_events,
+)
+from app.tasks.bridge_tasks import drain_platform_events
+
+
+@pytest.fixture
+def stream_key():
+    """Point the bridge at a throwaway stream for the test.
+
+    Publishing does not schedule real drains; tests call the task directly.
+    """
+    key = f"test:bridge:{uuid.uuid4().hex}"
+    with patch.object(settings, "bridge_stream_key", key), \
+            patch("app.tasks.bridge_tasks.drain_platform_events"):
+        yield key
+    get_sync_redis().delete(key, bridge_delivery_service.DRAIN_KICK_KEY)
+
+
+def _envelope(event: str = "product.created", user_id: uuid.UUID | None = None, n: int = 0) -> dict:
+    return build_platform_envelope(
+        user_id or uuid.uuid4(), None, event, uuid.uuid4(), event.split(".")[0], {"n": n}
+    )
+
+
+# ---------------------------------------------------------------------------
+# Stream
+# ---------------------------------------------------------------------------
+
+
+def test_unacked_entries_are_read_again(stream_key):
+    """A batch read but not acknowledged is returned again before new events."""
+    redis = get_sync_redis()
+    for n in range(3):
+        publish_platform_event(_envelope(n=n))
+    ensure_consumer_group(redis)
+    ensure_consumer_group(redis)  # idempotent
+
+    first = read_platform_events(redis)
+    assert [envelope["data"]["n"] for _, envelope in first] == [0, 1, 2]
+
+    publish_platform_event(_envelope(n=3))
+    again = read_platform_events(redis)
+    assert [entry_id for entry_id, _ in again] == [entry_id for entry_id, _ in first]
+
+    ack_platform_events(redis, [entry_id for entry_id, _ in first])
+    rest = read_platform_events(redis)
+    assert [envelope["data"]["n"] for _, envelope in rest] == [3]
+    ack_platform_events(redis, [entry_id for entry_id, _ in rest])
+    assert read_platform_events(redis) == []
+    assert redis.xlen(stream_key) == 0
+
+
+def test_unreadable_entries_are_returned_as_none(stream_key):
+    """Malformed entries do not block the stream."""
+    redis = get_sync_redis()
+    ensure_consumer_group(redis)
+    redis.xadd(stream_key, {"envelope": "not json"})
+    ((_, envelope),) = read_platform_events(redis)
+    assert envelope is None
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+
+async def _user_with_integrations(db, active: list[ServiceName], inactive: list[ServiceName]) -> User:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    for service, is_active in [(s, True) for s in active] + [(s, False) for s in inactive]:
+        db.add(ServiceIntegration(
+            user_id=user.id,
+            service_name=service,
+            service_user_id=f"svc_{uuid.uuid4().hex[:8]}",
+            api_key=f"key_{uuid.uuid4().hex[:16]}",
+            tier=ServiceTier.free,
+            is_active=is_active,
+            provisioned_at=datetime.now(timezone.utc),
+        ))
+    await db.commit()
+    return user
+
+
+async def test_plan_groups_events_per_service_in_order(db):
+    """Events go to the user's active integrations only, in stream order."""
+    user = await _user_with_integrations(
+        db,
+        active=[ServiceName.contentforge, ServiceName.flowsend],
+        inactive=[ServiceName.rankpilot],
+    )
+    other = await _user_with_integrations(db, active=[ServiceName.contentforge], inactive=[])
+    envelopes = [
+        _envelope("product.created", user.id, 1),
+        _envelope("order.created", user.id, 2),
+        _envelope("product.updated", other.id, 3),
+        _envelope("product.updated", user.id, 4),
+        _envelope("store.renamed", user.id, 5),
+    ]
+
+    plan = await db.run_sync(
+        lambda s: bridge_delivery_service.plan_service_batches(s, envelopes)
+    )
+
+    assert set(plan) == {ServiceName.contentforge, ServiceName.flowsend}
+    assert [e["data"]["n"] for e, _ in plan[ServiceName.contentforge]] == [1, 3, 4]
+    assert [e["data"]["n"] for e, _ in plan[ServiceName.flowsend]] == [2]
+
+
+async def test_plan_clears_deleted_store_ids(db):
+    """Events for stores deleted since publishing are recorded without a store."""
+    user = await _user_with_integrations(db, active=[ServiceName.flowsend], inactive=[])
+    envelope = build_platform_envelope(
+        user.id, uuid.uuid4(), "order.created", uuid.uuid4(), "order", {}
+    )
+
+    plan = await db.run_sync(
+        lambda s: bridge_delivery_service.plan_service_batches(s, [envelope])
+    )
+    assert plan[ServiceName.flowsend][0][0]["store_id"] is None
+
+
+# ---------------------------------------------------------------------------
+# Delivery
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def service_stub():
+    """Run a stub service batch endpoint; ``/fail`` answers 500."""
+    received: list[dict] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append({"path": self.path, "headers": dict(self.headers), "body": body})
+            status = 500 if self.path.startswith("/fail") else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", received
+    server.shutdown()
+    server.server_close()
+
+
+def test_deliver_posts_ordered_signed_chunks(service_stub):
+    """Each service gets its events in order, chunked and signed."""
+    base_url, received = service_stub
+    urls = {
+        ServiceName.contentforge: f"{base_url}/ok",
+        ServiceName.flowsend: f"{base_url}/fail",
+    }
+    user_id = uuid.uuid4()
+    plan = {
+        ServiceName.contentforge: [(_envelope("product.created", user_id, n), uuid.uuid4()) for n in range(5)],
+        ServiceName.flowsend: [(_envelope("order.created", user_id, 9), uuid.uuid4())],
+    }
+
+    with patch.object(settings, "bridge_max_events_per_post", 2), \
+            patch.object(bridge_delivery_service, "service_batch_url", urls.get):
+        rows = deliver_service_batches(plan)
+
+    ok_posts = [r for r in received if r["path"] == "/ok"]
+    assert [len(json.loads(r["body"])["events"]) for r in ok_posts] == [2, 2, 1]
+    assert [
+        e["data"]["n"] for r in ok_posts for e in json.loads(r["body"])["events"]
+    ] == [0, 1, 2, 3, 4]
+    expected = hmac.new(
+        settings.platform_webhook_secret.encode(), ok_posts[0]["body"], hashlib.sha256
+    ).hexdigest()
+    assert ok_posts[0]["headers"]["X-Platform-Signature"] == f"sha256={expected}"
+    assert ok_posts[0]["headers"]["X-Platform-Event-Count"] == "2"
+
+    assert len(rows) == 6
+    by_service = {}
+    for row in rows:
+        by_service.setdefault(row["service_name"], []).append(row)
+    assert all(r["success"] for r in by_service[ServiceName.contentforge])
+    (failed,) = by_service[ServiceName.flowsend]
+    assert failed["success"] is False
+    assert failed["response_status"] == 500
+    assert failed["error_message"] == "HTTP 500"
+
+
+def test_batch_url_points_at_batch_endpoint():
+    """Services are addressed at their batch ingestion route."""
+    url = bridge_delivery_service.service_batch_url(ServiceName.contentforge)
+    assert url.endswith("/api/v1/webhooks/platform-events/batch")
+
+
+# ---------------------------------------------------------------------------
+# Drain task
+# ---------------------------------------------------------------------------
+
+
+@patch("app.services.bridge_delivery_service.deliver_service_batches")
+@patch("app.services.bridge_delivery_service.plan_service_batches")
+@patch("app.tasks.bridge_tasks.SyncSessionFactory")
+def test_drain_commits_then_acks(mock_factory, mock_plan, mock_deliver, stream_key):
+    """Delivery rows are committed in one insert before entries are acked."""
+    redis = get_sync_redis()
+    for n in range(4):
+        publish_platform_event(_envelope(n=n))
+
+    session = MagicMock()
+    mock_factory.return_value = session
+    mock_plan.return_value = {ServiceName.contentforge: []}
+    mock_deliver.return_value = [{"success": True}, {"success": True}, {"success": False}]
+
+    result = drain_platform_events()
+
+    assert result["batches"] == 1
+    assert result["events"] == 4
+    assert result["deliveries"] == 3
+    assert result["failure_count"] == 1
+    assert len(mock_plan.call_args.args[1]) == 4
+    session.execute.assert_called_once()
+    session.commit.assert_called_once()
+    assert redis.xlen(stream_key) == 0
+    assert redis.xpending(stream_key, bridge_delivery_service.STREAM_GROUP)["pending"] == 0
+
+
+@patch("app.services.bridge_delivery_service.deliver_service_batches")
+@patch("app.tasks.bridge_tasks.SyncSessionFactory")
+def test_drain_keeps_entries_when_commit_fails(mock_factory, mock_deliver, stream_key):
+    """A failed commit leaves the batch pending for the next drain."""
+    redis = get_sync_redis()
+    publish_platform_event(_envelope("store.renamed"))
+    session = MagicMock()
+    session.commit.side_effect = RuntimeError("db down")
+    mock_factory.return_value = session
+    mock_deliver.return_value = []
+
+    result = drain_platform_events()
+
+    assert result["error"] == "db down"
+    session.rollback.assert_called_once()
+    assert redis.xpending(stream_key, bridge_delivery_service.STREAM_GROUP)["pending"] == 1
+
+
+def test_drain_skips_while_another_drain_runs(stream_key):
+    """Only one drain runs at a time."""
+    lock = bridge_delivery_service.drain_lock(get_sync_redis())
+    assert lock.acquire(blocking=False)
+    try:
+        assert drain_platform_events()["status"] == "skipped"
+    finally:
+        lock.release()
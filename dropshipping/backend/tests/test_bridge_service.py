@@ -1,26 +1,31 @@
 """Tests for the bridge_service helper functions.
 
-Verifies HMAC signing, fire_platform_event delegation to Celery, and
-async query functions for the dashboard UI.
+Verifies HMAC signing, fire_platform_event publishing to the bridge
+stream (with the Celery fallback), and async query functions for the
+dashboard UI.
 
 **For Developers:**
-    Tests mock the Celery task and use the ``db`` fixture for async queries.
+    Tests mock the Celery tasks and use the ``db`` fixture for async queries.
 
 **For QA Engineers:**
     - ``sign_bridge_payload`` produces deterministic HMAC digests.
-    - ``fire_platform_event`` calls Celery ``dispatch_platform_event.delay()``.
+    - ``fire_platform_event`` appends to the bridge stream, and calls
+      Celery ``dispatch_platform_event.delay()`` when Redis is down.
     - Query functions return empty results for users with no deliveries.
 """
 
 import hashlib
 import hmac
+import json
 import uuid
 from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 
 import pytest
 import pytest_asyncio
+from redis.exceptions import ConnectionError as RedisConnectionError
 
+from app.config import settings
 from app.models.bridge_delivery import BridgeDelivery
 from app.models.service_integration import ServiceName
 from app.services.bridge_service import (
@@ -63,9 +68,45 @@ class TestSignBridgePayload:
 class TestFirePlatformEvent:
     """Tests for the fire_platform_event wrapper."""
 
+    @patch("app.tasks.bridge_tasks.drain_platform_events")
+    def test_appends_envelope_to_stream(self, mock_drain):
+        """Should XADD the event envelope and schedule a drain."""
+        from app.redis_client import get_sync_redis
+        from app.services.bridge_delivery_service import DRAIN_KICK_KEY
+
+        redis = get_sync_redis()
+        redis.delete(settings.bridge_stream_key, DRAIN_KICK_KEY)
+        user_id = uuid.uuid4()
+        store_id = uuid.uuid4()
+        resource_id = uuid.uuid4()
+
+        for _ in range(3):
+            fire_platform_event(
+                user_id=user_id,
+                store_id=store_id,
+                event="product.created",
+                resource_id=resource_id,
+                resource_type="product",
+                payload={"title": "Widget"},
+            )
+
+        entries = redis.xrange(settings.bridge_stream_key)
+        assert len(entries) == 3
+        envelope = json.loads(entries[0][1]["envelope"])
+        assert envelope["event"] == "product.created"
+        assert envelope["user_id"] == str(user_id)
+        assert envelope["store_id"] == str(store_id)
+        assert envelope["resource_id"] == str(resource_id)
+        assert envelope["data"] == {"title": "Widget"}
+        # Several events in one kick window schedule a single drain.
+        mock_drain.apply_async.assert_called_once()
+        redis.delete(settings.bridge_stream_key, DRAIN_KICK_KEY)
+
     @patch("app.tasks.bridge_tasks.dispatch_platform_event")
-    def test_calls_delay_with_correct_args(self, mock_task):
+    @patch("app.services.bridge_delivery_service.publish_platform_event")
+    def test_falls_back_to_celery_without_redis(self, mock_publish, mock_task):
         """Should call dispatch_platform_event.delay() with string UUIDs."""
+        mock_publish.side_effect = RedisConnectionError("down")
         user_id = uuid.uuid4()
         store_id = uuid.uuid4()
         resource_id = uuid.uuid4()
@@ -89,8 +130,10 @@ class TestFirePlatformEvent:
         )
 
     @patch("app.tasks.bridge_tasks.dispatch_platform_event")
-    def test_none_store_id(self, mock_task):
+    @patch("app.services.bridge_delivery_service.publish_platform_event")
+    def test_none_store_id(self, mock_publish, mock_task):
         """store_id=None should be passed through as None."""
+        mock_publish.side_effect = RedisConnectionError("down")
         fire_platform_event(
             user_id=uuid.uuid4(),
             store_id=None,
@@ -7,11 +7,21 @@ and that partial failures are reported correctly.
 **For QA Engineers:**
     Each test is independent — the database is reset between tests.
     Bulk endpoints are store-scoped: ``/stores/{store_id}/bulk/products/...``.
-    Maximum 100 products per bulk operation. Partial failures return 200
-    with a results array showing per-item status.
+    Requests above ``bulk_job_threshold`` return 202 with a bulk job.
+    Partial failures return 200 with a results array showing per-item status.
 """
 
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
 import pytest
+from sqlalchemy import select
+
+from app.models.bulk_job import BulkJob, BulkJobStatus
+from app.models.product import Product
+from app.services import bulk_service
+from app.services.bulk_service import BulkOperation
 
 
 # ---------------------------------------------------------------------------
@@ -259,3 +269,284 @@ async def test_bulk_price_adjustment_store_not_found(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Set-based chunks and batched notifications
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_bulk_price_chunks_clamp_and_report_missing(client, db, monkeypatch):
+    """Prices change across several chunks; unknown ids are reported per item."""
+    monkeypatch.setattr(bulk_service, "BULK_CHUNK_SIZE", 2)
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    products = [
+        await create_test_product(client, token, store["id"], title=f"P{i}", price=price)
+        for i, price in enumerate([10.00, 20.00, 3.00])
+    ]
+    missing = str(uuid.uuid4())
+
+    response = await client.post(
+        f"/api/v1/stores/{store['id']}/bulk/products/price",
+        json={
+            "product_ids": [p["id"] for p in products] + [missing],
+            "adjustment_type": "fixed",
+            "adjustment_value": -5,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    data = response.json()
+    assert (data["total"], data["succeeded"], data["failed"]) == (4, 3, 1)
+    failed = [r for r in data["results"] if not r["success"]]
+    assert failed == [{
+        "product_id": missing,
+        "success": False,
+        "message": "Product not found in this store",
+    }]
+
+    prices = dict(
+        (await db.execute(select(Product.title, Product.price))).all()
+    )
+    assert prices == {
+        "P0": Decimal("5.00"),
+        "P1": Decimal("15.00"),
+        "P2": Decimal("0.01"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_ignores_protected_fields(client, db):
+    """Only writable product columns are updated."""
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    product = await create_test_product(client, token, store["id"], title="Before")
+
+    response = await client.post(
+        f"/api/v1/stores/{store['id']}/bulk/products/update",
+        json={
+            "product_ids": [product["id"]],
+            "updates": {
+                "title": "After",
+                "status": "draft",
+                "store_id": str(uuid.uuid4()),
+                "variants": [],
+            },
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.json()["succeeded"] == 1
+
+    row = (await db.execute(select(Product))).scalar_one()
+    assert row.title == "After"
+    assert row.status.value == "draft"
+    assert str(row.store_id) == store["id"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_reports_already_archived(client):
+    """Archiving twice reports the second attempt as already archived."""
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    product = await create_test_product(client, token, store["id"])
+    url = f"/api/v1/stores/{store['id']}/bulk/products/delete"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    await client.post(url, json={"product_ids": [product["id"]]}, headers=headers)
+    data = (await client.post(url, json={"product_ids": [product["id"]]}, headers=headers)).json()
+
+    assert data["failed"] == 1
+    assert data["results"][0]["message"] == "Product is already archived"
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_sends_one_webhook(client):
+    """A bulk update sends a single batched product.updated webhook."""
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    p1 = await create_test_product(client, token, store["id"], title="A")
+    p2 = await create_test_product(client, token, store["id"], title="B")
+
+    with patch("app.tasks.webhook_tasks.dispatch_webhook_event.delay") as mock_delay:
+        await client.post(
+            f"/api/v1/stores/{store['id']}/bulk/products/update",
+            json={
+                "product_ids": [p1["id"], p2["id"], str(uuid.uuid4())],
+                "updates": {"title": "Renamed"},
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    mock_delay.assert_called_once()
+    store_id, event, payload = mock_delay.call_args.args
+    assert (store_id, event) == (store["id"], "product.updated")
+    assert payload["operation"] == "update"
+    assert payload["product_ids"] == [p1["id"], p2["id"]]
+
+
+# ---------------------------------------------------------------------------
+# Background bulk jobs
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_large_bulk_request_queues_job(client, db, monkeypatch):
+    """Requests above the threshold return 202 with a pollable job."""
+    monkeypatch.setattr("app.api.bulk.settings.bulk_job_threshold", 1)
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    p1 = await create_test_product(client, token, store["id"], price=10.00)
+    p2 = await create_test_product(client, token, store["id"], price=20.00)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with patch("app.tasks.bulk_tasks.run_bulk_job.delay") as mock_delay:
+        response = await client.post(
+            f"/api/v1/stores/{store['id']}/bulk/products/price",
+            json={
+                "product_ids": [p1["id"], p2["id"]],
+                "adjustment_type": "percentage",
+                "adjustment_value": 50,
+            },
+            headers=headers,
+        )
+    assert response.status_code == 202
+    job = response.json()
+    assert (job["status"], job["total"], job["processed"]) == ("pending", 2, 0)
+    mock_delay.assert_called_once_with(job["id"])
+
+    record = await db.get(BulkJob, uuid.UUID(job["id"]))
+    assert record.params == {"adjustment_type": "percentage", "adjustment_value": "50"}
+
+    # Apply the chunk the way the worker does, against the test schema.
+    errors = await db.run_sync(
+        lambda session: bulk_service.apply_bulk_chunk_sync(
+            session, BulkOperation.price, record.store_id,
+            [uuid.UUID(p1["id"]), uuid.UUID(p2["id"])], record.params,
+        )
+    )
+    assert errors == []
+    prices = sorted((await db.execute(select(Product.price))).scalars())
+    assert prices == [Decimal("15.00"), Decimal("30.00")]
+
+    status_resp = await client.get(
+        f"/api/v1/stores/{store['id']}/bulk/jobs/{job['id']}", headers=headers
+    )
+    assert status_resp.status_code == 200
+    assert status_resp.json()["operation"] == "price"
+
+
+@pytest.mark.asyncio
+async def test_bulk_job_invalid_adjustment_returns_400(client, monkeypatch):
+    """Queued price jobs validate the adjustment type up front."""
+    monkeypatch.setattr("app.api.bulk.settings.bulk_job_threshold", 0)
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+
+    response = await client.post(
+        f"/api/v1/stores/{store['id']}/bulk/products/price",
+        json={
+            "product_ids": [str(uuid.uuid4())],
+            "adjustment_type": "double",
+            "adjustment_value": 1,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 400
+
+
+class TestRunBulkJobTask:
+    """Tests for the run_bulk_job Celery task."""
+
+    def _job(self, product_ids):
+        job = MagicMock(spec=BulkJob)
+        job.id = uuid.uuid4()
+        job.store_id = uuid.uuid4()
+        job.operation = "delete"
+        job.params = {}
+        job.product_ids = [str(pid) for pid in product_ids]
+        job.status = BulkJobStatus.pending
+        job.processed = job.succeeded = job.failed = 0
+        return job
+
+    @patch("app.services.bulk_service.notify_bulk_change")
+    @patch("app.services.bulk_service.apply_bulk_chunk_sync")
+    @patch("app.tasks.bulk_tasks.SyncSessionFactory")
+    def test_tracks_progress_per_chunk(self, mock_factory, mock_apply, mock_notify, monkeypatch):
+        """Counters are committed per chunk and one notification is sent."""
+        from app.tasks.bulk_tasks import run_bulk_job
+
+        monkeypatch.setattr(bulk_service, "BULK_CHUNK_SIZE", 2)
+        ids = [uuid.uuid4() for _ in range(5)]
+        job = self._job(ids)
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        missing = {"product_id": str(ids[4]), "error": "Product not found in this store"}
+        mock_apply.side_effect = [[], [], [missing]]
+
+        result = run_bulk_job(str(job.id))
+
+        assert result == {"status": "completed", "succeeded": 4, "failed": 1}
+        assert mock_apply.call_count == 3
+        assert (job.processed, job.succeeded, job.failed) == (5, 4, 1)
+        assert job.errors == [missing]
+        assert job.status == BulkJobStatus.completed
+        # running + one commit per chunk + completed
+        assert session.commit.call_count == 5
+        mock_notify.assert_called_once_with(
+            job.store_id, BulkOperation.delete, ids, [missing]
+        )
+
+    @patch("app.services.bulk_service.apply_bulk_chunk_sync")
+    @patch("app.tasks.bulk_tasks.SyncSessionFactory")
+    def test_failure_marks_job_failed(self, mock_factory, mock_apply):
+        """Errors mark the job failed with a message."""
+        from app.tasks.bulk_tasks import run_bulk_job
+
+        job = self._job([uuid.uuid4()])
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        mock_apply.side_effect = RuntimeError("deadlock detected")
+
+        assert run_bulk_job(str(job.id))["status"] == "failed"
+        assert job.status == BulkJobStatus.failed
+        assert "deadlock" in job.error_message
+
+    @patch("app.services.bulk_service.notify_bulk_change")
+    @patch("app.services.bulk_service.apply_bulk_chunk_sync")
+    @patch("app.tasks.bulk_tasks.SyncSessionFactory")
+    def test_failure_notifies_committed_chunks(
+        self, mock_factory, mock_apply, mock_notify, monkeypatch
+    ):
+        """Products changed by chunks committed before a failure are announced."""
+        from app.tasks.bulk_tasks import run_bulk_job
+
+        monkeypatch.setattr(bulk_service, "BULK_CHUNK_SIZE", 2)
+        ids = [uuid.uuid4() for _ in range(5)]
+        job = self._job(ids)
+        job.errors = []
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        mock_apply.side_effect = [[], RuntimeError("deadlock detected")]
+
+        assert run_bulk_job(str(job.id))["status"] == "failed"
+        assert job.processed == 2
+        mock_notify.assert_called_once_with(
+            job.store_id, BulkOperation.delete, ids[:2], []
+        )
+
+    @patch("app.tasks.bulk_tasks.SyncSessionFactory")
+    def test_skips_non_pending_job(self, mock_factory):
+        """A redelivered task does not apply a running job twice."""
+        from app.tasks.bulk_tasks import run_bulk_job
+
+        job = self._job([uuid.uuid4()])
+        job.status = BulkJobStatus.running
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+
+        assert run_bulk_job(str(job.id))["status"] == "skipped"
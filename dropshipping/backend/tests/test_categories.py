@@ -331,3 +331,53 @@ async def test_remove_product_from_category(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert resp.status_code == 204
+
+
+# ---------------------------------------------------------------------------
+# Public storefront
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_public_categories_include_subcategory_products(client):
+    """Public counts and listings cover subcategories; moves show at once."""
+    token = await register_and_get_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    store = await create_test_store(client, token)
+    parent = await create_test_category(client, token, store["id"], name="Audio")
+    child = await create_test_category(
+        client, token, store["id"], name="Headphones", parent_id=parent["id"]
+    )
+    product = await create_test_product(
+        client, token, store["id"], title="Buds", status="active"
+    )
+    await client.post(
+        f"/api/v1/stores/{store['id']}/categories/{child['id']}/products",
+        json={"product_ids": [product["id"]]},
+        headers=headers,
+    )
+    base = f"/api/v1/public/stores/{store['slug']}/categories"
+
+    counts = {c["name"]: c["product_count"] for c in (await client.get(base)).json()}
+    assert counts == {"Audio": 1, "Headphones": 1}
+
+    listing = (await client.get(f"{base}/{parent['slug']}/products")).json()
+    assert [p["id"] for p in listing["items"]] == [product["id"]]
+    direct = await client.get(f"{base}/{parent['slug']}/products?include_subcategories=false")
+    assert direct.json()["total"] == 0
+
+    other = await create_test_category(client, token, store["id"], name="Video")
+    await client.patch(
+        f"/api/v1/stores/{store['id']}/categories/{child['id']}",
+        json={"parent_id": other["id"]},
+        headers=headers,
+    )
+    counts = {c["name"]: c["product_count"] for c in (await client.get(base)).json()}
+    assert counts == {"Audio": 0, "Headphones": 1, "Video": 1}
+
+    resp = await client.patch(
+        f"/api/v1/stores/{store['id']}/categories/{other['id']}",
+        json={"parent_id": child["id"]},
+        headers=headers,
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,186 @@
+"""Tests for the category closure table, subtree listings, and tree cache.
+
+Covers ``category_service`` closure maintenance on create, move, and
+delete, ``get_products_by_category(include_subcategories=True)``, the
+cached ``get_category_tree`` with recursive product counts, and cloning
+of the closure rows.
+
+**For Developers:**
+    Tests use the ``db`` fixture and the Redis from ``REDIS_URL``; every
+    test creates its own store, so cached trees never collide. Tree
+    rebuilds are counted by wrapping ``_build_tree``.
+
+**For QA Engineers:**
+    - Moving a category carries its subtree; cycles are rejected.
+    - Deleting a category splits its children off as separate trees.
+    - Product counts include subcategories and count each product once.
+    - The tree is rebuilt only after a category, assignment, or product
+      status change.
+    - Cloned stores get their own closure rows.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from app.models.category import Category, CategoryClosure
+from app.models.product import Product, ProductStatus
+from app.models.store import Store
+from app.models.user import User
+from app.services import category_service
+from app.services.category_service import (
+    assign_products_to_category,
+    create_category,
+    delete_category,
+    flatten_category_tree,
+    get_category_tree,
+    get_products_by_category,
+    update_category,
+)
+from app.services.clone_service import clone_store
+from app.services.product_service import update_product
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Tree Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _product(db, store, status=ProductStatus.active) -> Product:
+    product = Product(
+        store_id=store.id, title="Item", slug=f"item-{uuid.uuid4().hex[:8]}",
+        price=Decimal("10"), status=status,
+    )
+    db.add(product)
+    await db.flush()
+    return product
+
+
+async def _pairs(db, store) -> set[tuple[str, str, int]]:
+    """Closure rows of a store as (ancestor name, descendant name, depth)."""
+    anc, desc = aliased(Category), aliased(Category)
+    rows = await db.execute(
+        select(anc.name, desc.name, CategoryClosure.depth)
+        .join(anc, anc.id == CategoryClosure.ancestor_id)
+        .join(desc, desc.id == CategoryClosure.descendant_id)
+        .where(anc.store_id == store.id)
+    )
+    return {tuple(row) for row in rows.all()}
+
+
+async def _shop(db):
+    """Clothing > Men > Shirts, plus Shoes at the root."""
+    store = await _store(db)
+    owner = store.user_id
+    clothing = await create_category(db, store.id, owner, "Clothing")
+    men = await create_category(db, store.id, owner, "Men", parent_id=clothing.id)
+    shirts = await create_category(db, store.id, owner, "Shirts", parent_id=men.id)
+    shoes = await create_category(db, store.id, owner, "Shoes")
+    return store, clothing, men, shirts, shoes
+
+
+async def test_closure_follows_create_move_and_delete(db):
+    """The closure mirrors parent_id through moves and deletes."""
+    store, clothing, men, shirts, shoes = await _shop(db)
+    assert {("Clothing", "Shirts", 2), ("Men", "Shirts", 1), ("Shirts", "Shirts", 0)} <= (
+        await _pairs(db, store)
+    )
+
+    await update_category(db, store.id, store.user_id, men.id, parent_id=shoes.id)
+    pairs = await _pairs(db, store)
+    assert ("Shoes", "Shirts", 2) in pairs
+    assert not {p for p in pairs if p[0] == "Clothing" and p[1] != "Clothing"}
+
+    with pytest.raises(ValueError, match="Circular"):
+        await update_category(db, store.id, store.user_id, shoes.id, parent_id=shirts.id)
+
+    await delete_category(db, store.id, store.user_id, men.id)
+    assert await _pairs(db, store) == {
+        ("Clothing", "Clothing", 0), ("Shoes", "Shoes", 0), ("Shirts", "Shirts", 0),
+    }
+
+
+async def test_subtree_listing_counts_each_product_once(db):
+    """Subtree listings include subcategories and skip inactive ones."""
+    store, clothing, men, shirts, _ = await _shop(db)
+    owner = store.user_id
+    tee = await _product(db, store)
+    polo = await _product(db, store)
+    draft = await _product(db, store, ProductStatus.draft)
+    await assign_products_to_category(db, store.id, owner, clothing.id, [tee.id])
+    await assign_products_to_category(db, store.id, owner, shirts.id, [tee.id, polo.id, draft.id])
+
+    direct, direct_total = await get_products_by_category(db, store.id, clothing.id)
+    assert (direct_total, [p.id for p in direct]) == (1, [tee.id])
+
+    subtree, total = await get_products_by_category(
+        db, store.id, clothing.id, include_subcategories=True
+    )
+    assert total == 2
+    assert {p.id for p in subtree} == {tee.id, polo.id}
+
+    await update_category(db, store.id, owner, shirts.id, is_active=False)
+    _, total = await get_products_by_category(
+        db, store.id, clothing.id, include_subcategories=True
+    )
+    assert total == 1
+    _, total = await get_products_by_category(
+        db, store.id, shirts.id, include_subcategories=True
+    )
+    assert total == 2
+
+
+async def test_tree_is_cached_with_recursive_counts(db):
+    """The tree is served from cache until an assignment or status change commits."""
+    store, clothing, men, shirts, shoes = await _shop(db)
+    owner = store.user_id
+    tee = await _product(db, store)
+    await assign_products_to_category(db, store.id, owner, shirts.id, [tee.id])
+
+    with patch.object(
+        category_service, "_build_tree", wraps=category_service._build_tree
+    ) as build:
+        tree = await get_category_tree(db, store.id)
+        assert await get_category_tree(db, store.id) == tree
+        assert build.call_count == 1
+
+        counts = {n["name"]: n["product_count"] for n in flatten_category_tree(tree)}
+        assert counts == {"Clothing": 1, "Men": 1, "Shirts": 1, "Shoes": 0}
+        assert [n["name"] for n in tree] == ["Clothing", "Shoes"]
+        assert tree[0]["children"][0]["id"] == men.id
+
+        await update_product(db, store.id, owner, tee.id, status=ProductStatus.draft)
+        assert await get_category_tree(db, store.id) == tree
+        await db.commit()
+        tree = await get_category_tree(db, store.id)
+        assert build.call_count == 2
+        assert tree[0]["product_count"] == 0
+
+
+async def test_tree_without_redis_is_built_from_database(db):
+    """A Redis outage builds the tree on every call."""
+    store, *_ = await _shop(db)
+    broken = MagicMock()
+    broken.get.side_effect = RedisError("down")
+    with patch.object(category_service, "get_redis", return_value=broken):
+        tree = await get_category_tree(db, store.id)
+    assert [n["name"] for n in flatten_category_tree(tree)] == [
+        "Clothing", "Men", "Shirts", "Shoes",
+    ]
+
+
+async def test_clone_copies_closure(db):
+    """A cloned store's subtree queries work on the new category IDs."""
+    store, *_ = await _shop(db)
+    clone = await clone_store(db, store.user_id, store.id)
+    assert await _pairs(db, clone) == await _pairs(db, store)
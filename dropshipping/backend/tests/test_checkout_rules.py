@@ -0,0 +1,227 @@
+"""Tests for the compiled per-store checkout rules cache.
+
+Covers ``checkout_rules_service`` and its use by
+``tax_service.calculate_tax`` and ``discount_service.validate_discount``.
+
+**For Developers:**
+    Tests use the ``db`` fixture and the Redis from ``REDIS_URL``; every
+    test creates its own store, so cache entries and version keys never
+    collide. Recompiles are counted by wrapping ``_compile``.
+
+**For QA Engineers:**
+    - Repeated checks are answered without recompiling.
+    - Tax, discount, and category edits are visible on the next check
+      after they commit, including edits made by another process; a
+      check racing the commit does not keep the old rules.
+    - Usage caps are enforced against the live ``times_used``.
+    - Without Redis, cached rules are used until the TTL runs out.
+"""
+
+import time
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.models.discount import AppliesTo, DiscountStatus, DiscountType
+from app.models.order import Order
+from app.models.product import Product, ProductStatus
+from app.models.store import Store
+from app.models.user import User
+from app.redis_client import get_sync_redis
+from app.services import checkout_rules_service
+from app.services.category_service import assign_products_to_category, create_category
+from app.services.discount_service import (
+    apply_discount,
+    create_discount,
+    update_discount,
+    validate_discount,
+)
+from app.services.tax_service import calculate_tax, create_tax_rate, update_tax_rate
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Rules Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _product(db, store) -> Product:
+    product = Product(
+        store_id=store.id,
+        title="Lamp",
+        slug=f"lamp-{uuid.uuid4().hex[:8]}",
+        price=Decimal("20"),
+        status=ProductStatus.active,
+    )
+    db.add(product)
+    await db.flush()
+    return product
+
+
+def _count_compiles():
+    return patch.object(
+        checkout_rules_service, "_compile", wraps=checkout_rules_service._compile
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tax
+# ---------------------------------------------------------------------------
+
+
+async def test_tax_rates_match_by_region_and_priority(db):
+    """Only rates whose state and zip are unset or equal apply, by priority."""
+    store = await _store(db)
+    owner = store.user_id
+    await create_tax_rate(db, store.id, owner, "Federal", Decimal("5"), "us", priority=0)
+    await create_tax_rate(db, store.id, owner, "State", Decimal("2"), "US", state="ca", priority=1)
+    await create_tax_rate(
+        db, store.id, owner, "City", Decimal("1"), "US", state="CA", zip_code="94105", priority=2
+    )
+    await create_tax_rate(db, store.id, owner, "Zip only", Decimal("3"), "US", zip_code="10001")
+    await create_tax_rate(db, store.id, owner, "Other", Decimal("9"), "US", state="NY")
+
+    result = await calculate_tax(db, store.id, Decimal("100"), "us", "ca", "94105")
+    assert [row["name"] for row in result["breakdown"]] == ["Federal", "State", "City"]
+    assert result["tax_amount"] == Decimal("8.00")
+
+    assert [
+        row["name"] for row in (await calculate_tax(db, store.id, Decimal("100"), "US"))["breakdown"]
+    ] == ["Federal"]
+    assert [
+        row["name"]
+        for row in (
+            await calculate_tax(db, store.id, Decimal("100"), "US", zip_code="10001")
+        )["breakdown"]
+    ] == ["Federal", "Zip only"]
+
+
+async def test_tax_checks_reuse_compiled_rules_until_rates_change(db):
+    """Estimates hit the cache; a committed rate edit recompiles."""
+    store = await _store(db)
+    rate = await create_tax_rate(db, store.id, store.user_id, "VAT", Decimal("20"), "GB")
+
+    with _count_compiles() as compile_:
+        for _ in range(3):
+            result = await calculate_tax(db, store.id, Decimal("50"), "GB")
+            assert result["tax_amount"] == Decimal("10.00")
+        assert compile_.call_count == 1
+
+        await update_tax_rate(db, store.id, store.user_id, rate.id, is_active=False)
+        await db.commit()
+        assert (await calculate_tax(db, store.id, Decimal("50"), "GB"))["breakdown"] == []
+        assert compile_.call_count == 2
+
+
+async def test_version_bump_from_another_process_recompiles(db):
+    """A version bump in Redis invalidates this process's entry."""
+    store = await _store(db)
+    await calculate_tax(db, store.id, Decimal("50"), "GB")
+
+    get_sync_redis().incr(checkout_rules_service._version_key(store.id))
+    with _count_compiles() as compile_:
+        await calculate_tax(db, store.id, Decimal("50"), "GB")
+        await calculate_tax(db, store.id, Decimal("50"), "GB")
+        assert compile_.call_count == 1
+
+
+async def test_without_redis_rules_are_used_until_ttl(db):
+    """A Redis outage falls back to the TTL."""
+    store = await _store(db)
+    await calculate_tax(db, store.id, Decimal("50"), "GB")
+
+    broken = MagicMock()
+    broken.get.side_effect = RedisError("down")
+    with _count_compiles() as compile_, \
+            patch.object(checkout_rules_service, "get_redis", return_value=broken):
+        await calculate_tax(db, store.id, Decimal("50"), "GB")
+        assert compile_.call_count == 0
+
+        expired = time.monotonic() - settings.checkout_rules_cache_ttl_seconds - 1
+        checkout_rules_service._cache[store.id].compiled_at = expired
+        await calculate_tax(db, store.id, Decimal("50"), "GB")
+        assert compile_.call_count == 1
+
+
+async def test_cache_keeps_most_recently_used_stores():
+    """The cache is capped by evicting the least recently used store."""
+    checkout_rules_service.clear_rules_cache()
+    with patch.object(settings, "checkout_rules_cache_max_stores", 2), \
+            patch.object(
+                checkout_rules_service, "_compile",
+                side_effect=lambda db, store_id: checkout_rules_service.StoreRules(),
+            ):
+        stores = [uuid.uuid4() for _ in range(3)]
+        for store_id in (stores[0], stores[1], stores[0], stores[2]):
+            await checkout_rules_service.get_store_rules(None, store_id)
+    assert list(checkout_rules_service._cache) == [stores[0], stores[2]]
+    checkout_rules_service.clear_rules_cache()
+
+
+# ---------------------------------------------------------------------------
+# Discounts
+# ---------------------------------------------------------------------------
+
+
+async def test_category_discount_follows_category_membership(db):
+    """Adding a product to a targeted category makes the code apply."""
+    store = await _store(db)
+    product = await _product(db, store)
+    category = await create_category(db, store.id, store.user_id, "Lighting")
+    await create_discount(
+        db, store.id, store.user_id, "glow10", None, DiscountType.percentage, Decimal("10"),
+        applies_to=AppliesTo.specific_categories, category_ids=[category.id],
+    )
+
+    result = await validate_discount(db, store.id, "GLOW10", Decimal("40"), [product.id])
+    assert result["valid"] is False
+    assert result["message"] == "This discount does not apply to the categories in your cart"
+
+    await assign_products_to_category(db, store.id, store.user_id, category.id, [product.id])
+    await db.commit()
+    result = await validate_discount(db, store.id, "glow10", Decimal("40"), [product.id])
+    assert result["valid"] is True
+    assert result["discount_amount"] == Decimal("4.00")
+
+
+async def test_usage_cap_reads_live_times_used(db):
+    """Applying a capped code is seen without invalidating the rules."""
+    store = await _store(db)
+    await create_discount(
+        db, store.id, store.user_id, "ONCE", None, DiscountType.fixed_amount, Decimal("5"),
+        max_uses=1,
+    )
+    assert (await validate_discount(db, store.id, "ONCE", Decimal("40")))["valid"] is True
+
+    order = Order(store_id=store.id, customer_email="a@example.com", total=Decimal("35"))
+    db.add(order)
+    await db.flush()
+    with _count_compiles() as compile_:
+        await apply_discount(db, store.id, "ONCE", order.id, "a@example.com", Decimal("5"))
+        result = await validate_discount(db, store.id, "ONCE", Decimal("40"))
+        assert compile_.call_count == 0
+    assert result["message"] == "This discount code has reached its usage limit"
+
+
+async def test_disabled_code_racing_the_commit_is_not_kept(db, session_factory):
+    """A lookup before the edit commits cannot cache the old rules as new."""
+    store = await _store(db)
+    discount = await create_discount(
+        db, store.id, store.user_id, "SPRING", None, DiscountType.fixed_amount, Decimal("5"),
+    )
+    store_id, owner, discount_id = store.id, store.user_id, discount.id
+    await db.commit()
+    assert (await validate_discount(db, store_id, "SPRING", Decimal("40")))["valid"] is True
+
+    await update_discount(db, store_id, owner, discount_id, status=DiscountStatus.disabled)
+    async with session_factory() as other:
+        assert (await validate_discount(other, store_id, "SPRING", Decimal("40")))["valid"] is True
+    await db.commit()
+    assert (await validate_discount(db, store_id, "SPRING", Decimal("40")))["valid"] is False
@@ -37,8 +37,18 @@ verification that transient data (orders, reviews) is NOT cloned.
 
 import uuid
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import select
+
+from app.models.category import ProductCategory
+from app.models.discount import DiscountProduct
+from app.models.product import Product
+from app.models.store_clone_job import CloneJobStatus, StoreCloneJob
+from app.models.supplier import ProductSupplier
+from app.services import clone_service
 
 
 # ---------------------------------------------------------------------------
@@ -1027,3 +1037,202 @@ async def test_clone_empty_store(client):
     )
     assert prod_resp.status_code == 200
     assert prod_resp.json()["total"] == 0
+
+
+# ---------------------------------------------------------------------------
+# 16. Junction links remapped server-side
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_clone_store_junctions_remapped(client, db):
+    """Product-category, product-supplier and discount-product links point at clones."""
+    token = await register_and_get_token(client)
+    await upgrade_to_starter(client, token)
+    store = await create_test_store(client, token, name="Linked Store")
+    product = await create_test_product(client, token, store["id"], title="Linked")
+    category = await create_test_category(client, token, store["id"], name="Linked Cat")
+    supplier = await create_test_supplier(client, token, store["id"])
+    discount = await create_test_discount(client, token, store["id"], code="LINK10")
+    db.add_all([
+        ProductCategory(product_id=uuid.UUID(product["id"]), category_id=uuid.UUID(category["id"])),
+        ProductSupplier(
+            product_id=uuid.UUID(product["id"]),
+            supplier_id=uuid.UUID(supplier["id"]),
+            supplier_sku="ACME-1",
+            supplier_cost=Decimal("4.20"),
+            is_primary=True,
+        ),
+        DiscountProduct(discount_id=uuid.UUID(discount["id"]), product_id=uuid.UUID(product["id"])),
+    ])
+    await db.commit()
+
+    resp = await clone_store(client, token, store["id"])
+    assert resp.status_code == 201
+    cloned_id = uuid.UUID(resp.json()["store"]["id"])
+
+    cloned_product = (
+        await db.execute(select(Product).where(Product.store_id == cloned_id))
+    ).scalar_one()
+    links = (
+        await db.execute(
+            select(ProductSupplier).where(ProductSupplier.product_id == cloned_product.id)
+        )
+    ).scalars().all()
+    assert len(links) == 1
+    assert str(links[0].supplier_id) != supplier["id"]
+    assert (links[0].supplier_sku, links[0].supplier_cost) == ("ACME-1", Decimal("4.20"))
+
+    category_links = (
+        await db.execute(
+            select(ProductCategory).where(ProductCategory.product_id == cloned_product.id)
+        )
+    ).scalars().all()
+    assert len(category_links) == 1
+    assert str(category_links[0].category_id) != category["id"]
+
+    discount_links = (
+        await db.execute(
+            select(DiscountProduct).where(DiscountProduct.product_id == cloned_product.id)
+        )
+    ).scalars().all()
+    assert len(discount_links) == 1
+    assert str(discount_links[0].discount_id) != discount["id"]
+
+
+# ---------------------------------------------------------------------------
+# 17. Background clone jobs
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_clone_large_store_runs_as_job(client, db, monkeypatch):
+    """Stores above the threshold return 202 with a paused store and a job."""
+    monkeypatch.setattr(clone_service.settings, "clone_job_threshold", 0)
+    token = await register_and_get_token(client)
+    await upgrade_to_starter(client, token)
+    store = await create_test_store(client, token, name="Big Store")
+    await create_test_product(
+        client, token, store["id"], title="Bulk Item",
+        variants=[{"name": "One", "sku": "B-1", "price": 5.0, "inventory_count": 3}],
+    )
+
+    with patch("app.tasks.clone_tasks.clone_store_contents.delay") as mock_delay:
+        resp = await clone_store(client, token, store["id"])
+    assert resp.status_code == 202
+    data = resp.json()
+    assert data["store"]["status"] == "paused"
+    job = data["job"]
+    assert job["status"] == "pending"
+    assert job["total_steps"] == clone_service.CLONE_STEP_COUNT
+    mock_delay.assert_called_once_with(job["id"])
+
+    # Run the steps the way the worker does, against the test schema.
+    steps: list[tuple[str, int]] = []
+    await db.run_sync(
+        lambda session: clone_service.clone_store_contents_sync(
+            session,
+            uuid.UUID(store["id"]),
+            uuid.UUID(data["store"]["id"]),
+            on_step=lambda name, done: steps.append((name, done)),
+        )
+    )
+    await db.commit()
+    assert steps[0] == ("id_map", 1)
+    assert steps[-1] == ("tax_rates", clone_service.CLONE_STEP_COUNT)
+
+    prod_resp = await client.get(
+        f"/api/v1/stores/{data['store']['id']}/products", headers=_auth(token)
+    )
+    products = prod_resp.json()["items"]
+    assert [p["title"] for p in products] == ["Bulk Item"]
+    assert products[0]["variants"][0]["sku"] == "B-1"
+
+    status_resp = await client.get(
+        f"/api/v1/stores/{store['id']}/clone/jobs/{job['id']}", headers=_auth(token)
+    )
+    assert status_resp.status_code == 200
+    assert status_resp.json()["store_id"] == data["store"]["id"]
+
+
+@pytest.mark.asyncio
+async def test_clone_job_unknown_returns_404(client):
+    """Unknown clone job ids return 404."""
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    resp = await client.get(
+        f"/api/v1/stores/{store['id']}/clone/jobs/{uuid.uuid4()}", headers=_auth(token)
+    )
+    assert resp.status_code == 404
+
+
+class TestCloneStoreContentsTask:
+    """Tests for the clone_store_contents Celery task."""
+
+    def _job(self):
+        job = MagicMock(spec=StoreCloneJob)
+        job.id = uuid.uuid4()
+        job.source_store_id = uuid.uuid4()
+        job.store_id = uuid.uuid4()
+        job.status = CloneJobStatus.pending
+        return job
+
+    @patch("app.services.storefront_routing_service.publish_store_route")
+    @patch("app.services.clone_service.clone_store_contents_sync")
+    @patch("app.tasks.clone_tasks.SyncSessionFactory")
+    def test_records_steps_and_activates_store(self, mock_factory, mock_clone, mock_publish):
+        """Each finished step is committed on the job; the store goes active."""
+        from app.tasks.clone_tasks import clone_store_contents
+
+        job = self._job()
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        work = MagicMock()
+        store = work.query.return_value.filter.return_value.first.return_value
+        mock_factory.side_effect = [session, work]
+
+        def run_steps(work, source_id, target_id, on_step):
+            on_step("id_map", 1)
+            on_step("products", 2)
+
+        mock_clone.side_effect = run_steps
+
+        result = clone_store_contents(str(job.id))
+
+        assert result == {"status": "completed", "store_id": str(job.store_id)}
+        assert (job.current_step, job.completed_steps) == ("products", 2)
+        assert job.status == CloneJobStatus.completed
+        assert store.status.value == "active"
+        mock_publish.assert_called_once_with(work, store)
+        work.commit.assert_called_once()
+        work.close.assert_called_once()
+
+    @patch("app.services.clone_service.clone_store_contents_sync")
+    @patch("app.tasks.clone_tasks.SyncSessionFactory")
+    def test_failure_rolls_back_and_marks_failed(self, mock_factory, mock_clone):
+        """A failing step rolls back the copy and marks the job failed."""
+        from app.tasks.clone_tasks import clone_store_contents
+
+        job = self._job()
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        mock_clone.side_effect = RuntimeError("unique violation")
+
+        assert clone_store_contents(str(job.id))["status"] == "failed"
+        assert job.status == CloneJobStatus.failed
+        assert "unique violation" in job.error_message
+        session.rollback.assert_called()
+
+    @patch("app.tasks.clone_tasks.SyncSessionFactory")
+    def test_skips_non_pending_job(self, mock_factory):
+        """A redelivered task does not clone a running job twice."""
+        from app.tasks.clone_tasks import clone_store_contents
+
+        job = self._job()
+        job.status = CloneJobStatus.running
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+
+        assert clone_store_contents(str(job.id))["status"] == "skipped"
@@ -729,6 +729,6 @@ async def test_dns_status_response_shape(client):
     data = resp.json()
     expected_keys = {
         "domain", "dns_configured", "ssl_provisioned",
-        "records_count", "propagation_status",
+        "records_count", "propagation_status", "checked_at",
     }
     assert set(data.keys()) == expected_keys
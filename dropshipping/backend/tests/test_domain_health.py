@@ -0,0 +1,234 @@
+"""Tests for concurrent DNS propagation checks and the domain health sweep.
+
+Covers ``dns_management_service.check_propagation`` (through
+``verify_dns_propagation``), the cached ``get_dns_status``,
+the ``claim_due_domains_sync`` / ``check_claimed_domains_sync`` health
+sweep, and the ``sweep_domain_health`` Beat task.
+
+**For Developers:**
+    ``get_dns_provider`` is patched to return a ``MockDnsProvider`` with
+    injected latency or a fixed outcome. The sweep runs through
+    ``db.run_sync``; because the test event loop is already running
+    there, ``run_async`` is patched to run the checks on a fresh loop in
+    a helper thread.
+
+**For QA Engineers:**
+    - A domain's records are checked at the same time, never more than
+      ``dns_propagation_concurrency`` at once.
+    - DNS status is answered from the last check until the managed
+      records change.
+    - Pending domains are verified by the sweep once their TXT record
+      resolves; failing domains are re-checked with doubling delays.
+    - Expired SSL certificates are flagged by the sweep.
+    - A domain changed while its checks run keeps the change.
+"""
+
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from app.config import settings
+from app.models.domain import CustomDomain, DnsRecordEntry, DnsRecordType, DomainStatus
+from app.models.store import Store
+from app.models.user import User
+from app.services import dns_management_service
+from app.services.dns.mock import MockDnsProvider
+from app.services.dns_management_service import (
+    check_claimed_domains_sync,
+    claim_due_domains_sync,
+    get_dns_status,
+    update_dns_record,
+    verify_dns_propagation,
+)
+from app.services.storefront_routing_service import resolve_host
+
+
+async def _domain(db, status=DomainStatus.verified, records: int = 0) -> CustomDomain:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Domain Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    domain = CustomDomain(
+        store_id=store.id,
+        domain=f"{uuid.uuid4().hex[:8]}.example.com",
+        status=status,
+        verification_token=uuid.uuid4().hex,
+    )
+    db.add(domain)
+    await db.flush()
+    for i in range(records):
+        db.add(DnsRecordEntry(
+            domain_id=domain.id,
+            record_type=DnsRecordType.A,
+            name=f"host{i}",
+            value="192.0.2.1",
+            ttl=3600,
+            is_managed=True,
+        ))
+    await db.flush()
+    return domain
+
+
+def _provider(**kwargs):
+    return patch.object(
+        dns_management_service, "get_dns_provider", return_value=MockDnsProvider(**kwargs)
+    )
+
+
+def _run_in_thread(coro):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def _sweep(db, **provider) -> dict:
+    with _provider(**provider), \
+            patch.object(dns_management_service, "run_async", _run_in_thread):
+        return await db.run_sync(
+            lambda session: check_claimed_domains_sync(
+                session, claim_due_domains_sync(session)
+            )
+        )
+
+
+async def test_records_are_checked_concurrently(db):
+    """Six slow lookups take about as long as one, within the bound."""
+    domain = await _domain(db, records=6)
+
+    with _provider(latency=0.2):
+        started = time.monotonic()
+        result = await verify_dns_propagation(db, domain.id)
+        assert time.monotonic() - started < 0.6
+    assert result["propagated"] is True
+    assert result["verified_records"] == 6
+    assert [d["name"] for d in result["details"]] == [f"host{i}" for i in range(6)]
+
+    with _provider(latency=0.1), \
+            patch.object(settings, "dns_propagation_concurrency", 2):
+        started = time.monotonic()
+        await verify_dns_propagation(db, domain.id)
+        assert time.monotonic() - started >= 0.3
+
+
+async def test_status_is_served_from_the_last_check(db):
+    """Status does not query DNS again until a managed record changes."""
+    domain = await _domain(db, records=2)
+    with _provider():
+        status = await get_dns_status(db, domain.id)
+    assert status["propagation_status"] == "propagated"
+    assert status["checked_at"] is not None
+
+    with _provider(latency=5.0, propagated=False):
+        started = time.monotonic()
+        assert (await get_dns_status(db, domain.id))["propagation_status"] == "propagated"
+        assert time.monotonic() - started < 1.0
+
+    record = (await dns_management_service.list_dns_records(db, domain.id))[0]
+    await update_dns_record(db, record.id, value="192.0.2.2")
+    with _provider(propagated=False):
+        assert (await get_dns_status(db, domain.id))["propagation_status"] == "pending"
+
+
+async def test_sweep_verifies_pending_domains(db):
+    """A pending domain whose TXT record resolves is verified and routed."""
+    domain = await _domain(db, status=DomainStatus.pending)
+
+    counts = await _sweep(db)
+    assert counts["verified"] == 1
+    assert domain.status == DomainStatus.verified
+    assert domain.verified_at is not None
+    assert domain.dns_next_check_at is None
+    assert (await resolve_host(db, domain.domain)).id == domain.store_id
+
+
+async def test_sweep_backs_off_failing_domains(db):
+    """Consecutive failures double the delay; domains not due are skipped."""
+    domain = await _domain(db, records=2)
+    base = settings.domain_health_retry_base_seconds
+
+    for failures in (1, 2, 3):
+        counts = await _sweep(db, propagated=False)
+        assert counts["failing"] == 1
+        assert domain.dns_propagated is False
+        assert domain.dns_check_failures == failures
+        delay = (domain.dns_next_check_at - domain.dns_checked_at).total_seconds()
+        assert 0.9 * base * 2 ** (failures - 1) <= delay <= 1.1 * base * 2 ** (failures - 1)
+
+        assert (await _sweep(db))["checked"] == 0
+        domain.dns_next_check_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await db.flush()
+
+    counts = await _sweep(db)
+    assert counts["propagated"] == 1
+    assert domain.dns_check_failures == 0
+    assert (await get_dns_status(db, domain.id))["propagation_status"] == "propagated"
+
+
+async def test_sweep_flags_expired_certificates(db):
+    """An active domain whose certificate expired needs a new one."""
+    domain = await _domain(db, status=DomainStatus.active, records=1)
+    domain.ssl_provisioned = True
+    domain.ssl_expires_at = datetime.now(timezone.utc) - timedelta(days=1)
+    await db.flush()
+
+    counts = await _sweep(db)
+    assert counts["ssl_expired"] == 1
+    assert domain.ssl_provisioned is False
+    assert domain.status == DomainStatus.verified
+
+
+async def test_claimed_domains_are_skipped_until_the_lease_ends(db):
+    """A second sweep does not claim domains another sweep is checking."""
+    domain = await _domain(db, records=1)
+
+    claimed = await db.run_sync(claim_due_domains_sync)
+    assert list(claimed) == [domain.id]
+    assert claimed[domain.id].checks == [(domain.domain, DnsRecordType.A, "192.0.2.1")]
+    assert await db.run_sync(claim_due_domains_sync) == {}
+
+
+async def test_change_during_checks_is_kept(db):
+    """Records changed while a sweep's lookups run are not overwritten."""
+    domain = await _domain(db, records=1)
+    claimed = await db.run_sync(claim_due_domains_sync)
+
+    record = (await dns_management_service.list_dns_records(db, domain.id))[0]
+    await update_dns_record(db, record.id, value="192.0.2.2")
+
+    with _provider(propagated=True), \
+            patch.object(dns_management_service, "run_async", _run_in_thread):
+        counts = await db.run_sync(
+            lambda session: check_claimed_domains_sync(session, claimed)
+        )
+    assert counts["checked"] == 0
+    await db.refresh(domain)
+    assert domain.dns_propagated is None
+    assert domain.dns_next_check_at is None
+
+
+@patch("app.services.dns_management_service.check_claimed_domains_sync")
+@patch("app.services.dns_management_service.claim_due_domains_sync")
+@patch("app.tasks.domain_tasks.SyncSessionFactory")
+def test_sweep_task_commits_claim_before_checking(mock_factory, mock_claim, mock_check):
+    """The Beat task commits the lease before any lookup runs."""
+    from app.tasks.domain_tasks import sweep_domain_health
+
+    session = MagicMock()
+    mock_factory.return_value = session
+    claimed = {uuid.uuid4(): MagicMock()}
+    mock_claim.return_value = claimed
+
+    def _check(check_session, check_claimed):
+        session.commit.assert_called_once()
+        assert check_claimed is claimed
+        return {"checked": 1, "verified": 1, "propagated": 0, "failing": 0, "ssl_expired": 0}
+
+    mock_check.side_effect = _check
+
+    assert sweep_domain_health()["verified"] == 1
+    assert session.commit.call_count == 2
+    session.close.assert_called_once()
@@ -0,0 +1,276 @@
+"""Tests for compiled email templates and batched SMTP delivery.
+
+Covers the process-wide template environment, the Redis outbox, the
+pooled SMTP sender, and the ``flush_email_outbox`` task.
+
+**For Developers:**
+    SMTP tests talk to a minimal in-process SMTP server (``smtp_stub``)
+    running on its own event loop thread. Outbox tests use the Redis from
+    ``REDIS_URL`` with a unique outbox key per test. Each test drops the
+    thread's SMTP pool afterwards so no connection outlives its stub.
+
+**For QA Engineers:**
+    - A batch uses at most ``smtp_pool_size`` connections, reused across
+      batches.
+    - A refused recipient fails only its own email; a dropped connection
+      is replaced.
+    - Failed emails are requeued until ``email_max_attempts``.
+"""
+
+import asyncio
+import threading
+import uuid
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.redis_client import get_sync_redis
+from app.services import email_delivery_service, email_service as email_service_module
+from app.services.email_delivery_service import (
+    OutgoingEmail,
+    flush_outbox_sync,
+    queue_email,
+    reset_smtp_pool,
+    send_emails,
+)
+from app.services.email_service import EmailService, get_template_env, reset_template_env
+
+
+class _SmtpStub:
+    """Tiny SMTP server recording the messages it accepts."""
+
+    def __init__(self) -> None:
+        self.received: list[str] = []
+        self.connections = 0
+        self.refuse: set[str] = set()
+        self.drop_after: int | None = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        sent_here = 0
+        recipient = None
+        writer.write(b"220 stub ESMTP\r\n")
+        try:
+            while True:
+                line = (await reader.readline()).decode().strip()
+                command = line[:4].upper()
+                if not line:
+                    break
+                if command in ("EHLO", "HELO"):
+                    reply = "250 stub"
+                elif command == "MAIL":
+                    reply = "250 OK"
+                elif command == "RCPT":
+                    recipient = line.split("<", 1)[1].rstrip(">")
+                    reply = "550 No such user" if recipient in self.refuse else "250 OK"
+                elif command == "DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await reader.readuntil(b"\r\n.\r\n")
+                    self.received.append(recipient)
+                    sent_here += 1
+                    reply = "250 Queued"
+                elif command == "QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    break
+                else:
+                    reply = "250 OK"
+                writer.write(f"{reply}\r\n".encode())
+                await writer.drain()
+                if self.drop_after is not None and sent_here >= self.drop_after:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+def smtp_stub():
+    """Run the stub SMTP server and point the SMTP settings at it."""
+    stub = _SmtpStub()
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    server = asyncio.run_coroutine_threadsafe(
+        asyncio.start_server(stub.handle, "127.0.0.1", 0), loop
+    ).result()
+    port = server.sockets[0].getsockname()[1]
+    reset_smtp_pool()
+    with patch.object(settings, "smtp_host", "127.0.0.1"), \
+            patch.object(settings, "smtp_port", port), \
+            patch.object(settings, "smtp_start_tls", False), \
+            patch.object(settings, "smtp_pool_size", 3):
+        yield stub
+        reset_smtp_pool()
+    server.close()
+    loop.call_soon_threadsafe(loop.stop)
+
+
+@pytest.fixture
+def outbox_key():
+    """Point the outbox at a throwaway Redis list; flush scheduling is patched out."""
+    key = f"test:email:outbox:{uuid.uuid4().hex}"
+    with patch.object(settings, "email_outbox_key", key), \
+            patch("app.tasks.email_tasks.flush_email_outbox") as task:
+        yield key, task
+    get_sync_redis().delete(key, email_delivery_service.FLUSH_KICK_KEY)
+
+
+def _email(to: str, attempts: int = 0) -> OutgoingEmail:
+    return OutgoingEmail(
+        to=to, subject="Hi", html="<p>Hi</p>", template_name="welcome.html", attempts=attempts
+    )
+
+
+# ---------------------------------------------------------------------------
+# Templates
+# ---------------------------------------------------------------------------
+
+
+def test_template_env_is_shared_and_compiled_once(tmp_path):
+    """Every EmailService uses one environment with a bytecode cache."""
+    reset_template_env()
+    try:
+        with patch.object(settings, "email_template_cache_dir", str(tmp_path)):
+            first, second = EmailService(), EmailService()
+            assert first.template_env is second.template_env is get_template_env()
+
+            html = first._render_template("welcome.html", {"store_name": "Cached Store"})
+            assert "Cached Store" in html
+            template = first.template_env.get_template("welcome.html")
+            assert second.template_env.get_template("welcome.html") is template
+            assert list(tmp_path.iterdir())
+    finally:
+        reset_template_env()
+
+
+# ---------------------------------------------------------------------------
+# SMTP pool
+# ---------------------------------------------------------------------------
+
+
+def test_batch_uses_pooled_connections(smtp_stub):
+    """A batch is spread over the pool and the connections are reused."""
+    emails = [_email(f"buyer{n}@example.com") for n in range(10)]
+
+    assert send_emails(emails) == [True] * 10
+    assert send_emails(emails[:4]) == [True] * 4
+
+    assert smtp_stub.connections == 3
+    assert sorted(smtp_stub.received[:10]) == sorted(e.to for e in emails)
+
+
+def test_refused_recipient_fails_only_its_email(smtp_stub):
+    """The relay refusing one recipient does not fail the batch."""
+    smtp_stub.refuse = {"gone@example.com"}
+    emails = [_email("a@example.com"), _email("gone@example.com"), _email("b@example.com")]
+
+    with patch.object(settings, "smtp_pool_size", 1):
+        reset_smtp_pool()
+        assert send_emails(emails) == [True, False, True]
+    assert smtp_stub.connections == 1
+
+
+def test_dropped_connection_is_replaced(smtp_stub):
+    """A connection the server closes is reopened for the next email."""
+    smtp_stub.drop_after = 2
+    emails = [_email(f"buyer{n}@example.com") for n in range(5)]
+
+    with patch.object(settings, "smtp_pool_size", 1):
+        reset_smtp_pool()
+        assert send_emails(emails) == [True] * 5
+    assert smtp_stub.connections == 3
+
+
+def test_unreachable_relay_fails_the_batch():
+    """Nothing listening fails every email without raising."""
+    reset_smtp_pool()
+    with patch.object(settings, "smtp_host", "127.0.0.1"), \
+            patch.object(settings, "smtp_port", 1), \
+            patch.object(settings, "smtp_start_tls", False):
+        assert send_emails([_email("a@example.com"), _email("b@example.com")]) == [False, False]
+    reset_smtp_pool()
+
+
+# ---------------------------------------------------------------------------
+# Outbox
+# ---------------------------------------------------------------------------
+
+
+def test_queue_schedules_one_flush_per_window(outbox_key):
+    """Emails queued within a window share one flush."""
+    key, task = outbox_key
+    assert queue_email(_email("a@example.com")) is True
+    assert queue_email(_email("b@example.com")) is False
+
+    task.apply_async.assert_called_once_with(countdown=settings.email_batch_window_seconds)
+    assert get_sync_redis().llen(key) == 2
+
+
+def test_flush_requeues_and_drops_failures(outbox_key, smtp_stub):
+    """Failures go back to the outbox until their attempts run out."""
+    key, _ = outbox_key
+    smtp_stub.refuse = {"gone@example.com", "bounced@example.com"}
+    redis = get_sync_redis()
+    redis.rpush(key, "not json")
+    for email in (
+        _email("a@example.com"),
+        _email("gone@example.com"),
+        _email("bounced@example.com", attempts=settings.email_max_attempts - 1),
+        _email("b@example.com"),
+    ):
+        redis.rpush(key, email.to_json())
+
+    with patch.object(settings, "email_batch_size", 3):
+        result = flush_outbox_sync()
+
+    assert result == {"batches": 2, "sent": 2, "requeued": 1, "dropped": 2}
+    (requeued,) = [OutgoingEmail.from_json(raw) for raw in redis.lrange(key, 0, -1)]
+    assert requeued.to == "gone@example.com"
+    assert requeued.attempts == 1
+
+
+# ---------------------------------------------------------------------------
+# EmailService and task
+# ---------------------------------------------------------------------------
+
+
+def test_send_email_sync_only_renders_in_dev_mode(outbox_key):
+    """The log backend never touches the outbox."""
+    key, _ = outbox_key
+    service = EmailService()
+    assert service.dev_mode is True
+    assert service.send_email_sync("a@example.com", "Hi", "welcome.html", {"store_name": "S"})
+    assert get_sync_redis().llen(key) == 0
+
+
+def test_send_email_sync_queues_outside_dev_mode(outbox_key):
+    """The SMTP backend queues the rendered email."""
+    key, _ = outbox_key
+    with patch.object(settings, "email_backend", "smtp"):
+        service = EmailService()
+        assert service.send_email_sync("a@example.com", "Hi", "welcome.html", {"store_name": "S"})
+
+    (queued,) = [OutgoingEmail.from_json(raw) for raw in get_sync_redis().lrange(key, 0, -1)]
+    assert queued.to == "a@example.com"
+    assert "S" in queued.html
+
+
+def test_send_email_sync_sends_directly_without_redis():
+    """If the outbox is unavailable the email is sent straight away."""
+    with patch.object(settings, "email_backend", "smtp"), \
+            patch.object(email_service_module, "queue_email", side_effect=RedisError("down")), \
+            patch.object(email_service_module, "send_emails", return_value=[True]) as send:
+        service = EmailService()
+        assert service.send_email_sync("a@example.com", "Hi", "welcome.html", {}) is True
+    assert send.call_args.args[0][0].to == "a@example.com"
+
+
+@patch("app.services.email_delivery_service.flush_outbox_sync")
+def test_flush_task_returns_counts(mock_flush):
+    """The task reports the flush result."""
+    from app.tasks.email_tasks import flush_email_outbox
+
+    mock_flush.return_value = {"batches": 1, "sent": 3, "requeued": 0, "dropped": 0}
+    assert flush_email_outbox()["sent"] == 3
@@ -0,0 +1,181 @@
+"""Tests for live exchange rates and batch price conversion.
+
+Covers the rate sources in ``app.services.exchange_rates``, the Redis
+snapshot published by ``currency_service.refresh_exchange_rates_sync``,
+``convert_prices`` rounding, and the ``currency`` parameter of the
+public product endpoints.
+
+**For Developers:**
+    Rates come from a ``FileRateSource`` over a JSON file in ``tmp_path``.
+    The ``rates_snapshot`` fixture clears the global snapshot keys and the
+    process's loaded table before and after each test, so other tests
+    keep seeing the built-in rates.
+
+**For QA Engineers:**
+    - Without a snapshot the built-in rates are used.
+    - A refresh publishes a new version only when the rates changed.
+    - Prices are rounded per currency (JPY to whole yen, CHF to 0.05).
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.redis_client import get_sync_redis
+from app.services import currency_service
+from app.services.currency_service import (
+    BUILTIN_VERSION,
+    convert_prices,
+    get_rate_table,
+    refresh_exchange_rates_sync,
+    round_amount,
+)
+from app.services.exchange_rates.file import FileRateSource
+
+
+@pytest.fixture
+def rates_snapshot():
+    """Start and end without a published snapshot."""
+    redis = get_sync_redis()
+    redis.delete(currency_service.SNAPSHOT_KEY, currency_service.VERSION_KEY)
+    currency_service.reset_rate_table()
+    yield redis
+    redis.delete(currency_service.SNAPSHOT_KEY, currency_service.VERSION_KEY)
+    currency_service.reset_rate_table()
+
+
+async def _refresh(source: FileRateSource) -> dict:
+    """Run the worker-side refresh off the test's event loop."""
+    return await asyncio.to_thread(refresh_exchange_rates_sync, source)
+
+
+def _rate_file(tmp_path, **rates) -> FileRateSource:
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"base": "USD", "rates": {"USD": 1, **rates}}))
+    return FileRateSource(str(path))
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+async def test_builtin_rates_without_snapshot(rates_snapshot):
+    """No published snapshot serves the built-in table."""
+    table = await get_rate_table()
+    assert table.version == BUILTIN_VERSION
+    assert table.rates["EUR"] == Decimal("0.92")
+
+
+async def test_refresh_publishes_new_version_only_on_change(rates_snapshot, tmp_path):
+    """Unchanged rates do not bump the version."""
+    source = _rate_file(tmp_path, EUR="0.90", JPY="150")
+
+    first = await _refresh(source)
+    assert first == {"version": "1", "changed": True, "currencies": 3}
+    assert (await _refresh(source))["changed"] is False
+
+    table = await get_rate_table()
+    assert table.version == "1"
+    assert table.rate("EUR", "JPY") == Decimal("150") / Decimal("0.90")
+    assert await get_rate_table() is table
+
+    source = _rate_file(tmp_path, EUR="0.95", JPY="150")
+    assert (await _refresh(source))["version"] == "2"
+    assert (await get_rate_table()).rates["EUR"] == Decimal("0.95")
+
+
+async def test_unusable_quote_keeps_previous_snapshot(rates_snapshot, tmp_path):
+    """A quote without a supported pair is rejected."""
+    await _refresh(_rate_file(tmp_path, EUR="0.90"))
+    with pytest.raises(ValueError):
+        await _refresh(_rate_file(tmp_path, XXX="2"))
+    assert (await get_rate_table()).rates["EUR"] == Decimal("0.90")
+
+
+async def test_redis_outage_keeps_last_loaded_table(rates_snapshot, tmp_path):
+    """The last loaded snapshot outlives a Redis outage."""
+    await _refresh(_rate_file(tmp_path, EUR="0.90"))
+    loaded = await get_rate_table()
+
+    broken = MagicMock()
+    broken.get.side_effect = RedisError("down")
+    with patch.object(currency_service, "get_redis", return_value=broken):
+        assert await get_rate_table() is loaded
+
+
+# ---------------------------------------------------------------------------
+# Conversion
+# ---------------------------------------------------------------------------
+
+
+def test_rounding_rules_per_currency():
+    """Decimals and cash increments come from CURRENCY_INFO."""
+    assert round_amount(Decimal("2988.5"), "JPY") == Decimal("2989")
+    assert round_amount(Decimal("17.5912"), "CHF") == Decimal("17.60")
+    assert round_amount(Decimal("17.5712"), "chf") == Decimal("17.55")
+    assert round_amount(Decimal("1.005"), "EUR") == Decimal("1.01")
+
+
+async def test_convert_prices_batch(rates_snapshot):
+    """A batch converts with one rate and validates the codes."""
+    amounts = [Decimal("19.99"), Decimal("5.00"), Decimal("0.01")]
+    assert await convert_prices(amounts, "usd", "EUR") == [
+        Decimal("18.39"), Decimal("4.60"), Decimal("0.01"),
+    ]
+    assert await convert_prices(amounts, "EUR", "EUR") == amounts
+    with pytest.raises(ValueError, match="Unsupported currency: XYZ"):
+        await convert_prices(amounts, "USD", "XYZ")
+
+
+# ---------------------------------------------------------------------------
+# Public product endpoints
+# ---------------------------------------------------------------------------
+
+
+async def _store_with_product(client) -> str:
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "fx@example.com", "password": "securepass123"},
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    store = (
+        await client.post("/api/v1/stores", json={"name": "FX Store", "niche": "gear"}, headers=headers)
+    ).json()
+    await client.post(
+        f"/api/v1/stores/{store['id']}/products",
+        json={
+            "title": "Lamp",
+            "price": "19.99",
+            "compare_at_price": "29.99",
+            "status": "active",
+            "variants": [{"name": "Large", "price": "24.99", "inventory_count": 3}],
+        },
+        headers=headers,
+    )
+    return store["slug"]
+
+
+async def test_public_products_in_requested_currency(client, rates_snapshot):
+    """Every price on the page is shown in the requested currency."""
+    slug = await _store_with_product(client)
+
+    page = (await client.get(f"/api/v1/public/stores/{slug}/products?currency=jpy")).json()
+    (product,) = page["items"]
+    assert product["currency"] == "JPY"
+    assert Decimal(product["price"]) == Decimal("2989")
+    assert Decimal(product["compare_at_price"]) == Decimal("4484")
+    assert Decimal(product["variants"][0]["price"]) == Decimal("3736")
+
+    single = (
+        await client.get(f"/api/v1/public/stores/{slug}/products/{product['slug']}")
+    ).json()
+    assert single["currency"] == "USD"
+    assert Decimal(single["price"]) == Decimal("19.99")
+
+    resp = await client.get(f"/api/v1/public/stores/{slug}/products?currency=XYZ")
+    assert resp.status_code == 400
@@ -0,0 +1,379 @@
+"""Tests for streaming data exports and background export jobs.
+
+Covers CSV and NDJSON output, gzip compression, batched server-side
+cursor streaming, ownership checks, and the export job lifecycle.
+
+**For Developers:**
+    Endpoint tests create the owner and store through the API, and rows
+    through the ``db`` fixture. ``EXPORT_BATCH_SIZE`` is patched down to
+    exercise multi-batch streaming on small datasets. The Celery task is
+    tested with a mocked ``SyncSessionFactory`` like the other task tests.
+
+**For QA Engineers:**
+    - CSV formatting is unchanged from the original exports.
+    - Gzip downloads decompress to the plain export byte for byte.
+    - Download of an unfinished job returns 409.
+    - Expired jobs lose their file and stale partial files are removed.
+"""
+
+import csv
+import gzip
+import io
+import json
+import uuid
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from app.models.customer import CustomerAccount
+from app.models.export_job import ExportJob, ExportJobStatus
+from app.models.order import Order, OrderStatus
+from app.models.product import Product, ProductStatus
+from app.models.store import Store
+from app.services import export_service
+from app.services.export_service import ExportDataset, ExportFormat
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _owner_with_store(client, email: str = "exporter@example.com") -> tuple[dict, str]:
+    """Register a user, create a store, and return (headers, store_id)."""
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": email, "password": "securepass123"},
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    resp = await client.post(
+        "/api/v1/stores",
+        json={"name": "Export Store", "niche": "electronics"},
+        headers=headers,
+    )
+    return headers, resp.json()["id"]
+
+
+async def _seed(db, store_id: str) -> None:
+    """Create two products, one order, and three customers."""
+    sid = uuid.UUID(store_id)
+    db.add_all([
+        Product(
+            store_id=sid,
+            title="Mug",
+            slug="mug",
+            price=Decimal("12.5"),
+            status=ProductStatus.active,
+            tags=["kitchen", "gift"],
+            images=["https://img.example.com/mug.png"],
+        ),
+        Product(store_id=sid, title="Lamp", slug="lamp", price=Decimal("40"), status=ProductStatus.draft),
+        Order(
+            store_id=sid,
+            customer_email="buyer@example.com",
+            status=OrderStatus.paid,
+            total=Decimal("52.50"),
+            subtotal=Decimal("52.50"),
+        ),
+    ])
+    for i in range(3):
+        db.add(
+            CustomerAccount(
+                store_id=sid,
+                email=f"customer{i}@example.com",
+                hashed_password="x",
+                first_name=f"C{i}",
+            )
+        )
+    await db.commit()
+
+
+# ---------------------------------------------------------------------------
+# Streaming downloads
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_orders_csv_export(client, db):
+    """Orders stream as CSV with headers and original formatting."""
+    headers, store_id = await _owner_with_store(client)
+    await _seed(db, store_id)
+
+    resp = await client.get(f"/api/v1/stores/{store_id}/exports/orders", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert f"orders-{store_id}.csv" in resp.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0][:3] == ["Order ID", "Status", "Customer Email"]
+    assert len(rows) == 2
+    order = dict(zip(rows[0], rows[1]))
+    assert order["Status"] == "paid"
+    assert order["Total"] == "52.50"
+    assert order["Discount Amount"] == "0.00"
+    assert order["Currency"] == "USD"
+    assert order["Notes"] == ""
+
+
+@pytest.mark.asyncio
+async def test_products_ndjson_export(client, db):
+    """NDJSON exports one JSON object per line with native arrays."""
+    headers, store_id = await _owner_with_store(client)
+    await _seed(db, store_id)
+
+    resp = await client.get(
+        f"/api/v1/stores/{store_id}/exports/products?format=ndjson", headers=headers
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    products = {p["slug"]: p for p in map(json.loads, resp.text.splitlines())}
+    assert set(products) == {"mug", "lamp"}
+    assert products["mug"]["price"] == "12.50"
+    assert products["mug"]["tags"] == ["kitchen", "gift"]
+    assert products["mug"]["status"] == "active"
+    assert products["lamp"]["cost"] is None
+
+
+@pytest.mark.asyncio
+async def test_gzip_export_matches_plain(client, db):
+    """Gzip downloads decompress to exactly the uncompressed export."""
+    headers, store_id = await _owner_with_store(client)
+    await _seed(db, store_id)
+    url = f"/api/v1/stores/{store_id}/exports/customers"
+
+    plain = await client.get(url, headers=headers)
+    packed = await client.get(f"{url}?gzip=true", headers=headers)
+
+    assert packed.status_code == 200
+    assert packed.headers["content-type"] == "application/gzip"
+    assert "customers-" in packed.headers["content-disposition"]
+    assert gzip.decompress(packed.content) == plain.content
+    assert plain.text.count("\n") == 4
+
+
+@pytest.mark.asyncio
+async def test_export_other_users_store_returns_404(client, db):
+    """Exports of a store owned by someone else are rejected."""
+    _, store_id = await _owner_with_store(client)
+    other_headers, _ = await _owner_with_store(client, email="other@example.com")
+
+    resp = await client.get(
+        f"/api/v1/stores/{store_id}/exports/orders", headers=other_headers
+    )
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_one_chunk_per_batch(client, db, monkeypatch):
+    """Rows are read in yield_per batches and emitted as separate chunks."""
+    _, store_id = await _owner_with_store(client)
+    await _seed(db, store_id)
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 2)
+    user_id = (
+        await db.execute(select(Store.user_id).where(Store.id == uuid.UUID(store_id)))
+    ).scalar_one()
+
+    chunks = [
+        chunk
+        async for chunk in await export_service.open_export(
+            db, uuid.UUID(store_id), user_id, ExportDataset.customers, ExportFormat.ndjson
+        )
+    ]
+
+    # 3 customers in batches of 2 -> two chunks, no header for NDJSON
+    assert len(chunks) == 2
+    emails = [json.loads(line)["email"] for line in b"".join(chunks).decode().splitlines()]
+    assert sorted(emails) == [f"customer{i}@example.com" for i in range(3)]
+
+
+# ---------------------------------------------------------------------------
+# Background export jobs
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_export_job_lifecycle(client, db, tmp_path):
+    """Jobs are queued, report status, and serve their file once complete."""
+    headers, store_id = await _owner_with_store(client)
+    await _seed(db, store_id)
+
+    with patch("app.tasks.export_tasks.generate_export.delay") as mock_delay:
+        resp = await client.post(
+            f"/api/v1/stores/{store_id}/exports/orders/jobs?gzip=true", headers=headers
+        )
+    assert resp.status_code == 202
+    job = resp.json()
+    assert job["status"] == "pending"
+    assert job["download_url"] is None
+    mock_delay.assert_called_once_with(job["id"])
+
+    url = f"/api/v1/stores/{store_id}/exports/jobs/{job['id']}"
+    assert (await client.get(f"{url}/download", headers=headers)).status_code == 409
+
+    # Run the export the way the worker does, against the test schema.
+    file_path = tmp_path / "orders.csv.gz"
+    with open(file_path, "wb") as out:
+        row_count = await db.run_sync(
+            lambda session: export_service.write_export_sync(
+                session, uuid.UUID(store_id), ExportDataset.orders,
+                ExportFormat.csv, True, out,
+            )
+        )
+    assert row_count == 1
+    record = await db.get(ExportJob, uuid.UUID(job["id"]))
+    record.status = ExportJobStatus.completed
+    record.file_path = str(file_path)
+    record.row_count = row_count
+    await db.commit()
+
+    status_resp = await client.get(url, headers=headers)
+    assert status_resp.json()["download_url"] == f"{url}/download"
+
+    download = await client.get(f"{url}/download", headers=headers)
+    assert download.status_code == 200
+    plain = await client.get(f"/api/v1/stores/{store_id}/exports/orders", headers=headers)
+    assert gzip.decompress(download.content) == plain.content
+
+
+@pytest.mark.asyncio
+async def test_export_job_unknown_returns_404(client):
+    """Unknown job ids return 404."""
+    headers, store_id = await _owner_with_store(client)
+    resp = await client.get(
+        f"/api/v1/stores/{store_id}/exports/jobs/{uuid.uuid4()}", headers=headers
+    )
+    assert resp.status_code == 404
+
+
+class TestGenerateExportTask:
+    """Tests for the generate_export Celery task."""
+
+    def _job(self):
+        job = MagicMock(spec=ExportJob)
+        job.id = uuid.uuid4()
+        job.store_id = uuid.uuid4()
+        job.dataset = "orders"
+        job.format = "csv"
+        job.compressed = False
+        job.status = ExportJobStatus.pending
+        return job
+
+    @patch("app.services.export_service.write_export_sync")
+    @patch("app.tasks.export_tasks.SyncSessionFactory")
+    def test_writes_file_and_completes(self, mock_factory, mock_write, tmp_path):
+        """Writes the export under export_dir and marks the job completed."""
+        from app.tasks.export_tasks import generate_export
+
+        job = self._job()
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        mock_write.side_effect = lambda s, sid, d, f, c, out: out.write(b"a,b\n") and 7
+
+        with patch("app.tasks.export_tasks.settings.export_dir", str(tmp_path)):
+            result = generate_export(str(job.id))
+
+        assert result["status"] == "completed"
+        assert result["row_count"] == 7
+        assert job.status == ExportJobStatus.completed
+        with open(job.file_path, "rb") as f:
+            assert f.read() == b"a,b\n"
+        assert not list(tmp_path.rglob("*.part"))
+
+    @patch("app.services.export_service.write_export_sync")
+    @patch("app.tasks.export_tasks.SyncSessionFactory")
+    def test_failure_marks_job_failed(self, mock_factory, mock_write, tmp_path):
+        """Errors mark the job failed and remove the partial file."""
+        from app.tasks.export_tasks import generate_export
+
+        job = self._job()
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+        mock_write.side_effect = RuntimeError("cursor lost")
+
+        with patch("app.tasks.export_tasks.settings.export_dir", str(tmp_path)):
+            result = generate_export(str(job.id))
+
+        assert result["status"] == "failed"
+        assert job.status == ExportJobStatus.failed
+        assert "cursor lost" in job.error_message
+        assert not list(tmp_path.rglob("*.part"))
+
+    @patch("app.tasks.export_tasks.SyncSessionFactory")
+    def test_skips_non_pending_job(self, mock_factory):
+        """A redelivered task does not export a running job twice."""
+        from app.tasks.export_tasks import generate_export
+
+        job = self._job()
+        job.status = ExportJobStatus.running
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = job
+        mock_factory.return_value = session
+
+        assert generate_export(str(job.id))["status"] == "skipped"
+
+
+class TestExpireExportsTask:
+    """Tests for the expire_exports Celery task."""
+
+    def _completed(self, file_path):
+        job = MagicMock(spec=ExportJob)
+        job.status = ExportJobStatus.completed
+        job.file_path = file_path
+        return job
+
+    @patch("app.tasks.export_tasks.SyncSessionFactory")
+    def test_deletes_files_and_expires_jobs(self, mock_factory, tmp_path):
+        """Old files are deleted, and a file that is already gone is ignored."""
+        from app.tasks.export_tasks import expire_exports
+
+        old_file = tmp_path / "old.csv"
+        old_file.write_bytes(b"a,b\n")
+        present = self._completed(str(old_file))
+        missing = self._completed(str(tmp_path / "missing.csv"))
+        session = MagicMock()
+        query = session.query.return_value.filter.return_value.order_by.return_value
+        query.limit.return_value.all.return_value = [present, missing]
+        mock_factory.return_value = session
+
+        with patch("app.tasks.export_tasks.settings.export_dir", str(tmp_path)):
+            result = expire_exports()
+
+        assert result == {"expired": 2, "orphans": 0}
+        assert not old_file.exists()
+        for job in (present, missing):
+            assert job.status == ExportJobStatus.expired
+            assert job.file_path is None
+        session.commit.assert_called_once()
+
+    @patch("app.tasks.export_tasks.SyncSessionFactory")
+    def test_removes_only_stale_partial_files(self, mock_factory, tmp_path):
+        """Partial files of dead workers are removed; live ones are kept."""
+        import os
+        import time
+
+        from app.tasks.export_tasks import expire_exports
+
+        store_dir = tmp_path / str(uuid.uuid4())
+        store_dir.mkdir()
+        stale = store_dir / "stale.csv.part"
+        stale.write_bytes(b"a")
+        old = time.time() - 3 * 24 * 3600
+        os.utime(stale, (old, old))
+        live = store_dir / "live.csv.part"
+        live.write_bytes(b"a")
+        session = MagicMock()
+        query = session.query.return_value.filter.return_value.order_by.return_value
+        query.limit.return_value.all.return_value = []
+        mock_factory.return_value = session
+
+        with patch("app.tasks.export_tasks.settings.export_dir", str(tmp_path)):
+            result = expire_exports()
+
+        assert result == {"expired": 0, "orphans": 1}
+        assert not stale.exists()
+        assert live.exists()
@@ -0,0 +1,241 @@
+"""Tests for incremental fraud features and batch rescoring.
+
+Covers the Redis-backed per-customer counters of
+``fraud_feature_service``, the shared ``fraud_service.score_order`` rules,
+and ``fraud_service.rescore_pending_orders_sync``.
+
+**For Developers:**
+    Feature tests use the ``db`` fixture and the Redis from ``REDIS_URL``;
+    every test creates its own store, so Redis keys never collide.
+    Rescoring runs through ``db.run_sync``.
+
+**For QA Engineers:**
+    - The first read rebuilds the features from PostgreSQL; later reads
+      come from Redis and move only through the order transition hooks.
+    - Features are still computed when Redis is down.
+    - Rescoring updates stale checks, creates missing ones, and leaves
+      reviewed checks alone.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from redis.exceptions import RedisError
+
+from app.models.fraud import FraudCheck, FraudRiskLevel
+from app.models.order import Order, OrderStatus
+from app.models.store import Store
+from app.models.user import User
+from app.redis_client import get_sync_redis
+from app.services import fraud_feature_service
+from app.services.fraud_feature_service import (
+    CustomerFeatures,
+    get_customer_features,
+    get_customer_features_sync,
+    record_order_placed,
+    record_status_change,
+)
+from app.services.fraud_service import rescore_pending_orders_sync, score_order
+
+EMAIL = "shopper@example.com"
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Fraud Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _order(db, store, status, total="40", email=EMAIL, age=timedelta(0)) -> Order:
+    order = Order(
+        store_id=store.id,
+        customer_email=email,
+        status=status,
+        total=Decimal(total),
+        created_at=datetime.now(timezone.utc) - age,
+    )
+    db.add(order)
+    await db.flush()
+    return order
+
+
+def _forget(store, email=EMAIL):
+    get_sync_redis().delete(*fraud_feature_service._keys(store.id, email))
+
+
+# ---------------------------------------------------------------------------
+# Features
+# ---------------------------------------------------------------------------
+
+
+async def test_features_are_seeded_then_maintained_in_redis(db):
+    """The first read seeds Redis; later changes arrive through the hooks."""
+    store = await _store(db)
+    await _order(db, store, OrderStatus.delivered, age=timedelta(days=3))
+    await _order(db, store, OrderStatus.cancelled, age=timedelta(days=2))
+    await _order(db, store, OrderStatus.paid, age=timedelta(minutes=20))
+    current = await _order(db, store, OrderStatus.pending)
+    await db.commit()
+    try:
+        assert await get_customer_features(db, current) == CustomerFeatures(2, 2)
+
+        # Placed behind the service's back: only the hooks move the cache.
+        extra = await _order(db, store, OrderStatus.pending)
+        await db.commit()
+        assert await get_customer_features(db, current) == CustomerFeatures(2, 2)
+
+        await record_order_placed(extra)
+        extra.status = OrderStatus.paid
+        await record_status_change(extra, OrderStatus.pending)
+        current.status = OrderStatus.paid
+        await record_status_change(current, OrderStatus.pending)
+
+        # The order's own payment is not part of its history.
+        assert await get_customer_features(db, current) == CustomerFeatures(3, 3)
+        assert await db.run_sync(
+            lambda s: get_customer_features_sync(s, current)
+        ) == CustomerFeatures(3, 3)
+    finally:
+        _forget(store)
+
+
+async def test_shipping_does_not_move_counter(db):
+    """Only entering or leaving a counted status changes the counter."""
+    store = await _store(db)
+    order = await _order(db, store, OrderStatus.paid)
+    await db.commit()
+    try:
+        await get_customer_features(db, order)
+        order.status = OrderStatus.shipped
+        await record_status_change(order, OrderStatus.paid)
+        counter_key, _ = fraud_feature_service._keys(store.id, EMAIL)
+        assert get_sync_redis().hget(counter_key, "orders") == "1"
+
+        order.status = OrderStatus.cancelled
+        await record_status_change(order, OrderStatus.shipped)
+        assert get_sync_redis().hget(counter_key, "orders") == "0"
+    finally:
+        _forget(store)
+
+
+async def test_status_change_without_counter_is_ignored(db):
+    """A counter is never started from a partial count."""
+    store = await _store(db)
+    order = await _order(db, store, OrderStatus.paid)
+    await db.commit()
+    try:
+        await record_status_change(order, OrderStatus.pending)
+        counter_key, _ = fraud_feature_service._keys(store.id, EMAIL)
+        assert not get_sync_redis().exists(counter_key)
+    finally:
+        _forget(store)
+
+
+async def test_features_fall_back_to_postgres_without_redis(db):
+    """Redis errors are not fatal to scoring."""
+    store = await _store(db)
+    await _order(db, store, OrderStatus.paid, age=timedelta(days=1))
+    current = await _order(db, store, OrderStatus.pending)
+    await db.commit()
+
+    broken = MagicMock()
+    broken.register_script.return_value = MagicMock(side_effect=RedisError("down"))
+    with patch.object(fraud_feature_service, "get_redis", return_value=broken):
+        assert await get_customer_features(db, current) == CustomerFeatures(1, 1)
+    assert not get_sync_redis().exists(*fraud_feature_service._keys(store.id, EMAIL))
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+
+def test_score_order_returning_customer_is_clean():
+    """A returning customer with a normal order has no signals."""
+    assert score_order(Decimal("40"), EMAIL, CustomerFeatures(1, 1)) == (0, "low", [])
+
+
+def test_score_order_caps_at_100():
+    """Every signal at once scores exactly 100."""
+    score, level, signals = score_order(
+        Decimal("600"), "test+alias@fake.com", CustomerFeatures(0, 4)
+    )
+    assert (score, level) == (100, "critical")
+    assert signals == [
+        "high_amount",
+        "new_customer_high_order",
+        "velocity_spike",
+        "suspicious_email",
+        "first_order",
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Batch rescoring
+# ---------------------------------------------------------------------------
+
+
+async def test_rescore_updates_creates_and_skips_reviewed(db):
+    """Stale checks are rewritten, missing ones created, reviewed ones kept."""
+    store = await _store(db)
+    await _order(db, store, OrderStatus.delivered, email="loyal@example.com", age=timedelta(days=5))
+    stale = await _order(db, store, OrderStatus.paid, total="600", email="new@example.com")
+    missing = await _order(db, store, OrderStatus.paid, email="loyal@example.com")
+    reviewed = await _order(db, store, OrderStatus.paid, total="600", email="vip@example.com")
+    await _order(db, store, OrderStatus.shipped, total="600", email="gone@example.com")
+
+    stale_check = FraudCheck(
+        store_id=store.id, order_id=stale.id, risk_level=FraudRiskLevel.low,
+        risk_score=Decimal("10"), signals=["first_order"], is_flagged=False,
+    )
+    reviewed_check = FraudCheck(
+        store_id=store.id, order_id=reviewed.id, risk_level=FraudRiskLevel.low,
+        risk_score=Decimal("0"), signals=[], is_flagged=False,
+        reviewed_by=store.user_id, reviewed_at=datetime.now(timezone.utc),
+    )
+    db.add_all([stale_check, reviewed_check])
+    await db.commit()
+
+    def rescore(session):
+        first = rescore_pending_orders_sync(session, store_id=store.id, limit=2)
+        second = rescore_pending_orders_sync(
+            session, store_id=store.id, after_order_id=first["last_order_id"], limit=2
+        )
+        third = rescore_pending_orders_sync(
+            session, store_id=store.id, after_order_id=second["last_order_id"], limit=2
+        )
+        session.commit()
+        return first, second, third
+
+    first, second, third = await db.run_sync(rescore)
+
+    assert first["orders"] + second["orders"] == 3
+    assert third == {
+        "orders": 0, "updated": 0, "created": 0, "last_order_id": None, "newly_flagged": [],
+    }
+    assert first["updated"] + second["updated"] == 1
+    assert first["created"] + second["created"] == 1
+    assert first["newly_flagged"] + second["newly_flagged"] == [
+        (str(store.id), str(stale_check.id))
+    ]
+
+    await db.refresh(stale_check)
+    await db.refresh(reviewed_check)
+    assert stale_check.risk_level == FraudRiskLevel.high
+    assert stale_check.risk_score == Decimal("55")
+    assert stale_check.is_flagged is True
+    assert reviewed_check.risk_score == Decimal("0")
+
+    (created,) = (
+        await db.execute(
+            FraudCheck.__table__.select().where(FraudCheck.order_id == missing.id)
+        )
+    ).all()
+    assert created.risk_level == FraudRiskLevel.low
+    assert created.signals == []
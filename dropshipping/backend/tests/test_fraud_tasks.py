@@ -5,9 +5,11 @@ calculates risk scores, assigns risk levels, and dispatches fraud alert
 notifications for flagged orders.
 
 **For Developers:**
-    Tests mock ``SyncSessionFactory`` to inject controlled database state.
-    Each signal is tested individually and in combination to verify correct
-    score accumulation and risk-level thresholds.
+    Tests mock ``SyncSessionFactory`` to inject the order and patch
+    ``fraud_feature_service.get_customer_features_sync`` to inject the
+    customer's features. Each signal is tested individually and in
+    combination to verify correct score accumulation and risk-level
+    thresholds.
 
 **For QA Engineers:**
     - Signal thresholds: high_amount ($500+), new_customer_high_order (first + $200+),
@@ -20,9 +22,7 @@ notifications for flagged orders.
 
 import uuid
 from decimal import Decimal
-from unittest.mock import MagicMock, patch, call
-
-import pytest
+from unittest.mock import MagicMock, patch
 
 
 def _make_mock_order(
@@ -44,6 +44,23 @@ def _make_mock_order(
     return mock
 
 
+def _session_for(order):
+    """Create a mock session whose order lookup returns ``order``."""
+    session = MagicMock()
+    session.query.return_value.filter.return_value.first.return_value = order
+    return session
+
+
+def _features(previous_orders=1, recent_orders=1):
+    """Create customer features (defaults: returning customer, no spike)."""
+    from app.services.fraud_feature_service import CustomerFeatures
+
+    return CustomerFeatures(previous_orders=previous_orders, recent_orders=recent_orders)
+
+
+_FEATURES = "app.services.fraud_feature_service.get_customer_features_sync"
+
+
 class TestRunFraudCheckOrderNotFound:
     """Tests for missing order handling."""
 
@@ -64,54 +81,31 @@ class TestRunFraudCheckOrderNotFound:
 class TestFraudSignalHighAmount:
     """Tests for the high_amount signal ($500+)."""
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_high_amount_adds_20_points(self, mock_factory):
+    def test_high_amount_adds_20_points(self, mock_factory, mock_features):
         """Orders >= $500 trigger high_amount signal (+20 points)."""
-        from app.models.fraud import FraudCheck, FraudRiskLevel
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="600.00", customer_email="legit@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # previous_orders=1 (not first), velocity=1 (no spike)
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert "high_amount" in result["signals"]
         assert result["risk_score"] >= 20
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_no_high_amount_under_500(self, mock_factory):
+    def test_no_high_amount_under_500(self, mock_factory, mock_features):
         """Orders < $500 do not trigger high_amount signal."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="499.99", customer_email="legit@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # previous_orders=1 (not first), velocity=1 (no spike)
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert "high_amount" not in result["signals"]
@@ -120,50 +114,30 @@ class TestFraudSignalHighAmount:
 class TestFraudSignalSuspiciousEmail:
     """Tests for the suspicious_email signal."""
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_suspicious_email_with_plus(self, mock_factory):
+    def test_suspicious_email_with_plus(self, mock_factory, mock_features):
         """Email containing '+' triggers suspicious_email signal."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="20.00", customer_email="user+alias@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert "suspicious_email" in result["signals"]
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_suspicious_email_with_test(self, mock_factory):
+    def test_suspicious_email_with_test(self, mock_factory, mock_features):
         """Email containing 'test' triggers suspicious_email signal."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="20.00", customer_email="testuser@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert "suspicious_email" in result["signals"]
@@ -172,29 +146,16 @@ class TestFraudSignalSuspiciousEmail:
 class TestFraudSignalFirstOrder:
     """Tests for the first_order signal."""
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_first_order_adds_10_points(self, mock_factory):
+    def test_first_order_adds_10_points(self, mock_factory, mock_features):
         """First-time customer triggers first_order signal (+10)."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="20.00", customer_email="new@example.com")
 
-        session = MagicMock()
-        call_count = [0]
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # First call: previous orders count (0 = first order)
-                # Second call: velocity count
-                chain.filter.return_value.scalar.return_value = 0
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features(previous_orders=0)
 
         result = run_fraud_check(str(order.id))
         assert "first_order" in result["signals"]
@@ -204,63 +165,42 @@ class TestFraudSignalFirstOrder:
 class TestFraudRiskLevels:
     """Tests for risk level thresholds."""
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_low_risk_clean_order(self, mock_factory):
+    def test_low_risk_clean_order(self, mock_factory, mock_features):
         """A clean order with no signals is low risk."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="20.00", customer_email="clean@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # previous_orders=1 (not first order), velocity=1 (no spike)
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert result["risk_level"] == "low"
         assert result["is_flagged"] is False
         assert result["risk_score"] == 0
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_high_risk_is_flagged(self, mock_factory):
+    def test_high_risk_is_flagged(self, mock_factory, mock_features):
         """Orders with high risk level are flagged for review."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         # High amount ($500+ → +20) + first order (+10) + new_customer_high_order (+25) = 55 → high
         order = _make_mock_order(total="600.00", customer_email="new@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                chain.filter.return_value.scalar.return_value = 0  # first order
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features(previous_orders=0)
 
         result = run_fraud_check(str(order.id))
         assert result["risk_level"] in ("high", "critical")
         assert result["is_flagged"] is True
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_score_capped_at_100(self, mock_factory):
+    def test_score_capped_at_100(self, mock_factory, mock_features):
         """Risk score is capped at 100 even if signals exceed it."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         # high_amount(+20) + new_customer_high_order(+25) + velocity_spike(+30)
@@ -270,63 +210,29 @@ class TestFraudRiskLevels:
             customer_email="test+alias@fake.com",
         )
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # previous_orders=0 (first order), velocity=5 (spike)
-                chain.filter.return_value.scalar.return_value = 0
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
-
-        # Override velocity to trigger spike
-        # The query returns 0 for previous orders but we need velocity >= 3
-        # Since both queries use the same scalar mock, we need sequential return values
-        scalar_values = iter([0, 5])  # first=0 prev orders, second=5 recent orders
-        def query_side_effect_v2(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                chain.filter.return_value.scalar.return_value = next(scalar_values, 0)
-            return chain
-
-        session.query.side_effect = query_side_effect_v2
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features(previous_orders=0, recent_orders=5)
 
         result = run_fraud_check(str(order.id))
-        assert result["risk_score"] <= 100
+        assert result["risk_score"] == 100
+        assert "velocity_spike" in result["signals"]
 
 
 class TestFraudNotificationDispatch:
     """Tests for fraud alert notification dispatching."""
 
     @patch("app.tasks.notification_tasks.create_fraud_alert_notification")
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_dispatches_notification_when_flagged(self, mock_factory, mock_notify):
+    def test_dispatches_notification_when_flagged(self, mock_factory, mock_features, mock_notify):
         """Fraud alert notification is dispatched for flagged orders."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         # Trigger high risk: high_amount + first_order + new_customer_high_order = 55
         order = _make_mock_order(total="600.00", customer_email="new@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                chain.filter.return_value.scalar.return_value = 0  # first order
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features(previous_orders=0)
 
         mock_notify.delay = MagicMock()
 
@@ -334,27 +240,16 @@ class TestFraudNotificationDispatch:
         if result["is_flagged"]:
             mock_notify.delay.assert_called_once()
 
+    @patch(_FEATURES)
     @patch("app.tasks.fraud_tasks.SyncSessionFactory")
-    def test_no_notification_for_low_risk(self, mock_factory):
+    def test_no_notification_for_low_risk(self, mock_factory, mock_features):
         """No notification is dispatched for low-risk orders."""
-        from app.models.order import Order
         from app.tasks.fraud_tasks import run_fraud_check
 
         order = _make_mock_order(total="20.00", customer_email="clean@example.com")
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if model is Order or (hasattr(model, '__name__') and model.__name__ == "Order"):
-                chain.filter.return_value.first.return_value = order
-            else:
-                # previous_orders=1 (not first), velocity=1 (no spike)
-                chain.filter.return_value.scalar.return_value = 1
-            return chain
-
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        mock_factory.return_value = _session_for(order)
+        mock_features.return_value = _features()
 
         result = run_fraud_check(str(order.id))
         assert result["is_flagged"] is False
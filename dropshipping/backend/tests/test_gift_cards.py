@@ -9,9 +9,26 @@ All endpoints require authentication and enforce store ownership.
     POST create returns 201 with auto-generated or custom code.
     Validate endpoint checks balance, expiry, and active status.
     Disabled gift cards cannot be used for purchases.
+    Charges are conditional updates: concurrent charges on one card
+    never overdraw it, and every charge appends a ledger transaction.
+    Validation caches a card's status and expiry in Redis (dropped once a
+    disable or charge commits) and always reads the balance live.
 """
 
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
 import pytest
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+
+from app.models.gift_card import GiftCard, GiftCardStatus, GiftCardTransaction
+from app.models.store import Store
+from app.models.user import User
+from app.services import gift_card_service
 
 
 # ---------------------------------------------------------------------------
@@ -268,3 +285,193 @@ async def test_disable_gift_card_already_disabled(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_disable_invalidates_cached_validation(client):
+    """A validated (and so cached) card fails validation once disabled."""
+    token = await register_and_get_token(client)
+    store = await create_test_store(client, token)
+    card = await create_test_gift_card(client, token, store["id"])
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"/api/v1/stores/{store['id']}/gift-cards/validate"
+
+    assert (await client.post(url, json={"code": card["code"]}, headers=headers)).json()["valid"]
+    await client.post(
+        f"/api/v1/stores/{store['id']}/gift-cards/{card['id']}/disable", headers=headers
+    )
+
+    data = (await client.post(url, json={"code": card["code"]}, headers=headers)).json()
+    assert data["valid"] is False
+    assert data["message"] == "This gift card is not active"
+
+
+# ---------------------------------------------------------------------------
+# Charging and the transaction ledger
+# ---------------------------------------------------------------------------
+
+
+async def _make_card(db, balance: str = "50.00", **kwargs) -> GiftCard:
+    """Create a store with one active gift card."""
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Card Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gifts")
+    db.add(store)
+    await db.flush()
+    card = GiftCard(
+        store_id=store.id,
+        code=gift_card_service.generate_gift_card_code(),
+        initial_balance=Decimal(balance),
+        current_balance=Decimal(balance),
+        status=GiftCardStatus.active,
+        **kwargs,
+    )
+    db.add(card)
+    await db.flush()
+    return card
+
+
+async def _ledger(db, card) -> list[Decimal]:
+    rows = await db.execute(
+        select(GiftCardTransaction.amount)
+        .where(GiftCardTransaction.gift_card_id == card.id)
+        .order_by(GiftCardTransaction.created_at)
+    )
+    return list(rows.scalars())
+
+
+@pytest.mark.asyncio
+async def test_charge_and_refund_update_balance_and_ledger(db):
+    """Charges debit, refunds credit, and each appends a transaction."""
+    card = await _make_card(db)
+    store_id, code = card.store_id, card.code.lower()
+
+    assert (await gift_card_service.validate_gift_card(db, store_id, code))["balance"] == Decimal("50.00")
+    await gift_card_service.charge_gift_card(db, store_id, code, Decimal("30.00"), None)
+    await gift_card_service.refund_gift_card(db, card.id, Decimal("5.00"), None)
+
+    result = await gift_card_service.validate_gift_card(db, store_id, code)
+    assert result["balance"] == Decimal("25.00")
+    await db.refresh(card)
+    assert card.current_balance == Decimal("25.00")
+    assert await _ledger(db, card) == [Decimal("-30.00"), Decimal("5.00")]
+
+
+@pytest.mark.asyncio
+async def test_refused_charges_explain_why(db):
+    """Overdraft, disabled, expired and unknown cards are refused untouched."""
+    card = await _make_card(db, balance="10.00")
+    expired = await _make_card(db, expires_at=datetime.now(timezone.utc) - timedelta(days=1))
+    charge = gift_card_service.charge_gift_card
+
+    with pytest.raises(ValueError, match="exceeds gift card balance"):
+        await charge(db, card.store_id, card.code, Decimal("10.01"), None)
+    with pytest.raises(ValueError, match="has expired"):
+        await charge(db, expired.store_id, expired.code, Decimal("1.00"), None)
+    with pytest.raises(ValueError, match="not found"):
+        await charge(db, card.store_id, "GC-NONE-NONE-NONE", Decimal("1.00"), None)
+    with pytest.raises(ValueError, match="greater than zero"):
+        await charge(db, card.store_id, card.code, Decimal("0.00"), None)
+    card.status = GiftCardStatus.disabled
+    await db.flush()
+    with pytest.raises(ValueError, match="not active"):
+        await charge(db, card.store_id, card.code, Decimal("1.00"), None)
+
+    await db.refresh(card)
+    assert card.current_balance == Decimal("10.00")
+    assert await _ledger(db, card) == []
+
+
+@pytest.mark.asyncio
+async def test_cached_validation_reads_the_live_balance(db, session_factory):
+    """A charge committed elsewhere is seen by the next validation."""
+    card = await _make_card(db, balance="20.00")
+    store_id, code = card.store_id, card.code
+    await db.commit()
+    assert (await gift_card_service.validate_gift_card(db, store_id, code))["valid"]
+
+    async with session_factory() as other:
+        await gift_card_service.charge_gift_card(other, store_id, code, Decimal("20.00"), None)
+        await other.commit()
+
+    result = await gift_card_service.validate_gift_card(db, store_id, code)
+    assert result["valid"] is False
+    assert result["balance"] == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_disable_racing_validation_is_seen_after_commit(db, session_factory):
+    """A validation before the disable commits cannot keep the card usable."""
+    card = await _make_card(db)
+    store_id, code = card.store_id, card.code
+    await db.commit()
+
+    card.status = GiftCardStatus.disabled
+    await db.flush()
+    gift_card_service.invalidate_gift_card(db, store_id, code)
+    async with session_factory() as other:
+        assert (await gift_card_service.validate_gift_card(other, store_id, code))["valid"]
+    await db.commit()
+
+    result = await gift_card_service.validate_gift_card(db, store_id, code)
+    assert result["message"] == "This gift card is not active"
+
+
+@pytest.mark.asyncio
+async def test_validation_falls_back_to_database_without_redis(db):
+    """With Redis down, validation still answers from the database."""
+    card = await _make_card(db)
+
+    class _DownRedis:
+        async def get(self, key):
+            raise RedisError("down")
+
+        async def delete(self, key):
+            raise RedisError("down")
+
+    class _DownSyncRedis:
+        def delete(self, key):
+            raise RedisError("down")
+
+    store_id, code = card.store_id, card.code
+    with patch.object(gift_card_service, "get_redis", return_value=_DownRedis()), \
+            patch.object(gift_card_service, "get_sync_redis", return_value=_DownSyncRedis()):
+        assert (await gift_card_service.validate_gift_card(db, store_id, code))["valid"]
+        await gift_card_service.charge_gift_card(db, store_id, code, Decimal("50.00"), None)
+        await db.commit()
+        assert not (await gift_card_service.validate_gift_card(db, store_id, code))["valid"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_redemptions_never_overdraw(db, session_factory):
+    """200 checkouts race to charge $1 from a $50 card: exactly 50 succeed."""
+    card = await _make_card(db)
+    await db.commit()
+    store_id, code = card.store_id, card.code
+    gate = asyncio.Semaphore(40)
+
+    async def checkout() -> bool:
+        async with gate, session_factory() as session:
+            try:
+                await gift_card_service.charge_gift_card(
+                    session, store_id, code, Decimal("1.00"), None
+                )
+                await session.commit()
+                return True
+            except ValueError:
+                await session.rollback()
+                return False
+
+    results = await asyncio.gather(*(checkout() for _ in range(200)))
+    assert sum(results) == 50
+
+    await db.refresh(card)
+    assert card.current_balance == Decimal("0.00")
+    total = (
+        await db.execute(
+            select(func.sum(GiftCardTransaction.amount))
+            .where(GiftCardTransaction.gift_card_id == card.id)
+        )
+    ).scalar_one()
+    assert total == Decimal("-50.00")
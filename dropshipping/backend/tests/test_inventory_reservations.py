@@ -0,0 +1,504 @@
+"""Tests for the atomic stock reservation engine.
+
+Covers conditional reservations, all-or-nothing batches, release,
+fulfillment, TTL expiry, the Redis hot-counter front, checkout
+integration, and a concurrency stress test with hundreds of buyers.
+
+**For Developers:**
+    Service-level tests build fixtures directly with the ``db`` session.
+    Concurrency tests open one session per simulated buyer through the
+    ``session_factory`` fixture so that PostgreSQL sees truly concurrent
+    transactions competing for the same rows.
+
+**For QA Engineers:**
+    - ``reserved_quantity`` never exceeds ``quantity`` under contention.
+    - Multi-line reservations never deadlock, regardless of line order.
+    - Expired holds return their stock and cannot be fulfilled.
+    - Hot counters reject surplus buyers before PostgreSQL is touched.
+
+**For Project Managers:**
+    These tests guarantee that flash sales cannot oversell inventory.
+"""
+
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.inventory import (
+    InventoryAdjustment,
+    InventoryLevel,
+    ReservationStatus,
+    StockReservation,
+    Warehouse,
+)
+from app.models.product import Product, ProductStatus, ProductVariant
+from app.models.store import Store, StoreType
+from app.models.user import User
+from app.services import reservation_service
+from app.services.inventory_service import fulfill_stock, release_stock, reserve_stock
+from app.services.reservation_service import InsufficientStockError
+
+# Bounded so hundreds of buyers fit in PostgreSQL's default connection limit.
+MAX_DB_CONNECTIONS = 40
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _make_store(db) -> tuple[Store, Warehouse]:
+    """Create a user, an ecommerce store, and its default warehouse."""
+    user = User(email=f"res-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x")
+    db.add(user)
+    await db.flush()
+    store = Store(
+        user_id=user.id,
+        name="Flash Store",
+        slug=f"flash-{uuid.uuid4().hex[:8]}",
+        niche="electronics",
+        store_type=StoreType.ecommerce,
+    )
+    db.add(store)
+    await db.flush()
+    warehouse = Warehouse(store_id=store.id, name="Main", is_default=True)
+    db.add(warehouse)
+    await db.flush()
+    return store, warehouse
+
+
+async def _make_level(db, store: Store, warehouse: Warehouse, quantity: int) -> InventoryLevel:
+    """Create a product with one variant and an inventory level."""
+    product = Product(
+        store_id=store.id,
+        title="Limited Sneaker",
+        slug=f"sneaker-{uuid.uuid4().hex[:8]}",
+        price=Decimal("99.00"),
+        status=ProductStatus.active,
+    )
+    db.add(product)
+    await db.flush()
+    variant = ProductVariant(product_id=product.id, name="Size 42", inventory_count=quantity)
+    db.add(variant)
+    await db.flush()
+    level = InventoryLevel(variant_id=variant.id, warehouse_id=warehouse.id, quantity=quantity)
+    db.add(level)
+    await db.flush()
+    return level
+
+
+async def _level_state(session_factory, level_id) -> tuple[int, int]:
+    """Read (quantity, reserved_quantity) from a fresh session."""
+    async with session_factory() as session:
+        row = (
+            await session.execute(
+                select(InventoryLevel.quantity, InventoryLevel.reserved_quantity)
+                .where(InventoryLevel.id == level_id)
+            )
+        ).one()
+        return row[0], row[1]
+
+
+def _line(level: InventoryLevel, quantity: int) -> dict:
+    """Build a reservation line for an inventory level."""
+    return {
+        "inventory_level_id": level.id,
+        "variant_id": level.variant_id,
+        "quantity": quantity,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Conditional reservations
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_reserve_levels_creates_hold_and_audit(db):
+    """A reservation increments reserved_quantity and records an adjustment."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=10)
+
+    holds = await reservation_service.reserve_levels(db, store.id, [_line(level, 3)])
+    await db.commit()
+
+    assert len(holds) == 1
+    assert holds[0].quantity == 3
+    assert holds[0].status == ReservationStatus.active.value
+    assert holds[0].expires_at is not None
+
+    reserved = (
+        await db.execute(
+            select(InventoryLevel.reserved_quantity).where(InventoryLevel.id == level.id)
+        )
+    ).scalar_one()
+    assert reserved == 3
+    adjustments = (
+        await db.execute(
+            select(func.count(InventoryAdjustment.id)).where(
+                InventoryAdjustment.inventory_level_id == level.id
+            )
+        )
+    ).scalar_one()
+    assert adjustments == 1
+
+
+@pytest.mark.asyncio
+async def test_reserve_levels_rejects_when_short(db):
+    """Requesting more than available raises and reserves nothing."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=2)
+
+    with pytest.raises(InsufficientStockError) as exc_info:
+        await reservation_service.reserve_levels(db, store.id, [_line(level, 3)])
+    assert exc_info.value.level_ids == [level.id]
+
+
+@pytest.mark.asyncio
+async def test_multi_line_reservation_is_all_or_nothing(db, session_factory):
+    """If one line is short, no line of the batch is reserved."""
+    store, warehouse = await _make_store(db)
+    plenty = await _make_level(db, store, warehouse, quantity=50)
+    scarce = await _make_level(db, store, warehouse, quantity=1)
+    await db.commit()
+
+    with pytest.raises(InsufficientStockError) as exc_info:
+        await reservation_service.reserve_levels(
+            db, store.id, [_line(plenty, 5), _line(scarce, 2)]
+        )
+    await db.commit()
+
+    assert exc_info.value.level_ids == [scarce.id]
+    assert await _level_state(session_factory, plenty.id) == (50, 0)
+    assert await _level_state(session_factory, scarce.id) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_lines_are_merged(db):
+    """Two lines for the same level become a single hold."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=10)
+
+    holds = await reservation_service.reserve_levels(
+        db, store.id, [_line(level, 2), _line(level, 3)]
+    )
+    assert len(holds) == 1
+    assert holds[0].quantity == 5
+
+
+# ---------------------------------------------------------------------------
+# Order lifecycle
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_release_order_reservations_returns_stock(db, session_factory):
+    """Releasing an order's holds restores availability exactly once."""
+    from app.models.order import Order
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=10)
+    order = Order(store_id=store.id, customer_email="a@b.co", total=Decimal("1.00"))
+    db.add(order)
+    await db.flush()
+    order_id = order.id
+
+    await reservation_service.reserve_levels(db, store.id, [_line(level, 4)])
+    await reservation_service.reserve_for_order(
+        db, store.id, order_id, [{"variant_id": level.variant_id, "quantity": 2}]
+    )
+    await db.commit()
+    assert await _level_state(session_factory, level.id) == (10, 6)
+
+    released = await reservation_service.release_order_reservations(db, order_id)
+    await db.commit()
+    assert released == 2
+    assert await _level_state(session_factory, level.id) == (10, 4)
+
+    # Idempotent: nothing left to release
+    assert await reservation_service.release_order_reservations(db, order_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_fulfill_order_reservations_decrements_quantity(db, session_factory):
+    """Fulfilling holds decrements both quantity and reserved quantity."""
+    from app.models.order import Order
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=10)
+    order = Order(store_id=store.id, customer_email="a@b.co", total=Decimal("1.00"))
+    db.add(order)
+    await db.flush()
+
+    await reservation_service.reserve_for_order(
+        db, store.id, order.id, [{"variant_id": level.variant_id, "quantity": 3}]
+    )
+    fulfilled = await reservation_service.fulfill_order_reservations(db, order.id)
+    await db.commit()
+
+    assert fulfilled == 3
+    assert await _level_state(session_factory, level.id) == (7, 0)
+
+
+@pytest.mark.asyncio
+async def test_expired_reservations_are_released(db, session_factory):
+    """Holds past their TTL are expired and can no longer be fulfilled."""
+    from app.models.order import Order
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=5)
+    order = Order(store_id=store.id, customer_email="a@b.co", total=Decimal("1.00"))
+    db.add(order)
+    await db.flush()
+    await reservation_service.reserve_for_order(
+        db, store.id, order.id, [{"variant_id": level.variant_id, "quantity": 5}]
+    )
+    await db.commit()
+    assert await _level_state(session_factory, level.id) == (5, 5)
+
+    later = datetime.now(timezone.utc) + timedelta(hours=2)
+    released = await reservation_service.expire_reservations(db, now=later)
+    await db.commit()
+
+    assert released == 5
+    assert await _level_state(session_factory, level.id) == (5, 0)
+    assert await reservation_service.fulfill_order_reservations(db, order.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_commit_order_reservations_clears_expiry(db):
+    """Paying for an order turns its holds into holds that never expire."""
+    from app.models.order import Order
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=5)
+    order = Order(store_id=store.id, customer_email="a@b.co", total=Decimal("1.00"))
+    db.add(order)
+    await db.flush()
+    items = [{"variant_id": level.variant_id, "quantity": 2}]
+    await reservation_service.reserve_for_order(db, store.id, order.id, items)
+
+    await reservation_service.commit_order_reservations(db, store.id, order.id, items)
+    await db.commit()
+
+    expiries = (
+        await db.execute(
+            select(StockReservation.expires_at).where(StockReservation.order_id == order.id)
+        )
+    ).scalars().all()
+    assert expiries == [None]
+
+
+@pytest.mark.asyncio
+async def test_untracked_variants_are_skipped(db):
+    """Variants without inventory levels are not reserved."""
+    store, _ = await _make_store(db)
+    holds = await reservation_service.reserve_for_order(
+        db, store.id, uuid.uuid4(), [{"variant_id": uuid.uuid4(), "quantity": 1}]
+    )
+    assert holds == []
+
+
+# ---------------------------------------------------------------------------
+# Legacy single-level primitives
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_reserve_release_fulfill_stock_primitives(db):
+    """reserve_stock / release_stock / fulfill_stock keep their contracts."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=10)
+
+    updated = await reserve_stock(db, level.variant_id, warehouse.id, 6)
+    assert updated.reserved_quantity == 6
+
+    with pytest.raises(ValueError, match="Insufficient stock"):
+        await reserve_stock(db, level.variant_id, warehouse.id, 5)
+
+    updated = await release_stock(db, level.variant_id, warehouse.id, 2)
+    assert updated.reserved_quantity == 4
+
+    with pytest.raises(ValueError, match="Cannot release more than reserved"):
+        await release_stock(db, level.variant_id, warehouse.id, 5)
+
+    updated = await fulfill_stock(db, level.variant_id, warehouse.id, 4)
+    assert (updated.quantity, updated.reserved_quantity) == (6, 0)
+
+    with pytest.raises(ValueError, match="Cannot fulfill more than reserved"):
+        await fulfill_stock(db, level.variant_id, warehouse.id, 1)
+
+
+# ---------------------------------------------------------------------------
+# Redis hot counters
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_hot_counter_rejects_before_postgres(db, session_factory):
+    """A drained hot counter rejects buyers even if PostgreSQL has stock."""
+    from app.redis_client import get_redis
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=3)
+    await db.commit()
+
+    assert await reservation_service.mark_level_hot(db, store.id, level.id) == 3
+    try:
+        await reservation_service.reserve_levels(db, store.id, [_line(level, 3)])
+        await db.commit()
+        assert await get_redis().get(reservation_service._counter_key(level.id)) == "0"
+
+        # Simulate drift: PostgreSQL gains stock the counter doesn't know about.
+        await get_redis().set(reservation_service._counter_key(level.id), 0)
+        async with session_factory() as session:
+            level_row = await session.get(InventoryLevel, level.id)
+            level_row.quantity = 10
+            await session.commit()
+
+        with pytest.raises(InsufficientStockError):
+            await reservation_service.reserve_levels(db, store.id, [_line(level, 1)])
+
+        # Reconciliation brings the counter back in line with PostgreSQL.
+        await reservation_service.refresh_hot_counter(db, level.id)
+        assert await get_redis().get(reservation_service._counter_key(level.id)) == "7"
+    finally:
+        await reservation_service.unmark_level_hot(db, store.id, level.id)
+
+
+@pytest.mark.asyncio
+async def test_manual_reserve_and_release_resync_hot_counter(db):
+    """``reserve_stock`` and ``release_stock`` keep a hot counter current."""
+    from app.redis_client import get_redis
+
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=5)
+    await db.commit()
+    key = reservation_service._counter_key(level.id)
+
+    assert await reservation_service.mark_level_hot(db, store.id, level.id) == 5
+    try:
+        await reserve_stock(db, level.variant_id, warehouse.id, 2)
+        assert await get_redis().get(key) == "3"
+        await release_stock(db, level.variant_id, warehouse.id, 1)
+        assert await get_redis().get(key) == "4"
+    finally:
+        await reservation_service.unmark_level_hot(db, store.id, level.id)
+
+
+# ---------------------------------------------------------------------------
+# Checkout integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_checkout_reserves_warehouse_stock(client, db, session_factory):
+    """Public checkout holds stock and rejects oversold carts before Stripe."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=2)
+    product_id = (
+        await db.execute(select(ProductVariant.product_id).where(ProductVariant.id == level.variant_id))
+    ).scalar_one()
+    await db.commit()
+
+    body = {
+        "customer_email": "buyer@example.com",
+        "items": [
+            {"product_id": str(product_id), "variant_id": str(level.variant_id), "quantity": 2}
+        ],
+        "shipping_address": {
+            "name": "Buyer",
+            "line1": "1 Main St",
+            "city": "Springfield",
+            "postal_code": "12345",
+            "country": "US",
+        },
+    }
+    resp = await client.post(f"/api/v1/public/stores/{store.slug}/checkout", json=body)
+    assert resp.status_code == 201, resp.text
+    assert await _level_state(session_factory, level.id) == (2, 2)
+    assert resp.json()["session_id"] == f"cs_test_mock_{resp.json()['order_id']}"
+
+    with patch("app.api.public.create_checkout_session") as create_session:
+        resp = await client.post(f"/api/v1/public/stores/{store.slug}/checkout", json=body)
+    assert resp.status_code == 400
+    assert "Insufficient stock" in resp.json()["detail"]
+    create_session.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Concurrency stress tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_hundreds_of_parallel_buyers_never_oversell(db, session_factory):
+    """300 concurrent buyers compete for 50 units: exactly 50 succeed."""
+    store, warehouse = await _make_store(db)
+    level = await _make_level(db, store, warehouse, quantity=50)
+    await db.commit()
+    line = _line(level, 1)
+    gate = asyncio.Semaphore(MAX_DB_CONNECTIONS)
+
+    async def buyer() -> bool:
+        async with gate, session_factory() as session:
+            try:
+                await reservation_service.reserve_levels(session, store.id, [line])
+                await session.commit()
+                return True
+            except InsufficientStockError:
+                await session.rollback()
+                return False
+
+    results = await asyncio.gather(*(buyer() for _ in range(300)))
+
+    assert sum(results) == 50
+    assert await _level_state(session_factory, level.id) == (50, 50)
+    async with session_factory() as session:
+        held = (
+            await session.execute(
+                select(func.coalesce(func.sum(StockReservation.quantity), 0)).where(
+                    StockReservation.inventory_level_id == level.id,
+                    StockReservation.status == ReservationStatus.active.value,
+                )
+            )
+        ).scalar_one()
+    assert held == 50
+
+
+@pytest.mark.asyncio
+async def test_parallel_multi_line_carts_do_not_deadlock(db, session_factory):
+    """Carts with the same SKUs in opposite orders complete without deadlocks."""
+    store, warehouse = await _make_store(db)
+    first = await _make_level(db, store, warehouse, quantity=40)
+    second = await _make_level(db, store, warehouse, quantity=40)
+    await db.commit()
+    gate = asyncio.Semaphore(MAX_DB_CONNECTIONS)
+    rng = random.Random(26)
+
+    async def buyer(lines: list[dict]) -> bool:
+        async with gate, session_factory() as session:
+            try:
+                await reservation_service.reserve_levels(session, store.id, lines)
+                await session.commit()
+                return True
+            except InsufficientStockError:
+                await session.rollback()
+                return False
+
+    carts = []
+    for _ in range(200):
+        lines = [_line(first, 1), _line(second, 1)]
+        rng.shuffle(lines)
+        carts.append(lines)
+    results = await asyncio.gather(*(buyer(lines) for lines in carts))
+
+    assert sum(results) == 40
+    assert await _level_state(session_factory, first.id) == (40, 40)
+    assert await _level_state(session_factory, second.id) == (40, 40)
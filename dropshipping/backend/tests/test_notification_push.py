@@ -0,0 +1,262 @@
+"""Tests for cached unread counters and the notification stream.
+
+Covers ``notification_push_service`` (Redis unread counters, pub/sub
+fan-out through ``NotificationHub``) and ``GET /notifications/stream``.
+
+**For Developers:**
+    httpx's ASGI transport buffers whole responses, so the stream endpoint
+    is driven with raw ASGI messages: body chunks are collected as they are
+    sent and ``http.disconnect`` is delivered to close the stream. The
+    app's lifespan does not run under tests, so each test that needs pushes
+    starts ``listen_for_notifications`` itself.
+
+**For QA Engineers:**
+    - The unread count is served from Redis once cached; every committed
+      write keeps it exact, a rolled-back one pushes nothing, and
+      PostgreSQL answers when Redis is down.
+    - Notifications created by Celery tasks reach open streams.
+    - Closing a stream removes it from the hub.
+    - Many idle streams share the process's one Redis subscription.
+"""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from unittest.mock import patch
+
+from redis.exceptions import RedisError
+
+from app.main import app
+from app.models.notification import Notification, NotificationType
+from app.models.user import User
+from app.redis_client import get_redis
+from app.services import notification_push_service, notification_service
+from app.services.notification_push_service import (
+    CHANNEL,
+    get_notification_hub,
+    listen_for_notifications,
+    notifications_created_sync,
+    reset_notification_hub,
+    stream_events,
+)
+
+
+async def _user(db) -> User:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    return user
+
+
+def _row(user: User, title: str = "Hello") -> Notification:
+    return Notification(
+        user_id=user.id,
+        notification_type=NotificationType.order_placed,
+        title=title,
+        message="Something happened",
+    )
+
+
+@contextlib.asynccontextmanager
+async def _listener():
+    """Run the pub/sub listener until the block exits."""
+    reset_notification_hub()
+    task = asyncio.create_task(listen_for_notifications())
+    try:
+        for _ in range(50):
+            if (await get_redis().pubsub_numsub(CHANNEL))[0][1]:
+                break
+            await asyncio.sleep(0.02)
+        yield get_notification_hub()
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+async def test_unread_count_is_served_from_the_counter(db):
+    """After the first read, writes move the counter and no COUNT runs."""
+    user = await _user(db)
+    db.add_all([_row(user), _row(user)])
+    await db.flush()
+    assert await notification_service.get_unread_count(db, user.id) == 2
+
+    db.add(_row(user))  # Bypasses the service, so the cache does not see it.
+    await db.flush()
+    assert await notification_service.get_unread_count(db, user.id) == 2
+
+    created = await notification_service.create_notification(
+        db, user.id, None, NotificationType.order_placed, "New", "Order", metadata={"a": 1}
+    )
+    assert created.metadata_ == {"a": 1}
+    await db.commit()
+    assert await notification_service.get_unread_count(db, user.id) == 3
+
+    assert await notification_service.mark_as_read(db, user.id, [created.id]) == 1
+    await db.commit()
+    assert await notification_service.get_unread_count(db, user.id) == 2
+
+    other = (await notification_service.list_notifications(db, user.id, unread_only=True))[0][0]
+    await notification_service.delete_notification(db, user.id, other.id)
+    await db.commit()
+    assert await notification_service.get_unread_count(db, user.id) == 1
+
+    await notification_service.mark_all_as_read(db, user.id)
+    await db.commit()
+    assert await notification_service.get_unread_count(db, user.id) == 0
+
+
+async def test_rolled_back_writes_push_nothing(db):
+    """Counters and pushes wait for the commit; a rollback leaves them alone."""
+    user = await _user(db)
+    user_id = user.id
+    db.add(_row(user))
+    await db.commit()
+    assert await notification_service.get_unread_count(db, user_id) == 1
+
+    async with _listener() as hub:
+        queue = hub.subscribe(user_id)
+        await notification_service.create_notification(
+            db, user_id, None, NotificationType.order_placed, "Phantom", "Rolled back"
+        )
+        await notification_service.mark_all_as_read(db, user_id)
+        assert await notification_service.get_unread_count(db, user_id) == 1
+        await db.rollback()
+        await asyncio.sleep(0.2)
+        assert queue.empty()
+    assert await notification_service.get_unread_count(db, user_id) == 1
+
+
+async def test_unread_count_falls_back_to_postgres(db):
+    """Without Redis the count comes from PostgreSQL."""
+    user = await _user(db)
+    db.add(_row(user))
+    await db.flush()
+
+    with patch.object(notification_push_service, "get_redis", side_effect=RedisError("down")), \
+            patch.object(notification_push_service, "get_sync_redis", side_effect=RedisError("down")):
+        assert await notification_service.get_unread_count(db, user.id) == 1
+        await notification_service.mark_all_as_read(db, user.id)
+        await db.commit()
+        assert await notification_service.get_unread_count(db, user.id) == 0
+
+
+async def test_task_notifications_reach_open_streams(db):
+    """A worker-side push bumps the counter and lands in the stream's queue."""
+    user = await _user(db)
+    assert await notification_service.get_unread_count(db, user.id) == 0
+    row = _row(user, "From a task")
+    db.add(row)
+    await db.flush()
+    await db.refresh(row)
+
+    async with _listener() as hub:
+        queue = hub.subscribe(user.id)
+        notifications_created_sync([row])
+        event, data = await asyncio.wait_for(queue.get(), 2)
+
+    assert event == "notification"
+    assert data["title"] == "From a task"
+    assert data["id"] == str(row.id)
+    assert data["unread_count"] == 1
+
+
+async def _open_stream(headers: dict[str, str]):
+    """Start the stream endpoint; return (chunks queue, disconnect, task)."""
+    chunks: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+    sent_request = False
+
+    async def receive():
+        nonlocal sent_request
+        if not sent_request:
+            sent_request = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            await chunks.put(("status", message["status"]))
+        elif message["type"] == "http.response.body" and message.get("body"):
+            await chunks.put(("body", message["body"].decode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/notifications/stream",
+        "raw_path": b"/api/v1/notifications/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    return chunks, disconnected, task
+
+
+async def test_stream_endpoint_pushes_events(client):
+    """The stream opens with the count and then carries pushed events."""
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "stream@example.com", "password": "securepass123"},
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    user_id = (await client.get("/api/v1/auth/me", headers=headers)).json()["id"]
+
+    async with _listener() as hub:
+        chunks, disconnected, task = await _open_stream(headers)
+        assert await asyncio.wait_for(chunks.get(), 5) == ("status", 200)
+        kind, body = await asyncio.wait_for(chunks.get(), 5)
+        assert body == 'event: unread_count\ndata: {"count": 0}\n\n'
+        assert hub.connections == 1
+
+        notifications_created_sync([{
+            "id": str(uuid.uuid4()), "user_id": user_id, "title": "Pushed",
+        }])
+        kind, body = await asyncio.wait_for(chunks.get(), 5)
+        event, data = body.strip().split("\n")
+        assert event == "event: notification"
+        assert json.loads(data.removeprefix("data: "))["title"] == "Pushed"
+
+        await client.post("/api/v1/notifications/mark-all-read", headers=headers)
+        kind, body = await asyncio.wait_for(chunks.get(), 5)
+        assert body == 'event: unread_count\ndata: {"count": 0}\n\n'
+
+        disconnected.set()
+        await asyncio.wait_for(task, 5)
+        assert hub.connections == 0
+
+
+async def test_stream_requires_authentication(client):
+    """Streams are only opened for authenticated users."""
+    resp = await client.get("/api/v1/notifications/stream")
+    assert resp.status_code == 401
+
+
+async def test_idle_streams_share_one_subscription():
+    """A thousand idle streams cost one Redis subscription and all get pushes."""
+    users = [uuid.uuid4() for _ in range(1000)]
+    async with _listener() as hub:
+        streams = [stream_events(user_id, 0) for user_id in users]
+        for stream in streams:
+            await anext(stream)
+        assert hub.connections == len(users)
+        assert (await get_redis().pubsub_numsub(CHANNEL))[0][1] == 1
+
+        notifications_created_sync([
+            {"id": str(uuid.uuid4()), "user_id": str(user_id), "title": "Hi"} for user_id in users
+        ])
+        received = await asyncio.wait_for(
+            asyncio.gather(*(anext(stream) for stream in streams)), 10
+        )
+        assert all(chunk.startswith("event: notification") for chunk in received)
+
+        for stream in streams:
+            await stream.aclose()
+        assert hub.connections == 0
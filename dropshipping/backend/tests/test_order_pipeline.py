@@ -0,0 +1,206 @@
+"""Tests for the post-payment pipeline helpers and the low-stock digest.
+
+Covers stage timing records on orders, the joined low-stock query, the
+per-store Redis digest queue, and the ``send_low_stock_digest`` task.
+
+**For Developers:**
+    Query tests use the ``db`` fixture through ``db.run_sync``. Digest
+    queue tests use the Redis from ``REDIS_URL`` with a unique store id
+    per test; scheduling of the digest task is patched out.
+
+**For QA Engineers:**
+    - Stage timings from parallel tasks are merged, never overwritten.
+    - Only the order's variants at or below the threshold are reported.
+    - One digest task is scheduled per store and window, however many
+      orders report low stock.
+    - Variants restocked before the digest runs are left out.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product, ProductVariant
+from app.models.store import Store
+from app.models.user import User
+from app.redis_client import get_sync_redis
+from app.services import order_pipeline_service
+from app.services.order_pipeline_service import (
+    find_low_stock_variants_sync,
+    low_stock_digest_items_sync,
+    pop_low_stock_digest,
+    queue_low_stock_digest,
+    record_stage_sync,
+)
+
+
+async def _paid_order(db, stock: list[int]) -> tuple[Order, list[ProductVariant]]:
+    """Create a paid order with one item per variant, stocked as given."""
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Pipeline Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    product = Product(store_id=store.id, title="Trail Pack", slug=f"p-{uuid.uuid4().hex[:8]}", price=Decimal("20"))
+    db.add(product)
+    await db.flush()
+    variants = [
+        ProductVariant(product_id=product.id, name=f"Size {n}", inventory_count=count)
+        for n, count in enumerate(stock)
+    ]
+    db.add_all(variants)
+    order = Order(
+        store_id=store.id,
+        customer_email="buyer@example.com",
+        status=OrderStatus.paid,
+        total=Decimal("40"),
+        paid_at=datetime.now(timezone.utc) - timedelta(seconds=30),
+    )
+    db.add(order)
+    await db.flush()
+    for variant in variants:
+        # Two lines for the same variant must still yield one alert.
+        for _ in range(2):
+            db.add(OrderItem(
+                order_id=order.id,
+                product_id=product.id,
+                variant_id=variant.id,
+                product_title=product.title,
+                quantity=1,
+                unit_price=Decimal("20"),
+            ))
+    await db.commit()
+    return order, variants
+
+
+async def test_record_stage_merges_timings(db):
+    """Each stage is stored as seconds since payment without losing others."""
+    order, _ = await _paid_order(db, [10])
+
+    def record(session):
+        first = record_stage_sync(session, order.id, "pipeline_started")
+        record_stage_sync(session, order.id, "confirmation_sent")
+        session.commit()
+        return first
+
+    seconds = await db.run_sync(record)
+    await db.refresh(order)
+
+    assert set(order.pipeline_timings) == {"pipeline_started", "confirmation_sent"}
+    assert 29 <= seconds < 120
+    assert order.pipeline_timings["pipeline_started"] == seconds
+
+
+async def test_record_stage_rejects_unknown_stage(db):
+    """Stage names are validated."""
+    order, _ = await _paid_order(db, [10])
+    with pytest.raises(ValueError, match="Unknown pipeline stage"):
+        await db.run_sync(lambda s: record_stage_sync(s, order.id, "shipped"))
+
+
+async def test_find_low_stock_variants(db):
+    """Only the order's variants at or below the threshold are returned, once each."""
+    order, variants = await _paid_order(db, [2, 5, 6])
+
+    found = await db.run_sync(lambda s: find_low_stock_variants_sync(s, order.id))
+
+    assert sorted(found) == sorted([variants[0].id, variants[1].id])
+
+
+async def test_digest_items_skip_restocked_and_foreign_variants(db):
+    """Restocked variants and other stores' variants are left out."""
+    order, variants = await _paid_order(db, [1, 50])
+    _, foreign = await _paid_order(db, [0])
+
+    items = await db.run_sync(
+        lambda s: low_stock_digest_items_sync(
+            s, order.store_id, [v.id for v in variants + foreign]
+        )
+    )
+
+    assert [i["variant_id"] for i in items] == [str(variants[0].id)]
+    assert items[0]["product_title"] == "Trail Pack"
+    assert items[0]["inventory_count"] == 1
+
+
+def test_digest_is_scheduled_once_per_window():
+    """Several orders of one store share one scheduled digest."""
+    store_id = str(uuid.uuid4())
+    a, b, c = (uuid.uuid4() for _ in range(3))
+    redis = get_sync_redis()
+    try:
+        with patch("app.tasks.notification_tasks.send_low_stock_digest") as task:
+            assert queue_low_stock_digest(store_id, [a, b]) is True
+            assert queue_low_stock_digest(store_id, [b, c]) is False
+            assert queue_low_stock_digest(store_id, []) is False
+        task.apply_async.assert_called_once()
+        assert task.apply_async.call_args.args == ((store_id,),)
+
+        assert pop_low_stock_digest(store_id) == sorted(str(v) for v in (a, b, c))
+        assert pop_low_stock_digest(store_id) == []
+    finally:
+        redis.delete(
+            order_pipeline_service._digest_key(store_id),
+            order_pipeline_service._digest_kick_key(store_id),
+        )
+
+
+class TestSendLowStockDigest:
+    """Tests for the send_low_stock_digest task."""
+
+    @patch("app.services.order_pipeline_service.low_stock_digest_items_sync")
+    @patch("app.tasks.notification_tasks.SyncSessionFactory")
+    def test_creates_one_notification_for_all_variants(self, mock_factory, mock_items):
+        """All variants of the digest go into a single notification."""
+        from app.models.notification import NotificationType
+        from app.tasks.notification_tasks import send_low_stock_digest
+
+        store = MagicMock(spec=Store)
+        store.id = uuid.uuid4()
+        store.user_id = uuid.uuid4()
+        store.name = "Pipeline Store"
+        owner = MagicMock(spec=User)
+        owner.email = "owner@example.com"
+
+        session = MagicMock()
+
+        def query_side_effect(model):
+            chain = MagicMock()
+            chain.filter.return_value.first.return_value = store if model is Store else owner
+            return chain
+
+        session.query.side_effect = query_side_effect
+        mock_factory.return_value = session
+        mock_items.return_value = [
+            {"product_id": str(uuid.uuid4()), "product_title": "Trail Pack",
+             "variant_id": str(uuid.uuid4()), "variant_name": "S", "inventory_count": 0},
+            {"product_id": str(uuid.uuid4()), "product_title": "Tent",
+             "variant_id": str(uuid.uuid4()), "variant_name": "2P", "inventory_count": 3},
+        ]
+
+        result = send_low_stock_digest(str(store.id), [str(uuid.uuid4()), str(uuid.uuid4())])
+
+        assert result["status"] == "created"
+        assert result["variant_count"] == 2
+        assert result["email"] == "owner@example.com"
+        notification = session.add.call_args.args[0]
+        assert notification.notification_type == NotificationType.low_stock
+        assert notification.message == "2 variants are running low on stock"
+        assert len(notification.metadata_["items"]) == 2
+        session.commit.assert_called_once()
+
+    @patch("app.services.order_pipeline_service.pop_low_stock_digest", return_value=[])
+    @patch("app.tasks.notification_tasks.SyncSessionFactory")
+    def test_skips_empty_digest(self, mock_factory, mock_pop):
+        """A digest whose variants were already reported does nothing."""
+        from app.tasks.notification_tasks import send_low_stock_digest
+
+        result = send_low_stock_digest(str(uuid.uuid4()))
+
+        assert result["status"] == "skipped"
+        mock_factory.assert_not_called()
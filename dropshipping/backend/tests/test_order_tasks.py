@@ -1,27 +1,32 @@
 """Tests for order processing Celery tasks.
 
-Validates the ``process_paid_order`` orchestrator, ``auto_fulfill_order``
-automatic fulfillment, and ``check_fulfillment_status`` Beat task.
+Validates the ``process_paid_order`` orchestrator, the fraud-gated
+``complete_paid_order`` callback, ``auto_fulfill_order`` automatic
+fulfillment, the ``check_fulfillment_status`` Beat task, and the
+``notify_orders_delivered`` page task.
 
 **For Developers:**
     Tests mock ``SyncSessionFactory`` and downstream task ``.delay()`` calls.
-    ``process_paid_order`` calls ``run_fraud_check`` synchronously (direct import),
-    so it is also mocked to control fraud results.
+    ``process_paid_order`` builds a Celery canvas; ``group`` is patched so
+    the signatures it receives can be inspected without a broker.
 
 **For QA Engineers:**
-    - ``process_paid_order`` always dispatches email, webhook, and notification
-      regardless of fraud result.
+    - ``process_paid_order`` dispatches email, webhook, and notification in
+      parallel with the fraud check.
     - Auto-fulfill is skipped when order is fraud-flagged.
     - ``auto_fulfill_order`` only transitions orders in ``paid`` status.
-    - ``check_fulfillment_status`` uses random delivery (mocked to control).
+    - ``check_fulfillment_status`` commits each tracking page and queues
+      one delivery event task per page.
+    - Delivery webhooks and emails are sent after the notifications
+      commit, and never again on a retry.
 """
 
 import uuid
-from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
+from celery.exceptions import Retry
 
 
 def _make_mock_order(
@@ -52,110 +57,98 @@ def _make_mock_order(
 class TestProcessPaidOrder:
     """Tests for the process_paid_order orchestrator task."""
 
-    @patch("app.tasks.order_tasks.auto_fulfill_order")
-    @patch("app.tasks.notification_tasks.create_low_stock_notification")
-    @patch("app.tasks.notification_tasks.create_order_notification")
-    @patch("app.tasks.webhook_tasks.dispatch_webhook_event")
-    @patch("app.tasks.email_tasks.send_low_stock_alert")
-    @patch("app.tasks.email_tasks.send_order_confirmation")
-    @patch("app.tasks.fraud_tasks.run_fraud_check")
+    @staticmethod
+    def _session_for(order):
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = order
+        return session
+
+    @patch("app.services.order_pipeline_service.queue_low_stock_digest")
+    @patch("app.services.order_pipeline_service.record_stage_sync", return_value=0.4)
+    @patch("app.services.order_pipeline_service.find_low_stock_variants_sync", return_value=[])
+    @patch("app.tasks.order_tasks.group")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_orchestrates_all_downstream_tasks(
-        self, mock_factory, mock_fraud, mock_email, mock_low_stock_email,
-        mock_webhook, mock_notify, mock_low_stock_notify, mock_auto_fulfill,
+    def test_starts_parallel_pipeline(
+        self, mock_factory, mock_group, mock_low_stock, mock_stage, mock_queue,
     ):
-        """Dispatches email, webhook, notification, and auto-fulfill for a clean order."""
-        from app.models.order import Order, OrderItem, OrderStatus
-        from app.models.product import ProductVariant
+        """Fraud check, email, webhook, and notification start together."""
+        from celery.canvas import _chain
         from app.tasks.order_tasks import process_paid_order
 
         order = _make_mock_order(status="paid")
-
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if hasattr(model, '__name__') and model.__name__ == "Order":
-                chain.filter.return_value.first.return_value = order
-            elif hasattr(model, '__name__') and model.__name__ == "OrderItem":
-                chain.filter.return_value.all.return_value = []  # no items
-            else:
-                chain.filter.return_value.first.return_value = None
-            return chain
-
-        session.query.side_effect = query_side_effect
+        session = self._session_for(order)
         mock_factory.return_value = session
 
-        mock_fraud.return_value = {
-            "risk_score": 0,
-            "risk_level": "low",
-            "is_flagged": False,
-            "signals": [],
-        }
-
-        mock_email.delay = MagicMock()
-        mock_webhook.delay = MagicMock()
-        mock_notify.delay = MagicMock()
-        mock_auto_fulfill.delay = MagicMock()
-
         result = process_paid_order(str(order.id))
 
-        assert result["order_id"] == str(order.id)
-        mock_email.delay.assert_called_once()
-        mock_webhook.delay.assert_called_once()
-        mock_notify.delay.assert_called_once()
-        mock_auto_fulfill.delay.assert_called_once()
-        assert result["auto_fulfill"] == "dispatched"
-
-    @patch("app.tasks.order_tasks.auto_fulfill_order")
-    @patch("app.tasks.notification_tasks.create_order_notification")
-    @patch("app.tasks.webhook_tasks.dispatch_webhook_event")
-    @patch("app.tasks.email_tasks.send_order_confirmation")
-    @patch("app.tasks.fraud_tasks.run_fraud_check")
+        assert result["pipeline"] == "dispatched"
+        assert result["low_stock_alerts"] == 0
+        mock_stage.assert_called_once_with(session, order.id, "pipeline_started")
+        session.commit.assert_called_once()
+        mock_group.return_value.apply_async.assert_called_once()
+
+        fraud_branch, *branches = mock_group.call_args.args
+        assert isinstance(fraud_branch, _chain)
+        assert [t.task for t in fraud_branch.tasks] == [
+            "app.tasks.fraud_tasks.run_fraud_check",
+            "app.tasks.order_tasks.complete_paid_order",
+        ]
+        assert [b.task for b in branches] == [
+            "app.tasks.email_tasks.send_order_confirmation",
+            "app.tasks.webhook_tasks.dispatch_webhook_event",
+            "app.tasks.notification_tasks.create_order_notification",
+        ]
+        assert branches[1].args[1] == "order.paid"
+        assert [b.options["link"][0].args[1] for b in branches] == [
+            "confirmation_sent", "webhooks_dispatched", "owner_notified",
+        ]
+
+    @patch("app.tasks.notification_tasks.send_low_stock_digest")
+    @patch("app.services.order_pipeline_service.queue_low_stock_digest")
+    @patch("app.services.order_pipeline_service.record_stage_sync")
+    @patch("app.services.order_pipeline_service.find_low_stock_variants_sync")
+    @patch("app.tasks.order_tasks.group")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_skips_auto_fulfill_when_fraud_flagged(
-        self, mock_factory, mock_fraud, mock_email, mock_webhook,
-        mock_notify, mock_auto_fulfill,
+    def test_queues_low_stock_variants_for_digest(
+        self, mock_factory, mock_group, mock_low_stock, mock_stage, mock_queue, mock_digest,
     ):
-        """Auto-fulfill is skipped when fraud check flags the order."""
-        from app.models.order import Order, OrderItem
+        """Low-stock variants go to the store's digest, not one task each."""
         from app.tasks.order_tasks import process_paid_order
 
         order = _make_mock_order(status="paid")
+        mock_factory.return_value = self._session_for(order)
+        variants = [uuid.uuid4(), uuid.uuid4()]
+        mock_low_stock.return_value = variants
 
-        session = MagicMock()
-
-        def query_side_effect(model):
-            chain = MagicMock()
-            if hasattr(model, '__name__') and model.__name__ == "Order":
-                chain.filter.return_value.first.return_value = order
-            elif hasattr(model, '__name__') and model.__name__ == "OrderItem":
-                chain.filter.return_value.all.return_value = []
-            else:
-                chain.filter.return_value.first.return_value = None
-            return chain
+        result = process_paid_order(str(order.id))
 
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+        assert result["low_stock_alerts"] == 2
+        mock_queue.assert_called_once_with(str(order.store_id), variants)
+        mock_digest.delay.assert_not_called()
 
-        mock_fraud.return_value = {
-            "risk_score": 75,
-            "risk_level": "high",
-            "is_flagged": True,
-            "signals": ["high_amount", "new_customer_high_order", "first_order"],
-        }
+    @patch("app.tasks.notification_tasks.send_low_stock_digest")
+    @patch("app.services.order_pipeline_service.queue_low_stock_digest")
+    @patch("app.services.order_pipeline_service.record_stage_sync")
+    @patch("app.services.order_pipeline_service.find_low_stock_variants_sync")
+    @patch("app.tasks.order_tasks.group")
+    @patch("app.tasks.order_tasks.SyncSessionFactory")
+    def test_sends_digest_directly_when_redis_is_down(
+        self, mock_factory, mock_group, mock_low_stock, mock_stage, mock_queue, mock_digest,
+    ):
+        """Without Redis the order's low-stock variants are reported at once."""
+        from redis.exceptions import ConnectionError as RedisConnectionError
+        from app.tasks.order_tasks import process_paid_order
 
-        mock_email.delay = MagicMock()
-        mock_webhook.delay = MagicMock()
-        mock_notify.delay = MagicMock()
-        mock_auto_fulfill.delay = MagicMock()
+        order = _make_mock_order(status="paid")
+        mock_factory.return_value = self._session_for(order)
+        variant_id = uuid.uuid4()
+        mock_low_stock.return_value = [variant_id]
+        mock_queue.side_effect = RedisConnectionError("down")
 
-        result = process_paid_order(str(order.id))
+        process_paid_order(str(order.id))
 
-        assert result["auto_fulfill"] == "skipped_fraud_flagged"
-        mock_auto_fulfill.delay.assert_not_called()
-        # Email, webhook, notification still dispatched
-        mock_email.delay.assert_called_once()
+        mock_digest.delay.assert_called_once_with(str(order.store_id), [str(variant_id)])
+        mock_group.return_value.apply_async.assert_called_once()
 
     @patch("app.tasks.order_tasks.SyncSessionFactory")
     def test_skips_when_order_not_found(self, mock_factory):
@@ -185,68 +178,62 @@ class TestProcessPaidOrder:
         assert result["status"] == "skipped"
         assert "shipped" in result["reason"].lower()
 
+
+# ---------------------------------------------------------------------------
+# complete_paid_order / record_order_stage
+# ---------------------------------------------------------------------------
+
+
+class TestCompletePaidOrder:
+    """Tests for the fraud-gated auto-fulfillment decision."""
+
+    @patch("app.services.order_pipeline_service.record_stage_sync", return_value=1.5)
     @patch("app.tasks.order_tasks.auto_fulfill_order")
-    @patch("app.tasks.notification_tasks.create_low_stock_notification")
-    @patch("app.tasks.notification_tasks.create_order_notification")
-    @patch("app.tasks.webhook_tasks.dispatch_webhook_event")
-    @patch("app.tasks.email_tasks.send_low_stock_alert")
-    @patch("app.tasks.email_tasks.send_order_confirmation")
-    @patch("app.tasks.fraud_tasks.run_fraud_check")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_dispatches_low_stock_alerts(
-        self, mock_factory, mock_fraud, mock_email, mock_low_stock_email,
-        mock_webhook, mock_notify, mock_low_stock_notify, mock_auto_fulfill,
-    ):
-        """Low-stock alerts dispatched for variants with <= 5 units."""
-        from app.models.order import Order, OrderItem
-        from app.models.product import ProductVariant
-        from app.tasks.order_tasks import process_paid_order
+    def test_dispatches_auto_fulfill_for_clean_order(self, mock_factory, mock_auto_fulfill, mock_stage):
+        """A clean fraud result dispatches auto-fulfillment."""
+        from app.tasks.order_tasks import complete_paid_order
 
-        order = _make_mock_order(status="paid")
-        product_id = uuid.uuid4()
-        variant_id = uuid.uuid4()
+        order_id = str(uuid.uuid4())
+        result = complete_paid_order(
+            {"risk_score": 0, "risk_level": "low", "is_flagged": False, "signals": []},
+            order_id,
+        )
 
-        mock_item = MagicMock(spec=OrderItem)
-        mock_item.variant_id = variant_id
-        mock_item.product_id = product_id
+        assert result["auto_fulfill"] == "dispatched"
+        mock_auto_fulfill.delay.assert_called_once_with(order_id)
+        assert mock_stage.call_args.args[2] == "fraud_checked"
+        mock_factory.return_value.commit.assert_called_once()
 
-        mock_variant = MagicMock(spec=ProductVariant)
-        mock_variant.id = variant_id
-        mock_variant.inventory_count = 3  # below threshold
+    @patch("app.services.order_pipeline_service.record_stage_sync")
+    @patch("app.tasks.order_tasks.auto_fulfill_order")
+    @patch("app.tasks.order_tasks.SyncSessionFactory")
+    def test_skips_auto_fulfill_when_fraud_flagged(self, mock_factory, mock_auto_fulfill, mock_stage):
+        """Auto-fulfill is skipped when the fraud check flags the order."""
+        from app.tasks.order_tasks import complete_paid_order
 
-        session = MagicMock()
+        result = complete_paid_order(
+            {"risk_score": 75, "risk_level": "high", "is_flagged": True,
+             "signals": ["high_amount", "new_customer_high_order", "first_order"]},
+            str(uuid.uuid4()),
+        )
 
-        def query_side_effect(model):
-            chain = MagicMock()
-            if hasattr(model, '__name__') and model.__name__ == "Order":
-                chain.filter.return_value.first.return_value = order
-            elif hasattr(model, '__name__') and model.__name__ == "OrderItem":
-                chain.filter.return_value.all.return_value = [mock_item]
-            elif hasattr(model, '__name__') and model.__name__ == "ProductVariant":
-                chain.filter.return_value.first.return_value = mock_variant
-            else:
-                chain.filter.return_value.first.return_value = None
-            return chain
+        assert result["auto_fulfill"] == "skipped_fraud_flagged"
+        mock_auto_fulfill.delay.assert_not_called()
 
-        session.query.side_effect = query_side_effect
-        mock_factory.return_value = session
+    @patch("app.tasks.order_tasks.SyncSessionFactory")
+    def test_record_order_stage_never_raises(self, mock_factory):
+        """Instrumentation failures are reported, not retried."""
+        from app.tasks.order_tasks import record_order_stage
 
-        mock_fraud.return_value = {
-            "risk_score": 0, "risk_level": "low",
-            "is_flagged": False, "signals": [],
-        }
+        session = MagicMock()
+        session.execute.side_effect = RuntimeError("db down")
+        mock_factory.return_value = session
 
-        mock_email.delay = MagicMock()
-        mock_low_stock_email.delay = MagicMock()
-        mock_webhook.delay = MagicMock()
-        mock_notify.delay = MagicMock()
-        mock_low_stock_notify.delay = MagicMock()
-        mock_auto_fulfill.delay = MagicMock()
+        result = record_order_stage(str(uuid.uuid4()), "owner_notified")
 
-        result = process_paid_order(str(order.id))
-        assert result["low_stock_alerts"] == 1
-        mock_low_stock_email.delay.assert_called_once()
-        mock_low_stock_notify.delay.assert_called_once()
+        assert result == {"stage": "owner_notified", "error": "db down"}
+        session.rollback.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -406,77 +393,118 @@ class TestAutoFulfillOrder:
 class TestCheckFulfillmentStatus:
     """Tests for the check_fulfillment_status Beat task."""
 
+    @patch("app.tasks.order_tasks.notify_orders_delivered")
+    @patch("app.services.tracking_service.poll_shipments_sync")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_no_shipped_orders(self, mock_factory):
+    def test_no_shipped_orders(self, mock_factory, mock_poll, mock_notify):
         """Returns zero counts when no shipped orders exist."""
         from app.tasks.order_tasks import check_fulfillment_status
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = []
-        mock_factory.return_value = session
+        mock_factory.return_value = MagicMock()
+        mock_poll.return_value = {"checked": 0, "delivered": [], "last_order_id": None}
 
         result = check_fulfillment_status()
         assert result["checked_count"] == 0
         assert result["delivered_count"] == 0
+        assert result["batches"] == 0
+        mock_notify.delay.assert_not_called()
 
-    @patch("app.tasks.order_tasks.random")
-    @patch("app.tasks.notification_tasks.create_order_notification")
-    @patch("app.tasks.webhook_tasks.dispatch_webhook_event")
-    @patch("app.tasks.email_tasks.send_order_delivered")
+    @patch("app.tasks.order_tasks.notify_orders_delivered")
+    @patch("app.services.tracking_service.poll_shipments_sync")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_delivers_orders_randomly(
-        self, mock_factory, mock_email, mock_webhook, mock_notify, mock_random,
-    ):
-        """Transitions shipped orders to delivered based on random chance."""
-        from app.models.order import Order, OrderStatus
+    def test_pages_until_cursor_is_exhausted(self, mock_factory, mock_poll, mock_notify):
+        """Commits every page and queues one event task per page with deliveries."""
         from app.tasks.order_tasks import check_fulfillment_status
 
-        mock_order = MagicMock(spec=Order)
-        mock_order.id = uuid.uuid4()
-        mock_order.store_id = uuid.uuid4()
-        mock_order.status = OrderStatus.shipped
-        mock_order.shipped_at = datetime.now(timezone.utc) - timedelta(days=10)
-
         session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_order]
         mock_factory.return_value = session
+        cursor = uuid.uuid4()
+        delivered = [str(uuid.uuid4()), str(uuid.uuid4())]
+        mock_poll.side_effect = [
+            {"checked": 500, "delivered": delivered, "last_order_id": cursor},
+            {"checked": 20, "delivered": [], "last_order_id": None},
+        ]
 
-        mock_email.delay = MagicMock()
-        mock_webhook.delay = MagicMock()
-        mock_notify.delay = MagicMock()
+        result = check_fulfillment_status()
+        assert result == {"checked_count": 520, "delivered_count": 2, "batches": 2}
+        assert mock_poll.call_args_list[1].kwargs["after_order_id"] == cursor
+        assert session.commit.call_count == 2
+        mock_notify.delay.assert_called_once_with(delivered)
 
-        # Force the random check to pass (< 0.3)
-        mock_random.random.return_value = 0.1
 
-        result = check_fulfillment_status()
-        assert result["checked_count"] == 1
-        assert result["delivered_count"] == 1
-        assert mock_order.status == OrderStatus.delivered
-        mock_email.delay.assert_called_once()
-        session.commit.assert_called_once()
+# ---------------------------------------------------------------------------
+# notify_orders_delivered
+# ---------------------------------------------------------------------------
+
 
-    @patch("app.tasks.order_tasks.random")
+class TestNotifyOrdersDelivered:
+    """Tests for the per-page delivery side effects task."""
+
+    @patch("app.services.notification_push_service.notifications_created_sync")
+    @patch("app.services.tracking_service.send_delivery_events_sync")
+    @patch("app.services.tracking_service.create_delivery_notifications_sync")
     @patch("app.tasks.order_tasks.SyncSessionFactory")
-    def test_skips_delivery_on_high_random(self, mock_factory, mock_random):
-        """Does not deliver orders when random > 0.3."""
-        from app.models.order import Order, OrderStatus
-        from app.tasks.order_tasks import check_fulfillment_status
+    def test_notifications_commit_before_webhooks_and_emails(
+        self, mock_factory, mock_create, mock_send, mock_push
+    ):
+        """Webhooks and emails are sent only after the notifications commit."""
+        from app.tasks.order_tasks import notify_orders_delivered
+
+        session = MagicMock()
+        mock_factory.return_value = session
+        events = []
+        session.commit.side_effect = lambda: events.append("commit")
+        mock_create.return_value = (["row"], ["notification"])
+        mock_send.side_effect = lambda s, rows: events.append("send") or {"webhooks": 1, "emails": 1}
+
+        result = notify_orders_delivered([str(uuid.uuid4())])
+
+        assert result == {"notifications": 1, "webhooks": 1, "emails": 1}
+        assert events == ["commit", "send", "commit"]
+        mock_send.assert_called_once_with(session, ["row"])
+        mock_push.assert_called_once_with(["notification"])
 
-        mock_order = MagicMock(spec=Order)
-        mock_order.id = uuid.uuid4()
-        mock_order.store_id = uuid.uuid4()
-        mock_order.status = OrderStatus.shipped
-        mock_order.shipped_at = datetime.now(timezone.utc) - timedelta(days=10)
+    @patch("app.services.notification_push_service.notifications_created_sync")
+    @patch("app.services.tracking_service.send_delivery_events_sync")
+    @patch("app.services.tracking_service.create_delivery_notifications_sync")
+    @patch("app.tasks.order_tasks.SyncSessionFactory")
+    def test_failure_after_sending_is_not_retried(
+        self, mock_factory, mock_create, mock_send, mock_push
+    ):
+        """A database error while recording the webhooks does not resend the page."""
+        from app.tasks.order_tasks import notify_orders_delivered
 
         session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_order]
         mock_factory.return_value = session
+        session.commit.side_effect = [None, RuntimeError("connection lost")]
+        mock_create.return_value = (["row"], ["notification"])
+        mock_send.return_value = {"webhooks": 1, "emails": 1}
 
-        # Force the random check to fail (>= 0.3)
-        mock_random.random.return_value = 0.5
+        with patch.object(notify_orders_delivered, "retry") as retry:
+            result = notify_orders_delivered([str(uuid.uuid4())])
 
-        result = check_fulfillment_status()
-        assert result["checked_count"] == 1
-        assert result["delivered_count"] == 0
-        assert mock_order.status == OrderStatus.shipped
-        session.commit.assert_not_called()
+        retry.assert_not_called()
+        mock_send.assert_called_once()
+        session.rollback.assert_called_once()
+        assert result["notifications"] == 1
+
+    @patch("app.services.tracking_service.send_delivery_events_sync")
+    @patch("app.services.tracking_service.create_delivery_notifications_sync")
+    @patch("app.tasks.order_tasks.SyncSessionFactory")
+    def test_notification_failure_retries_without_sending(
+        self, mock_factory, mock_create, mock_send
+    ):
+        """Only the notification step is retried, before anything was sent."""
+        from app.tasks.order_tasks import notify_orders_delivered
+
+        session = MagicMock()
+        mock_factory.return_value = session
+        mock_create.side_effect = RuntimeError("db down")
+
+        with patch.object(notify_orders_delivered, "retry", side_effect=Retry()) as retry:
+            with pytest.raises(Retry):
+                notify_orders_delivered([str(uuid.uuid4())])
+
+        retry.assert_called_once()
+        mock_send.assert_not_called()
+        session.rollback.assert_called_once()
@@ -0,0 +1,179 @@
+"""Tests for precomputed co-purchase recommendations.
+
+Covers ``recommendation_service`` (the co-purchase matrix, incremental
+refresh, top-K ranking, manual upsell mirroring), the blended public
+upsells endpoint, and the ``refresh_product_recommendations`` Beat task.
+
+**For Developers:**
+    Orders are inserted directly with a ``paid_at`` in the past. The
+    refresh runs through ``db.run_sync`` with ``now`` an hour ahead, so
+    the settle delay does not hold the test orders back. Data is
+    committed before the public endpoint is called, since the client uses
+    its own sessions.
+
+**For QA Engineers:**
+    - Products bought together in at least
+      ``recommendation_min_co_purchases`` paid orders recommend each
+      other, best cosine score first.
+    - A refresh without new orders changes nothing; new orders re-rank
+      only their products and neighbours.
+    - Manual upsells come first and a target is listed once.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import select
+
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.product import Product, ProductStatus
+from app.models.store import Store
+from app.models.upsell import ProductCoPurchase, ProductRecommendation
+from app.models.user import User
+from app.services.recommendation_service import refresh_recommendations_sync
+from app.services.upsell_service import create_upsell, delete_upsell
+
+
+async def _catalog(db, count: int) -> tuple[User, Store, list[Product]]:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Rec Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    products = [
+        Product(
+            store_id=store.id, title=f"Product {i}", slug=f"product-{i}",
+            price=Decimal("10.00"), status=ProductStatus.active, images=[f"https://img/{i}.jpg"],
+        )
+        for i in range(count)
+    ]
+    db.add_all(products)
+    await db.flush()
+    return user, store, products
+
+
+async def _orders(db, store, products, times: int = 1, status=OrderStatus.paid, paid_at=None):
+    for _ in range(times):
+        order = Order(
+            store_id=store.id,
+            customer_email=f"{uuid.uuid4().hex[:8]}@example.com",
+            status=status,
+            total=Decimal("10.00") * len(products),
+            paid_at=paid_at or datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db.add(order)
+        await db.flush()
+        db.add_all([
+            OrderItem(
+                order_id=order.id, product_id=p.id, product_title=p.title,
+                quantity=1, unit_price=p.price,
+            )
+            for p in products
+        ])
+    await db.flush()
+
+
+async def _refresh(db, hours_ahead: int = 1) -> dict:
+    now = datetime.now(timezone.utc) + timedelta(hours=hours_ahead)
+    return await db.run_sync(lambda s: refresh_recommendations_sync(s, now=now))
+
+
+async def _learned(db, product) -> list[tuple[uuid.UUID, float]]:
+    rows = await db.execute(
+        select(ProductRecommendation.target_product_id, ProductRecommendation.score)
+        .where(
+            ProductRecommendation.product_id == product.id,
+            ProductRecommendation.upsell_id.is_(None),
+        )
+        .order_by(ProductRecommendation.rank)
+    )
+    return [(target, round(score, 3)) for target, score in rows]
+
+
+async def test_refresh_ranks_co_purchased_products(db):
+    """Top neighbours by cosine score; rare pairs and unpaid orders are ignored."""
+    _, store, (a, b, c, d) = await _catalog(db, 4)
+    await _orders(db, store, [a, b], times=3)
+    await _orders(db, store, [a, c], times=2)
+    await _orders(db, store, [a, d])
+    await _orders(db, store, [a, d], times=5, status=OrderStatus.pending)
+
+    counts = await _refresh(db)
+    assert counts["products"] == 4
+
+    diagonal = (await db.execute(
+        select(ProductCoPurchase.orders).where(
+            ProductCoPurchase.product_id == a.id, ProductCoPurchase.other_product_id == a.id
+        )
+    )).scalar_one()
+    assert diagonal == 6
+    # 3 / sqrt(6 * 3) and 2 / sqrt(6 * 2); A-D shares a single order
+    assert await _learned(db, a) == [(b.id, 0.707), (c.id, 0.577)]
+    assert await _learned(db, b) == [(a.id, 0.707)]
+    assert await _learned(db, d) == []
+
+
+async def test_refresh_is_incremental(db):
+    """Only new orders are counted, and only their neighbourhoods re-ranked."""
+    _, store, (a, b, c, d) = await _catalog(db, 4)
+    await _orders(db, store, [a, b], times=2)
+    await _orders(db, store, [c, d], times=1)
+    await _refresh(db)
+    assert await _refresh(db) == {"cells": 0, "products": 0}
+
+    await _orders(db, store, [c, d], paid_at=datetime.now(timezone.utc) + timedelta(minutes=90))
+    counts = await _refresh(db, hours_ahead=2)
+    assert counts["cells"] == 4
+    assert counts["products"] == 2
+    assert [t for t, _ in await _learned(db, d)] == [c.id]
+    assert [t for t, _ in await _learned(db, a)] == [b.id]
+
+
+async def test_public_endpoint_blends_manual_and_learned(client, db):
+    """Upsells come first; learned rows fill up; each target appears once."""
+    user, store, (a, b, c, hidden) = await _catalog(db, 4)
+    await _orders(db, store, [a, b, c, hidden], times=2)
+    hidden.status = ProductStatus.draft
+    await _refresh(db)
+    store_id, slug, a_id, b_id, c_id = store.id, store.slug, a.id, b.id, c.id
+    await db.commit()
+
+    upsell = await create_upsell(
+        db, store_id, user.id, a_id, c_id, upsell_type="bundle", title="Better together"
+    )
+    await db.commit()
+
+    url = f"/api/v1/public/stores/{slug}/products/product-0/upsells"
+    resp = await client.get(url)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [(r["target_product_id"], r["source"]) for r in body] == [
+        (str(c_id), "manual"), (str(b_id), "learned"),
+    ]
+    assert body[0]["upsell_type"] == "bundle"
+    assert body[0]["title"] == "Better together"
+    assert body[1]["upsell_type"] == "cross_sell"
+    assert body[1]["target_product_image"] == "https://img/1.jpg"
+
+    await delete_upsell(db, store_id, user.id, upsell.id)
+    await db.commit()
+    body = (await client.get(url)).json()
+    assert [r["source"] for r in body] == ["learned", "learned"]
+
+
+@patch("app.services.recommendation_service.refresh_recommendations_sync")
+@patch("app.tasks.analytics_tasks.SyncSessionFactory")
+def test_refresh_task_commits(mock_factory, mock_refresh):
+    """The Beat task commits the refresh and returns its counts."""
+    from app.tasks.analytics_tasks import refresh_product_recommendations
+
+    session = MagicMock()
+    mock_factory.return_value = session
+    mock_refresh.return_value = {"cells": 4, "products": 2}
+
+    assert refresh_product_recommendations() == {"cells": 4, "products": 2}
+    session.commit.assert_called_once()
+    session.close.assert_called_once()
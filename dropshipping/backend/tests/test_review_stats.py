@@ -0,0 +1,125 @@
+"""Tests for incrementally maintained review rating aggregates.
+
+Covers the per-product count, sum, and star histogram that
+``review_service.update_review_status`` moves on each moderation change,
+and ``review_service.reconcile_rating_stats_sync``.
+
+**For Developers:**
+    Tests use the ``db`` fixture; reconciliation runs through
+    ``db.run_sync``.
+
+**For QA Engineers:**
+    - Only entering or leaving ``approved`` moves the aggregates.
+    - Stats are read from the product, never recomputed from reviews.
+    - Reconciliation repairs drifted products and leaves correct ones alone.
+"""
+
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from app.models.product import Product, ProductStatus
+from app.models.review import ReviewStatus
+from app.models.store import Store
+from app.models.user import User
+from app.services.review_service import (
+    create_review,
+    get_review_stats,
+    reconcile_rating_stats_sync,
+    update_review_status,
+)
+
+
+async def _product(db) -> Product:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Review Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    product = Product(
+        store_id=store.id, title="Lamp", slug="lamp", price=Decimal("20"),
+        status=ProductStatus.active,
+    )
+    db.add(product)
+    await db.flush()
+    return product
+
+
+async def _moderated(db, product, rating, status=ReviewStatus.approved):
+    review = await create_review(
+        db, product.store_id, product.id, None, "Shopper", "s@example.com", rating
+    )
+    owner = (await db.get(Store, product.store_id)).user_id
+    return await update_review_status(db, product.store_id, owner, review.id, status)
+
+
+async def test_moderation_moves_aggregates(db):
+    """Approving adds a rating; un-approving removes it; other moves are no-ops."""
+    product = await _product(db)
+    owner = (await db.get(Store, product.store_id)).user_id
+    five = await _moderated(db, product, 5)
+    await _moderated(db, product, 4)
+    await _moderated(db, product, 1, ReviewStatus.rejected)
+
+    stats = await get_review_stats(db, product.store_id, product.id)
+    assert stats == {
+        "average_rating": 4.5,
+        "total_reviews": 2,
+        "rating_distribution": {1: 0, 2: 0, 3: 0, 4: 1, 5: 1},
+    }
+
+    await update_review_status(db, product.store_id, owner, five.id, ReviewStatus.approved)
+    await update_review_status(db, product.store_id, owner, five.id, ReviewStatus.pending)
+    await db.refresh(product)
+    assert (product.review_count, product.rating_sum, product.rating_5_count) == (1, 4, 0)
+    assert product.avg_rating == Decimal("4.00")
+
+    assert (await get_review_stats(db, product.store_id, product.id))["total_reviews"] == 1
+
+
+async def test_last_approved_review_removed_clears_average(db):
+    """No approved reviews leave a null average."""
+    product = await _product(db)
+    owner = (await db.get(Store, product.store_id)).user_id
+    review = await _moderated(db, product, 3)
+    await update_review_status(db, product.store_id, owner, review.id, ReviewStatus.rejected)
+
+    await db.refresh(product)
+    assert (product.review_count, product.rating_sum, product.avg_rating) == (0, 0, None)
+
+
+async def test_reconcile_repairs_drift(db):
+    """Drifted aggregates are recounted; correct ones are untouched."""
+    healthy = await _product(db)
+    drifted = await _product(db)
+    await _moderated(db, healthy, 2)
+    await _moderated(db, drifted, 5)
+    await _moderated(db, drifted, 3)
+    await db.execute(
+        update(Product)
+        .where(Product.id == drifted.id)
+        .values(review_count=7, rating_sum=1, rating_5_count=0)
+    )
+    await db.commit()
+
+    def reconcile(session):
+        first = reconcile_rating_stats_sync(session, limit=1)
+        second = reconcile_rating_stats_sync(
+            session, after_product_id=first["last_product_id"], limit=1
+        )
+        third = reconcile_rating_stats_sync(
+            session, after_product_id=second["last_product_id"], limit=1
+        )
+        session.commit()
+        return first, second, third
+
+    first, second, third = await db.run_sync(reconcile)
+    assert first["corrected"] + second["corrected"] == 1
+    assert third == {"products": 0, "corrected": 0, "last_product_id": None}
+
+    await db.refresh(drifted)
+    assert (drifted.review_count, drifted.rating_sum) == (2, 8)
+    assert (drifted.rating_3_count, drifted.rating_5_count) == (1, 1)
+    assert drifted.avg_rating == Decimal("4.00")
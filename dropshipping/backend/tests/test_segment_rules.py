@@ -0,0 +1,234 @@
+"""Tests for rule-compiled automatic segments.
+
+Covers ``segment_rules_service`` (rule compilation, set-based
+materialization, incremental per-customer refreshes) and the segment
+counters maintained by ``segment_service``.
+
+**For Developers:**
+    Orders are inserted directly and moved through
+    ``order_service.update_order_status`` so the order hooks run; customer
+    and address events go through the public storefront API.
+
+**For QA Engineers:**
+    - Saving an automatic segment fills it with every matching customer.
+    - Paying or cancelling an order, registering, and changing an address
+      move customers in and out in the same request.
+    - Segment sizes come from ``customer_count``, for manual segments too.
+    - Unknown rules are rejected with 400.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import patch
+
+from app.models.order import Order, OrderStatus
+from app.models.store import Store
+from app.models.user import User
+from app.services import segment_service
+from app.services.customer_service import register_customer
+from app.services.order_service import update_order_status
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Segment Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _order(db, store, email, total, status=OrderStatus.paid) -> Order:
+    order = Order(store_id=store.id, customer_email=email, status=status, total=Decimal(total))
+    db.add(order)
+    await db.flush()
+    return order
+
+
+async def _emails(db, store, segment) -> set[str]:
+    customers, total = await segment_service.get_segment_customers(
+        db, store.id, store.user_id, segment.id, per_page=100
+    )
+    assert total == len(customers)
+    return {c["email"] for c in customers}
+
+
+async def test_saving_rules_materializes_matching_customers(db):
+    """Create and rule changes fill the segment set-based."""
+    store = await _store(db)
+    for email in ("big@example.com", "small@example.com", "new@vip.example"):
+        await register_customer(db, store.id, email, "secret123")
+    await _order(db, store, "big@example.com", "100")
+    await _order(db, store, "big@example.com", "50")
+    await _order(db, store, "small@example.com", "30")
+    await _order(db, store, "small@example.com", "500", status=OrderStatus.pending)
+
+    segment = await segment_service.create_segment(
+        db, store.id, store.user_id, "Repeat buyers",
+        segment_type="automatic", rules={"min_orders": 2}
+    )
+    assert segment.customer_count == 1
+    assert await _emails(db, store, segment) == {"big@example.com"}
+
+    segment = await segment_service.update_segment(
+        db, store.id, store.user_id, segment.id, rules={"total_spent_gte": 20}
+    )
+    assert segment.customer_count == 2
+    assert await _emails(db, store, segment) == {"big@example.com", "small@example.com"}
+
+    segment = await segment_service.update_segment(
+        db, store.id, store.user_id, segment.id, rules={"email_domain": "vip.example"}
+    )
+    assert await _emails(db, store, segment) == {"new@vip.example"}
+
+
+async def test_order_events_move_customers_incrementally(db):
+    """Paying and cancelling orders update membership and the counter."""
+    store = await _store(db)
+    segment = await segment_service.create_segment(
+        db, store.id, store.user_id, "Buyers",
+        segment_type="automatic", rules={"min_orders": 1}
+    )
+    await register_customer(db, store.id, "buyer@example.com", "secret123")
+    assert segment.customer_count == 0
+
+    order = await _order(db, store, "buyer@example.com", "25", status=OrderStatus.pending)
+    await update_order_status(db, store.id, store.user_id, order.id, OrderStatus.paid)
+    assert segment.customer_count == 1
+    assert await _emails(db, store, segment) == {"buyer@example.com"}
+
+    await update_order_status(db, store.id, store.user_id, order.id, OrderStatus.cancelled)
+    assert segment.customer_count == 0
+    assert await _emails(db, store, segment) == set()
+
+
+async def test_events_skip_segments_that_do_not_read_them(db):
+    """An order event costs one lookup when no rule reads orders."""
+    from app.services import segment_rules_service
+
+    store = await _store(db)
+    await segment_service.create_segment(
+        db, store.id, store.user_id, "US",
+        segment_type="automatic", rules={"country": "US"}
+    )
+    order = await _order(db, store, "x@example.com", "10", status=OrderStatus.pending)
+    order.status = OrderStatus.paid
+
+    with patch.object(db, "execute", wraps=db.execute) as execute:
+        await segment_rules_service.on_order_status_change(db, order, OrderStatus.pending)
+        assert execute.call_count == 1
+
+
+async def test_new_customers_and_addresses_update_segments(client):
+    """Registration and address changes are applied in the same request."""
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "owner@example.com", "password": "securepass123"},
+    )
+    owner = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Rule Shop", "niche": "home"}, headers=owner)
+    ).json()
+    base = f"/api/v1/stores/{store['id']}/segments"
+
+    everyone = (
+        await client.post(base, json={"name": "All", "segment_type": "dynamic"}, headers=owner)
+    ).json()
+    assert everyone["segment_type"] == "automatic"
+    us = (
+        await client.post(
+            base,
+            json={"name": "US", "segment_type": "automatic", "rules": {"country": ["us", "CA"]}},
+            headers=owner,
+        )
+    ).json()
+
+    public = f"/api/v1/public/stores/{store['slug']}/customers"
+    resp = await client.post(
+        f"{public}/register", json={"email": "jane@example.com", "password": "secret123"}
+    )
+    customer = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    assert (await client.get(f"{base}/{everyone['id']}", headers=owner)).json()["customer_count"] == 1
+    assert (await client.get(f"{base}/{us['id']}", headers=owner)).json()["customer_count"] == 0
+
+    address = (
+        await client.post(
+            f"{public}/me/addresses",
+            json={
+                "label": "Home", "name": "Jane Doe", "line1": "1 Main St",
+                "city": "Portland", "postal_code": "97201", "country": "US",
+                "is_default": True,
+            },
+            headers=customer,
+        )
+    ).json()
+    members = (await client.get(f"{base}/{us['id']}/customers", headers=owner)).json()
+    assert members["total"] == 1
+    assert members["items"][0]["email"] == "jane@example.com"
+
+    await client.delete(f"{public}/me/addresses/{address['id']}", headers=customer)
+    assert (await client.get(f"{base}/{us['id']}", headers=owner)).json()["customer_count"] == 0
+
+
+async def test_invalid_rules_and_manual_counters(client):
+    """Bad rules are 400s; manual membership keeps an exact counter."""
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "owner@example.com", "password": "securepass123"},
+    )
+    owner = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    shopper = (
+        await client.post(
+            "/api/v1/auth/register",
+            json={"email": "shopper@example.com", "password": "securepass123"},
+        )
+    ).json()
+    shopper_id = (
+        await client.get(
+            "/api/v1/auth/me", headers={"Authorization": f"Bearer {shopper['access_token']}"}
+        )
+    ).json()["id"]
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Count Shop", "niche": "home"}, headers=owner)
+    ).json()
+    base = f"/api/v1/stores/{store['id']}/segments"
+
+    resp = await client.post(
+        base,
+        json={"name": "Bad", "segment_type": "automatic", "rules": {"favourite_colour": "red"}},
+        headers=owner,
+    )
+    assert resp.status_code == 400
+    resp = await client.post(
+        base,
+        json={"name": "Bad", "segment_type": "automatic", "rules": {"min_orders": -1}},
+        headers=owner,
+    )
+    assert resp.status_code == 400
+
+    automatic = (
+        await client.post(base, json={"name": "Auto", "segment_type": "automatic"}, headers=owner)
+    ).json()
+    resp = await client.post(
+        f"{base}/{automatic['id']}/customers", json={"customer_ids": [shopper_id]}, headers=owner
+    )
+    assert resp.status_code == 400
+
+    manual = (
+        await client.post(base, json={"name": "Hand-picked", "segment_type": "manual"}, headers=owner)
+    ).json()
+    for expected in (1, 0):
+        resp = await client.post(
+            f"{base}/{manual['id']}/customers",
+            json={"customer_ids": [shopper_id, shopper_id]},
+            headers=owner,
+        )
+        assert resp.json()["added"] == expected
+    assert (await client.get(f"{base}/{manual['id']}", headers=owner)).json()["customer_count"] == 1
+    listed = (await client.get(f"{base}/{manual['id']}/customers", headers=owner)).json()
+    assert listed["total"] == 1
+    assert listed["items"][0]["email"] == "shopper@example.com"
+
+    await client.delete(f"{base}/{manual['id']}/customers/{shopper_id}", headers=owner)
+    assert (await client.get(f"{base}/{manual['id']}", headers=owner)).json()["customer_count"] == 0
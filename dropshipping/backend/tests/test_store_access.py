@@ -0,0 +1,177 @@
+"""Tests for the cached store access resolver.
+
+Covers ``store_access_service``, its use by the service-level ownership
+checks and ``team_service``, and the ``require_store_owner`` dependency.
+
+**For Developers:**
+    Tests use the ``db`` fixture and the Redis from ``REDIS_URL``; every
+    test creates its own store, so cached roles never collide. Database
+    lookups are counted by wrapping ``_load_role``.
+
+**For QA Engineers:**
+    - Repeated checks are answered without querying the database, also
+      by a process that only has the Redis entry.
+    - Committed team changes and store deletion take effect on the next
+      check, also when a check re-cached the old role before the commit.
+    - Without Redis, checks fall back to the database.
+"""
+
+import io
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.models.store import Store
+from app.models.user import User
+from app.services import store_access_service
+from app.services.store_access_service import resolve_store_role, verify_store_ownership
+from app.services.store_service import delete_store
+from app.services.team_service import (
+    accept_invite,
+    check_store_access,
+    invite_member,
+    remove_member_or_invite,
+    update_member_or_invite_role,
+)
+from app.services.tax_service import list_tax_rates
+
+
+async def _user(db) -> User:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    return user
+
+
+async def _store(db) -> Store:
+    owner = await _user(db)
+    store = Store(user_id=owner.id, name="Access Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+def _count_loads():
+    return patch.object(
+        store_access_service, "_load_role", wraps=store_access_service._load_role
+    )
+
+
+async def test_owner_checks_are_cached(db):
+    """Only the first check of a caller and store queries the database."""
+    store = await _store(db)
+    stranger = await _user(db)
+
+    with _count_loads() as load:
+        for _ in range(3):
+            await verify_store_ownership(db, store.id, store.user_id)
+            await list_tax_rates(db, store.id, store.user_id)
+            with pytest.raises(ValueError, match="Store not found"):
+                await verify_store_ownership(db, store.id, stranger.id)
+        assert load.call_count == 2
+
+        store_access_service.clear_access_cache()
+        assert await resolve_store_role(db, store.id, store.user_id) == "owner"
+        assert await resolve_store_role(db, store.id, stranger.id) is None
+        assert load.call_count == 2
+
+
+async def test_team_changes_invalidate_member_role(db):
+    """Accepting, re-roling, and removing a member are seen once committed."""
+    store = await _store(db)
+    member = await _user(db)
+    assert await check_store_access(db, store.id, member.id) is None
+
+    invite = await invite_member(db, store.id, store.user_id, member.email, "viewer")
+    joined = await accept_invite(db, invite.token, member.id)
+    await db.commit()
+    assert await check_store_access(db, store.id, member.id) == "viewer"
+
+    await update_member_or_invite_role(db, store.id, store.user_id, joined.id, "admin")
+    await db.commit()
+    assert await check_store_access(db, store.id, member.id) == "admin"
+    with pytest.raises(ValueError):
+        await verify_store_ownership(db, store.id, member.id)
+
+    await remove_member_or_invite(db, store.id, store.user_id, joined.id)
+    await db.commit()
+    assert await check_store_access(db, store.id, member.id) is None
+
+
+async def test_lookup_before_commit_does_not_outlive_it(db, session_factory):
+    """A check racing a removal re-caches the old role only until commit."""
+    store = await _store(db)
+    member = await _user(db)
+    invite = await invite_member(db, store.id, store.user_id, member.email, "editor")
+    joined = await accept_invite(db, invite.token, member.id)
+    await db.commit()
+
+    await remove_member_or_invite(db, store.id, store.user_id, joined.id)
+    async with session_factory() as other:
+        assert await check_store_access(other, store.id, member.id) == "editor"
+    await db.commit()
+
+    assert await check_store_access(db, store.id, member.id) is None
+    store_access_service.clear_access_cache()
+    assert await check_store_access(db, store.id, member.id) is None
+
+
+async def test_rolled_back_changes_keep_the_cache(db):
+    """Invalidations of a rolled-back transaction are dropped."""
+    store = await _store(db)
+    store_id, owner_id = store.id, store.user_id
+    await db.commit()
+    await verify_store_ownership(db, store_id, owner_id)
+
+    with _count_loads() as load:
+        await delete_store(db, owner_id, store_id)
+        await db.rollback()
+        await verify_store_ownership(db, store_id, owner_id)
+        assert load.call_count == 0
+
+
+async def test_store_deletion_revokes_every_cached_role(db):
+    """A deleted store is not found, even for callers cached before."""
+    store = await _store(db)
+    stranger = await _user(db)
+    await verify_store_ownership(db, store.id, store.user_id)
+    assert await resolve_store_role(db, store.id, stranger.id) is None
+
+    await delete_store(db, store.user_id, store.id)
+    await db.commit()
+    with pytest.raises(ValueError, match="Store not found"):
+        await verify_store_ownership(db, store.id, store.user_id)
+
+
+async def test_without_redis_checks_use_the_database(db):
+    """A Redis outage falls back to the local entry and the database."""
+    store = await _store(db)
+    broken = MagicMock()
+    broken.get.side_effect = RedisError("down")
+    broken.set.side_effect = RedisError("down")
+
+    with _count_loads() as load, \
+            patch.object(store_access_service, "get_redis", return_value=broken):
+        assert await resolve_store_role(db, store.id, store.user_id) == "owner"
+        assert await resolve_store_role(db, store.id, store.user_id) == "owner"
+        assert load.call_count == 1
+
+
+async def test_upload_requires_store_owner(client):
+    """The ``require_store_owner`` dependency answers 404 to other users."""
+    tokens = []
+    for email in ("owner@example.com", "other@example.com"):
+        resp = await client.post(
+            "/api/v1/auth/register", json={"email": email, "password": "securepass123"}
+        )
+        tokens.append({"Authorization": f"Bearer {resp.json()['access_token']}"})
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Shop", "niche": "gear"}, headers=tokens[0])
+    ).json()
+
+    files = {"file": ("lamp.png", io.BytesIO(b"\x89PNG"), "image/png")}
+    url = f"/api/v1/stores/{store['id']}/products/upload"
+    assert (await client.post(url, files=files, headers=tokens[1])).status_code == 404
+    assert (await client.post(url, files=files, headers=tokens[0])).status_code == 201
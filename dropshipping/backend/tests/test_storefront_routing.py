@@ -0,0 +1,208 @@
+"""Tests for the in-memory storefront routing table.
+
+Covers ``storefront_routing_service`` (slug and host resolution, the
+negative cache, and pub/sub updates), ``StorefrontHostMiddleware``, and
+the ``/public/host`` endpoint.
+
+**For Developers:**
+    The ``truncate_tables`` fixture empties the routing table before each
+    test. Queries are counted by wrapping ``db.execute``.
+
+**For QA Engineers:**
+    - Renaming, pausing, and deleting a store take effect on the next
+      storefront request; a rolled-back change never does.
+    - Verified custom domains resolve; pending and deleted ones do not.
+    - Unknown slugs and hosts are answered from memory while the
+      subscriber is connected, and looked up once otherwise.
+"""
+
+import asyncio
+import json
+import uuid
+from unittest.mock import patch
+
+from app.models.store import Store, StoreStatus
+from app.models.user import User
+from app.redis_client import get_redis
+from app.services import storefront_routing_service
+from app.services.storefront_routing_service import (
+    ROUTES_CHANNEL,
+    listen_for_route_changes,
+    lookup_host,
+    publish_store_route,
+    resolve_host,
+    resolve_slug,
+)
+
+
+async def _owner(client) -> dict:
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "routes@example.com", "password": "securepass123"},
+    )
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+async def _store(db, slug: str) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Route Store", slug=slug, niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def test_store_changes_reach_storefront_immediately(client):
+    """Rename, pause, and delete are seen by the next public request."""
+    headers = await _owner(client)
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Lamp Shop", "niche": "home"}, headers=headers)
+    ).json()
+    assert (await client.get("/api/v1/public/stores/lamp-shop")).json()["id"] == store["id"]
+
+    await client.patch(f"/api/v1/stores/{store['id']}", json={"name": "Light Shop"}, headers=headers)
+    assert (await client.get("/api/v1/public/stores/lamp-shop")).status_code == 404
+    assert (await client.get("/api/v1/public/stores/light-shop")).status_code == 200
+
+    await client.patch(f"/api/v1/stores/{store['id']}", json={"status": "paused"}, headers=headers)
+    assert (await client.get("/api/v1/public/stores/light-shop")).status_code == 404
+    assert (await client.get("/api/v1/public/stores/light-shop/products")).status_code == 404
+
+    await client.patch(f"/api/v1/stores/{store['id']}", json={"status": "active"}, headers=headers)
+    await client.delete(f"/api/v1/stores/{store['id']}", headers=headers)
+    assert (await client.get("/api/v1/public/stores/light-shop")).status_code == 404
+
+
+async def test_route_changes_are_published_on_commit(db):
+    """A rename reaches the table when it commits, never on rollback."""
+    store = await _store(db, "committed-slug")
+    store_id = store.id
+    await db.commit()
+    assert (await resolve_slug(db, "committed-slug")).id == store_id
+
+    store.slug = "rolled-back-slug"
+    await db.flush()
+    publish_store_route(db, store)
+    assert storefront_routing_service._slugs.get("committed-slug") == store_id
+    await db.rollback()
+    assert "rolled-back-slug" not in storefront_routing_service._slugs
+
+    store = await db.get(Store, store_id)
+    store.slug = "renamed-slug"
+    await db.flush()
+    publish_store_route(db, store)
+    await db.commit()
+    assert storefront_routing_service._slugs.get("renamed-slug") == store_id
+    assert "committed-slug" not in storefront_routing_service._slugs
+
+
+async def test_known_and_unknown_slugs_answered_from_memory(db):
+    """After the table loads, hits and repeated misses cost no query."""
+    store = await _store(db, "preloaded")
+    with patch.object(db, "execute", wraps=db.execute) as execute:
+        assert (await resolve_slug(db, "preloaded")).id == store.id
+        loads = execute.call_count
+
+        assert (await resolve_slug(db, "preloaded")).id == store.id
+        assert await resolve_slug(db, "wp-admin") is None
+        assert await resolve_slug(db, "wp-admin") is None
+        assert execute.call_count == loads + 1
+
+
+async def test_store_missing_from_table_is_found_and_added(db):
+    """A store the table has not heard of is looked up and remembered."""
+    await resolve_slug(db, "anything")
+    late = await _store(db, "late-arrival")
+    assert (await resolve_slug(db, "late-arrival")).id == late.id
+    assert "late-arrival" in storefront_routing_service._slugs
+
+
+async def test_custom_domain_routes_once_verified(client):
+    """Only verified domains resolve through the Host header."""
+    headers = await _owner(client)
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Domain Shop", "niche": "home"}, headers=headers)
+    ).json()
+    await client.post(
+        f"/api/v1/stores/{store['id']}/domain", json={"domain": "shop.example.com"}, headers=headers
+    )
+    host = {"Host": "shop.example.com"}
+    assert (await client.get("/api/v1/public/host", headers=host)).status_code == 404
+
+    await client.post(f"/api/v1/stores/{store['id']}/domain/verify", headers=headers)
+    assert lookup_host("Shop.Example.com:443").id == uuid.UUID(store["id"])
+    resp = await client.get(
+        "/api/v1/public/host", headers={"X-Forwarded-Host": "shop.example.com"}
+    )
+    assert resp.json()["slug"] == "domain-shop"
+
+    await client.delete(f"/api/v1/stores/{store['id']}/domain", headers=headers)
+    assert (await client.get("/api/v1/public/host", headers=host)).status_code == 404
+
+
+async def test_unknown_hosts_hit_the_database_once(db):
+    """Scanner hosts are remembered as misses."""
+    with patch.object(db, "execute", wraps=db.execute) as execute:
+        assert await resolve_host(db, "random.invalid") is None
+        queries = execute.call_count
+        for _ in range(5):
+            assert await resolve_host(db, "RANDOM.invalid.") is None
+        assert execute.call_count == queries
+
+
+async def test_subscribed_table_answers_misses_without_queries(db):
+    """With the subscriber connected, unknown slugs and hosts cost nothing."""
+    await _store(db, "complete")
+    with patch.object(storefront_routing_service, "_subscribed", True):
+        await resolve_slug(db, "complete")
+        with patch.object(db, "execute", wraps=db.execute) as execute:
+            for n in range(20):
+                assert await resolve_slug(db, f"probe-{n}") is None
+                assert await resolve_host(db, f"probe-{n}.invalid") is None
+            assert execute.call_count == 0
+
+
+async def test_change_during_load_survives_it(db):
+    """A change applied while the table loads is replayed on the new table."""
+    store = await _store(db, "old-name")
+    message = {
+        "type": "store", "id": str(store.id), "slug": "new-name",
+        "status": StoreStatus.active.value, "user_id": str(store.user_id),
+        "name": store.name, "default_currency": "USD",
+    }
+    execute = db.execute
+
+    async def execute_then_publish(*args, **kwargs):
+        result = await execute(*args, **kwargs)
+        storefront_routing_service.apply_route_change(message)
+        return result
+
+    with patch.object(db, "execute", side_effect=execute_then_publish):
+        await storefront_routing_service.load_routes(db)
+    assert storefront_routing_service._slugs.get("new-name") == store.id
+    assert "old-name" not in storefront_routing_service._slugs
+
+
+async def test_listener_applies_changes_from_other_processes(db):
+    """A message on the channel updates this process's table."""
+    store = await _store(db, "before-rename")
+    await resolve_slug(db, "before-rename")
+
+    listener = asyncio.create_task(listen_for_route_changes())
+    try:
+        message = {
+            "type": "store", "id": str(store.id), "slug": "after-rename",
+            "status": StoreStatus.active.value, "user_id": str(store.user_id),
+            "name": store.name, "default_currency": "USD",
+        }
+        for _ in range(50):
+            await get_redis().publish(ROUTES_CHANNEL, json.dumps(message))
+            await asyncio.sleep(0.05)
+            if "after-rename" in storefront_routing_service._slugs:
+                break
+        assert storefront_routing_service._slugs.get("after-rename") == store.id
+        assert "before-rename" not in storefront_routing_service._slugs
+    finally:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
@@ -0,0 +1,287 @@
+"""Tests for the supplier catalog sync.
+
+Covers ``supplier_sync_service`` (platform detection, payload hashing,
+bounded concurrent lookups, ``sync_supplier_links_sync``) and the
+``sync_supplier_catalogs`` Beat task.
+
+**For Developers:**
+    The demo-mode ``AliExpressClient`` / ``CJDropshipClient`` serve as the
+    supplier double; a supplier change is simulated by editing the demo
+    catalog of the client handed out by a patched ``get_supplier_client``.
+    The sync runs through ``db.run_sync``; because the test event loop is
+    already running there, ``run_async`` is patched to run the lookups on
+    a fresh loop in a helper thread.
+
+**For QA Engineers:**
+    - The first sync applies the supplier's cost, the repriced product
+      price and the variant stock; a second sync without supplier changes
+      writes nothing.
+    - Non-primary links only update the link's cost.
+    - Inactive suppliers and unsupported platforms are left alone.
+    - One ``product.updated`` webhook is sent per store per run.
+"""
+
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from ecomm_suppliers import AliExpressClient
+
+from app.config import settings
+from app.models.product import Product, ProductVariant
+from app.models.store import Store
+from app.models.supplier import ProductSupplier, Supplier, SupplierStatus
+from app.models.user import User
+from app.services import supplier_sync_service
+from app.services.supplier_sync_service import (
+    fetch_supplier_products,
+    payload_hash,
+    supplier_platform,
+    sync_supplier_links_sync,
+)
+
+EARBUDS_ID = "1005006841237901"
+EARBUDS_URL = f"https://www.aliexpress.com/item/{EARBUDS_ID}.html"
+CJ_URL = "https://cjdropshipping.com/product/CJ-ELEC-2891734"
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Sync Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _linked_product(
+    db, store, url=EARBUDS_URL, is_primary=True, status=SupplierStatus.active,
+    price="30.00", cost="10.00", skus=("AE-TWS-BK", "AE-TWS-WH"), supplier_sku=None,
+) -> tuple[Product, ProductSupplier]:
+    product = Product(
+        store_id=store.id, title="Earbuds", slug=f"p-{uuid.uuid4().hex[:8]}",
+        price=Decimal(price), cost=Decimal(cost),
+    )
+    supplier = Supplier(store_id=store.id, name="Supplier", status=status)
+    db.add_all([product, supplier])
+    await db.flush()
+    db.add_all([
+        ProductVariant(product_id=product.id, name=sku, sku=sku, inventory_count=1)
+        for sku in skus
+    ])
+    link = ProductSupplier(
+        product_id=product.id, supplier_id=supplier.id, supplier_url=url,
+        supplier_sku=supplier_sku, supplier_cost=Decimal(cost), is_primary=is_primary,
+    )
+    db.add(link)
+    await db.flush()
+    return product, link
+
+
+def _run_in_thread(coro):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def _sync(db, client=None, **kwargs) -> dict:
+    with patch.object(supplier_sync_service, "run_async", _run_in_thread):
+        if client is None:
+            result = await db.run_sync(lambda s: sync_supplier_links_sync(s, **kwargs))
+        else:
+            with patch.object(supplier_sync_service, "get_supplier_client", return_value=client):
+                result = await db.run_sync(lambda s: sync_supplier_links_sync(s, **kwargs))
+    return result
+
+
+async def _stock(db, product) -> dict[str, int]:
+    await db.refresh(product, ["variants"])
+    return {v.sku: v.inventory_count for v in product.variants}
+
+
+def test_supplier_platform_from_url():
+    """Platforms are recognised by host; other hosts are unsupported."""
+    assert supplier_platform(EARBUDS_URL) == "aliexpress"
+    assert supplier_platform("https://aliexpress.us/item/1.html") == "aliexpress"
+    assert supplier_platform(CJ_URL) == "cjdropship"
+    assert supplier_platform("https://example.com/aliexpress/item/1.html") is None
+    assert supplier_platform(None) is None
+
+
+async def test_payload_hash_covers_price_and_stock_only():
+    """Refetches hash equally; a stock change gives a new hash."""
+    client = AliExpressClient()
+    first = await client.get_product(EARBUDS_ID)
+    second = await client.get_product(EARBUDS_ID)
+    assert payload_hash(first) == payload_hash(second)
+
+    renamed = second.model_copy(update={"title": "Renamed"})
+    assert payload_hash(first) == payload_hash(renamed)
+    variants = [second.variants[0].model_copy(update={"stock": 0}), *second.variants[1:]]
+    assert payload_hash(first) != payload_hash(second.model_copy(update={"variants": variants}))
+
+
+async def test_lookups_are_bounded_per_platform():
+    """At most ``supplier_sync_concurrency`` lookups run per platform."""
+    in_flight = peak = 0
+
+    class SlowClient(AliExpressClient):
+        async def get_product_by_url(self, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return await super().get_product_by_url(url)
+
+    ids = [p["id"] for p in AliExpressClient()._demo_products[:6]]
+    urls = [f"https://www.aliexpress.com/item/{i}.html" for i in ids]
+    with patch.object(supplier_sync_service, "get_supplier_client", return_value=SlowClient()), \
+            patch.object(settings, "supplier_sync_concurrency", 2):
+        started = time.monotonic()
+        fetched = await fetch_supplier_products(
+            {"aliexpress": urls + ["https://www.aliexpress.com/item/0.html"]}
+        )
+        elapsed = time.monotonic() - started
+    assert sorted(fetched) == sorted(urls)
+    assert peak == 2
+    assert elapsed >= 0.2
+
+
+async def test_sync_applies_cost_price_and_stock(db):
+    """The first sync applies the supplier data; a second one skips it."""
+    store = await _store(db)
+    product, link = await _linked_product(db, store)
+
+    result = await _sync(db)
+    assert result["updated"] == 1
+    assert result["changed"] == {str(store.id): [str(product.id)]}
+    assert result["last_link_id"] is None
+
+    await db.refresh(link)
+    await db.refresh(product)
+    assert link.supplier_cost == Decimal("18.74")
+    assert link.sync_hash is not None
+    assert product.cost == Decimal("18.74")
+    # 200% markup over the old cost is kept, then charm-priced: 56.22 -> 55.97
+    assert product.price == Decimal("55.97")
+    assert await _stock(db, product) == {"AE-TWS-BK": 4832, "AE-TWS-WH": 3291}
+
+    again = await _sync(db)
+    assert again["unchanged"] == 1
+    assert again["updated"] == 0
+    assert again["changed"] == {}
+
+
+async def test_sync_applies_supplier_changes(db):
+    """A stock-only change updates stock and keeps the price."""
+    store = await _store(db)
+    product, _ = await _linked_product(db, store)
+    await _sync(db)
+
+    client = AliExpressClient()
+    earbuds = next(p for p in client._demo_products if p["id"] == EARBUDS_ID)
+    earbuds["variants"][0]["stock"] = 0
+    result = await _sync(db, client=client)
+    assert result["updated"] == 1
+    assert result["changed"] == {str(store.id): [str(product.id)]}
+
+    await db.refresh(product)
+    assert product.price == Decimal("55.97")
+    assert (await _stock(db, product))["AE-TWS-BK"] == 0
+
+    earbuds["price"] = "20.00"
+    await _sync(db, client=client)
+    await db.refresh(product)
+    assert product.cost == Decimal("20.00")
+    assert product.price == Decimal("58.97")
+
+
+async def test_secondary_links_only_update_their_cost(db):
+    """A non-primary link gets its variant's cost; the product is untouched."""
+    store = await _store(db)
+    product, link = await _linked_product(
+        db, store, is_primary=False, supplier_sku="AE-TWS-NB"
+    )
+
+    result = await _sync(db)
+    assert result["updated"] == 1
+    assert result["changed"] == {}
+    await db.refresh(link)
+    await db.refresh(product)
+    assert link.supplier_cost == Decimal("19.49")
+    assert product.cost == Decimal("10.00")
+    assert product.price == Decimal("30.00")
+    assert set((await _stock(db, product)).values()) == {1}
+
+
+async def test_sync_skips_inactive_and_unsupported_links(db):
+    """Inactive suppliers are not synced; unknown platforms are skipped."""
+    store = await _store(db)
+    await _linked_product(db, store, status=SupplierStatus.inactive)
+    await _linked_product(db, store, url="https://supplier.example.com/item/1")
+    product, _ = await _linked_product(db, store, url=CJ_URL, skus=())
+
+    result = await _sync(db)
+    assert result["checked"] == 2
+    assert result["skipped"] == 1
+    assert result["updated"] == 1
+    assert result["changed"] == {str(store.id): [str(product.id)]}
+
+
+async def test_sync_pages_by_link_id(db):
+    """Links are walked in keyset pages."""
+    store = await _store(db)
+    for _ in range(3):
+        await _linked_product(db, store)
+
+    first = await _sync(db, limit=2)
+    assert first["checked"] == 2
+    assert first["last_link_id"] is not None
+    second = await _sync(db, limit=2, after_link_id=first["last_link_id"])
+    assert second["checked"] == 1
+    assert second["last_link_id"] is None
+
+
+async def test_failed_lookups_are_retried(db):
+    """A link whose lookup fails keeps its hash for the next run."""
+    store = await _store(db)
+    _, link = await _linked_product(db, store, url="https://www.aliexpress.com/item/1.html")
+
+    result = await _sync(db)
+    assert result["failed"] == 1
+    await db.refresh(link)
+    assert link.sync_hash is None
+
+
+@patch("app.tasks.webhook_tasks.dispatch_webhook_event")
+@patch("app.services.supplier_sync_service.sync_supplier_links_sync")
+@patch("app.tasks.supplier_tasks.SyncSessionFactory")
+def test_sync_task_sends_one_event_per_store(mock_factory, mock_sync, mock_dispatch):
+    """Pages are committed one by one; events are aggregated per store."""
+    from app.tasks.supplier_tasks import sync_supplier_catalogs
+
+    session = MagicMock()
+    mock_factory.return_value = session
+    page = {"checked": 2, "updated": 2, "unchanged": 0, "failed": 0, "skipped": 0}
+    cursor = uuid.uuid4()
+    mock_sync.side_effect = [
+        page | {"changed": {"s1": ["p1"], "s2": ["p3"]}, "last_link_id": cursor},
+        page | {"changed": {"s1": ["p2", "p1"]}, "last_link_id": None},
+    ]
+
+    result = sync_supplier_catalogs()
+    assert result["checked"] == 4
+    assert result["batches"] == 2
+    assert result["stores"] == 2
+    assert session.commit.call_count == 2
+    assert mock_sync.call_args_list[1].kwargs["after_link_id"] == cursor
+
+    events = {call.args[0]: call.args[2] for call in mock_dispatch.delay.call_args_list}
+    assert mock_dispatch.delay.call_count == 2
+    assert events["s1"]["product_ids"] == ["p1", "p2"]
+    assert events["s1"]["operation"] == "supplier_sync"
+    assert events["s2"]["count"] == 1
@@ -0,0 +1,195 @@
+"""Tests for the batched carrier tracking poller.
+
+Covers ``tracking_service.poll_shipments_sync`` (keyset pages, per-carrier
+bulk lookups, one bulk status update) and the batched delivery side
+effects (``create_delivery_notifications_sync`` and
+``send_delivery_events_sync``).
+
+**For Developers:**
+    ``get_carrier_tracker`` is patched to hand out one ``MockCarrierTracker``
+    per carrier so tests can count bulk calls. The service runs through
+    ``db.run_sync``; because the test event loop is already running there,
+    ``run_async`` is patched to run the lookups on a fresh loop in a
+    helper thread.
+
+**For QA Engineers:**
+    - Shipments are looked up per carrier in chunks of the carrier's
+      ``max_batch_size``.
+    - Orders without a tracking number, recent shipments and orders in
+      other statuses are not polled.
+    - A failing carrier does not hold back the others.
+    - Delivery notifications, webhooks and emails are produced for a whole
+      page at once.
+"""
+
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from app.models.notification import Notification
+from app.models.order import Order, OrderStatus
+from app.models.store import Store
+from app.models.user import User
+from app.models.webhook import StoreWebhook, WebhookDelivery
+from app.services import tracking_service
+from app.services.tracking import MockCarrierTracker
+from app.services.webhook_delivery_service import DeliveryResult
+
+
+async def _store(db) -> Store:
+    user = User(email=f"{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", is_active=True)
+    db.add(user)
+    await db.flush()
+    store = Store(user_id=user.id, name="Tracking Store", slug=f"s-{uuid.uuid4().hex[:8]}", niche="gear")
+    db.add(store)
+    await db.flush()
+    return store
+
+
+async def _shipment(db, store, carrier="UPS", days_ago=10, tracking=True, status=OrderStatus.shipped):
+    order = Order(
+        store_id=store.id,
+        customer_email=f"{uuid.uuid4().hex[:8]}@example.com",
+        status=status,
+        total=Decimal("20.00"),
+        carrier=carrier,
+        tracking_number=f"TRK-{uuid.uuid4().hex[:10]}" if tracking else None,
+        shipped_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+    db.add(order)
+    await db.flush()
+    return order
+
+
+def _run_in_thread(coro):
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def _trackers(**trackers):
+    return patch.object(
+        tracking_service, "get_carrier_tracker", side_effect=lambda carrier: trackers[carrier]
+    )
+
+
+async def _poll(db, **kwargs) -> dict:
+    with patch.object(tracking_service, "run_async", _run_in_thread):
+        return await db.run_sync(lambda s: tracking_service.poll_shipments_sync(s, **kwargs))
+
+
+async def test_poll_groups_lookups_per_carrier(db):
+    """Each carrier gets bulk calls; deliveries land in one update."""
+    store = await _store(db)
+    ups = [await _shipment(db, store, "UPS") for _ in range(3)]
+    dhl = await _shipment(db, store, "DHL")
+    skipped = [
+        await _shipment(db, store, "UPS", tracking=False),
+        await _shipment(db, store, "UPS", days_ago=1),
+        await _shipment(db, store, "UPS", status=OrderStatus.paid),
+    ]
+    ups_tracker = MockCarrierTracker(delivery_rate=1.0)
+    ups_tracker.max_batch_size = 2
+    dhl_tracker = MockCarrierTracker(delivery_rate=0.0)
+
+    with _trackers(UPS=ups_tracker, DHL=dhl_tracker):
+        page = await _poll(db)
+
+    assert page["checked"] == 4
+    assert page["last_order_id"] is None
+    assert sorted(page["delivered"]) == sorted(str(o.id) for o in ups)
+    assert [len(call) for call in ups_tracker.calls] == [2, 1]
+    assert dhl_tracker.calls == [[dhl.tracking_number]]
+
+    for order in ups + [dhl] + skipped:
+        await db.refresh(order)
+    assert all(o.status == OrderStatus.delivered and o.delivered_at for o in ups)
+    assert dhl.status == OrderStatus.shipped
+    assert [o.status for o in skipped] == [
+        OrderStatus.shipped, OrderStatus.shipped, OrderStatus.paid,
+    ]
+
+
+async def test_poll_pages_with_keyset_cursor(db):
+    """Pages continue after the last order id until the book is exhausted."""
+    store = await _store(db)
+    orders = [await _shipment(db, store) for _ in range(5)]
+    tracker = MockCarrierTracker(delivery_rate=0.0)
+
+    seen, cursor = [], None
+    with _trackers(UPS=tracker):
+        while True:
+            page = await _poll(db, after_order_id=cursor, limit=2)
+            seen.append(page["checked"])
+            cursor = page["last_order_id"]
+            if cursor is None:
+                break
+
+    assert seen == [2, 2, 1]
+    polled = [number for call in tracker.calls for number in call]
+    assert sorted(polled) == sorted(o.tracking_number for o in orders)
+
+
+async def test_failing_carrier_does_not_block_others(db):
+    """A carrier outage leaves its shipments for the next poll."""
+
+    class Down(MockCarrierTracker):
+        async def track_many(self, tracking_numbers):
+            raise RuntimeError("carrier unavailable")
+
+    store = await _store(db)
+    down = await _shipment(db, store, "FedEx")
+    up = await _shipment(db, store, "UPS")
+
+    with _trackers(FedEx=Down(), UPS=MockCarrierTracker(delivery_rate=1.0)):
+        page = await _poll(db)
+
+    assert page["delivered"] == [str(up.id)]
+    await db.refresh(down)
+    assert down.status == OrderStatus.shipped
+
+
+async def test_delivery_side_effects_are_batched(db):
+    """One notification, one webhook attempt and one email per order."""
+    store = await _store(db)
+    other = await _store(db)
+    orders = [await _shipment(db, store) for _ in range(2)] + [await _shipment(db, other)]
+    webhook = StoreWebhook(
+        store_id=store.id, url="https://hooks.example.com/x", secret="s", events=["order.delivered"],
+    )
+    db.add(webhook)
+    await db.flush()
+
+    def _deliver(attempts):
+        return [DeliveryResult(a, 200, "ok", True) for a in attempts]
+
+    with patch("app.services.webhook_delivery_service.deliver_all", side_effect=_deliver) as deliver, \
+            patch("app.services.email_service.email_service.send_email_sync") as send:
+        deliveries, notifications = await db.run_sync(
+            lambda s: tracking_service.create_delivery_notifications_sync(
+                s, [o.id for o in orders]
+            )
+        )
+        deliver.assert_not_called()
+        counts = await db.run_sync(
+            lambda s: tracking_service.send_delivery_events_sync(s, deliveries)
+        )
+
+    assert counts == {"webhooks": 2, "emails": 3}
+    assert {n.metadata_["order_id"] for n in notifications} == {str(o.id) for o in orders}
+    deliver.assert_called_once()
+    assert send.call_count == 3
+    assert (await db.execute(
+        select(func.count()).select_from(Notification).where(
+            Notification.store_id.in_([store.id, other.id])
+        )
+    )).scalar_one() == 3
+    assert (await db.execute(
+        select(func.count()).select_from(WebhookDelivery).where(
+            WebhookDelivery.webhook_id == webhook.id
+        )
+    )).scalar_one() == 2
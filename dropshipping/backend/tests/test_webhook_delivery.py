@@ -0,0 +1,342 @@
+"""Tests for the concurrent webhook delivery engine.
+
+Covers signed concurrent delivery against a local stub receiver, the
+per-host concurrency cap, backoff scheduling, the circuit breaker, the
+SQL subscription filter, and the retry sweep.
+
+**For Developers:**
+    Network tests are synchronous and post to a ``ThreadingHTTPServer``
+    on localhost. Database tests run the sync service functions through
+    ``db.run_sync`` with ``deliver_all`` patched, because the test event
+    loop is already running there.
+
+**For QA Engineers:**
+    - Deliveries carry a verifiable ``X-Webhook-Signature`` header.
+    - No more than ``webhook_max_per_host`` requests reach one host at once.
+    - Retry delays double per attempt and are capped.
+    - Tripping the breaker disables the webhook and cancels its retries.
+    - Concurrent dispatches to one webhook never lose failure counts.
+    - Claimed retries are leased, so concurrent sweeps skip them.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+
+from app.config import settings
+from app.models.webhook import StoreWebhook, WebhookDelivery
+from app.services import webhook_delivery_service
+from app.services.webhook_delivery_service import (
+    DeliveryAttempt,
+    DeliveryResult,
+    deliver_all,
+    record_delivery_results,
+    retry_delay,
+)
+
+
+# ---------------------------------------------------------------------------
+# Stub receiver
+# ---------------------------------------------------------------------------
+
+
+class _Receiver:
+    """Shared state of the stub receiver (requests seen, concurrency)."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def _make_handler(receiver: _Receiver):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            with receiver.lock:
+                receiver.in_flight += 1
+                receiver.max_in_flight = max(receiver.max_in_flight, receiver.in_flight)
+                receiver.requests.append({"path": self.path, "headers": dict(self.headers), "body": body})
+            if self.path == "/slow":
+                time.sleep(0.2)
+            with receiver.lock:
+                receiver.in_flight -= 1
+            status = 500 if self.path == "/fail" else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def receiver():
+    """Run a stub webhook receiver on a free localhost port."""
+    state = _Receiver()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def _attempt(url: str, attempt: int = 1, webhook_id: uuid.UUID | None = None) -> DeliveryAttempt:
+    return DeliveryAttempt(
+        webhook_id=webhook_id or uuid.uuid4(),
+        url=url,
+        secret="whsec_test",
+        event="order.paid",
+        payload={"event": "order.paid", "data": {"order": 1}},
+        attempt=attempt,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+def test_deliver_all_signs_and_reports_results(receiver):
+    """Each attempt yields a result; requests are signed and tagged."""
+    results = deliver_all([
+        _attempt(f"{receiver.base_url}/ok", attempt=2),
+        _attempt(f"{receiver.base_url}/fail"),
+    ])
+
+    assert [r.response_status for r in results] == [200, 500]
+    assert [r.success for r in results] == [True, False]
+
+    ok = next(r for r in receiver.requests if r["path"] == "/ok")
+    expected = hmac.new(b"whsec_test", ok["body"], hashlib.sha256).hexdigest()
+    assert ok["headers"]["X-Webhook-Signature"] == f"sha256={expected}"
+    assert ok["headers"]["X-Webhook-Event"] == "order.paid"
+    assert ok["headers"]["X-Webhook-Attempt"] == "2"
+
+
+def test_deliver_all_reports_transport_errors():
+    """Unreachable endpoints become failed results instead of raising."""
+    (result,) = deliver_all([_attempt("http://127.0.0.1:1/hook")])
+    assert result.success is False
+    assert result.response_status is None
+    assert result.response_body
+
+
+def test_deliver_all_bounds_concurrency_per_host(receiver):
+    """No more than ``webhook_max_per_host`` requests hit one host at once."""
+    with patch.object(settings, "webhook_max_per_host", 2):
+        results = deliver_all([_attempt(f"{receiver.base_url}/slow") for _ in range(6)])
+
+    assert all(r.success for r in results)
+    assert receiver.max_in_flight == 2
+
+
+def test_deliver_all_sends_concurrently(receiver):
+    """Slow endpoints are delivered in parallel, not one after another."""
+    with patch.object(settings, "webhook_max_per_host", 8):
+        started = time.monotonic()
+        deliver_all([_attempt(f"{receiver.base_url}/slow") for _ in range(8)])
+        elapsed = time.monotonic() - started
+
+    assert receiver.max_in_flight > 1
+    assert elapsed < 8 * 0.2
+
+
+def test_retry_delay_backs_off_exponentially():
+    """Delays double per attempt (±10% jitter) and are capped."""
+    base = settings.webhook_retry_base_seconds
+    for attempt in (1, 2, 3):
+        seconds = retry_delay(attempt).total_seconds()
+        assert base * 2 ** (attempt - 1) * 0.9 <= seconds <= base * 2 ** (attempt - 1) * 1.1
+    assert retry_delay(30).total_seconds() <= settings.webhook_retry_max_seconds * 1.1
+
+
+# ---------------------------------------------------------------------------
+# Database
+# ---------------------------------------------------------------------------
+
+
+async def _create_webhooks(client, events_by_url: dict[str, list[str]]) -> tuple[uuid.UUID, list[dict]]:
+    """Register an owner, create a store and webhooks; return the store id."""
+    resp = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "hooks@example.com", "password": "securepass123"},
+    )
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+    store = (
+        await client.post("/api/v1/stores", json={"name": "Hook Store", "niche": "tech"}, headers=headers)
+    ).json()
+    hooks = []
+    for url, events in events_by_url.items():
+        resp = await client.post(
+            f"/api/v1/stores/{store['id']}/webhooks",
+            json={"url": url, "events": events},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        hooks.append(resp.json())
+    return uuid.UUID(store["id"]), hooks
+
+
+def _fail_all(attempts):
+    return [DeliveryResult(a, 503, "busy", False) for a in attempts]
+
+
+def _succeed_all(attempts):
+    return [DeliveryResult(a, 200, "ok", True) for a in attempts]
+
+
+async def test_subscribed_webhooks_filters_in_sql(client, db):
+    """Only active webhooks subscribed to the event are loaded."""
+    store_id, hooks = await _create_webhooks(client, {
+        "https://a.example.com/hook": ["order.paid", "order.created"],
+        "https://b.example.com/hook": ["product.created"],
+    })
+
+    matching = await db.run_sync(
+        lambda s: webhook_delivery_service.subscribed_webhooks_sync(s, store_id, "order.paid")
+    )
+    assert [str(w.id) for w in matching] == [hooks[0]["id"]]
+
+
+async def test_failed_delivery_is_retried_by_sweep(client, db):
+    """A failed delivery is scheduled, claimed by the sweep, and resent."""
+    store_id, _ = await _create_webhooks(client, {"https://a.example.com/hook": ["order.paid"]})
+
+    def dispatch(session):
+        webhooks = webhook_delivery_service.subscribed_webhooks_sync(session, store_id, "order.paid")
+        attempts = [_attempt(w.url, webhook_id=w.id) for w in webhooks]
+        record_delivery_results(session, _fail_all(attempts))
+
+    await db.run_sync(dispatch)
+    await db.commit()
+
+    first = (await db.execute(select(WebhookDelivery))).scalar_one()
+    assert first.attempt == 1
+    assert first.next_retry_at is not None
+
+    # Not due yet: nothing is claimed.
+    assert await db.run_sync(webhook_delivery_service.claim_due_retries_sync) == {}
+
+    first.next_retry_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    await db.commit()
+    claimed = await db.run_sync(webhook_delivery_service.claim_due_retries_sync)
+    await db.commit()
+    with patch.object(webhook_delivery_service, "deliver_all", side_effect=_succeed_all) as sent:
+        counts = await db.run_sync(
+            lambda s: webhook_delivery_service.resend_claimed_retries_sync(s, claimed)
+        )
+    await db.commit()
+
+    assert counts == {"retried": 1, "success_count": 1, "failure_count": 0}
+    assert sent.call_args.args[0][0].attempt == 2
+    assert sent.call_args.args[0][0].payload == first.payload
+
+    db.expire_all()
+    rows = (
+        await db.execute(select(WebhookDelivery).order_by(WebhookDelivery.attempt))
+    ).scalars().all()
+    assert [(r.attempt, r.success, r.next_retry_at) for r in rows] == [
+        (1, False, None),
+        (2, True, None),
+    ]
+
+
+async def test_last_attempt_is_not_rescheduled(client, db):
+    """Failures on the final attempt give up instead of scheduling again."""
+    store_id, _ = await _create_webhooks(client, {"https://a.example.com/hook": ["order.paid"]})
+
+    def dispatch(session):
+        (webhook,) = webhook_delivery_service.subscribed_webhooks_sync(session, store_id, "order.paid")
+        attempt = _attempt(webhook.url, attempt=settings.webhook_max_attempts, webhook_id=webhook.id)
+        record_delivery_results(session, _fail_all([attempt]))
+
+    await db.run_sync(dispatch)
+    await db.commit()
+
+    row = (await db.execute(select(WebhookDelivery))).scalar_one()
+    assert row.success is False
+    assert row.next_retry_at is None
+
+
+async def test_circuit_breaker_disables_and_cancels_retries(client, db):
+    """Reaching the failure threshold disables the webhook and its retries."""
+    store_id, _ = await _create_webhooks(client, {"https://a.example.com/hook": ["order.paid"]})
+    threshold = settings.webhook_circuit_breaker_threshold
+
+    def fail_until_tripped(session):
+        (webhook,) = webhook_delivery_service.subscribed_webhooks_sync(session, store_id, "order.paid")
+        for _ in range(threshold):
+            attempt = _attempt(webhook.url, webhook_id=webhook.id)
+            record_delivery_results(session, _fail_all([attempt]))
+
+    await db.run_sync(fail_until_tripped)
+    await db.commit()
+
+    webhook = (await db.execute(select(StoreWebhook))).scalar_one()
+    await db.refresh(webhook)
+    assert webhook.is_active is False
+    assert webhook.failure_count == threshold
+
+    rows = (await db.execute(select(WebhookDelivery))).scalars().all()
+    assert len(rows) == threshold
+    assert all(r.next_retry_at is None for r in rows)
+
+
+async def test_claimed_retries_are_leased(client, db):
+    """A committed claim hides the retries from other sweeps until it expires."""
+    store_id, _ = await _create_webhooks(client, {"https://a.example.com/hook": ["order.paid"]})
+
+    def dispatch(session):
+        (webhook,) = webhook_delivery_service.subscribed_webhooks_sync(session, store_id, "order.paid")
+        record_delivery_results(
+            session, _fail_all([_attempt(webhook.url, webhook_id=webhook.id)]),
+            now=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+
+    await db.run_sync(dispatch)
+    await db.commit()
+
+    claimed = await db.run_sync(webhook_delivery_service.claim_due_retries_sync)
+    await db.commit()
+    assert [a.attempt for a in claimed.values()] == [2]
+    assert await db.run_sync(webhook_delivery_service.claim_due_retries_sync) == {}
+
+    row = (await db.execute(select(WebhookDelivery))).scalar_one()
+    await db.refresh(row)
+    lease = row.next_retry_at - datetime.now(timezone.utc)
+    assert lease > timedelta(seconds=settings.webhook_retry_claim_seconds - 60)
+
+
+async def test_concurrent_failures_are_all_counted(client, db, session_factory):
+    """Parallel dispatches to one webhook each add their failure."""
+    store_id, hooks = await _create_webhooks(client, {"https://a.example.com/hook": ["order.paid"]})
+    webhook_id = uuid.UUID(hooks[0]["id"])
+    attempt = _attempt("https://a.example.com/hook", webhook_id=webhook_id)
+
+    async def dispatch():
+        async with session_factory() as session:
+            await session.run_sync(lambda s: record_delivery_results(s, _fail_all([attempt])))
+            await session.commit()
+
+    await asyncio.gather(*(dispatch() for _ in range(6)))
+
+    webhook = (await db.execute(select(StoreWebhook))).scalar_one()
+    assert webhook.failure_count == 6
+    assert webhook.is_active is True
@@ -1,155 +1,212 @@
 """Tests for webhook delivery Celery tasks.
 
-Validates that ``dispatch_webhook_event`` correctly matches webhooks,
-sends HTTP POST requests, records deliveries, and handles failures.
+Validates that ``dispatch_webhook_event`` hands matching webhooks to the
+delivery engine, records deliveries, and handles failures, and that
+``retry_webhook_deliveries`` commits the retry sweep.
 
 **For Developers:**
-    Tests mock ``SyncSessionFactory`` and ``httpx.Client`` to avoid real
-    HTTP calls and database access.
+    Tests mock ``SyncSessionFactory`` and the delivery engine's network
+    and query functions to avoid real HTTP calls and database access.
+    The mocked session answers the ``failure_count`` update with the
+    counts the database would return (see ``_session``).
 
 **For QA Engineers:**
-    - Verifies event matching against webhook subscriptions.
-    - Verifies HMAC signature generation.
-    - Verifies failure counting and auto-disable after 10 failures.
-    - Verifies delivery recording in WebhookDelivery.
+    - Verifies that only subscribed webhooks are dispatched.
+    - Verifies failure counting, retry scheduling, and auto-disable after
+      10 failures.
+    - Verifies that all deliveries are recorded in one batched insert.
 """
 
 import uuid
 from unittest.mock import MagicMock, patch
 
-import pytest
+from app.services.webhook_delivery_service import DeliveryResult
+
+
+def _mock_webhook(failure_count: int = 0) -> MagicMock:
+    """Build a mock active StoreWebhook subscribed to ``order.paid``."""
+    webhook = MagicMock()
+    webhook.id = uuid.uuid4()
+    webhook.url = "https://example.com/webhook"
+    webhook.secret = "whsec_test123"
+    webhook.events = ["order.paid", "order.shipped"]
+    webhook.is_active = True
+    webhook.failure_count = failure_count
+    return webhook
+
+
+def _respond(status: int | None, body: str = ""):
+    """Build a fake ``deliver_all`` answering every attempt with ``status``."""
+    def fake_deliver_all(attempts):
+        return [
+            DeliveryResult(a, status, body, status is not None and 200 <= status < 300)
+            for a in attempts
+        ]
+    return fake_deliver_all
+
+
+def _session(*counts: tuple[uuid.UUID, int]) -> MagicMock:
+    """Build a mock session whose ``failure_count`` update returns ``counts``."""
+    session = MagicMock()
+    session.execute.return_value.all.return_value = list(counts)
+    return session
+
+
+def _inserted_rows(session: MagicMock) -> list[dict]:
+    """Return the rows passed to the batched WebhookDelivery insert."""
+    (rows,) = [c.args[1] for c in session.execute.call_args_list if len(c.args) > 1]
+    return rows
 
 
 class TestDispatchWebhookEvent:
     """Tests for the dispatch_webhook_event task."""
 
+    @patch("app.services.webhook_delivery_service.deliver_all")
+    @patch("app.services.webhook_delivery_service.subscribed_webhooks_sync")
     @patch("app.tasks.webhook_tasks.SyncSessionFactory")
-    def test_no_matching_webhooks(self, mock_factory):
+    def test_no_matching_webhooks(self, mock_factory, mock_subscribed, mock_deliver):
         """Returns zero counts when no webhooks match the event."""
         from app.tasks.webhook_tasks import dispatch_webhook_event
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = []
-        mock_factory.return_value = session
+        mock_factory.return_value = MagicMock()
+        mock_subscribed.return_value = []
 
         result = dispatch_webhook_event(str(uuid.uuid4()), "order.paid", {"test": True})
         assert result["delivery_count"] == 0
         assert result["success_count"] == 0
         assert result["failure_count"] == 0
+        mock_deliver.assert_not_called()
 
-    @patch("app.tasks.webhook_tasks.httpx")
+    @patch("app.services.webhook_delivery_service.deliver_all")
+    @patch("app.services.webhook_delivery_service.subscribed_webhooks_sync")
     @patch("app.tasks.webhook_tasks.SyncSessionFactory")
-    def test_successful_delivery(self, mock_factory, mock_httpx):
-        """Sends HTTP POST and records successful delivery."""
+    def test_successful_delivery(self, mock_factory, mock_subscribed, mock_deliver):
+        """Delivers the signed envelope and records a successful delivery."""
         from app.tasks.webhook_tasks import dispatch_webhook_event
 
-        mock_webhook = MagicMock()
-        mock_webhook.id = uuid.uuid4()
-        mock_webhook.url = "https://example.com/webhook"
-        mock_webhook.secret = "whsec_test123"
-        mock_webhook.events = ["order.paid", "order.shipped"]
-        mock_webhook.is_active = True
-        mock_webhook.failure_count = 0
-
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_webhook]
+        webhook = _mock_webhook()
+        session = _session((webhook.id, 0))
         mock_factory.return_value = session
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
-        mock_httpx.Client.return_value = mock_client
+        mock_subscribed.return_value = [webhook]
+        mock_deliver.side_effect = _respond(200, "OK")
 
         store_id = str(uuid.uuid4())
         result = dispatch_webhook_event(store_id, "order.paid", {"amount": "49.99"})
 
-        assert result["delivery_count"] == 1
-        assert result["success_count"] == 1
-        assert result["failure_count"] == 0
-        assert mock_webhook.failure_count == 0
-        session.add.assert_called_once()  # WebhookDelivery was added
+        assert result == {"delivery_count": 1, "success_count": 1, "failure_count": 0}
+        (attempt,) = mock_deliver.call_args.args[0]
+        assert attempt.url == webhook.url
+        assert attempt.attempt == 1
+        assert attempt.payload["store_id"] == store_id
+        assert attempt.payload["data"] == {"amount": "49.99"}
+        rows = _inserted_rows(session)
+        assert len(rows) == 1
+        assert rows[0]["success"] is True
+        assert rows[0]["next_retry_at"] is None
         session.commit.assert_called_once()
 
-    @patch("app.tasks.webhook_tasks.httpx")
+    @patch("app.services.webhook_delivery_service.deliver_all")
+    @patch("app.services.webhook_delivery_service.subscribed_webhooks_sync")
     @patch("app.tasks.webhook_tasks.SyncSessionFactory")
-    def test_failed_delivery_increments_count(self, mock_factory, mock_httpx):
-        """Increments failure_count on non-2xx response."""
+    def test_failed_delivery_schedules_retry(
+        self, mock_factory, mock_subscribed, mock_deliver
+    ):
+        """Increments failure_count and schedules a retry on non-2xx."""
         from app.tasks.webhook_tasks import dispatch_webhook_event
 
-        mock_webhook = MagicMock()
-        mock_webhook.id = uuid.uuid4()
-        mock_webhook.url = "https://example.com/webhook"
-        mock_webhook.secret = "whsec_test"
-        mock_webhook.events = ["order.paid"]
-        mock_webhook.is_active = True
-        mock_webhook.failure_count = 0
-
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_webhook]
+        webhook = _mock_webhook()
+        session = _session((webhook.id, 1))
         mock_factory.return_value = session
-
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
-        mock_httpx.Client.return_value = mock_client
+        mock_subscribed.return_value = [webhook]
+        mock_deliver.side_effect = _respond(500, "Internal Server Error")
 
         result = dispatch_webhook_event(str(uuid.uuid4()), "order.paid", {})
         assert result["failure_count"] == 1
-        assert mock_webhook.failure_count == 1
+        rows = _inserted_rows(session)
+        assert rows[0]["response_status"] == 500
+        assert rows[0]["next_retry_at"] is not None
 
-    @patch("app.tasks.webhook_tasks.httpx")
+    @patch("app.services.webhook_delivery_service.deliver_all")
+    @patch("app.services.webhook_delivery_service.subscribed_webhooks_sync")
     @patch("app.tasks.webhook_tasks.SyncSessionFactory")
-    def test_auto_disable_after_10_failures(self, mock_factory, mock_httpx):
+    def test_auto_disable_after_10_failures(
+        self, mock_factory, mock_subscribed, mock_deliver
+    ):
         """Webhook is disabled when failure_count reaches 10."""
         from app.tasks.webhook_tasks import dispatch_webhook_event
 
-        mock_webhook = MagicMock()
-        mock_webhook.id = uuid.uuid4()
-        mock_webhook.url = "https://example.com/webhook"
-        mock_webhook.secret = "whsec_test"
-        mock_webhook.events = ["order.paid"]
-        mock_webhook.is_active = True
-        mock_webhook.failure_count = 9  # Next failure = 10 → disable
-
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_webhook]
+        webhook = _mock_webhook(failure_count=9)
+        session = _session((webhook.id, 10))  # The update returns 10 → disabled
         mock_factory.return_value = session
+        mock_subscribed.return_value = [webhook]
+        mock_deliver.side_effect = _respond(None, "Connection refused")
+
+        dispatch_webhook_event(str(uuid.uuid4()), "order.paid", {})
+        assert _inserted_rows(session)[0]["next_retry_at"] is None
+        # Lock, counter update, insert, and the statement cancelling
+        # pending retries.
+        assert session.execute.call_count == 4
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.text = "Error"
-        mock_client = MagicMock()
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client.post.return_value = mock_response
-        mock_httpx.Client.return_value = mock_client
+    @patch("app.services.webhook_delivery_service.deliver_all")
+    @patch("app.services.webhook_delivery_service.subscribed_webhooks_sync")
+    @patch("app.tasks.webhook_tasks.SyncSessionFactory")
+    def test_endpoints_recorded_in_one_batch(
+        self, mock_factory, mock_subscribed, mock_deliver
+    ):
+        """All endpoints are delivered in one call and inserted together."""
+        from app.tasks.webhook_tasks import dispatch_webhook_event
+
+        webhooks = [_mock_webhook() for _ in range(5)]
+        session = _session(*((w.id, 0) for w in webhooks))
+        mock_factory.return_value = session
+        mock_subscribed.return_value = webhooks
+        mock_deliver.side_effect = _respond(204)
 
         result = dispatch_webhook_event(str(uuid.uuid4()), "order.paid", {})
-        assert mock_webhook.failure_count == 10
-        assert mock_webhook.is_active is False
+        assert result["delivery_count"] == 5
+        mock_deliver.assert_called_once()
+        assert len(mock_deliver.call_args.args[0]) == 5
+        # Lock, one counter update for all webhooks, one insert.
+        assert session.execute.call_count == 3
+        assert len(_inserted_rows(session)) == 5
 
+
+class TestRetryWebhookDeliveries:
+    """Tests for the retry_webhook_deliveries Beat task."""
+
+    @patch("app.services.webhook_delivery_service.resend_claimed_retries_sync")
+    @patch("app.services.webhook_delivery_service.claim_due_retries_sync")
     @patch("app.tasks.webhook_tasks.SyncSessionFactory")
-    def test_event_filtering(self, mock_factory):
-        """Only webhooks subscribed to the event are dispatched."""
-        from app.tasks.webhook_tasks import dispatch_webhook_event
+    def test_commits_claim_before_sending(self, mock_factory, mock_claim, mock_resend):
+        """The claim is committed before the retries are re-sent."""
+        from app.tasks.webhook_tasks import retry_webhook_deliveries
 
-        # Webhook subscribed to "product.created", not "order.paid"
-        mock_webhook = MagicMock()
-        mock_webhook.id = uuid.uuid4()
-        mock_webhook.events = ["product.created"]
-        mock_webhook.is_active = True
+        session = MagicMock()
+        mock_factory.return_value = session
+        mock_claim.return_value = {uuid.uuid4(): MagicMock()}
+        commits_before_send = []
+        mock_resend.side_effect = lambda s, claimed: (
+            commits_before_send.append(session.commit.call_count)
+            or {"retried": 3, "success_count": 2, "failure_count": 1}
+        )
+
+        assert retry_webhook_deliveries()["retried"] == 3
+        assert commits_before_send == [1]
+        assert session.commit.call_count == 2
+        session.close.assert_called_once()
+
+    @patch("app.services.webhook_delivery_service.resend_claimed_retries_sync")
+    @patch("app.services.webhook_delivery_service.claim_due_retries_sync")
+    @patch("app.tasks.webhook_tasks.SyncSessionFactory")
+    def test_rolls_back_on_error(self, mock_factory, mock_claim, mock_resend):
+        """A failing claim rolls back, leaving the retries due."""
+        from app.tasks.webhook_tasks import retry_webhook_deliveries
 
         session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [mock_webhook]
         mock_factory.return_value = session
+        mock_claim.side_effect = RuntimeError("db down")
 
-        result = dispatch_webhook_event(str(uuid.uuid4()), "order.paid", {})
-        assert result["delivery_count"] == 0
+        assert retry_webhook_deliveries() == {"error": "db down"}
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+        mock_resend.assert_not_called()
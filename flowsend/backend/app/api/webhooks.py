@@ -71,36 +71,14 @@ def _verify_platform_signature(payload_bytes: bytes, signature_header: str) -> b
     return hmac.compare_digest(computed, expected)
 
 
-@router.post("/platform-events")
-async def platform_event_webhook(request: Request):
-    """Receive platform lifecycle events from the dropshipping platform.
-
-    The platform bridge dispatches events (product.created, order.created,
-    etc.) to connected services via HMAC-signed HTTP POST.
-
-    FlowSend handles:
-        - ``order.created`` -- queues a post-purchase email/SMS flow
-          (order confirmation, upsell sequence, review request).
-        - ``order.shipped`` -- queues a shipping notification flow
-          (tracking info, delivery ETA, follow-up).
-        - ``customer.created`` -- queues a welcome flow
-          (onboarding emails, first-purchase discount).
-
-    For Developers:
-        Events are signed with HMAC-SHA256 using the shared
-        ``platform_webhook_secret``. Only events mapped to this service
-        are delivered by the platform.
-
-    For QA Engineers:
-        - Valid signature required (X-Platform-Signature header).
-        - Returns 401 for invalid/missing signatures.
-        - Unknown event types are accepted but produce no actions.
+async def _read_platform_payload(request: Request):
+    """Verify a platform bridge request's signature and decode its JSON body.
 
     Args:
         request: The incoming webhook request.
 
     Returns:
-        Dict with status and list of actions taken.
+        The decoded JSON payload.
 
     Raises:
         HTTPException 401: If signature verification fails.
@@ -123,6 +101,18 @@ async def platform_event_webhook(request: Request):
             detail="Invalid JSON payload",
         )
 
+    return data
+
+
+def _route_platform_event(data: dict) -> list[str]:
+    """Run FlowSend's handler for one platform event envelope.
+
+    Args:
+        data: The event envelope (``event`` and ``data`` keys).
+
+    Returns:
+        List of actions taken (empty for unhandled event types).
+    """
     event_type = data.get("event", "")
     event_data = data.get("data", {})
     actions = []
@@ -147,7 +137,89 @@ async def platform_event_webhook(request: Request):
         )
         actions.append("welcome_flow_queued")
 
-    return {"status": "ok", "actions": actions}
+    return actions
+
+
+@router.post("/platform-events")
+async def platform_event_webhook(request: Request):
+    """Receive platform lifecycle events from the dropshipping platform.
+
+    The platform bridge dispatches events (product.created, order.created,
+    etc.) to connected services via HMAC-signed HTTP POST.
+
+    FlowSend handles:
+        - ``order.created`` -- queues a post-purchase email/SMS flow
+          (order confirmation, upsell sequence, review request).
+        - ``order.shipped`` -- queues a shipping notification flow
+          (tracking info, delivery ETA, follow-up).
+        - ``customer.created`` -- queues a welcome flow
+          (onboarding emails, first-purchase discount).
+
+    For Developers:
+        Events are signed with HMAC-SHA256 using the shared
+        ``platform_webhook_secret``. Only events mapped to this service
+        are delivered by the platform.
+
+    For QA Engineers:
+        - Valid signature required (X-Platform-Signature header).
+        - Returns 401 for invalid/missing signatures.
+        - Unknown event types are accepted but produce no actions.
+
+    Args:
+        request: The incoming webhook request.
+
+    Returns:
+        Dict with status and list of actions taken.
+
+    Raises:
+        HTTPException 401: If signature verification fails.
+        HTTPException 400: If the JSON payload is malformed.
+    """
+    data = await _read_platform_payload(request)
+    return {"status": "ok", "actions": _route_platform_event(data)}
+
+
+@router.post("/platform-events/batch")
+async def platform_event_batch_webhook(request: Request):
+    """Receive a batch of platform events from the dropshipping platform.
+
+    The platform bridge drains its event stream in batches and sends each
+    service its events in one signed POST (``{"events": [...]}``), in the
+    order they happened. Each event is handled exactly like a single
+    ``/platform-events`` delivery.
+
+    For QA Engineers:
+        - Valid signature over the whole body required.
+        - Returns 400 if ``events`` is missing or not a list of objects.
+        - ``results`` lists the actions per event, in request order.
+
+    Args:
+        request: The incoming webhook request.
+
+    Returns:
+        Dict with status, processed count, and per-event results.
+
+    Raises:
+        HTTPException 401: If signature verification fails.
+        HTTPException 400: If the payload is malformed.
+    """
+    data = await _read_platform_payload(request)
+    events = data.get("events") if isinstance(data, dict) else None
+    if not isinstance(events, list) or not all(isinstance(e, dict) for e in events):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected an 'events' list",
+        )
+
+    results = [
+        {
+            "event": event.get("event", ""),
+            "resource_id": event.get("resource_id"),
+            "actions": _route_platform_event(event),
+        }
+        for event in events
+    ]
+    return {"status": "ok", "processed": len(results), "results": results}
 
 
 # ---------------------------------------------------------------------------
@@ -189,3 +189,61 @@ async def test_platform_webhook_empty_event(client: AsyncClient):
     data = resp.json()
     assert data["status"] == "ok"
     assert data["actions"] == []
+
+
+@pytest.mark.asyncio
+async def test_platform_webhook_batch(client: AsyncClient):
+    """POST /webhooks/platform-events/batch handles each event in order."""
+    payload = json.dumps({
+        "events": [
+            {"event": "product.created", "resource_id": "res_1", "data": {"id": "res_1"}},
+            {"event": "unknown.event", "resource_id": "res_2", "data": {}},
+        ],
+    }).encode()
+    resp = await client.post(
+        "/api/v1/webhooks/platform-events/batch",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "X-Platform-Signature": _sign(payload),
+        },
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["processed"] == 2
+    assert data["results"][0] == {
+        "event": "product.created",
+        "resource_id": "res_1",
+        "actions": ["seo_schema_created"],
+    }
+    assert data["results"][1]["actions"] == []
+
+
+@pytest.mark.asyncio
+async def test_platform_webhook_batch_invalid_signature(client: AsyncClient):
+    """POST /webhooks/platform-events/batch with a bad signature returns 401."""
+    payload = json.dumps({"events": []}).encode()
+    resp = await client.post(
+        "/api/v1/webhooks/platform-events/batch",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "X-Platform-Signature": "sha256=invalid",
+        },
+    )
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_platform_webhook_batch_requires_events_list(client: AsyncClient):
+    """POST /webhooks/platform-events/batch without an events list returns 400."""
+    payload = json.dumps({"event": "product.created"}).encode()
+    resp = await client.post(
+        "/api/v1/webhooks/platform-events/batch",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "X-Platform-Signature": _sign(payload),
+        },
+    )
+    assert resp.status_code == 400